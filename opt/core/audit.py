@@ -41,8 +41,8 @@ class AuditEntry:
     actor_id: str
     action: str
     status: str
-    timestamp: str=field(  # type: ignore[call-overload]
-        _default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    timestamp: str=field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
     details: Dict[str, Any] = field(default_factory=dict)
     compliance_tags: List[str] = field(default_factory=list)
@@ -68,20 +68,20 @@ class AuditEntry:
     def compute_hash(self) -> str:
         """Compute SHA-256 hash of the entry content (excluding signature)."""
         # Create a canonical representation
-        _data=self.to_dict()
-        data.pop("signature", None)  # type: ignore[name-defined]
+        data=self.to_dict()
+        data.pop("signature", None)
 
         # Sort keys for deterministic hashing
-        _canonical_json=json.dumps(data, sort_keys=True)  # type: ignore[name-defined]
-        return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()  # type: ignore[name-defined]
+        canonical_json=json.dumps(data, sort_keys=True)
+        return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
 
 
 class AuditSigner:
     """Handles signing and verification of audit entries."""
 
-    def __init__(self, secretkey: Optional[str] = None) -> None:
+    def __init__(self, secret_key: Optional[str] = None) -> None:
         self.secret_key=(
-            secret_key or os.getenv("AUDIT_SECRET_KEY") or os.getenv("SECRET_KEY")  # type: ignore[name-defined]
+            secret_key or os.getenv("AUDIT_SECRET_KEY") or os.getenv("SECRET_KEY")
         )
         if not self.secret_key:
             raise ValueError(
@@ -92,10 +92,10 @@ class AuditSigner:
         """Generate HMAC signature for an entry."""
         if not self.secret_key:
             raise ValueError("Secret key not configured")
-        _content_hash=entry.compute_hash()
+        content_hash=entry.compute_hash()
         signature=hmac.new(
             self.secret_key.encode("utf-8"),
-            content_hash.encode("utf-8"),  # type: ignore[name-defined]
+            content_hash.encode("utf-8"),
             hashlib.sha256,
         ).hexdigest()
         return signature
@@ -104,8 +104,8 @@ class AuditSigner:
         """Verify the signature of an entry."""
         if not entry.signature:
             return False
-        _expected_signature=self.sign(entry)
-        return hmac.compare_digest(entry.signature, expected_signature)  # type: ignore[name-defined]
+        expected_signature=self.sign(entry)
+        return hmac.compare_digest(entry.signature, expected_signature)
 
 
 class AuditLogger:
@@ -131,20 +131,20 @@ class AuditLogger:
         """
         Create and sign a new audit entry.
         """
-        _entry=AuditEntry(  # type: ignore[call-arg]
-            _operation=operation,
-            _resource_type=resource_type,
-            _resource_id=resource_id,
-            _actor_id=actor_id,
-            _action=action,
-            _status=status,
-            _details=details or {},
-            _compliance_tags=compliance_tags or [],
-            _previous_hash=previous_hash,
+        entry=AuditEntry(
+            operation=operation,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            actor_id=actor_id,
+            action=action,
+            status=status,
+            details=details or {},
+            compliance_tags=compliance_tags or [],
+            previous_hash=previous_hash,
         )
 
-        entry.signature=self.signer.sign(entry)  # type: ignore[name-defined]
-        return entry  # type: ignore[name-defined]
+        entry.signature=self.signer.sign(entry)
+        return entry
 
 
 # Global instance helper
@@ -154,6 +154,6 @@ _audit_logger: Optional[AuditLogger] = None
 def get_audit_logger() -> AuditLogger:
     global _audit_logger
     if _audit_logger is None:
-        _signer=AuditSigner()
-        _audit_logger=AuditLogger(signer)  # type: ignore[name-defined]
+        signer=AuditSigner()
+        _audit_logger=AuditLogger(signer)
     return _audit_logger
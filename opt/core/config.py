@@ -39,30 +39,30 @@ class VaultSettingsSource(PydanticBaseSettingsSource):
     Defaults to reading from 'secret/data/debvisor/config'.
     """
 
-    def get_field_value(self, field: FieldInfo, fieldname: str) -> Tuple[Any, str, bool]:
+    def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
     # Not used in __call__ based implementation but required by abstract base class in some versions
-        return None, field_name, False  # type: ignore[name-defined]
+        return None, field_name, False
 
     def __call__(self) -> Dict[str, Any]:
         if not HAS_VAULT:
             return {}
 
-        _vault_addr=os.getenv("VAULT_ADDR")
-        _vault_token=os.getenv("VAULT_TOKEN")
-        _vault_path=os.getenv("VAULT_PATH", "debvisor/config")
-        _vault_mount=os.getenv("VAULT_MOUNT", "secret")
+        vault_addr=os.getenv("VAULT_ADDR")
+        vault_token=os.getenv("VAULT_TOKEN")
+        vault_path=os.getenv("VAULT_PATH", "debvisor/config")
+        vault_mount=os.getenv("VAULT_MOUNT", "secret")
 
-        if not vault_addr or not vault_token:  # type: ignore[name-defined]
+        if not vault_addr or not vault_token:
             return {}
 
         try:
-            _client=hvac.Client(url=vault_addr, token=vault_token)  # type: ignore[name-defined]
-            if not client.is_authenticated():  # type: ignore[name-defined]
+            client=hvac.Client(url=vault_addr, token=vault_token)
+            if not client.is_authenticated():
                 return {}
 
             # Read from KV v2
-            response=client.secrets.kv.v2.read_secret_version(  # type: ignore[name-defined]
-                _path=vault_path, mount_point=vault_mount  # type: ignore[name-defined]
+            response=client.secrets.kv.v2.read_secret_version(
+                path=vault_path, mount_point=vault_mount
             )
 
             if response and 'data' in response and 'data' in response['data']:
@@ -148,8 +148,8 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATELIMIT_STORAGE_URI: str=Field("memory://", validation_alias="RATELIMIT_STORAGE_URI")
 
-    _model_config=SettingsConfigDict(  # type: ignore[typeddict-unknown-key]
-        _env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
+    model_config=SettingsConfigDict(  # type: ignore[typeddict-unknown-key]
+        env_file=".env", env_file_encoding="utf-8", case_sensitive=True, extra="ignore"
     )
 
     @classmethod
@@ -195,7 +195,7 @@ class Settings(BaseSettings):
 
 # Global settings instance
 try:
-    _settings=Settings()
+    settings=Settings()
 except Exception as e:
     # In case of validation error (e.g. missing SECRET_KEY in prod), print and re-raise
     print(f"Configuration Error: {e}")
@@ -208,6 +208,6 @@ except Exception as e:
         class DevSettings(Settings):
             SECRET_KEY: str="dev-secret-key"
 
-        _settings=DevSettings()
+        settings=DevSettings()
     else:
         raise
@@ -27,7 +27,7 @@ config=context.config
 # This line sets up loggers basically.
 if config.config_file_name:
     fileConfig(config.config_file_name)
-_logger=logging.getLogger("alembic.env")
+logger=logging.getLogger("alembic.env")
 
 
 def get_engine() -> Any:
@@ -75,8 +75,8 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    _url=config.get_main_option("sqlalchemy.url")
-    context.configure(url=url, target_metadata=get_metadata(), literal_binds=True)  # type: ignore[name-defined]
+    url=config.get_main_option("sqlalchemy.url")
+    context.configure(url=url, target_metadata=get_metadata(), literal_binds=True)
 
     with context.begin_transaction():
         context.run_migrations()
@@ -99,17 +99,17 @@ def run_migrations_online() -> None:
             script=directives[0]
             if script.upgrade_ops.is_empty():
                 directives[:] = []
-                logger.info("No changes in schema detected.")  # type: ignore[name-defined]
+                logger.info("No changes in schema detected.")
 
     conf_args=current_app.extensions["migrate"].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
 
-    _connectable=get_engine()
+    connectable=get_engine()
 
-    with connectable.connect() as connection:  # type: ignore[name-defined]
+    with connectable.connect() as connection:
         context.configure(
-            _connection=connection, target_metadata=get_metadata(), **conf_args
+            connection=connection, target_metadata=get_metadata(), **conf_args
         )
 
         with context.begin_transaction():
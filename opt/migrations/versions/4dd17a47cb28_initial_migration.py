@@ -25,9 +25,9 @@ import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision="4dd17a47cb28"
-_down_revision=None
-_branch_labels=None
-_depends_on=None
+down_revision=None
+branch_labels=None
+depends_on=None
 
 
 def upgrade() -> None:
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""add audit_chain_checkpoint
+
+Revision ID: 9c41d7a2b3f0
+Revises: e715b9926fa5
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision='9c41d7a2b3f0'
+down_revision='e715b9926fa5'
+branch_labels=None
+depends_on=None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'audit_chain_checkpoint',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('verified_up_to_id', sa.Integer(), nullable=False),
+        sa.Column('last_hash', sa.String(length=64), nullable=False),
+        sa.Column('total_verified', sa.Integer(), nullable=False),
+        sa.Column('signature', sa.String(length=64), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('audit_chain_checkpoint', schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f('ix_audit_chain_checkpoint_verified_up_to_id'), ['verified_up_to_id'], unique=False
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('audit_chain_checkpoint', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_audit_chain_checkpoint_verified_up_to_id'))
+
+    op.drop_table('audit_chain_checkpoint')
@@ -23,9 +23,9 @@ from alembic import op
 
 # revision identifiers, used by Alembic.
 revision='e715b9926fa5'
-_down_revision='4dd17a47cb28'
-_branch_labels=None
-_depends_on=None
+down_revision='4dd17a47cb28'
+branch_labels=None
+depends_on=None
 
 
 def upgrade() -> None:
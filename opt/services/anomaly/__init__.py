@@ -106,6 +106,8 @@ Statistical and ML-based anomaly detection for VM and system metrics.
 Features:
 - Multiple detection methods (Z-Score, IQR, EWMA)
 - Baseline establishment from historical data
+- Batched, vectorised detection with incremental baselines
+- Per-series LSTM forecasters trained together (BPTT) in the background
 - Trend analysis with forecasting
 - Confidence scoring for alerts
 - Multi-interface access (Python, CLI, REST API)
@@ -144,6 +146,7 @@ engine.acknowledge_alert(alert_id, acknowledged_by="admin")
 from opt.services.anomaly.core import (
     AnomalyDetectionEngine,
     AnomalyType,
+    LSTMModel,
     AnomalyAlert,
     Baseline,
     DetectionMethod,
@@ -152,6 +155,13 @@ from opt.services.anomaly.core import (
     SeverityLevel,
     TrendAnalysis,
     get_anomaly_engine,
+    predict_lstm_models,
+    train_lstm_models,
+)
+
+from opt.services.anomaly.streaming import (
+    BatchDetectionResult,
+    StreamingAnomalyDetector,
 )
 
 from opt.services.anomaly.cli import AnomalyCLI, main
@@ -165,6 +175,13 @@ __all__=[
     # Core engine
     "get_anomaly_engine",
     "AnomalyDetectionEngine",
+    # LSTM forecasting
+    "LSTMModel",
+    "train_lstm_models",
+    "predict_lstm_models",
+    # Streaming batch detection
+    "StreamingAnomalyDetector",
+    "BatchDetectionResult",
     # Data models
     "MetricPoint",
     "Baseline",
@@ -845,5 +845,5 @@ def main() -> int:
     return cli.run()  # type: ignore[name-defined]
 
 
-if _name__== "__main__":  # type: ignore[name-defined]
+if __name__ == "__main__":
     sys.exit(main())
@@ -110,17 +110,29 @@ Version: 1.0.0
 Status: Production-Ready
 """
 
+import contextlib
 import logging
 import math
+import os
+import tempfile
+import threading
+import time
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Any
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Any
 from uuid import uuid4
 import statistics
 import numpy as np
 
+from opt.services.anomaly import lstm
+
+if TYPE_CHECKING:
+    from opt.services.anomaly.streaming import BatchDetectionResult, StreamingAnomalyDetector
+
 
 # ============================================================================
 # Enumerations
@@ -306,29 +318,36 @@ class TrendAnalysis:
 # ML Models
 # ============================================================================
 class LSTMModel:
-    """Simplified LSTM model for time-series prediction using NumPy."""
-
-    def __init__(self, inputsize: int=1, hiddensize: int=8, outputsize: int=1) -> None:
-        self.hidden_size=hidden_size  # type: ignore[name-defined]
-        self.input_size=input_size  # type: ignore[name-defined]
-        self.output_size=output_size  # type: ignore[name-defined]
-
-        # Xavier initialization
-        _std=1.0 / np.sqrt(hidden_size + input_size)  # type: ignore[name-defined]
-        self.Wf=np.random.randn(hidden_size, hidden_size + input_size) * std  # type: ignore[name-defined]
-        self.Wi=np.random.randn(hidden_size, hidden_size + input_size) * std  # type: ignore[name-defined]
-        self.Wc=np.random.randn(hidden_size, hidden_size + input_size) * std  # type: ignore[name-defined]
-        self.Wo=np.random.randn(hidden_size, hidden_size + input_size) * std  # type: ignore[name-defined]
-        self.Wy=np.random.randn(output_size, hidden_size) * std  # type: ignore[name-defined]
-
-        self.bf=np.zeros((hidden_size, 1))  # type: ignore[name-defined]
-        self.bi=np.zeros((hidden_size, 1))  # type: ignore[name-defined]
-        self.bc=np.zeros((hidden_size, 1))  # type: ignore[name-defined]
-        self.bo=np.zeros((hidden_size, 1))  # type: ignore[name-defined]
-        self.by=np.zeros((output_size, 1))  # type: ignore[name-defined]
+    """Small LSTM model for time-series prediction using NumPy.
+
+    Weights are kept in the packed layout of ``opt.services.anomaly.lstm`` so
+    many models can be stacked and trained or evaluated together (see
+    ``train_lstm_models`` and ``predict_lstm_models``).
+    """
+
+    SEQ_LENGTH=10    # Window length used for training and prediction
+    TRAIN_STRIDE=5    # Offset between training windows (every step has a target)
+
+    def __init__(
+        self,
+        input_size: int=1,
+        hidden_size: int=8,
+        output_size: int=1,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.hidden_size=hidden_size
+        self.input_size=input_size
+        self.output_size=output_size
+
+        params=lstm.init_params(
+            1, input_size, hidden_size, output_size, np.random.default_rng(seed)
+        )
+        self.params: Dict[str, np.ndarray] = {name: value[0] for name, value in params.items()}
 
         self.last_trained=datetime.min.replace(tzinfo=timezone.utc)
         self.is_trained=False
+        self.stats: Dict[str, float] = {"mean": 0.0, "std": 1.0}
+        self.loss: Optional[float] = None
 
     def sigmoid(self, x: Any) -> Any:
         return 1 / (1 + np.exp(-x))
@@ -337,68 +356,18 @@ class LSTMModel:
         return np.tanh(x)
 
     def forward(self, inputs: List[float]) -> List[float]:
-        """Forward pass through the LSTM."""
-        _h=np.zeros((self.hidden_size, 1))
-        _c=np.zeros((self.hidden_size, 1))
-
-        _outputs=[]  # type: ignore[var-annotated]
+        """Forward pass through the LSTM (normalized inputs and outputs)."""
+        X=np.asarray(inputs, dtype=np.float64).reshape(1, 1, -1, self.input_size)
+        outputs, _=lstm.forward(self.stacked_params(), X)
+        return outputs[0, 0, :, 0].tolist()
 
-        for x_val in inputs:
-            _x_arr=np.array([[x_val]])
-            _z=np.row_stack((h, x_arr))  # type: ignore[name-defined]
+    def stacked_params(self) -> Dict[str, np.ndarray]:
+        """Parameters with a leading model axis of size one."""
+        return {name: value[None] for name, value in self.params.items()}
 
-            _f=self.sigmoid(np.dot(self.Wf, z) + self.bf)  # type: ignore[name-defined]
-            _i=self.sigmoid(np.dot(self.Wi, z) + self.bi)  # type: ignore[name-defined]
-            C_bar=self.tanh(np.dot(self.Wc, z) + self.bc)  # type: ignore[name-defined]
-
-            c=f * c + i * C_bar  # type: ignore[has-type, name-defined]
-            _o=self.sigmoid(np.dot(self.Wo, z) + self.bo)  # type: ignore[name-defined]
-            _h=o * self.tanh(c)  # type: ignore[name-defined]
-
-            _y=np.dot(self.Wy, h) + self.by  # type: ignore[name-defined]
-            outputs.append(y[0, 0])  # type: ignore[name-defined]
-
-        return outputs  # type: ignore[name-defined]
-
-    def train(self, data: List[float], epochs: int=50, learningrate: float=0.01) -> None:
-        """Train the model (Simplified BPTT)."""
-        # Normalize data
-        _mean=float(np.mean(data))
-        _std=float(np.std(data))
-        if std == 0:  # type: ignore[has-type, used-before-def]
-            std=1.0
-        _norm_data=[(x - mean) / std for x in data]  # type: ignore[name-defined]
-
-        # Create sequences
-        seq_length=5
-        X, Y=[], []
-        for i in range(len(norm_data) - seq_length):  # type: ignore[name-defined]
-            X.append(norm_data[i : i + seq_length])  # type: ignore[name-defined]
-            Y.append(norm_data[i + seq_length])  # type: ignore[name-defined]
-
-        # Simple training loop (Random Search / Mutation for stability in this simplified version
-        # instead of full gradient descent to avoid complexity and instability)
-        # Note: For production, use a proper library or full BPTT implementation.
-        # Here we use a genetic-like mutation approach for robustness without gradients.
-
-        # best_loss = float('inf')
-
-        for _ in range(epochs):
-        # Mutate weights
-            # Wf_mut = self.Wf + np.random.randn(*self.Wf.shape) * learning_rate
-            # Wy_mut = self.Wy + np.random.randn(*self.Wy.shape) * learning_rate
-
-            # Evaluate
-            # total_loss = 0
-            for i in range(len(X)):
-            # Forward with mutated weights (simplified for this block)
-                # In a real implementation, we'd do full BPTT.
-                # For this "Enterprise Ready" demo, we'll assume the weights are adjusted.
-                pass
-
-        self.is_trained=True
-        self.last_trained=datetime.now(timezone.utc)
-        self.stats={"mean": mean, "std": std}  # type: ignore[name-defined]
+    def train(self, data: List[float], epochs: int=50, learning_rate: float=0.01) -> None:
+        """Train the model with BPTT (see ``train_lstm_models``)."""
+        train_lstm_models([self], [data], epochs=epochs, learning_rate=learning_rate)
 
     def predict(self, sequence: List[float]) -> float:
         """Predict next value."""
@@ -407,12 +376,92 @@ class LSTMModel:
 
         mean=self.stats["mean"]
         std=self.stats["std"]
+        hidden=self.hidden_size
+        W=self.params["W"]
+
+        # Input contributions for all steps at once; only h @ W_h is sequential
+        x=(np.asarray(sequence, dtype=np.float64) - mean) / std
+        pre=np.outer(x, W[:, hidden]) + self.params["b"]
+        W_h=W[:, :hidden]
+        h=np.zeros(hidden)
+        c=np.zeros(hidden)
+        for a in pre:
+            a=a + W_h @ h
+            gates=0.5 * (np.tanh(0.5 * a) + 1.0)
+            c=gates[:hidden] * c + gates[hidden : 2 * hidden] * np.tanh(a[2 * hidden : 3 * hidden])
+            h=gates[3 * hidden :] * np.tanh(c)
+
+        pred_norm=float(self.params["Wy"][0] @ h + self.params["by"][0])
+        return pred_norm * std + mean
+
+
+def train_lstm_models(
+    models: List[LSTMModel],
+    series: List[Sequence[float]],
+    epochs: int=50,
+    learning_rate: float=0.01,
+) -> None:
+    """Train many models together on stacked tensors.
+
+    Each model is fitted to its own series (normalized per series). Models
+    whose series yield the same number of training windows are stacked into
+    one batch, so a fleet of equally long histories trains in one pass.
+
+    Args:
+        models: Models to train (same hidden size)
+        series: Training data per model, oldest first
+        epochs: BPTT epochs
+        learning_rate: Adam step size
+    """
+    groups: Dict[Tuple[int, int], List[Tuple[LSTMModel, np.ndarray, np.ndarray, float, float]]] = {}
+    for model, data in zip(models, series):
+        values=np.asarray(data, dtype=np.float64)
+        mean=float(values.mean()) if values.size else 0.0
+        std=float(values.std()) if values.size else 0.0
+        if std == 0:
+            std=1.0
+        X, Y=lstm.sliding_windows(
+            (values - mean) / std, LSTMModel.SEQ_LENGTH, LSTMModel.TRAIN_STRIDE
+        )
+        if not len(X):
+            continue
+        groups.setdefault((len(X), model.hidden_size), []).append((model, X, Y, mean, std))
+
+    trained_at=datetime.now(timezone.utc)
+    for group in groups.values():
+        params=lstm.stack_params([entry[0].params for entry in group])
+        X=np.stack([entry[1] for entry in group])[..., None]
+        Y=np.stack([entry[2] for entry in group])[..., None]
+        losses=lstm.fit(params, X, Y, epochs=epochs, learning_rate=learning_rate)
+
+        for (model, _, _, mean, std), fitted, loss in zip(
+            group, lstm.unstack_params(params), losses.tolist()
+        ):
+            model.params=fitted
+            model.stats={"mean": mean, "std": std}
+            model.loss=loss
+            model.is_trained=True
+            model.last_trained=trained_at
+
+
+def predict_lstm_models(models: List[LSTMModel], sequences: List[Sequence[float]]) -> List[float]:
+    """Next-value predictions for many trained models in one stacked pass.
 
-        _norm_seq=[(x - mean) / std for x in sequence]
-        _outputs=self.forward(norm_seq)  # type: ignore[name-defined]
+    Args:
+        models: Trained models (same hidden size)
+        sequences: One input window per model, all the same length
 
-        pred_norm=outputs[-1]  # type: ignore[name-defined]
-        return float((pred_norm * std) + mean)
+    Returns:
+        Predicted next value per model
+    """
+    if not models:
+        return []
+    means=np.array([m.stats["mean"] for m in models])
+    stds=np.array([m.stats["std"] for m in models])
+    X=(np.asarray(sequences, dtype=np.float64) - means[:, None]) / stds[:, None]
+    params=lstm.stack_params([m.params for m in models])
+    outputs, _=lstm.forward(params, X[:, None, :, None])
+    return (outputs[:, 0, -1, 0] * stds + means).tolist()
 
 
 # ============================================================================
@@ -441,6 +490,11 @@ class AnomalyConfig:
     z_score_threshold: float=_ANOMALY_Z_SCORE_THRESHOLD
     confidence_threshold: float=_ANOMALY_CONFIDENCE_THRESHOLD
     max_history: int=_ANOMALY_MAX_HISTORY
+    lstm_workers: int=2    # Background training threads; 0 trains inline
+    lstm_epochs: int=50
+    lstm_train_points: int=256    # Most recent points used for training
+    lstm_model_file: str="lstm_models.npz"    # Relative to config_dir
+    lstm_save_interval: float=60.0    # Min seconds between saves while training is queued
 
 
 # ============================================================================
@@ -468,6 +522,13 @@ class AnomalyDetectionEngine:
         self.alerts: List[AnomalyAlert] = []
         self.trends: Dict[Tuple[str, MetricType], TrendAnalysis] = {}
         self.lstm_models: Dict[Tuple[str, MetricType], LSTMModel] = {}
+        self.stream_detector: Optional["StreamingAnomalyDetector"] = None
+        self._lstm_executor: Optional[ThreadPoolExecutor] = None
+        self._lstm_pending: set = set()
+        self._lstm_lock=threading.Lock()
+        self._lstm_save_lock=threading.Lock()    # One writer of the model file at a time
+        self._lstm_unsaved=False
+        self._lstm_last_save=0.0
 
         # Use config values
         self.baseline_window=self.config.baseline_window
@@ -475,6 +536,8 @@ class AnomalyDetectionEngine:
         self.confidence_threshold=self.config.confidence_threshold
         self.max_history=self.config.max_history
 
+        self.load_lstm_models()
+
     def add_metric(
         self,
         resource_id: str,
@@ -490,20 +553,20 @@ class AnomalyDetectionEngine:
             value: Metric value
             timestamp: Optional timestamp (defaults to now)
         """
-        _key=(resource_id, metric_type)
+        key=(resource_id, metric_type)
 
         # Initialize if needed
-        if key not in self.metrics:  # type: ignore[name-defined]
-            self.metrics[key] = deque(maxlen=self.max_history)  # type: ignore[name-defined]
-
-        point=MetricPoint(  # type: ignore[call-arg]
-            _timestamp=timestamp or datetime.now(timezone.utc),
-            _value=value,
-            _resource_id=resource_id,
-            _metric_type=metric_type,
+        if key not in self.metrics:
+            self.metrics[key] = deque(maxlen=self.max_history)
+
+        point=MetricPoint(
+            timestamp=timestamp or datetime.now(timezone.utc),
+            value=value,
+            resource_id=resource_id,
+            metric_type=metric_type,
         )
 
-        self.metrics[key].append(point)  # type: ignore[name-defined]
+        self.metrics[key].append(point)
 
     def establish_baseline(
         self, resource_id: str, metric_type: MetricType, percentile_based: bool=False
@@ -518,47 +581,47 @@ class AnomalyDetectionEngine:
         Returns:
             Baseline object or None if insufficient data
         """
-        _key=(resource_id, metric_type)
+        key=(resource_id, metric_type)
 
-        if key not in self.metrics or len(self.metrics[key]) < 10:  # type: ignore[name-defined]
-            self.logger.warning(f"Insufficient data for baseline: {key}")  # type: ignore[name-defined]
+        if key not in self.metrics or len(self.metrics[key]) < 10:
+            self.logger.warning(f"Insufficient data for baseline: {key}")
             return None
 
-        values=[p.value for p in self.metrics[key]]  # type: ignore[name-defined]
+        values=[p.value for p in self.metrics[key]]
 
         try:
             if percentile_based:
-                _baseline=Baseline(  # type: ignore[call-arg]
-                    _metric_type=metric_type,
-                    _resource_id=resource_id,
-                    _mean=statistics.mean(values),
-                    _stddev=statistics.stdev(values) if len(values) > 1 else 0,
-                    _min_value=min(values),
-                    _max_value=max(values),
-                    _p25=self._percentile(values, 25),
-                    _p50=self._percentile(values, 50),
-                    _p75=self._percentile(values, 75),
-                    _p95=self._percentile(values, 95),
-                    _sample_count=len(values),
+                baseline=Baseline(
+                    metric_type=metric_type,
+                    resource_id=resource_id,
+                    mean=statistics.mean(values),
+                    stddev=statistics.stdev(values) if len(values) > 1 else 0,
+                    min_value=min(values),
+                    max_value=max(values),
+                    p25=self._percentile(values, 25),
+                    p50=self._percentile(values, 50),
+                    p75=self._percentile(values, 75),
+                    p95=self._percentile(values, 95),
+                    sample_count=len(values),
                 )
             else:
-                _baseline=Baseline(  # type: ignore[call-arg]
-                    _metric_type=metric_type,
-                    _resource_id=resource_id,
-                    _mean=statistics.mean(values),
-                    _stddev=statistics.stdev(values) if len(values) > 1 else 0,
-                    _min_value=min(values),
-                    _max_value=max(values),
-                    _p25=self._percentile(values, 25),
-                    _p50=self._percentile(values, 50),
-                    _p75=self._percentile(values, 75),
-                    _p95=self._percentile(values, 95),
-                    _sample_count=len(values),
+                baseline=Baseline(
+                    metric_type=metric_type,
+                    resource_id=resource_id,
+                    mean=statistics.mean(values),
+                    stddev=statistics.stdev(values) if len(values) > 1 else 0,
+                    min_value=min(values),
+                    max_value=max(values),
+                    p25=self._percentile(values, 25),
+                    p50=self._percentile(values, 50),
+                    p75=self._percentile(values, 75),
+                    p95=self._percentile(values, 95),
+                    sample_count=len(values),
                 )
 
-            self.baselines[key] = baseline  # type: ignore[name-defined]
-            self.logger.info(f"Baseline established: {key}")  # type: ignore[name-defined]
-            return baseline  # type: ignore[name-defined]
+            self.baselines[key] = baseline
+            self.logger.info(f"Baseline established: {key}")
+            return baseline
 
         except Exception as e:
             self.logger.error(f"Error establishing baseline: {e}")
@@ -583,7 +646,7 @@ class AnomalyDetectionEngine:
             List of anomaly alerts
         """
         if methods is None:
-            _methods=[
+            methods=[
                 DetectionMethod.Z_SCORE,
                 DetectionMethod.IQR,
                 DetectionMethod.EWMA,
@@ -591,44 +654,44 @@ class AnomalyDetectionEngine:
             ]
 
         alerts: List[AnomalyAlert] = []
-        _key=(resource_id, metric_type)
+        key=(resource_id, metric_type)
 
         # Get baseline
-        _baseline=self.baselines.get(key)  # type: ignore[name-defined]
-        if not baseline:  # type: ignore[name-defined]
+        baseline=self.baselines.get(key)
+        if not baseline:
         # Try to establish from data
-            _baseline=self.establish_baseline(resource_id, metric_type)
-            if not baseline:  # type: ignore[name-defined]
+            baseline=self.establish_baseline(resource_id, metric_type)
+            if not baseline:
                 return alerts
 
         # Z-score detection
-        if DetectionMethod.Z_SCORE in methods:  # type: ignore[operator]
+        if DetectionMethod.Z_SCORE in methods:
             alert=self._detect_zscore_anomaly(
-                resource_id, metric_type, current_value, baseline  # type: ignore[name-defined]
+                resource_id, metric_type, current_value, baseline
             )
             if alert:
                 alerts.append(alert)
 
         # IQR detection
-        if DetectionMethod.IQR in methods:  # type: ignore[operator]
+        if DetectionMethod.IQR in methods:
             alert=self._detect_iqr_anomaly(
-                resource_id, metric_type, current_value, baseline  # type: ignore[name-defined]
+                resource_id, metric_type, current_value, baseline
             )
             if alert:
                 alerts.append(alert)
 
         # EWMA detection
-        if DetectionMethod.EWMA in methods:  # type: ignore[operator]
+        if DetectionMethod.EWMA in methods:
             alert=self._detect_ewma_anomaly(
-                resource_id, metric_type, current_value, baseline  # type: ignore[name-defined]
+                resource_id, metric_type, current_value, baseline
             )
             if alert:
                 alerts.append(alert)
 
         # LSTM detection
-        if DetectionMethod.LSTM in methods:  # type: ignore[operator]
+        if DetectionMethod.LSTM in methods:
             alert=self._detect_lstm_anomaly(
-                resource_id, metric_type, current_value, baseline  # type: ignore[name-defined]
+                resource_id, metric_type, current_value, baseline
             )
             if alert:
                 alerts.append(alert)
@@ -640,6 +703,82 @@ class AnomalyDetectionEngine:
 
         return alerts
 
+    def detect_batch(
+        self,
+        resource_ids: Sequence[str],
+        metric_types: Any,
+        values: Sequence[float],
+        timestamps: Optional[Sequence[float]] = None,
+        methods: Optional[List[DetectionMethod]] = None,
+        record_history: bool=False,
+    ) -> "BatchDetectionResult":
+        """Detect anomalies for a columnar batch of samples.
+
+        Scores every sample against an incremental per-series baseline
+        (see ``StreamingAnomalyDetector``) and then folds it in, so no
+        history scan or baseline re-computation happens per value. LSTM is
+        not available in batch mode.
+
+        Args:
+            resource_ids: Resource identifier per sample
+            metric_types: Metric type per sample, or one for the whole batch
+            values: Metric values
+            timestamps: Epoch seconds per sample (defaults to now)
+            methods: Detection methods to use (default: Z-score, IQR, EWMA)
+            record_history: Also append the samples to the per-series history
+
+        Returns:
+            BatchDetectionResult with per-sample scores and the alerts raised
+        """
+        detector=self.get_stream_detector()
+        result=detector.process_batch(
+            resource_ids, metric_types, values, timestamps=timestamps, methods=methods
+        )
+
+        if record_history:
+            stamps=timestamps if timestamps is not None else [None] * len(values)
+            for series_id, value, stamp in zip(result.series_ids.tolist(), values, stamps):
+                resource_id, metric_type=detector.series_key(series_id)
+                self.add_metric(
+                    resource_id,
+                    metric_type,
+                    float(value),
+                    datetime.fromtimestamp(stamp, timezone.utc) if stamp is not None else None,
+                )
+
+        self.alerts.extend(result.alerts)
+        if result.alerts:
+            self.logger.warning(f"Batch anomalies detected: {len(result.alerts)}")
+
+        return result
+
+    def get_stream_detector(self) -> "StreamingAnomalyDetector":
+        """Streaming detector backing ``detect_batch`` (created on first use)."""
+        if self.stream_detector is None:
+            from opt.services.anomaly.streaming import StreamingAnomalyDetector
+
+            self.stream_detector=StreamingAnomalyDetector(
+                z_score_threshold=self.z_score_threshold,
+                max_samples=self.max_history,
+            )
+        return self.stream_detector
+
+    def get_streaming_baseline(
+        self, resource_id: str, metric_type: MetricType
+    ) -> Optional[Baseline]:
+        """Incremental baseline maintained by ``detect_batch``.
+
+        Args:
+            resource_id: Resource identifier
+            metric_type: Type of metric
+
+        Returns:
+            Baseline object or None if the series was never batch-processed
+        """
+        if self.stream_detector is None:
+            return None
+        return self.stream_detector.baseline(resource_id, metric_type)
+
     def _detect_zscore_anomaly(
         self,
         resource_id: str,
@@ -651,46 +790,46 @@ class AnomalyDetectionEngine:
         if baseline.stddev == 0:
             return None
 
-        _z_score=abs((current_value - baseline.mean) / baseline.stddev)
+        z_score=abs((current_value - baseline.mean) / baseline.stddev)
 
-        if z_score > self.z_score_threshold:  # type: ignore[name-defined]
+        if z_score > self.z_score_threshold:
         # Determine type and severity
             if current_value > baseline.mean:
                 anomaly_type=AnomalyType.SPIKE
             else:
-                _anomaly_type=AnomalyType.DIP
+                anomaly_type=AnomalyType.DIP
 
             # Calculate confidence
-            _confidence=min(1.0, (z_score - self.z_score_threshold) / 2.0)  # type: ignore[name-defined]
+            confidence=min(1.0, (z_score - self.z_score_threshold) / 2.0)
 
             # Determine severity
-            if confidence < 0.7:  # type: ignore[name-defined]
+            if confidence < 0.7:
                 severity=SeverityLevel.WARNING
             else:
-                _severity=SeverityLevel.CRITICAL
+                severity=SeverityLevel.CRITICAL
 
-            _expected_range=(
+            expected_range=(
                 baseline.mean - 2 * baseline.stddev,
                 baseline.mean + 2 * baseline.stddev,
             )
 
-            return AnomalyAlert(  # type: ignore[call-arg]
-                _alert_id=str(uuid4())[:8],
-                _timestamp=datetime.now(timezone.utc),
-                _resource_id=resource_id,
-                _metric_type=metric_type,
-                _anomaly_type=anomaly_type,
-                _severity=severity,
-                _confidence=confidence,  # type: ignore[name-defined]
-                _detected_value=current_value,
-                _expected_range=expected_range,  # type: ignore[name-defined]
-                _detection_method=DetectionMethod.Z_SCORE,
-                _message=(
+            return AnomalyAlert(
+                alert_id=str(uuid4())[:8],
+                timestamp=datetime.now(timezone.utc),
+                resource_id=resource_id,
+                metric_type=metric_type,
+                anomaly_type=anomaly_type,
+                severity=severity,
+                confidence=confidence,
+                detected_value=current_value,
+                expected_range=expected_range,
+                detection_method=DetectionMethod.Z_SCORE,
+                message=(
                     f"{anomaly_type.value} detected: {current_value:.2f} "
-                    f"(Z-score: {z_score:.2f})"  # type: ignore[name-defined]
+                    f"(Z-score: {z_score:.2f})"
                 ),
-                _details={
-                    "z_score": z_score,  # type: ignore[name-defined]
+                details={
+                    "z_score": z_score,
                     "baseline_mean": baseline.mean,
                     "baseline_stddev": baseline.stddev,
                 },
@@ -715,7 +854,7 @@ class AnomalyDetectionEngine:
             if current_value > upper_fence:
                 anomaly_type=AnomalyType.SPIKE
             else:
-                _anomaly_type=AnomalyType.DIP
+                anomaly_type=AnomalyType.DIP
 
             # Calculate confidence based on fence distance
             max_distance=max(
@@ -729,23 +868,23 @@ class AnomalyDetectionEngine:
             if confidence < 0.7:
                 severity=SeverityLevel.WARNING
             else:
-                _severity=SeverityLevel.CRITICAL
-
-            _expected_range=(lower_fence, upper_fence)
-
-            return AnomalyAlert(  # type: ignore[call-arg]
-                _alert_id=str(uuid4())[:8],
-                _timestamp=datetime.now(timezone.utc),
-                _resource_id=resource_id,
-                _metric_type=metric_type,
-                _anomaly_type=anomaly_type,
-                _severity=severity,
-                _confidence=confidence,
-                _detected_value=current_value,
-                _expected_range=expected_range,  # type: ignore[name-defined]
-                _detection_method=DetectionMethod.IQR,
-                _message=f"{anomaly_type.value} detected (IQR): {current_value:.2f}",
-                _details={
+                severity=SeverityLevel.CRITICAL
+
+            expected_range=(lower_fence, upper_fence)
+
+            return AnomalyAlert(
+                alert_id=str(uuid4())[:8],
+                timestamp=datetime.now(timezone.utc),
+                resource_id=resource_id,
+                metric_type=metric_type,
+                anomaly_type=anomaly_type,
+                severity=severity,
+                confidence=confidence,
+                detected_value=current_value,
+                expected_range=expected_range,
+                detection_method=DetectionMethod.IQR,
+                message=f"{anomaly_type.value} detected (IQR): {current_value:.2f}",
+                details={
                     "iqr": iqr,
                     "lower_fence": lower_fence,
                     "upper_fence": upper_fence,
@@ -762,55 +901,55 @@ class AnomalyDetectionEngine:
         baseline: Baseline,
     ) -> Optional[AnomalyAlert]:
         """Detect anomaly using Exponential Weighted Moving Average."""
-        _key=(resource_id, metric_type)
+        key=(resource_id, metric_type)
 
-        if key not in self.metrics or len(self.metrics[key]) < 5:  # type: ignore[name-defined]
+        if key not in self.metrics or len(self.metrics[key]) < 5:
             return None
 
-        _values=[p.value for p in list(self.metrics[key])[-50:]]    # Last 50 points  # type: ignore[name-defined]
+        values=[p.value for p in list(self.metrics[key])[-50:]]    # Last 50 points
 
         # Calculate EWMA
-        _ewma=self._calculate_ewma(values, alpha=0.3)  # type: ignore[name-defined]
-        _ewma_stddev=self._calculate_ewma_stddev(values, ewma, alpha=0.3)  # type: ignore[name-defined]
+        ewma=self._calculate_ewma(values, alpha=0.3)
+        ewma_stddev=self._calculate_ewma_stddev(values, ewma, alpha=0.3)
 
-        if ewma_stddev == 0:  # type: ignore[name-defined]
+        if ewma_stddev == 0:
             return None
 
-        _deviation=abs(current_value - ewma) / ewma_stddev  # type: ignore[name-defined]
+        deviation=abs(current_value - ewma) / ewma_stddev
 
-        if deviation > 2.0:  # type: ignore[name-defined]
-            if current_value > ewma:  # type: ignore[name-defined]
+        if deviation > 2.0:
+            if current_value > ewma:
                 anomaly_type=AnomalyType.SPIKE
             else:
-                _anomaly_type=AnomalyType.DIP
+                anomaly_type=AnomalyType.DIP
 
-            _confidence=min(1.0, (deviation - 2.0) / 2.0)  # type: ignore[name-defined]
+            confidence=min(1.0, (deviation - 2.0) / 2.0)
 
-            if confidence < 0.7:  # type: ignore[name-defined]
+            if confidence < 0.7:
                 severity=SeverityLevel.INFO
-            elif confidence < 0.85:  # type: ignore[name-defined]
+            elif confidence < 0.85:
                 severity=SeverityLevel.WARNING
             else:
-                _severity=SeverityLevel.CRITICAL
-
-            _expected_range=(ewma - 2 * ewma_stddev, ewma + 2 * ewma_stddev)  # type: ignore[name-defined]
-
-            return AnomalyAlert(  # type: ignore[call-arg]
-                _alert_id=str(uuid4())[:8],
-                _timestamp=datetime.now(timezone.utc),
-                _resource_id=resource_id,
-                _metric_type=metric_type,
-                _anomaly_type=anomaly_type,
-                _severity=severity,
-                _confidence=confidence,  # type: ignore[name-defined]
-                _detected_value=current_value,
-                _expected_range=expected_range,  # type: ignore[name-defined]
-                _detection_method=DetectionMethod.EWMA,
-                _message=f"{anomaly_type.value} detected (EWMA): {current_value:.2f}",
-                _details={
-                    "ewma": ewma,  # type: ignore[name-defined]
-                    "ewma_stddev": ewma_stddev,  # type: ignore[name-defined]
-                    "deviation": deviation,  # type: ignore[name-defined]
+                severity=SeverityLevel.CRITICAL
+
+            expected_range=(ewma - 2 * ewma_stddev, ewma + 2 * ewma_stddev)
+
+            return AnomalyAlert(
+                alert_id=str(uuid4())[:8],
+                timestamp=datetime.now(timezone.utc),
+                resource_id=resource_id,
+                metric_type=metric_type,
+                anomaly_type=anomaly_type,
+                severity=severity,
+                confidence=confidence,
+                detected_value=current_value,
+                expected_range=expected_range,
+                detection_method=DetectionMethod.EWMA,
+                message=f"{anomaly_type.value} detected (EWMA): {current_value:.2f}",
+                details={
+                    "ewma": ewma,
+                    "ewma_stddev": ewma_stddev,
+                    "deviation": deviation,
                 },
             )
 
@@ -824,90 +963,338 @@ class AnomalyDetectionEngine:
         baseline: Baseline,
     ) -> Optional[AnomalyAlert]:
         """Detect anomaly using LSTM prediction."""
-        _key=(resource_id, metric_type)
-
-        # Check if model exists and is trained
-        if key not in self.lstm_models:  # type: ignore[name-defined]
-            self.lstm_models[key] = LSTMModel()  # type: ignore[name-defined]
-            # Trigger training if enough data
-            if len(self.metrics.get(key, [])) > 50:  # type: ignore[name-defined]
-                self.train_model(resource_id, metric_type)
-            return None
-
-        model=self.lstm_models[key]  # type: ignore[name-defined]
-        if not model.is_trained:
+        key=(resource_id, metric_type)
+        history=self.metrics.get(key)
+
+        # Check if model exists and is trained; train in the background if not
+        model=self.lstm_models.get(key)
+        if model is None or not model.is_trained:
+            if history is not None and len(history) > 50:
+                self.schedule_lstm_training([key])
             return None
 
         # Get recent sequence
-        if key not in self.metrics or len(self.metrics[key]) < 10:  # type: ignore[name-defined]
+        if history is None or len(history) < 10:
             return None
 
         # Use last 10 points (excluding current) for prediction
-        _sequence=[p.value for p in list(self.metrics[key])[-11:-1]]  # type: ignore[name-defined]
-        if not sequence:  # type: ignore[name-defined]
+        sequence=[p.value for p in islice(reversed(history), 1, 11)]
+        if not sequence:
             return None
+        sequence.reverse()
 
-        _predicted_value=model.predict(sequence)  # type: ignore[name-defined]
+        predicted_value=model.predict(sequence)
 
         # Calculate deviation
-        _deviation=abs(current_value - predicted_value)  # type: ignore[name-defined]
+        deviation=abs(current_value - predicted_value)
         threshold=baseline.stddev * 2.5    # Slightly tighter than Z-score
 
-        if deviation > threshold:  # type: ignore[name-defined]
-            if current_value > predicted_value:  # type: ignore[name-defined]
+        if deviation > threshold:
+            if current_value > predicted_value:
                 anomaly_type=AnomalyType.SPIKE
             else:
-                _anomaly_type=AnomalyType.DIP
+                anomaly_type=AnomalyType.DIP
 
-            _confidence=min(1.0, (deviation - threshold) / threshold)  # type: ignore[name-defined]
+            confidence=min(1.0, (deviation - threshold) / threshold)
 
-            if confidence < 0.6:  # type: ignore[name-defined]
+            if confidence < 0.6:
                 severity=SeverityLevel.INFO
-            elif confidence < 0.8:  # type: ignore[name-defined]
+            elif confidence < 0.8:
                 severity=SeverityLevel.WARNING
             else:
-                _severity=SeverityLevel.CRITICAL
-
-            _expected_range=(predicted_value - threshold, predicted_value + threshold)  # type: ignore[name-defined]
-
-            return AnomalyAlert(  # type: ignore[call-arg]
-                _alert_id=str(uuid4())[:8],
-                _timestamp=datetime.now(timezone.utc),
-                _resource_id=resource_id,
-                _metric_type=metric_type,
-                _anomaly_type=anomaly_type,
-                _severity=severity,
-                _confidence=confidence,  # type: ignore[name-defined]
-                _detected_value=current_value,
-                _expected_range=expected_range,  # type: ignore[name-defined]
-                _detection_method=DetectionMethod.LSTM,
-                _message=(
+                severity=SeverityLevel.CRITICAL
+
+            expected_range=(predicted_value - threshold, predicted_value + threshold)
+
+            return AnomalyAlert(
+                alert_id=str(uuid4())[:8],
+                timestamp=datetime.now(timezone.utc),
+                resource_id=resource_id,
+                metric_type=metric_type,
+                anomaly_type=anomaly_type,
+                severity=severity,
+                confidence=confidence,
+                detected_value=current_value,
+                expected_range=expected_range,
+                detection_method=DetectionMethod.LSTM,
+                message=(
                     f"{anomaly_type.value} detected (LSTM): "
-                    f"{current_value:.2f} (Pred: {predicted_value:.2f})"  # type: ignore[name-defined]
+                    f"{current_value:.2f} (Pred: {predicted_value:.2f})"
                 ),
-                _details={
-                    "predicted": predicted_value,  # type: ignore[name-defined]
-                    "deviation": deviation,  # type: ignore[name-defined]
+                details={
+                    "predicted": predicted_value,
+                    "deviation": deviation,
                     "threshold": threshold,
                 },
             )
 
         return None
 
-    def train_model(self, resourceid: str, metrictype: MetricType) -> bool:
+    def train_model(self, resource_id: str, metric_type: MetricType) -> bool:
         """Train LSTM model for a metric."""
-        _key=(resource_id, metric_type)  # type: ignore[name-defined]
+        key=(resource_id, metric_type)
 
-        if key not in self.metrics or len(self.metrics[key]) < 50:  # type: ignore[name-defined]
+        if key not in self.metrics or len(self.metrics[key]) < 50:
             return False
 
-        if key not in self.lstm_models:  # type: ignore[name-defined]
-            self.lstm_models[key] = LSTMModel()  # type: ignore[name-defined]
+        return self.train_models([key]) == 1
+
+    def train_models(self, keys: Optional[List[Tuple[str, MetricType]]] = None) -> int:
+        """Train LSTM models for many series together and persist them.
+
+        Args:
+            keys: Series to train (default: every series with 50+ points)
+
+        Returns:
+            Number of models trained
+        """
+        if keys is None:
+            keys=list(self.metrics)
+        data=self._lstm_training_data(keys)
+        trained=self._train_lstm_batch(data)
+        if trained:
+            self.flush_lstm_models()
+        return trained
+
+    def schedule_lstm_training(
+        self, keys: List[Tuple[str, MetricType]]
+    ) -> Optional["Future[int]"]:
+        """Train models on the background worker pool.
+
+        Series already queued are skipped. Training data is copied before
+        submission, so metrics can keep arriving while models train.
+
+        Returns:
+            Future resolving to the number of models trained, or None if
+            there was nothing new to train
+        """
+        with self._lstm_lock:
+            keys=[key for key in keys if key not in self._lstm_pending]
+            data=self._lstm_training_data(keys)
+            if not data:
+                return None
+            self._lstm_pending.update(data)
+
+        if self.config.lstm_workers <= 0:
+            future: "Future[int]"=Future()
+            future.set_result(self._train_lstm_batch(data))
+            return future
+
+        if self._lstm_executor is None:
+            self._lstm_executor=ThreadPoolExecutor(
+                max_workers=self.config.lstm_workers, thread_name_prefix="lstm-train"
+            )
+        return self._lstm_executor.submit(self._train_lstm_batch, data)
+
+    def _lstm_training_data(
+        self, keys: List[Tuple[str, MetricType]]
+    ) -> Dict[Tuple[str, MetricType], List[float]]:
+        limit=self.config.lstm_train_points
+        data: Dict[Tuple[str, MetricType], List[float]] = {}
+        for key in keys:
+            history=self.metrics.get(key)
+            if history is None or len(history) < 50:
+                continue
+            values=[p.value for p in islice(reversed(history), limit)]
+            values.reverse()
+            data[key] = values
+        return data
+
+    def _train_lstm_batch(self, data: Dict[Tuple[str, MetricType], List[float]]) -> int:
+        count=0
+        try:
+            models={key: LSTMModel() for key in data}
+            train_lstm_models(
+                list(models.values()), list(data.values()), epochs=self.config.lstm_epochs
+            )
+            trained={key: model for key, model in models.items() if model.is_trained}
+            self.lstm_models.update(trained)
+            self.logger.info(f"LSTM models trained: {len(trained)}")
+            count=len(trained)
+        except Exception as e:
+            self.logger.error(f"Error training LSTM models: {e}")
+        finally:
+            with self._lstm_lock:
+                self._lstm_pending.difference_update(data)
+                self._lstm_unsaved=self._lstm_unsaved or count > 0
+                # Save once the queue drains, or periodically while it never does
+                save_due=self._lstm_unsaved and (
+                    not self._lstm_pending
+                    or time.monotonic() - self._lstm_last_save >= self.config.lstm_save_interval
+                )
+        if save_due:
+            self.flush_lstm_models()
+        return count
+
+    def predict_lstm(
+        self, keys: Optional[List[Tuple[str, MetricType]]] = None
+    ) -> Dict[Tuple[str, MetricType], float]:
+        """Next-value forecasts for many series in one stacked pass.
 
-        data=[p.value for p in self.metrics[key]]  # type: ignore[name-defined]
-        self.lstm_models[key].train(data)  # type: ignore[name-defined]
-        self.logger.info(f"LSTM model trained for {key}")  # type: ignore[name-defined]
-        return True
+        Args:
+            keys: Series to forecast (default: all with a trained model)
+
+        Returns:
+            Mapping of series key to predicted next value
+        """
+        if keys is None:
+            keys=list(self.lstm_models)
+        models: List[LSTMModel] = []
+        sequences: List[List[float]] = []
+        ready: List[Tuple[str, MetricType]] = []
+        for key in keys:
+            model=self.lstm_models.get(key)
+            history=self.metrics.get(key)
+            if model is None or not model.is_trained or history is None:
+                continue
+            if len(history) < LSTMModel.SEQ_LENGTH:
+                continue
+            sequence=[p.value for p in islice(reversed(history), LSTMModel.SEQ_LENGTH)]
+            sequence.reverse()
+            models.append(model)
+            sequences.append(sequence)
+            ready.append(key)
+
+        predictions: Dict[Tuple[str, MetricType], float] = {}
+        by_size: Dict[int, List[int]] = {}
+        for n, model in enumerate(models):
+            by_size.setdefault(model.hidden_size, []).append(n)
+        for indexes in by_size.values():
+            values=predict_lstm_models(
+                [models[n] for n in indexes], [sequences[n] for n in indexes]
+            )
+            for n, value in zip(indexes, values):
+                predictions[ready[n]] = value
+        return predictions
+
+    def _lstm_model_path(self) -> Optional[str]:
+        if not os.path.isdir(self.config.config_dir):
+            return None
+        return os.path.join(self.config.config_dir, self.config.lstm_model_file)
+
+    def flush_lstm_models(self) -> Optional[str]:
+        """Save trained models if any were trained since the last save.
+
+        Background training only marks models unsaved (see
+        ``lstm_save_interval``); ``train_models`` and ``close`` flush.
+
+        Returns:
+            Path written, or None if nothing was saved
+        """
+        with self._lstm_lock:
+            if not self._lstm_unsaved:
+                return None
+            self._lstm_unsaved=False
+            self._lstm_last_save=time.monotonic()
+        path=self.save_lstm_models()
+        if path is None:
+            with self._lstm_lock:
+                self._lstm_unsaved=True
+        return path
+
+    def save_lstm_models(self, path: Optional[str] = None) -> Optional[str]:
+        """Persist trained LSTM weights so restarts don't retrain.
+
+        Saves are serialized and the snapshot is taken under the save lock,
+        so a later save always writes newer models; each writes a unique
+        temporary file in the target directory and renames it into place.
+        Only one hidden size fits the file: models of other sizes are
+        skipped with a warning.
+
+        Args:
+            path: Target file (default: ``lstm_model_file`` in config_dir,
+                skipped if config_dir does not exist)
+
+        Returns:
+            Path written, or None if nothing was saved
+        """
+        path=path or self._lstm_model_path()
+        if path is None:
+            return None
+        with self._lstm_save_lock:
+            items=[(k, m) for k, m in list(self.lstm_models.items()) if m.is_trained]
+            if not items:
+                return None
+            sizes={m.hidden_size for _, m in items}
+            if len(sizes) > 1:
+                hidden=max(sizes, key=lambda size: sum(m.hidden_size == size for _, m in items))
+                kept=[(k, m) for k, m in items if m.hidden_size == hidden]
+                self.logger.warning(
+                    f"Not saving {len(items) - len(kept)} LSTM models: hidden sizes "
+                    f"{sorted(sizes)} differ, only hidden_size={hidden} is saved"
+                )
+                items=kept
+
+            arrays={
+                name: np.stack([m.params[name] for _, m in items]) for name in lstm.PARAM_NAMES
+            }
+            tmp_path: Optional[str] = None
+            try:
+                fd, tmp_path=tempfile.mkstemp(
+                    dir=os.path.dirname(os.path.abspath(path)),
+                    prefix=f"{os.path.basename(path)}.",
+                    suffix=".tmp",
+                )
+                with os.fdopen(fd, "wb") as fh:
+                    np.savez(
+                        fh,
+                        resource_ids=np.array([k[0] for k, _ in items]),
+                        metric_types=np.array([k[1].value for k, _ in items]),
+                        means=np.array([m.stats["mean"] for _, m in items]),
+                        stds=np.array([m.stats["std"] for _, m in items]),
+                        last_trained=np.array([m.last_trained.timestamp() for _, m in items]),
+                        **arrays,
+                    )
+                os.replace(tmp_path, path)
+                return path
+            except OSError as e:
+                self.logger.error(f"Error saving LSTM models: {e}")
+                if tmp_path is not None:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_path)
+                return None
+
+    def load_lstm_models(self, path: Optional[str] = None) -> int:
+        """Load LSTM weights written by ``save_lstm_models``.
+
+        Returns:
+            Number of models loaded
+        """
+        path=path or self._lstm_model_path()
+        if path is None or not os.path.exists(path):
+            return 0
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays={name: data[name] for name in lstm.PARAM_NAMES}
+                count=len(data["resource_ids"])
+                hidden=arrays["W"].shape[1] // 4
+                for n, (resource_id, metric) in enumerate(
+                    zip(data["resource_ids"].tolist(), data["metric_types"].tolist())
+                ):
+                    model=LSTMModel(
+                        input_size=arrays["W"].shape[2] - hidden,
+                        hidden_size=hidden,
+                        output_size=arrays["Wy"].shape[1],
+                    )
+                    model.params={name: arrays[name][n].copy() for name in lstm.PARAM_NAMES}
+                    model.stats={"mean": float(data["means"][n]), "std": float(data["stds"][n])}
+                    model.last_trained=datetime.fromtimestamp(
+                        float(data["last_trained"][n]), timezone.utc
+                    )
+                    model.is_trained=True
+                    self.lstm_models[(resource_id, MetricType(metric))] = model
+            self.logger.info(f"Loaded {count} LSTM models from {path}")
+            return count
+        except (OSError, KeyError, ValueError) as e:
+            self.logger.error(f"Error loading LSTM models: {e}")
+            return 0
+
+    def close(self) -> None:
+        """Stop the background training pool, waiting for running jobs, and save."""
+        if self._lstm_executor is not None:
+            self._lstm_executor.shutdown(wait=True)
+            self._lstm_executor=None
+        self.flush_lstm_models()
 
     def analyze_trend(
         self, resource_id: str, metric_type: MetricType, hours: int=24
@@ -922,13 +1309,13 @@ class AnomalyDetectionEngine:
         Returns:
             TrendAnalysis object or None
         """
-        _key=(resource_id, metric_type)
+        key=(resource_id, metric_type)
 
-        if key not in self.metrics:  # type: ignore[name-defined]
+        if key not in self.metrics:
             return None
 
-        _cutoff_time=datetime.now(timezone.utc) - timedelta(hours=hours)
-        recent_data=[p for p in self.metrics[key] if p.timestamp >= cutoff_time]  # type: ignore[name-defined]
+        cutoff_time=datetime.now(timezone.utc) - timedelta(hours=hours)
+        recent_data=[p for p in self.metrics[key] if p.timestamp >= cutoff_time]
 
         if len(recent_data) < 3:
             return None
@@ -940,39 +1327,39 @@ class AnomalyDetectionEngine:
         ]
 
         # Linear regression for trend
-        _trend_strength=self._calculate_correlation(times, values)
+        trend_strength=self._calculate_correlation(times, values)
 
         # Determine direction
-        if trend_strength > 0.3:  # type: ignore[name-defined]
+        if trend_strength > 0.3:
             trend_direction="increasing"
-        elif trend_strength < -0.3:  # type: ignore[name-defined]
+        elif trend_strength < -0.3:
             trend_direction="decreasing"
         else:
-            _trend_direction="stable"
+            trend_direction="stable"
 
         # Calculate average change per hour
-        _avg_change=(values[-1] - values[0]) / hours if hours > 0 else 0
+        avg_change=(values[-1] - values[0]) / hours if hours > 0 else 0
 
         # Simple 24h forecast
-        _forecast_24h=values[-1] + (avg_change * 24)  # type: ignore[name-defined]
-
-        _analysis=TrendAnalysis(  # type: ignore[call-arg]
-            _resource_id=resource_id,
-            _metric_type=metric_type,
-            _period_start=recent_data[0].timestamp,
-            _period_end=recent_data[-1].timestamp,
-            _trend_direction=trend_direction,
-            _trend_strength=abs(trend_strength),  # type: ignore[name-defined]
-            _average_change_per_hour=avg_change,  # type: ignore[name-defined]
-            _forecast_value_24h=forecast_24h,  # type: ignore[name-defined]
-            _confidence=min(1.0, len(recent_data) / 100.0),
-            _analysis_method="linear_regression",
+        forecast_24h=values[-1] + (avg_change * 24)
+
+        analysis=TrendAnalysis(
+            resource_id=resource_id,
+            metric_type=metric_type,
+            period_start=recent_data[0].timestamp,
+            period_end=recent_data[-1].timestamp,
+            trend_direction=trend_direction,
+            trend_strength=abs(trend_strength),
+            average_change_per_hour=avg_change,
+            forecast_value_24h=forecast_24h,
+            confidence=min(1.0, len(recent_data) / 100.0),
+            analysis_method="linear_regression",
         )
 
-        self.trends[key] = analysis  # type: ignore[name-defined]
-        self.logger.info(f"Trend analysis: {key} - {trend_direction}")  # type: ignore[name-defined]
+        self.trends[key] = analysis
+        self.logger.info(f"Trend analysis: {key} - {trend_direction}")
 
-        return analysis  # type: ignore[name-defined]
+        return analysis
 
     def acknowledge_alert(
         self, alert_id: str, acknowledged_by: str, notes: str=""
@@ -1035,15 +1422,15 @@ class AnomalyDetectionEngine:
         Returns:
             List of historical alerts
         """
-        _cutoff=datetime.now(timezone.utc) - timedelta(hours=hours)
+        cutoff=datetime.now(timezone.utc) - timedelta(hours=hours)
 
-        alerts=[a for a in self.alerts if a.timestamp >= cutoff]  # type: ignore[name-defined]
+        alerts=[a for a in self.alerts if a.timestamp >= cutoff]
 
         if resource_id:
             alerts=[a for a in alerts if a.resource_id == resource_id]
 
         # Sort by timestamp, newest first
-        _alerts=sorted(alerts, key=lambda a: a.timestamp, reverse=True)
+        alerts=sorted(alerts, key=lambda a: a.timestamp, reverse=True)
 
         return alerts[:limit]
 
@@ -1053,21 +1440,21 @@ class AnomalyDetectionEngine:
         Returns:
             Statistics dictionary
         """
-        _active_alerts=self.get_active_alerts()
-        _critical_alerts=len(
-            [a for a in active_alerts if a.severity == SeverityLevel.CRITICAL]  # type: ignore[name-defined]
+        active_alerts=self.get_active_alerts()
+        critical_alerts=len(
+            [a for a in active_alerts if a.severity == SeverityLevel.CRITICAL]
         )
-        _warning_alerts=len(
-            [a for a in active_alerts if a.severity == SeverityLevel.WARNING]  # type: ignore[name-defined]
+        warning_alerts=len(
+            [a for a in active_alerts if a.severity == SeverityLevel.WARNING]
         )
 
         return {
             "total_metrics": len(self.metrics),
             "total_baselines": len(self.baselines),
             "total_alerts": len(self.alerts),
-            "active_alerts": len(active_alerts),  # type: ignore[name-defined]
-            "critical_alerts": critical_alerts,  # type: ignore[name-defined]
-            "warning_alerts": warning_alerts,  # type: ignore[name-defined]
+            "active_alerts": len(active_alerts),
+            "critical_alerts": critical_alerts,
+            "warning_alerts": warning_alerts,
             "trends_analyzed": len(self.trends),
             "alert_ack_rate": (
                 len([a for a in self.alerts if a.acknowledged]) / len(self.alerts)
@@ -1085,15 +1472,15 @@ class AnomalyDetectionEngine:
         if not data:
             return 0.0
 
-        _sorted_data=sorted(data)
-        _index=(percentile / 100.0) * (len(sorted_data) - 1)  # type: ignore[name-defined]
+        sorted_data=sorted(data)
+        index=(percentile / 100.0) * (len(sorted_data) - 1)
 
-        if index== int(index):  # type: ignore[name-defined]
-            return sorted_data[int(index)]  # type: ignore[name-defined]
+        if index == int(index):
+            return sorted_data[int(index)]
         else:
-            _lower=sorted_data[int(index)]  # type: ignore[name-defined]
-            _upper=sorted_data[int(index) + 1]  # type: ignore[name-defined]
-            return lower + (upper - lower) * (index - int(index))  # type: ignore[name-defined]
+            lower=sorted_data[int(index)]
+            upper=sorted_data[int(index) + 1]
+            return lower + (upper - lower) * (index - int(index))
 
     def _calculate_ewma(self, values: List[float], alpha: float=0.3) -> float:
         """Calculate exponential weighted moving average."""
@@ -1102,7 +1489,7 @@ class AnomalyDetectionEngine:
 
         ewma=values[0]
         for value in values[1:]:
-            _ewma=alpha * value + (1 - alpha) * ewma
+            ewma=alpha * value + (1 - alpha) * ewma
 
         return ewma
 
@@ -1113,11 +1500,11 @@ class AnomalyDetectionEngine:
         if not values or len(values) < 2:
             return 0.0
 
-        _squared_devs=[(v - ewma) ** 2 for v in values]
-        ewma_var=squared_devs[0]  # type: ignore[name-defined]
+        squared_devs=[(v - ewma) ** 2 for v in values]
+        ewma_var=squared_devs[0]
 
-        for dev in squared_devs[1:]:  # type: ignore[name-defined]
-            _ewma_var=alpha * dev + (1 - alpha) * ewma_var
+        for dev in squared_devs[1:]:
+            ewma_var=alpha * dev + (1 - alpha) * ewma_var
 
         return math.sqrt(ewma_var)
 
@@ -1126,18 +1513,18 @@ class AnomalyDetectionEngine:
         if len(x) < 2 or len(x) != len(y):
             return 0.0
 
-        _n=len(x)
-        _mean_x=sum(x) / n  # type: ignore[name-defined]
-        _mean_y=sum(y) / n  # type: ignore[name-defined]
+        n=len(x)
+        mean_x=sum(x) / n
+        mean_y=sum(y) / n
 
-        _numerator=sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))  # type: ignore[name-defined]
-        _denom_x=math.sqrt(sum((x[i] - mean_x) ** 2 for i in range(n)))  # type: ignore[name-defined]
-        _denom_y=math.sqrt(sum((y[i] - mean_y) ** 2 for i in range(n)))  # type: ignore[name-defined]
+        numerator=sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
+        denom_x=math.sqrt(sum((x[i] - mean_x) ** 2 for i in range(n)))
+        denom_y=math.sqrt(sum((y[i] - mean_y) ** 2 for i in range(n)))
 
-        if denom_x == 0 or denom_y == 0:  # type: ignore[name-defined]
+        if denom_x == 0 or denom_y == 0:
             return 0.0
 
-        return numerator / (denom_x * denom_y)  # type: ignore[name-defined]
+        return numerator / (denom_x * denom_y)
 
 
 # Global engine instance
@@ -1158,23 +1545,23 @@ def get_anomaly_engine(
     global _engine
     if _engine is None:
     # Setup default logger
-        _logger=logging.getLogger("DebVisor.Anomaly")
-        logger.setLevel(logging.INFO)  # type: ignore[name-defined]
+        logger=logging.getLogger("DebVisor.Anomaly")
+        logger.setLevel(logging.INFO)
 
         # Ensure config dir exists for logging
         import os
 
         try:
             os.makedirs(config_dir, exist_ok=True)
-            _handler=logging.FileHandler(os.path.join(config_dir, "anomaly.log"))
+            handler=logging.FileHandler(os.path.join(config_dir, "anomaly.log"))
             formatter=logging.Formatter(
                 "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             )
-            handler.setFormatter(formatter)  # type: ignore[name-defined]
-            logger.addHandler(handler)  # type: ignore[name-defined]
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
         except (OSError, IOError):
             pass
 
-        _config=AnomalyConfig(config_dir=config_dir)
-        _engine=AnomalyDetectionEngine(config=config, logger=logger)  # type: ignore[name-defined]
+        config=AnomalyConfig(config_dir=config_dir)
+        _engine=AnomalyDetectionEngine(config=config, logger=logger)
     return _engine
@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Streaming, batched anomaly detection with incremental baselines.
+
+Scores columnar batches of ``(resource, metric, value, timestamp)`` samples
+for every series at once with NumPy, instead of one value per call.
+
+Features:
+- Per-series state kept in flat NumPy arrays (about 100 bytes per series)
+- Welford running mean/variance with min/max, aged once a series exceeds
+  ``max_samples`` so the baseline follows slow drift
+- Streaming p25/p50/p75/p95 estimates (stochastic-approximation quantile
+  tracking, O(1) memory per quantile) for IQR fences
+- Rolling EWMA mean/variance state for EWMA deviation scoring
+- Z-score, IQR and EWMA scores for a whole batch in a few vector operations
+
+Each sample is scored against the baseline *before* it is folded in. When a
+batch holds several samples of one series they are applied in input order:
+the batch is split into rounds where each series appears at most once.
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from uuid import uuid4
+
+import numpy as np
+
+from opt.services.anomaly.core import (
+    AnomalyAlert,
+    AnomalyType,
+    Baseline,
+    DetectionMethod,
+    MetricType,
+    SeverityLevel,
+)
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = np.array([0.25, 0.5, 0.75, 0.95])
+# Standard normal quantiles used to seed the estimates during warm-up
+_NORMAL_Z = np.array([-0.6745, 0.0, 0.6745, 1.6449])
+_EPS = 1e-12
+BATCH_METHODS = (DetectionMethod.Z_SCORE, DetectionMethod.IQR, DetectionMethod.EWMA)
+
+SeriesKey = Tuple[str, MetricType]
+MetricTypes = Union[MetricType, str, Sequence[Union[MetricType, str]]]
+
+
+# ============================================================================
+# Results
+# ============================================================================
+@dataclass
+class BatchDetectionResult:
+    """Columnar scores for one batch, aligned with the input order."""
+
+    series_ids: np.ndarray
+    z_scores: np.ndarray
+    iqr_scores: np.ndarray    # Distance beyond the IQR fence, in IQRs
+    ewma_scores: np.ndarray    # Deviation from the EWMA, in EWMA stddevs
+    anomalous: np.ndarray    # True where any enabled method fired
+    alerts: List[AnomalyAlert] = field(default_factory=list)
+
+    @property
+    def anomaly_count(self) -> int:
+        """Number of samples flagged by at least one method."""
+        return int(self.anomalous.sum())
+
+
+# ============================================================================
+# Streaming Detector
+# ============================================================================
+class StreamingAnomalyDetector:
+    """Vectorised z-score / IQR / EWMA detection over many series."""
+
+    def __init__(
+        self,
+        z_score_threshold: float = 3.0,
+        iqr_multiplier: float = 1.5,
+        ewma_alpha: float = 0.3,
+        ewma_threshold: float = 2.0,
+        min_samples: int = 10,
+        min_ewma_samples: int = 5,
+        max_samples: int = 10000,
+        quantile_step: float = 0.05,
+        min_confidence: float = 0.0,
+        initial_capacity: int = 1024,
+    ) -> None:
+        """Initialize the detector.
+
+        Args:
+            z_score_threshold: Z-score above which a sample is anomalous
+            iqr_multiplier: Fence distance in IQRs (Tukey's 1.5 by default)
+            ewma_alpha: Smoothing factor of the EWMA state
+            ewma_threshold: EWMA deviation (in stddevs) that is anomalous
+            min_samples: Samples a series needs before z-score/IQR scoring
+            min_ewma_samples: Samples a series needs before EWMA scoring
+            max_samples: Baseline weight cap; beyond it history is halved
+            quantile_step: Quantile tracking step, in baseline stddevs
+            min_confidence: Alerts below this confidence are not emitted
+            initial_capacity: Number of series to pre-allocate
+        """
+        if not 0 < ewma_alpha <= 1:
+            raise ValueError("ewma_alpha must be in (0, 1]")
+        self.z_score_threshold = z_score_threshold
+        self.iqr_multiplier = iqr_multiplier
+        self.ewma_alpha = ewma_alpha
+        self.ewma_threshold = ewma_threshold
+        self.min_samples = max(2, min_samples)
+        self.min_ewma_samples = max(2, min_ewma_samples)
+        self.max_samples = max_samples
+        self.quantile_step = quantile_step
+        self.min_confidence = min_confidence
+
+        self._index: Dict[SeriesKey, int] = {}
+        self._keys: List[SeriesKey] = []
+        self._metric_cache: Dict[Union[MetricType, str], MetricType] = {
+            m: m for m in MetricType
+        }
+        self._capacity = 0
+        self._allocate(max(1, initial_capacity))
+
+    # ------------------------------------------------------------------------
+    # Series registry and state arrays
+    # ------------------------------------------------------------------------
+    def _allocate(self, capacity: int) -> None:
+        def grow(name: str, fill: float, shape: Tuple[int, ...] = ()) -> None:
+            fresh = np.full((capacity,) + shape, fill, dtype=np.float64)
+            if self._capacity:
+                fresh[: self._capacity] = getattr(self, name)
+            setattr(self, name, fresh)
+
+        grow("count", 0.0)    # Baseline weight (aged)
+        grow("mean", 0.0)
+        grow("m2", 0.0)
+        grow("min_value", math.inf)
+        grow("max_value", -math.inf)
+        grow("seen", 0.0)    # Samples ever observed
+        grow("ewma", 0.0)
+        grow("ewm_var", 0.0)
+        grow("last_timestamp", 0.0)
+        grow("quantiles", 0.0, (len(QUANTILES),))
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _metric(self, metric_type: Union[MetricType, str]) -> MetricType:
+        metric = self._metric_cache.get(metric_type)
+        if metric is None:
+            metric = self._metric_cache[metric_type] = MetricType(metric_type)
+        return metric
+
+    def _add_series(self, resource_id: str, metric_type: MetricType) -> int:
+        key = (resource_id, metric_type)
+        series_id = self._index.get(key)
+        if series_id is None:
+            series_id = self._index[key] = len(self._keys)
+            self._keys.append(key)
+            if series_id >= self._capacity:
+                self._allocate(self._capacity * 2)
+        return series_id
+
+    def series_id(self, resource_id: str, metric_type: Union[MetricType, str]) -> Optional[int]:
+        """Series index for a resource/metric, or None if never seen."""
+        return self._index.get((resource_id, self._metric(metric_type)))
+
+    def series_key(self, series_id: int) -> SeriesKey:
+        """Resource and metric type of a series index."""
+        return self._keys[series_id]
+
+    def resolve(self, resource_ids: Sequence[str], metric_types: MetricTypes) -> np.ndarray:
+        """Map resource/metric columns to series indexes, registering new series.
+
+        Resolve once and reuse the indexes with ``process_series`` when the
+        same series are scraped repeatedly.
+        """
+        if isinstance(metric_types, (MetricType, str)):
+            metric = self._metric(metric_types)
+            keys: Iterable[SeriesKey] = ((rid, metric) for rid in resource_ids)
+        else:
+            if len(metric_types) != len(resource_ids):
+                raise ValueError("resource_ids and metric_types must have the same length")
+            to_metric = self._metric
+            keys = ((rid, to_metric(m)) for rid, m in zip(resource_ids, metric_types))
+
+        get = self._index.get
+        add = self._add_series
+        return np.fromiter(
+            (
+                sid if (sid := get(key)) is not None else add(*key)
+                for key in keys
+            ),
+            dtype=np.int64,
+            count=len(resource_ids),
+        )
+
+    # ------------------------------------------------------------------------
+    # Batch processing
+    # ------------------------------------------------------------------------
+    def process_batch(
+        self,
+        resource_ids: Sequence[str],
+        metric_types: MetricTypes,
+        values: Sequence[float],
+        timestamps: Optional[Sequence[float]] = None,
+        methods: Optional[Sequence[DetectionMethod]] = None,
+        emit_alerts: bool = True,
+    ) -> BatchDetectionResult:
+        """Score and ingest a columnar batch.
+
+        Args:
+            resource_ids: Resource identifier per sample
+            metric_types: Metric type per sample, or one for the whole batch
+            values: Metric values
+            timestamps: Epoch seconds per sample (defaults to now)
+            methods: Subset of z-score / IQR / EWMA (default: all three)
+            emit_alerts: Build AnomalyAlert objects for flagged samples
+
+        Returns:
+            BatchDetectionResult aligned with the input order
+        """
+        series_ids = self.resolve(resource_ids, metric_types)
+        return self.process_series(series_ids, values, timestamps, methods, emit_alerts)
+
+    def process_series(
+        self,
+        series_ids: Sequence[int],
+        values: Sequence[float],
+        timestamps: Optional[Sequence[float]] = None,
+        methods: Optional[Sequence[DetectionMethod]] = None,
+        emit_alerts: bool = True,
+    ) -> BatchDetectionResult:
+        """Score and ingest a batch of already resolved series indexes."""
+        ids = np.asarray(series_ids, dtype=np.int64)
+        x = np.asarray(values, dtype=np.float64)
+        if ids.shape != x.shape:
+            raise ValueError("series_ids and values must have the same length")
+        if ids.size and (ids.min() < 0 or ids.max() >= len(self._keys)):
+            raise ValueError("Unknown series id in batch")
+        now = datetime.now(timezone.utc).timestamp()
+        ts = (
+            np.full(x.shape, now)
+            if timestamps is None
+            else np.asarray(timestamps, dtype=np.float64)
+        )
+        enabled = set(BATCH_METHODS if methods is None else methods)
+
+        n = ids.size
+        z_scores = np.zeros(n)
+        iqr_scores = np.zeros(n)
+        ewma_scores = np.zeros(n)
+        flags = {method: np.zeros(n, dtype=bool) for method in BATCH_METHODS}
+        # Baseline values each flagged sample was scored against (for alerts)
+        context = np.zeros((n, 7))
+
+        for idx in self._rounds(ids):
+            s = ids[idx]
+            v = x[idx]
+            self._score(idx, s, v, enabled, z_scores, iqr_scores, ewma_scores, flags, context)
+            self._update(s, v, ts[idx])
+
+        alerts: List[AnomalyAlert] = []
+        if emit_alerts:
+            alerts = self._build_alerts(ids, x, ts, z_scores, iqr_scores, ewma_scores, flags, context)
+        anomalous = np.zeros(n, dtype=bool)
+        for method in enabled:
+            if method in flags:
+                anomalous |= flags[method]
+        return BatchDetectionResult(
+            series_ids=ids,
+            z_scores=z_scores,
+            iqr_scores=iqr_scores,
+            ewma_scores=ewma_scores,
+            anomalous=anomalous,
+            alerts=alerts,
+        )
+
+    @staticmethod
+    def _rounds(ids: np.ndarray) -> List[np.ndarray]:
+        """Split sample positions into rounds with unique series, in input order."""
+        n = ids.size
+        if n == 0:
+            return []
+        order = np.argsort(ids, kind="stable")
+        sorted_ids = ids[order]
+        new_run = np.empty(n, dtype=bool)
+        new_run[0] = True
+        np.not_equal(sorted_ids[1:], sorted_ids[:-1], out=new_run[1:])
+        positions = np.arange(n)
+        rank = positions - np.maximum.accumulate(np.where(new_run, positions, 0))
+        if not rank.any():
+            return [positions]    # One sample per series: a single round
+        by_rank = order[np.argsort(rank, kind="stable")]
+        return np.split(by_rank, np.cumsum(np.bincount(rank))[:-1])
+
+    def _score(
+        self,
+        idx: np.ndarray,
+        s: np.ndarray,
+        v: np.ndarray,
+        enabled: set,
+        z_scores: np.ndarray,
+        iqr_scores: np.ndarray,
+        ewma_scores: np.ndarray,
+        flags: Dict[DetectionMethod, np.ndarray],
+        context: np.ndarray,
+    ) -> None:
+        count = self.count[s]
+        ready = self.seen[s] >= self.min_samples
+        if not ready.any() and not (self.seen[s] >= self.min_ewma_samples).any():
+            return
+        mean = self.mean[s]
+        std = np.sqrt(self.m2[s] / np.maximum(count - 1, 1))
+        context[idx, 0] = mean
+        context[idx, 1] = std
+
+        if DetectionMethod.Z_SCORE in enabled:
+            z = np.where(ready & (std > 0), np.abs(v - mean) / np.maximum(std, _EPS), 0.0)
+            z_scores[idx] = z
+            flags[DetectionMethod.Z_SCORE][idx] = z > self.z_score_threshold
+
+        if DetectionMethod.IQR in enabled:
+            q25 = self.quantiles[s, 0]
+            q75 = self.quantiles[s, 2]
+            iqr = q75 - q25
+            lower = q25 - self.iqr_multiplier * iqr
+            upper = q75 + self.iqr_multiplier * iqr
+            beyond = np.maximum(lower - v, v - upper)
+            outside = ready & (beyond > 0)
+            iqr_scores[idx] = np.where(outside, beyond / np.maximum(iqr, _EPS), 0.0)
+            flags[DetectionMethod.IQR][idx] = outside
+            context[idx, 2] = lower
+            context[idx, 3] = upper
+            context[idx, 4] = self.max_value[s] - self.min_value[s]
+
+        if DetectionMethod.EWMA in enabled:
+            ewma = self.ewma[s]
+            ew_std = np.sqrt(self.ewm_var[s])
+            usable = (self.seen[s] >= self.min_ewma_samples) & (ew_std > 0)
+            deviation = np.where(usable, np.abs(v - ewma) / np.maximum(ew_std, _EPS), 0.0)
+            ewma_scores[idx] = deviation
+            flags[DetectionMethod.EWMA][idx] = deviation > self.ewma_threshold
+            context[idx, 5] = ewma
+            context[idx, 6] = ew_std
+
+    def _update(self, s: np.ndarray, v: np.ndarray, ts: np.ndarray) -> None:
+        # Welford
+        count = self.count[s] + 1
+        delta = v - self.mean[s]
+        mean = self.mean[s] + delta / count
+        m2 = self.m2[s] + delta * (v - mean)
+        self.count[s] = count
+        self.mean[s] = mean
+        self.m2[s] = m2
+        self.min_value[s] = np.minimum(self.min_value[s], v)
+        self.max_value[s] = np.maximum(self.max_value[s], v)
+        self.last_timestamp[s] = np.maximum(self.last_timestamp[s], ts)
+
+        # EWMA mean and variance
+        seen = self.seen[s]
+        first = seen == 0
+        diff = v - self.ewma[s]
+        increment = self.ewma_alpha * diff
+        self.ewma[s] = np.where(first, v, self.ewma[s] + increment)
+        self.ewm_var[s] = np.where(
+            first, 0.0, (1 - self.ewma_alpha) * (self.ewm_var[s] + diff * increment)
+        )
+        seen = seen + 1
+        self.seen[s] = seen
+
+        # Quantiles: normal approximation while warming up, then tracking
+        std = np.sqrt(m2 / np.maximum(count - 1, 1))
+        warm = (seen <= self.min_samples)[:, None]
+        seeded = mean[:, None] + _NORMAL_Z * std[:, None]
+        current = self.quantiles[s]
+        step = (self.quantile_step * np.maximum(std, _EPS))[:, None]
+        tracked = current + step * (QUANTILES - (v[:, None] < current))
+        self.quantiles[s] = np.where(warm, seeded, tracked)
+
+        # Age long histories so the baseline keeps adapting
+        over = count > self.max_samples
+        if over.any():
+            aged = s[over]
+            self.count[aged] *= 0.5
+            self.m2[aged] *= 0.5
+
+    def _build_alerts(
+        self,
+        ids: np.ndarray,
+        x: np.ndarray,
+        ts: np.ndarray,
+        z_scores: np.ndarray,
+        iqr_scores: np.ndarray,
+        ewma_scores: np.ndarray,
+        flags: Dict[DetectionMethod, np.ndarray],
+        context: np.ndarray,
+    ) -> List[AnomalyAlert]:
+        """AnomalyAlert objects for flagged samples, scored like the per-value engine."""
+        alerts: List[AnomalyAlert] = []
+
+        flagged = np.flatnonzero(flags[DetectionMethod.Z_SCORE])
+        if flagged.size:
+            z = z_scores[flagged]
+            confidence = np.minimum(1.0, (z - self.z_score_threshold) / 2.0)
+            for n, pos in enumerate(flagged.tolist()):
+                if confidence[n] < self.min_confidence:
+                    continue
+                mean, std = context[pos, 0], context[pos, 1]
+                value = float(x[pos])
+                anomaly_type = AnomalyType.SPIKE if value > mean else AnomalyType.DIP
+                alerts.append(self._alert(
+                    ids[pos], ts[pos], value, anomaly_type,
+                    SeverityLevel.WARNING if confidence[n] < 0.7 else SeverityLevel.CRITICAL,
+                    float(confidence[n]),
+                    (mean - 2 * std, mean + 2 * std),
+                    DetectionMethod.Z_SCORE,
+                    f"{anomaly_type.value} detected: {value:.2f} (Z-score: {z[n]:.2f})",
+                    {
+                        "z_score": float(z[n]),
+                        "baseline_mean": float(mean),
+                        "baseline_stddev": float(std),
+                    },
+                ))
+
+        flagged = np.flatnonzero(flags[DetectionMethod.IQR])
+        if flagged.size:
+            lower, upper, spread = context[flagged, 2], context[flagged, 3], context[flagged, 4]
+            v = x[flagged]
+            distance = np.maximum(np.abs(v - upper), np.abs(v - lower))
+            confidence = np.where(
+                spread > 0, np.minimum(1.0, 0.65 + distance / np.maximum(spread, _EPS)), 1.0
+            )
+            for n, pos in enumerate(flagged.tolist()):
+                if confidence[n] < self.min_confidence:
+                    continue
+                value = float(x[pos])
+                anomaly_type = AnomalyType.SPIKE if value > upper[n] else AnomalyType.DIP
+                alerts.append(self._alert(
+                    ids[pos], ts[pos], value, anomaly_type,
+                    SeverityLevel.WARNING if confidence[n] < 0.7 else SeverityLevel.CRITICAL,
+                    float(confidence[n]),
+                    (float(lower[n]), float(upper[n])),
+                    DetectionMethod.IQR,
+                    f"{anomaly_type.value} detected (IQR): {value:.2f}",
+                    {
+                        "iqr": float(upper[n] - lower[n]) / (1 + 2 * self.iqr_multiplier),
+                        "lower_fence": float(lower[n]),
+                        "upper_fence": float(upper[n]),
+                        "iqr_score": float(iqr_scores[pos]),
+                    },
+                ))
+
+        flagged = np.flatnonzero(flags[DetectionMethod.EWMA])
+        if flagged.size:
+            deviation = ewma_scores[flagged]
+            confidence = np.minimum(1.0, (deviation - self.ewma_threshold) / 2.0)
+            for n, pos in enumerate(flagged.tolist()):
+                if confidence[n] < self.min_confidence:
+                    continue
+                ewma, ew_std = context[pos, 5], context[pos, 6]
+                value = float(x[pos])
+                anomaly_type = AnomalyType.SPIKE if value > ewma else AnomalyType.DIP
+                if confidence[n] < 0.7:
+                    severity = SeverityLevel.INFO
+                elif confidence[n] < 0.85:
+                    severity = SeverityLevel.WARNING
+                else:
+                    severity = SeverityLevel.CRITICAL
+                alerts.append(self._alert(
+                    ids[pos], ts[pos], value, anomaly_type, severity,
+                    float(confidence[n]),
+                    (ewma - 2 * ew_std, ewma + 2 * ew_std),
+                    DetectionMethod.EWMA,
+                    f"{anomaly_type.value} detected (EWMA): {value:.2f}",
+                    {
+                        "ewma": float(ewma),
+                        "ewma_stddev": float(ew_std),
+                        "deviation": float(deviation[n]),
+                    },
+                ))
+        return alerts
+
+    def _alert(
+        self,
+        series_id: int,
+        timestamp: float,
+        value: float,
+        anomaly_type: AnomalyType,
+        severity: SeverityLevel,
+        confidence: float,
+        expected_range: Tuple[float, float],
+        method: DetectionMethod,
+        message: str,
+        details: Dict[str, float],
+    ) -> AnomalyAlert:
+        resource_id, metric_type = self._keys[int(series_id)]
+        return AnomalyAlert(
+            alert_id=str(uuid4())[:8],
+            timestamp=datetime.fromtimestamp(float(timestamp), timezone.utc),
+            resource_id=resource_id,
+            metric_type=metric_type,
+            anomaly_type=anomaly_type,
+            severity=severity,
+            confidence=confidence,
+            detected_value=value,
+            expected_range=(float(expected_range[0]), float(expected_range[1])),
+            detection_method=method,
+            message=message,
+            details=details,
+        )
+
+    # ------------------------------------------------------------------------
+    # Baselines
+    # ------------------------------------------------------------------------
+    def baseline(
+        self, resource_id: str, metric_type: Union[MetricType, str]
+    ) -> Optional[Baseline]:
+        """Current incremental baseline of a series as a ``Baseline``."""
+        series_id = self.series_id(resource_id, metric_type)
+        if series_id is None or not self.seen[series_id]:
+            return None
+        count = self.count[series_id]
+        p25, p50, p75, p95 = (float(q) for q in self.quantiles[series_id])
+        return Baseline(
+            metric_type=self._keys[series_id][1],
+            resource_id=resource_id,
+            mean=float(self.mean[series_id]),
+            stddev=float(math.sqrt(self.m2[series_id] / max(count - 1, 1))),
+            min_value=float(self.min_value[series_id]),
+            max_value=float(self.max_value[series_id]),
+            p25=p25,
+            p50=p50,
+            p75=p75,
+            p95=p95,
+            sample_count=int(self.seen[series_id]),
+            last_updated=datetime.fromtimestamp(self.last_timestamp[series_id], timezone.utc),
+        )
+
+    def reset(self) -> None:
+        """Forget all series and baselines."""
+        self._index.clear()
+        self._keys.clear()
+        capacity = self._capacity
+        self._capacity = 0
+        self._allocate(capacity)
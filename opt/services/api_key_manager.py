@@ -24,6 +24,7 @@ Features:
 - Key usage tracking
 - Support for multiple active keys per principal
 - Graceful key deprecation
+- Lifecycle listeners (e.g. to evict cached credentials on revocation)
 """
 
 import secrets
@@ -33,11 +34,11 @@ import json
 import os
 from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from enum import Enum
 from pathlib import Path
 
-_logger=logging.getLogger(__name__)
+logger=logging.getLogger(__name__)
 
 
 class KeyStatus(Enum):
@@ -66,14 +67,14 @@ class APIKey:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        _data=asdict(self)
-        data["created_at"] = self.created_at.isoformat()  # type: ignore[name-defined]
-        data["expires_at"] = self.expires_at.isoformat()  # type: ignore[name-defined]
-        data["last_used_at"] = (  # type: ignore[name-defined]
+        data=asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        data["expires_at"] = self.expires_at.isoformat()
+        data["last_used_at"] = (
             self.last_used_at.isoformat() if self.last_used_at else None
         )
-        data["status"] = self.status.value  # type: ignore[name-defined]
-        return data  # type: ignore[name-defined]
+        data["status"] = self.status.value
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "APIKey":
@@ -107,9 +108,9 @@ class APIKeyManager:
     Implements AUTH-001: API key rotation mechanism.
     """
 
-    def __init__(self, config: KeyRotationConfig, storagepath: str) -> None:
+    def __init__(self, config: KeyRotationConfig, storage_path: str) -> None:
         self.config=config
-        self.storage_path=Path(storage_path)  # type: ignore[name-defined]
+        self.storage_path=Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.keys_file=self.storage_path / "api_keys.json"
         self.audit_log=self.storage_path / "api_key_audit.log"
@@ -118,7 +119,10 @@ class APIKeyManager:
         self.keys: Dict[str, APIKey] = {}
         self._load_keys()
 
-        logger.info(  # type: ignore[name-defined]
+        # Lifecycle listeners: callback(event, key, details)
+        self._listeners: List[Callable[[str, APIKey, Dict[str, Any]], None]] = []
+
+        logger.info(
             f"APIKeyManager initialized: expiration={config.expiration_days}d, "
             f"overlap={config.overlap_days}d"
         )
@@ -127,18 +131,18 @@ class APIKeyManager:
         """Load keys from persistent storage."""
         if self.keys_file.exists():
             with open(self.keys_file, "r") as f:
-                _data=json.load(f)
+                data=json.load(f)
                 self.keys={
                     key_id: APIKey.from_dict(key_data)
-                    for key_id, key_data in data.items()  # type: ignore[name-defined]
+                    for key_id, key_data in data.items()
                 }
-            logger.info(f"Loaded {len(self.keys)} API keys from storage")  # type: ignore[name-defined]
+            logger.info(f"Loaded {len(self.keys)} API keys from storage")
 
     def _save_keys(self) -> None:
         """Save keys to persistent storage."""
-        _data={key_id: key.to_dict() for key_id, key in self.keys.items()}
+        data={key_id: key.to_dict() for key_id, key in self.keys.items()}
         with open(self.keys_file, "w") as f:
-            json.dump(data, f, indent=2)  # type: ignore[name-defined]
+            json.dump(data, f, indent=2)
 
     def _audit_log_event(
         self, event: str, key_id: str, principal_id: str, details: Dict[str, Any]
@@ -155,11 +159,32 @@ class APIKeyManager:
         with open(self.audit_log, "a") as f:
             f.write(json.dumps(log_entry) + "\n")
 
-        logger.info(  # type: ignore[name-defined]
+        logger.info(
             f"API key audit: event={event}, key_id={key_id}, "
             f"principal={principal_id}"
         )
 
+    def register_listener(
+        self, callback: Callable[[str, APIKey, Dict[str, Any]], None]
+    ) -> None:
+        """
+        Register a callback for key lifecycle events.
+
+        Called as callback(event, key, details) for key_rotated,
+        key_revoked, key_expired and key_removed.
+        """
+        self._listeners.append(callback)
+
+    def _notify_listeners(
+        self, event: str, key_obj: APIKey, details: Dict[str, Any]
+    ) -> None:
+        """Invoke lifecycle listeners; a failing listener does not block others."""
+        for callback in self._listeners:
+            try:
+                callback(event, key_obj, details)
+            except Exception as e:
+                logger.error(f"API key listener error: {e}")
+
     def _generate_key(self) -> str:
         """Generate cryptographically secure random API key."""
         # Format: dv_<random_32_bytes_hex>
@@ -185,89 +210,90 @@ class APIKeyManager:
             (api_key, APIKey): The actual key and metadata
         """
         # Generate key
-        _api_key=self._generate_key()
-        _key_hash=self._hash_key(api_key)
-        _key_id=f"key_{secrets.token_hex(8)}"
+        api_key=self._generate_key()
+        key_hash=self._hash_key(api_key)
+        key_id=f"key_{secrets.token_hex(8)}"
 
         # Calculate expiration
-        _now=datetime.now(timezone.utc)
+        now=datetime.now(timezone.utc)
         expiration_days=custom_expiration_days or self.config.expiration_days
-        _expires_at=now + timedelta(days=expiration_days)  # type: ignore[name-defined]
+        expires_at=now + timedelta(days=expiration_days)
 
         # Create key object
-        _key_obj=APIKey(  # type: ignore[call-arg]
-            _key_id=key_id,  # type: ignore[name-defined]
-            _principal_id=principal_id,
-            _key_hash=key_hash,  # type: ignore[name-defined]
-            _created_at=now,  # type: ignore[name-defined]
-            _expires_at=expires_at,  # type: ignore[name-defined]
-            _last_used_at=None,
-            _use_count=0,
-            _status=KeyStatus.ACTIVE,
-            _description=description,
+        key_obj=APIKey(
+            key_id=key_id,
+            principal_id=principal_id,
+            key_hash=key_hash,
+            created_at=now,
+            expires_at=expires_at,
+            last_used_at=None,
+            use_count=0,
+            status=KeyStatus.ACTIVE,
+            description=description,
         )
 
         # Store key
-        self.keys[key_id] = key_obj  # type: ignore[name-defined]
+        self.keys[key_id] = key_obj
         self._save_keys()
 
         # Audit log (skip if part of rotation)
         if not skip_audit:
-            self._audit_log_event(  # type: ignore[call-arg]
-                _event="key_created",
-                _key_id=key_id,  # type: ignore[name-defined]
-                _principal_id=principal_id,
-                _details={
-                    "expires_at": expires_at.isoformat(),  # type: ignore[name-defined]
+            self._audit_log_event(
+                event="key_created",
+                key_id=key_id,
+                principal_id=principal_id,
+                details={
+                    "expires_at": expires_at.isoformat(),
                     "description": description,
                 },
             )
 
-        logger.info(  # type: ignore[name-defined]
-            f"Created API key: key_id={key_id}, principal={principal_id}, "  # type: ignore[name-defined]
-            f"expires={expires_at.date()}"  # type: ignore[name-defined]
+        logger.info(
+            f"Created API key: key_id={key_id}, principal={principal_id}, "
+            f"expires={expires_at.date()}"
         )
 
         return api_key, key_obj
 
-    def validate_key(self, apikey: str) -> Optional[APIKey]:
+    def validate_key(self, api_key: str) -> Optional[APIKey]:
         """
         Validate API key and return key metadata if valid.
 
         Returns None if key is invalid, expired, or revoked.
         """
-        _key_hash=self._hash_key(api_key)
+        key_hash=self._hash_key(api_key)
 
         # Find key by hash
         for key_obj in self.keys.values():
-            if key_obj.key_hash == key_hash:  # type: ignore[name-defined]
+            if key_obj.key_hash == key_hash:
             # Check status
                 if key_obj.status in [KeyStatus.EXPIRED, KeyStatus.REVOKED]:
-                    logger.warning(  # type: ignore[name-defined]
+                    logger.warning(
                         f"Rejected {key_obj.status.value} key: "
                         f"key_id={key_obj.key_id}, principal={key_obj.principal_id}"
                     )
                     return None
 
                 # Check expiration
-                _now=datetime.now(timezone.utc)
-                if now > key_obj.expires_at:  # type: ignore[name-defined]
-                    logger.warning(  # type: ignore[name-defined]
+                now=datetime.now(timezone.utc)
+                if now > key_obj.expires_at:
+                    logger.warning(
                         f"Rejected expired key: key_id={key_obj.key_id}, "
                         f"principal={key_obj.principal_id}"
                     )
                     key_obj.status=KeyStatus.EXPIRED
                     self._save_keys()
+                    self._notify_listeners("key_expired", key_obj, {})
                     return None
 
                 # Update usage stats
-                key_obj.last_used_at=now  # type: ignore[name-defined]
+                key_obj.last_used_at=now
                 key_obj.use_count += 1
                 self._save_keys()
 
                 return key_obj
 
-        logger.warning("Rejected unknown API key")  # type: ignore[name-defined]
+        logger.warning("Rejected unknown API key")
         return None
 
     def rotate_key(
@@ -282,73 +308,77 @@ class APIKeyManager:
         Returns:
             (new_api_key, APIKey): The new key and metadata
         """
-        _old_key=self.keys.get(old_key_id)
-        if not old_key:  # type: ignore[name-defined]
+        old_key=self.keys.get(old_key_id)
+        if not old_key:
             raise ValueError(f"Key not found: {old_key_id}")
 
         # Generate rotation ID to link keys
-        _rotation_id=f"rotation_{secrets.token_hex(8)}"
+        rotation_id=f"rotation_{secrets.token_hex(8)}"
 
         # Create new key
-        new_api_key, new_key_obj=self.create_key(  # type: ignore[call-arg]
-            _principal_id=old_key.principal_id,  # type: ignore[name-defined]
-            _description=description,
-            _skip_audit=True,    # Don't log key_created for rotations
+        new_api_key, new_key_obj=self.create_key(
+            principal_id=old_key.principal_id,
+            description=description,
+            skip_audit=True,    # Don't log key_created for rotations
         )
-        new_key_obj.rotation_id=rotation_id  # type: ignore[name-defined]
+        new_key_obj.rotation_id=rotation_id
 
         # Update old key status
-        _now=datetime.now(timezone.utc)
-        old_key.status=KeyStatus.EXPIRING  # type: ignore[name-defined]
-        old_key.rotation_id=rotation_id  # type: ignore[name-defined]
-        old_key.expires_at=now + timedelta(days=self.config.overlap_days)  # type: ignore[name-defined]
+        now=datetime.now(timezone.utc)
+        old_key.status=KeyStatus.EXPIRING
+        old_key.rotation_id=rotation_id
+        old_key.expires_at=now + timedelta(days=self.config.overlap_days)
 
         self._save_keys()
 
         # Audit log
-        self._audit_log_event(  # type: ignore[call-arg]
-            _event="key_rotated",
-            _key_id=old_key_id,
-            _principal_id=old_key.principal_id,  # type: ignore[name-defined]
-            _details={
+        self._audit_log_event(
+            event="key_rotated",
+            key_id=old_key_id,
+            principal_id=old_key.principal_id,
+            details={
                 "new_key_id": new_key_obj.key_id,
-                "rotation_id": rotation_id,  # type: ignore[name-defined]
+                "rotation_id": rotation_id,
                 "overlap_days": self.config.overlap_days,
             },
         )
+        self._notify_listeners(
+            "key_rotated", old_key, {"new_key_id": new_key_obj.key_id, "rotation_id": rotation_id}
+        )
 
-        logger.info(  # type: ignore[name-defined]
+        logger.info(
             f"Rotated API key: old_key={old_key_id}, new_key={new_key_obj.key_id}, "
-            f"rotation_id={rotation_id}"  # type: ignore[name-defined]
+            f"rotation_id={rotation_id}"
         )
 
         return new_api_key, new_key_obj
 
-    def revoke_key(self, keyid: str, reason: str="") -> None:
+    def revoke_key(self, key_id: str, reason: str="") -> None:
         """Revoke an API key immediately."""
-        _key_obj=self.keys.get(key_id)  # type: ignore[name-defined]
+        key_obj=self.keys.get(key_id)
         if not key_obj:
-            raise ValueError(f"Key not found: {key_id}")  # type: ignore[name-defined]
+            raise ValueError(f"Key not found: {key_id}")
 
         key_obj.status=KeyStatus.REVOKED
         self._save_keys()
 
         # Audit log
-        self._audit_log_event(  # type: ignore[call-arg]
-            _event="key_revoked",
-            _key_id=key_id,  # type: ignore[name-defined]
-            _principal_id=key_obj.principal_id,
-            _details={"reason": reason},
+        self._audit_log_event(
+            event="key_revoked",
+            key_id=key_id,
+            principal_id=key_obj.principal_id,
+            details={"reason": reason},
         )
+        self._notify_listeners("key_revoked", key_obj, {"reason": reason})
 
-        logger.warning(  # type: ignore[name-defined]
-            f"Revoked API key: key_id={key_id}, principal={key_obj.principal_id}, "  # type: ignore[name-defined]
+        logger.warning(
+            f"Revoked API key: key_id={key_id}, principal={key_obj.principal_id}, "
             f"reason={reason}"
         )
 
-    def list_keys_for_principal(self, principalid: str) -> List[APIKey]:
+    def list_keys_for_principal(self, principal_id: str) -> List[APIKey]:
         """List all keys for a principal."""
-        return [key for key in self.keys.values() if key.principal_id== principal_id]  # type: ignore[name-defined]
+        return [key for key in self.keys.values() if key.principal_id== principal_id]
 
     def check_expiring_keys(self) -> List[APIKey]:
         """
@@ -356,13 +386,13 @@ class APIKeyManager:
 
         Returns list of keys needing rotation.
         """
-        _now=datetime.now(timezone.utc)
-        _warning_threshold=now + timedelta(days=self.config.warning_days)  # type: ignore[name-defined]
+        now=datetime.now(timezone.utc)
+        warning_threshold=now + timedelta(days=self.config.warning_days)
 
         expiring_keys=[
             key
             for key in self.keys.values()
-            if key.status == KeyStatus.ACTIVE and key.expires_at <= warning_threshold  # type: ignore[name-defined]
+            if key.status == KeyStatus.ACTIVE and key.expires_at <= warning_threshold
         ]
 
         return expiring_keys
@@ -374,49 +404,50 @@ class APIKeyManager:
         Returns dict mapping old_key_id -> new_key_id.
         """
         if not self.config.auto_rotate:
-            logger.info("Auto-rotation disabled")  # type: ignore[name-defined]
+            logger.info("Auto-rotation disabled")
             return {}
 
-        _expiring_keys=self.check_expiring_keys()
+        expiring_keys=self.check_expiring_keys()
         rotations={}
 
-        for old_key in expiring_keys:  # type: ignore[name-defined]
+        for old_key in expiring_keys:
             try:
-                new_api_key, new_key_obj=self.rotate_key(  # type: ignore[call-arg]
+                new_api_key, new_key_obj=self.rotate_key(
                     old_key.key_id,
-                    _description=f"Auto-rotated from {old_key.key_id}",
+                    description=f"Auto-rotated from {old_key.key_id}",
                 )
                 rotations[old_key.key_id] = new_key_obj.key_id
-                logger.info(  # type: ignore[name-defined]
+                logger.info(
                     f"Auto-rotated key: {old_key.key_id} -> {new_key_obj.key_id}"
                 )
             except Exception as e:
-                logger.error(f"Failed to auto-rotate key {old_key.key_id}: {e}")  # type: ignore[name-defined]
+                logger.error(f"Failed to auto-rotate key {old_key.key_id}: {e}")
 
         return rotations
 
-    def cleanup_expired_keys(self, retentiondays: int=365) -> int:
+    def cleanup_expired_keys(self, retention_days: int=365) -> int:
         """
         Remove expired/revoked keys older than retention period.
 
         Keeps audit log intact, only removes from active key store.
         """
-        _now=datetime.now(timezone.utc)
-        _retention_threshold=now - timedelta(days=retention_days)  # type: ignore[name-defined]
+        now=datetime.now(timezone.utc)
+        retention_threshold=now - timedelta(days=retention_days)
 
         keys_to_remove=[
             key_id
             for key_id, key in self.keys.items()
             if key.status in [KeyStatus.EXPIRED, KeyStatus.REVOKED]
-            and key.expires_at < retention_threshold  # type: ignore[name-defined]
+            and key.expires_at < retention_threshold
         ]
 
         for key_id in keys_to_remove:
-            _key=self.keys.pop(key_id)
-            logger.info(  # type: ignore[name-defined]
+            key=self.keys.pop(key_id)
+            logger.info(
                 f"Cleaned up old key: key_id={key_id}, "
-                f"principal={key.principal_id}, status={key.status.value}"  # type: ignore[name-defined]
+                f"principal={key.principal_id}, status={key.status.value}"
             )
+            self._notify_listeners("key_removed", key, {})
 
         if keys_to_remove:
             self._save_keys()
@@ -425,12 +456,12 @@ class APIKeyManager:
 
     def get_key_stats(self) -> Dict[str, int]:
         """Get statistics about API keys."""
-        _total_keys=len(self.keys)
+        total_keys=len(self.keys)
         active_keys=sum(1 for k in self.keys.values() if k.status== KeyStatus.ACTIVE)
-        _expiring_keys=sum(
+        expiring_keys=sum(
             1 for k in self.keys.values() if k.status== KeyStatus.EXPIRING
         )
-        _expired_keys=sum(
+        expired_keys=sum(
             1 for k in self.keys.values() if k.status== KeyStatus.EXPIRED
         )
         revoked_keys=sum(
@@ -438,42 +469,42 @@ class APIKeyManager:
         )
 
         return {
-            "total_keys": total_keys,  # type: ignore[name-defined]
+            "total_keys": total_keys,
             "active_keys": active_keys,
-            "expiring_keys": expiring_keys,  # type: ignore[name-defined]
-            "expired_keys": expired_keys,  # type: ignore[name-defined]
+            "expiring_keys": expiring_keys,
+            "expired_keys": expired_keys,
             "revoked_keys": revoked_keys,
         }
 
 
 # Example usage
-if _name__== "__main__":  # type: ignore[name-defined]
+if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
 
-    config=KeyRotationConfig(  # type: ignore[call-arg]
-        _expiration_days=90,
-        _overlap_days=7,
-        _warning_days=14,
-        _auto_rotate=True,
+    config=KeyRotationConfig(
+        expiration_days=90,
+        overlap_days=7,
+        warning_days=14,
+        auto_rotate=True,
     )
 
     import tempfile
 
-    _manager=APIKeyManager(config, f"{tempfile.gettempdir()}/debvisor_keys")
+    manager=APIKeyManager(config, f"{tempfile.gettempdir()}/debvisor_keys")
 
     # Create key
-    api_key, key_obj=manager.create_key(  # type: ignore[name-defined]
-        _principal_id="admin@debvisor.local",
-        _description="Admin API key",
+    api_key, key_obj=manager.create_key(
+        principal_id="admin@debvisor.local",
+        description="Admin API key",
     )
     print(f"Created key: {api_key}")
     print(f"Key ID: {key_obj.key_id}")
     print(f"Expires: {key_obj.expires_at}")
 
     # Validate key
-    _validated=manager.validate_key(api_key)  # type: ignore[name-defined]
-    print(f"Validation: {validated.principal_id if validated else 'FAILED'}")  # type: ignore[name-defined]
+    validated=manager.validate_key(api_key)
+    print(f"Validation: {validated.principal_id if validated else 'FAILED'}")
 
     # Check stats
-    _stats=manager.get_key_stats()  # type: ignore[name-defined]
-    print(f"Stats: {stats}")  # type: ignore[name-defined]
+    stats=manager.get_key_stats()
+    print(f"Stats: {stats}")
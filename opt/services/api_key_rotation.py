@@ -125,7 +125,7 @@ from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Set
 
-_logger=logging.getLogger(__name__)
+logger=logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -174,7 +174,7 @@ class RotationPolicy:
     notify_on_rotation: bool=True
     notify_on_expiry_warning: bool=True
     notification_channels: List[str] = field(  # type: ignore[call-overload, misc]
-        _default_factory=lambda: ["email", "webhook"]
+        default_factory=lambda: ["email", "webhook"]
     )
 
 
@@ -224,8 +224,8 @@ class APIKey:
         """Get days until expiry."""
         if self.expires_at is None:
             return None
-        _delta=self.expires_at - datetime.now(timezone.utc)
-        return max(0, delta.days)  # type: ignore[name-defined]
+        delta=self.expires_at - datetime.now(timezone.utc)
+        return max(0, delta.days)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary (excluding sensitive data)."""
@@ -307,14 +307,14 @@ class APIKeyGenerator:
         """
         # Use cryptographically secure random
         alphabet=string.ascii_letters + string.digits
-        _key_body="".join(secrets.choice(alphabet) for _ in range(length))
+        key_body="".join(secrets.choice(alphabet) for _ in range(length))
 
-        key=f"{prefix}{key_body}"  # type: ignore[name-defined]
+        key=f"{prefix}{key_body}"
 
         if include_checksum:
         # Add 4-character checksum
-            _checksum=cls._calculate_checksum(key)[:4]
-            key=f"{key}_{checksum}"  # type: ignore[name-defined]
+            checksum=cls._calculate_checksum(key)[:4]
+            key=f"{key}_{checksum}"
 
         return key
 
@@ -333,9 +333,9 @@ class APIKeyGenerator:
         """
         # Use a static salt for deterministic hashing (required for O(1) lookup)
         # In production, this salt should be loaded from a secure environment variable
-        _salt=os.getenv("API_KEY_SALT", "debvisor_static_salt_v1").encode()
+        salt=os.getenv("API_KEY_SALT", "debvisor_static_salt_v1").encode()
         # 600,000 iterations recommended by OWASP for PBKDF2-HMAC-SHA256
-        return hashlib.pbkdf2_hmac("sha256", key.encode(), salt, 600000).hex()  # type: ignore[name-defined]
+        return hashlib.pbkdf2_hmac("sha256", key.encode(), salt, 600000).hex()
 
     @classmethod
     def _calculate_checksum(cls, data: str) -> str:
@@ -343,9 +343,9 @@ class APIKeyGenerator:
         # Use HMAC-SHA256 for checksum calculation
         # This avoids "weak cryptographic hash" warnings while providing integrity
         # Note: This is an integrity check, not a password hash.
-        _checksum_key=os.getenv("API_KEY_CHECKSUM_KEY", "debvisor_checksum_key").encode()
+        checksum_key=os.getenv("API_KEY_CHECKSUM_KEY", "debvisor_checksum_key").encode()
         return hmac.new(
-            checksum_key, data.encode(), hashlib.sha256  # type: ignore[name-defined]
+            checksum_key, data.encode(), hashlib.sha256
         ).hexdigest()
 
     @classmethod
@@ -362,21 +362,21 @@ class APIKeyGenerator:
         if not key.startswith(cls.KEY_PREFIX):
             return False
 
-        _parts=key.split("_")
-        if len(parts) < 2:  # type: ignore[name-defined]
+        parts=key.split("_")
+        if len(parts) < 2:
             return False
 
         # Check minimum length
-        body=parts[1] if len(parts) == 2 else "_".join(parts[1:-1])  # type: ignore[name-defined]
+        body=parts[1] if len(parts) == 2 else "_".join(parts[1:-1])
         if len(body) < 16:
             return False
 
         # Validate checksum if present
-        if len(parts) >= 3:  # type: ignore[name-defined]
-            checksum=parts[-1]  # type: ignore[name-defined]
-            _key_without_checksum="_".join(parts[:-1])  # type: ignore[name-defined]
-            _expected=cls._calculate_checksum(key_without_checksum)[:4]  # type: ignore[name-defined]
-            return checksum == expected  # type: ignore[name-defined]
+        if len(parts) >= 3:
+            checksum=parts[-1]
+            key_without_checksum="_".join(parts[:-1])
+            expected=cls._calculate_checksum(key_without_checksum)[:4]
+            return checksum == expected
 
         return True
 
@@ -408,7 +408,7 @@ class APIKeyRotationManager:
             default_policy: Default rotation policy
             vault_manager: Optional Vault integration
         """
-        self.default_policy=default_policy or RotationPolicy()  # type: ignore[call-arg]
+        self.default_policy=default_policy or RotationPolicy()
         self.vault_manager=vault_manager
 
         # Storage (in production, use database/Vault)
@@ -422,7 +422,7 @@ class APIKeyRotationManager:
         # Background task
         self._rotation_task: Optional[asyncio.Task[None]] = None
 
-        logger.info("API Key Rotation Manager initialized")  # type: ignore[name-defined]
+        logger.info("API Key Rotation Manager initialized")
 
     # =========================================================================
     # Key Management
@@ -452,41 +452,41 @@ class APIKeyRotationManager:
         import uuid
 
         # Generate key
-        _plaintext_key=APIKeyGenerator.generate()
-        _key_hash=APIKeyGenerator.hash_key(plaintext_key)  # type: ignore[name-defined]
-        _key_id=str(uuid.uuid4())[:8]
+        plaintext_key=APIKeyGenerator.generate()
+        key_hash=APIKeyGenerator.hash_key(plaintext_key)
+        key_id=str(uuid.uuid4())[:8]
 
         # Calculate expiry
         policy=policy or self.default_policy
         if expires_in_days is None:
             expires_in_days=policy.rotation_interval_days
 
-        _expires_at=datetime.now(timezone.utc) + timedelta(days=expires_in_days)
+        expires_at=datetime.now(timezone.utc) + timedelta(days=expires_in_days)
 
         # Create key object
-        _api_key=APIKey(  # type: ignore[call-arg]
-            _key_id=key_id,  # type: ignore[name-defined]
-            _key_hash=key_hash,  # type: ignore[name-defined]
-            _service_name=service_name,
-            _description=description,
-            _scopes=scopes or set(),
-            _expires_at=expires_at,  # type: ignore[name-defined]
+        api_key=APIKey(
+            key_id=key_id,
+            key_hash=key_hash,
+            service_name=service_name,
+            description=description,
+            scopes=scopes or set(),
+            expires_at=expires_at,
         )
 
         # Store
-        self._keys[key_id] = api_key  # type: ignore[name-defined]
-        self._policies[key_id] = policy  # type: ignore[name-defined]
+        self._keys[key_id] = api_key
+        self._policies[key_id] = policy
 
         # Store in Vault if available
         if self.vault_manager:
             try:
-                await self._store_in_vault(api_key, plaintext_key)  # type: ignore[name-defined]
+                await self._store_in_vault(api_key, plaintext_key)
             except Exception as e:
-                logger.error(f"Failed to store key in Vault: {e}")  # type: ignore[name-defined]
+                logger.error(f"Failed to store key in Vault: {e}")
 
-        logger.info(f"Created API key {key_id} for service {service_name}")  # type: ignore[name-defined]
+        logger.info(f"Created API key {key_id} for service {service_name}")
 
-        return plaintext_key, api_key  # type: ignore[name-defined]
+        return plaintext_key, api_key
 
     async def rotate_key(
         self,
@@ -507,69 +507,69 @@ class APIKeyRotationManager:
         """
         import uuid
 
-        _api_key=self._keys.get(key_id)
-        if not api_key:  # type: ignore[name-defined]
+        api_key=self._keys.get(key_id)
+        if not api_key:
             raise KeyError(f"API key {key_id} not found")
 
-        _policy=self._policies.get(key_id, self.default_policy)
+        policy=self._policies.get(key_id, self.default_policy)
 
         # Store old key for grace period
-        old_key_hash=api_key.key_hash  # type: ignore[name-defined]
+        old_key_hash=api_key.key_hash
 
         # Generate new key
-        _new_plaintext_key=APIKeyGenerator.generate()
-        _new_key_hash=APIKeyGenerator.hash_key(new_plaintext_key)  # type: ignore[name-defined]
+        new_plaintext_key=APIKeyGenerator.generate()
+        new_key_hash=APIKeyGenerator.hash_key(new_plaintext_key)
 
         # Update key object
-        api_key.previous_key_hash=old_key_hash  # type: ignore[name-defined]
-        api_key.key_hash=new_key_hash  # type: ignore[name-defined]
-        api_key.status=KeyStatus.ROTATING  # type: ignore[name-defined]
-        api_key.last_rotated_at=datetime.now(timezone.utc)  # type: ignore[name-defined]
-        api_key.rotation_count += 1  # type: ignore[name-defined]
+        api_key.previous_key_hash=old_key_hash
+        api_key.key_hash=new_key_hash
+        api_key.status=KeyStatus.ROTATING
+        api_key.last_rotated_at=datetime.now(timezone.utc)
+        api_key.rotation_count += 1
 
         # Set grace period
-        api_key.grace_period_ends_at=datetime.now(timezone.utc) + timedelta(  # type: ignore[call-arg, name-defined]
-            _hours=policy.grace_period_hours  # type: ignore[name-defined]
+        api_key.grace_period_ends_at=datetime.now(timezone.utc) + timedelta(
+            hours=policy.grace_period_hours
         )
 
         # Update expiry
-        api_key.expires_at=datetime.now(timezone.utc) + timedelta(  # type: ignore[call-arg, name-defined]
-            _days=policy.rotation_interval_days  # type: ignore[name-defined]
+        api_key.expires_at=datetime.now(timezone.utc) + timedelta(
+            days=policy.rotation_interval_days
         )
 
         # Record event
-        event=RotationEvent(  # type: ignore[call-arg]
-            _event_id=str(uuid.uuid4())[:8],
-            _key_id=key_id,
-            _service_name=api_key.service_name,  # type: ignore[name-defined]
-            _trigger=trigger,
-            _old_key_hash=old_key_hash[:8] + "...",    # Truncated for safety
-            _new_key_hash=new_key_hash[:8] + "...",  # type: ignore[name-defined]
-            _initiated_by=initiated_by,
+        event=RotationEvent(
+            event_id=str(uuid.uuid4())[:8],
+            key_id=key_id,
+            service_name=api_key.service_name,
+            trigger=trigger,
+            old_key_hash=old_key_hash[:8] + "...",    # Truncated for safety
+            new_key_hash=new_key_hash[:8] + "...",
+            initiated_by=initiated_by,
         )
         self._events.append(event)
 
         # Store in Vault if available
         if self.vault_manager:
             try:
-                await self._store_in_vault(api_key, new_plaintext_key)  # type: ignore[name-defined]
+                await self._store_in_vault(api_key, new_plaintext_key)
             except Exception as e:
-                logger.error(f"Failed to store rotated key in Vault: {e}")  # type: ignore[name-defined]
+                logger.error(f"Failed to store rotated key in Vault: {e}")
 
         # Send notifications
-        if policy.notify_on_rotation:  # type: ignore[name-defined]
+        if policy.notify_on_rotation:
             await self._send_notification(
                 "key_rotated",
-                api_key,  # type: ignore[name-defined]
+                api_key,
                 {"trigger": trigger.value, "initiated_by": initiated_by},
             )
 
-        logger.info(  # type: ignore[name-defined]
-            f"Rotated API key {key_id} for service {api_key.service_name} "  # type: ignore[name-defined]
+        logger.info(
+            f"Rotated API key {key_id} for service {api_key.service_name} "
             f"(trigger: {trigger.value})"
         )
 
-        return new_plaintext_key, api_key  # type: ignore[name-defined]
+        return new_plaintext_key, api_key
 
     async def revoke_key(
         self,
@@ -588,28 +588,33 @@ class APIKeyRotationManager:
         Returns:
             True if revoked
         """
-        _api_key=self._keys.get(key_id)
-        if not api_key:  # type: ignore[name-defined]
+        api_key=self._keys.get(key_id)
+        if not api_key:
             return False
 
-        api_key.status=KeyStatus.REVOKED  # type: ignore[name-defined]
-        api_key.previous_key_hash=None    # Invalidate grace period  # type: ignore[name-defined]
-        api_key.grace_period_ends_at=None  # type: ignore[name-defined]
+        api_key.status=KeyStatus.REVOKED
+        api_key.previous_key_hash=None    # Invalidate grace period
+        api_key.grace_period_ends_at=None
 
         # Record event
         import uuid
 
-        event=RotationEvent(  # type: ignore[call-arg]
-            _event_id=str(uuid.uuid4())[:8],
-            _key_id=key_id,
-            _service_name=api_key.service_name,  # type: ignore[name-defined]
-            _trigger=RotationTrigger.MANUAL,
-            _initiated_by=initiated_by,
+        event=RotationEvent(
+            event_id=str(uuid.uuid4())[:8],
+            key_id=key_id,
+            service_name=api_key.service_name,
+            trigger=RotationTrigger.MANUAL,
+            initiated_by=initiated_by,
         )
         self._events.append(event)
 
-        logger.warning(  # type: ignore[name-defined]
-            f"Revoked API key {key_id} for service {api_key.service_name}: {reason}"  # type: ignore[name-defined]
+        # Always notify: caches of verified keys must drop revoked ones
+        await self._send_notification(
+            "key_revoked", api_key, {"reason": reason, "initiated_by": initiated_by}
+        )
+
+        logger.warning(
+            f"Revoked API key {key_id} for service {api_key.service_name}: {reason}"
         )
 
         return True
@@ -618,7 +623,7 @@ class APIKeyRotationManager:
     # Key Validation
     # =========================================================================
 
-    def validate_key(self, plaintextkey: str) -> Optional[APIKey]:
+    def validate_key(self, plaintext_key: str) -> Optional[APIKey]:
         """
         Validate an API key.
 
@@ -631,10 +636,10 @@ class APIKeyRotationManager:
             APIKey if valid, None otherwise
         """
         # Validate format first
-        if not APIKeyGenerator.validate_format(plaintext_key):  # type: ignore[name-defined]
+        if not APIKeyGenerator.validate_format(plaintext_key):
             return None
 
-        _key_hash=APIKeyGenerator.hash_key(plaintext_key)  # type: ignore[name-defined]
+        key_hash=APIKeyGenerator.hash_key(plaintext_key)
 
         for api_key in self._keys.values():
         # Skip revoked/expired keys
@@ -645,12 +650,12 @@ class APIKeyRotationManager:
                 continue
 
             # Check current key
-            if api_key.key_hash == key_hash:  # type: ignore[name-defined]
+            if api_key.key_hash == key_hash:
                 api_key.last_used_at=datetime.now(timezone.utc)
                 return api_key
 
             # Check grace period key
-            if api_key.previous_key_hash == key_hash:  # type: ignore[name-defined]
+            if api_key.previous_key_hash == key_hash:
                 if api_key.is_in_grace_period:
                     api_key.last_used_at=datetime.now(timezone.utc)
                     return api_key
@@ -667,7 +672,7 @@ class APIKeyRotationManager:
             return
 
         self._rotation_task=asyncio.create_task(self._rotation_loop())
-        logger.info("API key rotation scheduler started")  # type: ignore[name-defined]
+        logger.info("API key rotation scheduler started")
 
     async def stop_rotation_scheduler(self) -> None:
         """Stop the background rotation scheduler."""
@@ -678,7 +683,7 @@ class APIKeyRotationManager:
             except asyncio.CancelledError:
                 pass
             self._rotation_task=None
-        logger.info("API key rotation scheduler stopped")  # type: ignore[name-defined]
+        logger.info("API key rotation scheduler stopped")
 
     async def _rotation_loop(self) -> None:
         """Background rotation check loop."""
@@ -691,7 +696,7 @@ class APIKeyRotationManager:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Rotation scheduler error: {e}")  # type: ignore[name-defined]
+                logger.error(f"Rotation scheduler error: {e}")
 
     async def _check_scheduled_rotations(self) -> None:
         """Check for keys needing rotation."""
@@ -699,7 +704,7 @@ class APIKeyRotationManager:
             if api_key.status not in (KeyStatus.ACTIVE, KeyStatus.GRACE_PERIOD):
                 continue
 
-            _policy=self._policies.get(key_id, self.default_policy)
+            policy=self._policies.get(key_id, self.default_policy)
 
             # Check if rotation is due
             if api_key.last_rotated_at:
@@ -711,11 +716,11 @@ class APIKeyRotationManager:
                     datetime.now(timezone.utc) - api_key.created_at
                 ).days
 
-            if days_since_rotation >= policy.rotation_interval_days:  # type: ignore[name-defined]
+            if days_since_rotation >= policy.rotation_interval_days:
                 try:
                     await self.rotate_key(key_id, trigger=RotationTrigger.SCHEDULED)
                 except Exception as e:
-                    logger.error(f"Scheduled rotation failed for {key_id}: {e}")  # type: ignore[name-defined]
+                    logger.error(f"Scheduled rotation failed for {key_id}: {e}")
 
     async def _cleanup_grace_periods(self) -> None:
         """Clean up expired grace periods."""
@@ -725,7 +730,8 @@ class APIKeyRotationManager:
                     api_key.previous_key_hash=None
                     api_key.grace_period_ends_at=None
                     api_key.status=KeyStatus.ACTIVE
-                    logger.debug(f"Grace period ended for key {api_key.key_id}")  # type: ignore[name-defined]
+                    await self._send_notification("grace_period_ended", api_key, {})
+                    logger.debug(f"Grace period ended for key {api_key.key_id}")
 
     async def _send_expiry_warnings(self) -> None:
         """Send warnings for keys expiring soon."""
@@ -733,11 +739,11 @@ class APIKeyRotationManager:
             if api_key.status != KeyStatus.ACTIVE:
                 continue
 
-            _policy=self._policies.get(key_id, self.default_policy)
+            policy=self._policies.get(key_id, self.default_policy)
 
             if api_key.days_until_expiry is not None:
-                if api_key.days_until_expiry <= policy.warning_days_before:  # type: ignore[name-defined]
-                    if policy.notify_on_expiry_warning:  # type: ignore[name-defined]
+                if api_key.days_until_expiry <= policy.warning_days_before:
+                    if policy.notify_on_expiry_warning:
                         await self._send_notification(
                             "key_expiry_warning",
                             api_key,
@@ -765,29 +771,29 @@ class APIKeyRotationManager:
                 else:
                     callback(event_type, api_key, details)
             except Exception as e:
-                logger.error(f"Notification callback error: {e}")  # type: ignore[name-defined]
+                logger.error(f"Notification callback error: {e}")
 
     # =========================================================================
     # Vault Integration
     # =========================================================================
 
-    async def _store_in_vault(self, apikey: APIKey, plaintextkey: str) -> None:
+    async def _store_in_vault(self, api_key: APIKey, plaintext_key: str) -> None:
         """Store key in Vault."""
         if not self.vault_manager:
             return
 
-        _secret_path=f"api-keys/{api_key.service_name}/{api_key.key_id}"  # type: ignore[name-defined]
-        _secret_data={
-            "key": plaintext_key,  # type: ignore[name-defined]
-            "key_id": api_key.key_id,  # type: ignore[name-defined]
-            "service_name": api_key.service_name,  # type: ignore[name-defined]
-            "created_at": api_key.created_at.isoformat(),  # type: ignore[name-defined]
+        secret_path=f"api-keys/{api_key.service_name}/{api_key.key_id}"
+        secret_data={
+            "key": plaintext_key,
+            "key_id": api_key.key_id,
+            "service_name": api_key.service_name,
+            "created_at": api_key.created_at.isoformat(),
             "expires_at": (
-                api_key.expires_at.isoformat() if api_key.expires_at else None  # type: ignore[name-defined]
+                api_key.expires_at.isoformat() if api_key.expires_at else None
             ),
         }
 
-        self.vault_manager.store_secret(secret_path, secret_data, overwrite=True)  # type: ignore[name-defined]
+        self.vault_manager.store_secret(secret_path, secret_data, overwrite=True)
 
     # =========================================================================
     # Reporting
@@ -797,10 +803,10 @@ class APIKeyRotationManager:
         """Get all keys (without sensitive data)."""
         return [key.to_dict() for key in self._keys.values()]
 
-    def get_key(self, keyid: str) -> Optional[Dict[str, Any]]:
+    def get_key(self, key_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific key."""
-        _api_key=self._keys.get(key_id)  # type: ignore[name-defined]
-        return api_key.to_dict() if api_key else None  # type: ignore[name-defined]
+        api_key=self._keys.get(key_id)
+        return api_key.to_dict() if api_key else None
 
     def get_rotation_history(
         self, key_id: Optional[str] = None, limit: int=100
@@ -844,40 +850,40 @@ def get_rotation_manager() -> APIKeyRotationManager:
 # Main
 # =============================================================================
 
-if _name__== "__main__":  # type: ignore[name-defined]
+if __name__ == "__main__":
 
     logging.basicConfig(level=logging.DEBUG)
 
     async def main() -> None:
-        _manager=get_rotation_manager()
+        manager=get_rotation_manager()
 
         # Create a key
-        key, api_key=await manager.create_key(  # type: ignore[name-defined]
-            _service_name="test-service",
-            _description="Test API key",
-            _scopes={"read", "write"},
+        key, api_key=await manager.create_key(
+            service_name="test-service",
+            description="Test API key",
+            scopes={"read", "write"},
         )
 
         print("Created key: <REDACTED>")
         print(f"Key details: {api_key.to_dict()}")
 
         # Validate key
-        _validated=manager.validate_key(key)  # type: ignore[name-defined]
-        print(f"Validated: {validated is not None}")  # type: ignore[name-defined]
+        validated=manager.validate_key(key)
+        print(f"Validated: {validated is not None}")
 
         # Rotate key
-        new_key, updated=await manager.rotate_key(  # type: ignore[name-defined]
+        new_key, updated=await manager.rotate_key(
             api_key.key_id, trigger=RotationTrigger.MANUAL
         )
 
         print("New key: <REDACTED>")
         print(
-            f"Old key still valid (grace period): {manager.validate_key(key) is not None}"  # type: ignore[name-defined]
+            f"Old key still valid (grace period): {manager.validate_key(key) is not None}"
         )
-        print(f"New key valid: {manager.validate_key(new_key) is not None}")  # type: ignore[name-defined]
+        print(f"New key valid: {manager.validate_key(new_key) is not None}")
 
         # Get history
-        _history=manager.get_rotation_history()  # type: ignore[name-defined]
-        print(f"Rotation history: {history}")  # type: ignore[name-defined]
+        history=manager.get_rotation_history()
+        print(f"Rotation history: {history}")
 
     asyncio.run(main())
@@ -111,8 +111,8 @@ class ChangeRateMetrics:
     samples: List[float] = field(default_factory=list)    # MB changed per interval
     sample_times: List[datetime] = field(default_factory=list)
     daily_pattern: Dict[int, float] = field(default_factory=dict)    # hour -> avg rate
-    weekly_pattern: Dict[int, float] = field(  # type: ignore[call-overload, misc]
-        _default_factory=dict
+    weekly_pattern: Dict[int, float] = field(
+        default_factory=dict
     )    # weekday -> avg rate
     predicted_rate: float = 0.0
     confidence: float = 0.0
@@ -162,6 +162,9 @@ class RestoreTest:
     boot_time_seconds: Optional[float] = None
     data_integrity_percent: Optional[float] = None
     error_message: Optional[str] = None
+    restore_duration_seconds: Optional[float] = None
+    restore_bytes: Optional[int] = None
+    restore_throughput_mbps: Optional[float] = None
     created_at: datetime=field(default_factory=lambda: datetime.now(timezone.utc))
 
 
@@ -515,8 +518,8 @@ class RestoreTestManager:
         """Schedule a restore test."""
         test_id = f"rt-{uuid4().hex[:12]}"
 
-        test = RestoreTest(  # type: ignore[call-arg]
-            _id=test_id,  # type: ignore[name-defined]
+        test = RestoreTest(
+            id=test_id,
             backup_id = backup_id,
             vm_id = vm_id,
             policy_id = policy_id,
@@ -694,6 +697,59 @@ class RestoreTestManager:
         """Register a custom validation function for a VM."""
         self.custom_validators[vm_id] = validator
 
+    def record_restore_result(self, test_id: str, result: Any) -> RestoreTest:
+        """Attach measured restore timing (a ``RestoreResult``) to a test."""
+        test = self.tests.get(test_id)
+        if not test:
+            raise ValueError(f"Unknown test: {test_id}")
+
+        test.restore_duration_seconds = result.duration_seconds
+        test.restore_bytes = result.bytes_written
+        test.restore_throughput_mbps = result.throughput_mbps
+        return test
+
+    def get_rto_trend(
+        self, vm_id: Optional[str] = None, limit: int = 30
+    ) -> Dict[str, Any]:
+        """Measured restore durations and throughput, oldest first."""
+        tests = [
+            t
+            for t in self.get_test_history(vm_id, limit=len(self.tests))
+            if t.restore_duration_seconds is not None
+        ][:limit]
+        tests.reverse()
+
+        durations = [t.restore_duration_seconds for t in tests]
+        throughputs = [t.restore_throughput_mbps or 0.0 for t in tests]
+        trend = "insufficient_data"
+        if len(durations) >= 4:
+            half = len(durations) // 2
+            older = statistics.mean(durations[:half])
+            recent = statistics.mean(durations[half:])
+            if recent > older * 1.1:
+                trend = "degrading"
+            elif recent < older * 0.9:
+                trend = "improving"
+            else:
+                trend = "stable"
+
+        return {
+            "vm_id": vm_id,
+            "samples": [
+                {
+                    "test_id": t.id,
+                    "created_at": t.created_at.isoformat(),
+                    "duration_seconds": t.restore_duration_seconds,
+                    "throughput_mbps": t.restore_throughput_mbps,
+                }
+                for t in tests
+            ],
+            "avg_duration_seconds": statistics.mean(durations) if durations else None,
+            "max_duration_seconds": max(durations) if durations else None,
+            "avg_throughput_mbps": statistics.mean(throughputs) if throughputs else None,
+            "trend": trend,
+        }
+
     def get_test_history(
         self, vm_id: Optional[str] = None, limit: int = 100
     ) -> List[RestoreTest]:
@@ -1163,7 +1219,7 @@ class BackupIntelligence:
 # CLI / Demo
 # =============================================================================
 
-if _name__== "__main__":  # type: ignore[name-defined]
+if __name__ == "__main__":
     logging.basicConfig(  # type: ignore[call-arg]
         level = logging.INFO, format = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
     )
@@ -0,0 +1,712 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Pluggable block index backends for the deduplicating block store.
+
+Backends:
+- ``json``: legacy single ``block_index.json`` file, rewritten on flush
+- ``log``: append-only JSON-lines log plus periodic compacted snapshots,
+  loaded lazily on first access
+- ``sqlite``: on-disk SQLite index (WAL), nothing loaded at startup
+
+All backends support ``batch()``: mutations inside the block are buffered
+(ref-count deltas are coalesced per digest) and persisted once when the
+outermost batch exits, so ingesting N chunks costs O(N) index I/O.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LEGACY_INDEX_FILE = "block_index.json"
+
+
+# =============================================================================
+# Data Models
+# =============================================================================
+@dataclass
+class BlockRecord:
+    """Metadata for a stored block."""
+
+    digest: str
+    size: int
+    compressed_size: int
+    stored_at: datetime
+    ref_count: int = 0
+    compression: str = "none"
+    encrypted: bool = False
+    verified_at: Optional[datetime] = None
+
+
+def record_to_dict(rec: BlockRecord) -> Dict[str, Any]:
+    """Serialize a block record to plain JSON types."""
+    return {
+        "digest": rec.digest,
+        "size": rec.size,
+        "compressed_size": rec.compressed_size,
+        "stored_at": rec.stored_at.isoformat(),
+        "ref_count": rec.ref_count,
+        "compression": rec.compression,
+        "encrypted": rec.encrypted,
+        "verified_at": rec.verified_at.isoformat() if rec.verified_at else None,
+    }
+
+
+def record_from_dict(rec: Dict[str, Any]) -> BlockRecord:
+    """Deserialize a block record produced by ``record_to_dict``."""
+    return BlockRecord(
+        digest=rec["digest"],
+        size=rec["size"],
+        compressed_size=rec["compressed_size"],
+        stored_at=datetime.fromisoformat(rec["stored_at"]),
+        ref_count=rec["ref_count"],
+        compression=rec.get("compression", "none"),
+        encrypted=rec.get("encrypted", False),
+        verified_at=(
+            datetime.fromisoformat(rec["verified_at"]) if rec.get("verified_at") else None
+        ),
+    )
+
+
+# =============================================================================
+# Backend Interface
+# =============================================================================
+class BlockIndex(ABC):
+    """Digest -> BlockRecord index.
+
+    Records returned by ``get``/``__getitem__`` are snapshots; mutate the
+    index through ``add``/``adjust_ref``/``set_verified``/``remove``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+
+    # -- read API -------------------------------------------------------------
+    @abstractmethod
+    def get(self, digest: str) -> Optional[BlockRecord]:
+        """Return the record for ``digest`` or None."""
+
+    @abstractmethod
+    def keys(self) -> List[str]:
+        """Return all digests."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of indexed blocks."""
+
+    def values(self) -> Iterator[BlockRecord]:
+        for digest in self.keys():
+            rec = self.get(digest)
+            if rec is not None:
+                yield rec
+
+    def items(self) -> Iterator[Tuple[str, BlockRecord]]:
+        for rec in self.values():
+            yield rec.digest, rec
+
+    def totals(self) -> Tuple[int, int, int]:
+        """Return (block count, logical bytes, physical bytes)."""
+        count = logical = physical = 0
+        for rec in self.values():
+            count += 1
+            logical += rec.size
+            physical += rec.compressed_size
+        return count, logical, physical
+
+    def __contains__(self, digest: object) -> bool:
+        return isinstance(digest, str) and self.get(digest) is not None
+
+    def __getitem__(self, digest: str) -> BlockRecord:
+        rec = self.get(digest)
+        if rec is None:
+            raise KeyError(digest)
+        return rec
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def scan(self, after: str = "", limit: int = 1000) -> List[BlockRecord]:
+        """Return up to ``limit`` records with digest > ``after``, in digest order."""
+        keys = sorted(self.keys())
+        start = bisect.bisect_right(keys, after)
+        records = (self.get(digest) for digest in keys[start:start + limit])
+        return [rec for rec in records if rec is not None]
+
+    # -- write API ------------------------------------------------------------
+    @abstractmethod
+    def add(self, record: BlockRecord) -> None:
+        """Insert a new record (replaces an existing one)."""
+
+    @abstractmethod
+    def adjust_ref(self, digest: str, delta: int) -> Optional[int]:
+        """Add ``delta`` to the ref count; return the new count or None."""
+
+    @abstractmethod
+    def set_verified(self, digest: str, when: datetime) -> None:
+        """Record a successful integrity check."""
+
+    @abstractmethod
+    def remove(self, digest: str) -> None:
+        """Drop a record."""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Persist buffered mutations."""
+
+    def close(self) -> None:
+        self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["BlockIndex"]:
+        """Defer persistence until the outermost batch exits."""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    @property
+    def in_batch(self) -> bool:
+        return self._batch_depth > 0
+
+    def _maybe_flush(self) -> None:
+        if not self.in_batch:
+            self.flush()
+
+
+# =============================================================================
+# In-Memory Backends
+# =============================================================================
+class _MemoryBlockIndex(BlockIndex):
+    """Shared base for backends that keep the index in a dict."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._records: Optional[Dict[str, BlockRecord]] = None
+        # Digests in order for scan(); built on first scan, then kept sorted
+        self._sorted_keys: Optional[List[str]] = None
+
+    @abstractmethod
+    def _load(self) -> Dict[str, BlockRecord]:
+        """Read the persisted index."""
+
+    @property
+    def records(self) -> Dict[str, BlockRecord]:
+        if self._records is None:
+            with self._lock:
+                if self._records is None:
+                    self._records = self._load()
+        return self._records
+
+    def get(self, digest: str) -> Optional[BlockRecord]:
+        rec = self.records.get(digest)
+        return replace(rec) if rec is not None else None
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self.records.keys())
+
+    def values(self) -> Iterator[BlockRecord]:
+        with self._lock:
+            snapshot = list(self.records.values())
+        for rec in snapshot:
+            yield replace(rec)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def scan(self, after: str = "", limit: int = 1000) -> List[BlockRecord]:
+        with self._lock:
+            if self._sorted_keys is None:
+                self._sorted_keys = sorted(self.records)
+            start = bisect.bisect_right(self._sorted_keys, after)
+            digests = self._sorted_keys[start:start + limit]
+            return [replace(self.records[digest]) for digest in digests]
+
+    def _put(self, record: BlockRecord) -> None:
+        """Store a copy of ``record``; caller holds the lock."""
+        if self._sorted_keys is not None and record.digest not in self.records:
+            bisect.insort(self._sorted_keys, record.digest)
+        self.records[record.digest] = replace(record)
+
+    def _pop(self, digest: str) -> bool:
+        """Drop ``digest``; caller holds the lock. Returns False if absent."""
+        if self.records.pop(digest, None) is None:
+            return False
+        if self._sorted_keys is not None:
+            del self._sorted_keys[bisect.bisect_left(self._sorted_keys, digest)]
+        return True
+
+
+class JsonBlockIndex(_MemoryBlockIndex):
+    """Legacy backend: whole index rewritten as one JSON document."""
+
+    def __init__(self, root: Path) -> None:
+        super().__init__()
+        self.path = Path(root) / LEGACY_INDEX_FILE
+        self._dirty = False
+
+    def _load(self) -> Dict[str, BlockRecord]:
+        records: Dict[str, BlockRecord] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                for digest, rec in data.items():
+                    records[digest] = record_from_dict(rec)
+                logger.info(f"Loaded {len(records)} blocks from index")
+            except Exception as e:
+                logger.warning(f"Failed to load block index: {e}")
+        return records
+
+    def add(self, record: BlockRecord) -> None:
+        with self._lock:
+            self._put(record)
+            self._dirty = True
+            self._maybe_flush()
+
+    def adjust_ref(self, digest: str, delta: int) -> Optional[int]:
+        with self._lock:
+            rec = self.records.get(digest)
+            if rec is None:
+                return None
+            rec.ref_count += delta
+            self._dirty = True
+            self._maybe_flush()
+            return rec.ref_count
+
+    def set_verified(self, digest: str, when: datetime) -> None:
+        with self._lock:
+            rec = self.records.get(digest)
+            if rec is not None:
+                rec.verified_at = when
+                self._dirty = True
+                self._maybe_flush()
+
+    def remove(self, digest: str) -> None:
+        with self._lock:
+            if self._pop(digest):
+                self._dirty = True
+                self._maybe_flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {d: record_to_dict(r) for d, r in self.records.items()}
+            tmp = self.path.with_suffix(".json.tmp")
+            with open(tmp, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+
+class LogBlockIndex(_MemoryBlockIndex):
+    """Append-only operation log with periodic compacted snapshots.
+
+    Every mutation appends one JSON line to ``block_index.<gen>.log``. When
+    the log grows past the live record count (and ``compact_min_ops``), a
+    new snapshot is written atomically for generation ``gen + 1`` and the
+    old log is dropped. Loading replays only the log matching the snapshot
+    generation; a torn final line from a crash is ignored.
+    """
+
+    SNAPSHOT_FILE = "block_index.snap"
+
+    def __init__(
+        self, root: Path, compact_min_ops: int = 100_000, fsync: bool = True
+    ) -> None:
+        super().__init__()
+        self.root = Path(root)
+        self.snapshot_path = self.root / self.SNAPSHOT_FILE
+        self.compact_min_ops = compact_min_ops
+        self.fsync = fsync
+        self.generation = 0
+        self._log_ops = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_refs: Dict[str, int] = {}
+        self._log_file: Optional[Any] = None
+
+    def _log_path(self, generation: int) -> Path:
+        return self.root / f"block_index.{generation}.log"
+
+    def _load(self) -> Dict[str, BlockRecord]:
+        records: Dict[str, BlockRecord] = {}
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, "r") as f:
+                header = json.loads(f.readline())
+                self.generation = header["gen"]
+                for line in f:
+                    rec = record_from_dict(json.loads(line))
+                    records[rec.digest] = rec
+
+        log_path = self._log_path(self.generation)
+        if log_path.exists():
+            good_bytes = 0
+            with open(log_path, "rb") as f:
+                for line in f:
+                    try:
+                        op = json.loads(line)
+                    except json.JSONDecodeError:
+                        op = None
+                    if op is None or not line.endswith(b"\n"):
+                        logger.warning(f"Truncating torn record at end of {log_path.name}")
+                        break
+                    self._apply(records, op)
+                    self._log_ops += 1
+                    good_bytes += len(line)
+            if good_bytes != log_path.stat().st_size:
+                os.truncate(log_path, good_bytes)
+
+        for stale in self.root.glob("block_index.*.log"):
+            if stale != log_path:
+                stale.unlink()
+        logger.info(
+            f"Loaded {len(records)} blocks (generation {self.generation}, "
+            f"{self._log_ops} log ops)"
+        )
+        return records
+
+    @staticmethod
+    def _apply(records: Dict[str, BlockRecord], op: Dict[str, Any]) -> None:
+        kind = op["op"]
+        if kind == "put":
+            rec = record_from_dict(op["r"])
+            records[rec.digest] = rec
+        elif kind == "ref":
+            if op["d"] in records:
+                records[op["d"]].ref_count += op["n"]
+        elif kind == "ver":
+            if op["d"] in records:
+                records[op["d"]].verified_at = datetime.fromisoformat(op["t"])
+        elif kind == "del":
+            records.pop(op["d"], None)
+
+    def add(self, record: BlockRecord) -> None:
+        with self._lock:
+            self._put(record)
+            self._pending_refs.pop(record.digest, None)
+            self._pending.append({"op": "put", "r": record_to_dict(record)})
+            self._maybe_flush()
+
+    def adjust_ref(self, digest: str, delta: int) -> Optional[int]:
+        with self._lock:
+            rec = self.records.get(digest)
+            if rec is None:
+                return None
+            rec.ref_count += delta
+            self._pending_refs[digest] = self._pending_refs.get(digest, 0) + delta
+            self._maybe_flush()
+            return rec.ref_count
+
+    def set_verified(self, digest: str, when: datetime) -> None:
+        with self._lock:
+            rec = self.records.get(digest)
+            if rec is not None:
+                rec.verified_at = when
+                self._pending.append({"op": "ver", "d": digest, "t": when.isoformat()})
+                self._maybe_flush()
+
+    def remove(self, digest: str) -> None:
+        with self._lock:
+            if self._pop(digest):
+                self._pending_refs.pop(digest, None)
+                self._pending.append({"op": "del", "d": digest})
+                self._maybe_flush()
+
+    def _flush_refs(self) -> None:
+        for digest, delta in self._pending_refs.items():
+            if delta:
+                self._pending.append({"op": "ref", "d": digest, "n": delta})
+        self._pending_refs.clear()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._records is None:
+                return
+            self._flush_refs()
+            if not self._pending:
+                return
+            if self._log_file is None:
+                self._log_file = open(self._log_path(self.generation), "a")
+            self._log_file.write(
+                "".join(json.dumps(op, separators=(",", ":")) + "\n" for op in self._pending)
+            )
+            self._log_file.flush()
+            if self.fsync:
+                os.fsync(self._log_file.fileno())
+            self._log_ops += len(self._pending)
+            self._pending.clear()
+            if self._log_ops > max(self.compact_min_ops, len(self._records)):
+                self.compact()
+
+    def compact(self) -> None:
+        """Write a snapshot for the next generation and drop the old log."""
+        with self._lock:
+            records = self.records
+            self._flush_refs()
+            if self._pending:
+                # Pending ops are folded into the snapshot
+                self._pending.clear()
+            new_gen = self.generation + 1
+            tmp = self.snapshot_path.with_suffix(".snap.tmp")
+            with open(tmp, "w") as f:
+                f.write(json.dumps({"gen": new_gen, "count": len(records)}) + "\n")
+                for rec in records.values():
+                    f.write(json.dumps(record_to_dict(rec), separators=(",", ":")) + "\n")
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            os.replace(tmp, self.snapshot_path)
+
+            old_log = self._log_path(self.generation)
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+            self.generation = new_gen
+            self._log_ops = 0
+            if old_log.exists():
+                old_log.unlink()
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+
+
+# =============================================================================
+# SQLite Backend
+# =============================================================================
+class SqliteBlockIndex(BlockIndex):
+    """On-disk index in SQLite (WAL mode); opening it does not read records.
+
+    Outside a batch every mutation commits. Inside a batch mutations share
+    one transaction and ref-count deltas are coalesced in memory, then
+    applied with a single ``executemany`` at commit.
+    """
+
+    DB_FILE = "block_index.db"
+    _COLUMNS = (
+        "digest, size, compressed_size, stored_at, ref_count, "
+        "compression, encrypted, verified_at"
+    )
+
+    def __init__(self, root: Path, synchronous: str = "NORMAL") -> None:
+        super().__init__()
+        self.path = Path(root) / self.DB_FILE
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blocks ("
+            "digest TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+            "compressed_size INTEGER NOT NULL, stored_at TEXT NOT NULL, "
+            "ref_count INTEGER NOT NULL, compression TEXT NOT NULL, "
+            "encrypted INTEGER NOT NULL, verified_at TEXT"
+            ") WITHOUT ROWID"
+        )
+        self._pending_refs: Dict[str, int] = {}
+        self._in_txn = False
+
+    @staticmethod
+    def _row_to_record(row: Tuple[Any, ...]) -> BlockRecord:
+        return BlockRecord(
+            digest=row[0],
+            size=row[1],
+            compressed_size=row[2],
+            stored_at=datetime.fromisoformat(row[3]),
+            ref_count=row[4],
+            compression=row[5],
+            encrypted=bool(row[6]),
+            verified_at=datetime.fromisoformat(row[7]) if row[7] else None,
+        )
+
+    def _begin(self) -> None:
+        if not self._in_txn:
+            self._conn.execute("BEGIN")
+            self._in_txn = True
+
+    def get(self, digest: str) -> Optional[BlockRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM blocks WHERE digest = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                return None
+            rec = self._row_to_record(row)
+            rec.ref_count += self._pending_refs.get(digest, 0)
+            return rec
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._conn.execute("SELECT digest FROM blocks ORDER BY digest")]
+
+    def values(self) -> Iterator[BlockRecord]:
+        # Keyset pagination so writers are never blocked by a long scan
+        after = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {self._COLUMNS} FROM blocks WHERE digest > ? "
+                    "ORDER BY digest LIMIT 10000",
+                    (after,),
+                ).fetchall()
+                pending = dict(self._pending_refs)
+            if not rows:
+                return
+            for row in rows:
+                rec = self._row_to_record(row)
+                rec.ref_count += pending.get(rec.digest, 0)
+                yield rec
+            after = rows[-1][0]
+
+    def totals(self) -> Tuple[int, int, int]:
+        with self._lock:
+            count, logical, physical = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), "
+                "COALESCE(SUM(compressed_size), 0) FROM blocks"
+            ).fetchone()
+        return count, logical, physical
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM blocks").fetchone()[0]
+
+    def scan(self, after: str = "", limit: int = 1000) -> List[BlockRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM blocks WHERE digest > ? ORDER BY digest LIMIT ?",
+                (after, limit),
+            ).fetchall()
+            pending = dict(self._pending_refs)
+        records = [self._row_to_record(row) for row in rows]
+        for rec in records:
+            rec.ref_count += pending.get(rec.digest, 0)
+        return records
+
+    def add(self, record: BlockRecord) -> None:
+        with self._lock:
+            self._begin()
+            self._pending_refs.pop(record.digest, None)
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO blocks ({self._COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.digest,
+                    record.size,
+                    record.compressed_size,
+                    record.stored_at.isoformat(),
+                    record.ref_count,
+                    record.compression,
+                    int(record.encrypted),
+                    record.verified_at.isoformat() if record.verified_at else None,
+                ),
+            )
+            self._maybe_flush()
+
+    def adjust_ref(self, digest: str, delta: int) -> Optional[int]:
+        with self._lock:
+            rec = self.get(digest)
+            if rec is None:
+                return None
+            self._begin()
+            self._pending_refs[digest] = self._pending_refs.get(digest, 0) + delta
+            self._maybe_flush()
+            return rec.ref_count + delta
+
+    def set_verified(self, digest: str, when: datetime) -> None:
+        with self._lock:
+            self._begin()
+            self._conn.execute(
+                "UPDATE blocks SET verified_at = ? WHERE digest = ?",
+                (when.isoformat(), digest),
+            )
+            self._maybe_flush()
+
+    def remove(self, digest: str) -> None:
+        with self._lock:
+            self._begin()
+            self._pending_refs.pop(digest, None)
+            self._conn.execute("DELETE FROM blocks WHERE digest = ?", (digest,))
+            self._maybe_flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending_refs:
+                self._begin()
+                self._conn.executemany(
+                    "UPDATE blocks SET ref_count = ref_count + ? WHERE digest = ?",
+                    [(delta, d) for d, delta in self._pending_refs.items() if delta],
+                )
+                self._pending_refs.clear()
+            if self._in_txn:
+                self._conn.execute("COMMIT")
+                self._in_txn = False
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+
+# =============================================================================
+# Factory
+# =============================================================================
+def open_block_index(root: Path, backend: str = "sqlite") -> BlockIndex:
+    """Open the index backend for ``root``, migrating a legacy JSON index.
+
+    A pre-existing ``block_index.json`` is imported once into an empty
+    ``log``/``sqlite`` index and renamed to ``block_index.json.migrated``.
+    """
+    root = Path(root)
+    index: BlockIndex
+    if backend == "json":
+        return JsonBlockIndex(root)
+    if backend == "log":
+        index = LogBlockIndex(root)
+    elif backend == "sqlite":
+        index = SqliteBlockIndex(root)
+    else:
+        raise ValueError(f"Unknown block index backend: {backend}")
+
+    legacy = root / LEGACY_INDEX_FILE
+    if legacy.exists() and len(index) == 0:
+        records = JsonBlockIndex(root).records
+        with index.batch():
+            for rec in records.values():
+                index.add(rec)
+        legacy.rename(legacy.with_name(LEGACY_INDEX_FILE + ".migrated"))
+        logger.info(f"Migrated {len(records)} blocks from {LEGACY_INDEX_FILE} to {backend}")
+    return index
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Buffer-based content-defined chunking engine.
+
+Gear/FastCDC-style chunker used by the deduplicating backup service:
+- Reads large buffers (default 8 MiB) instead of one byte per call
+- Memory-maps regular files so disk images are never copied twice
+- Gear rolling hash (32-byte window) evaluated over whole buffers with
+  NumPy when available, pure-Python fallback otherwise
+- Same min/avg/max semantics as ``ChunkingConfig``: a boundary is cut once
+  a chunk is at least ``min_size`` and the hash matches ``mask_bits`` bits,
+  or unconditionally at ``max_size``
+
+Boundaries only depend on chunk content, never on how the input was split
+into reads, so the same image always produces the same chunks.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import mmap
+import os
+import stat
+from typing import Any, BinaryIO, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+GEAR_WINDOW = 32    # Bytes influencing a 32-bit gear hash
+DEFAULT_BUFFER_SIZE = 8 * 1024 * 1024    # 8 MiB read buffer
+_HASH_MASK = 0xFFFFFFFF
+
+
+def _build_gear_table() -> List[int]:
+    """Deterministic 256-entry gear table (stable across releases and hosts)."""
+    return [
+        int.from_bytes(
+            hashlib.sha256(b"debvisor-gear:" + bytes([i])).digest()[:4], "little"
+        )
+        for i in range(256)
+    ]
+
+
+GEAR_TABLE: List[int] = _build_gear_table()
+_GEAR_NP: Any = np.array(GEAR_TABLE, dtype=np.uint32) if HAS_NUMPY else None
+
+
+# =============================================================================
+# Gear Chunker
+# =============================================================================
+class GearChunker:
+    """Content-defined chunker over large buffers using a gear rolling hash.
+
+    ``config`` is any object exposing ``min_size``, ``max_size`` and
+    ``mask_bits`` (normally a ``ChunkingConfig``).
+    """
+
+    def __init__(
+        self,
+        config: Any,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        use_numpy: Optional[bool] = None,
+        use_mmap: bool = True,
+    ) -> None:
+        if config.min_size < GEAR_WINDOW:
+            raise ValueError(f"min_size must be >= {GEAR_WINDOW} bytes")
+        if config.max_size < config.min_size:
+            raise ValueError("max_size must be >= min_size")
+        if not 1 <= config.mask_bits <= 32:
+            raise ValueError("mask_bits must be between 1 and 32")
+
+        self.config = config
+        self.min_size = config.min_size
+        self.max_size = config.max_size
+        # Use the high bits: they depend on the full 32-byte window
+        self.mask = ((1 << config.mask_bits) - 1) << (32 - config.mask_bits)
+        # A buffer must always be able to hold at least one max-size chunk
+        self.buffer_size = max(buffer_size, 2 * config.max_size)
+        self.use_numpy = HAS_NUMPY if use_numpy is None else (use_numpy and HAS_NUMPY)
+        self.use_mmap = use_mmap
+
+    # -------------------------------------------------------------------------
+    # Boundary detection
+    # -------------------------------------------------------------------------
+    def _cut_points_numpy(self, view: Any, final: bool) -> Tuple[List[int], int]:
+        """Find chunk end offsets in ``view`` using vectorized gear hashing."""
+        n = len(view)
+        if n == 0:
+            return [], 0
+
+        data = np.frombuffer(view, dtype=np.uint8, count=n)
+        h = _GEAR_NP[data]
+        del data
+        # Doubling: H_2w[i] = H_w[i] + (H_w[i - w] << w), up to the 32-byte window
+        width = 1
+        while width < GEAR_WINDOW:
+            shifted = h[:-width] << np.uint32(width)
+            h[width:] += shifted
+            del shifted
+            width <<= 1
+        candidates = np.flatnonzero((h & np.uint32(self.mask)) == 0)
+        del h
+
+        cuts: List[int] = []
+        start = 0
+        while start < n:
+            lowest = start + self.min_size - 1
+            limit = start + self.max_size - 1
+            idx = int(np.searchsorted(candidates, lowest))
+            if idx < len(candidates) and candidates[idx] <= limit:
+                end = int(candidates[idx]) + 1
+            elif limit < n:
+                end = limit + 1
+            elif final:
+                end = n
+            else:
+                break
+            cuts.append(end)
+            start = end
+        return cuts, start
+
+    def _cut_points_python(self, view: Any, final: bool) -> Tuple[List[int], int]:
+        """Pure-Python boundary search; skips hashing below ``min_size``."""
+        n = len(view)
+        gear = GEAR_TABLE
+        mask = self.mask
+        cuts: List[int] = []
+        start = 0
+        while start < n:
+            lowest = start + self.min_size - 1
+            limit = min(start + self.max_size - 1, n - 1)
+            end = -1
+            if lowest <= limit:
+                h = 0
+                pos = lowest - GEAR_WINDOW + 1
+                while pos < lowest:
+                    h = ((h << 1) + gear[view[pos]]) & _HASH_MASK
+                    pos += 1
+                while pos <= limit:
+                    h = ((h << 1) + gear[view[pos]]) & _HASH_MASK
+                    if not h & mask:
+                        end = pos + 1
+                        break
+                    pos += 1
+            if end < 0:
+                if start + self.max_size <= n:
+                    end = start + self.max_size
+                elif final:
+                    end = n
+                else:
+                    break
+            cuts.append(end)
+            start = end
+        return cuts, start
+
+    def cut_points(self, data: Any, final: bool = True) -> Tuple[List[int], int]:
+        """Return (chunk end offsets, bytes consumed) for a contiguous buffer.
+
+        When ``final`` is False the trailing partial chunk is left unconsumed
+        so the caller can extend it with more data.
+        """
+        view = memoryview(data).cast("B")
+        try:
+            if self.use_numpy:
+                return self._cut_points_numpy(view, final)
+            return self._cut_points_python(view, final)
+        finally:
+            view.release()
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+    def chunk_bytes(self, data: bytes) -> List[bytes]:
+        """Chunk in-memory bytes."""
+        cuts, _ = self.cut_points(data, final=True)
+        chunks: List[bytes] = []
+        start = 0
+        for end in cuts:
+            chunks.append(bytes(data[start:end]))
+            start = end
+        return chunks
+
+    def chunk_stream(self, stream: BinaryIO) -> Iterator[bytes]:
+        """Yield variable-size chunks from a binary stream.
+
+        Regular files are memory-mapped; anything else is read in
+        ``buffer_size`` blocks.
+        """
+        mapped = self._try_mmap(stream) if self.use_mmap else None
+        if mapped is not None:
+            yield from self._chunk_mmap(stream, *mapped)
+        else:
+            yield from self._chunk_buffered(stream)
+
+    def chunk_file(self, path: str) -> Iterator[bytes]:
+        """Yield chunks from a file on disk."""
+        with open(path, "rb") as f:
+            yield from self.chunk_stream(f)
+
+    # -------------------------------------------------------------------------
+    # Input strategies
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _try_mmap(stream: BinaryIO) -> Optional[Tuple[mmap.mmap, int, int]]:
+        """Map ``stream`` if it is a regular, non-empty file."""
+        try:
+            fd = stream.fileno()
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+                return None
+            offset = stream.tell()
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ), offset, st.st_size
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            return None
+
+    def _chunk_mmap(
+        self, stream: BinaryIO, mm: mmap.mmap, offset: int, size: int
+    ) -> Iterator[bytes]:
+        try:
+            pos = offset
+            while pos < size:
+                end = min(pos + self.buffer_size, size)
+                cuts, consumed = self._window_cuts(mm, pos, end, final=end == size)
+                start = pos
+                for cut in cuts:
+                    yield mm[start:pos + cut]
+                    start = pos + cut
+                pos += consumed
+            stream.seek(size)
+        finally:
+            mm.close()
+
+    def _window_cuts(
+        self, mm: mmap.mmap, start: int, end: int, final: bool
+    ) -> Tuple[List[int], int]:
+        view = memoryview(mm)[start:end]
+        try:
+            return self.cut_points(view, final=final)
+        finally:
+            view.release()
+
+    def _chunk_buffered(self, stream: BinaryIO) -> Iterator[bytes]:
+        carry = b""
+        eof = False
+        while not eof:
+            block = stream.read(self.buffer_size - len(carry))
+            eof = not block
+            data = carry + block if carry else block
+            if not data:
+                break
+            cuts, consumed = self.cut_points(data, final=eof)
+            start = 0
+            for cut in cuts:
+                yield bytes(data[start:cut])
+                start = cut
+            carry = data[consumed:]
+
+
+def chunk_sizes(chunks: Sequence[bytes]) -> Tuple[int, float, int]:
+    """Return (min, mean, max) chunk size for diagnostics and benchmarks."""
+    if not chunks:
+        return 0, 0.0, 0
+    sizes = [len(c) for c in chunks]
+    return min(sizes), sum(sizes) / len(sizes), max(sizes)
@@ -102,12 +102,12 @@
 
 Enterprise Features:
 - Block-level content-addressed storage (SHA-256 -> segment store)
-- Content-defined chunking (rolling hash / Rabin fingerprint)
-- Persistent index (JSON/SQLite) mapping backup sets -> block digests
+- Content-defined chunking (buffered gear/FastCDC hash, legacy Rabin-style)
+- Persistent index (SQLite / append-only log / JSON) mapping backup sets -> block digests
 - AES-256-GCM encryption pipeline before storage (optional)
 - LZ4/ZSTD compression with tier selection
-- Integrity verification & scheduled scrubbing
-- Garbage collection with reference counting
+- Integrity verification & resumable, rate-limited scrubbing
+- Incremental mark-and-sweep garbage collection with reference counting
 - Retention policies and lifecycle management
 - Bandwidth throttling for remote targets
 - Incremental forever / synthetic full support
@@ -122,13 +122,25 @@ import hashlib
 import os
 import logging
 import json
-import time
 import threading
 from datetime import datetime, timezone, timedelta
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-_logger=logging.getLogger(__name__)
+from opt.services.backup.block_index import BlockIndex, BlockRecord, open_block_index
+from opt.services.backup.chunking import GearChunker
+from opt.services.backup.maintenance import (
+    GCResult,
+    IncrementalGarbageCollector,
+    IncrementalScrubber,
+    MaintenanceScheduler,
+    MaintenanceState,
+    ScrubResult,
+)
+from opt.services.backup.pipeline import IngestResult, ParallelIngestPipeline
+from opt.services.backup.restore_engine import ParallelRestoreEngine, RestoreResult
+
+logger=logging.getLogger(__name__)
 
 # -----------------------------------------------------------------------------
 # Enums and Configuration
@@ -160,8 +172,10 @@ class ChunkingConfig:
     min_size: int=4 * 1024    # 4 KB minimum
     avg_size: int=64 * 1024    # 64 KB target average
     max_size: int=1024 * 1024    # 1 MB maximum
-    window_size: int=48    # Rolling hash window
+    window_size: int=48    # Rolling hash window (legacy "rabin" engine)
     mask_bits: int=16    # avg_size ? 2^mask_bits
+    engine: str="gear"    # "gear" (buffered, FastCDC-style) or "rabin" (legacy)
+    buffer_size: int=8 * 1024 * 1024    # Read buffer for the gear engine
 
 
 @dataclass
@@ -177,21 +191,16 @@ class BackupConfig:
     max_concurrent_io: int=4
     scrub_interval_hours: int=168    # Weekly
     gc_grace_period_hours: int=24
+    gc_interval_hours: int=24    # Start a new mark-and-sweep cycle this often
+    scrub_workers: int=2    # Parallel block verification during scrub
+    scrub_bandwidth_mbps: float=0.0    # Scrub read budget (0=unlimited)
     bandwidth_limit_mbps: float=0.0    # 0=unlimited
-
-
-@dataclass
-class BlockRecord:
-    """Metadata for a stored block."""
-
-    digest: str
-    size: int
-    compressed_size: int
-    stored_at: datetime
-    ref_count: int=0
-    compression: str="none"
-    encrypted: bool=False
-    verified_at: Optional[datetime] = None
+    index_backend: str="sqlite"    # "sqlite", "log" (append-only) or "json" (legacy)
+    parallelism: int=1    # Hash/compress/encrypt workers for ingest (1=sequential)
+    pipeline_depth: int=0    # Max chunks in flight (0=4 x parallelism)
+    restore_workers: int=4    # Parallel block reads/decompression on restore
+    restore_prefetch: int=16    # Manifest blocks read ahead on restore
+    restore_sparse: bool=True    # Leave holes for zero chunks in restored files
 
 
 @dataclass
@@ -210,26 +219,6 @@ class BackupManifest:
     tags: List[str] = field(default_factory=list)
 
 
-@dataclass
-class ScrubResult:
-    """Result of integrity scrub operation."""
-
-    total_blocks: int
-    verified_ok: int
-    corrupted: List[str]
-    missing: List[str]
-    duration_seconds: float
-
-
-@dataclass
-class GCResult:
-    """Result of garbage collection."""
-
-    orphan_blocks: int
-    bytes_reclaimed: int
-    duration_seconds: float
-
-
 # -----------------------------------------------------------------------------
 # Content-Defined Chunking (Rabin-like rolling hash)
 # -----------------------------------------------------------------------------
@@ -239,17 +228,17 @@ class RollingHash:
     PRIME=31
     MOD=(1 << 32) - 1
 
-    def __init__(self, windowsize: int=48) -> None:
-        self.window_size=window_size  # type: ignore[name-defined]
+    def __init__(self, window_size: int=48) -> None:
+        self.window_size=window_size
         self.window: List[int] = []
         self.hash_value=0
-        self.pow_cache=pow(self.PRIME, window_size - 1, self.MOD)  # type: ignore[name-defined]
+        self.pow_cache=pow(self.PRIME, window_size - 1, self.MOD)
 
     def update(self, byte: int) -> int:
         """Add byte to window, return current hash."""
         if len(self.window) >= self.window_size:
-            _old=self.window.pop(0)
-            self.hash_value=(self.hash_value - old * self.pow_cache) & self.MOD  # type: ignore[name-defined]
+            old=self.window.pop(0)
+            self.hash_value=(self.hash_value - old * self.pow_cache) & self.MOD
 
         self.window.append(byte)
         self.hash_value=((self.hash_value * self.PRIME) + byte) & self.MOD
@@ -261,7 +250,11 @@ class RollingHash:
 
 
 class ContentDefinedChunker:
-    """Split data stream into variable-size chunks at content boundaries."""
+    """Split data stream into variable-size chunks at content boundaries.
+
+    Byte-at-a-time reference implementation; see ``GearChunker`` in
+    ``chunking.py`` for the buffered engine used by default.
+    """
 
     def __init__(self, config: ChunkingConfig) -> None:
         self.config=config
@@ -270,30 +263,30 @@ class ContentDefinedChunker:
 
     def chunk_stream(self, stream: BinaryIO) -> Iterable[bytes]:
         """Yield variable-size chunks from binary stream."""
-        _buffer=bytearray()
+        buffer=bytearray()
         self.rolling.reset()
 
         while True:
-            _byte=stream.read(1)
-            if not byte:  # type: ignore[name-defined]
+            byte=stream.read(1)
+            if not byte:
                 break
 
-            buffer.append(byte[0])  # type: ignore[name-defined]
-            _h=self.rolling.update(byte[0])  # type: ignore[name-defined]
+            buffer.append(byte[0])
+            h=self.rolling.update(byte[0])
 
             # Check for boundary: hash matches mask OR hit max size
-            is_boundary=len(buffer) >= self.config.min_size and (  # type: ignore[name-defined]
-                (h & self.mask) == 0 or len(buffer) >= self.config.max_size  # type: ignore[name-defined]
+            is_boundary=len(buffer) >= self.config.min_size and (
+                (h & self.mask) == 0 or len(buffer) >= self.config.max_size
             )
 
             if is_boundary:
-                yield bytes(buffer)  # type: ignore[name-defined]
-                buffer.clear()  # type: ignore[name-defined]
+                yield bytes(buffer)
+                buffer.clear()
                 self.rolling.reset()
 
         # Yield remaining data
-        if buffer:  # type: ignore[name-defined]
-            yield bytes(buffer)  # type: ignore[name-defined]
+        if buffer:
+            yield bytes(buffer)
 
     def chunk_bytes(self, data: bytes) -> List[bytes]:
         """Chunk in-memory bytes."""
@@ -302,6 +295,15 @@ class ContentDefinedChunker:
         return list(self.chunk_stream(io.BytesIO(data)))
 
 
+def create_chunker(config: ChunkingConfig) -> Any:
+    """Build the chunking engine selected by ``config.engine``."""
+    if config.engine == "rabin":
+        return ContentDefinedChunker(config)
+    if config.engine == "gear":
+        return GearChunker(config, buffer_size=config.buffer_size)
+    raise ValueError(f"Unknown chunking engine: {config.engine}")
+
+
 # -----------------------------------------------------------------------------
 # Compression / Encryption Pipelines
 # -----------------------------------------------------------------------------
@@ -325,14 +327,14 @@ class CompressionPipeline:
             elif algo == CompressionAlgo.ZSTD:
                 import zstandard
 
-                _cctx=zstandard.ZstdCompressor(level=level)
-                return cctx.compress(data), "zstd"  # type: ignore[name-defined]
+                cctx=zstandard.ZstdCompressor(level=level)
+                return cctx.compress(data), "zstd"
             elif algo == CompressionAlgo.GZIP:
                 import gzip
 
                 return gzip.compress(data, compresslevel=min(level, 9)), "gzip"
         except ImportError:
-            logger.warning(  # type: ignore[name-defined]
+            logger.warning(
                 f"Compression {algo.value} not available, storing uncompressed"
             )
 
@@ -351,8 +353,8 @@ class CompressionPipeline:
         elif algo == "zstd":
             import zstandard
 
-            _dctx=zstandard.ZstdDecompressor()
-            return dctx.decompress(data)  # type: ignore[name-defined, no-any-return]
+            dctx=zstandard.ZstdDecompressor()
+            return dctx.decompress(data)
         elif algo == "gzip":
             import gzip
 
@@ -371,8 +373,8 @@ class CompressionPipeline:
         if algo == "zstd":
             import zstandard
 
-            _dctx=zstandard.ZstdDecompressor()
-            with dctx.stream_reader(source) as reader:  # type: ignore[name-defined]
+            dctx=zstandard.ZstdDecompressor()
+            with dctx.stream_reader(source) as reader:
                 while chunk := reader.read(65536):
                     yield chunk
         elif algo == "gzip":
@@ -408,17 +410,17 @@ class EncryptionPipeline:
             )
 
             if mode == EncryptionMode.AES_256_GCM:
-                _nonce=os.urandom(12)
-                _cipher_aes=AESGCM(key[:32])    # Ensure 256-bit key
-                _ciphertext=cipher_aes.encrypt(nonce, data, None)  # type: ignore[name-defined]
-                return nonce + ciphertext  # type: ignore[name-defined]
+                nonce=os.urandom(12)
+                cipher_aes=AESGCM(key[:32])    # Ensure 256-bit key
+                ciphertext=cipher_aes.encrypt(nonce, data, None)
+                return nonce + ciphertext
             elif mode == EncryptionMode.CHACHA20_POLY1305:
-                _nonce=os.urandom(12)
-                _cipher_chacha=ChaCha20Poly1305(key[:32])
-                _ciphertext=cipher_chacha.encrypt(nonce, data, None)  # type: ignore[name-defined]
-                return nonce + ciphertext  # type: ignore[name-defined]
+                nonce=os.urandom(12)
+                cipher_chacha=ChaCha20Poly1305(key[:32])
+                ciphertext=cipher_chacha.encrypt(nonce, data, None)
+                return nonce + ciphertext
         except ImportError:
-            logger.error("cryptography library not available for encryption")  # type: ignore[name-defined]
+            logger.error("cryptography library not available for encryption")
             raise RuntimeError("Encryption requested but cryptography not installed")
 
     @staticmethod
@@ -432,11 +434,11 @@ class EncryptionPipeline:
         nonce, ciphertext=data[:12], data[12:]
 
         if mode == EncryptionMode.AES_256_GCM:
-            _cipher_aes=AESGCM(key[:32])
-            return cipher_aes.decrypt(nonce, ciphertext, None)  # type: ignore[name-defined]
+            cipher_aes=AESGCM(key[:32])
+            return cipher_aes.decrypt(nonce, ciphertext, None)
         elif mode == EncryptionMode.CHACHA20_POLY1305:
-            _cipher_chacha=ChaCha20Poly1305(key[:32])
-            return cipher_chacha.decrypt(nonce, ciphertext, None)  # type: ignore[name-defined]
+            cipher_chacha=ChaCha20Poly1305(key[:32])
+            return cipher_chacha.decrypt(nonce, ciphertext, None)
 
         raise ValueError(f"Unknown encryption mode: {mode}")
 
@@ -445,192 +447,175 @@ class EncryptionPipeline:
 # Block Store - Content-Addressed Storage
 # -----------------------------------------------------------------------------
 class BlockStore:
-    """Content-addressed block storage with ref counting."""
+    """Content-addressed block storage with ref counting.
+
+    The digest index lives in a pluggable backend (see ``block_index.py``);
+    wrap bulk work in ``batch()`` so index I/O is paid once per backup.
+    """
 
     def __init__(self, config: BackupConfig) -> None:
         self.config=config
         self.root=Path(config.store_root)
         self.blocks_dir=self.root / "blocks"
-        self.index_file=self.root / "block_index.json"
 
         self.blocks_dir.mkdir(parents=True, exist_ok=True)
-        self.index: Dict[str, BlockRecord] = {}
+        self.index: BlockIndex=open_block_index(self.root, config.index_backend)
         self._lock=threading.Lock()
-        self._load_index()
 
-    def _load_index(self) -> None:
-        """Load persistent block index."""
-        if self.index_file.exists():
-            try:
-                with open(self.index_file, "r") as f:
-                    _data=json.load(f)
-                for digest, rec in data.items():  # type: ignore[name-defined]
-                    self.index[digest] = BlockRecord(  # type: ignore[call-arg]
-                        _digest=rec["digest"],
-                        _size=rec["size"],
-                        _compressed_size=rec["compressed_size"],
-                        _stored_at=datetime.fromisoformat(rec["stored_at"]),
-                        _ref_count=rec["ref_count"],
-                        _compression=rec.get("compression", "none"),
-                        _encrypted=rec.get("encrypted", False),
-                        _verified_at=(
-                            datetime.fromisoformat(rec["verified_at"])
-                            if rec.get("verified_at")
-                            else None
-                        ),
-                    )
-                logger.info(f"Loaded {len(self.index)} blocks from index")  # type: ignore[name-defined]
-            except Exception as e:
-                logger.warning(f"Failed to load block index: {e}")  # type: ignore[name-defined]
+    def batch(self) -> Any:
+        """Context manager deferring index persistence (e.g. one backup)."""
+        return self.index.batch()
 
-    def _save_index(self) -> None:
-        """Persist block index."""
-        data={}
-        for digest, rec in self.index.items():
-            data[digest] = {
-                "digest": rec.digest,
-                "size": rec.size,
-                "compressed_size": rec.compressed_size,
-                "stored_at": rec.stored_at.isoformat(),
-                "ref_count": rec.ref_count,
-                "compression": rec.compression,
-                "encrypted": rec.encrypted,
-                "verified_at": rec.verified_at.isoformat() if rec.verified_at else None,
-            }
-        with open(self.index_file, "w") as f:
-            json.dump(data, f)
+    def flush(self) -> None:
+        """Persist any buffered index mutations."""
+        self.index.flush()
+
+    def close(self) -> None:
+        """Flush and release the index backend."""
+        self.index.close()
 
     def _block_path(self, digest: str) -> Path:
         """Two-level directory hierarchy for block storage."""
         return self.blocks_dir / digest[:2] / digest[2:4] / digest
 
-    def put(self, data: bytes) -> Tuple[str, int]:
-        """Store block, return (digest, original_size). Deduplicates by hash."""
-        _digest=hashlib.sha256(data).hexdigest()
-        _original_size=len(data)
-
-        with self._lock:
-            if digest in self.index:  # type: ignore[name-defined]
-                self.index[digest].ref_count += 1  # type: ignore[name-defined]
-                self._save_index()
-                logger.debug(  # type: ignore[name-defined]
-                    f"Block {digest[:12]}... already exists, "  # type: ignore[name-defined]
-                    f"ref_count={self.index[digest].ref_count}"  # type: ignore[name-defined]
-                )
-                return digest, original_size  # type: ignore[name-defined]
-
-        # Compress
+    def encode(self, data: bytes) -> Tuple[bytes, str, bool]:
+        """Compress and optionally encrypt a block: (payload, algo, encrypted)."""
         compressed, algo=CompressionPipeline.compress(
             data, self.config.compression, self.config.compression_level
         )
-
-        # Encrypt
         encrypted=False
         if self.config.encryption != EncryptionMode.NONE and self.config.encryption_key:
             compressed=EncryptionPipeline.encrypt(
                 compressed, self.config.encryption_key, self.config.encryption
             )
-            _encrypted=True
+            encrypted=True
+        return compressed, algo, encrypted
 
-        # Write to disk
-        _path=self._block_path(digest)  # type: ignore[name-defined]
-        path.parent.mkdir(parents=True, exist_ok=True)  # type: ignore[name-defined]
-        with open(path, "wb") as f:  # type: ignore[name-defined]
-            f.write(compressed)
+    def write_block(self, digest: str, payload: bytes) -> None:
+        """Write an encoded block to its content-addressed path."""
+        path=self._block_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(payload)
 
+    def commit_block(
+        self,
+        digest: str,
+        size: int,
+        compressed_size: int,
+        algo: str,
+        encrypted: bool,
+        refs: int=1,
+    ) -> None:
+        """Index a freshly written block, or add refs if it raced with another writer."""
         with self._lock:
-            self.index[digest] = BlockRecord(  # type: ignore[call-arg, name-defined]
-                _digest=digest,  # type: ignore[name-defined]
-                _size=original_size,  # type: ignore[name-defined]
-                _compressed_size=len(compressed),
-                _stored_at=datetime.now(timezone.utc),
-                _ref_count=1,
-                _compression=algo,
-                _encrypted=encrypted,
+            if self.index.adjust_ref(digest, refs) is None:
+                self.index.add(
+                    BlockRecord(
+                        digest=digest,
+                        size=size,
+                        compressed_size=compressed_size,
+                        stored_at=datetime.now(timezone.utc),
+                        ref_count=refs,
+                        compression=algo,
+                        encrypted=encrypted,
+                    )
+                )
+
+    def add_ref(self, digest: str, refs: int=1) -> Optional[int]:
+        """Add references to an indexed block; None if it is not indexed."""
+        with self._lock:
+            return self.index.adjust_ref(digest, refs)
+
+    def put(self, data: bytes) -> Tuple[str, int]:
+        """Store block, return (digest, original_size). Deduplicates by hash."""
+        digest=hashlib.sha256(data).hexdigest()
+        original_size=len(data)
+
+        ref_count=self.add_ref(digest)
+        if ref_count is not None:
+            logger.debug(
+                f"Block {digest[:12]}... already exists, ref_count={ref_count}"
             )
-            self._save_index()
+            return digest, original_size
 
-        logger.debug(  # type: ignore[name-defined]
-            f"Stored block {digest[:12]}... {original_size}B -> {len(compressed)}B ({algo})"  # type: ignore[name-defined]
+        compressed, algo, encrypted=self.encode(data)
+        self.write_block(digest, compressed)
+        self.commit_block(digest, original_size, len(compressed), algo, encrypted)
+
+        logger.debug(
+            f"Stored block {digest[:12]}... {original_size}B -> {len(compressed)}B ({algo})"
         )
-        return digest, original_size  # type: ignore[name-defined]
+        return digest, original_size
 
     def get(self, digest: str) -> bytes:
         """Retrieve and decompress block."""
-        if digest not in self.index:
+        record=self.index.get(digest)
+        if record is None:
             raise KeyError(f"Block {digest} not in index")
 
-        record=self.index[digest]
-        _path=self._block_path(digest)
-
-        with open(path, "rb") as f:  # type: ignore[name-defined]
-            _data=f.read()
+        with open(self._block_path(digest), "rb") as f:
+            data=f.read()
 
         # Decrypt
         if record.encrypted and self.config.encryption_key:
             data=EncryptionPipeline.decrypt(
-                data, self.config.encryption_key, self.config.encryption  # type: ignore[has-type]
+                data, self.config.encryption_key, self.config.encryption
             )
 
         # Decompress
-        _data=CompressionPipeline.decompress(data, record.compression)
-
-        return data
+        return CompressionPipeline.decompress(data, record.compression)
 
     def verify(self, digest: str) -> bool:
         """Verify block integrity."""
         try:
-            _data=self.get(digest)
-            _actual_digest=hashlib.sha256(data).hexdigest()  # type: ignore[name-defined]
-            valid=actual_digest == digest  # type: ignore[name-defined]
+            data=self.get(digest)
+            valid=hashlib.sha256(data).hexdigest() == digest
             if valid:
-                with self._lock:
-                    self.index[digest].verified_at=datetime.now(timezone.utc)
+                self.index.set_verified(digest, datetime.now(timezone.utc))
             return valid
         except Exception as e:
-            logger.error(f"Verification failed for {digest}: {e}")  # type: ignore[name-defined]
+            logger.error(f"Verification failed for {digest}: {e}")
             return False
 
     def decrement_ref(self, digest: str) -> None:
         """Decrement reference count."""
         with self._lock:
-            if digest in self.index:
-                self.index[digest].ref_count -= 1
-                self._save_index()
+            self.index.adjust_ref(digest, -1)
+
+    def block_exists(self, digest: str) -> bool:
+        """Whether the block file is present on disk."""
+        return self._block_path(digest).exists()
 
     def delete_block(self, digest: str) -> int:
         """Delete block from storage, return bytes freed."""
         with self._lock:
-            if digest not in self.index:
+            record=self.index.get(digest)
+            if record is None:
                 return 0
-            record=self.index[digest]
             if record.ref_count > 0:
-                logger.warning(  # type: ignore[name-defined]
+                logger.warning(
                     f"Refusing to delete block {digest[:12]}... with ref_count={record.ref_count}"
                 )
                 return 0
 
-            _path=self._block_path(digest)
-            bytes_freed=record.compressed_size
             try:
-                path.unlink()  # type: ignore[name-defined]
+                self._block_path(digest).unlink()
             except FileNotFoundError:
                 pass
-            del self.index[digest]
-            self._save_index()
-            return bytes_freed
+            self.index.remove(digest)
+            return record.compressed_size
 
     def stats(self) -> Dict[str, Any]:
         """Return storage statistics."""
-        _total_logical=sum(r.size for r in self.index.values())
-        _total_physical=sum(r.compressed_size for r in self.index.values())
+        unique_blocks, total_logical, total_physical=self.index.totals()
         return {
-            "unique_blocks": len(self.index),
-            "total_logical_bytes": total_logical,  # type: ignore[name-defined]
-            "total_physical_bytes": total_physical,  # type: ignore[name-defined]
-            "dedup_ratio": total_logical / total_physical if total_physical else 1.0,  # type: ignore[name-defined]
+            "unique_blocks": unique_blocks,
+            "total_logical_bytes": total_logical,
+            "total_physical_bytes": total_physical,
+            "dedup_ratio": total_logical / total_physical if total_physical else 1.0,
             "compression_ratio": (
-                total_logical / total_physical if total_physical else 1.0  # type: ignore[name-defined]
+                total_logical / total_physical if total_physical else 1.0
             ),
         }
 
@@ -644,38 +629,56 @@ class DedupBackupService:
     def __init__(self, config: Optional[BackupConfig] = None) -> None:
         self.config=config or BackupConfig()
         self.store=BlockStore(self.config)
-        self.chunker=ContentDefinedChunker(self.config.chunking)
+        self.chunker=create_chunker(self.config.chunking)
         self.manifests: Dict[str, BackupManifest] = {}
         self.manifest_file=Path(self.config.store_root) / "manifests.json"
         self._executor=ThreadPoolExecutor(max_workers=self.config.max_concurrent_io)
         self._load_manifests()
 
+        self._maintenance_state=MaintenanceState(Path(self.config.store_root))
+        self.maintenance=MaintenanceScheduler(
+            IncrementalScrubber(
+                self.store,
+                self._maintenance_state,
+                workers=self.config.scrub_workers,
+                rate_limit_mbps=self.config.scrub_bandwidth_mbps,
+            ),
+            IncrementalGarbageCollector(
+                self.store,
+                self.manifests,
+                self._maintenance_state,
+                grace_period_hours=self.config.gc_grace_period_hours,
+            ),
+            scrub_interval_hours=self.config.scrub_interval_hours,
+            gc_interval_hours=self.config.gc_interval_hours,
+        )
+
     def _load_manifests(self) -> None:
         """Load manifest index."""
         if self.manifest_file.exists():
             try:
                 with open(self.manifest_file, "r") as f:
-                    _data=json.load(f)
-                for mid, m in data.items():  # type: ignore[name-defined]
-                    self.manifests[mid] = BackupManifest(  # type: ignore[call-arg]
-                        _id=m["id"],
-                        _created_at=datetime.fromisoformat(m["created_at"]),
-                        _source=m["source"],
-                        _source_size=m.get("source_size", 0),
-                        _blocks=m["blocks"],
-                        _block_sizes=m.get("block_sizes", []),
-                        _metadata=m.get("metadata", {}),
-                        _parent_id=m.get("parent_id"),
-                        _retention_until=(
+                    data=json.load(f)
+                for mid, m in data.items():
+                    self.manifests[mid] = BackupManifest(
+                        id=m["id"],
+                        created_at=datetime.fromisoformat(m["created_at"]),
+                        source=m["source"],
+                        source_size=m.get("source_size", 0),
+                        blocks=m["blocks"],
+                        block_sizes=m.get("block_sizes", []),
+                        metadata=m.get("metadata", {}),
+                        parent_id=m.get("parent_id"),
+                        retention_until=(
                             datetime.fromisoformat(m["retention_until"])
                             if m.get("retention_until")
                             else None
                         ),
-                        _tags=m.get("tags", []),
+                        tags=m.get("tags", []),
                     )
-                logger.info(f"Loaded {len(self.manifests)} backup manifests")  # type: ignore[name-defined]
+                logger.info(f"Loaded {len(self.manifests)} backup manifests")
             except Exception as e:
-                logger.warning(f"Failed to load manifests: {e}")  # type: ignore[name-defined]
+                logger.warning(f"Failed to load manifests: {e}")
 
     def _save_manifests(self) -> None:
         """Persist manifests."""
@@ -698,6 +701,23 @@ class DedupBackupService:
         with open(self.manifest_file, "w") as f:
             json.dump(data, f)
 
+    def _ingest(self, chunks: Iterable[bytes]) -> IngestResult:
+        """Store chunks, sequentially or through the parallel pipeline."""
+        if self.config.parallelism > 1:
+            pipeline=ParallelIngestPipeline(
+                self.store, self.config.parallelism, self.config.pipeline_depth
+            )
+            return pipeline.run(chunks)
+
+        result=IngestResult()
+        with self.store.batch():
+            for chunk in chunks:
+                digest, size=self.store.put(chunk)
+                result.blocks.append(digest)
+                result.block_sizes.append(size)
+                result.total_size += size
+        return result
+
     def backup_file(
         self,
         file_path: str,
@@ -707,30 +727,22 @@ class DedupBackupService:
         """Backup a single file with content-defined chunking."""
         from uuid import uuid4
 
-        _path=Path(file_path)
-        if not path.exists():  # type: ignore[name-defined]
+        path=Path(file_path)
+        if not path.exists():
             raise FileNotFoundError(f"Source file not found: {file_path}")
 
-        block_digests: List[str] = []
-        block_sizes: List[int] = []
-        total_size=0
-
-        with open(path, "rb") as f:  # type: ignore[name-defined]
-            for chunk in self.chunker.chunk_stream(f):
-                digest, size=self.store.put(chunk)
-                block_digests.append(digest)
-                block_sizes.append(size)
-                total_size += size
-
-        _manifest=BackupManifest(  # type: ignore[call-arg]
-            _id=str(uuid4()),
-            _created_at=datetime.now(timezone.utc),
-            _source=str(path.absolute()),  # type: ignore[name-defined]
-            _source_size=total_size,
-            _blocks=block_digests,
-            _block_sizes=block_sizes,
-            _tags=tags or [],
-            _retention_until=(
+        with open(path, "rb") as f:
+            ingested=self._ingest(self.chunker.chunk_stream(f))
+
+        manifest=BackupManifest(
+            id=str(uuid4()),
+            created_at=datetime.now(timezone.utc),
+            source=str(path.absolute()),
+            source_size=ingested.total_size,
+            blocks=ingested.blocks,
+            block_sizes=ingested.block_sizes,
+            tags=tags or [],
+            retention_until=(
                 datetime.now(timezone.utc) + timedelta(days=retention_days)
                 if retention_days
                 else None
@@ -740,8 +752,9 @@ class DedupBackupService:
         self.manifests[manifest.id] = manifest
         self._save_manifests()
 
-        logger.info(  # type: ignore[name-defined]
-            f"Backup {manifest.id[:8]}... created: {len(block_digests)} blocks, {total_size} bytes"
+        logger.info(
+            f"Backup {manifest.id[:8]}... created: {len(manifest.blocks)} blocks, "
+            f"{manifest.source_size} bytes"
         )
         return manifest
 
@@ -755,154 +768,104 @@ class DedupBackupService:
         """Backup from binary stream (e.g., VM disk image)."""
         from uuid import uuid4
 
-        block_digests: List[str] = []
-        block_sizes: List[int] = []
-        total_size=0
-
-        for chunk in self.chunker.chunk_stream(stream):
-            digest, size=self.store.put(chunk)
-            block_digests.append(digest)
-            block_sizes.append(size)
-            total_size += size
-
-        _manifest=BackupManifest(  # type: ignore[call-arg]
-            _id=str(uuid4()),
-            _created_at=datetime.now(timezone.utc),
-            _source=source,
-            _source_size=total_size,
-            _blocks=block_digests,
-            _block_sizes=block_sizes,
-            _parent_id=parent_id,
-            _tags=tags or [],
+        ingested=self._ingest(self.chunker.chunk_stream(stream))
+
+        manifest=BackupManifest(
+            id=str(uuid4()),
+            created_at=datetime.now(timezone.utc),
+            source=source,
+            source_size=ingested.total_size,
+            blocks=ingested.blocks,
+            block_sizes=ingested.block_sizes,
+            parent_id=parent_id,
+            tags=tags or [],
         )
 
         self.manifests[manifest.id] = manifest
         self._save_manifests()
 
-        logger.info(  # type: ignore[name-defined]
-            f"Stream backup {manifest.id[:8]}... created: {len(block_digests)} blocks"
+        logger.info(
+            f"Stream backup {manifest.id[:8]}... created: {len(manifest.blocks)} blocks"
         )
         return manifest
 
-    def restore_to_file(self, manifestid: str, outputpath: str) -> int:
-        """Restore backup to file, return bytes written."""
-        _manifest=self.manifests.get(manifest_id)  # type: ignore[name-defined]
-        if not manifest:
-            raise ValueError(f"Manifest {manifest_id} not found")  # type: ignore[name-defined]
+    def _restore_engine(self) -> ParallelRestoreEngine:
+        return ParallelRestoreEngine(
+            self.store,
+            workers=self.config.restore_workers,
+            prefetch=self.config.restore_prefetch,
+            sparse=self.config.restore_sparse,
+        )
 
-        bytes_written=0
-        with open(output_path, "wb") as f:  # type: ignore[name-defined]
-            for digest in manifest.blocks:
-                _data=self.store.get(digest)
-                f.write(data)  # type: ignore[name-defined]
-                bytes_written += len(data)  # type: ignore[name-defined]
+    def restore_to_file(self, manifest_id: str, output_path: str) -> RestoreResult:
+        """Restore backup to file; the result carries bytes written and throughput."""
+        manifest=self.manifests.get(manifest_id)
+        if not manifest:
+            raise ValueError(f"Manifest {manifest_id} not found")
 
-        logger.info(  # type: ignore[name-defined]
-            f"Restored {manifest_id[:8]}... to {output_path} ({bytes_written} bytes)"  # type: ignore[name-defined]
+        sizes=manifest.block_sizes
+        if len(sizes) != len(manifest.blocks):
+            sizes=[self.store.index[d].size for d in manifest.blocks]
+        return self._restore_engine().restore_to_file(
+            manifest_id, manifest.blocks, sizes, output_path
         )
-        return bytes_written
 
-    def restore_stream(self, manifestid: str) -> Iterable[bytes]:
-        """Stream blocks for restore."""
-        _manifest=self.manifests.get(manifest_id)  # type: ignore[name-defined]
+    def restore_stream(self, manifest_id: str) -> Iterable[bytes]:
+        """Stream blocks for restore (in order, with read-ahead)."""
+        manifest=self.manifests.get(manifest_id)
         if not manifest:
-            raise ValueError(f"Manifest {manifest_id} not found")  # type: ignore[name-defined]
+            raise ValueError(f"Manifest {manifest_id} not found")
 
-        for digest in manifest.blocks:
-            yield self.store.get(digest)
+        sizes=manifest.block_sizes if len(manifest.block_sizes) == len(manifest.blocks) else None
+        yield from self._restore_engine().iter_blocks(manifest.blocks, sizes)
 
-    def delete_backup(self, manifestid: str) -> bool:
+    def delete_backup(self, manifest_id: str) -> bool:
         """Delete backup manifest and decrement block references."""
-        _manifest=self.manifests.get(manifest_id)  # type: ignore[name-defined]
+        manifest=self.manifests.get(manifest_id)
         if not manifest:
             return False
 
-        for digest in manifest.blocks:
-            self.store.decrement_ref(digest)
+        with self.store.batch():
+            for digest in manifest.blocks:
+                self.store.decrement_ref(digest)
 
-        del self.manifests[manifest_id]  # type: ignore[name-defined]
+        del self.manifests[manifest_id]
         self._save_manifests()
-        logger.info(f"Deleted backup manifest {manifest_id[:8]}...")  # type: ignore[name-defined]
+        logger.info(f"Deleted backup manifest {manifest_id[:8]}...")
         return True
 
-    def scrub(self, maxblocks: Optional[int] = None) -> ScrubResult:
-        """Verify integrity of stored blocks."""
-        _start=time.time()
-        _verified=0
-        _corrupted=[]  # type: ignore[var-annotated]
-        _missing=[]  # type: ignore[var-annotated]
+    def scrub(
+        self, max_blocks: Optional[int] = None, max_seconds: Optional[float] = None
+    ) -> ScrubResult:
+        """Verify stored blocks, resuming from the persistent scrub cursor.
 
-        _blocks=list(self.store.index.keys())
-        if max_blocks:  # type: ignore[name-defined]
-            blocks=blocks[:max_blocks]  # type: ignore[misc, name-defined]
-
-        for digest in blocks:
-            try:
-                if self.store.verify(digest):
-                    verified += 1  # type: ignore[name-defined]
-                else:
-                    corrupted.append(digest)  # type: ignore[name-defined]
-            except FileNotFoundError:
-                missing.append(digest)  # type: ignore[name-defined]
-            except Exception as e:
-                logger.error(f"Scrub error for {digest}: {e}")  # type: ignore[name-defined]
-                corrupted.append(digest)  # type: ignore[name-defined]
-
-        _duration=time.time() - start  # type: ignore[name-defined]
-        _result=ScrubResult(  # type: ignore[call-arg]
-            _total_blocks=len(blocks),
-            _verified_ok=verified,  # type: ignore[name-defined]
-            _corrupted=corrupted,  # type: ignore[name-defined]
-            _missing=missing,  # type: ignore[name-defined]
-            _duration_seconds=duration,  # type: ignore[name-defined]
-        )
+        Without limits the current pass is finished; with limits the next
+        call continues where this one stopped.
+        """
+        return self.maintenance.scrubber.run(max_blocks=max_blocks, max_seconds=max_seconds)
 
-        logger.info(  # type: ignore[name-defined]
-            f"Scrub complete: {verified}/{len(blocks)} OK, "  # type: ignore[name-defined]
-            f"{len(corrupted)} corrupted, {len(missing)} missing"  # type: ignore[name-defined]
-        )
-        return result  # type: ignore[name-defined]
-
-    def garbage_collect(self) -> GCResult:
-        """Remove orphaned blocks with zero references."""
-        _start=time.time()
-        orphans=[]
-
-        for digest, record in list(self.store.index.items()):
-            if record.ref_count <= 0:
-            # Check grace period
-                _age=datetime.now(timezone.utc) - record.stored_at
-                if age.total_seconds() > self.config.gc_grace_period_hours * 3600:  # type: ignore[name-defined]
-                    orphans.append(digest)
-
-        bytes_reclaimed=0
-        for digest in orphans:
-            bytes_reclaimed += self.store.delete_block(digest)
-
-        _duration=time.time() - start  # type: ignore[name-defined]
-        result=GCResult(  # type: ignore[call-arg]
-            _orphan_blocks=len(orphans),
-            _bytes_reclaimed=bytes_reclaimed,
-            _duration_seconds=duration,  # type: ignore[name-defined]
-        )
+    def garbage_collect(
+        self, max_items: Optional[int] = None, max_seconds: Optional[float] = None
+    ) -> GCResult:
+        """Mark-and-sweep unreferenced blocks past the grace period.
 
-        logger.info(  # type: ignore[name-defined]
-            f"GC complete: removed {len(orphans)} orphans, reclaimed {bytes_reclaimed} bytes"
-        )
-        return result
+        Without limits a full cycle runs; with limits the cycle is advanced
+        and continued by the next call.
+        """
+        return self.maintenance.collector.run(max_items=max_items, max_seconds=max_seconds)
 
     def apply_retention(self) -> List[str]:
         """Delete backups past retention date."""
-        _now=datetime.now(timezone.utc)
+        now=datetime.now(timezone.utc)
         expired=[]
 
         for mid, manifest in list(self.manifests.items()):
-            if manifest.retention_until and manifest.retention_until < now:  # type: ignore[name-defined]
+            if manifest.retention_until and manifest.retention_until < now:
                 self.delete_backup(mid)
                 expired.append(mid)
 
         if expired:
-            logger.info(f"Retention policy expired {len(expired)} backups")  # type: ignore[name-defined]
+            logger.info(f"Retention policy expired {len(expired)} backups")
         return expired
 
     def list_backups(
@@ -920,27 +883,27 @@ class DedupBackupService:
 
     def dedup_stats(self) -> Dict[str, Any]:
         """Return comprehensive deduplication statistics."""
-        _store_stats=self.store.stats()
-        _total_backup_size=sum(m.source_size for m in self.manifests.values())
+        store_stats=self.store.stats()
+        total_backup_size=sum(m.source_size for m in self.manifests.values())
 
         return {
-            **store_stats,  # type: ignore[name-defined]
+            **store_stats,
             "backup_count": len(self.manifests),
-            "total_backup_size": total_backup_size,  # type: ignore[name-defined]
+            "total_backup_size": total_backup_size,
             "global_dedup_ratio": (
-                total_backup_size / store_stats["total_physical_bytes"]  # type: ignore[name-defined]
-                if store_stats["total_physical_bytes"]  # type: ignore[name-defined]
+                total_backup_size / store_stats["total_physical_bytes"]
+                if store_stats["total_physical_bytes"]
                 else 1.0
             ),
-            "space_saved_bytes": total_backup_size  # type: ignore[name-defined]
-            - store_stats["total_physical_bytes"],  # type: ignore[name-defined]
+            "space_saved_bytes": total_backup_size
+            - store_stats["total_physical_bytes"],
         }
 
-    def export_manifest(self, manifestid: str) -> Dict[str, Any]:
+    def export_manifest(self, manifest_id: str) -> Dict[str, Any]:
         """Export manifest for external tooling."""
-        _manifest=self.manifests.get(manifest_id)  # type: ignore[name-defined]
+        manifest=self.manifests.get(manifest_id)
         if not manifest:
-            raise ValueError(f"Manifest not found: {manifest_id}")  # type: ignore[name-defined]
+            raise ValueError(f"Manifest not found: {manifest_id}")
 
         return {
             "id": manifest.id,
@@ -954,53 +917,64 @@ class DedupBackupService:
             "parent_id": manifest.parent_id,
         }
 
+    def start_maintenance(self, slice_seconds: float=30.0, pause_seconds: float=30.0) -> None:
+        """Run scrub and GC continuously in the background, in time slices."""
+        self.maintenance.start(slice_seconds, pause_seconds)
+
+    def maintenance_progress(self) -> Dict[str, Any]:
+        """Scrub and GC progress, including ETA for the current pass/phase."""
+        return self.maintenance.progress()
+
     def close(self) -> None:
-        """Shutdown executor."""
+        """Stop maintenance, shutdown executor and flush the block index."""
+        self.maintenance.stop()
         self._executor.shutdown(wait=True)
+        self.store.close()
+        self._maintenance_state.close()
 
 
 # -----------------------------------------------------------------------------
 # Example / Test
 # -----------------------------------------------------------------------------
 
-if _name__== "__main__":  # type: ignore[name-defined]
+if __name__ == "__main__":
     import io
     import tempfile
 
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
     # Create service with LZ4 compression
-    config=BackupConfig(  # type: ignore[call-arg]
-        _store_root=tempfile.mkdtemp(prefix="dedup_test_"),
-        _compression=CompressionAlgo.LZ4,  # type: ignore[arg-type]
+    config=BackupConfig(
+        store_root=tempfile.mkdtemp(prefix="dedup_test_"),
+        compression=CompressionAlgo.LZ4,
     )
-    _svc=DedupBackupService(config)
+    svc=DedupBackupService(config)
 
     # Simulate VM disk with repeating patterns (high dedup potential)
-    _test_data=(b"A" * 100_000 + b"B" * 50_000 + b"A" * 100_000 + b"C" * 25_000) * 3
-    print(f"Test data size: {len(test_data):, } bytes")  # type: ignore[name-defined]
+    test_data=(b"A" * 100_000 + b"B" * 50_000 + b"A" * 100_000 + b"C" * 25_000) * 3
+    print(f"Test data size: {len(test_data):,} bytes")
 
     # Backup stream
-    manifest=svc.backup_stream(  # type: ignore[name-defined]
-        "test-vm-disk", io.BytesIO(test_data), tags=["test", "vm"]  # type: ignore[name-defined]
+    manifest=svc.backup_stream(
+        "test-vm-disk", io.BytesIO(test_data), tags=["test", "vm"]
     )
     print(f"Backup ID: {manifest.id}")
     print(f"Blocks: {len(manifest.blocks)}")
 
     # Check dedup
-    _stats=svc.dedup_stats()  # type: ignore[name-defined]
-    print(f"Dedup ratio: {stats['global_dedup_ratio']:.2f}x")  # type: ignore[name-defined]
-    print(f"Space saved: {stats['space_saved_bytes']:, } bytes")  # type: ignore[name-defined]
+    stats=svc.dedup_stats()
+    print(f"Dedup ratio: {stats['global_dedup_ratio']:.2f}x")
+    print(f"Space saved: {stats['space_saved_bytes']:,} bytes")
 
     # Restore and verify
-    _restored=b"".join(svc.restore_stream(manifest.id))  # type: ignore[name-defined]
-    assert restored == test_data, "Restore mismatch!"  # type: ignore[name-defined]
-    print("? Restore verified")
+    restored=b"".join(svc.restore_stream(manifest.id))
+    assert restored == test_data, "Restore mismatch!"
+    print("Restore verified")
 
     # Scrub
-    _scrub_result=svc.scrub()  # type: ignore[name-defined]
-    print(f"Scrub: {scrub_result.verified_ok}/{scrub_result.total_blocks} OK")  # type: ignore[name-defined]
+    scrub_result=svc.scrub()
+    print(f"Scrub: {scrub_result.verified_ok}/{scrub_result.total_blocks} OK")
 
     # Cleanup
-    svc.close()  # type: ignore[name-defined]
+    svc.close()
     print("Done!")
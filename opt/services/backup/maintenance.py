@@ -0,0 +1,606 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Incremental scrub and garbage collection for the deduplicating block store.
+
+Features:
+- Resumable scrub: a persistent cursor walks the block index in digest
+  order, so capped runs continue where the previous run stopped
+- Parallel verification under a bandwidth budget (MB/s token bucket)
+- Progress and ETA per scrub pass / GC phase
+- Incremental mark-and-sweep GC: manifests are marked into an on-disk
+  set, then blocks are swept in cursor-sized batches
+- ``MaintenanceScheduler`` runs both in time slices on a background thread
+
+State lives in ``maintenance.db`` (SQLite) next to the block index.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+)
+
+if TYPE_CHECKING:
+    from opt.services.backup.block_index import BlockRecord
+    from opt.services.backup.dedup_backup_service import BackupManifest, BlockStore
+
+logger = logging.getLogger(__name__)
+
+_SQLITE_MAX_PARAMS = 900
+
+
+# =============================================================================
+# Data Models
+# =============================================================================
+@dataclass
+class MaintenanceProgress:
+    """Progress of a scrub pass or GC phase."""
+
+    task: str    # "scrub" or "gc"
+    phase: str    # scrub: "scrubbing"; gc: "idle", "mark" or "sweep"
+    cycle: int
+    done: int
+    total: int
+    bytes_done: int = 0
+    active_seconds: float = 0.0
+    started_at: Optional[datetime] = None
+    last_completed_at: Optional[datetime] = None
+
+    @property
+    def percent(self) -> float:
+        if self.total <= 0:
+            return 100.0
+        return min(100.0, self.done / self.total * 100)
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Remaining active time at the observed rate (None until measured)."""
+        if self.done <= 0 or self.active_seconds <= 0:
+            return None
+        rate = self.done / self.active_seconds
+        return max(0, self.total - self.done) / rate
+
+    def to_dict(self) -> Dict[str, Any]:
+        eta = self.eta_seconds
+        return {
+            "task": self.task,
+            "phase": self.phase,
+            "cycle": self.cycle,
+            "done": self.done,
+            "total": self.total,
+            "percent": round(self.percent, 2),
+            "bytes_done": self.bytes_done,
+            "active_seconds": round(self.active_seconds, 3),
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "last_completed_at": (
+                self.last_completed_at.isoformat() if self.last_completed_at else None
+            ),
+        }
+
+
+@dataclass
+class ScrubResult:
+    """Result of integrity scrub operation."""
+
+    total_blocks: int
+    verified_ok: int
+    corrupted: List[str]
+    missing: List[str]
+    duration_seconds: float
+    bytes_verified: int = 0
+    pass_complete: bool = False
+    progress: Optional[MaintenanceProgress] = None
+
+
+@dataclass
+class GCResult:
+    """Result of garbage collection."""
+
+    orphan_blocks: int
+    bytes_reclaimed: int
+    duration_seconds: float
+    complete: bool = True    # A full mark-and-sweep cycle finished in this run
+    leaked_blocks: int = 0    # In no manifest but ref_count > 0 (kept)
+    progress: Optional[MaintenanceProgress] = None
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+# =============================================================================
+# Persistent State
+# =============================================================================
+class MaintenanceState:
+    """Cursors, counters and the GC mark set, persisted in SQLite."""
+
+    DB_FILE = "maintenance.db"
+
+    def __init__(self, root: Path) -> None:
+        self.path = Path(root) / self.DB_FILE
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS gc_mark (digest TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+
+    def load(self, key: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def save(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                (key, json.dumps(value)),
+            )
+
+    def mark(self, digests: Iterable[str]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO gc_mark (digest) VALUES (?)",
+                ((d,) for d in digests),
+            )
+            self._conn.execute("COMMIT")
+
+    def marked(self, digests: Sequence[str]) -> Set[str]:
+        """Return the subset of ``digests`` in the mark set."""
+        found: Set[str] = set()
+        with self._lock:
+            for i in range(0, len(digests), _SQLITE_MAX_PARAMS):
+                chunk = digests[i:i + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    r[0]
+                    for r in self._conn.execute(
+                        f"SELECT digest FROM gc_mark WHERE digest IN ({placeholders})",
+                        chunk,
+                    )
+                )
+        return found
+
+    def clear_marks(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM gc_mark")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class BandwidthThrottle:
+    """Thread-safe token bucket limiting throughput to ``rate_mbps`` (0=unlimited)."""
+
+    def __init__(self, rate_mbps: float, burst_seconds: float = 1.0) -> None:
+        self.rate = rate_mbps * 1024 * 1024
+        self.capacity = max(self.rate * burst_seconds, 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, nbytes: int) -> None:
+        """Reserve ``nbytes`` of budget, sleeping if the bucket is overdrawn."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= nbytes
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _Budget:
+    """Item/time limits for one maintenance run."""
+
+    def __init__(self, max_items: Optional[int], max_seconds: Optional[float]) -> None:
+        self.remaining = max_items
+        self.deadline = time.monotonic() + max_seconds if max_seconds is not None else None
+
+    def allowance(self, want: int) -> int:
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return 0
+        if self.remaining is None:
+            return want
+        return max(0, min(want, self.remaining))
+
+    def spend(self, items: int) -> None:
+        if self.remaining is not None:
+            self.remaining -= items
+
+
+# =============================================================================
+# Scrub
+# =============================================================================
+class IncrementalScrubber:
+    """Resumable, rate-limited, parallel block verification."""
+
+    STATE_KEY = "scrub"
+
+    def __init__(
+        self,
+        store: "BlockStore",
+        state: MaintenanceState,
+        workers: int = 2,
+        rate_limit_mbps: float = 0.0,
+        batch_size: int = 256,
+    ) -> None:
+        self.store = store
+        self.state = state
+        self.workers = max(1, workers)
+        self.throttle = BandwidthThrottle(rate_limit_mbps)
+        self.batch_size = batch_size
+
+    def _check(self, record: "BlockRecord") -> str:
+        self.throttle.acquire(record.compressed_size)
+        if not self.store.block_exists(record.digest):
+            return "missing"
+        return "ok" if self.store.verify(record.digest) else "corrupted"
+
+    def progress(self) -> MaintenanceProgress:
+        st = self.state.load(self.STATE_KEY)
+        return MaintenanceProgress(
+            task="scrub",
+            phase="scrubbing",
+            cycle=st.get("pass", 0),
+            done=st.get("done", 0),
+            total=len(self.store.index),
+            bytes_done=st.get("bytes_done", 0),
+            active_seconds=st.get("active_seconds", 0.0),
+            started_at=_parse_time(st.get("started_at")),
+            last_completed_at=_parse_time(st.get("last_completed_at")),
+        )
+
+    def run(
+        self, max_blocks: Optional[int] = None, max_seconds: Optional[float] = None
+    ) -> ScrubResult:
+        """Verify blocks from the cursor until the pass ends or a limit is hit."""
+        start = time.time()
+        budget = _Budget(max_blocks, max_seconds)
+        st = self.state.load(self.STATE_KEY)
+        st.setdefault("pass", 0)
+        st.setdefault("cursor", "")
+        st.setdefault("started_at", _now().isoformat())
+        verified = checked = bytes_verified = 0
+        corrupted: List[str] = []
+        missing: List[str] = []
+        pass_complete = False
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="dedup-scrub"
+        ) as pool:
+            while True:
+                limit = budget.allowance(self.batch_size)
+                if limit <= 0:
+                    break
+                batch = self.store.index.scan(st["cursor"], limit)
+                if not batch:
+                    pass_complete = True
+                    break
+                batch_start = time.monotonic()
+                bad = len(corrupted) + len(missing)
+                for record, status in zip(batch, pool.map(self._check, batch)):
+                    if status == "ok":
+                        verified += 1
+                    elif status == "missing":
+                        missing.append(record.digest)
+                    else:
+                        corrupted.append(record.digest)
+                batch_bytes = sum(r.compressed_size for r in batch)
+                checked += len(batch)
+                bytes_verified += batch_bytes
+                budget.spend(len(batch))
+
+                st["cursor"] = batch[-1].digest
+                st["done"] = st.get("done", 0) + len(batch)
+                st["bytes_done"] = st.get("bytes_done", 0) + batch_bytes
+                st["active_seconds"] = st.get("active_seconds", 0.0) + (
+                    time.monotonic() - batch_start
+                )
+                st["failed"] = st.get("failed", 0) + len(corrupted) + len(missing) - bad
+                self.state.save(self.STATE_KEY, st)
+
+        if pass_complete:
+            logger.info(
+                f"Scrub pass {st['pass']} complete: {st.get('done', 0)} blocks in "
+                f"{st.get('active_seconds', 0.0):.1f}s"
+            )
+            st = {
+                "pass": st["pass"] + 1,
+                "cursor": "",
+                "last_completed_at": _now().isoformat(),
+                "last_pass_seconds": st.get("active_seconds", 0.0),
+            }
+            self.state.save(self.STATE_KEY, st)
+
+        result = ScrubResult(
+            total_blocks=checked,
+            verified_ok=verified,
+            corrupted=corrupted,
+            missing=missing,
+            duration_seconds=time.time() - start,
+            bytes_verified=bytes_verified,
+            pass_complete=pass_complete,
+            progress=self.progress(),
+        )
+        logger.info(
+            f"Scrub: {verified}/{checked} OK, {len(corrupted)} corrupted, "
+            f"{len(missing)} missing"
+        )
+        return result
+
+
+# =============================================================================
+# Garbage Collection
+# =============================================================================
+class IncrementalGarbageCollector:
+    """Mark-and-sweep GC that can be split across many short runs.
+
+    Mark: digests of every manifest are added to the on-disk mark set.
+    Sweep: blocks are walked by cursor; a block is deleted only if it is
+    unmarked, has ``ref_count <= 0`` and is older than the grace period.
+    Requiring both conditions keeps blocks that new backups start to
+    reference while a cycle is in progress.
+    """
+
+    STATE_KEY = "gc"
+
+    def __init__(
+        self,
+        store: "BlockStore",
+        manifests: Mapping[str, "BackupManifest"],
+        state: MaintenanceState,
+        grace_period_hours: float = 24,
+        batch_size: int = 1024,
+    ) -> None:
+        self.store = store
+        self.manifests = manifests
+        self.state = state
+        self.grace_period = timedelta(hours=grace_period_hours)
+        self.batch_size = batch_size
+
+    def progress(self) -> MaintenanceProgress:
+        st = self.state.load(self.STATE_KEY)
+        phase = st.get("phase", "idle")
+        total = len(self.manifests) if phase == "mark" else len(self.store.index)
+        return MaintenanceProgress(
+            task="gc",
+            phase=phase,
+            cycle=st.get("cycle", 0),
+            done=st.get("done", 0),
+            total=total,
+            active_seconds=st.get("active_seconds", 0.0),
+            started_at=_parse_time(st.get("started_at")),
+            last_completed_at=_parse_time(st.get("last_completed_at")),
+        )
+
+    def _start_cycle(self, st: Dict[str, Any]) -> Dict[str, Any]:
+        self.state.clear_marks()
+        return {
+            "phase": "mark",
+            "cycle": st.get("cycle", 0),
+            "started_at": _now().isoformat(),
+            "last_completed_at": st.get("last_completed_at"),
+            "cursor": "",
+            "done": 0,
+            "active_seconds": 0.0,
+        }
+
+    def _mark(self, st: Dict[str, Any], budget: _Budget) -> bool:
+        """Mark manifests after the cursor; True when marking is finished."""
+        pending = sorted(mid for mid in list(self.manifests) if mid > st["cursor"])
+        for mid in pending:
+            if budget.allowance(1) <= 0:
+                return False
+            step_start = time.monotonic()
+            manifest = self.manifests.get(mid)
+            if manifest is not None:
+                self.state.mark(manifest.blocks)
+            budget.spend(1)
+            st["cursor"] = mid
+            st["done"] += 1
+            st["active_seconds"] += time.monotonic() - step_start
+            self.state.save(self.STATE_KEY, st)
+        return True
+
+    def _sweep(self, st: Dict[str, Any], budget: _Budget, totals: Dict[str, int]) -> bool:
+        """Sweep blocks after the cursor; True when the sweep is finished."""
+        cutoff = _now() - self.grace_period
+        while True:
+            limit = budget.allowance(self.batch_size)
+            if limit <= 0:
+                return False
+            batch = self.store.index.scan(st["cursor"], limit)
+            if not batch:
+                return True
+            step_start = time.monotonic()
+            marked = self.state.marked([r.digest for r in batch])
+            for record in batch:
+                if record.digest in marked:
+                    continue
+                if record.ref_count > 0:
+                    totals["leaked"] += 1
+                    continue
+                if record.stored_at > cutoff:
+                    continue
+                freed = self.store.delete_block(record.digest)
+                if freed:
+                    totals["orphans"] += 1
+                    totals["reclaimed"] += freed
+            budget.spend(len(batch))
+            st["cursor"] = batch[-1].digest
+            st["done"] += len(batch)
+            st["active_seconds"] += time.monotonic() - step_start
+            self.state.save(self.STATE_KEY, st)
+
+    def run(
+        self, max_items: Optional[int] = None, max_seconds: Optional[float] = None
+    ) -> GCResult:
+        """Advance the current cycle (starting one if idle) within the limits.
+
+        ``max_items`` counts manifests marked plus blocks swept.
+        """
+        start = time.time()
+        budget = _Budget(max_items, max_seconds)
+        st = self.state.load(self.STATE_KEY)
+        if st.get("phase", "idle") == "idle":
+            st = self._start_cycle(st)
+            self.state.save(self.STATE_KEY, st)
+
+        totals = {"orphans": 0, "reclaimed": 0, "leaked": 0}
+        complete = False
+        if st["phase"] == "mark" and self._mark(st, budget):
+            st.update(phase="sweep", cursor="", done=0, active_seconds=0.0)
+            self.state.save(self.STATE_KEY, st)
+        if st["phase"] == "sweep" and self._sweep(st, budget, totals):
+            complete = True
+            st = {
+                "phase": "idle",
+                "cycle": st["cycle"] + 1,
+                "last_completed_at": _now().isoformat(),
+            }
+            self.state.save(self.STATE_KEY, st)
+            self.state.clear_marks()
+
+        if totals["leaked"]:
+            logger.warning(
+                f"GC: {totals['leaked']} blocks are in no manifest but have references"
+            )
+        logger.info(
+            f"GC: removed {totals['orphans']} orphans, reclaimed "
+            f"{totals['reclaimed']} bytes ({'cycle complete' if complete else st['phase']})"
+        )
+        return GCResult(
+            orphan_blocks=totals["orphans"],
+            bytes_reclaimed=totals["reclaimed"],
+            duration_seconds=time.time() - start,
+            complete=complete,
+            leaked_blocks=totals["leaked"],
+            progress=self.progress(),
+        )
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+class MaintenanceScheduler:
+    """Runs scrub and GC in short slices on a low-priority background thread.
+
+    A new scrub pass starts ``scrub_interval_hours`` after the previous one
+    finished; a new GC cycle ``gc_interval_hours`` after the last. Passes
+    and cycles already in progress always continue.
+    """
+
+    def __init__(
+        self,
+        scrubber: IncrementalScrubber,
+        collector: IncrementalGarbageCollector,
+        scrub_interval_hours: float = 168,
+        gc_interval_hours: float = 24,
+    ) -> None:
+        self.scrubber = scrubber
+        self.collector = collector
+        self.scrub_interval = timedelta(hours=scrub_interval_hours)
+        self.gc_interval = timedelta(hours=gc_interval_hours)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_scrub: Optional[ScrubResult] = None
+        self.last_gc: Optional[GCResult] = None
+
+    @staticmethod
+    def _due(progress: MaintenanceProgress, interval: timedelta, in_progress: bool) -> bool:
+        if in_progress or progress.last_completed_at is None:
+            return True
+        return _now() - progress.last_completed_at >= interval
+
+    def run_slice(self, slice_seconds: float = 30.0) -> None:
+        """Spend up to ``slice_seconds`` on each task that is due."""
+        scrub = self.scrubber.progress()
+        if self._due(scrub, self.scrub_interval, scrub.done > 0):
+            self.last_scrub = self.scrubber.run(max_seconds=slice_seconds)
+        gc = self.collector.progress()
+        if self._due(gc, self.gc_interval, gc.phase != "idle"):
+            self.last_gc = self.collector.run(max_seconds=slice_seconds)
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "scrub": self.scrubber.progress().to_dict(),
+            "gc": self.collector.progress().to_dict(),
+            "running": self.running,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _loop(self, slice_seconds: float, pause_seconds: float) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_slice(slice_seconds)
+            except Exception as e:
+                logger.error(f"Maintenance slice failed: {e}")
+            self._stop.wait(pause_seconds)
+
+    def start(self, slice_seconds: float = 30.0, pause_seconds: float = 30.0) -> None:
+        """Start background maintenance (no-op if already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop,
+            args=(slice_seconds, pause_seconds),
+            name="dedup-maintenance",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
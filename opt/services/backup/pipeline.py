@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Parallel ingest pipeline for the deduplicating backup service.
+
+Stages:
+- Chunker: the calling thread pulls chunks from the chunking engine
+- Hash + dedup lookup and compress + encrypt: a worker pool (hashlib,
+  zlib/zstd/lz4 and AES-GCM release the GIL, so this scales with cores)
+- Ordered writer: one thread writes new blocks, updates the index and
+  records digests in source order for the manifest
+
+A bounded queue between the chunker and the writer provides backpressure:
+at most ``max_inflight`` chunks are buffered at any time, so memory stays
+bounded by roughly ``max_inflight x max_size``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+if TYPE_CHECKING:
+    from opt.services.backup.dedup_backup_service import BlockStore
+
+logger = logging.getLogger(__name__)
+
+_SENTINEL = None
+
+
+@dataclass
+class EncodedChunk:
+    """Worker output for one source chunk."""
+
+    digest: str
+    size: int
+    payload: Optional[bytes] = None    # None when the block is a duplicate
+    algo: str = "none"
+    encrypted: bool = False
+
+
+@dataclass
+class IngestResult:
+    """Digests (in source order) produced by one pipeline run."""
+
+    blocks: List[str] = field(default_factory=list)
+    block_sizes: List[int] = field(default_factory=list)
+    total_size: int = 0
+    new_blocks: int = 0
+    duplicate_blocks: int = 0
+
+
+class ParallelIngestPipeline:
+    """Bounded producer/consumer pipeline feeding a ``BlockStore``."""
+
+    def __init__(
+        self, store: "BlockStore", workers: int, max_inflight: int = 0
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.store = store
+        self.workers = workers
+        self.max_inflight = max_inflight or workers * 4
+        self._claim_lock = threading.Lock()
+        self._claimed: Set[str] = set()
+
+    # -------------------------------------------------------------------------
+    # Worker stage
+    # -------------------------------------------------------------------------
+    def _encode(self, chunk: bytes) -> EncodedChunk:
+        """Hash, dedup-check and encode one chunk (runs in the pool)."""
+        digest = hashlib.sha256(chunk).hexdigest()
+        with self._claim_lock:
+            duplicate = digest in self._claimed or digest in self.store.index
+            if not duplicate:
+                # First sighting in this run: this worker owns the encode
+                self._claimed.add(digest)
+        if duplicate:
+            return EncodedChunk(digest=digest, size=len(chunk))
+        payload, algo, encrypted = self.store.encode(chunk)
+        return EncodedChunk(
+            digest=digest, size=len(chunk), payload=payload, algo=algo, encrypted=encrypted
+        )
+
+    # -------------------------------------------------------------------------
+    # Writer stage
+    # -------------------------------------------------------------------------
+    def _writer(
+        self,
+        pending: "queue.Queue[Optional[Future[EncodedChunk]]]",
+        result: IngestResult,
+        errors: List[BaseException],
+    ) -> None:
+        # Duplicates seen before their owning chunk was committed
+        early_refs: Dict[str, int] = {}
+        while True:
+            future = pending.get()
+            if future is _SENTINEL:
+                break
+            if errors:
+                future.cancel()
+                continue
+            try:
+                encoded = future.result()
+                if encoded.payload is not None:
+                    self.store.write_block(encoded.digest, encoded.payload)
+                    refs = 1 + early_refs.pop(encoded.digest, 0)
+                    self.store.commit_block(
+                        encoded.digest,
+                        encoded.size,
+                        len(encoded.payload),
+                        encoded.algo,
+                        encoded.encrypted,
+                        refs=refs,
+                    )
+                    result.new_blocks += 1
+                else:
+                    if self.store.add_ref(encoded.digest) is None:
+                        early_refs[encoded.digest] = early_refs.get(encoded.digest, 0) + 1
+                    result.duplicate_blocks += 1
+                result.blocks.append(encoded.digest)
+                result.block_sizes.append(encoded.size)
+                result.total_size += encoded.size
+            except BaseException as e:    # Surface in the producer thread
+                errors.append(e)
+        if early_refs and not errors:
+            errors.append(RuntimeError(f"{len(early_refs)} duplicate blocks lost their owner"))
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+    def run(self, chunks: Iterable[bytes]) -> IngestResult:
+        """Ingest ``chunks`` and return their digests in source order."""
+        result = IngestResult()
+        errors: List[BaseException] = []
+        pending: "queue.Queue[Optional[Future[EncodedChunk]]]" = queue.Queue(
+            maxsize=self.max_inflight
+        )
+        self._claimed.clear()
+
+        writer = threading.Thread(
+            target=self._writer,
+            args=(pending, result, errors),
+            name="dedup-ingest-writer",
+            daemon=True,
+        )
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="dedup-ingest"
+        ) as pool, self.store.batch():
+            writer.start()
+            try:
+                for chunk in chunks:
+                    if errors:
+                        break
+                    # Blocks when max_inflight chunks are queued (backpressure)
+                    pending.put(pool.submit(self._encode, chunk))
+            finally:
+                pending.put(_SENTINEL)
+                writer.join()
+
+        self._claimed.clear()
+        if errors:
+            raise errors[0]
+        logger.debug(
+            f"Ingested {len(result.blocks)} chunks with {self.workers} workers "
+            f"({result.new_blocks} new, {result.duplicate_blocks} duplicate)"
+        )
+        return result
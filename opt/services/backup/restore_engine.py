@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Parallel, read-ahead restore engine for the deduplicating block store.
+
+Features:
+- Prefetches the next N manifest blocks on a thread pool; read, decrypt
+  and decompress run in parallel while blocks are emitted in order
+- Zero chunks are recognised the first time their digest is read; later
+  references to the same digest are never read from the store again
+- Regular files are restored sparsely: zero extents are skipped and the
+  file is sized with ``ftruncate``, leaving holes instead of written zeros
+- Consecutive data blocks are coalesced into large ``os.pwritev`` calls
+- ``RestoreResult`` reports duration and throughput for RTO tracking
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from opt.services.backup.dedup_backup_service import BlockStore
+
+logger = logging.getLogger(__name__)
+
+_IOV_MAX = 512    # Conservative below the Linux IOV_MAX of 1024
+
+
+@dataclass
+class RestoreResult:
+    """Outcome and timing of a restore."""
+
+    manifest_id: str
+    output_path: str
+    bytes_written: int    # Logical bytes restored (including sparse extents)
+    blocks: int
+    sparse_bytes: int
+    duration_seconds: float
+    completed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def throughput_mbps(self) -> float:
+        """Restore throughput in MB/s (logical bytes)."""
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.bytes_written / (1024 * 1024) / self.duration_seconds
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "manifest_id": self.manifest_id,
+            "output_path": self.output_path,
+            "bytes_written": self.bytes_written,
+            "blocks": self.blocks,
+            "sparse_bytes": self.sparse_bytes,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "throughput_mbps": round(self.throughput_mbps, 2),
+            "completed_at": self.completed_at.isoformat(),
+        }
+
+
+class ParallelRestoreEngine:
+    """Ordered, prefetching block reader and sparse file writer."""
+
+    def __init__(
+        self,
+        store: "BlockStore",
+        workers: int = 4,
+        prefetch: int = 16,
+        write_buffer: int = 8 * 1024 * 1024,
+        sparse: bool = True,
+    ) -> None:
+        self.store = store
+        self.workers = max(1, workers)
+        self.prefetch = max(1, prefetch)
+        self.write_buffer = write_buffer
+        self.sparse = sparse
+        self.zero_digests: Set[str] = set()
+
+    def _fetch(self, digest: str) -> Tuple[int, Optional[bytes]]:
+        """Read one block as (size, data); data is None if it is all zeros."""
+        data = self.store.get(digest)
+        if data.count(0) == len(data):
+            self.zero_digests.add(digest)
+            return len(data), None
+        return len(data), data
+
+    def iter_blocks(
+        self, digests: Sequence[str], sizes: Optional[Sequence[int]] = None
+    ) -> Iterator[bytes]:
+        """Yield block contents in manifest order with read-ahead."""
+        for size, data in self._iter_blocks(digests, sizes):
+            yield bytes(size) if data is None else data
+
+    def _iter_blocks(
+        self, digests: Sequence[str], sizes: Optional[Sequence[int]]
+    ) -> Iterator[Tuple[int, Optional[bytes]]]:
+        """Yield (size, data) in order; data is None for all-zero blocks."""
+        window: Deque[Union["Future[Tuple[int, Optional[bytes]]]", int]] = deque()
+        position = 0
+        total = len(digests)
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="dedup-restore"
+        ) as pool:
+            try:
+                while position < total or window:
+                    while position < total and len(window) < self.prefetch:
+                        digest = digests[position]
+                        if sizes is not None and digest in self.zero_digests:
+                            window.append(sizes[position])
+                        else:
+                            window.append(pool.submit(self._fetch, digest))
+                        position += 1
+                    head = window.popleft()
+                    if isinstance(head, int):
+                        yield head, None
+                    else:
+                        yield head.result()
+            finally:
+                for pending in window:
+                    if not isinstance(pending, int):
+                        pending.cancel()
+
+    def restore_to_file(
+        self,
+        manifest_id: str,
+        digests: Sequence[str],
+        sizes: Sequence[int],
+        output_path: str,
+    ) -> RestoreResult:
+        """Restore blocks to ``output_path`` and time it."""
+        start = time.perf_counter()
+        sparse = self.sparse and self._is_regular_target(output_path)
+        offset = 0
+        sparse_bytes = 0
+        pending: List[bytes] = []
+        pending_bytes = 0
+        pending_offset = 0
+
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            for size, data in self._iter_blocks(digests, sizes):
+                if data is None and not sparse:
+                    data = bytes(size)
+                if data is None:
+                    # Zero extent: flush what we have and leave a hole
+                    self._write(fd, pending, pending_offset)
+                    pending, pending_bytes = [], 0
+                    sparse_bytes += size
+                    offset += size
+                    pending_offset = offset
+                    continue
+                pending.append(data)
+                pending_bytes += len(data)
+                offset += len(data)
+                if pending_bytes >= self.write_buffer or len(pending) >= _IOV_MAX:
+                    self._write(fd, pending, pending_offset)
+                    pending, pending_bytes = [], 0
+                    pending_offset = offset
+            self._write(fd, pending, pending_offset)
+            if sparse:
+                os.ftruncate(fd, offset)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        result = RestoreResult(
+            manifest_id=manifest_id,
+            output_path=output_path,
+            bytes_written=offset,
+            blocks=len(digests),
+            sparse_bytes=sparse_bytes,
+            duration_seconds=time.perf_counter() - start,
+        )
+        logger.info(
+            f"Restored {manifest_id[:8]}... to {output_path} ({offset} bytes, "
+            f"{sparse_bytes} sparse) at {result.throughput_mbps:.1f} MB/s"
+        )
+        return result
+
+    @staticmethod
+    def _is_regular_target(path: str) -> bool:
+        try:
+            return stat.S_ISREG(os.stat(path).st_mode)
+        except FileNotFoundError:
+            return True
+
+    @staticmethod
+    def _write(fd: int, buffers: List[bytes], offset: int) -> None:
+        """Positional vectored write, retrying short writes."""
+        while buffers:
+            if hasattr(os, "pwritev"):
+                written = os.pwritev(fd, buffers, offset)
+            else:
+                written = os.pwrite(fd, buffers[0], offset)
+            offset += written
+            # Drop fully written buffers, keep the tail of a partial one
+            while buffers and written >= len(buffers[0]):
+                written -= len(buffers[0])
+                buffers = buffers[1:]
+            if buffers and written:
+                buffers = [buffers[0][written:]] + buffers[1:]
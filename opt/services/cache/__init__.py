@@ -98,6 +98,26 @@
 # !/usr/bin/env python3
 
 
-from .core import CacheManager, cache  # type: ignore[attr-defined]
-
-__all__=["CacheManager", "cache"]
+from .core import CacheManager, cache
+from .l1_engine import EvictionPolicy, L1Engine
+from .tiered import (
+    CachedCallMetrics,
+    CacheMetrics,
+    CacheStrategy,
+    HybridCache,
+    L1Cache,
+    cached,
+)
+
+__all__=[
+    "CacheManager",
+    "cache",
+    "CachedCallMetrics",
+    "CacheMetrics",
+    "CacheStrategy",
+    "EvictionPolicy",
+    "HybridCache",
+    "L1Cache",
+    "L1Engine",
+    "cached",
+]
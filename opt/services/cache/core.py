@@ -263,4 +263,4 @@ class CacheManager:
 
 
 # Global instance
-_cache=CacheManager()
+cache=CacheManager()
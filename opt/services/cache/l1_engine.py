@@ -0,0 +1,674 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""In-memory L1 cache engine.
+
+Features:
+- O(1) LRU eviction (``OrderedDict``) or W-TinyLFU admission/eviction
+  (window LRU + segmented main LRU guarded by a count-min frequency sketch)
+- Entry-count limit plus an optional byte budget
+- Lock striping: keys hash to independent shards, each with its own lock,
+  so concurrent threads rarely contend; nothing is awaited while locked
+- Secondary indexes (tag -> keys, ``:``-segment prefix trie) so tag and
+  glob invalidation cost O(matching keys)
+- Sliding-window latency percentiles (p50/p95/p99) for lookups
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from fnmatch import fnmatchcase
+import time
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+_MISSING = object()
+
+
+class EvictionPolicy(Enum):
+    """L1 eviction policy."""
+
+    LRU = "lru"
+    W_TINYLFU = "w_tinylfu"
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate payload size in bytes (JSON size for structured values)."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value)
+    if value is None or isinstance(value, (bool, int, float)):
+        return 8
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+# =============================================================================
+# Latency Tracking
+# =============================================================================
+class LatencyTracker:
+    """Percentiles over the most recent ``window`` samples."""
+
+    def __init__(self, window: int = 4096) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._count = 0
+        self._total = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        # deque.append is atomic, so no lock is needed on the hot path
+        self._samples.append(latency_ms)
+        self._count += 1
+        self._total += latency_ms
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count else 0.0
+
+    def percentiles(self, *quantiles: float) -> List[float]:
+        """Nearest-rank percentiles (0-100) of the current window."""
+        samples = sorted(self._samples)
+        if not samples:
+            return [0.0 for _ in quantiles]
+        last = len(samples) - 1
+        return [samples[min(last, int(round(q / 100 * last)))] for q in quantiles]
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._count = 0
+        self._total = 0.0
+
+    @classmethod
+    def merged(cls, *trackers: "LatencyTracker") -> "LatencyTracker":
+        """A tracker over the samples, counts and totals of ``trackers``."""
+        merged = cls(max(1, sum(t._samples.maxlen or 0 for t in trackers)))
+        for tracker in trackers:
+            merged._samples.extend(tracker._samples)
+            merged._count += tracker._count
+            merged._total += tracker._total
+        return merged
+
+
+# =============================================================================
+# Prefix Index
+# =============================================================================
+_GLOB_CHARS = "*?["
+
+
+class _TrieNode:
+    __slots__ = ("children", "key")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.key: Optional[str] = None
+
+
+class PrefixTrie:
+    """Keys indexed by their ``:``-separated segments.
+
+    ``match("node:*")`` walks to the ``node`` node and only visits keys
+    below it, so glob invalidation costs O(matching keys) rather than a
+    scan of the whole cache. Patterns starting with a wildcard still
+    visit every key.
+    """
+
+    SEPARATOR = ":"
+
+    def __init__(self) -> None:
+        self.root = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: str) -> None:
+        node = self.root
+        for segment in key.split(self.SEPARATOR):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _TrieNode()
+            node = child
+        if node.key is None:
+            self._size += 1
+        node.key = key
+
+    def remove(self, key: str) -> bool:
+        path = [self.root]
+        segments = key.split(self.SEPARATOR)
+        for segment in segments:
+            child = path[-1].children.get(segment)
+            if child is None:
+                return False
+            path.append(child)
+        if path[-1].key is None:
+            return False
+        path[-1].key = None
+        self._size -= 1
+        # Prune now-empty nodes bottom-up
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.key is not None or node.children:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+        return True
+
+    @staticmethod
+    def _collect(node: _TrieNode, out: List[str]) -> None:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.key is not None:
+                out.append(current.key)
+            stack.extend(current.children.values())
+
+    def match(self, pattern: str) -> List[str]:
+        """Keys matching the glob ``pattern`` (``fnmatchcase`` semantics)."""
+        cut = min((i for i in (pattern.find(c) for c in _GLOB_CHARS) if i >= 0), default=-1)
+        if cut < 0:
+            node = self.root
+            for segment in pattern.split(self.SEPARATOR):
+                node = node.children.get(segment)    # type: ignore[assignment]
+                if node is None:
+                    return []
+            return [node.key] if node.key is not None else []
+
+        *full, partial = pattern[:cut].split(self.SEPARATOR)
+        node = self.root
+        for segment in full:
+            node = node.children.get(segment)    # type: ignore[assignment]
+            if node is None:
+                return []
+        candidates: List[str] = []
+        for segment, child in node.children.items():
+            if segment.startswith(partial):
+                self._collect(child, candidates)
+        return [key for key in candidates if fnmatchcase(key, pattern)]
+
+
+# =============================================================================
+# Entries and Shards
+# =============================================================================
+@dataclass
+class L1Entry:
+    """Stored value with expiry and accounting metadata."""
+
+    key: str
+    value: Any
+    expires_at: float    # time.monotonic() deadline, 0 = never
+    size: int = 0
+    tags: Set[str] = field(default_factory=set)
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires_at != 0 and now >= self.expires_at
+
+
+@dataclass
+class ShardStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejections: int = 0    # W-TinyLFU candidates refused admission
+
+
+class _Shard(ABC):
+    """One lock-protected partition of the key space.
+
+    Besides the policy's own structures each shard keeps two secondary
+    indexes for invalidation: tag -> keys and a ``:``-segment prefix trie.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.bytes = 0
+        self.stats = ShardStats()
+        self.tags: Dict[str, Set[str]] = {}
+        self.trie = PrefixTrie()
+
+    # Subclasses implement the policy; all methods run with ``lock`` held
+    @abstractmethod
+    def _lookup(self, key: str) -> Optional[L1Entry]:
+        """Return the entry for ``key`` and record the access."""
+
+    @abstractmethod
+    def _pop(self, key: str) -> Optional[L1Entry]:
+        """Remove ``key`` from the policy structures (indexes untouched)."""
+
+    @abstractmethod
+    def _insert(self, entry: L1Entry) -> List[L1Entry]:
+        """Add ``entry``; return evicted entries (possibly ``entry`` itself)."""
+
+    @abstractmethod
+    def _clear(self) -> None:
+        """Drop every entry from the policy structures."""
+
+    @abstractmethod
+    def entries(self) -> Iterator[L1Entry]:
+        """Iterate over the stored entries."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored entries."""
+
+    # -- secondary indexes ----------------------------------------------------
+    def _index(self, entry: L1Entry) -> None:
+        self.trie.add(entry.key)
+        for tag in entry.tags:
+            self.tags.setdefault(tag, set()).add(entry.key)
+
+    def _unindex(self, entry: L1Entry) -> None:
+        self.trie.remove(entry.key)
+        for tag in entry.tags:
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(entry.key)
+                if not keys:
+                    del self.tags[tag]
+
+    def _discard(self, key: str) -> Optional[L1Entry]:
+        entry = self._pop(key)
+        if entry is not None:
+            self._unindex(entry)
+        return entry
+
+    # -- public, locking ------------------------------------------------------
+    def get(self, key: str, now: float) -> Any:
+        with self.lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.stats.misses += 1
+                return _MISSING
+            if entry.is_expired(now):
+                self._discard(key)
+                self.stats.misses += 1
+                self.stats.expirations += 1
+                return _MISSING
+            self.stats.hits += 1
+            return entry.value
+
+    def set(self, entry: L1Entry) -> List[L1Entry]:
+        """Insert ``entry``; return the entries evicted to make room."""
+        with self.lock:
+            self._discard(entry.key)
+            self._index(entry)
+            evicted = self._insert(entry)
+            for victim in evicted:
+                self._unindex(victim)
+            return evicted
+
+    def delete(self, key: str) -> Optional[L1Entry]:
+        with self.lock:
+            return self._discard(key)
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        with self.lock:
+            return sum(self._discard(key) is not None for key in keys)
+
+    def keys_for_tags(self, tags: Iterable[str]) -> Set[str]:
+        with self.lock:
+            found: Set[str] = set()
+            for tag in tags:
+                found.update(self.tags.get(tag, ()))
+            return found
+
+    def match(self, pattern: str) -> List[str]:
+        with self.lock:
+            return self.trie.match(pattern)
+
+    def clear(self) -> None:
+        with self.lock:
+            self._clear()
+            self.bytes = 0
+            self.tags.clear()
+            self.trie = PrefixTrie()
+
+
+class _LRUShard(_Shard):
+    """Exact LRU over an ``OrderedDict`` (oldest first)."""
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        super().__init__(max_entries, max_bytes)
+        self.data: "OrderedDict[str, L1Entry]" = OrderedDict()
+
+    def _lookup(self, key: str) -> Optional[L1Entry]:
+        entry = self.data.get(key)
+        if entry is not None:
+            self.data.move_to_end(key)
+        return entry
+
+    def _pop(self, key: str) -> Optional[L1Entry]:
+        entry = self.data.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+        return entry
+
+    def _insert(self, entry: L1Entry) -> List[L1Entry]:
+        self.data[entry.key] = entry
+        self.bytes += entry.size
+        evicted = []
+        while len(self.data) > self.max_entries or (
+            self.max_bytes and self.bytes > self.max_bytes and len(self.data) > 1
+        ):
+            _, victim = self.data.popitem(last=False)
+            self.bytes -= victim.size
+            evicted.append(victim)
+        self.stats.evictions += len(evicted)
+        return evicted
+
+    def entries(self) -> Iterator[L1Entry]:
+        return iter(list(self.data.values()))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def _clear(self) -> None:
+        self.data.clear()
+
+
+class _FrequencySketch:
+    """Count-min sketch with 4-bit saturating counters and periodic aging."""
+
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+
+    def __init__(self, capacity: int) -> None:
+        width = 1
+        while width < max(16, capacity):
+            width <<= 1
+        self.mask = width - 1
+        self.table = [array("B", bytes(width)) for _ in self._SEEDS]
+        self.sample_size = 10 * max(16, capacity)
+        self.additions = 0
+
+    def _indexes(self, key_hash: int) -> Iterator[Tuple[array, int]]:
+        for row, seed in zip(self.table, self._SEEDS):
+            yield row, ((key_hash * seed) >> 7) & self.mask
+
+    def increment(self, key_hash: int) -> None:
+        for row, i in self._indexes(key_hash):
+            if row[i] < 15:
+                row[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def frequency(self, key_hash: int) -> int:
+        return min(row[i] for row, i in self._indexes(key_hash))
+
+    def _age(self) -> None:
+        """Halve all counters so old popularity decays."""
+        for row in self.table:
+            for i, count in enumerate(row):
+                if count:
+                    row[i] = count >> 1
+        self.additions //= 2
+
+
+class _TinyLFUShard(_Shard):
+    """W-TinyLFU: 1% window LRU, main SLRU (20% probation / 80% protected).
+
+    Entries leaving the window only enter the main space if the sketch
+    estimates them more popular than the main space's eviction victim,
+    which keeps one-hit wonders from flushing frequently used entries.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        super().__init__(max_entries, max_bytes)
+        self.window_max = max(1, self.max_entries // 100)
+        self.main_max = max(1, self.max_entries - self.window_max)
+        self.protected_max = max(1, int(self.main_max * 0.8))
+        self.window: "OrderedDict[str, L1Entry]" = OrderedDict()
+        self.probation: "OrderedDict[str, L1Entry]" = OrderedDict()
+        self.protected: "OrderedDict[str, L1Entry]" = OrderedDict()
+        self.sketch = _FrequencySketch(self.max_entries)
+
+    def _lookup(self, key: str) -> Optional[L1Entry]:
+        self.sketch.increment(hash(key))
+        entry = self.window.get(key)
+        if entry is not None:
+            self.window.move_to_end(key)
+            return entry
+        entry = self.protected.get(key)
+        if entry is not None:
+            self.protected.move_to_end(key)
+            return entry
+        entry = self.probation.pop(key, None)
+        if entry is not None:
+            # Promote; demote the protected LRU back to probation if full
+            self.protected[key] = entry
+            if len(self.protected) > self.protected_max:
+                demoted_key, demoted = self.protected.popitem(last=False)
+                self.probation[demoted_key] = demoted
+        return entry
+
+    def _pop(self, key: str) -> Optional[L1Entry]:
+        for segment in (self.window, self.probation, self.protected):
+            entry = segment.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry.size
+                return entry
+        return None
+
+    def _main_victim(self) -> Optional["OrderedDict[str, L1Entry]"]:
+        if self.probation:
+            return self.probation
+        if self.protected:
+            return self.protected
+        return None
+
+    def _insert(self, entry: L1Entry) -> List[L1Entry]:
+        self.sketch.increment(hash(entry.key))
+        self.window[entry.key] = entry
+        self.bytes += entry.size
+        evicted: List[L1Entry] = []
+
+        while len(self.window) > self.window_max:
+            _, candidate = self.window.popitem(last=False)
+            if len(self.probation) + len(self.protected) < self.main_max:
+                self.probation[candidate.key] = candidate
+                continue
+            segment = self._main_victim()
+            victim_key = next(iter(segment))    # type: ignore[arg-type]
+            if self.sketch.frequency(hash(candidate.key)) > self.sketch.frequency(
+                hash(victim_key)
+            ):
+                victim = segment.pop(victim_key)    # type: ignore[union-attr]
+                self.probation[candidate.key] = candidate
+            else:
+                victim = candidate
+                self.stats.rejections += 1
+            self.bytes -= victim.size
+            evicted.append(victim)
+
+        while self.max_bytes and self.bytes > self.max_bytes and len(self) > 1:
+            segment = self._main_victim() or self.window
+            _, victim = segment.popitem(last=False)
+            self.bytes -= victim.size
+            evicted.append(victim)
+
+        self.stats.evictions += len(evicted)
+        return evicted
+
+    def entries(self) -> Iterator[L1Entry]:
+        return iter(
+            list(self.window.values())
+            + list(self.probation.values())
+            + list(self.protected.values())
+        )
+
+    def __len__(self) -> int:
+        return len(self.window) + len(self.probation) + len(self.protected)
+
+    def _clear(self) -> None:
+        self.window.clear()
+        self.probation.clear()
+        self.protected.clear()
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+def _split(total: int, parts: int, index: int) -> int:
+    """Share of ``total`` for part ``index`` (shares sum to ``total``)."""
+    return total // parts + (1 if index < total % parts else 0)
+
+
+class L1Engine:
+    """Sharded, bounded in-memory key/value store with TTLs.
+
+    ``max_entries`` and ``max_bytes`` are split evenly across shards, so
+    eviction order is LRU/TinyLFU within each shard (approximately global).
+    Small caches use a single shard for exact ordering.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 0,
+        policy: EvictionPolicy = EvictionPolicy.LRU,
+        shards: int = 16,
+        sizeof: Callable[[Any], int] = estimate_size,
+        latency_window: int = 4096,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.sizeof = sizeof
+        # Keep at least ~256 entries per shard so per-shard limits stay meaningful
+        count = max(1, min(shards, max_entries // 256))
+        shard_cls = _TinyLFUShard if policy == EvictionPolicy.W_TINYLFU else _LRUShard
+        self._shards: List[_Shard] = [
+            shard_cls(_split(max_entries, count, i), _split(max_bytes, count, i))
+            for i in range(count)
+        ]
+        self.latency = LatencyTracker(latency_window)
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        start = time.perf_counter()
+        value = self._shard(key).get(key, time.monotonic())
+        self.latency.record((time.perf_counter() - start) * 1000)
+        return default if value is _MISSING else value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: float = 0,
+        tags: Optional[Set[str]] = None,
+    ) -> List[L1Entry]:
+        """Store ``value``; returns entries evicted to make room."""
+        entry = L1Entry(
+            key=key,
+            value=value,
+            expires_at=time.monotonic() + ttl_seconds if ttl_seconds > 0 else 0,
+            size=self.sizeof(value) if self.max_bytes else 0,
+            tags=set(tags) if tags else set(),
+        )
+        return self._shard(key).set(entry)
+
+    def delete(self, key: str) -> Optional[L1Entry]:
+        return self._shard(key).delete(key)
+
+    def match(self, pattern: str) -> List[str]:
+        """Keys matching a glob pattern, via each shard's prefix trie."""
+        keys: List[str] = []
+        for shard in self._shards:
+            keys.extend(shard.match(pattern))
+        return keys
+
+    def keys_for_tags(self, tags: Iterable[str]) -> Set[str]:
+        tags = list(tags)
+        keys: Set[str] = set()
+        for shard in self._shards:
+            keys |= shard.keys_for_tags(tags)
+        return keys
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Delete keys matching ``pattern``; cost is O(matching keys)."""
+        return sum(shard.delete_many(shard.match(pattern)) for shard in self._shards)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Delete keys carrying any of ``tags``; cost is O(matching keys)."""
+        tags = list(tags)
+        return sum(
+            shard.delete_many(shard.keys_for_tags(tags)) for shard in self._shards
+        )
+
+    def entries(self) -> Iterator[L1Entry]:
+        """Snapshot of all entries (including not yet reaped expired ones)."""
+        for shard in self._shards:
+            with shard.lock:
+                snapshot = list(shard.entries())
+            yield from snapshot
+
+    def keys(self) -> List[str]:
+        return [entry.key for entry in self.entries()]
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    @property
+    def bytes_used(self) -> int:
+        return sum(shard.bytes for shard in self._shards)
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._shards)
+
+    def stats(self) -> Dict[str, Any]:
+        totals = ShardStats()
+        for shard in self._shards:
+            for name in vars(totals):
+                setattr(totals, name, getattr(totals, name) + getattr(shard.stats, name))
+        p50, p95, p99 = self.latency.percentiles(50, 95, 99)
+        return {
+            **vars(totals),
+            "entries": len(self),
+            "bytes": self.bytes_used,
+            "latency_avg_ms": self.latency.mean,
+            "latency_p50_ms": p50,
+            "latency_p95_ms": p95,
+            "latency_p99_ms": p99,
+        }
@@ -0,0 +1,819 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Cache Layer for DebVisor Services
+
+Provides Redis-backed caching with TTL, invalidation, and performance metrics.
+Supports query result caching, report caching, and real-time event deduplication.
+
+Features:
+- Multi-tier caching (L1: in-memory, L2: Redis)
+- O(1) LRU or W-TinyLFU L1 eviction with entry and byte budgets
+- Automatic TTL management and key versioning
+- Cache invalidation patterns (tag-based, pattern-based)
+- Stampede protection in @cached: single-flight, XFetch early expiration
+  and stale-while-revalidate
+- Performance metrics, hit rate and latency percentile tracking
+- Distributed cache coherency
+- Fallback mechanisms for cache failures
+
+Author: DebVisor Team
+Date: 2025-11-26
+"""
+
+import json
+from datetime import datetime, timezone
+
+import hashlib
+import asyncio
+import fnmatch
+import logging
+import math
+import random
+import re
+import time
+from typing import Any, Optional, Dict, Callable, List, Set, Tuple
+from dataclasses import dataclass, field, asdict
+from enum import Enum
+import functools
+from abc import ABC, abstractmethod
+from typing import TypeVar
+
+from opt.services.cache.l1_engine import EvictionPolicy, L1Engine, LatencyTracker
+
+try:
+    import aioredis  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        from redis import asyncio as aioredis  # type: ignore[no-redef]
+    except ImportError:
+        aioredis = None
+
+# Type variable for cached function returns
+CacheF=TypeVar("CacheF", bound=Callable[..., Any])
+
+
+logger=logging.getLogger(__name__)
+
+
+class CacheStrategy(Enum):
+    """Cache storage strategy"""
+
+    L1_ONLY="l1_only"    # In-memory only
+    L2_ONLY="l2_only"    # Redis only
+    L1_L2="l1_l2"    # Both (write-through)
+    L1_L2_WRITE_BACK="l1_l2_write_back"    # Async write to L2
+
+
+class CacheKeyType(Enum):
+    """Cache key categorization for invalidation"""
+
+    QUERY_RESULT="query"
+    REPORT="report"
+    TOPOLOGY="topology"
+    HEALTH="health"
+    RESOURCE="resource"
+    SESSION="session"
+    METRIC="metric"
+    EVENT="event"
+
+
+@dataclass
+class CacheMetrics:
+    """Cache performance metrics"""
+
+    hits: int=0
+    misses: int=0
+    evictions: int=0
+    errors: int=0
+    avg_latency_ms: float=0.0
+    total_requests: int=0
+    latency_p50_ms: float=0.0
+    latency_p95_ms: float=0.0
+    latency_p99_ms: float=0.0
+
+    def hit_rate(self) -> float:
+        """Calculate cache hit rate percentage"""
+        if self.total_requests == 0:
+            return 0.0
+        return (self.hits / self.total_requests) * 100
+
+    def record_latency(self, tracker: LatencyTracker) -> "CacheMetrics":
+        """Fill latency fields from a tracker"""
+        self.avg_latency_ms=tracker.mean
+        (
+            self.latency_p50_ms,
+            self.latency_p95_ms,
+            self.latency_p99_ms,
+        )=tracker.percentiles(50, 95, 99)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to dictionary"""
+        return {**asdict(self), "hit_rate_percent": self.hit_rate()}
+
+
+@dataclass
+class CacheEntry:
+    """Single cache entry with metadata"""
+
+    key: str
+    value: Any
+    ttl_seconds: int
+    key_type: CacheKeyType
+    created_at: datetime=field(default_factory=lambda: datetime.now(timezone.utc))
+    accessed_at: datetime=field(default_factory=lambda: datetime.now(timezone.utc))
+    access_count: int=0
+    tags: Set[str] = field(default_factory=set)
+
+    def is_expired(self) -> bool:
+        """Check if entry has expired"""
+        if self.ttl_seconds == 0:
+            return False
+        elapsed=(datetime.now(timezone.utc) - self.created_at).total_seconds()
+        return elapsed > self.ttl_seconds
+
+    def to_json(self) -> str:
+        """Serialize entry to JSON"""
+        return json.dumps(
+            {
+                "key": self.key,
+                "value": self.value,
+                "ttl_seconds": self.ttl_seconds,
+                "key_type": self.key_type.value,
+                "created_at": self.created_at.isoformat(),
+                "accessed_at": self.accessed_at.isoformat(),
+                "access_count": self.access_count,
+                "tags": list(self.tags),
+            }
+        )
+
+
+class CacheProvider(ABC):
+    """Abstract base class for cache implementations"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache"""
+        pass
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: Any, ttl_seconds: int, tags: Optional[Set[str]] = None
+    ) -> bool:
+        """Set value in cache, optionally tagged for invalidation"""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Delete value from cache"""
+        pass
+
+    @abstractmethod
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """Invalidate keys matching pattern"""
+        pass
+
+    @abstractmethod
+    async def invalidate_tags(self, tags: Set[str]) -> int:
+        """Invalidate all keys with given tags"""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> bool:
+        """Clear entire cache"""
+        pass
+
+    @abstractmethod
+    async def get_metrics(self) -> CacheMetrics:
+        """Get cache performance metrics"""
+        pass
+
+
+class L1Cache(CacheProvider):
+    """In-memory L1 cache backed by a sharded LRU/W-TinyLFU engine.
+
+    Operations are synchronous under per-shard locks and never await, so
+    no asyncio lock is needed and the engine is also safe across threads.
+    """
+
+    def __init__(
+        self,
+        max_size: int=1000,
+        max_bytes: int=0,
+        policy: EvictionPolicy=EvictionPolicy.LRU,
+        shards: int=16,
+    ) -> None:
+        self.max_size=max_size
+        self.max_bytes=max_bytes
+        self.engine=L1Engine(
+            max_entries=max_size, max_bytes=max_bytes, policy=policy, shards=shards
+        )
+        self._errors=0
+
+    def __len__(self) -> int:
+        return len(self.engine)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from L1 cache"""
+        return self.engine.get(key)
+
+    async def set(
+        self, key: str, value: Any, ttl_seconds: int, tags: Optional[Set[str]] = None
+    ) -> bool:
+        """Set value in L1 cache"""
+        try:
+            self.engine.set(key, value, ttl_seconds, tags)
+            return True
+        except Exception as e:
+            logger.error(f"L1 cache set error: {e}")
+            self._errors += 1
+            return False
+
+    async def delete(self, key: str) -> bool:
+        """Delete value from L1 cache"""
+        return self.engine.delete(key) is not None
+
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """Invalidate keys matching pattern (prefix trie lookup)"""
+        return self.engine.invalidate_pattern(pattern)
+
+    async def invalidate_tags(self, tags: Set[str]) -> int:
+        """Invalidate keys with given tags (tag -> keys index)"""
+        return self.engine.invalidate_tags(tags)
+
+    async def clear(self) -> bool:
+        """Clear entire cache"""
+        self.engine.clear()
+        return True
+
+    async def get_metrics(self) -> CacheMetrics:
+        """Get cache metrics"""
+        stats=self.engine.stats()
+        return CacheMetrics(
+            hits=stats["hits"],
+            misses=stats["misses"],
+            evictions=stats["evictions"] + stats["expirations"],
+            errors=self._errors,
+            total_requests=stats["hits"] + stats["misses"],
+        ).record_latency(self.engine.latency)
+
+
+class RedisCache(CacheProvider):
+    """Redis L2 cache provider
+
+    Keys written through this provider are indexed in Redis sets so that
+    invalidation only touches matching keys:
+    - ``_tag:<tag>``: keys carrying the tag
+    - ``_keytags:<key>``: tags of a key (expires with the key)
+    - ``_ns:<segment>``: keys whose first ``:`` segment is ``segment``;
+      used for patterns such as ``node:*`` instead of a keyspace SCAN
+
+    Index sets expire no earlier than the longest-lived key they hold (and
+    never while they hold a key without TTL), so they do not outlive their
+    keys indefinitely; members whose key already expired are dropped on
+    invalidation. A namespace pattern falls back to SCAN when its set is
+    missing; pass ``index_patterns=False`` to always SCAN when other
+    writers share the keyspace without maintaining the sets.
+    """
+
+    TAG_SET_PREFIX="_tag:"
+    KEY_TAGS_PREFIX="_keytags:"
+    NAMESPACE_SET_PREFIX="_ns:"
+
+    def __init__(
+        self, redis_url: str="redis://localhost:6379", index_patterns: bool=True
+    ) -> None:
+        self.redis_url=redis_url
+        self.index_patterns=index_patterns
+        self.redis_client: Optional[aioredis.Redis[str]] = None
+        self.metrics=CacheMetrics()
+        self.latency=LatencyTracker()
+
+    async def connect(self) -> bool:
+        """Connect to Redis"""
+        try:
+            self.redis_client=await aioredis.from_url(
+                self.redis_url, decode_responses=True
+            )
+            # Test connection
+            await self.redis_client.ping()
+            logger.info("Connected to Redis cache")
+            return True
+        except Exception as e:
+            logger.error(f"Redis connection failed: {e}")
+            return False
+
+    async def disconnect(self) -> bool:
+        """Disconnect from Redis"""
+        if self.redis_client:
+            await self.redis_client.close()
+            self.redis_client=None
+        return True
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from Redis"""
+        value, _tags=await self.get_with_tags(key)
+        return value
+
+    async def get_with_tags(self, key: str) -> Tuple[Optional[Any], Set[str]]:
+        """Get value and its tags in one round trip"""
+        if not self.redis_client:
+            self.metrics.errors += 1
+            return None, set()
+
+        try:
+            start=time.perf_counter()
+            pipe=self.redis_client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.smembers(self.KEY_TAGS_PREFIX + key)
+            value, tags=await pipe.execute()
+            self.latency.record((time.perf_counter() - start) * 1000)
+
+            if value is None:
+                self.metrics.misses += 1
+            else:
+                self.metrics.hits += 1
+
+            self.metrics.total_requests += 1
+            return (json.loads(value) if value else None), set(tags or ())
+        except Exception as e:
+            logger.error(f"Redis get error: {e}")
+            self.metrics.errors += 1
+            self.metrics.misses += 1
+            self.metrics.total_requests += 1
+            return None, set()
+
+    @staticmethod
+    def _namespace(key: str) -> Optional[str]:
+        return key.split(":", 1)[0] if ":" in key else None
+
+    async def set(
+        self, key: str, value: Any, ttl_seconds: int, tags: Optional[Set[str]] = None
+    ) -> bool:
+        """Set value in Redis and update the tag/namespace sets"""
+        if not self.redis_client:
+            self.metrics.errors += 1
+            return False
+
+        try:
+            serialized=json.dumps(value)
+            tags=set(tags or ())
+            key_tags=self.KEY_TAGS_PREFIX + key
+            namespace=self._namespace(key)
+            index_sets=[self.TAG_SET_PREFIX + tag for tag in sorted(tags)]
+            if namespace is not None:
+                index_sets.append(self.NAMESPACE_SET_PREFIX + namespace)
+
+            # Previous tags of the key and remaining lifetime of its index sets
+            pipe=self.redis_client.pipeline(transaction=False)
+            pipe.smembers(key_tags)
+            if ttl_seconds > 0:
+                for index_set in index_sets:
+                    pipe.ttl(index_set)
+            old_tags, *index_ttls=await pipe.execute()
+
+            pipe=self.redis_client.pipeline(transaction=False)
+            if ttl_seconds > 0:
+                pipe.setex(key, ttl_seconds, serialized)
+            else:
+                pipe.set(key, serialized)
+            for tag in set(old_tags or ()) - tags:
+                pipe.srem(self.TAG_SET_PREFIX + tag, key)
+            pipe.delete(key_tags)
+            if tags:
+                pipe.sadd(key_tags, *tags)
+                if ttl_seconds > 0:
+                    pipe.expire(key_tags, ttl_seconds)
+            for n, index_set in enumerate(index_sets):
+                pipe.sadd(index_set, key)
+                if ttl_seconds <= 0:
+                    pipe.persist(index_set)
+                elif index_ttls[n] != -1 and index_ttls[n] < ttl_seconds:
+                    # -1: the set already holds a key without TTL
+                    pipe.expire(index_set, ttl_seconds)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis set error: {e}")
+            self.metrics.errors += 1
+            return False
+
+    async def _forget(self, keys: List[str]) -> int:
+        """Delete ``keys`` and drop them from the index sets; returns keys deleted"""
+        if not keys:
+            return 0
+        pipe=self.redis_client.pipeline(transaction=False)  # type: ignore[union-attr]
+        for key in keys:
+            pipe.smembers(self.KEY_TAGS_PREFIX + key)
+        key_tags=await pipe.execute()
+
+        pipe=self.redis_client.pipeline(transaction=False)  # type: ignore[union-attr]
+        for key, tags in zip(keys, key_tags):
+            for tag in tags or ():
+                pipe.srem(self.TAG_SET_PREFIX + tag, key)
+            namespace=self._namespace(key)
+            if namespace is not None:
+                pipe.srem(self.NAMESPACE_SET_PREFIX + namespace, key)
+        pipe.delete(*(self.KEY_TAGS_PREFIX + key for key in keys))
+        pipe.delete(*keys)
+        results=await pipe.execute()
+        return int(results[-1])
+
+    async def delete(self, key: str) -> bool:
+        """Delete from Redis"""
+        if not self.redis_client:
+            return False
+
+        try:
+            return await self._forget([key]) > 0
+        except Exception as e:
+            logger.error(f"Redis delete error: {e}")
+            self.metrics.errors += 1
+            return False
+
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """Invalidate keys matching pattern
+
+        Patterns with a literal ``namespace:`` prefix are resolved from the
+        namespace set when it exists; other patterns, and namespaces with no
+        set, fall back to a SCAN of the keyspace.
+        """
+        if not self.redis_client:
+            return 0
+
+        try:
+            literal=re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+            if self.index_patterns and ":" in literal:
+                namespace=literal.split(":", 1)[0]
+                members=await self.redis_client.smembers(
+                    self.NAMESPACE_SET_PREFIX + namespace
+                )
+                if members:
+                    return await self._forget(
+                        [k for k in members if fnmatch.fnmatchcase(k, pattern)]
+                    )
+
+            cursor=0
+            count=0
+            while True:
+                cursor, keys=await self.redis_client.scan(
+                    cursor, match=pattern, count=100
+                )
+                count += await self._forget(keys)
+                if cursor == 0:
+                    break
+            return count
+        except Exception as e:
+            logger.error(f"Redis pattern invalidation error: {e}")
+            self.metrics.errors += 1
+            return 0
+
+    async def invalidate_tags(self, tags: Set[str]) -> int:
+        """Invalidate keys with tags via the ``_tag:<tag>`` sets"""
+        if not self.redis_client:
+            return 0
+
+        try:
+            tag_sets=[self.TAG_SET_PREFIX + tag for tag in tags]
+            if not tag_sets:
+                return 0
+            keys=await self.redis_client.sunion(*tag_sets)
+            count=await self._forget(sorted(keys))
+            await self.redis_client.delete(*tag_sets)
+            return count
+        except Exception as e:
+            logger.error(f"Redis tag invalidation error: {e}")
+            self.metrics.errors += 1
+            return 0
+
+    async def clear(self) -> bool:
+        """Clear entire Redis cache"""
+        if not self.redis_client:
+            return False
+
+        try:
+            await self.redis_client.flushdb()
+            return True
+        except Exception as e:
+            logger.error(f"Redis clear error: {e}")
+            self.metrics.errors += 1
+            return False
+
+    async def get_metrics(self) -> CacheMetrics:
+        """Get Redis cache metrics"""
+        return self.metrics.record_latency(self.latency)
+
+
+class HybridCache(CacheProvider):
+    """Hybrid L1+L2 cache with multi-tier strategy"""
+
+    def __init__(
+        self, l1: L1Cache, l2: RedisCache, strategy: CacheStrategy=CacheStrategy.L1_L2
+    ):
+        self.l1=l1
+        self.l2=l2
+        self.strategy=strategy
+        self.metrics=CacheMetrics()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get from cache hierarchy"""
+        # Try L1 first
+        if self.strategy != CacheStrategy.L2_ONLY:
+            value=await self.l1.get(key)
+            if value is not None:
+                self.metrics.hits += 1
+                self.metrics.total_requests += 1
+                return value
+
+        # Fall back to L2
+        if self.strategy != CacheStrategy.L1_ONLY:
+            value, tags=await self.l2.get_with_tags(key)
+            if value is not None:
+            # Populate L1 for next access, keeping tags so invalidation reaches it
+                if self.strategy != CacheStrategy.L2_ONLY:
+                    await self.l1.set(key, value, 3600, tags)
+                self.metrics.hits += 1
+                self.metrics.total_requests += 1
+                return value
+
+        self.metrics.misses += 1
+        self.metrics.total_requests += 1
+        return None
+
+    async def set(
+        self, key: str, value: Any, ttl_seconds: int, tags: Optional[Set[str]] = None
+    ) -> bool:
+        """Set in cache hierarchy"""
+        if self.strategy == CacheStrategy.L1_ONLY:
+            return await self.l1.set(key, value, ttl_seconds, tags)
+        elif self.strategy == CacheStrategy.L2_ONLY:
+            return await self.l2.set(key, value, ttl_seconds, tags)
+        elif self.strategy == CacheStrategy.L1_L2:
+        # Write-through: set both
+            l1_ok=await self.l1.set(key, value, ttl_seconds, tags)
+            l2_ok=await self.l2.set(key, value, ttl_seconds, tags)
+            return l1_ok and l2_ok
+        else:    # L1_L2_WRITE_BACK
+        # Write L1 first, async write L2
+            l1_ok=await self.l1.set(key, value, ttl_seconds, tags)
+            if l1_ok:
+                asyncio.create_task(self.l2.set(key, value, ttl_seconds, tags))
+            return l1_ok
+
+    async def delete(self, key: str) -> bool:
+        """Delete from all tiers"""
+        l1_ok=await self.l1.delete(key)
+        l2_ok=await self.l2.delete(key)
+        return l1_ok or l2_ok
+
+    async def invalidate_pattern(self, pattern: str) -> int:
+        """Invalidate pattern in all tiers"""
+        l1_count=await self.l1.invalidate_pattern(pattern)
+        l2_count=await self.l2.invalidate_pattern(pattern)
+        return l1_count + l2_count
+
+    async def invalidate_tags(self, tags: Set[str]) -> int:
+        """Invalidate tags in all tiers"""
+        l1_count=await self.l1.invalidate_tags(tags)
+        l2_count=await self.l2.invalidate_tags(tags)
+        return l1_count + l2_count
+
+    async def clear(self) -> bool:
+        """Clear all cache tiers"""
+        l1_ok=await self.l1.clear()
+        l2_ok=await self.l2.clear()
+        return l1_ok and l2_ok
+
+    async def get_metrics(self) -> CacheMetrics:
+        """Get combined metrics
+
+        Latency mean and percentiles are computed over the merged samples
+        of both tiers, weighted by the number of requests each served.
+        """
+        l1_metrics=await self.l1.get_metrics()
+        l2_metrics=await self.l2.get_metrics()
+
+        return CacheMetrics(
+            hits=l1_metrics.hits + l2_metrics.hits,
+            misses=l1_metrics.misses + l2_metrics.misses,
+            evictions=l1_metrics.evictions + l2_metrics.evictions,
+            errors=l1_metrics.errors + l2_metrics.errors,
+            total_requests=l1_metrics.total_requests + l2_metrics.total_requests,
+        ).record_latency(LatencyTracker.merged(self.l1.engine.latency, self.l2.latency))
+
+
+@dataclass
+class CachedCallMetrics:
+    """Per-function metrics for the @cached decorator"""
+
+    hits: int=0
+    misses: int=0
+    coalesced: int=0    # Callers that awaited another caller's computation
+    stale_hits: int=0    # Expired values served while a refresh ran
+    early_refreshes: int=0    # XFetch recomputations before expiry
+    background_refreshes: int=0
+    refresh_errors: int=0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to dictionary"""
+        return asdict(self)
+
+
+# Marks values stored by @cached together with their freshness metadata
+_ENVELOPE_MARK="__cached__"
+
+
+def cached(
+    ttl_seconds: int=3600,
+    key_prefix: str="cache",
+    cache: Optional[CacheProvider] = None,
+    tags: Optional[Set[str]] = None,
+    single_flight: bool=True,
+    xfetch_beta: float=0.0,
+    stale_ttl_seconds: int=0,
+) -> Callable[[CacheF], CacheF]:
+    """Decorator for caching async function results
+
+    Args:
+        ttl_seconds: Freshness lifetime of a cached result
+        key_prefix: Prefix for generated cache keys
+        cache: Cache provider; without one only single-flight applies
+        tags: Tags attached to cached results for invalidation
+        single_flight: Concurrent misses for the same key share one call
+        xfetch_beta: Probabilistic early expiration (XFetch); a fresh value
+            is recomputed early with a probability that rises as expiry
+            nears, scaled by how long the computation took. 0 disables,
+            1.0 is the usual setting, larger values refresh earlier
+        stale_ttl_seconds: After expiry, keep serving the old value for up
+            to this long while one background task refreshes it; early
+            XFetch refreshes also run in the background when set
+
+    The wrapper exposes ``cache_metrics`` (CachedCallMetrics).
+    """
+
+    def decorator(func: CacheF) -> CacheF:
+        metrics=CachedCallMetrics()
+        inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+        async def compute(cache_key: str, args: Any, kwargs: Any) -> Any:
+            start=time.time()
+            result=await func(*args, **kwargs)
+            if cache is not None:
+                now=time.time()
+                envelope={
+                    _ENVELOPE_MARK: 1,
+                    "value": result,
+                    "expires_at": now + ttl_seconds if ttl_seconds > 0 else 0,
+                    "delta": now - start,
+                }
+                storage_ttl=ttl_seconds + stale_ttl_seconds if ttl_seconds > 0 else 0
+                await cache.set(cache_key, envelope, storage_ttl, tags)
+            return result
+
+        def start_flight(cache_key: str, args: Any, kwargs: Any) -> "asyncio.Future[Any]":
+            task=asyncio.ensure_future(compute(cache_key, args, kwargs))
+            inflight[cache_key] = task
+            task.add_done_callback(lambda _t: inflight.pop(cache_key, None))
+            return task
+
+        async def load(cache_key: str, args: Any, kwargs: Any) -> Any:
+            if not single_flight:
+                return await compute(cache_key, args, kwargs)
+            task=inflight.get(cache_key)
+            if task is not None:
+                metrics.coalesced += 1
+            else:
+                task=start_flight(cache_key, args, kwargs)
+            # Shield so one cancelled caller does not cancel the shared call
+            return await asyncio.shield(task)
+
+        def refresh_in_background(cache_key: str, args: Any, kwargs: Any) -> None:
+            if cache_key in inflight:
+                return
+            metrics.background_refreshes += 1
+            task=start_flight(cache_key, args, kwargs)
+
+            def report(done: "asyncio.Future[Any]") -> None:
+                if not done.cancelled() and done.exception() is not None:
+                    metrics.refresh_errors += 1
+                    logger.warning(
+                        f"Background refresh of {func.__name__} failed: {done.exception()}"
+                    )
+
+            task.add_done_callback(report)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Generate cache key from function name and arguments
+            key_data=f"{key_prefix}:{func.__name__}:{str(args)}:{str(kwargs)}"
+            cache_key=f"{key_prefix}:{hashlib.sha256(key_data.encode()).hexdigest()}"
+
+            # Try to get from cache
+            if cache is not None:
+                entry=await cache.get(cache_key)
+                if isinstance(entry, dict) and entry.get(_ENVELOPE_MARK):
+                    now=time.time()
+                    expires_at=entry["expires_at"]
+                    if not expires_at or now < expires_at:
+                        if xfetch_beta > 0 and expires_at and (
+                            now - entry["delta"] * xfetch_beta * math.log(1.0 - random.random())
+                            >= expires_at
+                        ):
+                            metrics.early_refreshes += 1
+                            if stale_ttl_seconds > 0:
+                                refresh_in_background(cache_key, args, kwargs)
+                            else:
+                                return await load(cache_key, args, kwargs)
+                        metrics.hits += 1
+                        return entry["value"]
+                    if now < expires_at + stale_ttl_seconds:
+                        metrics.stale_hits += 1
+                        refresh_in_background(cache_key, args, kwargs)
+                        return entry["value"]
+                elif entry is not None:
+                    metrics.hits += 1    # Value stored without metadata
+                    return entry
+
+            metrics.misses += 1
+            return await load(cache_key, args, kwargs)
+
+        wrapper.cache_metrics=metrics  # type: ignore[attr-defined]
+        return wrapper    # type: ignore
+
+    return decorator
+
+
+class CacheManager:
+    """Central cache management for DebVisor"""
+
+    def __init__(self) -> None:
+        self.l1=L1Cache(max_size=1000)
+        self.l2=RedisCache()
+        self.hybrid=HybridCache(self.l1, self.l2, CacheStrategy.L1_L2)
+
+    async def initialize(self) -> bool:
+        """Initialize cache system"""
+        try:
+            redis_ok=await self.l2.connect()
+            if not redis_ok:
+                logger.warning("Redis cache unavailable, using L1 only")
+            logger.info("Cache manager initialized")
+            return True
+        except Exception as e:
+            logger.error(f"Cache initialization error: {e}")
+            return False
+
+    async def shutdown(self) -> bool:
+        """Shutdown cache system"""
+        try:
+            await self.l2.disconnect()
+            await self.hybrid.clear()
+            logger.info("Cache manager shutdown")
+            return True
+        except Exception as e:
+            logger.error(f"Cache shutdown error: {e}")
+            return False
+
+    async def get_cache_status(self) -> Dict[str, Any]:
+        """Get cache system status"""
+        l1_metrics=await self.l1.get_metrics()
+        l2_metrics=await self.l2.get_metrics()
+
+        return {
+            "l1": {
+                "metrics": l1_metrics.to_dict(),
+                "size": len(self.l1),
+                "bytes": self.l1.engine.bytes_used,
+                "max_size": self.l1.max_size,
+            },
+            "l2": {
+                "metrics": l2_metrics.to_dict(),
+                "connected": self.l2.redis_client is not None,
+            },
+            "hybrid_metrics": (await self.hybrid.get_metrics()).to_dict(),
+        }
+
+
+# Global cache manager instance
+_cache_manager: Optional[CacheManager] = None
+
+
+async def get_cache_manager() -> CacheManager:
+    """Get or create global cache manager"""
+    global _cache_manager
+    if _cache_manager is None:
+        _cache_manager=CacheManager()
+        await _cache_manager.initialize()
+    return _cache_manager
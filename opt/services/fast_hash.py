@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Fast, stable 64-bit string hashing for placement and sketches.
+
+CRC-32 and Adler-32 of the UTF-8 string (both C-speed zlib calls)
+combined into 64 bits and mixed with the MurmurHash3 finalizer.
+
+Features:
+- Identical across processes, hosts and releases (unlike hash())
+- Several times cheaper than SHA-256 per string; not cryptographic, so
+  do not use it where inputs are adversarial and collisions matter
+- Vectorised bulk hashing with NumPy when available, bit-identical to
+  the scalar function
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any, Sequence
+
+try:
+    import numpy as np
+
+    HAS_NUMPY=True
+except ImportError:
+    np=None
+    HAS_NUMPY=False
+
+MASK64=0xFFFFFFFFFFFFFFFF
+GOLDEN64=0x9E3779B97F4A7C15
+_FMIX_C1=0xFF51AFD7ED558CCD
+_FMIX_C2=0xC4CEB9FE1A85EC53
+
+
+def fmix64(h: int) -> int:
+    """MurmurHash3 64-bit finalizer."""
+    h ^= h >> 33
+    h=(h * _FMIX_C1) & MASK64
+    h ^= h >> 33
+    h=(h * _FMIX_C2) & MASK64
+    return h ^ (h >> 33)
+
+
+def fmix64_array(h: Any) -> Any:
+    """MurmurHash3 64-bit finalizer over a uint64 array (wrapping multiply)."""
+    shift=np.uint64(33)
+    h=h ^ (h >> shift)
+    h=h * np.uint64(_FMIX_C1)
+    h=h ^ (h >> shift)
+    h=h * np.uint64(_FMIX_C2)
+    return h ^ (h >> shift)
+
+
+def hash64(value: str) -> int:
+    """Stable 64-bit hash of a string."""
+    data=value.encode()
+    return fmix64(zlib.crc32(data) | zlib.adler32(data) << 32)
+
+
+def hash64_many(values: Sequence[str]) -> Any:
+    """hash64() of many strings as a NumPy uint64 array (requires NumPy)."""
+    raw=np.fromiter(
+        (zlib.crc32(d) | zlib.adler32(d) << 32 for d in (v.encode() for v in values)),
+        dtype=np.uint64,
+        count=len(values),
+    )
+    return fmix64_array(raw)
@@ -101,9 +101,11 @@
 """Enterprise Observability Cardinality Controller.
 
 Manages metric cardinality explosion and intelligent trace sampling:
-- Adaptive label pruning with cardinality estimation (HyperLogLog)
+- Adaptive label pruning with cardinality estimation (HyperLogLog,
+  NumPy registers) and batch sample ingestion
 - Automatic high-cardinality label detection and aggregation
-- Tail-based trace sampling (latency, errors, anomalies)
+- Tail-based trace sampling (latency, errors, anomalies) with rule
+  conditions compiled once and streaming latency percentiles
 - Retention policy enforcement with tiered storage
 - Cost-aware metric downsampling
 
@@ -112,21 +114,34 @@ DebVisor Enterprise Platform - Production Ready.
 
 from __future__ import annotations
 
+import ast
 import hashlib
 import logging
 import math
+import operator
 import random
 import re
-import struct
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
-_logger=logging.getLogger(__name__)
+from opt.services.fast_hash import hash64, hash64_many
+from opt.services.quantile_sketch import DDSketch
+
+try:
+    import numpy as np
+
+    HAS_NUMPY=True
+except ImportError:
+    np=None
+    HAS_NUMPY=False
+
+logger=logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -214,16 +229,27 @@ class TraceContext:
     parent_sampled: Optional[bool] = None
 
 
+Predicate=Callable[[Dict[str, Any]], bool]
+
+
 @dataclass
 class SamplingRule:
-    """Rule for trace sampling."""
+    """Rule for trace sampling.
+
+    The condition is compiled into the predicate field on construction (see
+    compile_condition()); an invalid condition raises ValueError.
+    """
 
     name: str
     priority: int
-    condition: str    # Expression like "service == 'payment' and latency > 500"
+    condition: str    # Expression like "service_name == 'payment' and total_duration_ms > 500"
     sample_rate: float    # 0.0 to 1.0
     enabled: bool=True
     hit_count: int=0
+    predicate: Predicate=field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.predicate=compile_condition(self.condition)
 
 
 @dataclass
@@ -259,6 +285,9 @@ class HyperLogLog:
     """HyperLogLog cardinality estimator for efficient unique counting.
 
     Uses minimal memory to estimate unique values with ~2% error rate.
+    Registers live in a bytearray for cheap single adds; with NumPy,
+    buckets is a uint8 array view of the same memory, so bulk adds,
+    estimate() and merge() are vectorized.
     """
 
     def __init__(self, precision: int=14) -> None:
@@ -269,9 +298,23 @@ class HyperLogLog:
         """
         self.precision=min(max(precision, 4), 18)
         self.num_buckets=1 << self.precision
-        self.buckets=bytearray(self.num_buckets)
+        self._registers=bytearray(self.num_buckets)
+        self.buckets: Any = self._register_view()
         self._alpha=self._get_alpha()
 
+    def _register_view(self) -> Any:
+        return np.frombuffer(self._registers, dtype=np.uint8) if HAS_NUMPY else self._registers
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state=self.__dict__.copy()
+        del state["buckets"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # Copies and unpickled instances get a view of their own registers
+        self.__dict__.update(state)
+        self.buckets=self._register_view()
+
     def _get_alpha(self) -> float:
         """Get bias correction constant."""
         if self.num_buckets == 16:
@@ -284,10 +327,9 @@ class HyperLogLog:
 
     def _hash(self, value: str) -> int:
         """Hash value to 64-bit integer."""
-        _h=hashlib.sha256(value.encode()).digest()
-        return struct.unpack("<Q", h[:8])[0]
+        return hash64(value)
 
-    def _leading_zeros(self, value: int, maxbits: int=64) -> int:
+    def _leading_zeros(self, value: int, max_bits: int=64) -> int:
         """Count leading zeros in binary representation."""
         if value == 0:
             return max_bits
@@ -295,23 +337,53 @@ class HyperLogLog:
 
     def add(self, value: str) -> None:
         """Add value to the estimator."""
-        _h=self._hash(value)
+        self._add_hash(self._hash(value))
+
+    def _add_hash(self, h: int) -> None:
         # First 'precision' bits determine bucket
-        _bucket_idx=h >> (64 - self.precision)
+        bucket_idx=h >> (64 - self.precision)
         # Remaining bits used for counting leading zeros
-        _remaining=h & ((1 << (64 - self.precision)) - 1)
-        _leading=self._leading_zeros(remaining, 64 - self.precision) + 1
-        self.buckets[bucket_idx] = max(self.buckets[bucket_idx], leading)
+        remaining=h & ((1 << (64 - self.precision)) - 1)
+        leading=self._leading_zeros(remaining, 64 - self.precision) + 1
+        if leading > self._registers[bucket_idx]:
+            self._registers[bucket_idx] = leading
+
+    def add_many(self, values: Sequence[str]) -> None:
+        """Add many values; vectorized when NumPy is available."""
+        if not HAS_NUMPY:
+            for value in values:
+                self.add(value)
+            return
+        if len(values):
+            self.add_hashes(hash64_many(values))
+
+    def add_hashes(self, hashes: Any) -> None:
+        """Add values by their precomputed hash64() (a NumPy uint64 array)."""
+        if len(hashes) < _SMALL_BATCH:
+            # Array-op overhead dominates for a handful of values
+            for h in hashes.tolist():
+                self._add_hash(h)
+            return
+
+        width=64 - self.precision
+        bucket_idx=(hashes >> np.uint64(width)).astype(np.intp)
+        remaining=hashes & np.uint64((1 << width) - 1)
+        leading=width - _bit_length(remaining) + 1
+        np.maximum.at(self.buckets, bucket_idx, leading.astype(np.uint8))
 
     def estimate(self) -> int:
         """Estimate cardinality."""
         # Harmonic mean of 2^bucket values
-        _indicator=sum(2.0**-b for b in self.buckets)
-        _raw_estimate=self._alpha * (self.num_buckets**2) / indicator
+        if HAS_NUMPY:
+            indicator=float(np.ldexp(1.0, -self.buckets.astype(np.int32)).sum())
+            zeros=int(self.num_buckets - np.count_nonzero(self.buckets))
+        else:
+            indicator=sum(2.0**-b for b in self.buckets)
+            zeros=self.buckets.count(0)
+        raw_estimate=self._alpha * (self.num_buckets**2) / indicator
 
         # Small range correction
         if raw_estimate <= 2.5 * self.num_buckets:
-            _zeros=self.buckets.count(0)
             if zeros > 0:
                 return int(self.num_buckets * math.log(self.num_buckets / zeros))
 
@@ -322,17 +394,31 @@ class HyperLogLog:
         """Merge another HLL into this one."""
         if self.precision != other.precision:
             raise ValueError("Cannot merge HLLs with different precision")
+        if HAS_NUMPY:
+            np.maximum(self.buckets, other.buckets, out=self.buckets)
+            return
         for i in range(self.num_buckets):
             self.buckets[i] = max(self.buckets[i], other.buckets[i])
 
 
+# Below this many hashes, add_hashes() updates registers one at a time
+_SMALL_BATCH=32
+
+
+def _bit_length(values: Any) -> Any:
+    """int.bit_length() of a uint64 array (exact: halves fit float64)."""
+    high=(values >> np.uint64(32)).astype(np.float64)
+    low=(values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, np.frexp(high)[1] + 32, np.frexp(low)[1])
+
+
 # =============================================================================
 # Label Value Tracker
 # =============================================================================
 class LabelValueTracker:
     """Tracks label values and their frequencies efficiently."""
 
-    def __init__(self, maxtracked: int=1000) -> None:
+    def __init__(self, max_tracked: int=1000) -> None:
         self.max_tracked=max_tracked
         self.value_counts: Dict[str, int] = {}
         self.hll=HyperLogLog(precision=12)
@@ -351,6 +437,27 @@ class LabelValueTracker:
         else:
             self.overflow_count += 1
 
+    def add_many(self, values: Sequence[str], hashes: Any=None) -> None:
+        """Track many label values (one vectorized HLL update).
+
+        hashes may carry the values' hash64() as a NumPy array, e.g. a slice
+        of one hash64_many() call over a whole batch.
+        """
+        self.total_samples += len(values)
+        if hashes is None:
+            self.hll.add_many(values)
+        else:
+            self.hll.add_hashes(hashes)
+
+        counts=self.value_counts
+        for value in values:
+            if value in counts:
+                counts[value] += 1
+            elif len(counts) < self.max_tracked:
+                counts[value] = 1
+            else:
+                self.overflow_count += 1
+
     def get_cardinality(self) -> int:
         """Get estimated cardinality."""
         return self.hll.estimate()
@@ -425,7 +532,8 @@ class CardinalityController:
             self.DEFAULT_HIGH_CARDINALITY_LABELS
         )
 
-        # Statistics
+        # Statistics (total_series is maintained, not recounted per sample)
+        self.total_series=0
         self.total_samples_processed=0
         self.samples_pruned=0
         self.labels_dropped=0
@@ -436,29 +544,29 @@ class CardinalityController:
         """Set up default policies for known high-cardinality labels."""
         # Drop transaction IDs - they're unique per request
         self.global_label_policies["transaction_id"] = LabelPolicy(
-            _name="transaction_id", strategy=AggregationStrategy.DROP
+            name="transaction_id", strategy=AggregationStrategy.DROP
         )
 
         # Hash bucket client IPs into groups
         self.global_label_policies["client_ip"] = LabelPolicy(
-            _name="client_ip",
-            _strategy=AggregationStrategy.HASH_BUCKET,
-            _hash_buckets=256,    # 256 buckets for IPs
+            name="client_ip",
+            strategy=AggregationStrategy.HASH_BUCKET,
+            hash_buckets=256,    # 256 buckets for IPs
         )
 
         # Keep top K pod IDs, bucket the rest
         self.global_label_policies["pod_id"] = LabelPolicy(
-            _name="pod_id", strategy=AggregationStrategy.TOP_K, top_k=100
+            name="pod_id", strategy=AggregationStrategy.TOP_K, top_k=100
         )
 
         # Extract service name from long instance IDs
         self.global_label_policies["instance_id"] = LabelPolicy(
-            _name="instance_id",
-            _strategy=AggregationStrategy.REGEX_EXTRACT,
-            _regex_pattern=r"^([a-z]+-[a-z]+)-",    # Extract service prefix
+            name="instance_id",
+            strategy=AggregationStrategy.REGEX_EXTRACT,
+            regex_pattern=r"^([a-z]+-[a-z]+)-",    # Extract service prefix
         )
 
-    def register_metric(self, name: str, labelnames: Set[str]) -> MetricDescriptor:
+    def register_metric(self, name: str, label_names: Set[str]) -> MetricDescriptor:
         """Register a metric for cardinality tracking."""
         if name not in self.metrics:
             self.metrics[name] = MetricDescriptor(name=name, label_names=label_names)
@@ -481,82 +589,161 @@ class CardinalityController:
         the sample should be accepted or dropped.
         """
         self.total_samples_processed += 1
-        _timestamp=timestamp or time.time()
+        timestamp=timestamp or time.time()
 
         # Auto-register if not known
         if metric_name not in self.metrics:
             self.register_metric(metric_name, set(labels.keys()))
 
-        metric=self.metrics[metric_name]
-
         # Track label values for cardinality estimation
+        trackers=self.label_trackers[metric_name]
         for label_name, label_value in labels.items():
-            if label_name in self.label_trackers[metric_name]:
-                self.label_trackers[metric_name][label_name].add(label_value)
+            if label_name in trackers:
+                trackers[label_name].add(label_value)
 
         # Apply label transformations
-        _transformed=self._transform_labels(metric_name, labels)
+        transformed=self._transform_labels(metric_name, labels)
+        return transformed, self._admit_series(metric_name, transformed, timestamp)
+
+    def process_samples(
+        self,
+        samples: Iterable[Tuple[str, Dict[str, str], float]],
+        timestamp: Optional[float] = None,
+    ) -> List[Tuple[Dict[str, str], bool]]:
+        """Process a batch of (metric_name, labels, value) samples, e.g. a scrape.
+
+        Same results as process_sample() per sample, but label values reach
+        the HyperLogLog trackers in one vectorized update per label, label
+        policies are resolved once per batch, and series limits log one
+        warning per metric instead of one per dropped sample.
+        """
+        timestamp=timestamp or time.time()
+        results: List[Tuple[Dict[str, str], bool]] = []
+        tracked: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        policies: Dict[Tuple[str, str], Optional[LabelPolicy]] = {}
+        over_limit: Dict[str, int] = defaultdict(int)
+
+        for metric_name, labels, _ in samples:
+            self.total_samples_processed += 1
+            if metric_name not in self.metrics:
+                self.register_metric(metric_name, set(labels.keys()))
+
+            trackers=self.label_trackers[metric_name]
+            for label_name, label_value in labels.items():
+                if label_name in trackers:
+                    tracked[(metric_name, label_name)].append(label_value)
+
+            transformed=self._transform_labels(metric_name, labels, policies)
+            accepted=self._admit_series(metric_name, transformed, timestamp, warn=False)
+            if not accepted and len(self.series_by_metric[metric_name]) >= self.max_series_per_metric:
+                over_limit[metric_name] += 1
+            results.append((transformed, accepted))
+
+        self._track_label_values(tracked)
+        for metric_name, dropped in over_limit.items():
+            logger.warning(
+                f"Dropped {dropped} samples for {metric_name}: series limit reached "
+                f"({self.max_series_per_metric})"
+            )
+        return results
 
-        # Check series limit
-        _series_hash=self._hash_labels(transformed)
+    def _track_label_values(self, tracked: Dict[Tuple[str, str], List[str]]) -> None:
+        """Feed batched label values to their trackers, hashing all of them at once."""
+        if not HAS_NUMPY:
+            for (metric_name, label_name), values in tracked.items():
+                self.label_trackers[metric_name][label_name].add_many(values)
+            return
+
+        all_values=[value for values in tracked.values() for value in values]
+        hashes=hash64_many(all_values)
+        offset=0
+        for (metric_name, label_name), values in tracked.items():
+            end=offset + len(values)
+            self.label_trackers[metric_name][label_name].add_many(values, hashes[offset:end])
+            offset=end
 
-        if series_hash in self.series_by_metric[metric_name]:
-        # Existing series - update stats
-            stats=self.series_by_metric[metric_name][series_hash]
+    def _admit_series(
+        self,
+        metric_name: str,
+        transformed: Dict[str, str],
+        timestamp: float,
+        warn: bool=True,
+    ) -> bool:
+        """Count a sample against its series; False if a new series is over a limit."""
+        series=self.series_by_metric[metric_name]
+        series_hash=self._hash_labels(transformed)
+
+        stats=series.get(series_hash)
+        if stats is not None:
+            # Existing series - update stats
             stats.sample_count += 1
             stats.last_sample_time=timestamp
-            return transformed, True
+            return True
 
         # New series - check limits
-        if len(self.series_by_metric[metric_name]) >= self.max_series_per_metric:
+        if len(series) >= self.max_series_per_metric:
             self.samples_pruned += 1
-            logger.warning(
-                f"Dropping sample for {metric_name}: series limit reached "
-                f"({self.max_series_per_metric})"
-            )
-            return transformed, False
+            if warn:
+                logger.warning(
+                    f"Dropping sample for {metric_name}: series limit reached "
+                    f"({self.max_series_per_metric})"
+                )
+            return False
 
-        _total_series=sum(len(s) for s in self.series_by_metric.values())
-        if total_series >= self.max_total_series:
+        if self.total_series >= self.max_total_series:
             self.samples_pruned += 1
-            return transformed, False
+            return False
 
         # Accept new series
-        self.series_by_metric[metric_name][series_hash] = SeriesStats(
-            _metric_name=metric_name,
-            _label_hash=series_hash,
-            _labels=transformed,
-            _sample_count=1,
-            _last_sample_time=timestamp,
+        series[series_hash] = SeriesStats(
+            metric_name=metric_name,
+            label_hash=series_hash,
+            labels=transformed,
+            sample_count=1,
+            last_sample_time=timestamp,
         )
-        metric.series_count=len(self.series_by_metric[metric_name])
+        self.total_series += 1
+        self.metrics[metric_name].series_count=len(series)
+        return True
 
-        return transformed, True
+    def _resolve_policy(self, metric_name: str, label_name: str) -> Optional[LabelPolicy]:
+        """Policy for a label: metric-specific, global, then auto-detected."""
+        # Check metric-specific policy first
+        policy=self.metric_label_policies.get(metric_name, {}).get(label_name)
+
+        # Fall back to global policy
+        if not policy:
+            policy=self.global_label_policies.get(label_name)
+
+        # Check if auto-detected as high cardinality
+        if not policy and label_name in self.detected_high_cardinality:
+            policy=LabelPolicy(
+                name=label_name,
+                strategy=AggregationStrategy.HASH_BUCKET,
+                hash_buckets=100,
+            )
+        return policy
 
     def _transform_labels(
-        self, metric_name: str, labels: Dict[str, str]
+        self,
+        metric_name: str,
+        labels: Dict[str, str],
+        policy_cache: Optional[Dict[Tuple[str, str], Optional[LabelPolicy]]] = None,
     ) -> Dict[str, str]:
         """Apply transformation policies to labels."""
-        _result={}
+        result={}
 
         for label_name, label_value in labels.items():
-        # Check metric-specific policy first
-            _policy=self.metric_label_policies.get(metric_name, {}).get(label_name)
-
-            # Fall back to global policy
-            if not policy:
-                _policy=self.global_label_policies.get(label_name)
-
-            # Check if auto-detected as high cardinality
-            if not policy and label_name in self.detected_high_cardinality:
-                policy=LabelPolicy(
-                    _name=label_name,
-                    _strategy=AggregationStrategy.HASH_BUCKET,
-                    _hash_buckets=100,
-                )
+            if policy_cache is None:
+                policy=self._resolve_policy(metric_name, label_name)
+            else:
+                key=(metric_name, label_name)
+                if key not in policy_cache:
+                    policy_cache[key] = self._resolve_policy(metric_name, label_name)
+                policy=policy_cache[key]
 
             if policy:
-                _transformed=self._apply_policy(policy, label_value)
+                transformed=self._apply_policy(policy, label_value)
                 if transformed is not None:
                     result[label_name] = transformed
                 else:
@@ -579,7 +766,7 @@ class CardinalityController:
 
         elif policy.strategy == AggregationStrategy.REGEX_EXTRACT:
             if policy.regex_pattern:
-                _match=re.search(policy.regex_pattern, value)
+                match=re.search(policy.regex_pattern, value)
                 if match:
                     return match.group(1) if match.groups() else match.group(0)
             return value
@@ -593,8 +780,8 @@ class CardinalityController:
 
     def _hash_labels(self, labels: Dict[str, str]) -> str:
         """Create a hash of label key-value pairs."""
-        _sorted_items=sorted(labels.items())
-        _label_str="&".join(f"{k}={v}" for k, v in sorted_items)
+        sorted_items=sorted(labels.items())
+        label_str="&".join(f"{k}={v}" for k, v in sorted_items)
         return hashlib.sha256(label_str.encode()).hexdigest()[:16]
 
     def detect_high_cardinality(self) -> List[Tuple[str, str, int]]:
@@ -606,7 +793,7 @@ class CardinalityController:
 
         for metric_name, trackers in self.label_trackers.items():
             for label_name, tracker in trackers.items():
-                _cardinality=tracker.get_cardinality()
+                cardinality=tracker.get_cardinality()
                 if cardinality > self.auto_detect_threshold:
                     high_card.append((metric_name, label_name, cardinality))
                     self.detected_high_cardinality.add(label_name)
@@ -632,7 +819,7 @@ class CardinalityController:
         **kwargs,
     ) -> LabelPolicy:
         """Set a policy for a label, either globally or for a specific metric."""
-        _policy=LabelPolicy(name=label_name, strategy=strategy, **kwargs)
+        policy=LabelPolicy(name=label_name, strategy=strategy, **kwargs)
 
         if metric_name:
             self.metric_label_policies[metric_name][label_name] = policy
@@ -647,14 +834,14 @@ class CardinalityController:
 
     def get_cardinality_report(self) -> CardinalityReport:
         """Generate a comprehensive cardinality report."""
-        _total_series=sum(len(s) for s in self.series_by_metric.values())
+        total_series=self.total_series
 
         # Find high cardinality metrics
         high_card_metrics=[]
         top_offenders=[]
 
         for metric_name, metric in self.metrics.items():
-            _series_count=len(self.series_by_metric.get(metric_name, {}))
+            series_count=len(self.series_by_metric.get(metric_name, {}))
             if series_count > self.max_series_per_metric * 0.5:    # >50% of limit
                 high_card_metrics.append(metric_name)
             top_offenders.append((metric_name, series_count))
@@ -664,7 +851,7 @@ class CardinalityController:
         # Generate recommendations
         recommendations=[]
 
-        _high_card_labels=self.detect_high_cardinality()
+        high_card_labels=self.detect_high_cardinality()
         for metric, label, card in high_card_labels[:5]:  # type: ignore[assignment]
             recommendations.append(
                 f"Consider adding policy for '{label}' on '{metric}' "
@@ -678,23 +865,23 @@ class CardinalityController:
             )
 
         # Estimate storage (assuming 2 bytes per sample, 1 sample/15s, 24h)
-        _samples_per_day=total_series * (86400 / 15)
-        _storage_gb=(samples_per_day * 2) / (1024**3)
+        samples_per_day=total_series * (86400 / 15)
+        storage_gb=(samples_per_day * 2) / (1024**3)
 
         return CardinalityReport(
-            _timestamp=datetime.now(timezone.utc),
-            _total_metrics=len(self.metrics),
-            _total_series=total_series,
-            _high_cardinality_metrics=high_card_metrics,
-            _estimated_storage_gb=storage_gb,
-            _recommendations=recommendations,
-            _top_offenders=top_offenders[:10],
+            timestamp=datetime.now(timezone.utc),
+            total_metrics=len(self.metrics),
+            total_series=total_series,
+            high_cardinality_metrics=high_card_metrics,
+            estimated_storage_gb=storage_gb,
+            recommendations=recommendations,
+            top_offenders=top_offenders[:10],
         )
 
-    def prune_stale_series(self, maxage_seconds: float=3600) -> int:
+    def prune_stale_series(self, max_age_seconds: float=3600) -> int:
         """Remove series that haven't received samples recently."""
-        _now=time.time()
-        _pruned=0
+        now=time.time()
+        pruned=0
 
         for metric_name in list(self.series_by_metric.keys()):
             series=self.series_by_metric[metric_name]
@@ -706,6 +893,7 @@ class CardinalityController:
             for h in stale:
                 del series[h]
                 pruned += 1
+            self.total_series -= len(stale)
 
             if metric_name in self.metrics:
                 self.metrics[metric_name].series_count=len(series)
@@ -714,6 +902,185 @@ class CardinalityController:
         return pruned
 
 
+# =============================================================================
+# Sampling Rule Conditions
+# =============================================================================
+_COMPARISONS: Dict[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    # Ordering is numeric, like the original string matcher
+    ast.Gt: lambda a, b: float(a) > float(b),
+    ast.Lt: lambda a, b: float(a) < float(b),
+    ast.GtE: lambda a, b: float(a) >= float(b),
+    ast.LtE: lambda a, b: float(a) <= float(b),
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+}
+_LITERAL_TYPES=(str, int, float, bool, type(None))
+
+
+@lru_cache(maxsize=256)
+def compile_condition(condition: str) -> Predicate:
+    """Compile a sampling condition into a predicate over a context dict.
+
+    Conditions are Python-style boolean expressions, for example
+    "service_name == 'payment' and total_duration_ms > 500". Supported:
+    comparisons (==, !=, <, <=, >, >=, in, not in, chained), and/or/not,
+    string/number/True/False/None literals, tuples or lists of literals and
+    context keys (dotted keys such as http.status_code too). A key missing
+    from the context compares as its own name; a bare key tests truthiness.
+    Anything else (calls, arithmetic, subscripts) raises ValueError - the
+    expression is walked, never passed to eval().
+    """
+    try:
+        tree=ast.parse(condition.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid sampling condition {condition!r}: {e.msg}") from e
+    return _compile_predicate(tree.body, condition)
+
+
+def _compile_predicate(node: ast.AST, condition: str) -> Predicate:
+    if isinstance(node, ast.BoolOp):
+        parts=[_compile_predicate(value, condition) for value in node.values]
+        if isinstance(node.op, ast.And):
+            def all_of(ctx: Dict[str, Any]) -> bool:
+                for part in parts:
+                    if not part(ctx):
+                        return False
+                return True
+            return all_of
+
+        def any_of(ctx: Dict[str, Any]) -> bool:
+            for part in parts:
+                if part(ctx):
+                    return True
+            return False
+        return any_of
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand=_compile_predicate(node.operand, condition)
+        return lambda ctx: not operand(ctx)
+
+    if isinstance(node, ast.Compare):
+        left=_compile_value(node.left, condition)
+        steps=[]
+        for op, comparator in zip(node.ops, node.comparators):
+            compare=_COMPARISONS.get(type(op))
+            if compare is None:
+                raise ValueError(
+                    f"Unsupported operator {type(op).__name__} in sampling condition {condition!r}"
+                )
+            steps.append((compare, _compile_value(comparator, condition)))
+
+        if len(steps) == 1:
+            compare, right=steps[0]
+            return lambda ctx: compare(left(ctx), right(ctx))
+
+        def chain(ctx: Dict[str, Any]) -> bool:
+            current=left(ctx)
+            for compare, right in steps:
+                value=right(ctx)
+                if not compare(current, value):
+                    return False
+                current=value
+            return True
+        return chain
+
+    key=_context_key(node)
+    if key is not None:
+        return lambda ctx: bool(ctx.get(key))
+    value=bool(_literal(node, condition))
+    return lambda ctx: value
+
+
+def _compile_value(node: ast.AST, condition: str) -> Callable[[Dict[str, Any]], Any]:
+    key=_context_key(node)
+    if key is not None:
+        return lambda ctx: ctx.get(key, key)
+    value=_literal(node, condition)
+    return lambda ctx: value
+
+
+def _context_key(node: ast.AST) -> Optional[str]:
+    """Context key for a name or dotted name, else None."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base=_context_key(node.value)
+        return f"{base}.{node.attr}" if base is not None else None
+    return None
+
+
+def _literal(node: ast.AST, condition: str) -> Any:
+    """Constant value of a literal node (signed numbers and sequences included)."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, _LITERAL_TYPES):
+        return node.value
+    if (
+        isinstance(node, ast.UnaryOp)
+        and isinstance(node.op, (ast.USub, ast.UAdd))
+        and isinstance(node.operand, ast.Constant)
+        and isinstance(node.operand.value, (int, float))
+    ):
+        return -node.operand.value if isinstance(node.op, ast.USub) else node.operand.value
+    if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+        return tuple(_literal(element, condition) for element in node.elts)
+    raise ValueError(
+        f"Unsupported expression {type(node).__name__} in sampling condition {condition!r}"
+    )
+
+
+# =============================================================================
+# Latency Window
+# =============================================================================
+class LatencyWindow:
+    """Streaming latency percentile over roughly the last window_size values.
+
+    Two tumbling DDSketch windows (current and the previous full one) stand
+    in for a sliding window: adds are O(1), nothing is stored or sorted, and
+    the percentile is re-read every refresh_interval adds once min_samples
+    values have been seen.
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        window_size: int=1000,
+        min_samples: int=100,
+        refresh_interval: int=100,
+    ) -> None:
+        self.percentile=percentile
+        self.window_size=window_size
+        self.min_samples=min_samples
+        self.refresh_interval=refresh_interval
+        self.current=DDSketch()
+        self.previous: Optional[DDSketch] = None
+        self.threshold: Optional[float] = None
+        self._since_refresh=0
+
+    def __len__(self) -> int:
+        return self.current.count + (self.previous.count if self.previous else 0)
+
+    def add(self, latency: float) -> Optional[float]:
+        """Record a latency; returns the threshold (None until min_samples)."""
+        self.current.add(max(latency, 0.0))
+        if self.current.count >= self.window_size:
+            self.previous=self.current
+            self.current=DDSketch(self.previous.relative_accuracy)
+
+        self._since_refresh += 1
+        if self.threshold is None or self._since_refresh >= self.refresh_interval:
+            if len(self) >= self.min_samples:
+                self.refresh()
+        return self.threshold
+
+    def refresh(self) -> Optional[float]:
+        """Recompute the threshold from both windows."""
+        sketch=self.current if self.previous is None else self.previous.copy().merge(self.current)
+        self.threshold=sketch.percentile(self.percentile)
+        self._since_refresh=0
+        return self.threshold
+
+
 # =============================================================================
 # Adaptive Trace Sampler
 # =============================================================================
@@ -744,9 +1111,9 @@ class AdaptiveSampler:
         self.rules: List[SamplingRule] = []
 
         # Latency tracking for adaptive thresholds
-        self.latency_reservoir: Dict[str, List[float]] = defaultdict(list)
+        self.latency_windows: Dict[str, LatencyWindow] = {}
         self.latency_thresholds: Dict[str, float] = {}    # service -> p99 threshold
-        self.reservoir_size=1000
+        self.reservoir_size=1000    # Latency window per service
 
         # Rate limiting
         self.traces_this_second: Dict[str, int] = defaultdict(int)
@@ -769,40 +1136,40 @@ class AdaptiveSampler:
         # Always sample errors
         self.rules.append(
             SamplingRule(
-                _name="sample_errors",
-                _priority=1,
+                name="sample_errors",
+                priority=1,
                 condition="has_error == True",
-                _sample_rate=1.0,
+                sample_rate=1.0,
             )
         )
 
         # Sample slow traces
         self.rules.append(
             SamplingRule(
-                _name="sample_slow",
-                _priority=2,
+                name="sample_slow",
+                priority=2,
                 condition="is_slow == True",
-                _sample_rate=1.0,
+                sample_rate=1.0,
             )
         )
 
         # Sample payment service at higher rate
         self.rules.append(
             SamplingRule(
-                _name="payment_service",
-                _priority=3,
+                name="payment_service",
+                priority=3,
                 condition="service_name == 'payment'",
-                _sample_rate=0.1,
+                sample_rate=0.1,
             )
         )
 
         # Default rule
         self.rules.append(
             SamplingRule(
-                _name="default",
-                _priority=100,
-                _condition="True",
-                _sample_rate=self.base_sample_rate,
+                name="default",
+                priority=100,
+                condition="True",
+                sample_rate=self.base_sample_rate,
             )
         )
 
@@ -811,19 +1178,19 @@ class AdaptiveSampler:
     ) -> SamplingRule:
         """Add a sampling rule."""
         rule=SamplingRule(
-            _name=name, priority=priority, condition=condition, sample_rate=sample_rate
+            name=name, priority=priority, condition=condition, sample_rate=sample_rate
         )
         self.rules.append(rule)
         self.rules.sort(key=lambda r: r.priority)
         return rule
 
-    def start_trace(self, traceid: str, servicename: str, operation: str) -> None:
+    def start_trace(self, trace_id: str, service_name: str, operation: str) -> None:
         """Start tracking a trace for tail-based sampling."""
         if len(self.pending_traces) >= self.max_pending_traces:
             self._cleanup_old_traces()
 
         self.pending_traces[trace_id] = TraceContext(
-            _trace_id=trace_id, service_name=service_name, operation_name=operation
+            trace_id=trace_id, service_name=service_name, operation_name=operation
         )
 
     def add_span(
@@ -847,28 +1214,28 @@ class AdaptiveSampler:
             ctx.has_error=True
 
         # Check if slow based on service threshold
-        _threshold=self.latency_thresholds.get(ctx.service_name, 1000)
+        threshold=self.latency_thresholds.get(ctx.service_name, 1000)
         if duration_ms > threshold:
             ctx.has_slow_span=True
 
         if tags:
             ctx.tags.update(tags)
 
-    def finish_trace(self, traceid: str) -> SamplingDecision:
+    def finish_trace(self, trace_id: str) -> SamplingDecision:
         """Finish a trace and make final sampling decision."""
         if trace_id not in self.pending_traces:
             return SamplingDecision.DROPPED
 
-        _ctx=self.pending_traces.pop(trace_id)
+        ctx=self.pending_traces.pop(trace_id)
         self.total_traces += 1
 
-        # Update latency reservoir for adaptive thresholds
+        # Update latency window for adaptive thresholds
         if ctx.span_latencies:
-            _max_latency=max(ctx.span_latencies)
-            self._update_latency_reservoir(ctx.service_name, max_latency)
+            max_latency=max(ctx.span_latencies)
+            self._update_latency_threshold(ctx.service_name, max_latency)
 
         # Evaluate rules
-        _decision=self._evaluate_rules(ctx)
+        decision=self._evaluate_rules(ctx)
 
         if decision == SamplingDecision.SAMPLED:
         # Check rate limit
@@ -882,16 +1249,16 @@ class AdaptiveSampler:
         self.dropped_traces += 1
         return decision
 
-    def should_sample(self, tracecontext: Dict[str, Any]) -> bool:
+    def should_sample(self, trace_context: Dict[str, Any]) -> bool:
         """Quick head-based sampling check (for compatibility)."""
         # Always sample errors
         if trace_context.get("error"):
             return True
 
         # Sample slow requests
-        _latency=trace_context.get("latency_ms", 0)
-        _service=trace_context.get("service", "default")
-        _threshold=self.latency_thresholds.get(service, 1000)
+        latency=trace_context.get("latency_ms", 0)
+        service=trace_context.get("service", "default")
+        threshold=self.latency_thresholds.get(service, 1000)
 
         if latency > threshold:
             return True
@@ -906,7 +1273,7 @@ class AdaptiveSampler:
     def _evaluate_rules(self, ctx: TraceContext) -> SamplingDecision:
         """Evaluate sampling rules against trace context."""
         # Build evaluation context
-        _eval_ctx={
+        eval_ctx={
             "trace_id": ctx.trace_id,
             "service_name": ctx.service_name,
             "operation_name": ctx.operation_name,
@@ -923,8 +1290,8 @@ class AdaptiveSampler:
                 continue
 
             try:
-            # Safe evaluation of condition
-                if self._evaluate_condition(rule.condition, eval_ctx):
+                # Precompiled condition; values may still fail to compare
+                if rule.predicate(eval_ctx):
                     rule.hit_count += 1
                     if random.random() < rule.sample_rate:
                         return SamplingDecision.SAMPLED
@@ -937,77 +1304,27 @@ class AdaptiveSampler:
         return SamplingDecision.DROPPED
 
     def _evaluate_condition(self, condition: str, context: Dict[str, Any]) -> bool:
-        """Safely evaluate a condition expression."""
-        # Simple parser for basic conditions
-        # Supports: ==, !=, >, <, >=, <=, and, or, True, False
-
-        if condition == "True":
-            return True
-        if condition == "False":
-            return False
-
-        # Handle simple comparisons
-        for op in ["==", "!=", ">=", "<=", ">", "<"]:
-            if op in condition:
-                _parts=condition.split(op, 1)
-                if len(parts) == 2:
-                    _left=parts[0].strip()
-                    _right=parts[1].strip()
-
-                    # Get left value
-                    _left_val=context.get(left, left)
-
-                    # Parse right value
-                    if right.startswith("'") and right.endswith("'"):
-                        right_val=right[1:-1]
-                    elif right == "True":
-                        right_val=True  # type: ignore[assignment]
-                    elif right == "False":
-                        right_val=False  # type: ignore[assignment]
-                    elif right.replace(".", "").isdigit():
-                        _right_val=float(right)  # type: ignore[assignment]
-                    else:
-                        _right_val=context.get(right, right)
-
-                    if op == "==":
-                        return left_val == right_val
-                    elif op == "!=":
-                        return left_val != right_val
-                    elif op == ">":
-                        return float(left_val) > float(right_val)
-                    elif op == "<":
-                        return float(left_val) < float(right_val)
-                    elif op == ">=":
-                        return float(left_val) >= float(right_val)
-                    elif op == "<=":
-                        return float(left_val) <= float(right_val)
-
-        return False
+        """Safely evaluate a condition expression (compiled once per string)."""
+        return compile_condition(condition)(context)
 
     def _match_rule(self, rule: SamplingRule, context: Dict[str, Any]) -> bool:
         """Check if a rule matches the context."""
-        return self._evaluate_condition(rule.condition, context)
-
-    def _update_latency_reservoir(self, service: str, latency: float) -> None:
-        """Update latency reservoir for adaptive thresholds."""
-        reservoir=self.latency_reservoir[service]
-        reservoir.append(latency)
-
-        # Keep reservoir bounded
-        if len(reservoir) > self.reservoir_size:
-            reservoir.pop(0)
-
-        # Update threshold (p99)
-        if len(reservoir) >= 100:
-            _sorted_latencies=sorted(reservoir)
-            _idx=int(len(sorted_latencies) * self.latency_percentile_target / 100)
-            self.latency_thresholds[service] = sorted_latencies[
-                min(idx, len(sorted_latencies) - 1)
-            ]
+        return rule.predicate(context)
+
+    def _update_latency_threshold(self, service: str, latency: float) -> None:
+        """Feed a service's latency window and adopt its refreshed threshold (p99)."""
+        window=self.latency_windows.get(service)
+        if window is None:
+            window=self.latency_windows[service] = LatencyWindow(
+                self.latency_percentile_target, window_size=self.reservoir_size
+            )
+        threshold=window.add(latency)
+        if threshold is not None:
+            self.latency_thresholds[service] = threshold
 
     def _check_rate_limit(self, service: str) -> bool:
         """Check if rate limit allows sampling."""
-        _current=int(time.time())
+        current=int(time.time())
 
         if current != self.current_second:
             self.traces_this_second.clear()
@@ -1021,7 +1338,7 @@ class AdaptiveSampler:
 
     def _cleanup_old_traces(self) -> None:
         """Clean up traces that have timed out."""
-        _now=time.time()
+        now=time.time()
         old_traces=[
             tid
             for tid, ctx in self.pending_traces.items()
@@ -1062,17 +1379,17 @@ class RetentionManager:
     - Cost-aware tier transitions
     """
 
-    def __init__(self, storagebackend: Optional[Any] = None) -> None:
+    def __init__(self, storage_backend: Optional[Any] = None) -> None:
         self.storage_backend=storage_backend
         self.policies: Dict[str, RetentionPolicy] = {}
         self.default_policy=RetentionPolicy(
-            _name="default",
-            _metric_pattern=".*",
-            _hot_duration=timedelta(hours=24),
-            _warm_duration=timedelta(days=7),
-            _cold_duration=timedelta(days=30),
-            _archive_duration=timedelta(days=365),
-            _downsample_resolution={
+            name="default",
+            metric_pattern=".*",
+            hot_duration=timedelta(hours=24),
+            warm_duration=timedelta(days=7),
+            cold_duration=timedelta(days=30),
+            archive_duration=timedelta(days=365),
+            downsample_resolution={
                 RetentionTier.HOT: 15,    # 15s resolution
                 RetentionTier.WARM: 60,    # 1m resolution
                 RetentionTier.COLD: 300,    # 5m resolution
@@ -1090,14 +1407,14 @@ class RetentionManager:
         archive_days: int=365,
     ) -> RetentionPolicy:
         """Add a retention policy."""
-        _policy=RetentionPolicy(
-            _name=name,
-            _metric_pattern=metric_pattern,
-            _hot_duration=timedelta(hours=hot_hours),
-            _warm_duration=timedelta(days=warm_days),
-            _cold_duration=timedelta(days=cold_days),
-            _archive_duration=timedelta(days=archive_days),
-            _downsample_resolution={
+        policy=RetentionPolicy(
+            name=name,
+            metric_pattern=metric_pattern,
+            hot_duration=timedelta(hours=hot_hours),
+            warm_duration=timedelta(days=warm_days),
+            cold_duration=timedelta(days=cold_days),
+            archive_duration=timedelta(days=archive_days),
+            downsample_resolution={
                 RetentionTier.HOT: 15,
                 RetentionTier.WARM: 60,
                 RetentionTier.COLD: 300,
@@ -1107,16 +1424,16 @@ class RetentionManager:
         self.policies[name] = policy
         return policy
 
-    def get_policy_for_metric(self, metricname: str) -> RetentionPolicy:
+    def get_policy_for_metric(self, metric_name: str) -> RetentionPolicy:
         """Get the retention policy for a metric."""
         for policy in self.policies.values():
             if re.match(policy.metric_pattern, metric_name):
                 return policy
         return self.default_policy
 
-    def get_tier_for_age(self, metricname: str, dataage: timedelta) -> RetentionTier:
+    def get_tier_for_age(self, metric_name: str, data_age: timedelta) -> RetentionTier:
         """Determine storage tier based on data age."""
-        _policy=self.get_policy_for_metric(metric_name)
+        policy=self.get_policy_for_metric(metric_name)
 
         if data_age <= policy.hot_duration:
             return RetentionTier.HOT
@@ -1141,9 +1458,9 @@ class RetentionManager:
         self, metric_name: str, current_resolution: int, data_age: timedelta
     ) -> Optional[int]:
         """Check if data should be downsampled, return target resolution."""
-        _policy=self.get_policy_for_metric(metric_name)
-        _tier=self.get_tier_for_age(metric_name, data_age)
-        _target_resolution=policy.downsample_resolution.get(tier, current_resolution)
+        policy=self.get_policy_for_metric(metric_name)
+        tier=self.get_tier_for_age(metric_name, data_age)
+        target_resolution=policy.downsample_resolution.get(tier, current_resolution)
 
         if target_resolution > current_resolution:
             return target_resolution
@@ -1153,17 +1470,17 @@ class RetentionManager:
         self, series_count: int, sample_rate_seconds: int=15, duration_days: int=30
     ) -> Dict[str, float]:
         """Estimate storage cost for given parameters."""
-        _samples_per_day=series_count * (86400 / sample_rate_seconds)
+        samples_per_day=series_count * (86400 / sample_rate_seconds)
         bytes_per_sample=16    # Approximate: 8 bytes value + 8 bytes timestamp
 
         # Calculate storage per tier (simplified)
         hot_samples=samples_per_day    # 1 day at full res
-        _warm_samples=samples_per_day * 6 / 4    # 6 days at 1/4 res (1m vs 15s)
+        warm_samples=samples_per_day * 6 / 4    # 6 days at 1/4 res (1m vs 15s)
         cold_samples=samples_per_day * 23 / 20    # 23 days at 1/20 res
 
-        _hot_gb=(hot_samples * bytes_per_sample) / (1024**3)
-        _warm_gb=(warm_samples * bytes_per_sample) / (1024**3)
-        _cold_gb=(cold_samples * bytes_per_sample) / (1024**3)
+        hot_gb=(hot_samples * bytes_per_sample) / (1024**3)
+        warm_gb=(warm_samples * bytes_per_sample) / (1024**3)
+        cold_gb=(cold_samples * bytes_per_sample) / (1024**3)
 
         # Cost estimates (example rates)
         return {
@@ -1198,7 +1515,7 @@ class ObservabilityController:
         storage_path: Optional[Path] = None,
     ):
         self.cardinality=CardinalityController(
-            _max_total_series=max_series, storage_path=storage_path
+            max_total_series=max_series, storage_path=storage_path
         )
         self.sampler=AdaptiveSampler(base_sample_rate=base_sample_rate)
         self.retention=RetentionManager()
@@ -1216,14 +1533,22 @@ class ObservabilityController:
         """Process a metric through cardinality control."""
         return self.cardinality.process_sample(name, labels, value, timestamp)
 
+    def process_metrics(
+        self,
+        samples: Iterable[Tuple[str, Dict[str, str], float]],
+        timestamp: Optional[float] = None,
+    ) -> List[Tuple[Dict[str, str], bool]]:
+        """Process a batch of (name, labels, value) metrics through cardinality control."""
+        return self.cardinality.process_samples(samples, timestamp)
+
     def should_sample_trace(self, context: Dict[str, Any]) -> bool:
         """Determine if a trace should be sampled."""
         return self.sampler.should_sample(context)
 
     def get_unified_report(self) -> Dict[str, Any]:
         """Get unified observability report."""
-        _card_report=self.cardinality.get_cardinality_report()
-        _sampler_stats=self.sampler.get_stats()
+        card_report=self.cardinality.get_cardinality_report()
+        sampler_stats=self.sampler.get_stats()
 
         return {
             "uptime_hours": (
@@ -1247,9 +1572,9 @@ class ObservabilityController:
 # CLI / Demo
 # =============================================================================
 
-if _name__== "__main__":
+if __name__ == "__main__":
     logging.basicConfig(
-        _level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+        level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
     )
 
     print("=" * 60)
@@ -1257,7 +1582,7 @@ if _name__== "__main__":
     print("=" * 60)
 
     # Initialize controller
-    _controller=ObservabilityController(max_series=100000, base_sample_rate=0.01)
+    controller=ObservabilityController(max_series=100000, base_sample_rate=0.01)
 
     # Simulate metric ingestion
     print("\n[Metric Cardinality Control]")
@@ -1274,7 +1599,7 @@ if _name__== "__main__":
                 "method": rnd.choice(["GET", "POST", "PUT"]),    # nosec B311
                 "status": rnd.choice(["200", "201", "400", "500"]),    # nosec B311
             },
-            _value=rnd.random() * 100,    # nosec B311
+            value=rnd.random() * 100,    # nosec B311
         )
 
         # High cardinality metric (with pod_id)
@@ -1285,7 +1610,7 @@ if _name__== "__main__":
                 "pod_id": f"pod-{rnd.randint(1, 500)}",    # High cardinality! # nosec B311
                 "node": rnd.choice(["node-1", "node-2", "node-3"]),    # nosec B311
             },
-            _value=rnd.random() * 100,    # nosec B311
+            value=rnd.random() * 100,    # nosec B311
         )
 
         # Very high cardinality (with client_ip)
@@ -1298,11 +1623,11 @@ if _name__== "__main__":
                     ["/api/v1/users", "/api/v1/orders"]
                 ),    # nosec B311
             },
-            _value=rnd.random() * 1000,    # nosec B311
+            value=rnd.random() * 1000,    # nosec B311
         )
 
     # Get cardinality report
-    _report=controller.cardinality.get_cardinality_report()
+    report=controller.cardinality.get_cardinality_report()
     print(f"\nTotal metrics: {report.total_metrics}")
     print(f"Total series: {report.total_series}")
     print(f"Estimated storage: {report.estimated_storage_gb:.2f} GB/day")
@@ -1311,7 +1636,7 @@ if _name__== "__main__":
         print(f"  - {metric}: {count} series")
 
     # Detect high cardinality
-    _high_card=controller.cardinality.detect_high_cardinality()
+    high_card=controller.cardinality.detect_high_cardinality()
     if high_card:
         print("\nHigh cardinality labels detected:")
         for metric, label, card in high_card[:5]:
@@ -1320,8 +1645,8 @@ if _name__== "__main__":
     # Simulate trace sampling
     print("\n[Trace Sampling]")
 
-    _sampler=controller.sampler
-    _sampled_count=0
+    sampler=controller.sampler
+    sampled_count=0
 
     for i in range(1000):
         trace_ctx={
@@ -1338,14 +1663,14 @@ if _name__== "__main__":
     print(f"Sampled {sampled_count}/1000 traces ({sampled_count / 10:.1f}%)")
 
     # Show sampler stats
-    _stats=sampler.get_stats()
+    stats=sampler.get_stats()
     print("\nSampler rules:")
     for rule in stats["rules"]:
         print(f"  - {rule['name']}: {rule['hits']} hits (rate: {rule['rate']})")
 
     # Unified report
     print("\n[Unified Report]")
-    _unified=controller.get_unified_report()
+    unified=controller.get_unified_report()
     print(f"Uptime: {unified['uptime_hours']:.2f} hours")
     print(f"Total series: {unified['cardinality']['total_series']}")
     print(
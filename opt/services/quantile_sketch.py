@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Mergeable quantile sketches for latency percentiles.
+
+DDSketch-style sketch: values are mapped to logarithmically sized bins so
+that every reported quantile is within a fixed *relative* error of the true
+value (1% by default), independent of the data distribution.
+
+Features:
+- O(1) insertion, no stored samples and no sorting on query
+- Bounded memory: at most ``max_bins`` bins; when exceeded, the lowest
+  bins are collapsed so tail percentiles (p95/p99) keep their guarantee
+- Exact, order-independent merging of sketches with the same accuracy,
+  so per-node sketches combine into fleet-wide percentiles
+- Compact dict form for shipping sketches between processes
+- Vectorised bulk insertion with NumPy when available
+
+Accuracy / memory tradeoff (see tests/benchmarks/test_quantile_sketch_benchmark.py):
+a 1% sketch covering 1 microsecond to 1 hour needs roughly 1,100 bins; a 2%
+sketch about half that.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+MIN_INDEXABLE_VALUE = 1e-9    # Smaller values are counted as zero
+
+
+# =============================================================================
+# DDSketch
+# =============================================================================
+@dataclass
+class SketchSummary:
+    """Point-in-time percentiles extracted from a sketch."""
+
+    count: int
+    min: float
+    max: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "count": self.count,
+            "min": round(self.min, 4),
+            "max": round(self.max, 4),
+            "mean": round(self.mean, 4),
+            "p50": round(self.p50, 4),
+            "p95": round(self.p95, 4),
+            "p99": round(self.p99, 4),
+        }
+
+
+class DDSketch:
+    """
+    Relative-error quantile sketch for non-negative values.
+
+    Example:
+        sketch = DDSketch(relative_accuracy=0.01)
+        for latency_ms in samples:
+            sketch.add(latency_ms)
+        p99 = sketch.percentile(99)
+
+        fleet = DDSketch.from_dict(node_a_dict)
+        fleet.merge(DDSketch.from_dict(node_b_dict))
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS,
+    ) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_bins < 2:
+            raise ValueError("max_bins must be at least 2")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.collapsed = False    # Lowest bins were merged to respect max_bins
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint of (gamma^(i-1), gamma^i] with relative error <= alpha
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    # -------------------------------------------------------------------------
+    # Insertion
+    # -------------------------------------------------------------------------
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add ``value`` (``weight`` times)."""
+        if value < 0 or value != value:
+            raise ValueError(f"DDSketch only accepts non-negative values, got {value}")
+        if value < MIN_INDEXABLE_VALUE:
+            self.zero_count += weight
+        else:
+            index = self._index(value)
+            self.bins[index] = self.bins.get(index, 0) + weight
+            if len(self.bins) > self.max_bins:
+                self._collapse()
+        self.count += weight
+        self.sum += value * weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Add many values; vectorised when NumPy is available."""
+        if not HAS_NUMPY:
+            for value in values:
+                self.add(value)
+            return
+
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        data = np.asarray(values, dtype=np.float64)
+        if data.size == 0:
+            return
+        if np.isnan(data).any() or (data < 0).any():
+            raise ValueError("DDSketch only accepts non-negative values")
+        positive = data[data >= MIN_INDEXABLE_VALUE]
+        self.zero_count += int(data.size - positive.size)
+        if positive.size:
+            indexes = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            unique, counts = np.unique(indexes, return_counts=True)
+            bins = self.bins
+            for index, count in zip(unique.tolist(), counts.tolist()):
+                bins[index] = bins.get(index, 0) + count
+            if len(bins) > self.max_bins:
+                self._collapse()
+        self.count += int(data.size)
+        self.sum += float(data.sum())
+        self.min = min(self.min, float(data.min()))
+        self.max = max(self.max, float(data.max()))
+
+    def _collapse(self) -> None:
+        """Fold the lowest bins into one so at most ``max_bins`` remain."""
+        indexes = sorted(self.bins)
+        excess = len(indexes) - self.max_bins + 1
+        target = indexes[excess]
+        folded = sum(self.bins.pop(index) for index in indexes[:excess])
+        self.bins[target] += folded
+        self.collapsed = True
+
+    # -------------------------------------------------------------------------
+    # Merging and serialization
+    # -------------------------------------------------------------------------
+    def merge(self, other: "DDSketch") -> "DDSketch":
+        """Fold ``other`` into this sketch; both must share an accuracy."""
+        if not math.isclose(self.gamma, other.gamma, rel_tol=1e-12):
+            raise ValueError(
+                "Cannot merge sketches with different relative accuracy "
+                f"({self.relative_accuracy} vs {other.relative_accuracy})"
+            )
+        if not other.count:
+            return self
+        bins = self.bins
+        for index, count in other.bins.items():
+            bins[index] = bins.get(index, 0) + count
+        if len(bins) > self.max_bins:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.collapsed = self.collapsed or other.collapsed
+        return self
+
+    def copy(self) -> "DDSketch":
+        """Independent copy of this sketch."""
+        clone = DDSketch(self.relative_accuracy, self.max_bins)
+        return clone.merge(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form (JSON/msgpack friendly)."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "bins": {str(index): count for index, count in self.bins.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "collapsed": self.collapsed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DDSketch":
+        """Rebuild a sketch produced by ``to_dict``."""
+        sketch = cls(
+            relative_accuracy=data["relative_accuracy"],
+            max_bins=data.get("max_bins", DEFAULT_MAX_BINS),
+        )
+        sketch.bins = {int(index): int(count) for index, count in data["bins"].items()}
+        sketch.zero_count = int(data.get("zero_count", 0))
+        sketch.count = int(data["count"])
+        sketch.sum = float(data.get("sum", 0.0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        sketch.collapsed = bool(data.get("collapsed", False))
+        return sketch
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile ``q`` (0..1); None for an empty sketch."""
+        return self.quantiles([q])[0]
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Value at percentile ``p`` (0..100); None for an empty sketch."""
+        return self.quantile(p / 100)
+
+    def quantiles(self, qs: List[float]) -> List[Optional[float]]:
+        """Several quantiles with a single walk over the bins."""
+        if any(not 0 <= q <= 1 for q in qs):
+            raise ValueError("quantiles must be between 0 and 1")
+        if not self.count:
+            return [None] * len(qs)
+
+        order = sorted(range(len(qs)), key=lambda n: qs[n])
+        results: List[Optional[float]] = [None] * len(qs)
+        indexes = sorted(self.bins)
+        position = 0
+        cumulative = self.zero_count
+        for n in order:
+            rank = qs[n] * (self.count - 1)
+            if rank < self.zero_count:
+                results[n] = max(self.min, 0.0)
+                continue
+            while position < len(indexes) and cumulative <= rank:
+                cumulative += self.bins[indexes[position]]
+                position += 1
+            value = self._value(indexes[position - 1]) if position else self.max
+            results[n] = min(max(value, self.min), self.max)
+        return results
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of all added values."""
+        return self.sum / self.count if self.count else 0.0
+
+    def summary(self) -> SketchSummary:
+        """Count, extremes, mean and the usual latency percentiles."""
+        if not self.count:
+            return SketchSummary(0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        p50, p95, p99 = self.quantiles([0.5, 0.95, 0.99])
+        return SketchSummary(
+            count=self.count,
+            min=self.min,
+            max=self.max,
+            mean=self.mean,
+            p50=p50 or 0.0,
+            p95=p95 or 0.0,
+            p99=p99 or 0.0,
+        )
+
+
+def merge_sketches(sketches: Iterable[DDSketch]) -> Optional[DDSketch]:
+    """Merge sketches (e.g. one per node) into a new sketch; None if empty."""
+    result: Optional[DDSketch] = None
+    for sketch in sketches:
+        if result is None:
+            result = sketch.copy()
+        else:
+            result.merge(sketch)
+    return result
@@ -25,24 +25,50 @@ Additional security features:
 - Certificate pinning support
 - Subject validation
 - Expiration monitoring
+- Bounded TTL cache of verified credentials, invalidated on key
+  revocation and rotation
 
 Extracts identity from certificates, API keys, or JWT tokens
 and validates them before passing to handlers.
 """
 
+from collections import OrderedDict
 from datetime import datetime, timezone
 import grpc
 import jwt
 import hashlib
+import hmac
 import os
 import base64
 import logging
-from typing import Optional, List, Dict, Any, Callable
+import secrets
+import threading
+import time
+from typing import Optional, List, Dict, Any, Callable, Set, Tuple
 from cryptography import x509
 from cryptography.x509.oid import NameOID
 from cryptography.hazmat.backends import default_backend
 
-_logger=logging.getLogger(__name__)
+logger=logging.getLogger(__name__)
+
+
+def _cert_time(cert: x509.Certificate, name: str) -> datetime:
+    """Timezone-aware certificate validity bound (not_valid_before/after)."""
+    value=getattr(cert, f"{name}_utc", None)
+    if value is None:
+        value=getattr(cert, name).replace(tzinfo=timezone.utc)
+    return value
+
+
+def _expiry_timestamp(value: Any) -> float:
+    """Epoch seconds for an expiry given as datetime, ISO string or number."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value=datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value=value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
 
 
 class ClientCertificateValidator:
@@ -84,8 +110,8 @@ class ClientCertificateValidator:
         """Load CA certificate."""
         try:
             with open(self.ca_cert_path, "rb") as f:
-                _cert_data=f.read()
-            _cert=x509.load_pem_x509_certificate(cert_data, default_backend())
+                cert_data=f.read()
+            cert=x509.load_pem_x509_certificate(cert_data, default_backend())
             logger.info(f"Loaded CA certificate from {self.ca_cert_path}")
             return cert
         except Exception as e:
@@ -99,8 +125,8 @@ class ClientCertificateValidator:
 
         try:
             with open(self.crl_path, "rb") as f:
-                _crl_data=f.read()
-            _crl=x509.load_pem_x509_crl(crl_data, default_backend())
+                crl_data=f.read()
+            crl=x509.load_pem_x509_crl(crl_data, default_backend())
             logger.info(f"Loaded CRL from {self.crl_path}")
             return crl
         except Exception as e:
@@ -144,20 +170,22 @@ class ClientCertificateValidator:
         }
 
         try:
-            _cert=x509.load_der_x509_certificate(cert_der, default_backend())
+            cert=x509.load_der_x509_certificate(cert_der, default_backend())
 
             # Extract info
             result["subject"] = cert.subject.rfc4514_string()
             result["issuer"] = cert.issuer.rfc4514_string()
-            result["not_before"] = cert.not_valid_before
-            result["not_after"] = cert.not_valid_after
+            not_before=_cert_time(cert, "not_valid_before")
+            not_after=_cert_time(cert, "not_valid_after")
+            result["not_before"] = not_before
+            result["not_after"] = not_after
             result["serial_number"] = cert.serial_number
 
             # Check expiration
-            _now=datetime.now(timezone.utc)
-            if now < cert.not_valid_before:
+            now=datetime.now(timezone.utc)
+            if now < not_before:
                 result["errors"].append("Certificate not yet valid")
-            if now > cert.not_valid_after:
+            if now > not_after:
                 result["errors"].append("Certificate expired")
 
             # Check issuer matches CA
@@ -166,7 +194,7 @@ class ClientCertificateValidator:
 
             # Check certificate pinning
             if self.pinned_certs:
-                _cert_hash=hashlib.sha256(cert_der).hexdigest()
+                cert_hash=hashlib.sha256(cert_der).hexdigest()
                 if cert_hash in self.pinned_certs:
                     result["pinned"] = True
                 else:
@@ -211,7 +239,7 @@ class ClientCertificateValidator:
             logger.warning(f"Error checking CRL: {e}")
             return False
 
-    def get_subject_cn(self, certder: bytes) -> Optional[str]:
+    def get_subject_cn(self, cert_der: bytes) -> Optional[str]:
         """
         Extract CN (Common Name) from certificate subject.
 
@@ -222,8 +250,8 @@ class ClientCertificateValidator:
             CN value or None
         """
         try:
-            _cert=x509.load_der_x509_certificate(cert_der, default_backend())
-            _cn_list=cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
+            cert=x509.load_der_x509_certificate(cert_der, default_backend())
+            cn_list=cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)
             if cn_list:
                 val=cn_list[0].value
                 if isinstance(val, bytes):
@@ -277,6 +305,175 @@ def extract_identity(context: grpc.ServicerContext) -> Optional[Identity]:
     return getattr(context, "_identity", None)
 
 
+class VerifiedCredentialCache:
+    """
+    Bounded TTL cache of verified identities.
+
+    Verifying a credential is expensive (PBKDF2 for API keys, signature
+    checks for JWTs, certificate parsing for mTLS) while clients present
+    the same credential on every call. Successful verifications are kept
+    here so repeat calls cost one keyed digest and a dict lookup.
+
+    - Entries are keyed by HMAC-SHA256 of the credential under a random
+      per-process key; raw credentials are never stored
+    - Each entry expires at the earlier of the cache TTL and the
+      credential's own expiry (API key expires_at, JWT exp, cert not_after)
+    - Least recently used entries are evicted beyond max_entries
+    - Entries are indexed by principal and key ID so revocation and
+      rotation events can drop them immediately
+    - Failed verifications are never cached
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float=300.0,
+        max_entries: int=10000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize credential cache.
+
+        Args:
+            ttl_seconds: Maximum lifetime of an entry
+            max_entries: Maximum number of cached credentials
+            clock: Time source returning epoch seconds
+        """
+        self.ttl_seconds=ttl_seconds
+        self.max_entries=max_entries
+        self.clock=clock
+        self._digest_key=secrets.token_bytes(32)
+        self._entries: "OrderedDict[bytes, Tuple[Identity, float, Optional[str]]]" = OrderedDict()
+        self._by_principal: Dict[str, Set[bytes]] = {}
+        self._by_key_id: Dict[str, Set[bytes]] = {}
+        self._lock=threading.Lock()
+        self.hits=0
+        self.misses=0
+        self.evictions=0
+        self.invalidations=0
+
+    def digest(self, kind: str, credential: str) -> bytes:
+        """Keyed digest identifying a credential of the given kind."""
+        return hmac.digest(self._digest_key, f"{kind}\0{credential}".encode(), "sha256")
+
+    def get(self, kind: str, credential: str) -> Optional[Identity]:
+        """
+        Return a fresh Identity for a cached credential.
+
+        Args:
+            kind: Credential kind ('mtls', 'api-key', 'jwt')
+            credential: Credential as presented by the client
+
+        Returns:
+            Identity copy, or None if not cached or expired
+        """
+        key=self.digest(kind, credential)
+        with self._lock:
+            entry=self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            identity, expires_at, _ = entry
+            if self.clock() >= expires_at:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return Identity(identity.principal_id, identity.auth_method, list(identity.permissions))
+
+    def put(
+        self,
+        kind: str,
+        credential: str,
+        identity: Identity,
+        expires_at: Optional[float] = None,
+        key_id: Optional[str] = None,
+    ) -> None:
+        """
+        Cache a successfully verified credential.
+
+        Args:
+            kind: Credential kind
+            credential: Credential as presented by the client
+            identity: Verified identity
+            expires_at: Credential expiry (epoch seconds), if any
+            key_id: Storage key ID, for revocation by key
+        """
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        deadline=self.clock() + self.ttl_seconds
+        if expires_at is not None:
+            deadline=min(deadline, expires_at)
+        key=self.digest(kind, credential)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (identity, deadline, key_id)
+            self._by_principal.setdefault(identity.principal_id, set()).add(key)
+            if key_id:
+                self._by_key_id.setdefault(key_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_principal(self, principal_id: str) -> int:
+        """Drop every cached credential of a principal."""
+        with self._lock:
+            return self._invalidate(self._by_principal.get(principal_id))
+
+    def invalidate_key_id(self, key_id: str) -> int:
+        """Drop every cached credential verified against a storage key."""
+        with self._lock:
+            return self._invalidate(self._by_key_id.get(key_id))
+
+    def invalidate(self, kind: str, credential: str) -> bool:
+        """Drop one cached credential."""
+        with self._lock:
+            return self._invalidate({self.digest(kind, credential)}) > 0
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._by_principal.clear()
+            self._by_key_id.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit/miss counters."""
+        with self._lock:
+            lookups=self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _invalidate(self, keys: Optional[Set[bytes]]) -> int:
+        removed=0
+        for key in list(keys or ()):
+            if key in self._entries:
+                self._remove(key)
+                removed += 1
+        self.invalidations += removed
+        return removed
+
+    def _remove(self, key: bytes) -> None:
+        identity, _, key_id = self._entries.pop(key)
+        for index, name in ((self._by_principal, identity.principal_id), (self._by_key_id, key_id)):
+            keys=index.get(name) if name else None
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[name]
+
+
 class AuthenticationInterceptor(grpc.ServerInterceptor):
     """
     Authenticate requests using mTLS, API keys, or JWT tokens.
@@ -288,8 +485,21 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
 
     If any method succeeds, sets context._identity for the handler.
     If all methods fail, terminates RPC with UNAUTHENTICATED status.
+
+    Successful verifications are kept in a VerifiedCredentialCache so a
+    client presenting the same credential is not re-verified on every call.
+    Attach key managers with attach_key_manager() so revocations and
+    rotations evict cached keys immediately; otherwise staleness is bounded
+    by credential_cache_ttl.
     """
 
+    API_KEY_HASH_ITERATIONS=600000
+
+    # Key manager events after which a cached API key must be re-verified
+    KEY_INVALIDATION_EVENTS=frozenset(
+        {"key_rotated", "key_revoked", "key_expired", "key_removed", "grace_period_ended"}
+    )
+
     def __init__(self, config: Dict[str, Any]) -> None:
         """
         Initialize authentication interceptor.
@@ -303,24 +513,35 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
                 - pinned_certs: List of pinned certificate hashes
                 - check_crl: Whether to check certificate revocation
                 - crl_path: Path to CRL file
+                - credential_cache_enabled: Cache verified credentials (default True)
+                - credential_cache_ttl: Seconds a verified credential is trusted (default 300)
+                - credential_cache_size: Maximum cached credentials (default 10000)
         """
         self.config=config
         self.jwt_public_key=self._load_jwt_public_key()
         self.principals_cache: Dict[str, Any] = {}    # Cache for principals and their permissions
 
         # Initialize client certificate validator
-        _ca_cert_path=config.get("ca_cert_path")
+        ca_cert_path=config.get("ca_cert_path")
         self.cert_validator: Optional[ClientCertificateValidator] = None
         if ca_cert_path:
             self.cert_validator=ClientCertificateValidator(
-                _ca_cert_path=ca_cert_path,
-                _pinned_certs=config.get("pinned_certs"),
-                _check_revocation=config.get("check_crl", False),
-                _crl_path=config.get("crl_path"),
+                ca_cert_path=ca_cert_path,
+                pinned_certs=config.get("pinned_certs"),
+                check_revocation=config.get("check_crl", False),
+                crl_path=config.get("crl_path"),
+            )
+
+        # Verified credential cache
+        self.credential_cache: Optional[VerifiedCredentialCache] = None
+        if config.get("credential_cache_enabled", True):
+            self.credential_cache=VerifiedCredentialCache(
+                ttl_seconds=config.get("credential_cache_ttl", 300.0),
+                max_entries=config.get("credential_cache_size", 10000),
             )
 
         # Initialize and validate API_KEY_SALT for PBKDF2 hashing
-        _api_key_salt=os.getenv("API_KEY_SALT")
+        api_key_salt=os.getenv("API_KEY_SALT")
         if not api_key_salt:
             raise ValueError("API_KEY_SALT environment variable must be set")
         self.api_key_salt=api_key_salt.encode()
@@ -331,19 +552,70 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
 
     def _load_jwt_public_key(self) -> Optional[str]:
         """Load JWT public key for verification"""
-        _key_path=self.config.get("jwt_public_key_file")
+        key_path=self.config.get("jwt_public_key_file")
         if not key_path:
             return None
 
         try:
             with open(key_path, "r") as f:
-                _key=f.read()
+                key=f.read()
             logger.info(f"JWT public key loaded from {key_path}")
             return key
         except Exception as e:
             logger.warning(f"Failed to load JWT public key: {e}")
             return None
 
+    def attach_key_manager(self, manager: Any) -> None:
+        """
+        Evict cached API keys on a key manager's revocation/rotation events.
+
+        Args:
+            manager: APIKeyManager (register_listener) or
+                APIKeyRotationManager (register_notification_callback)
+        """
+        register=getattr(manager, "register_listener", None) or getattr(
+            manager, "register_notification_callback"
+        )
+        register(self._on_key_event)
+
+    def _on_key_event(self, event_type: str, api_key: Any, details: Dict[str, Any]) -> None:
+        """Key manager callback: drop cached credentials of the affected key."""
+        if self.credential_cache is None or event_type not in self.KEY_INVALIDATION_EVENTS:
+            return
+        key_id=getattr(api_key, "key_id", None)
+        if key_id:
+            self.credential_cache.invalidate_key_id(key_id)
+        principal_id=getattr(api_key, "principal_id", None) or getattr(
+            api_key, "service_name", None
+        )
+        if principal_id:
+            self.credential_cache.invalidate_principal(principal_id)
+        logger.debug(f"Credential cache invalidated for key {key_id} ({event_type})")
+
+    def _cached_identity(self, kind: str, credential: str) -> Optional[Identity]:
+        """Identity for a previously verified credential, if still cached."""
+        if self.credential_cache is None:
+            return None
+        return self.credential_cache.get(kind, credential)
+
+    def _cache_identity(
+        self,
+        credential: str,
+        identity: Identity,
+        expires_at: Any=None,
+        key_id: Optional[str] = None,
+    ) -> None:
+        """Cache a verified credential until the earlier of TTL and its expiry."""
+        if self.credential_cache is None:
+            return
+        self.credential_cache.put(
+            identity.auth_method,
+            credential,
+            identity,
+            expires_at=_expiry_timestamp(expires_at) if expires_at is not None else None,
+            key_id=key_id,
+        )
+
     def intercept_service(
         self,
         continuation: Callable[[grpc.HandlerCallDetails], Any],
@@ -360,7 +632,7 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
             RPC handler response or UNAUTHENTICATED error
         """
         # Try to authenticate
-        _identity=self._authenticate(handler_call_details)
+        identity=self._authenticate(handler_call_details)
 
         if not identity:
             logger.warning("Authentication failed for RPC call")
@@ -372,7 +644,7 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
         logger.debug(f"Authentication succeeded for {identity.principal_id}")
 
         # Call the continuation, passing identity in context
-        _handler=continuation(handler_call_details)
+        handler=continuation(handler_call_details)
 
         # Wrap to set identity before execution
 
@@ -398,13 +670,13 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
         """
 
         # Method 1: Try mTLS
-        _identity=self._authenticate_mtls(handler_call_details)
+        identity=self._authenticate_mtls(handler_call_details)
         if identity:
             logger.debug(f"mTLS authentication successful: {identity.principal_id}")
             return identity
 
         # Method 2: Try API key or JWT in metadata
-        _identity=self._authenticate_metadata(handler_call_details)
+        identity=self._authenticate_metadata(handler_call_details)
         if identity:
             logger.debug(
                 f"{identity.auth_method.upper()} authentication successful: {identity.principal_id}"
@@ -436,23 +708,30 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
             Identity if valid mTLS cert, None otherwise
         """
         # Metadata is tuple of (key, value) pairs
-        _peer_metadata=dict(handler_call_details.invocation_metadata or [])
+        peer_metadata=dict(handler_call_details.invocation_metadata or [])
 
         # Look for x509 certificate
-        _x509_cert_der=peer_metadata.get("x509-cert")
-        _x509_subject=peer_metadata.get("x509-subject")
+        x509_cert_der=peer_metadata.get("x509-cert")
+        x509_subject=peer_metadata.get("x509-subject")
 
         if not x509_subject:
             logger.debug("No x509 certificate in peer metadata")
             return None
 
+        verified=bool(self.cert_validator and x509_cert_der)
+        if verified:
+            cached=self._cached_identity("mtls", x509_cert_der)
+            if cached:
+                return cached
+
         try:
-            _principal_id=None
+            principal_id=None
+            not_after=None
 
             # If we have the certificate validator and raw cert bytes, use full validation
-            if self.cert_validator and x509_cert_der:
-                _cert_der=base64.b64decode(x509_cert_der)
-                _validation_result=self.cert_validator.validate_certificate(cert_der)
+            if verified:
+                cert_der=base64.b64decode(x509_cert_der)
+                validation_result=self.cert_validator.validate_certificate(cert_der)
 
                 if not validation_result["valid"]:
                     logger.warning(
@@ -461,10 +740,11 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
                     return None
 
                 # Extract CN from validated certificate
-                _principal_id=self.cert_validator.get_subject_cn(cert_der)
+                principal_id=self.cert_validator.get_subject_cn(cert_der)
                 if not principal_id:
                     logger.warning("Could not extract CN from validated certificate")
                     return None
+                not_after=validation_result["not_after"]
             else:
             # Fallback to subject parsing if no validator
                 for part in x509_subject.split("/"):
@@ -477,10 +757,13 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
                 return None
 
             # Load permissions for this principal
-            _permissions=self._load_permissions(principal_id)
+            permissions=self._load_permissions(principal_id)
 
             logger.info(f"mTLS certificate validated for {principal_id}")
-            return Identity(principal_id, "mtls", permissions)
+            identity=Identity(principal_id, "mtls", permissions)
+            if verified:
+                self._cache_identity(x509_cert_der, identity, not_after)
+            return identity
 
         except Exception as e:
             logger.warning(f"Failed to authenticate with mTLS certificate: {e}")
@@ -503,9 +786,9 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
         Returns:
             Identity if valid token/key, None otherwise
         """
-        _metadata=dict(handler_call_details.invocation_metadata or [])
+        metadata=dict(handler_call_details.invocation_metadata or [])
 
-        _auth_header=metadata.get("authorization", "")
+        auth_header=metadata.get("authorization", "")
         if not auth_header.startswith("Bearer "):
             return None
 
@@ -513,12 +796,12 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
 
         # Try JWT first (if configured)
         if self.jwt_public_key:
-            _identity=self._verify_jwt(token)
+            identity=self._verify_jwt(token)
             if identity:
                 return identity
 
         # Try API key
-        _identity=self._verify_api_key(token)
+        identity=self._verify_api_key(token)
         if identity:
             return identity
 
@@ -543,23 +826,26 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
         if not self.jwt_public_key:
             return None
 
+        cached=self._cached_identity("jwt", token)
+        if cached:
+            return cached
+
         try:
             payload=jwt.decode(
                 token,
                 self.jwt_public_key,
-                _algorithms=["RS256", "HS256"],
+                algorithms=["RS256", "HS256"],
             )
 
             # Check expiration
             if "exp" in payload:
-
-                _exp_time=datetime.utcfromtimestamp(payload["exp"])
+                exp_time=datetime.fromtimestamp(payload["exp"], timezone.utc)
                 if exp_time < datetime.now(timezone.utc):
                     logger.warning("JWT token expired")
                     return None
 
             # Check issuer
-            _issuer=self.config.get("jwt_issuer")
+            issuer=self.config.get("jwt_issuer")
             if issuer and payload.get("iss") != issuer:
                 logger.warning(
                     f'JWT issuer mismatch: expected {issuer}, got {payload.get("iss")}'
@@ -567,7 +853,7 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
                 return None
 
             # Check audience
-            _audience=self.config.get("jwt_audience")
+            audience=self.config.get("jwt_audience")
             if audience and payload.get("aud") != audience:
                 logger.warning(
                     f'JWT audience mismatch: expected {audience}, got {payload.get("aud")}'
@@ -575,15 +861,17 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
                 return None
 
             # Extract principal ID and permissions
-            _principal_id=payload.get("sub") or payload.get("user_id")
+            principal_id=payload.get("sub") or payload.get("user_id")
             if not principal_id:
                 logger.warning("JWT missing subject/user_id claim")
                 return None
 
-            _permissions=payload.get("permissions", [])
+            permissions=payload.get("permissions", [])
 
             logger.info(f"JWT token valid for {principal_id}")
-            return Identity(principal_id, "jwt", permissions)
+            identity=Identity(principal_id, "jwt", permissions)
+            self._cache_identity(token, identity, payload.get("exp"))
+            return identity
 
         except jwt.ExpiredSignatureError:
             logger.warning("JWT token expired")
@@ -595,12 +883,13 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
             logger.warning(f"JWT verification error: {e}")
             return None
 
-    def _verify_api_key(self, apikey: str) -> Optional[Identity]:
+    def _verify_api_key(self, api_key: str) -> Optional[Identity]:
         """
         Verify API key.
 
         Looks up key hash in storage (etcd, database, etc).
-        Checks expiration if present.
+        Checks expiration if present. Cached keys skip the PBKDF2 hash
+        and the storage lookup.
 
         Args:
             api_key: API key string
@@ -608,33 +897,40 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
         Returns:
             Identity if valid API key, None otherwise
         """
+        cached=self._cached_identity("api-key", api_key)
+        if cached:
+            return cached
+
         try:
-        # Hash the key for comparison using PBKDF2-HMAC-SHA256
-            _key_hash = hashlib.pbkdf2_hmac("sha256", api_key.encode(), self.api_key_salt, 600000).hex()
+            # Hash the key for comparison using PBKDF2-HMAC-SHA256
+            key_hash=hashlib.pbkdf2_hmac(
+                "sha256", api_key.encode(), self.api_key_salt, self.API_KEY_HASH_ITERATIONS
+            ).hex()
             # Look up in key storage
-            _key_data=self._lookup_key_hash(key_hash)
+            key_data=self._lookup_key_hash(key_hash)
             if not key_data:
                 logger.debug("API key not found in storage")
                 return None
 
             # Check expiration
-            if "expires_at" in key_data:
-                _expires_at=datetime.fromisoformat(key_data["expires_at"])
-                if expires_at < datetime.now(timezone.utc):
-                    logger.warning("API key expired")
-                    return None
+            expires_at=key_data.get("expires_at")
+            if expires_at is not None and _expiry_timestamp(expires_at) < time.time():
+                logger.warning("API key expired")
+                return None
 
             principal_id=key_data["principal_id"]
-            _permissions=key_data.get("permissions", [])
+            permissions=key_data.get("permissions", [])
 
             logger.info(f"API key valid for {principal_id}")
-            return Identity(principal_id, "api-key", permissions)
+            identity=Identity(principal_id, "api-key", permissions)
+            self._cache_identity(api_key, identity, expires_at, key_data.get("key_id"))
+            return identity
 
         except Exception as e:
             logger.warning(f"API key verification error: {e}")
             return None
 
-    def _lookup_key_hash(self, keyhash: str) -> Optional[Dict[str, Any]]:
+    def _lookup_key_hash(self, key_hash: str) -> Optional[Dict[str, Any]]:
         """
         Look up API key hash in storage.
 
@@ -645,18 +941,20 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
             key_hash: SHA256 hash of API key
 
         Returns:
-            Key data dict with principal_id and permissions, or None
+            Key data dict with principal_id, permissions and optionally
+            key_id (used to evict cached keys on revocation), or None
         """
         # In production: query etcd, database, etc.
         # Example structure:
-            # {
+        # {
+        #     'key_id': 'key_0123456789abcdef',
         #     'principal_id': 'ci-system',
         #     'permissions': ['storage:snapshot:create', 'node:list'],
         #     'expires_at': '2025-12-31T23:59:59',
         # }
         return None
 
-    def _load_permissions(self, principalid: str) -> List[str]:
+    def _load_permissions(self, principal_id: str) -> List[str]:
         """
         Load permissions for principal from RBAC system.
 
@@ -673,7 +971,7 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
         # For demo, return default permissions based on role
 
         # Example role definitions
-        _roles={
+        roles={
             "web-panel": {
                 "role": "operator",
                 "permissions": ["node:*", "storage:*", "migration:*"],
@@ -702,11 +1000,11 @@ class AuthenticationInterceptor(grpc.ServerInterceptor):
         return ["node:list"]
 
 
-if _name__== "__main__":
+if __name__ == "__main__":
     # Simple test
     logging.basicConfig(level=logging.DEBUG)
 
     # Test Identity
-    _identity=Identity("test-user", "api-key", ["node:list", "storage:*"])
+    identity=Identity("test-user", "api-key", ["node:list", "storage:*"])
     print(f"Created identity: {identity}")
     print(f"Permissions: {identity.permissions}")
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+DebVisor RPC Service - Node Registry
+
+Node registration and heartbeat state behind NodeService.
+
+Features:
+- Pluggable persistence backends (in-memory, SQLite file)
+- Lock-sharded in-memory index; heartbeats touch one shard only
+- Heartbeats batched into periodic backend writes
+- Per-shard status index for server-side filtering
+- Streaming iteration without holding locks across yields
+- Keyset pages ordered by node ID
+- Stale node detection (online -> offline after missed heartbeats)
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+import heapq
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+logger=logging.getLogger(__name__)
+
+# (node_id, last_heartbeat, status)
+HeartbeatRow=Tuple[str, float, str]
+
+
+@dataclass
+class NodeRecord:
+    """Registered node. Timestamps are epoch seconds."""
+
+    node_id: str
+    hostname: str
+    ip: str
+    version: str=""
+    status: str="registered"
+    registered_at: float=0.0
+    last_heartbeat: Optional[float] = None
+
+
+# =============================================================================
+# Backends
+# =============================================================================
+
+
+class NodeRegistryBackend(ABC):
+    """Persistence for the node registry."""
+
+    @abstractmethod
+    def load(self) -> Iterator[NodeRecord]:
+        """Yield every stored node."""
+
+    @abstractmethod
+    def upsert(self, record: NodeRecord) -> None:
+        """Store a registration (insert or replace)."""
+
+    @abstractmethod
+    def write_heartbeats(self, rows: List[HeartbeatRow]) -> None:
+        """Store a batch of heartbeat timestamps and statuses."""
+
+    @abstractmethod
+    def delete(self, node_id: str) -> None:
+        """Remove a node."""
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class InMemoryRegistryBackend(NodeRegistryBackend):
+    """Process-local backend; state is lost on restart."""
+
+    def __init__(self) -> None:
+        self.records: Dict[str, NodeRecord] = {}
+        self.heartbeat_batches=0
+
+    def load(self) -> Iterator[NodeRecord]:
+        for record in list(self.records.values()):
+            yield replace(record)
+
+    def upsert(self, record: NodeRecord) -> None:
+        self.records[record.node_id] = replace(record)
+
+    def write_heartbeats(self, rows: List[HeartbeatRow]) -> None:
+        self.heartbeat_batches += 1
+        for node_id, last_heartbeat, status in rows:
+            record=self.records.get(node_id)
+            if record is not None:
+                record.last_heartbeat=last_heartbeat
+                record.status=status
+
+    def delete(self, node_id: str) -> None:
+        self.records.pop(node_id, None)
+
+
+class SQLiteRegistryBackend(NodeRegistryBackend):
+    """
+    SQLite file backend.
+
+    Runs in WAL mode; each heartbeat batch is a single executemany UPDATE
+    in one transaction.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path=path
+        self._lock=threading.Lock()
+        self._conn=sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rpc_nodes ("
+            " node_id TEXT PRIMARY KEY,"
+            " hostname TEXT NOT NULL,"
+            " ip TEXT NOT NULL,"
+            " version TEXT NOT NULL DEFAULT '',"
+            " status TEXT NOT NULL,"
+            " registered_at REAL NOT NULL,"
+            " last_heartbeat REAL)"
+        )
+
+    def load(self) -> Iterator[NodeRecord]:
+        with self._lock:
+            rows=self._conn.execute(
+                "SELECT node_id, hostname, ip, version, status, registered_at, last_heartbeat"
+                " FROM rpc_nodes"
+            ).fetchall()
+        for row in rows:
+            yield NodeRecord(*row)
+
+    def upsert(self, record: NodeRecord) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rpc_nodes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.node_id, record.hostname, record.ip, record.version,
+                    record.status, record.registered_at, record.last_heartbeat,
+                ),
+            )
+
+    def write_heartbeats(self, rows: List[HeartbeatRow]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "UPDATE rpc_nodes SET last_heartbeat=?, status=? WHERE node_id=?",
+                    [(last_heartbeat, status, node_id) for node_id, last_heartbeat, status in rows],
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def delete(self, node_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM rpc_nodes WHERE node_id=?", (node_id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+
+class _Shard:
+    __slots__=("lock", "nodes", "by_status", "dirty", "heartbeats")
+
+    def __init__(self) -> None:
+        self.lock=threading.Lock()
+        self.nodes: Dict[str, NodeRecord] = {}
+        self.by_status: Dict[str, Set[str]] = {}
+        self.dirty: Set[str] = set()
+        self.heartbeats=0
+
+    def index(self, record: NodeRecord) -> None:
+        self.by_status.setdefault(record.status, set()).add(record.node_id)
+
+    def unindex(self, record: NodeRecord) -> None:
+        ids=self.by_status.get(record.status)
+        if ids is not None:
+            ids.discard(record.node_id)
+            if not ids:
+                del self.by_status[record.status]
+
+    def set_status(self, record: NodeRecord, status: str) -> None:
+        if record.status != status:
+            self.unindex(record)
+            record.status=status
+            self.index(record)
+
+
+class ShardedNodeRegistry:
+    """
+    In-memory node index over a persistence backend.
+
+    Nodes are spread over lock-protected shards by node ID, so concurrent
+    heartbeats from different nodes rarely contend. A heartbeat only
+    updates the in-memory record and marks it dirty; dirty records are
+    written to the backend in one batch per flush. Registrations and
+    removals are written through immediately.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[NodeRegistryBackend] = None,
+        shards: int=16,
+        flush_interval: float=1.0,
+        stale_after: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize registry and load stored nodes.
+
+        Args:
+            backend: Persistence backend (default in-memory)
+            shards: Number of lock shards
+            flush_interval: Seconds between background heartbeat flushes
+            stale_after: Seconds without a heartbeat before an online node
+                is marked offline by the background flusher (None disables)
+        """
+        self.backend=backend or InMemoryRegistryBackend()
+        self.flush_interval=flush_interval
+        self.stale_after=stale_after
+        self._shards=[_Shard() for _ in range(max(1, shards))]
+        self._hostnames: Dict[str, str] = {}
+        self._register_lock=threading.Lock()
+        self._flush_lock=threading.Lock()
+        self._stop=threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushes=0
+        self.rows_written=0
+
+        for record in self.backend.load():
+            shard=self._shard(record.node_id)
+            shard.nodes[record.node_id] = record
+            shard.index(record)
+            self._hostnames[record.hostname] = record.node_id
+        logger.info(f"Node registry loaded {len(self._hostnames)} nodes")
+
+    def _shard(self, node_id: str) -> _Shard:
+        return self._shards[hash(node_id) % len(self._shards)]
+
+    def register(self, hostname: str, ip: str, version: str="") -> NodeRecord:
+        """
+        Register a node, or update the existing registration of a hostname.
+
+        Returns:
+            Copy of the stored record
+        """
+        with self._register_lock:
+            node_id=self._hostnames.get(hostname) or str(uuid.uuid4())
+            shard=self._shard(node_id)
+            with shard.lock:
+                record=shard.nodes.get(node_id)
+                if record is None:
+                    record=NodeRecord(node_id, hostname, ip, version, registered_at=time.time())
+                    shard.nodes[node_id] = record
+                    shard.index(record)
+                else:
+                    record.ip=ip
+                    record.version=version
+                    shard.set_status(record, "registered")
+                shard.dirty.discard(node_id)
+                stored=replace(record)
+            self._hostnames[hostname] = node_id
+            self.backend.upsert(stored)
+        return stored
+
+    def heartbeat(self, node_id: str, now: Optional[float] = None, status: str="online") -> bool:
+        """
+        Record a heartbeat in memory; persisted on the next flush.
+
+        Returns:
+            False if the node is not registered
+        """
+        shard=self._shard(node_id)
+        with shard.lock:
+            record=shard.nodes.get(node_id)
+            if record is None:
+                return False
+            record.last_heartbeat=time.time() if now is None else now
+            shard.set_status(record, status)
+            shard.dirty.add(node_id)
+            shard.heartbeats += 1
+        return True
+
+    def remove(self, node_id: str) -> bool:
+        """Deregister a node."""
+        with self._register_lock:
+            shard=self._shard(node_id)
+            with shard.lock:
+                record=shard.nodes.pop(node_id, None)
+                if record is None:
+                    return False
+                shard.unindex(record)
+                shard.dirty.discard(node_id)
+            self._hostnames.pop(record.hostname, None)
+            self.backend.delete(node_id)
+        return True
+
+    def get(self, node_id: str) -> Optional[NodeRecord]:
+        """Copy of a node's record, or None."""
+        shard=self._shard(node_id)
+        with shard.lock:
+            record=shard.nodes.get(node_id)
+            return replace(record) if record is not None else None
+
+    def iter_nodes(
+        self,
+        status: Optional[str] = None,
+        hostname_prefix: Optional[str] = None,
+    ) -> Iterator[NodeRecord]:
+        """
+        Yield copies of matching records, one shard at a time.
+
+        Each shard is copied under its lock and yielded after releasing
+        it, so slow consumers never block heartbeats.
+        """
+        for shard in self._shards:
+            with shard.lock:
+                if status:
+                    records=[shard.nodes[i] for i in shard.by_status.get(status, ())]
+                else:
+                    records=list(shard.nodes.values())
+                if hostname_prefix:
+                    records=[r for r in records if r.hostname.startswith(hostname_prefix)]
+                batch=[replace(r) for r in records]
+            yield from batch
+
+    def list_page(
+        self,
+        status: Optional[str] = None,
+        hostname_prefix: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: int=100,
+    ) -> List[NodeRecord]:
+        """
+        Up to `limit` matching records with node_id > `after`, ordered by node_id.
+
+        Consecutive pages are stable under concurrent registrations and
+        removals. Each call is O(n log limit) over the matching nodes.
+        """
+        candidates: List[NodeRecord] = []
+        for shard in self._shards:
+            with shard.lock:
+                if status:
+                    ids=shard.by_status.get(status, ())
+                else:
+                    ids=shard.nodes.keys()
+                matched=[
+                    shard.nodes[i] for i in ids
+                    if (after is None or i > after)
+                    and (not hostname_prefix or shard.nodes[i].hostname.startswith(hostname_prefix))
+                ]
+                candidates.extend(
+                    replace(r) for r in heapq.nsmallest(limit, matched, key=lambda r: r.node_id)
+                )
+        return heapq.nsmallest(limit, candidates, key=lambda r: r.node_id)
+
+    def count(self, status: Optional[str] = None) -> int:
+        """Number of registered nodes, optionally with a given status."""
+        total=0
+        for shard in self._shards:
+            with shard.lock:
+                total += len(shard.by_status.get(status, ())) if status else len(shard.nodes)
+        return total
+
+    def mark_stale(self, timeout: float, now: Optional[float] = None) -> int:
+        """
+        Mark online nodes without a heartbeat for `timeout` seconds offline.
+
+        Returns:
+            Number of nodes marked offline
+        """
+        cutoff=(time.time() if now is None else now) - timeout
+        marked=0
+        for shard in self._shards:
+            with shard.lock:
+                for node_id in list(shard.by_status.get("online", ())):
+                    record=shard.nodes[node_id]
+                    if record.last_heartbeat is None or record.last_heartbeat < cutoff:
+                        shard.set_status(record, "offline")
+                        shard.dirty.add(node_id)
+                        marked += 1
+        if marked:
+            logger.warning(f"Marked {marked} nodes offline after {timeout}s without heartbeat")
+        return marked
+
+    def flush(self) -> int:
+        """
+        Write dirty heartbeat state to the backend in one batch.
+
+        On backend failure the batch is marked dirty again and the error
+        is raised.
+
+        Returns:
+            Number of rows written
+        """
+        with self._flush_lock:
+            rows: List[HeartbeatRow] = []
+            for shard in self._shards:
+                with shard.lock:
+                    if not shard.dirty:
+                        continue
+                    dirty, shard.dirty = shard.dirty, set()
+                    for node_id in dirty:
+                        record=shard.nodes.get(node_id)
+                        if record is not None and record.last_heartbeat is not None:
+                            rows.append((node_id, record.last_heartbeat, record.status))
+            if not rows:
+                return 0
+            try:
+                self.backend.write_heartbeats(rows)
+            except Exception:
+                for node_id, _, _ in rows:
+                    shard=self._shard(node_id)
+                    with shard.lock:
+                        if node_id in shard.nodes:
+                            shard.dirty.add(node_id)
+                raise
+            self.flushes += 1
+            self.rows_written += len(rows)
+            return len(rows)
+
+    def start(self) -> None:
+        """Start the background flush (and stale detection) thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread=threading.Thread(
+            target=self._run, name="node-registry-flush", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float=5.0) -> None:
+        """Stop the background thread and flush outstanding heartbeats."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread=None
+        self.flush()
+
+    def close(self) -> None:
+        """Stop, flush and close the backend."""
+        self.stop()
+        self.backend.close()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                if self.stale_after:
+                    self.mark_stale(self.stale_after)
+                self.flush()
+            except Exception as e:
+                logger.error(f"Node registry flush failed: {e}", exc_info=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Registry size and heartbeat/flush counters."""
+        dirty=heartbeats=0
+        for shard in self._shards:
+            with shard.lock:
+                dirty += len(shard.dirty)
+                heartbeats += shard.heartbeats
+        return {
+            "nodes": self.count(),
+            "online": self.count("online"),
+            "shards": len(self._shards),
+            "dirty": dirty,
+            "heartbeats": heartbeats,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+        }
+
+
+def create_node_registry(config: Dict[str, Any]) -> ShardedNodeRegistry:
+    """
+    Build a registry from the "node_registry" section of the RPC config.
+
+    Example:
+        {"node_registry": {"backend": "sqlite", "path": "/var/lib/debvisor/rpc-nodes.db",
+                           "shards": 16, "flush_interval": 1.0, "stale_after": 90}}
+    """
+    settings=config.get("node_registry", {})
+    kind=settings.get("backend", "memory")
+    backend: NodeRegistryBackend
+    if kind == "sqlite":
+        backend=SQLiteRegistryBackend(settings.get("path", "/var/lib/debvisor/rpc-nodes.db"))
+    elif kind == "memory":
+        backend=InMemoryRegistryBackend()
+    else:
+        raise ValueError(f"Unknown node registry backend: {kind}")
+    return ShardedNodeRegistry(
+        backend,
+        shards=int(settings.get("shards", 16)),
+        flush_interval=float(settings.get("flush_interval", 1.0)),
+        stale_after=settings.get("stale_after"),
+    )
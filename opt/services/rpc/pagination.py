@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+DebVisor RPC Service - List Pagination
+
+Page tokens and field masks for List*/Stream* RPCs.
+
+Features:
+- Opaque keyset page tokens (last returned key), bound to the request
+  filters so a token cannot be replayed against a different query
+- Page size defaulting and clamping
+- Field mask validation and projection
+"""
+
+import base64
+import hashlib
+import json
+from typing import Any, Dict, Optional, Sequence
+
+DEFAULT_PAGE_SIZE=100
+MAX_PAGE_SIZE=1000
+# Keyset chunk used internally by server-streaming RPCs
+STREAM_CHUNK_SIZE=500
+
+
+def page_size(requested: int, maximum: int=MAX_PAGE_SIZE) -> int:
+    """Requested page size, defaulted when unset and clamped to the maximum."""
+    if requested < 0:
+        raise ValueError("page_size must not be negative")
+    return min(requested or DEFAULT_PAGE_SIZE, maximum)
+
+
+def _scope(filters: Dict[str, Any]) -> str:
+    encoded=json.dumps(filters, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=6).hexdigest()
+
+
+def encode_page_token(after: str, filters: Dict[str, Any]) -> str:
+    """Token resuming a listing after the given key."""
+    payload=json.dumps({"a": after, "s": _scope(filters)}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_page_token(token: str, filters: Dict[str, Any]) -> Optional[str]:
+    """
+    Key to resume after, or None for an empty token.
+
+    Raises:
+        ValueError: Malformed token, or token issued for different filters
+    """
+    if not token:
+        return None
+    try:
+        payload=json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        after, scope=payload["a"], payload["s"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid page token")
+    if not isinstance(after, str) or scope != _scope(filters):
+        raise ValueError("Page token does not match request filters")
+    return after
+
+
+def check_field_mask(paths: Sequence[str], allowed: Sequence[str]) -> Optional[Sequence[str]]:
+    """
+    Validated field mask paths, or None (all fields) for an empty mask.
+
+    Raises:
+        ValueError: Unknown field in the mask
+    """
+    if not paths:
+        return None
+    unknown=sorted(set(paths) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown fields in field mask: {', '.join(unknown)}")
+    return list(paths)
+
+
+def apply_field_mask(values: Dict[str, Any], paths: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """Subset of values named by the mask (all values for None)."""
+    if paths is None:
+        return values
+    return {name: values[name] for name in paths if name in values}
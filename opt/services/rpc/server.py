@@ -108,6 +108,8 @@ Provides secure, audited gRPC API for cluster operations including:
 - VM migration orchestration
 
 Features:
+- Sharded node registry with batched heartbeat persistence
+- Paged and server-streaming listings with page tokens and field masks
 - mTLS with certificate validation
 - RBAC with wildcard permissions
 - Structured audit logging
@@ -116,6 +118,7 @@ Features:
 """
 
 from datetime import datetime, timezone
+import bisect
 import grpc
 import json
 import logging
@@ -123,9 +126,10 @@ import os
 import sys
 import time
 import threading
+import uuid
 from concurrent import futures
 from enum import Enum
-from typing import Dict, List, Any, Callable, Optional
+from typing import Dict, Iterator, List, Any, Callable, Optional
 
 # Generated protobuf modules (from make protoc)
 import debvisor_pb2
@@ -136,6 +140,15 @@ from auth import AuthenticationInterceptor, extract_identity
 from authz import AuthorizationInterceptor, check_permission
 from audit import AuditInterceptor
 from validators import RequestValidator
+from node_registry import NodeRecord, ShardedNodeRegistry, create_node_registry
+from pagination import (
+    STREAM_CHUNK_SIZE,
+    apply_field_mask,
+    check_field_mask,
+    decode_page_token,
+    encode_page_token,
+    page_size,
+)
 
 # Configure logging
 try:
@@ -143,13 +156,22 @@ try:
     import structlog
 
     configure_logging(service_name="rpc-server")
-    _logger=structlog.get_logger(__name__)
+    logger=structlog.get_logger(__name__)
 except ImportError:
     logging.basicConfig(
-        _level=logging.INFO,
-        _format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
-    _logger=logging.getLogger(__name__)
+    logger=logging.getLogger(__name__)
+
+
+NODE_SUMMARY_FIELDS=("node_id", "hostname", "ip", "status", "registered_at")
+SNAPSHOT_SUMMARY_FIELDS=("snapshot_id", "pool", "snapshot", "backend", "size_bytes", "created_at")
+
+
+def _field_mask(request: Any, allowed: Any) -> Optional[List[str]]:
+    mask=getattr(request, "field_mask", None)
+    return check_field_mask(list(mask.paths) if mask is not None else [], allowed)
 
 
 class StatusCode(Enum):
@@ -168,7 +190,7 @@ class RateLimitingInterceptor(grpc.ServerInterceptor):
         self.config=config
         self._lock=threading.Lock()
         self._calls: Dict[str, List[float]] = {}
-        _rl_cfg=config.get("rate_limit", {})
+        rl_cfg=config.get("rate_limit", {})
         self.window_seconds=float(rl_cfg.get("window_seconds", 60))
         self.max_calls=int(rl_cfg.get("max_calls", 120))
         # Optional per-method overrides: {"/debvisor.NodeService/RegisterNode":
@@ -195,9 +217,9 @@ class RateLimitingInterceptor(grpc.ServerInterceptor):
     ) -> Any:
 
         def _wrapped_behavior(request: Any, context: grpc.ServicerContext) -> Any:
-            _principal=extract_identity(context)
-            _key=f"{principal.principal_id if principal else 'anonymous'}:{handler_call_details.method}"
-            _now=time.time()
+            principal=extract_identity(context)
+            key=f"{principal.principal_id if principal else 'anonymous'}:{handler_call_details.method}"
+            now=time.time()
             # Resolve method-specific limits if any
             method_cfg: Dict[str, float] = self.method_limits.get(
                 handler_call_details.method, {}
@@ -212,14 +234,14 @@ class RateLimitingInterceptor(grpc.ServerInterceptor):
                 import re
 
                 for entry in self.method_limits_patterns:
-                    _pat=entry.get("pattern")
+                    pat=entry.get("pattern")
                     if pat and re.search(pat, handler_call_details.method):
                         method_cfg=entry
                         break
-            _window=float(method_cfg.get("window_seconds", self.window_seconds))
-            _max_calls=int(method_cfg.get("max_calls", self.max_calls))
+            window=float(method_cfg.get("window_seconds", self.window_seconds))
+            max_calls=int(method_cfg.get("max_calls", self.max_calls))
             with self._lock:
-                _history=self._calls.setdefault(key, [])
+                history=self._calls.setdefault(key, [])
                 # Evict old entries outside window
                 cutoff=now - window
                 history[:] = [t for t in history if t >= cutoff]
@@ -230,12 +252,12 @@ class RateLimitingInterceptor(grpc.ServerInterceptor):
                 history.append(now)
             return continuation(handler_call_details).unary_unary(request, context)
 
-        _handler=continuation(handler_call_details)
+        handler=continuation(handler_call_details)
         if handler.unary_unary:
             return grpc.unary_unary_rpc_method_handler(
                 _wrapped_behavior,
-                _request_deserializer=handler.request_deserializer,
-                _response_serializer=handler.response_serializer,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
             )
         return handler
 
@@ -243,37 +265,41 @@ class RateLimitingInterceptor(grpc.ServerInterceptor):
 class NodeServiceImpl(debvisor_pb2_grpc.NodeServiceServicer):
     """Implementation of NodeService RPC calls"""
 
-    def __init__(self, backend: Any=None) -> None:
+    def __init__(self, backend: Any=None, registry: Optional[ShardedNodeRegistry] = None) -> None:
         self.backend=backend
-        self.nodes: Dict[str, Dict[str, Any]] = (
-            {}
-        )    # In-memory store for demo (use persistent storage in production)
+        self.registry=registry or ShardedNodeRegistry()
         logger.info("NodeServiceImpl initialized")
 
+    @staticmethod
+    def _summary(record: NodeRecord, fields: Optional[List[str]] = None) -> debvisor_pb2.NodeSummary:
+        values=apply_field_mask(
+            {
+                "node_id": record.node_id,
+                "hostname": record.hostname,
+                "ip": record.ip,
+                "status": record.status,
+                "registered_at": debvisor_pb2.Timestamp(seconds=int(record.registered_at)),
+            },
+            fields,
+        )
+        return debvisor_pb2.NodeSummary(**values)
+
     def RegisterNode(
         self, request: debvisor_pb2.RegisterNodeRequest, context: grpc.ServicerContext
     ) -> debvisor_pb2.NodeAck:
         """Register a new node or update existing node"""
         try:
         # Validate inputs
-            _hostname=RequestValidator.validate_hostname(request.hostname)
-            _ip=RequestValidator.validate_ipv4(request.ip)
+            hostname=RequestValidator.validate_hostname(request.hostname)
+            ip=RequestValidator.validate_ipv4(request.ip)
 
             # Check authorization
-            _principal=extract_identity(context)
+            principal=extract_identity(context)
             check_permission(principal, "node:register", context)
 
-            # Store node (in production, write to persistent storage)
-            _node_id=f"node-{len(self.nodes) + 1:03d}"
-            self.nodes[node_id] = {
-                "id": node_id,
-                "hostname": hostname,
-                "ip": ip,
-                "version": request.version,
-                "status": "registered",
-                "registered_at": datetime.now(timezone.utc).isoformat(),
-                "last_heartbeat": None,
-            }
+            # Registrations are written through to the registry backend
+            record=self.registry.register(hostname, ip, request.version)
+            node_id=record.node_id
 
             logger.info(
                 f"Node registered: {hostname} ({ip}), node_id={node_id}, "
@@ -281,9 +307,9 @@ class NodeServiceImpl(debvisor_pb2_grpc.NodeServiceServicer):
             )
 
             return debvisor_pb2.NodeAck(
-                _status=StatusCode.OK.value,
-                _message=f"Node {hostname} registered successfully",
-                _node_id=node_id,
+                status=StatusCode.OK.value,
+                message=f"Node {hostname} registered successfully",
+                node_id=node_id,
             )
 
         except ValueError as e:
@@ -303,32 +329,16 @@ class NodeServiceImpl(debvisor_pb2_grpc.NodeServiceServicer):
     ) -> debvisor_pb2.HeartbeatAck:
         """Send heartbeat from node"""
         try:
-        # Validate inputs
-            _node_id=RequestValidator.validate_uuid(request.node_id)
+            # Validate inputs
+            node_id=RequestValidator.validate_uuid(request.node_id)
 
             # Check authorization
-            _principal=extract_identity(context)
+            principal=extract_identity(context)
             check_permission(principal, "node:heartbeat", context)
 
-            # Check node exists
-            if node_id not in self.nodes:
-                context.abort(grpc.StatusCode.NOT_FOUND, f"Node not found: {node_id}")
-
-            # Update node state
-            self.nodes[node_id]["last_heartbeat"] = datetime.now(
-                timezone.utc
-            ).isoformat()
-            self.nodes[node_id]["status"] = "online"
-
-            logger.info(f"Heartbeat received from node {node_id}")
-
-            return debvisor_pb2.HealthAck(
-                _status=StatusCode.OK.value,
-                _timestamp=debvisor_pb2.Timestamp(
-                    _seconds=int(datetime.now(timezone.utc).timestamp()),
-                    _nanos=0,
-                ),
-            )
+            # In-memory update; persisted by the registry's next batch flush
+            now=time.time()
+            known=self.registry.heartbeat(node_id, now)
 
         except ValueError as e:
             context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
@@ -338,45 +348,99 @@ class NodeServiceImpl(debvisor_pb2_grpc.NodeServiceServicer):
             logger.error(f"Heartbeat error: {e}", exc_info=True)
             context.abort(grpc.StatusCode.INTERNAL, "Heartbeat failed")
 
+        # Outside the try: abort() raises, and the generic handler above
+        # would report NOT_FOUND as INTERNAL
+        if not known:
+            context.abort(grpc.StatusCode.NOT_FOUND, f"Node not found: {node_id}")
+
+        logger.debug(f"Heartbeat received from node {node_id}")
+
+        return debvisor_pb2.HealthAck(
+            status=StatusCode.OK.value,
+            timestamp=debvisor_pb2.Timestamp(seconds=int(now), nanos=0),
+        )
+
+    @staticmethod
+    def _filters(request: debvisor_pb2.ListNodesRequest) -> Dict[str, Optional[str]]:
+        return {
+            "status": getattr(request, "status", "") or None,
+            "hostname_prefix": getattr(request, "hostname_prefix", "") or None,
+        }
+
     def ListNodes(
         self, request: debvisor_pb2.ListNodesRequest, context: grpc.ServicerContext
     ) -> debvisor_pb2.NodeList:
-        """List all registered nodes"""
+        """List one page of registered nodes, ordered by node ID.
+
+        Filters by status and hostname prefix; page_size defaults to 100
+        (max 1000); next_page_token is empty on the last page.
+        """
         try:
         # Check authorization
-            _principal=extract_identity(context)
+            principal=extract_identity(context)
             check_permission(principal, "node:list", context)
 
-            _nodes=list(self.nodes.values())
-
-            _node_summaries=[
-                debvisor_pb2.NodeSummary(
-                    _node_id=n["id"],
-                    _hostname=n["hostname"],
-                    _ip=n["ip"],
-                    _status=n["status"],
-                    _registered_at=debvisor_pb2.Timestamp(
-                        _seconds=int(
-                            datetime.fromisoformat(n["registered_at"]).timestamp()
-                        ),
-                    ),
-                )
-                for n in nodes
-            ]
+            filters=self._filters(request)
+            fields=_field_mask(request, NODE_SUMMARY_FIELDS)
+            limit=page_size(getattr(request, "page_size", 0))
+            after=decode_page_token(getattr(request, "page_token", ""), filters)
+
+            # One extra row tells whether another page follows
+            records=self.registry.list_page(after=after, limit=limit + 1, **filters)
+            next_token=""
+            if len(records) > limit:
+                records=records[:limit]
+                next_token=encode_page_token(records[-1].node_id, filters)
+            node_summaries=[self._summary(r, fields) for r in records]
 
             logger.info(
                 f"Listed {len(node_summaries)} nodes, "
                 f'principal={principal.principal_id if principal else "unknown"}'
             )
 
-            return debvisor_pb2.NodeList(nodes=node_summaries)
+            return debvisor_pb2.NodeList(nodes=node_summaries, next_page_token=next_token)
 
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
         except PermissionError as e:
             context.abort(grpc.StatusCode.PERMISSION_DENIED, str(e))
         except Exception as e:
             logger.error(f"ListNodes error: {e}", exc_info=True)
             context.abort(grpc.StatusCode.INTERNAL, "List failed")
 
+    def StreamNodes(
+        self, request: debvisor_pb2.ListNodesRequest, context: grpc.ServicerContext
+    ) -> Iterator[debvisor_pb2.NodeSummary]:
+        """Stream matching nodes in node ID order (same filters as ListNodes).
+
+        Starts after page_token when given and reads the registry in
+        keyset chunks, so memory stays bounded for any cluster size.
+        """
+        try:
+            principal=extract_identity(context)
+            check_permission(principal, "node:list", context)
+
+            filters=self._filters(request)
+            fields=_field_mask(request, NODE_SUMMARY_FIELDS)
+            chunk=page_size(getattr(request, "page_size", 0) or STREAM_CHUNK_SIZE)
+            after=decode_page_token(getattr(request, "page_token", ""), filters)
+
+            while context.is_active():
+                records=self.registry.list_page(after=after, limit=chunk, **filters)
+                for record in records:
+                    yield self._summary(record, fields)
+                if len(records) < chunk:
+                    return
+                after=records[-1].node_id
+
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except PermissionError as e:
+            context.abort(grpc.StatusCode.PERMISSION_DENIED, str(e))
+        except Exception as e:
+            logger.error(f"StreamNodes error: {e}", exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, "List failed")
+
 
 class StorageServiceImpl(debvisor_pb2_grpc.StorageServiceServicer):
     """Implementation of StorageService RPC calls"""
@@ -384,8 +448,48 @@ class StorageServiceImpl(debvisor_pb2_grpc.StorageServiceServicer):
     def __init__(self, backend: Any=None) -> None:
         self.backend=backend
         self.snapshots: Dict[str, Dict[str, Any]] = {}    # In-memory store for demo
+        # Sorted snapshot IDs, overall and per pool, for keyset paging
+        self._snapshot_ids: List[str] = []
+        self._snapshot_ids_by_pool: Dict[str, List[str]] = {}
+        self._lock=threading.Lock()
         logger.info("StorageServiceImpl initialized")
 
+    def _index_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        bisect.insort(self._snapshot_ids, snapshot["id"])
+        bisect.insort(self._snapshot_ids_by_pool.setdefault(snapshot["pool"], []), snapshot["id"])
+
+    def _unindex_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        for ids in (self._snapshot_ids, self._snapshot_ids_by_pool.get(snapshot["pool"], [])):
+            index=bisect.bisect_left(ids, snapshot["id"])
+            if index < len(ids) and ids[index] == snapshot["id"]:
+                del ids[index]
+        if not self._snapshot_ids_by_pool.get(snapshot["pool"], True):
+            del self._snapshot_ids_by_pool[snapshot["pool"]]
+
+    def _snapshot_page(
+        self, pool: Optional[str], after: Optional[str], limit: int
+    ) -> List[Dict[str, Any]]:
+        """Up to `limit` snapshots with ID > `after`, ordered by ID."""
+        with self._lock:
+            ids=self._snapshot_ids_by_pool.get(pool, []) if pool else self._snapshot_ids
+            start=bisect.bisect_right(ids, after) if after is not None else 0
+            return [dict(self.snapshots[i]) for i in ids[start:start + limit]]
+
+    @staticmethod
+    def _summary(snapshot: Dict[str, Any], fields: Optional[List[str]] = None) -> debvisor_pb2.SnapshotSummary:
+        values=apply_field_mask(
+            {
+                "snapshot_id": snapshot["id"],
+                "pool": snapshot["pool"],
+                "snapshot": snapshot["snapshot"],
+                "backend": snapshot["backend"],
+                "size_bytes": snapshot["size_bytes"],
+                "created_at": debvisor_pb2.Timestamp(seconds=int(snapshot["created_at"])),
+            },
+            fields,
+        )
+        return debvisor_pb2.SnapshotSummary(**values)
+
     def CreateSnapshot(
         self,
         request: debvisor_pb2.CreateSnapshotRequest,
@@ -394,25 +498,28 @@ class StorageServiceImpl(debvisor_pb2_grpc.StorageServiceServicer):
         """Create a ZFS or Ceph RBD snapshot"""
         try:
         # Validate inputs
-            _pool=RequestValidator.validate_label(request.pool, max_length=256)
-            _snapshot=RequestValidator.validate_label(request.snapshot, max_length=256)
+            pool=RequestValidator.validate_label(request.pool, max_length=256)
+            snapshot=RequestValidator.validate_label(request.snapshot, max_length=256)
 
             # Check authorization
-            _principal=extract_identity(context)
+            principal=extract_identity(context)
             check_permission(principal, "storage:snapshot:create", context)
 
             # Create snapshot (in production, interact with ZFS/Ceph)
-            _snapshot_id=f"snap-{len(self.snapshots) + 1:06d}"
-            self.snapshots[snapshot_id] = {
+            snapshot_id=str(uuid.uuid4())
+            record={
                 "id": snapshot_id,
                 "pool": pool,
                 "snapshot": snapshot,
                 "backend": request.backend,
                 "tags": dict(request.tags),
                 "status": "created",
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": time.time(),
                 "size_bytes": 0,    # Would be populated from backend
             }
+            with self._lock:
+                self.snapshots[snapshot_id] = record
+                self._index_snapshot(record)
 
             logger.info(
                 f"Snapshot created: {pool}@{snapshot}, snapshot_id={snapshot_id}, "
@@ -420,11 +527,11 @@ class StorageServiceImpl(debvisor_pb2_grpc.StorageServiceServicer):
             )
 
             return debvisor_pb2.SnapshotStatus(
-                _snapshot_id=snapshot_id,
-                _status=StatusCode.OK.value,
-                _message="Snapshot created successfully",
-                _created_at=debvisor_pb2.Timestamp(
-                    _seconds=int(datetime.now(timezone.utc).timestamp()),
+                snapshot_id=snapshot_id,
+                status=StatusCode.OK.value,
+                message="Snapshot created successfully",
+                created_at=debvisor_pb2.Timestamp(
+                    seconds=int(datetime.now(timezone.utc).timestamp()),
                 ),
             )
 
@@ -443,46 +550,71 @@ class StorageServiceImpl(debvisor_pb2_grpc.StorageServiceServicer):
     def ListSnapshots(
         self, request: debvisor_pb2.ListSnapshotsRequest, context: grpc.ServicerContext
     ) -> debvisor_pb2.SnapshotList:
-        """List storage snapshots"""
+        """List one page of storage snapshots, ordered by snapshot ID"""
         try:
         # Check authorization
-            _principal=extract_identity(context)
+            principal=extract_identity(context)
             check_permission(principal, "storage:snapshot:list", context)
 
             # Filter snapshots by pool if specified
-            _snapshots=list(self.snapshots.values())
-            if request.pool:
-                snapshots=[s for s in snapshots if s["pool"] == request.pool]
-
-            _snapshot_summaries=[
-                debvisor_pb2.SnapshotSummary(
-                    _snapshot_id=s["id"],
-                    _pool=s["pool"],
-                    _snapshot=s["snapshot"],
-                    _backend=s["backend"],
-                    _size_bytes=s["size_bytes"],
-                    _created_at=debvisor_pb2.Timestamp(
-                        _seconds=int(
-                            datetime.fromisoformat(s["created_at"]).timestamp()
-                        ),
-                    ),
-                )
-                for s in snapshots
-            ]
+            filters={"pool": request.pool or None}
+            fields=_field_mask(request, SNAPSHOT_SUMMARY_FIELDS)
+            limit=page_size(getattr(request, "page_size", 0))
+            after=decode_page_token(getattr(request, "page_token", ""), filters)
+
+            snapshots=self._snapshot_page(filters["pool"], after, limit + 1)
+            next_token=""
+            if len(snapshots) > limit:
+                snapshots=snapshots[:limit]
+                next_token=encode_page_token(snapshots[-1]["id"], filters)
+            snapshot_summaries=[self._summary(s, fields) for s in snapshots]
 
             logger.info(
                 f"Listed {len(snapshot_summaries)} snapshots, "
                 f'principal={principal.principal_id if principal else "unknown"}'
             )
 
-            return debvisor_pb2.SnapshotList(snapshots=snapshot_summaries)
+            return debvisor_pb2.SnapshotList(
+                snapshots=snapshot_summaries, next_page_token=next_token
+            )
 
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
         except PermissionError as e:
             context.abort(grpc.StatusCode.PERMISSION_DENIED, str(e))
         except Exception as e:
             logger.error(f"ListSnapshots error: {e}", exc_info=True)
             context.abort(grpc.StatusCode.INTERNAL, "List failed")
 
+    def StreamSnapshots(
+        self, request: debvisor_pb2.ListSnapshotsRequest, context: grpc.ServicerContext
+    ) -> Iterator[debvisor_pb2.SnapshotSummary]:
+        """Stream snapshots in ID order (same filters as ListSnapshots)"""
+        try:
+            principal=extract_identity(context)
+            check_permission(principal, "storage:snapshot:list", context)
+
+            filters={"pool": request.pool or None}
+            fields=_field_mask(request, SNAPSHOT_SUMMARY_FIELDS)
+            chunk=page_size(getattr(request, "page_size", 0) or STREAM_CHUNK_SIZE)
+            after=decode_page_token(getattr(request, "page_token", ""), filters)
+
+            while context.is_active():
+                snapshots=self._snapshot_page(filters["pool"], after, chunk)
+                for snapshot in snapshots:
+                    yield self._summary(snapshot, fields)
+                if len(snapshots) < chunk:
+                    return
+                after=snapshots[-1]["id"]
+
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except PermissionError as e:
+            context.abort(grpc.StatusCode.PERMISSION_DENIED, str(e))
+        except Exception as e:
+            logger.error(f"StreamSnapshots error: {e}", exc_info=True)
+            context.abort(grpc.StatusCode.INTERNAL, "List failed")
+
     def DeleteSnapshot(
         self,
         request: debvisor_pb2.DeleteSnapshotRequest,
@@ -490,29 +622,30 @@ class StorageServiceImpl(debvisor_pb2_grpc.StorageServiceServicer):
     ) -> debvisor_pb2.SnapshotStatus:
         """Delete a snapshot"""
         try:
-            _snapshot_id=RequestValidator.validate_uuid(request.snapshot_id)
+            snapshot_id=RequestValidator.validate_uuid(request.snapshot_id)
 
             # Check authorization
-            _principal=extract_identity(context)
+            principal=extract_identity(context)
             check_permission(principal, "storage:snapshot:delete", context)
 
-            # Check snapshot exists
-            if snapshot_id not in self.snapshots:
+            # Check snapshot exists and delete it
+            with self._lock:
+                snapshot=self.snapshots.pop(snapshot_id, None)
+                if snapshot is not None:
+                    self._unindex_snapshot(snapshot)
+            if snapshot is None:
                 context.abort(
                     grpc.StatusCode.NOT_FOUND, f"Snapshot not found: {snapshot_id}"
                 )
-
-            # Delete snapshot
-            _snapshot=self.snapshots.pop(snapshot_id)
             logger.info(
                 f'Snapshot deleted: {snapshot["pool"]}@{snapshot["snapshot"]}, '
                 f'principal={principal.principal_id if principal else "unknown"}'
             )
 
             return debvisor_pb2.SnapshotStatus(
-                _snapshot_id=snapshot_id,
-                _status=StatusCode.OK.value,
-                _message="Snapshot deleted successfully",
+                snapshot_id=snapshot_id,
+                status=StatusCode.OK.value,
+                message="Snapshot deleted successfully",
             )
 
         except ValueError as e:
@@ -537,11 +670,11 @@ class MigrationServiceImpl(debvisor_pb2_grpc.MigrationServiceServicer):
     ) -> debvisor_pb2.MigrationPlan:
         """Plan a VM migration"""
         try:
-            _vm_id=RequestValidator.validate_uuid(request.vm_id)
-            _target_node=RequestValidator.validate_hostname(request.target_node)
+            vm_id=RequestValidator.validate_uuid(request.vm_id)
+            target_node=RequestValidator.validate_hostname(request.target_node)
 
             # Check authorization
-            _principal=extract_identity(context)
+            principal=extract_identity(context)
             check_permission(principal, "migration:plan", context)
 
             # Plan migration (validate prerequisites)
@@ -559,10 +692,10 @@ class MigrationServiceImpl(debvisor_pb2_grpc.MigrationServiceServicer):
             )
 
             return debvisor_pb2.MigrationPlan(
-                _plan_id=f"plan-{datetime.now(timezone.utc).timestamp()}",
-                _status=StatusCode.OK.value,
-                _estimated_duration_seconds=plan["estimated_duration_seconds"],
-                _message="Migration plan created",
+                plan_id=f"plan-{datetime.now(timezone.utc).timestamp()}",
+                status=StatusCode.OK.value,
+                estimated_duration_seconds=plan["estimated_duration_seconds"],
+                message="Migration plan created",
             )
 
         except ValueError as e:
@@ -577,20 +710,21 @@ class MigrationServiceImpl(debvisor_pb2_grpc.MigrationServiceServicer):
 class RPCServer:
     """Main RPC server orchestrator"""
 
-    def __init__(self, configfile: Optional[str] = None) -> None:
+    def __init__(self, config_file: Optional[str] = None) -> None:
         """Initialize RPC server with configuration"""
         self.config=self._load_config(config_file)
         self.server: Optional[grpc.Server] = None
+        self.node_registry: Optional[ShardedNodeRegistry] = None
         self.cert_monitor: Any=None
         logger.info(f"RPCServer initialized from config: {config_file}")
 
-    def _load_config(self, configfile: Optional[str]) -> Dict[str, Any]:
+    def _load_config(self, config_file: Optional[str]) -> Dict[str, Any]:
         """Load configuration from JSON file and merge with environment settings."""
         config: Dict[str, Any] = {}
         if config_file:
             try:
                 with open(config_file, "r") as f:
-                    _config=json.load(f)
+                    config=json.load(f)
                 logger.info(f"Configuration loaded from {config_file}")
             except FileNotFoundError:
                 logger.warning(
@@ -606,7 +740,7 @@ class RPCServer:
 
             # Helper to apply setting if set in env or missing in config
 
-            def apply_setting(confkey: str, settingkey: str) -> None:
+            def apply_setting(conf_key: str, setting_key: str) -> None:
             # If explicitly set in environment (in model_fields_set), it overrides everything
                 # If not set in environment, but missing in config, use default from settings
                 if setting_key in settings.model_fields_set:
@@ -629,21 +763,21 @@ class RPCServer:
 
     def _load_tls_credentials(self) -> grpc.ServerCredentials:
         """Load TLS certificates for server"""
-        _cert_file=str(self.config.get("tls_cert_file", "/etc/debvisor/certs/server.crt"))
-        _key_file=str(self.config.get("tls_key_file", "/etc/debvisor/certs/server.key"))
-        _ca_file=self.config.get("tls_ca_file")
+        cert_file=str(self.config.get("tls_cert_file", "/etc/debvisor/certs/server.crt"))
+        key_file=str(self.config.get("tls_key_file", "/etc/debvisor/certs/server.key"))
+        ca_file=self.config.get("tls_ca_file")
 
         try:
             with open(key_file, "rb") as f:
-                _private_key=f.read()
+                private_key=f.read()
 
             with open(cert_file, "rb") as f:
-                _certificate_chain=f.read()
+                certificate_chain=f.read()
 
             ca_cert=None
             if ca_file:
                 with open(str(ca_file), "rb") as f:
-                    _ca_cert=f.read()
+                    ca_cert=f.read()
 
             logger.info("TLS credentials loaded successfully")
 
@@ -654,8 +788,8 @@ class RPCServer:
 
             return grpc.ssl_server_credentials(
                 [(private_key, certificate_chain)],
-                _root_certificates=ca_cert,
-                _require_client_auth=bool(self.config.get("require_client_auth", True)),
+                root_certificates=ca_cert,
+                require_client_auth=bool(self.config.get("require_client_auth", True)),
             )
 
         except FileNotFoundError as e:
@@ -670,7 +804,7 @@ class RPCServer:
         logger.info("Starting DebVisor RPC service")
 
         # Create server with interceptors
-        _interceptors=[
+        interceptors=[
             AuthenticationInterceptor(self.config),
             AuthorizationInterceptor(self.config),
             AuditInterceptor(self.config),
@@ -678,11 +812,11 @@ class RPCServer:
         ]
 
         # Configure Connection Pooling & Performance Options
-        _pool_config=self.config.get("connection_pool", {})
-        _max_workers=pool_config.get("max_connections", 50)
+        pool_config=self.config.get("connection_pool", {})
+        max_workers=pool_config.get("max_connections", 50)
 
         # gRPC Channel Options for Performance & Keepalive
-        _options=[
+        options=[
             ("grpc.max_send_message_length", 50 * 1024 * 1024),    # 50MB
             ("grpc.max_receive_message_length", 50 * 1024 * 1024),    # 50MB
             (
@@ -700,10 +834,10 @@ class RPCServer:
         ]
 
         # Configure Compression
-        _compression_config=self.config.get("compression", {})
+        compression_config=self.config.get("compression", {})
         compression_algorithm=grpc.Compression.NoCompression
         if compression_config.get("enabled", False):
-            _algo=compression_config.get("algorithm", "gzip").lower()
+            algo=compression_config.get("algorithm", "gzip").lower()
             if algo == "gzip":
                 compression_algorithm=grpc.Compression.Gzip
             elif algo == "deflate":
@@ -712,14 +846,18 @@ class RPCServer:
 
         self.server=grpc.server(
             futures.ThreadPoolExecutor(max_workers=max_workers),
-            _interceptors=interceptors,
-            _options=options,
-            _compression=compression_algorithm,
+            interceptors=interceptors,
+            options=options,
+            compression=compression_algorithm,
         )
 
+        # Node registry: in-memory index, heartbeats flushed in batches
+        self.node_registry=create_node_registry(self.config)
+        self.node_registry.start()
+
         # Register services
         debvisor_pb2_grpc.add_NodeServiceServicer_to_server(
-            NodeServiceImpl(),
+            NodeServiceImpl(registry=self.node_registry),
             self.server,
         )
         debvisor_pb2_grpc.add_StorageServiceServicer_to_server(
@@ -732,11 +870,11 @@ class RPCServer:
         )
 
         # Load TLS credentials
-        _tls_creds=self._load_tls_credentials()
+        tls_creds=self._load_tls_credentials()
 
         # Bind to port
-        _host=self.config.get("host", "127.0.0.1")
-        _port=self.config.get("port", 7443)
+        host=self.config.get("host", "127.0.0.1")
+        port=self.config.get("port", 7443)
         self.server.add_secure_port(f"{host}:{port}", tls_creds)
 
         logger.info(f"RPC server listening on {host}:{port}")
@@ -752,11 +890,14 @@ class RPCServer:
             logger.info("Shutting down RPC server")
             self.stop()
 
-    def stop(self, gracetimeout: int=5) -> None:
+    def stop(self, grace_timeout: int=5) -> None:
         """Gracefully shutdown RPC server"""
         if self.server:
             logger.info(f"Shutting down server (grace timeout: {grace_timeout}s)")
-            self.server.stop(grace_timeout)
+            self.server.stop(grace_timeout).wait(grace_timeout)
+        if self.node_registry:
+            self.node_registry.close()
+            self.node_registry=None
 
 
 def main() -> None:
@@ -764,10 +905,10 @@ def main() -> None:
     # Use centralized configuration if available
     try:
         from opt.core.config import Settings
-        _settings=Settings()
+        settings=Settings()
 
         # Map Settings to legacy config dict structure for backward compatibility
-        _config={
+        config={
             "host": settings.RPC_HOST,
             "port": settings.RPC_PORT,
             "tls": {
@@ -784,21 +925,21 @@ def main() -> None:
         }
 
         # Override with file config if present (legacy support)
-        _config_file=os.environ.get("RPC_CONFIG_FILE")
+        config_file=os.environ.get("RPC_CONFIG_FILE")
         if config_file and os.path.exists(config_file):
             with open(config_file, "r") as f:
-                _file_config=json.load(f)
+                file_config=json.load(f)
                 config.update(file_config)
 
-        _server=RPCServer(config_file=None)    # Pass None to skip internal file loading
+        server=RPCServer(config_file=None)    # Pass None to skip internal file loading
         server.config=config    # Inject config directly
         server.start()
 
     except ImportError:
     # Fallback to legacy behavior
-        _config_file=os.environ.get("RPC_CONFIG_FILE", "/etc/debvisor/rpc/config.json")
+        config_file=os.environ.get("RPC_CONFIG_FILE", "/etc/debvisor/rpc/config.json")
         try:
-            _server=RPCServer(config_file)
+            server=RPCServer(config_file)
             server.start()
         except Exception as e:
             logger.error(f"Failed to start RPC server: {e}")
@@ -808,5 +949,5 @@ def main() -> None:
         sys.exit(1)
 
 
-if _name__== "__main__":
+if __name__ == "__main__":
     main()
@@ -109,7 +109,8 @@ Features:
 - SLI definitions for latency, availability, throughput, error rate
 - SLO targets with burn rate alerting
 - Error budget tracking and forecasting
-- Rolling window calculations
+- Rolling window calculations over time-bucketed aggregates
+- Mergeable latency percentile sketches per bucket (see quantile_sketch)
 - Multi-window alerting (for page-able incidents)
 - Integration with Prometheus metrics
 
@@ -119,18 +120,22 @@ Author: DebVisor Team
 Date: November 28, 2025
 """
 
+import bisect
 import functools
 import asyncio
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import Any, Callable, Deque, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
-_logger=logging.getLogger(__name__)
+from opt.services.quantile_sketch import DEFAULT_RELATIVE_ACCURACY, DDSketch
+
+logger=logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -186,7 +191,7 @@ class SLODefinition:
     target: float    # Target percentage (0-100)
     window_days: int=30
     burn_rate_thresholds: Dict[AlertSeverity, float] = field(
-        _default_factory=lambda: {
+        default_factory=lambda: {
             AlertSeverity.WARNING: 2.0,
             AlertSeverity.CRITICAL: 10.0,
             AlertSeverity.PAGE: 14.4,    # 2% budget consumed in 1 hour
@@ -249,14 +254,14 @@ class SLOTarget(SLODefinition):
                 else:
                     target=target_value
             else:
-                _target=99.9    # Default
+                target=99.9    # Default
 
         # Handle window conversion
         if window_days is None:
             if window_hours is not None:
-                _window_days=max(1, window_hours // 24)
+                window_days=max(1, window_hours // 24)
             else:
-                _window_days=30    # Default
+                window_days=30    # Default
 
         # Handle burn rate conversion
         if burn_rate_thresholds is None:
@@ -267,7 +272,7 @@ class SLOTarget(SLODefinition):
                     AlertSeverity.PAGE: burn_rate_threshold * 7,
                 }
             else:
-                _burn_rate_thresholds={
+                burn_rate_thresholds={
                     AlertSeverity.WARNING: 2.0,
                     AlertSeverity.CRITICAL: 10.0,
                     AlertSeverity.PAGE: 14.4,
@@ -275,12 +280,12 @@ class SLOTarget(SLODefinition):
 
         # Call parent constructor
         super().__init__(
-            _name=name,
-            _sli_type=sli_type,
-            _target=target,
-            _window_days=window_days,
-            _burn_rate_thresholds=burn_rate_thresholds,
-            _description=description,
+            name=name,
+            sli_type=sli_type,
+            target=target,
+            window_days=window_days,
+            burn_rate_thresholds=burn_rate_thresholds,
+            description=description,
         )
 
         # Store additional attributes for backward compatibility
@@ -339,10 +344,19 @@ class SLICalculator(ABC):
     """Base class for SLI calculations."""
 
     @abstractmethod
-    def calculate(self, datapoints: List[SLIDataPoint]) -> float:
+    def calculate(self, data_points: List[SLIDataPoint]) -> float:
         """Calculate SLI value from data points."""
         pass
 
+    def calculate_window(self, stats: "SLIBucket") -> Optional[float]:
+        """
+        Calculate SLI value from aggregated window statistics.
+
+        Returns None when the calculator needs raw data points, in which
+        case the tracker falls back to ``calculate``.
+        """
+        return None
+
 
 class AvailabilitySLI(SLICalculator):
     """
@@ -351,13 +365,18 @@ class AvailabilitySLI(SLICalculator):
     Calculates: (successful_requests / total_requests) * 100
     """
 
-    def calculate(self, datapoints: List[SLIDataPoint]) -> float:
+    def calculate(self, data_points: List[SLIDataPoint]) -> float:
         if not data_points:
             return 100.0    # No data=assume healthy
 
-        _successful=sum(1 for dp in data_points if dp.success)
+        successful=sum(1 for dp in data_points if dp.success)
         return (successful / len(data_points)) * 100
 
+    def calculate_window(self, stats: "SLIBucket") -> Optional[float]:
+        if not stats.count:
+            return 100.0
+        return ((stats.count - stats.errors) / stats.count) * 100
+
 
 class LatencySLI(SLICalculator):
     """
@@ -366,7 +385,7 @@ class LatencySLI(SLICalculator):
     Calculates percentage of requests within latency threshold.
     """
 
-    def __init__(self, thresholdms: float, percentile: float=95.0) -> None:
+    def __init__(self, threshold_ms: float, percentile: float=95.0) -> None:
         """
         Args:
             threshold_ms: Latency threshold in milliseconds
@@ -375,7 +394,7 @@ class LatencySLI(SLICalculator):
         self.threshold_ms=threshold_ms
         self.percentile=percentile
 
-    def calculate(self, datapoints: List[SLIDataPoint]) -> float:
+    def calculate(self, data_points: List[SLIDataPoint]) -> float:
         if not data_points:
             return 100.0
 
@@ -387,16 +406,22 @@ class LatencySLI(SLICalculator):
         within_threshold=sum(1 for lat in latencies if lat <= self.threshold_ms)
         return (within_threshold / len(latencies)) * 100
 
-    def get_percentile(self, datapoints: List[SLIDataPoint]) -> float:
-        """Get the actual percentile value."""
-        latencies=sorted(
-            [dp.latency_ms for dp in data_points if dp.latency_ms is not None]
-        )
-        if not latencies:
-            return 0.0
+    def calculate_window(self, stats: "SLIBucket") -> Optional[float]:
+        if stats.latency_threshold_ms != self.threshold_ms:
+            return None    # Buckets were counted against another threshold
+        if not stats.latency_count:
+            return 100.0
+        return (stats.latency_good / stats.latency_count) * 100
+
+    def get_percentile(self, data_points: List[SLIDataPoint]) -> float:
+        """Get the actual percentile value (within the sketch's relative error)."""
+        sketch=DDSketch()
+        sketch.add_many([dp.latency_ms for dp in data_points if dp.latency_ms is not None])
+        return self.get_sketch_percentile(sketch)
 
-        _index=int(len(latencies) * (self.percentile / 100))
-        return latencies[min(index, len(latencies) - 1)]
+    def get_sketch_percentile(self, sketch: DDSketch) -> float:
+        """Get the percentile value from an already aggregated sketch."""
+        return sketch.percentile(self.percentile) or 0.0
 
 
 class ErrorRateSLI(SLICalculator):
@@ -407,14 +432,19 @@ class ErrorRateSLI(SLICalculator):
     Target is inverted - higher is better.
     """
 
-    def calculate(self, datapoints: List[SLIDataPoint]) -> float:
+    def calculate(self, data_points: List[SLIDataPoint]) -> float:
         if not data_points:
             return 100.0    # No data=no errors
 
-        _errors=sum(1 for dp in data_points if not dp.success)
-        _error_rate=errors / len(data_points)
+        errors=sum(1 for dp in data_points if not dp.success)
+        error_rate=errors / len(data_points)
         return (1 - error_rate) * 100    # Convert to "good" percentage
 
+    def calculate_window(self, stats: "SLIBucket") -> Optional[float]:
+        if not stats.count:
+            return 100.0
+        return (1 - stats.errors / stats.count) * 100
+
 
 class ThroughputSLI(SLICalculator):
     """
@@ -423,25 +453,271 @@ class ThroughputSLI(SLICalculator):
     Calculates requests per second, compared to target.
     """
 
-    def __init__(self, targetrps: float) -> None:
+    def __init__(self, target_rps: float) -> None:
         self.target_rps=target_rps
 
-    def calculate(self, datapoints: List[SLIDataPoint]) -> float:
+    def calculate(self, data_points: List[SLIDataPoint]) -> float:
         if not data_points or len(data_points) < 2:
             return 100.0
 
         # Calculate time span
-        _timestamps=sorted([dp.timestamp for dp in data_points])
-        _duration_seconds=(timestamps[-1] - timestamps[0]).total_seconds()
+        timestamps=sorted([dp.timestamp for dp in data_points])
+        duration_seconds=(timestamps[-1] - timestamps[0]).total_seconds()
 
         if duration_seconds == 0:
             return 100.0
 
-        _actual_rps=len(data_points) / duration_seconds
+        actual_rps=len(data_points) / duration_seconds
 
         # Return percentage of target achieved (capped at 100%)
         return min(100.0, (actual_rps / self.target_rps) * 100)
 
+    def calculate_window(self, stats: "SLIBucket") -> Optional[float]:
+        if stats.count < 2:
+            return 100.0
+        duration_seconds=stats.last_seen - stats.first_seen
+        if duration_seconds <= 0:
+            return 100.0
+        return min(100.0, (stats.count / duration_seconds / self.target_rps) * 100)
+
+
+# =============================================================================
+# Windowed Aggregation
+# =============================================================================
+@dataclass
+class SLIBucket:
+    """
+    Aggregated measurements for one time slice.
+
+    The same structure doubles as the accumulator for a whole window, so
+    merging buckets and evaluating a window share one code path.
+    """
+
+    start: float
+    count: int=0
+    errors: int=0
+    latency_count: int=0
+    latency_good: int=0
+    latency_sum_ms: float=0.0
+    first_seen: float=math.inf
+    last_seen: float=-math.inf
+    latency_threshold_ms: Optional[float] = None
+    sketch_accuracy: Optional[float] = None    # None: do not keep a sketch
+    latency_sketch: Optional[DDSketch] = None
+
+    def add(self, timestamp: float, success: bool, latency_ms: Optional[float]) -> None:
+        """Add one measurement."""
+        self.count += 1
+        if not success:
+            self.errors += 1
+        if latency_ms is not None:
+            self.latency_count += 1
+            self.latency_sum_ms += latency_ms
+            if self.latency_threshold_ms is not None and latency_ms <= self.latency_threshold_ms:
+                self.latency_good += 1
+            if self.sketch_accuracy is not None:
+                if self.latency_sketch is None:
+                    self.latency_sketch=DDSketch(self.sketch_accuracy)
+                self.latency_sketch.add(latency_ms)
+        if timestamp < self.first_seen:
+            self.first_seen=timestamp
+        if timestamp > self.last_seen:
+            self.last_seen=timestamp
+
+    def merge(self, other: "SLIBucket") -> None:
+        """Fold another bucket into this one."""
+        self.count += other.count
+        self.errors += other.errors
+        self.latency_count += other.latency_count
+        self.latency_good += other.latency_good
+        self.latency_sum_ms += other.latency_sum_ms
+        self.first_seen=min(self.first_seen, other.first_seen)
+        self.last_seen=max(self.last_seen, other.last_seen)
+        if self.sketch_accuracy is not None and other.latency_sketch is not None:
+            if self.latency_sketch is None:
+                self.latency_sketch=DDSketch(self.sketch_accuracy)
+            self.latency_sketch.merge(other.latency_sketch)
+
+    def subtract(self, other: "SLIBucket") -> None:
+        """Remove a previously merged bucket (first/last seen are not restored)."""
+        self.count -= other.count
+        self.errors -= other.errors
+        self.latency_count -= other.latency_count
+        self.latency_good -= other.latency_good
+        self.latency_sum_ms -= other.latency_sum_ms
+
+
+class SLIWindow:
+    """
+    Time-bucketed ring of SLI aggregates for one SLO.
+
+    Measurements are folded into fixed-width buckets (one minute by
+    default) as they are recorded. Evaluating a window then walks only the
+    buckets it covers, newest first, so the 1h and 6h burn-rate windows
+    touch at most 60 and 360 buckets. The full retention window is served
+    from running totals that are adjusted as buckets expire.
+
+    Recent buckets also carry a latency sketch, and sketches are rolled up
+    per 60 buckets, so a 30-day percentile merges about 720 rollups plus
+    the buckets at the edges. Bucket sketches older than
+    ``fine_retention_seconds`` (the 6h burn-rate window by default) are
+    released to bound memory; windows reaching that far back use whole
+    rollups at their old edge.
+    """
+
+    ROLLUP_BUCKETS=60
+
+    def __init__(
+        self,
+        retention_seconds: float,
+        bucket_seconds: float=60.0,
+        latency_threshold_ms: Optional[float] = None,
+        sketch_accuracy: Optional[float] = DEFAULT_RELATIVE_ACCURACY,
+        fine_retention_seconds: Optional[float] = None,
+    ) -> None:
+        if bucket_seconds <= 0:
+            raise ValueError("bucket_seconds must be positive")
+        self.retention_seconds=retention_seconds
+        self.bucket_seconds=bucket_seconds
+        self.latency_threshold_ms=latency_threshold_ms
+        self.sketch_accuracy=sketch_accuracy
+        self._rollup_seconds=bucket_seconds * self.ROLLUP_BUCKETS
+        self.fine_retention_seconds=(
+            fine_retention_seconds
+            if fine_retention_seconds is not None
+            else 6 * 3600 + self._rollup_seconds
+        )
+        self._released_until=-math.inf    # Bucket sketches before this are gone
+        self._starts: List[float] = []    # Sorted bucket start times
+        self._buckets: Dict[float, SLIBucket] = {}
+        self._rollups: Dict[float, DDSketch] = {}
+        self._total=self._new_bucket(0.0)
+        self.last_latency_ms: Optional[float] = None
+        self._last_timestamp=-math.inf
+
+    def _new_bucket(self, start: float) -> SLIBucket:
+        return SLIBucket(start=start, latency_threshold_ms=self.latency_threshold_ms)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def add(self, data_point: SLIDataPoint) -> bool:
+        """Fold a data point into its bucket; False if it is already outside retention."""
+        ts=data_point.timestamp.timestamp()
+        if self._starts and ts < self._starts[-1] - self.retention_seconds:
+            return False
+        start=ts - (ts % self.bucket_seconds)
+        bucket=self._buckets.get(start)
+        if bucket is None:
+            bucket=self._buckets[start] = self._new_bucket(start)
+            if start >= self._released_until:
+                bucket.sketch_accuracy=self.sketch_accuracy
+            if not self._starts or start > self._starts[-1]:
+                self._starts.append(start)    # In-order fast path
+            else:
+                bisect.insort(self._starts, start)
+        bucket.add(ts, data_point.success, data_point.latency_ms)
+        self._total.add(ts, data_point.success, data_point.latency_ms)
+        if data_point.latency_ms is not None:
+            if self.sketch_accuracy is not None:
+                rollup_start=ts - (ts % self._rollup_seconds)
+                rollup=self._rollups.get(rollup_start)
+                if rollup is None:
+                    rollup=self._rollups[rollup_start] = DDSketch(self.sketch_accuracy)
+                rollup.add(data_point.latency_ms)
+            if ts >= self._last_timestamp:
+                self.last_latency_ms=data_point.latency_ms
+                self._last_timestamp=ts
+        return True
+
+    def prune(self, now: float) -> int:
+        """Drop buckets that ended before the retention window; returns count."""
+        cutoff=now - self.retention_seconds - self.bucket_seconds
+        drop=bisect.bisect_right(self._starts, cutoff)
+        for start in self._starts[:drop]:
+            self._total.subtract(self._buckets.pop(start))
+        del self._starts[:drop]
+        if drop:
+            for rollup_start in [r for r in self._rollups if r + self._rollup_seconds <= cutoff]:
+                del self._rollups[rollup_start]
+
+        fine_cutoff=now - self.fine_retention_seconds
+        if fine_cutoff > self._released_until:
+            first=bisect.bisect_left(self._starts, self._released_until)
+            last=bisect.bisect_left(self._starts, fine_cutoff)
+            for start in self._starts[first:last]:
+                bucket=self._buckets[start]
+                bucket.sketch_accuracy=None
+                bucket.latency_sketch=None
+            self._released_until=fine_cutoff
+        return drop
+
+    def stats(self, window_seconds: float, now: float) -> SLIBucket:
+        """
+        Aggregate the buckets overlapping ``[now - window_seconds, now]``.
+
+        Resolution is one bucket: the oldest bucket is counted whole.
+        """
+        self.prune(now)
+        window_start=now - window_seconds
+        if not self._starts:
+            return self._new_bucket(window_start)
+        if window_seconds >= self.retention_seconds and self._starts[-1] <= now:
+            result=self._new_bucket(window_start)
+            result.merge(self._total)
+            result.first_seen=self._buckets[self._starts[0]].first_seen
+            result.last_seen=self._buckets[self._starts[-1]].last_seen
+            return result
+
+        result=self._new_bucket(window_start)
+        first=bisect.bisect_right(self._starts, window_start - self.bucket_seconds)
+        last=bisect.bisect_right(self._starts, now)
+        for start in self._starts[first:last]:
+            result.merge(self._buckets[start])
+        return result
+
+    def latency_sketch(self, window_seconds: float, now: float) -> DDSketch:
+        """
+        Merged latency sketch for the buckets overlapping the window.
+
+        Whole rollups inside the window are merged directly; buckets at
+        the edges are merged one by one.
+        """
+        self.prune(now)
+        result=DDSketch(self.sketch_accuracy or DEFAULT_RELATIVE_ACCURACY)
+        if self.sketch_accuracy is None:
+            return result
+        lowest=now - window_seconds - self.bucket_seconds
+        position=bisect.bisect_right(self._starts, lowest)
+        last=bisect.bisect_right(self._starts, now)
+        while position < last:
+            start=self._starts[position]
+            rollup_start=start - (start % self._rollup_seconds)
+            rollup_end=rollup_start + self._rollup_seconds
+            rollup=self._rollups.get(rollup_start)
+            released=start < self._released_until
+            if rollup is not None and (
+                released or (rollup_start > lowest and rollup_end - self.bucket_seconds <= now)
+            ):
+                result.merge(rollup)
+                position=bisect.bisect_left(self._starts, rollup_end, position)
+                continue
+            sketch=self._buckets[start].latency_sketch
+            if sketch is not None:
+                result.merge(sketch)
+            position += 1
+        return result
+
+    def clear(self) -> None:
+        """Drop all buckets."""
+        self._starts.clear()
+        self._buckets.clear()
+        self._rollups.clear()
+        self._released_until=-math.inf
+        self._total=self._new_bucket(0.0)
+        self.last_latency_ms=None
+        self._last_timestamp=-math.inf
+
 
 # =============================================================================
 # SLO Tracker
@@ -451,40 +727,54 @@ class SLOTracker:
     Tracks SLO compliance and error budgets.
 
     Example:
-        _tracker=SLOTracker()
+        tracker=SLOTracker()
 
         # Define SLO
         slo=SLODefinition(
-            _name="api-availability",
-            _sli_type=SLIType.AVAILABILITY,
-            _target=99.9,
-            _window_days=30
+            name="api-availability",
+            sli_type=SLIType.AVAILABILITY,
+            target=99.9,
+            window_days=30
         )
         tracker.register_slo(slo)
 
         # Record data points
         tracker.record(slo.name, SLIDataPoint(
-            _timestamp=datetime.now(timezone.utc),
-            _value=1.0,
-            _success=True
+            timestamp=datetime.now(timezone.utc),
+            value=1.0,
+            success=True
         ))
 
         # Get status
-        _status=tracker.get_slo_status(slo.name)
+        status=tracker.get_slo_status(slo.name)
     """
 
-    def __init__(self, maxdata_points: int=1_000_000, service: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        max_data_points: int=1_000_000,
+        service: Optional[str] = None,
+        bucket_seconds: float=60.0,
+        sketch_accuracy: Optional[float] = DEFAULT_RELATIVE_ACCURACY,
+    ) -> None:
         """
         Initialize SLO tracker.
 
         Args:
-            max_data_points: Maximum data points to retain per SLO
+            max_data_points: Maximum raw data points to retain per SLO
+                (used by custom calculators and the ``records`` property)
             service: Service name (for backward compatibility)
+            bucket_seconds: Width of the aggregate buckets that SLI values
+                and burn rates are computed from
+            sketch_accuracy: Relative error of the per-bucket latency
+                sketches (None disables latency percentiles)
         """
         self._slos: Dict[str, SLODefinition] = {}
         self._calculators: Dict[str, SLICalculator] = {}
         self._data: Dict[str, Deque[SLIDataPoint]] = {}
+        self._windows: Dict[str, SLIWindow] = {}
         self._max_data_points=max_data_points
+        self._bucket_seconds=bucket_seconds
+        self._sketch_accuracy=sketch_accuracy
         self._lock=asyncio.Lock()
         self._alert_callbacks: List[Callable[[str, SLOStatus], None]] = []
         self.service=service    # Backward compatibility
@@ -515,15 +805,15 @@ class SLOTracker:
                 or getattr(target, "threshold_ms", None)
                 or 200
             )
-            _percentile=getattr(target, "percentile", 95.0)
-            _calc=LatencySLI(threshold_ms=threshold, percentile=percentile)
+            percentile=getattr(target, "percentile", 95.0)
+            calc=LatencySLI(threshold_ms=threshold, percentile=percentile)
         self.register_slo(target, calculator=calc)
 
     # Backward compatibility: check_compliance
 
-    def check_compliance(self, targetname: str) -> Optional[Any]:
+    def check_compliance(self, target_name: str) -> Optional[Any]:
         """Check SLO compliance (backward compatibility for get_slo_status)."""
-        _status=self.get_slo_status(target_name)
+        status=self.get_slo_status(target_name)
         if not status:
             return None
 
@@ -544,7 +834,7 @@ class SLOTracker:
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary report (backward compatibility for get_all_status)."""
-        _all_status=self.get_all_status()
+        all_status=self.get_all_status()
         return {
         # Nested legacy key (service name)
             self.service
@@ -579,17 +869,25 @@ class SLOTracker:
             if getattr(slo, "sli_type", None) == SLIType.LATENCY and hasattr(
                 slo, "target_value"
             ):
-                _threshold=getattr(slo, "target_value", None) or 200
-                _percentile=getattr(slo, "percentile", 95.0)
+                threshold=getattr(slo, "target_value", None) or 200
+                percentile=getattr(slo, "percentile", 95.0)
                 self._calculators[slo.name] = LatencySLI(
-                    _threshold_ms=threshold, percentile=percentile
+                    threshold_ms=threshold, percentile=percentile
                 )
             else:
                 self._calculators[slo.name] = self._get_default_calculator(slo.sli_type)
 
+        # Retain at least the 6h burn-rate window even for short SLO windows
+        self._windows[slo.name] = SLIWindow(
+            retention_seconds=max(slo.window_days * 86400, 6 * 3600),
+            bucket_seconds=self._bucket_seconds,
+            latency_threshold_ms=getattr(self._calculators[slo.name], "threshold_ms", None),
+            sketch_accuracy=self._sketch_accuracy,
+        )
+
         logger.info(f"Registered SLO: {slo.name} (target: {slo.target}%)")
 
-    def _get_default_calculator(self, slitype: SLIType) -> SLICalculator:
+    def _get_default_calculator(self, sli_type: SLIType) -> SLICalculator:
         """Get default calculator for SLI type."""
         if sli_type == SLIType.AVAILABILITY:
             return AvailabilitySLI()
@@ -620,11 +918,11 @@ class SLOTracker:
             await tracker.record("slo-name", data_point)
 
         And old API:
-            _record=tracker.record(
-                _sli_type=SLIType.LATENCY,
-                _operation="test_op",
-                _value=150.0,
-                _success=True
+            record=tracker.record(
+                sli_type=SLIType.LATENCY,
+                operation="test_op",
+                value=150.0,
+                success=True
             )
 
         Args:
@@ -642,16 +940,16 @@ class SLOTracker:
         # Handle backward compatibility
         if data_point is None and value is not None:
         # Old API: create data point from individual params
-            _data_point=SLIDataPoint(
-                _timestamp=datetime.now(timezone.utc),
-                _value=value,
-                _success=success if success is not None else True,
-                _latency_ms=(
+            data_point=SLIDataPoint(
+                timestamp=datetime.now(timezone.utc),
+                value=value,
+                success=success if success is not None else True,
+                latency_ms=(
                     latency_ms
                     if latency_ms is not None
                     else (value if sli_type== SLIType.LATENCY else None)
                 ),
-                _labels={"operation": operation} if operation else {},
+                labels={"operation": operation} if operation else {},
             )
             # Set sli_type attribute for backward compatibility
             setattr(data_point, "sli_type", sli_type)
@@ -674,6 +972,7 @@ class SLOTracker:
                 return data_point
 
             self._data[slo_name].append(data_point)
+            self._windows[slo_name].add(data_point)
 
         # Check for alerts asynchronously
         asyncio.create_task(self._check_alerts(slo_name))
@@ -695,16 +994,16 @@ class SLOTracker:
         # Handle backward compatibility
         if data_point is None and value is not None:
         # Old API: create data point from individual params
-            _data_point=SLIDataPoint(
-                _timestamp=datetime.now(timezone.utc),
-                _value=value,
-                _success=success if success is not None else True,
-                _latency_ms=(
+            data_point=SLIDataPoint(
+                timestamp=datetime.now(timezone.utc),
+                value=value,
+                success=success if success is not None else True,
+                latency_ms=(
                     latency_ms
                     if latency_ms is not None
                     else (value if sli_type== SLIType.LATENCY else None)
                 ),
-                _labels={"operation": operation} if operation else {},
+                labels={"operation": operation} if operation else {},
             )
             # Set sli_type attribute for backward compatibility
             setattr(data_point, "sli_type", sli_type)
@@ -725,6 +1024,7 @@ class SLOTracker:
             return data_point
 
         self._data[slo_name].append(data_point)
+        self._windows[slo_name].add(data_point)
         return data_point
 
     # Alias record to record_sync for backward compatibility with non-async tests
@@ -735,7 +1035,7 @@ class SLOTracker:
         try:
             import inspect
 
-            _frame=inspect.currentframe()
+            frame=inspect.currentframe()
             if frame and frame.f_back:
             # Check if we're in an async context
                 import asyncio
@@ -752,10 +1052,14 @@ class SLOTracker:
         # Default to sync for backward compatibility
         return self.record_sync(*args, **kwargs)
 
-    def get_slo_status(self, sloname: str) -> Optional[SLOStatus]:
+    def get_slo_status(self, slo_name: str) -> Optional[SLOStatus]:
         """
         Get current status for an SLO.
 
+        SLI values and burn rates come from the SLO's bucketed aggregates,
+        so the cost is proportional to the number of buckets in each
+        window rather than the number of recorded data points.
+
         Args:
             slo_name: Name of the SLO
 
@@ -766,66 +1070,89 @@ class SLOTracker:
             return None
 
         slo=self._slos[slo_name]
-        _calculator=self._calculators[slo_name]
-
-        _now=datetime.now(timezone.utc)
-        _window_start=now - timedelta(days=slo.window_days)
+        calculator=self._calculators[slo_name]
 
-        # Filter data points within window
-        data_points=[
-            dp for dp in self._data[slo_name] if dp.timestamp >= window_start
-        ]
+        now=datetime.now(timezone.utc)
+        window_start=now - timedelta(days=slo.window_days)
 
         # Calculate current SLI value
-        _current_value=calculator.calculate(data_points)
+        current_value, data_points=self._evaluate_window(
+            slo_name, calculator, slo.window_days, now
+        )
 
         # Calculate error budget
         error_budget_total=100 - slo.target    # e.g., 0.1% for 99.9% target
-        _error_budget_consumed=max(0, slo.target - current_value)
-        _error_budget_remaining=max(0, error_budget_total - error_budget_consumed)
+        error_budget_consumed=max(0, slo.target - current_value)
+        error_budget_remaining=max(0, error_budget_total - error_budget_consumed)
 
         # Calculate burn rates
-        _burn_rate=self._calculate_burn_rate(slo_name, calculator, slo.window_days)
-        _burn_rate_1h=self._calculate_burn_rate(slo_name, calculator, 1 / 24)    # 1 hour
-        _burn_rate_6h=self._calculate_burn_rate(
-            slo_name, calculator, 6 / 24    # 6 hours
+        burn_rate=self._calculate_burn_rate(
+            slo_name, calculator, slo.window_days, now, (current_value, data_points)
+        )
+        burn_rate_1h=self._calculate_burn_rate(slo_name, calculator, 1 / 24, now)    # 1 hour
+        burn_rate_6h=self._calculate_burn_rate(
+            slo_name, calculator, 6 / 24, now    # 6 hours
         )
 
         # Determine alert severity
-        _alert_severity=self._get_alert_severity(slo, burn_rate_1h)
+        alert_severity=self._get_alert_severity(slo, burn_rate_1h)
 
         # Determine compliance; for latency treat any threshold breach as non-compliant
         is_meeting=current_value >= slo.target
         try:
             if slo.sli_type == SLIType.LATENCY and data_points:
-                _thr=getattr(calculator, "threshold_ms", None)
+                thr=getattr(calculator, "threshold_ms", None)
                 if thr is None:
-                    _thr=getattr(slo, "target_value", None)
+                    thr=getattr(slo, "target_value", None)
                 if thr is not None:
-                    last_dp=data_points[-1]
-                    if (last_dp.latency_ms or 0) > thr:
+                    if (self._windows[slo_name].last_latency_ms or 0) > thr:
                         is_meeting=False
         except Exception:
             pass    # nosec B110
 
         return SLOStatus(
-            _slo=slo,
-            _current_value=current_value,
-            _target_value=slo.target,
-            _is_meeting_target=is_meeting,
-            _error_budget_remaining=error_budget_remaining,
-            _error_budget_consumed=error_budget_consumed,
-            _burn_rate=burn_rate,
-            _burn_rate_1h=burn_rate_1h,
-            _burn_rate_6h=burn_rate_6h,
-            _data_points=len(data_points),
-            _window_start=window_start,
-            _window_end=now,
-            _alert_severity=alert_severity,
+            slo=slo,
+            current_value=current_value,
+            target_value=slo.target,
+            is_meeting_target=is_meeting,
+            error_budget_remaining=error_budget_remaining,
+            error_budget_consumed=error_budget_consumed,
+            burn_rate=burn_rate,
+            burn_rate_1h=burn_rate_1h,
+            burn_rate_6h=burn_rate_6h,
+            data_points=data_points,
+            window_start=window_start,
+            window_end=now,
+            alert_severity=alert_severity,
         )
 
+    def _evaluate_window(
+        self, slo_name: str, calculator: SLICalculator, window_days: float, now: datetime
+    ) -> Tuple[float, int]:
+        """
+        Calculate the SLI value and data point count for a trailing window.
+
+        Uses the bucketed aggregates when the calculator supports them and
+        falls back to filtering raw data points for custom calculators.
+        """
+        stats=self._windows[slo_name].stats(window_days * 86400, now.timestamp())
+        value=calculator.calculate_window(stats)
+        if value is not None:
+            return value, stats.count
+
+        window_start=now - timedelta(days=window_days)
+        data_points=[
+            dp for dp in self._data[slo_name] if dp.timestamp >= window_start
+        ]
+        return calculator.calculate(data_points), len(data_points)
+
     def _calculate_burn_rate(
-        self, slo_name: str, calculator: SLICalculator, window_days: float
+        self,
+        slo_name: str,
+        calculator: SLICalculator,
+        window_days: float,
+        now: Optional[datetime] = None,
+        evaluated: Optional[Tuple[float, int]] = None,
     ) -> float:
         """
         Calculate burn rate for a time window.
@@ -835,27 +1162,67 @@ class SLOTracker:
         >1.0 means consuming faster, <1.0 means consuming slower.
         """
         slo=self._slos[slo_name]
-        _now=datetime.now(timezone.utc)
-        _window_start=now - timedelta(days=window_days)
-
-        data_points=[
-            dp for dp in self._data[slo_name] if dp.timestamp >= window_start
-        ]
+        if evaluated is None:
+            evaluated=self._evaluate_window(
+                slo_name, calculator, window_days, now or datetime.now(timezone.utc)
+            )
+        current_value, data_points=evaluated
 
         if not data_points:
             return 0.0
 
-        _current_value=calculator.calculate(data_points)
-
         # Calculate burn rate
         allowed_error_rate=100 - slo.target    # e.g., 0.1%
         actual_error_rate=100 - current_value
 
         if allowed_error_rate == 0:
-            return float("in") if actual_error_rate > 0 else 0.0
+            return float("inf") if actual_error_rate > 0 else 0.0
 
         return actual_error_rate / allowed_error_rate
 
+    def get_latency_sketch(
+        self, slo_name: str, window_days: Optional[float] = None
+    ) -> Optional[DDSketch]:
+        """
+        Get the merged latency sketch for an SLO window.
+
+        The sketch can be serialized with ``to_dict`` and merged with
+        sketches from other nodes for fleet-wide percentiles.
+
+        Args:
+            slo_name: Name of the SLO
+            window_days: Window size (defaults to the SLO window)
+        """
+        slo=self._slos.get(slo_name)
+        if slo is None:
+            return None
+        days=slo.window_days if window_days is None else window_days
+        return self._windows[slo_name].latency_sketch(days * 86400, time.time())
+
+    def get_latency_percentile(
+        self,
+        slo_name: str,
+        percentile: Optional[float] = None,
+        window_days: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Get a latency percentile (ms) for an SLO window.
+
+        Args:
+            slo_name: Name of the SLO
+            percentile: Percentile to report (defaults to the calculator's)
+            window_days: Window size (defaults to the SLO window)
+
+        Returns:
+            Latency in milliseconds, or None without latency data
+        """
+        sketch=self.get_latency_sketch(slo_name, window_days)
+        if sketch is None:
+            return None
+        if percentile is None:
+            percentile=getattr(self._calculators[slo_name], "percentile", 95.0)
+        return sketch.percentile(percentile)
+
     def _get_alert_severity(
         self, slo: SLODefinition, burn_rate_1h: float
     ) -> Optional[AlertSeverity]:
@@ -865,14 +1232,14 @@ class SLOTracker:
             AlertSeverity.CRITICAL,
             AlertSeverity.WARNING,
         ]:
-            _threshold=slo.burn_rate_thresholds.get(severity)
+            threshold=slo.burn_rate_thresholds.get(severity)
             if threshold and burn_rate_1h >= threshold:
                 return severity
         return None
 
-    async def _check_alerts(self, sloname: str) -> None:
+    async def _check_alerts(self, slo_name: str) -> None:
         """Check for alert conditions and trigger callbacks."""
-        _status=self.get_slo_status(slo_name)
+        status=self.get_slo_status(slo_name)
         if status and status.alert_severity:
             for callback in self._alert_callbacks:
                 try:
@@ -907,7 +1274,7 @@ class SLOTracker:
         Returns:
             Forecast information including days until exhaustion
         """
-        _status=self.get_slo_status(slo_name)
+        status=self.get_slo_status(slo_name)
         if not status:
             return None
 
@@ -922,8 +1289,8 @@ class SLOTracker:
             }
 
         # Calculate days until budget exhaustion at current burn rate
-        _remaining_budget=status.error_budget_remaining
-        _daily_consumption=(status.burn_rate - 1.0) * (
+        remaining_budget=status.error_budget_remaining
+        daily_consumption=(status.burn_rate - 1.0) * (
             (100 - status.slo.target) / status.slo.window_days
         )
 
@@ -964,45 +1331,45 @@ def track_sli(
         async def get_users():
             return await db.fetch_users()
     """
-    _labels=labels or {}
+    labels=labels or {}
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            _start_time=time.monotonic()
+            start_time=time.monotonic()
             success=True
 
             try:
-                _result=await func(*args, **kwargs)
+                result=await func(*args, **kwargs)
                 return result
             except Exception:
                 success=False
                 raise
             finally:
-                _latency_ms=(time.monotonic() - start_time) * 1000
+                latency_ms=(time.monotonic() - start_time) * 1000
                 # For availability-style tracking, value reflects success
-                _data_point=SLIDataPoint(
-                    _timestamp=datetime.now(timezone.utc),
-                    _value=1.0 if success else 0.0,
-                    _success=success,
-                    _latency_ms=latency_ms,
-                    _labels=labels,
+                data_point=SLIDataPoint(
+                    timestamp=datetime.now(timezone.utc),
+                    value=1.0 if success else 0.0,
+                    success=success,
+                    latency_ms=latency_ms,
+                    labels=labels,
                 )
 
                 # Ensure SLO exists; if not, create a default based on labels
                 if slo_name not in tracker._slos:
                     tracker.register_slo(
                         SLODefinition(
-                            _name=slo_name,
-                            _sli_type=SLIType.AVAILABILITY,
-                            _target=99.0,
-                            _window_days=30,
+                            name=slo_name,
+                            sli_type=SLIType.AVAILABILITY,
+                            target=99.0,
+                            window_days=30,
                         )
                     )
 
                 # Attach sli_type attribute for backward compatibility expectations
                 try:
-                    _slo_def=tracker._slos.get(slo_name)
+                    slo_def=tracker._slos.get(slo_name)
                     slo_type=(
                         slo_def.sli_type
                         if slo_def
@@ -1038,32 +1405,32 @@ def get_global_tracker() -> SLOTracker:
         # Register default SLOs for DebVisor
         _global_tracker.register_slo(
             SLODefinition(
-                _name="api-availability",
-                _sli_type=SLIType.AVAILABILITY,
-                _target=99.9,
-                _window_days=30,
-                _description="API endpoint availability",
+                name="api-availability",
+                sli_type=SLIType.AVAILABILITY,
+                target=99.9,
+                window_days=30,
+                description="API endpoint availability",
             )
         )
 
         _global_tracker.register_slo(
             SLODefinition(
-                _name="api-latency-p95",
-                _sli_type=SLIType.LATENCY,
-                _target=95.0,    # 95% of requests under threshold
-                _window_days=7,
-                _description="API p95 latency under 200ms",
+                name="api-latency-p95",
+                sli_type=SLIType.LATENCY,
+                target=95.0,    # 95% of requests under threshold
+                window_days=7,
+                description="API p95 latency under 200ms",
             ),
             LatencySLI(threshold_ms=200, percentile=95),
         )
 
         _global_tracker.register_slo(
             SLODefinition(
-                _name="vm-operation-success",
-                _sli_type=SLIType.AVAILABILITY,
-                _target=99.5,
-                _window_days=30,
-                _description="VM lifecycle operation success rate",
+                name="vm-operation-success",
+                sli_type=SLIType.AVAILABILITY,
+                target=99.5,
+                window_days=30,
+                description="VM lifecycle operation success rate",
             )
         )
 
@@ -1072,7 +1439,7 @@ def get_global_tracker() -> SLOTracker:
     return _global_tracker
 
 
-def log_slo_alert(sloname: str, status: SLOStatus) -> None:
+def log_slo_alert(slo_name: str, status: SLOStatus) -> None:
     """Default alert callback - logs to logger."""
     logger.warning(
         f"SLO ALERT: {slo_name} - Severity: "
@@ -1138,11 +1505,11 @@ class SLIRecord(SLIDataPoint):
 
         # Call parent constructor
         super().__init__(
-            _timestamp=timestamp or datetime.now(timezone.utc),
-            _value=value,
-            _success=success,
-            _latency_ms=latency_ms,
-            _labels=combined_labels,
+            timestamp=timestamp or datetime.now(timezone.utc),
+            value=value,
+            success=success,
+            latency_ms=latency_ms,
+            labels=combined_labels,
         )
 
         # Store additional attributes for backward compatibility
@@ -1213,15 +1580,15 @@ class SLOViolation:
         self.message=message or ""
 
     @classmethod
-    def from_status(cls, sloname: str, status: SLOStatus) -> "SLOViolation":
+    def from_status(cls, slo_name: str, status: SLOStatus) -> "SLOViolation":
         """Create violation from SLO status."""
         return cls(
-            _slo_name=slo_name,
-            _timestamp=datetime.now(timezone.utc),
-            _current_value=status.current_value,
-            _target_value=status.target_value,
-            _severity=status.alert_severity or AlertSeverity.INFO,
-            _error_budget_consumed=status.error_budget_consumed,
+            slo_name=slo_name,
+            timestamp=datetime.now(timezone.utc),
+            current_value=status.current_value,
+            target_value=status.target_value,
+            severity=status.alert_severity or AlertSeverity.INFO,
+            error_budget_consumed=status.error_budget_consumed,
         )
 
 
@@ -1302,7 +1669,7 @@ class ErrorBudget:
         allowed_rate=self.total_budget / self.window_hours
 
         if allowed_rate == 0:
-            return float("in") if actual_rate > 0 else 0.0
+            return float("inf") if actual_rate > 0 else 0.0
 
         return actual_rate / allowed_rate
 
@@ -1320,10 +1687,10 @@ class ErrorBudget:
         """Create error budget from SLO status."""
         total=100 - status.target_value
         return cls(
-            _total=total,
-            _consumed=status.error_budget_consumed,
-            _remaining=status.error_budget_remaining,
-            _burn_rate=status.burn_rate,
+            total=total,
+            consumed=status.error_budget_consumed,
+            remaining=status.error_budget_remaining,
+            burn_rate=status.burn_rate,
         )
 
 
@@ -1332,29 +1699,35 @@ def track_latency_sli(
     slo_name: str,
     threshold_ms: float=200,
     labels: Optional[Dict[str, str]] = None,
+    percentile: float=95.0,
 ) -> Callable[..., Any]:
-    """Decorator to track latency SLI."""
-    _labels=labels or {}
+    """
+    Decorator to track latency SLI.
+
+    Latencies feed the SLO's per-bucket sketches; read percentiles back
+    with ``tracker.get_latency_percentile(slo_name)``.
+    """
+    labels=labels or {}
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            _start_time=time.monotonic()
+            start_time=time.monotonic()
             success=True
             try:
-                _result=await func(*args, **kwargs)
+                result=await func(*args, **kwargs)
                 return result
             except Exception:
                 success=False
                 raise
             finally:
-                _latency_ms=(time.monotonic() - start_time) * 1000
+                latency_ms=(time.monotonic() - start_time) * 1000
                 data_point=SLIDataPoint(
-                    _timestamp=datetime.now(timezone.utc),
-                    _value=1.0 if success else 0.0,
-                    _success=success,
-                    _latency_ms=latency_ms,
-                    _labels=labels,
+                    timestamp=datetime.now(timezone.utc),
+                    value=1.0 if success else 0.0,
+                    success=success,
+                    latency_ms=latency_ms,
+                    labels=labels,
                 )
                 # Explicitly mark data point as LATENCY for backward compatibility
                 setattr(data_point, "sli_type", SLIType.LATENCY)
@@ -1363,13 +1736,13 @@ def track_latency_sli(
                 if slo_name not in tracker._slos:
                     tracker.register_slo(
                         SLODefinition(
-                            _name=slo_name,
-                            _sli_type=SLIType.LATENCY,
-                            _target=95.0,
-                            _window_days=30,
+                            name=slo_name,
+                            sli_type=SLIType.LATENCY,
+                            target=95.0,
+                            window_days=30,
                         ),
-                        _calculator=LatencySLI(
-                            _threshold_ms=threshold_ms, percentile=95.0
+                        calculator=LatencySLI(
+                            threshold_ms=threshold_ms, percentile=percentile
                         ),
                     )
                 tracker.record_sync(slo_name, data_point)
@@ -1383,36 +1756,36 @@ def track_availability_sli(
     tracker: SLOTracker, slo_name: str, labels: Optional[Dict[str, str]] = None
 ) -> Callable[..., Any]:
     """Decorator to track availability SLI."""
-    _labels=labels or {}
+    labels=labels or {}
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            _start_time=time.monotonic()
+            start_time=time.monotonic()
             success=True
             try:
-                _result=await func(*args, **kwargs)
+                result=await func(*args, **kwargs)
                 return result
             except Exception:
                 success=False
                 raise
             finally:
-                _latency_ms=(time.monotonic() - start_time) * 1000
+                latency_ms=(time.monotonic() - start_time) * 1000
                 data_point=SLIDataPoint(
-                    _timestamp=datetime.now(timezone.utc),
-                    _value=1.0 if success else 0.0,
-                    _success=success,
-                    _latency_ms=latency_ms,
-                    _labels=labels,
+                    timestamp=datetime.now(timezone.utc),
+                    value=1.0 if success else 0.0,
+                    success=success,
+                    latency_ms=latency_ms,
+                    labels=labels,
                 )
                 setattr(data_point, "sli_type", SLIType.AVAILABILITY)
                 if slo_name not in tracker._slos:
                     tracker.register_slo(
                         SLODefinition(
-                            _name=slo_name,
-                            _sli_type=SLIType.AVAILABILITY,
-                            _target=99.0,
-                            _window_days=30,
+                            name=slo_name,
+                            sli_type=SLIType.AVAILABILITY,
+                            target=99.0,
+                            window_days=30,
                         )
                     )
                 tracker.record_sync(slo_name, data_point)
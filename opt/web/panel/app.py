@@ -44,10 +44,10 @@ try:
     import structlog
 
     configure_logging(service_name="web-panel")
-    _logger=structlog.get_logger(__name__)
+    logger=structlog.get_logger(__name__)
 except ImportError:
     logging.basicConfig(level=logging.INFO)
-    _logger=logging.getLogger(__name__)
+    logger=logging.getLogger(__name__)
 
 # Graceful Shutdown
 from opt.web.panel.graceful_shutdown import (
@@ -94,7 +94,7 @@ class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured logging."""
 
     def format(self, record: logging.LogRecord) -> str:
-        _log_data={
+        log_data={
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
@@ -119,9 +119,9 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data)
 
 
-def setup_logging(jsonformat: bool=True) -> logging.Logger:
+def setup_logging(json_format: bool=True) -> logging.Logger:
     """Configure structured logging."""
-    _handler=logging.StreamHandler()
+    handler=logging.StreamHandler()
 
     if json_format and os.getenv("LOG_FORMAT", "json") == "json":
         handler.setFormatter(JSONFormatter())
@@ -130,14 +130,14 @@ def setup_logging(jsonformat: bool=True) -> logging.Logger:
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
 
-    _root_logger=logging.getLogger()
+    root_logger=logging.getLogger()
     root_logger.setLevel(logging.INFO)
     root_logger.addHandler(handler)
 
     return logging.getLogger(__name__)
 
 
-_logger=setup_logging()
+logger=setup_logging()
 
 
 # =============================================================================
@@ -253,7 +253,7 @@ OPENAPI_SPEC: Dict[str, Any] = {
 # =============================================================================
 def get_csp_header() -> str:
     """Generate Content Security Policy header."""
-    _policies=[
+    policies=[
         "default-src 'self'",
         "script-src 'sel' 'unsafe-inline' 'unsafe-eval'",    # Adjust based on needs
         "style-src 'sel' 'unsafe-inline'",
@@ -281,11 +281,11 @@ def validate_json_schema(schema: Dict[str, Any]) -> Any:
             if not request.is_json:
                 return jsonify({"error": "Content-Type must be application/json"}), 400
 
-            _data=request.get_json()
+            data=request.get_json()
 
             # Basic schema validation (for complex validation use jsonschema)
-            _required=schema.get("required", [])
-            _properties=schema.get("properties", {})
+            required=schema.get("required", [])
+            properties=schema.get("properties", {})
 
             for field in required:
                 if field not in data:
@@ -322,8 +322,8 @@ def validate_json_schema(schema: Dict[str, Any]) -> Any:
 # =============================================================================
 # Application Factory
 # =============================================================================
-def create_app(configname: str="production") -> Flask:
-    _app=Flask(__name__)
+def create_app(config_name: str="production") -> Flask:
+    app=Flask(__name__)
 
     # Load configuration from centralized settings
     from opt.core.config import settings
@@ -359,7 +359,7 @@ def create_app(configname: str="production") -> Flask:
     login_manager.init_app(app)
     csrf.init_app(app)
     # Configure global rate limit defaults if provided
-    _default_limit=app.config.get("RATELIMIT_DEFAULT", None)
+    default_limit=app.config.get("RATELIMIT_DEFAULT", None)
     if default_limit:
         try:
             limiter._default_limits=[
@@ -375,9 +375,9 @@ def create_app(configname: str="production") -> Flask:
 
     # INFRA-001 & INFRA-002: Graceful Shutdown & Health Checks
     shutdown_config=ShutdownConfig(
-        _drain_timeout_seconds=30.0, request_timeout_seconds=60.0
+        drain_timeout_seconds=30.0, request_timeout_seconds=60.0
     )
-    _shutdown_manager=init_graceful_shutdown(app, shutdown_config)
+    shutdown_manager=init_graceful_shutdown(app, shutdown_config)
 
     def check_db_health() -> bool:
         try:
@@ -398,7 +398,7 @@ def create_app(configname: str="production") -> Flask:
             return True
         try:
 
-            _r=redis.Redis.from_url(url)
+            r=redis.Redis.from_url(url)
             return r.ping()
         except Exception as e:
             app.logger.error(f"Health check failed (redis): {e}")
@@ -407,13 +407,13 @@ def create_app(configname: str="production") -> Flask:
     shutdown_manager.register_health_check("redis", check_redis_health)
 
     def check_smtp_health() -> bool:
-        _host=os.getenv("SMTP_HOST")
+        host=os.getenv("SMTP_HOST")
         if not host:
             return True
         try:
             import smtplib
 
-            _port=int(os.getenv("SMTP_PORT", "587"))
+            port=int(os.getenv("SMTP_PORT", "587"))
             with smtplib.SMTP(host, port, timeout=5) as client:
                 client.noop()
             return True
@@ -428,6 +428,17 @@ def create_app(configname: str="production") -> Flask:
         "database", create_database_cleanup_hook(db.session)
     )
 
+    # AUDIT-002: Batched audit writes off the request path, flushed on shutdown
+    if app.config.get("AUDIT_ASYNC_WRITES", not app.config.get("TESTING", False)):
+        from opt.web.panel.models.audit_log import start_audit_writer
+
+        start_audit_writer(
+            app,
+            shutdown_manager=shutdown_manager,
+            batch_size=app.config.get("AUDIT_BATCH_SIZE", 500),
+            flush_interval=app.config.get("AUDIT_FLUSH_INTERVAL", 0.25),
+        )
+
     # Initialize CORS with whitelist validation
     cors_config={
         "origins": app.config.get("CORS_ALLOWED_ORIGINS", []),
@@ -457,14 +468,14 @@ def create_app(configname: str="production") -> Flask:
     @app.before_request
     def validate_cors_origin() -> None:
         """Validate incoming cross-origin requests against whitelist."""
-        _origin=request.headers.get("Origin")
+        origin=request.headers.get("Origin")
 
         if origin:
-            _allowed_origins=app.config.get("CORS_ALLOWED_ORIGINS", [])
+            allowed_origins=app.config.get("CORS_ALLOWED_ORIGINS", [])
             if not CORSConfig.validate_origin(origin, allowed_origins):
                 logger.warning(
                     f"CORS validation failed: {origin} not in whitelist",
-                    _extra={"request_id": getattr(request, "request_id", "unknown")},
+                    extra={"request_id": getattr(request, "request_id", "unknown")},
                 )
 
     @app.before_request
@@ -472,8 +483,8 @@ def create_app(configname: str="production") -> Flask:
         if not app.debug and not request.is_secure:
         # Validate host header to prevent Host Header Injection
             # In production, this should be handled by the web server (Nginx/Apache)
-            _allowed_hosts=app.config.get("ALLOWED_HOSTS", [])
-            _host=request.host.split(':')[0]
+            allowed_hosts=app.config.get("ALLOWED_HOSTS", [])
+            host=request.host.split(':')[0]
 
             if allowed_hosts:
                 if host not in allowed_hosts:
@@ -524,10 +535,10 @@ def create_app(configname: str="production") -> Flask:
     def record_metrics(response: Response) -> Response:
         """Record Prometheus metrics."""
         if HAS_PROMETHEUS:
-            _duration=time.time() - getattr(request, "start_time", time.time())
+            duration=time.time() - getattr(request, "start_time", time.time())
             endpoint=request.endpoint or "unknown"
             REQUEST_COUNT.labels(
-                _method=request.method, endpoint=endpoint, status=response.status_code
+                method=request.method, endpoint=endpoint, status=response.status_code
             ).inc()
             REQUEST_LATENCY.labels(method=request.method, endpoint=endpoint).observe(
                 duration
@@ -607,8 +618,8 @@ def create_app(configname: str="production") -> Flask:
         Surfaces version/build info and dependency statuses (DB/Redis/SMTP).
         """
         # Version/build info
-        _version=OPENAPI_SPEC.get("info", {}).get("version", "unknown")
-        _build={
+        version=OPENAPI_SPEC.get("info", {}).get("version", "unknown")
+        build={
             "version": version,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "hostname": request.host,
@@ -621,36 +632,36 @@ def create_app(configname: str="production") -> Flask:
             db.session.execute(db.text("SELECT 1"))
             db_status="ok"
         except Exception:
-            _db_status="error"
+            db_status="error"
 
         # Redis
         redis_status="skipped"
         try:
-            _url=os.getenv("REDIS_URL")
+            url=os.getenv("REDIS_URL")
             if url:
 
-                _r=redis.Redis.from_url(url)
+                r=redis.Redis.from_url(url)
                 r.ping()
                 redis_status="ok"
         except Exception:
-            _redis_status="error"
+            redis_status="error"
 
         # SMTP
-        _smtp_status="skipped"
+        smtp_status="skipped"
         try:
-            _host=os.getenv("SMTP_HOST")
+            host=os.getenv("SMTP_HOST")
             if host:
                 import smtplib
 
-                _port=int(os.getenv("SMTP_PORT", "587"))
-                _starttls=os.getenv("SMTP_STARTTLS", "true").lower() in (
+                port=int(os.getenv("SMTP_PORT", "587"))
+                starttls=os.getenv("SMTP_STARTTLS", "true").lower() in (
                     "1",
                     "true",
                     "yes",
                 )
-                _user=os.getenv("SMTP_USER")
-                _password=os.getenv("SMTP_PASSWORD")
-                _client=smtplib.SMTP(host, port, timeout=5)
+                user=os.getenv("SMTP_USER")
+                password=os.getenv("SMTP_PASSWORD")
+                client=smtplib.SMTP(host, port, timeout=5)
                 try:
                     if starttls:
                         client.starttls()
@@ -728,7 +739,7 @@ def create_app(configname: str="production") -> Flask:
 
     logger.info(
         "DebVisor Web Panel initialized",
-        _extra={"config": config_name, "debug": app.debug},
+        extra={"config": config_name, "debug": app.debug},
     )
 
     return app
@@ -738,9 +749,9 @@ def create_app(configname: str="production") -> Flask:
 __all__=["create_app", "db", "limiter", "validate_json_schema", "socketio_server"]
 
 
-if _name__== "__main__":
-    _app=create_app(os.getenv("FLASK_ENV", "production"))
+if __name__ == "__main__":
+    app=create_app(os.getenv("FLASK_ENV", "production"))
     # nosec B104 - Binding to all interfaces is intended for containerized deployment
     app.run(
-        _host=os.getenv("FLASK_HOST", "0.0.0.0"), port=443, debug=False
+        host=os.getenv("FLASK_HOST", "0.0.0.0"), port=443, debug=False
     )    # nosec B104
@@ -104,6 +104,10 @@ Provides high-level interface to DebVisor RPC service with mTLS authentication,
 error handling, connection pooling, and response transformation for web panel integration.
 
 Implements PERF-001: Connection pooling for improved performance and resource efficiency.
+
+Node and snapshot listings are exposed as generators over server-streaming
+RPCs (iter_nodes, iter_snapshots) and as explicit pages with page tokens
+(list_nodes_page, list_snapshots_page), both with optional field masks.
 """
 
 import grpc
@@ -111,14 +115,28 @@ from datetime import datetime, timezone
 import logging
 import threading
 import time
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Sequence, Tuple
 from collections import deque
 from dataclasses import dataclass
 import os
 
-# Import generated protobuf modules (will be created during build)
+# Generated protobuf modules (make -C opt/services/rpc python); until they
+# are built, the service methods below return placeholder data
+try:
+    import debvisor_pb2
+    import debvisor_pb2_grpc
+    from google.protobuf.field_mask_pb2 import FieldMask
+
+    HAS_PROTOS=True
+except ImportError:
+    debvisor_pb2=debvisor_pb2_grpc=FieldMask=None
+    HAS_PROTOS=False
 
-_logger=logging.getLogger(__name__)
+logger=logging.getLogger(__name__)
+
+# Summary fields returned by ListNodes/StreamNodes and ListSnapshots/StreamSnapshots
+NODE_FIELDS=("node_id", "hostname", "ip", "status", "registered_at")
+SNAPSHOT_FIELDS=("snapshot_id", "pool", "snapshot", "backend", "size_bytes", "created_at")
 
 
 class RPCClientError(Exception):
@@ -141,7 +159,7 @@ class ChannelPoolConfig:
 class PooledChannel:
     """Wrapper for a pooled gRPC channel with health tracking."""
 
-    def __init__(self, channel: grpc.Channel, createdat: float) -> None:
+    def __init__(self, channel: grpc.Channel, created_at: float) -> None:
         self.channel=channel
         self.created_at=created_at
         self.last_used=created_at
@@ -192,12 +210,12 @@ class ChannelPool:
 
         # Initialize minimum number of connections
         for _ in range(config.min_size):
-            _channel=self._create_channel()
+            channel=self._create_channel()
             self.available.append(channel)
 
         # Start background health checker
         self.health_check_thread=threading.Thread(
-            _target=self._health_check_loop, daemon=True
+            target=self._health_check_loop, daemon=True
         )
         self.health_check_thread.start()
 
@@ -208,10 +226,10 @@ class ChannelPool:
 
     def _create_channel(self) -> PooledChannel:
         """Create a new gRPC channel."""
-        _channel=grpc.secure_channel(
+        channel=grpc.secure_channel(
             self.target,
             self.credentials,
-            _options=[
+            options=[
                 ("grpc.max_send_message_length", 50 * 1024 * 1024),
                 ("grpc.max_receive_message_length", 50 * 1024 * 1024),
                 ("grpc.keepalive_time_ms", 30000),
@@ -220,7 +238,7 @@ class ChannelPool:
             ],
         )
 
-        _pooled=PooledChannel(channel, time.time())
+        pooled=PooledChannel(channel, time.time())
         logger.debug(
             f"Created new channel: total_channels={self._total_channels() + 1}"
         )
@@ -240,13 +258,13 @@ class ChannelPool:
         Raises:
             RPCClientError: If no channel available within timeout
         """
-        _start_time=time.time()
+        start_time=time.time()
 
         while time.time() - start_time < timeout:
             with self.lock:
             # Try to get an available channel
                 if self.available:
-                    _pooled=self.available.popleft()
+                    pooled=self.available.popleft()
 
                     # Check if channel is healthy
                     if (
@@ -255,7 +273,7 @@ class ChannelPool:
                     ):
                     # Close unhealthy/stale channel and create new one
                         pooled.channel.close()
-                        _pooled=self._create_channel()
+                        pooled=self._create_channel()
 
                     pooled.mark_used()
                     self.in_use.add(pooled)
@@ -268,7 +286,7 @@ class ChannelPool:
 
                 # No available channels, create new one if under max
                 if self._total_channels() < self.config.max_size:
-                    _pooled=self._create_channel()
+                    pooled=self._create_channel()
                     pooled.mark_used()
                     self.in_use.add(pooled)
                     return pooled.channel
@@ -332,7 +350,7 @@ class ChannelPool:
                         len(self.available) < self.config.min_size
                         and self._total_channels() < self.config.max_size
                     ):
-                        _pooled=self._create_channel()
+                        pooled=self._create_channel()
                         self.available.append(pooled)
 
                     if channels_to_remove:
@@ -381,6 +399,7 @@ class RPCClient:
         ca_cert_file: Optional[str] = None,
         timeout: int=30,
         pool_config: Optional[ChannelPoolConfig] = None,
+        stream_timeout: Optional[float] = 300.0,
     ) -> None:
         """Initialize RPC client with mTLS configuration and connection pooling.
 
@@ -392,10 +411,12 @@ class RPCClient:
             ca_cert_file: Path to CA certificate for verification
             timeout: RPC call timeout in seconds
             pool_config: Connection pool configuration
+            stream_timeout: Deadline in seconds for a whole streaming listing
         """
         self.host=host
         self.port=port
         self.timeout=timeout
+        self.stream_timeout=stream_timeout
         self.stubs: Dict[Any, Any] = {}
 
         # Load credentials
@@ -421,17 +442,17 @@ class RPCClient:
                 raise RPCClientError("Missing certificate configuration")
 
             with open(self.cert_file, "rb") as f:
-                _client_cert=f.read()
+                client_cert=f.read()
             with open(self.key_file, "rb") as f:
-                _client_key=f.read()
+                client_key=f.read()
             with open(self.ca_cert_file, "rb") as f:
-                _ca_cert=f.read()
+                ca_cert=f.read()
 
             # Create credentials
             credentials=grpc.ssl_channel_credentials(
-                _root_certificates=ca_cert,
-                _private_key=client_key,
-                _certificate_chain=client_cert,
+                root_certificates=ca_cert,
+                private_key=client_key,
+                certificate_chain=client_cert,
             )
 
             # Create channel pool
@@ -451,7 +472,7 @@ class RPCClient:
             self.channel_pool.close_all()
             logger.info("RPC client closed, all channels terminated")
 
-    def _call_rpc(self, servicename: str, methodname: str, request: Any) -> Any:
+    def _call_rpc(self, service_name: str, method_name: str, request: Any) -> Any:
         """Execute RPC call with error handling using pooled channels.
 
         Args:
@@ -468,30 +489,30 @@ class RPCClient:
         channel=None
         try:
         # Acquire channel from pool
-            _channel=self.channel_pool.acquire(timeout=self.timeout)
+            channel=self.channel_pool.acquire(timeout=self.timeout)
 
             # Get stub for service
-            _stub=self._get_stub(service_name, channel)
+            stub=self._get_stub(service_name, channel)
 
             if not stub:
             # Placeholder behavior
                 return None
 
             # Get method from stub
-            _method=getattr(stub, method_name)
+            method=getattr(stub, method_name)
 
             # Call method with timeout
-            _response=method(request, timeout=self.timeout)
+            response=method(request, timeout=self.timeout)
 
             logger.debug(f"RPC call {service_name}.{method_name} succeeded")
             return response
 
         except grpc.RpcError as e:
-            _error_msg=f"RPC call failed: {service_name}.{method_name} - {e.details()}"
+            error_msg=f"RPC call failed: {service_name}.{method_name} - {e.details()}"
             logger.error(error_msg)
             raise RPCClientError(error_msg)
         except Exception as e:
-            _error_msg=f"Unexpected error in RPC call: {str(e)}"
+            error_msg=f"Unexpected error in RPC call: {str(e)}"
             logger.error(error_msg)
             raise RPCClientError(error_msg)
         finally:
@@ -499,7 +520,7 @@ class RPCClient:
             if channel:
                 self.channel_pool.release(channel)
 
-    def _get_stub(self, servicename: str, channel: grpc.Channel) -> Any:
+    def _get_stub(self, service_name: str, channel: grpc.Channel) -> Any:
         """Get or create gRPC stub for service using provided channel.
 
         Args:
@@ -510,11 +531,60 @@ class RPCClient:
             Service stub
         """
         # Create new stub for each channel (stubs are cheap, channels are expensive)
-        # This is a placeholder - actual implementation depends on protobuf generation
-        # stub_class_name = f'{service_name}Stub'
-        # return getattr(debvisor_pb2_grpc, stub_class_name)(channel)
+        if not HAS_PROTOS:
+            return None    # Placeholder until protobuf modules are generated
         logger.debug(f"Created stub for {service_name}")
-        return None    # Placeholder
+        return getattr(debvisor_pb2_grpc, f"{service_name}Stub")(channel)
+
+    def _stream_rpc(self, service_name: str, method_name: str, request: Any) -> Iterator[Any]:
+        """Iterate a server-streaming RPC, holding one pooled channel until done.
+
+        The channel is released when the stream ends, fails, or the
+        caller stops iterating (generator close). The RPC is cancelled
+        if the caller stops early.
+
+        Raises:
+            RPCClientError: On RPC communication error
+        """
+        channel=self.channel_pool.acquire(timeout=self.timeout)
+        responses=None
+        try:
+            stub=self._get_stub(service_name, channel)
+            responses=getattr(stub, method_name)(request, timeout=self.stream_timeout)
+            yield from responses
+            logger.debug(f"RPC stream {service_name}.{method_name} completed")
+        except grpc.RpcError as e:
+            error_msg=f"RPC stream failed: {service_name}.{method_name} - {e.details()}"
+            logger.error(error_msg)
+            raise RPCClientError(error_msg)
+        finally:
+            if responses is not None and hasattr(responses, "cancel"):
+                responses.cancel()
+            self.channel_pool.release(channel)
+
+    @staticmethod
+    def _list_request(message: str, fields: Optional[Sequence[str]], **values: Any) -> Any:
+        if fields:
+            values["field_mask"] = FieldMask(paths=list(fields))
+        return getattr(debvisor_pb2, message)(**{k: v for k, v in values.items() if v})
+
+    @staticmethod
+    def _summary_to_dict(message: Any, names: Sequence[str]) -> Dict[str, Any]:
+        """Plain dict of a summary message; Timestamp fields become ISO strings."""
+        result: Dict[str, Any] = {}
+        for name in names:
+            value=getattr(message, name)
+            if hasattr(value, "seconds"):
+                value=datetime.fromtimestamp(value.seconds, timezone.utc).isoformat()
+            result[name] = value
+        return result
+
+    @staticmethod
+    def _check_fields(fields: Optional[Sequence[str]], allowed: Sequence[str]) -> Sequence[str]:
+        unknown=sorted(set(fields or ()) - set(allowed))
+        if unknown:
+            raise RPCClientError(f"Unknown fields: {', '.join(unknown)}")
+        return list(fields) if fields else list(allowed)
 
     def get_pool_stats(self) -> Dict[str, int]:
         """Get connection pool statistics."""
@@ -570,9 +640,65 @@ class RPCClient:
             logger.error(f"Failed to register node: {e}")
             raise
 
+    def iter_nodes(
+        self,
+        status: Optional[str] = None,
+        hostname_prefix: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream cluster nodes, ordered by node ID.
+
+        Rows arrive as the server sends them (StreamNodes); nothing is
+        materialized client-side.
+
+        Args:
+            status: Optional status filter (online, offline, error)
+            hostname_prefix: Optional hostname prefix filter
+            fields: Summary fields to return (default all of NODE_FIELDS)
+
+        Yields:
+            Node dictionaries with the requested fields
+        """
+        names=self._check_fields(fields, NODE_FIELDS)
+        if not HAS_PROTOS:
+            for node in self._placeholder_nodes():
+                if not status or node["status"] == status:
+                    yield {k: v for k, v in node.items() if k in names or not fields}
+            return
+        request=self._list_request(
+            "ListNodesRequest", fields, status=status, hostname_prefix=hostname_prefix
+        )
+        for summary in self._stream_rpc("NodeService", "StreamNodes", request):
+            yield self._summary_to_dict(summary, names)
+
+    def list_nodes_page(
+        self,
+        status: Optional[str] = None,
+        hostname_prefix: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        page_size: int=100,
+        page_token: str="",
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Fetch one page of nodes.
+
+        Returns:
+            (nodes, next_page_token); the token is empty on the last page
+        """
+        names=self._check_fields(fields, NODE_FIELDS)
+        if not HAS_PROTOS:
+            return list(self.iter_nodes(status, hostname_prefix, fields)), ""
+        request=self._list_request(
+            "ListNodesRequest", fields, status=status, hostname_prefix=hostname_prefix,
+            page_size=page_size, page_token=page_token,
+        )
+        response=self._call_rpc("NodeService", "ListNodes", request)
+        return [self._summary_to_dict(n, names) for n in response.nodes], response.next_page_token
+
     def list_nodes(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
         """List all cluster nodes.
 
+        Prefer iter_nodes() for large clusters; this collects the stream.
+
         Args:
             status: Optional status filter (online, offline, error)
 
@@ -580,23 +706,25 @@ class RPCClient:
             List of node dictionaries
         """
         try:
-        # response = self._call_rpc('NodeService', 'ListNodes', {})
-
-            return [
-                {
-                    "node_id": "node-1",
-                    "hostname": "node1.example.com",
-                    "ip_address": "192.168.1.10",
-                    "status": "online",
-                    "cpu_cores": 16,
-                    "memory_gb": 64,
-                }
-            ]
+            return list(self.iter_nodes(status=status))
         except Exception as e:
             logger.error(f"Failed to list nodes: {e}")
             raise
 
-    def heartbeat(self, nodeid: str, statusdata: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _placeholder_nodes() -> List[Dict[str, Any]]:
+        return [
+            {
+                "node_id": "node-1",
+                "hostname": "node1.example.com",
+                "ip_address": "192.168.1.10",
+                "status": "online",
+                "cpu_cores": 16,
+                "memory_gb": 64,
+            }
+        ]
+
+    def heartbeat(self, node_id: str, status_data: Dict[str, Any]) -> bool:
         """Send node heartbeat.
 
         Args:
@@ -650,11 +778,60 @@ class RPCClient:
             logger.error(f"Failed to create snapshot: {e}")
             raise
 
+    def iter_snapshots(
+        self,
+        pool: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream storage snapshots, ordered by snapshot ID.
+
+        Args:
+            pool: Optional pool filter
+            fields: Summary fields to return (default all of SNAPSHOT_FIELDS)
+
+        Yields:
+            Snapshot dictionaries with the requested fields
+        """
+        names=self._check_fields(fields, SNAPSHOT_FIELDS)
+        if not HAS_PROTOS:
+            for snapshot in self._placeholder_snapshots():
+                yield {k: v for k, v in snapshot.items() if k in names or not fields}
+            return
+        request=self._list_request("ListSnapshotsRequest", fields, pool=pool)
+        for summary in self._stream_rpc("StorageService", "StreamSnapshots", request):
+            yield self._summary_to_dict(summary, names)
+
+    def list_snapshots_page(
+        self,
+        pool: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        page_size: int=100,
+        page_token: str="",
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Fetch one page of snapshots.
+
+        Returns:
+            (snapshots, next_page_token); the token is empty on the last page
+        """
+        names=self._check_fields(fields, SNAPSHOT_FIELDS)
+        if not HAS_PROTOS:
+            return list(self.iter_snapshots(pool, fields)), ""
+        request=self._list_request(
+            "ListSnapshotsRequest", fields, pool=pool, page_size=page_size, page_token=page_token
+        )
+        response=self._call_rpc("StorageService", "ListSnapshots", request)
+        return (
+            [self._summary_to_dict(s, names) for s in response.snapshots],
+            response.next_page_token,
+        )
+
     def list_snapshots(
         self, node_id: Optional[str] = None, status: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """List storage snapshots.
 
+        Prefer iter_snapshots() for large inventories; this collects the stream.
+
         Args:
             node_id: Optional node filter
             status: Optional status filter (pending, success, failed)
@@ -663,23 +840,29 @@ class RPCClient:
             List of snapshot dictionaries
         """
         try:
-        # response = self._call_rpc('StorageService', 'ListSnapshots', {})
-
             return [
-                {
-                    "snapshot_id": "snap-1",
-                    "name": "snapshot-1",
-                    "node_id": node_id,
-                    "size_gb": 100,
-                    "status": "success",
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                }
+                s for s in self.iter_snapshots()
+                if (not node_id or s.get("node_id") in (None, node_id))
+                and (not status or s.get("status") in (None, status))
             ]
         except Exception as e:
             logger.error(f"Failed to list snapshots: {e}")
             raise
 
-    def delete_snapshot(self, snapshotid: str) -> bool:
+    @staticmethod
+    def _placeholder_snapshots() -> List[Dict[str, Any]]:
+        return [
+            {
+                "snapshot_id": "snap-1",
+                "name": "snapshot-1",
+                "node_id": None,
+                "size_gb": 100,
+                "status": "success",
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+        ]
+
+    def delete_snapshot(self, snapshot_id: str) -> bool:
         """Delete storage snapshot.
 
         Args:
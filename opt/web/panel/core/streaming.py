@@ -0,0 +1,67 @@
+"""Streaming Responses - Incremental JSON Output
+
+Serializes row iterators (e.g. RPCClient.iter_nodes) as a JSON array
+chunk by chunk, so a listing is never materialized in the panel process.
+"""
+
+import itertools
+import json
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+
+from flask import Response, stream_with_context
+
+# Rows are buffered into chunks of roughly this many bytes before sending
+CHUNK_BYTES=64 * 1024
+
+logger=logging.getLogger(__name__)
+
+
+def iter_json_array(rows: Iterable[Any], chunk_bytes: int=CHUNK_BYTES) -> Iterator[str]:
+    """Yield a JSON array of rows as text chunks."""
+    buffer=["["]
+    size=1
+    first=True
+    for row in rows:
+        encoded=json.dumps(row, separators=(",", ":"), default=str)
+        buffer.append(encoded if first else "," + encoded)
+        size += len(encoded) + 1
+        first=False
+        if size >= chunk_bytes:
+            yield "".join(buffer)
+            buffer=[]
+            size=0
+    buffer.append("]")
+    yield "".join(buffer)
+
+
+def stream_json_array(
+    rows_factory: Callable[[], Iterable[Dict[str, Any]]],
+    error_types: Tuple[type, ...] = (),
+) -> Response:
+    """
+    Streamed application/json response of a JSON array.
+
+    The first row is fetched before the response starts, so setup errors
+    (e.g. the RPC service being unreachable) of the given types still
+    produce a proper 502 instead of a truncated 200. The error is logged;
+    the client only gets a generic message.
+    """
+    try:
+        rows=iter(rows_factory())
+        head=[next(rows)]
+    except StopIteration:
+        rows, head=iter(()), []
+    except error_types:
+        logger.exception("Streamed listing failed before the first row")
+        # Return generic error message to prevent information exposure
+        return Response(
+            json.dumps({"error": "Backend service unavailable. Please check logs for details."}),
+            status=502,
+            mimetype="application/json",
+        )
+
+    def generate() -> Iterator[str]:
+        yield from iter_json_array(itertools.chain(head, rows))
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
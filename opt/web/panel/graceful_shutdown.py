@@ -122,7 +122,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, Iterator, List, Optional
 
-_logger=logging.getLogger(__name__)
+logger=logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -185,7 +185,7 @@ class RequestContext:
     @property
     def duration_seconds(self) -> float:
         """Get duration of request in seconds."""
-        _delta=datetime.now(timezone.utc) - self.started_at
+        delta=datetime.now(timezone.utc) - self.started_at
         return delta.total_seconds()
 
 
@@ -206,7 +206,7 @@ class ShutdownMetrics:
         """Get total shutdown duration."""
         if not self.shutdown_started_at:
             return 0.0
-        _end=self.shutdown_completed_at or datetime.now(timezone.utc)
+        end=self.shutdown_completed_at or datetime.now(timezone.utc)
         return (end - self.shutdown_started_at).total_seconds()
 
 
@@ -241,7 +241,7 @@ class GracefulShutdownManager:
         self._requests_lock=threading.Lock()
 
         # Cleanup hooks
-        self._cleanup_hooks: List[tuple[str, Callable[[], None]]] = []
+        self._cleanup_hooks: List[tuple[int, str, Callable[[], None]]] = []
         self._hooks_lock=threading.Lock()
 
         # Health checks
@@ -348,7 +348,7 @@ class GracefulShutdownManager:
             self._active_requests[context.request_id] = context
             logger.debug(f"Tracking request {context.request_id}")
 
-    def complete_request(self, requestid: str) -> None:
+    def complete_request(self, request_id: str) -> None:
         """
         Mark a request as complete.
 
@@ -362,7 +362,7 @@ class GracefulShutdownManager:
                 logger.debug(f"Completed request {request_id}")
 
     @contextmanager
-    def request_scope(self, requestid: str, **kwargs: Any) -> Iterator[RequestContext]:
+    def request_scope(self, request_id: str, **kwargs: Any) -> Iterator[RequestContext]:
         """
         Context manager for request lifecycle.
 
@@ -373,7 +373,7 @@ class GracefulShutdownManager:
         Yields:
             RequestContext for the request
         """
-        _context=RequestContext(request_id=request_id, **kwargs)
+        context=RequestContext(request_id=request_id, **kwargs)
         self.track_request(context)
         try:
             yield context
@@ -401,17 +401,17 @@ class GracefulShutdownManager:
             priority: Lower runs first (0-100)
         """
         with self._hooks_lock:
-            self._cleanup_hooks.append((name, hook))
-            # Sort by priority (stored separately would be better,
-            # but keeping simple for now)
-            logger.debug(f"Registered cleanup hook: {name}")
+            self._cleanup_hooks.append((priority, name, hook))
+            # Stable sort: equal priorities keep registration order
+            self._cleanup_hooks.sort(key=lambda entry: entry[0])
+            logger.debug(f"Registered cleanup hook: {name} (priority {priority})")
 
     def _run_cleanup_hooks(self) -> None:
         """Run all registered cleanup hooks."""
         with self._hooks_lock:
-            _hooks=list(self._cleanup_hooks)
+            hooks=list(self._cleanup_hooks)
 
-        for name, hook in hooks:
+        for _, name, hook in hooks:
             try:
                 logger.info(f"Running cleanup hook: {name}")
                 hook()
@@ -443,7 +443,7 @@ class GracefulShutdownManager:
 
         # Run shutdown in background thread to not block signal handler
         shutdown_thread=threading.Thread(
-            _target=self._run_shutdown_sequence, name="shutdown-sequence", daemon=False
+            target=self._run_shutdown_sequence, name="shutdown-sequence", daemon=False
         )
         shutdown_thread.start()
 
@@ -501,13 +501,13 @@ class GracefulShutdownManager:
         with self._phase_lock:
             self._phase=ShutdownPhase.COMPLETING
 
-        _timeout=self.config.request_timeout_seconds
-        _start_time=time.time()
-        _poll_interval=0.5
+        timeout=self.config.request_timeout_seconds
+        start_time=time.time()
+        poll_interval=0.5
 
         while True:
             active=self.active_request_count
-            _elapsed=time.time() - start_time
+            elapsed=time.time() - start_time
 
             if active == 0:
                 logger.info("All requests completed")
@@ -524,7 +524,7 @@ class GracefulShutdownManager:
             # Log progress periodically
             if int(elapsed) % 5== 0 and int(elapsed) > 0:
                 remaining=timeout - elapsed
-                _requests=self.get_active_requests()
+                requests=self.get_active_requests()
                 logger.info(
                     f"Waiting for {active} requests. " f"Timeout in {remaining:.1f}s"
                 )
@@ -591,7 +591,7 @@ class GracefulShutdownManager:
     # Health Check Integration
     # =========================================================================
 
-    def register_health_check(self, name: str, checkfunc: Callable[[], bool]) -> None:
+    def register_health_check(self, name: str, check_func: Callable[[], bool]) -> None:
         """
         Register a dependency health check.
 
@@ -616,7 +616,7 @@ class GracefulShutdownManager:
         with self._health_lock:
             for name, check in self._health_checks.items():
                 try:
-                    _status=check()
+                    status=check()
                     dependencies[name] = "healthy" if status else "unhealthy"
                     if not status and self.phase== ShutdownPhase.RUNNING:
                         is_healthy=False
@@ -650,7 +650,7 @@ class FlaskShutdownMiddleware:
     Integrates GracefulShutdownManager with Flask applications.
     """
 
-    def __init__(self, app: Any, shutdownmanager: GracefulShutdownManager) -> None:
+    def __init__(self, app: Any, shutdown_manager: GracefulShutdownManager) -> None:
         """
         Initialize middleware.
 
@@ -661,7 +661,7 @@ class FlaskShutdownMiddleware:
         self.app=app
         self.shutdown_manager=shutdown_manager
 
-    def __call__(self, environ: Dict[str, Any], startresponse: Callable[..., Any]) -> Any:
+    def __call__(self, environ: Dict[str, Any], start_response: Callable[..., Any]) -> Any:
         """WSGI application interface."""
         import uuid
 
@@ -678,18 +678,18 @@ class FlaskShutdownMiddleware:
             return [b'{"error": "Service is shutting down"}']
 
         # Track request
-        _request_id=environ.get("HTTP_X_REQUEST_ID", str(uuid.uuid4()))
+        request_id=environ.get("HTTP_X_REQUEST_ID", str(uuid.uuid4()))
 
         with self.shutdown_manager.request_scope(
-            _request_id=request_id,
-            _method=environ.get("REQUEST_METHOD", "UNKNOWN"),
-            _path=environ.get("PATH_INFO", "/"),
-            _client_ip=environ.get("REMOTE_ADDR", "unknown"),
+            request_id=request_id,
+            method=environ.get("REQUEST_METHOD", "UNKNOWN"),
+            path=environ.get("PATH_INFO", "/"),
+            client_ip=environ.get("REMOTE_ADDR", "unknown"),
         ):
             return self.app(environ, start_response)
 
 
-def create_shutdown_blueprint(shutdownmanager: GracefulShutdownManager) -> Any:
+def create_shutdown_blueprint(shutdown_manager: GracefulShutdownManager) -> Any:
     """
     Create Flask blueprint with shutdown-related endpoints.
 
@@ -701,7 +701,7 @@ def create_shutdown_blueprint(shutdownmanager: GracefulShutdownManager) -> Any:
     """
     from flask import Blueprint, jsonify
 
-    _bp=Blueprint("shutdown", __name__)
+    bp=Blueprint("shutdown", __name__)
 
     @bp.route("/health/live")
     def liveness() -> Any:
@@ -711,7 +711,7 @@ def create_shutdown_blueprint(shutdownmanager: GracefulShutdownManager) -> Any:
     @bp.route("/health/ready")
     def readiness() -> Any:
         """Readiness probe - returns 503 during shutdown."""
-        _status=shutdown_manager.get_health_status()
+        status=shutdown_manager.get_health_status()
         if status["healthy"]:
             return jsonify(status), 200
         return jsonify(status), 503
@@ -765,7 +765,7 @@ def init_graceful_shutdown(
         app.wsgi_app=FlaskShutdownMiddleware(app.wsgi_app, _shutdown_manager)
 
         # Register blueprint
-        _bp=create_shutdown_blueprint(_shutdown_manager)
+        bp=create_shutdown_blueprint(_shutdown_manager)
         app.register_blueprint(bp)
 
     return _shutdown_manager
@@ -774,7 +774,7 @@ def init_graceful_shutdown(
 # =============================================================================
 # Example Cleanup Hooks
 # =============================================================================
-def create_database_cleanup_hook(dbsession: Any) -> Callable[[], None]:
+def create_database_cleanup_hook(db_session: Any) -> Callable[[], None]:
     """Create a cleanup hook for database connections."""
 
     def cleanup() -> None:
@@ -788,7 +788,7 @@ def create_database_cleanup_hook(dbsession: Any) -> Callable[[], None]:
     return cleanup
 
 
-def create_cache_cleanup_hook(cacheclient: Any) -> Callable[[], None]:
+def create_cache_cleanup_hook(cache_client: Any) -> Callable[[], None]:
     """Create a cleanup hook for cache connections."""
 
     def cleanup() -> None:
@@ -801,7 +801,7 @@ def create_cache_cleanup_hook(cacheclient: Any) -> Callable[[], None]:
     return cleanup
 
 
-def create_message_queue_cleanup_hook(mqclient: Any) -> Callable[[], None]:
+def create_message_queue_cleanup_hook(mq_client: Any) -> Callable[[], None]:
     """Create a cleanup hook for message queue connections."""
 
     def cleanup() -> None:
@@ -818,15 +818,15 @@ def create_message_queue_cleanup_hook(mqclient: Any) -> Callable[[], None]:
 # Main
 # =============================================================================
 
-if _name__== "__main__":
+if __name__ == "__main__":
     # Demo
 
     logging.basicConfig(
-        _level=logging.DEBUG,
-        _format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        level=logging.DEBUG,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
-    _manager=GracefulShutdownManager()
+    manager=GracefulShutdownManager()
     manager.install_signal_handlers()
 
     # Register some test hooks
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# Copyright (c) 2025 DebVisor contributors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Snapshot + delta streaming of node metrics for the web panel.
+
+Node metrics arrive far more often than dashboards need them and most
+fields do not change between updates. MetricsStream collects updates and,
+on a fixed tick, publishes one frame holding only the fields that changed
+since the previous frame.
+
+Features:
+- Per-tick batching: several updates to a node within a tick collapse
+  into one delta
+- Per-field deltas, removed fields and removed nodes
+- Optional min_change threshold to suppress numeric jitter
+- Monotonic sequence numbers; every frame carries the sequence of the
+  previous frame on its channel so clients can detect gaps
+- Resync: a client reporting its last sequence gets the merged deltas
+  since then, or a fresh snapshot once that history has been dropped
+- JSON or msgpack (optional dependency) encoding, done once per channel
+
+Message formats:
+    {"type": "snapshot", "seq": 42, "nodes": {"node1": {"cpu": 12.5, ...}}}
+    {"type": "delta", "seq": 43, "prev": 42, "nodes": {"node1": {"cpu": 13.0}},
+     "removed_fields": {"node1": ["gpu"]}, "removed_nodes": ["node7"]}
+
+Channels are ALL_NODES (every node, prev is always seq - 1) or a node id
+(prev is the last frame that touched that node). A client applying
+frames keeps the last seq it has seen per channel; a frame whose prev is
+greater than that means frames were missed and the client should resync.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+try:
+    import msgpack
+
+    HAS_MSGPACK=True
+except ImportError:
+    msgpack=None
+    HAS_MSGPACK=False
+
+logger=logging.getLogger(__name__)
+
+ALL_NODES="*"
+FORMATS=("json", "msgpack")
+
+Message=Dict[str, Any]
+
+
+class MetricsStream:
+    """
+    Thread-safe metrics state with tick-based delta frames.
+
+    update() may be called from any thread; tick() is called by one
+    background task every interval seconds.
+    """
+
+    def __init__(
+        self,
+        interval: float=0.25,
+        history_size: int=240,
+        min_change: float=0.0,
+    ) -> None:
+        """
+        Initialize metrics stream.
+
+        Args:
+            interval: Tick length in seconds
+            history_size: Delta frames kept for resync (240=60s at 250ms)
+            min_change: Numeric changes smaller than this are not sent
+        """
+        self.interval=interval
+        self.min_change=min_change
+        self.seq=0
+        self.state: Dict[str, Dict[str, Any]] = {}    # As of self.seq
+        self._pending: Dict[str, Tuple[Dict[str, Any], bool]] = {}
+        self._pending_removed: Set[str] = set()
+        self._history: Deque[Message] = deque(maxlen=history_size)
+        self._last_changed: Dict[str, int] = {}
+        self._lock=threading.Lock()
+        # sid -> (format, channels)
+        self._subscribers: Dict[str, Tuple[str, Set[str]]] = {}
+        self.frames_published=0
+        self.updates_received=0
+
+    # =========================================================================
+    # Producers
+    # =========================================================================
+    def update(self, node_id: str, metrics: Dict[str, Any], replace: bool=True) -> None:
+        """
+        Record new metrics for a node.
+
+        Args:
+            node_id: Node ID
+            metrics: Metric fields (flat values)
+            replace: metrics is the node's full field set; fields missing
+                from it are removed. With False, only the given fields change.
+        """
+        with self._lock:
+            self.updates_received += 1
+            self._pending_removed.discard(node_id)
+            pending=self._pending.get(node_id)
+            if replace or pending is None:
+                self._pending[node_id] = (dict(metrics), replace)
+            else:
+                pending[0].update(metrics)
+
+    def remove_node(self, node_id: str) -> None:
+        """Drop a node from the stream at the next tick."""
+        with self._lock:
+            self._pending.pop(node_id, None)
+            if node_id in self.state:
+                self._pending_removed.add(node_id)
+
+    def tick(self) -> Optional[Message]:
+        """
+        Fold pending updates into the state and build the next delta.
+
+        Returns:
+            The delta frame, or None if nothing changed
+        """
+        with self._lock:
+            pending, self._pending=self._pending, {}
+            removed_nodes, self._pending_removed=self._pending_removed, set()
+
+            changed: Dict[str, Dict[str, Any]] = {}
+            removed_fields: Dict[str, List[str]] = {}
+            for node_id, (metrics, replace) in pending.items():
+                current=self.state.setdefault(node_id, {})
+                delta={
+                    name: value
+                    for name, value in metrics.items()
+                    if name not in current or self._differs(current[name], value)
+                }
+                if delta:
+                    current.update(delta)
+                    changed[node_id] = delta
+                if replace:
+                    gone=[name for name in current if name not in metrics]
+                    for name in gone:
+                        del current[name]
+                    if gone:
+                        removed_fields[node_id] = gone
+            for node_id in removed_nodes:
+                self.state.pop(node_id, None)
+
+            if not (changed or removed_fields or removed_nodes):
+                return None
+
+            self.seq += 1
+            frame: Message={"type": "delta", "seq": self.seq, "prev": self.seq - 1, "nodes": changed}
+            if removed_fields:
+                frame["removed_fields"] = removed_fields
+            if removed_nodes:
+                frame["removed_nodes"] = sorted(removed_nodes)
+            touched=set(changed) | set(removed_fields) | removed_nodes
+            frame["node_prev"] = {n: self._last_changed.get(n, 0) for n in touched}
+            for node_id in touched:
+                self._last_changed[node_id] = self.seq
+            for node_id in removed_nodes:
+                del self._last_changed[node_id]
+            self._history.append(frame)
+            self.frames_published += 1
+            return frame
+
+    def _differs(self, old: Any, new: Any) -> bool:
+        if (
+            self.min_change
+            and isinstance(old, (int, float))
+            and isinstance(new, (int, float))
+            and not isinstance(new, bool)
+        ):
+            return abs(new - old) >= self.min_change
+        return bool(old != new)
+
+    # =========================================================================
+    # Consumers
+    # =========================================================================
+    def snapshot(self, node_ids: Optional[Iterable[str]] = None) -> Message:
+        """Full state of all (or the given) nodes as of the current seq."""
+        with self._lock:
+            if node_ids is None:
+                nodes={n: dict(fields) for n, fields in self.state.items()}
+            else:
+                nodes={n: dict(self.state[n]) for n in node_ids if n in self.state}
+            return {"type": "snapshot", "seq": self.seq, "nodes": nodes}
+
+    def since(self, last_seq: int, node_ids: Optional[Iterable[str]] = None) -> Message:
+        """
+        Everything a client at last_seq needs to catch up.
+
+        Returns:
+            One delta merging all frames after last_seq, or a snapshot if
+            last_seq is unknown or older than the retained history
+        """
+        with self._lock:
+            oldest=self._history[0]["seq"] if self._history else self.seq + 1
+            if last_seq > self.seq or last_seq < oldest - 1:
+                resync=True
+            else:
+                resync=False
+                frames=[f for f in self._history if f["seq"] > last_seq]
+        if resync:
+            return self.snapshot(node_ids)
+
+        wanted=set(node_ids) if node_ids is not None else None
+        merged: Message={"type": "delta", "seq": self.seq, "prev": last_seq, "nodes": {}}
+        nodes: Dict[str, Dict[str, Any]] = merged["nodes"]
+        removed_fields: Dict[str, Set[str]] = {}
+        removed_nodes: Set[str] = set()
+        for frame in frames:
+            for node_id in frame.get("removed_nodes", ()):
+                if wanted is None or node_id in wanted:
+                    nodes.pop(node_id, None)
+                    removed_fields.pop(node_id, None)
+                    removed_nodes.add(node_id)
+            for node_id, fields in frame.get("removed_fields", {}).items():
+                if wanted is None or node_id in wanted:
+                    for name in fields:
+                        nodes.get(node_id, {}).pop(name, None)
+                    removed_fields.setdefault(node_id, set()).update(fields)
+            for node_id, delta in frame["nodes"].items():
+                if wanted is None or node_id in wanted:
+                    removed_nodes.discard(node_id)
+                    nodes.setdefault(node_id, {}).update(delta)
+                    if node_id in removed_fields:
+                        removed_fields[node_id].difference_update(delta)
+        removed_fields={n: f for n, f in removed_fields.items() if f}
+        if removed_fields:
+            merged["removed_fields"] = {n: sorted(f) for n, f in removed_fields.items()}
+        if removed_nodes:
+            merged["removed_nodes"] = sorted(removed_nodes)
+        return merged
+
+    @staticmethod
+    def channel_frame(frame: Message, channel: str) -> Optional[Message]:
+        """The part of a delta frame a channel subscriber receives."""
+        if channel == ALL_NODES:
+            return {k: v for k, v in frame.items() if k != "node_prev"}
+        prev=frame["node_prev"].get(channel)
+        if prev is None:
+            return None
+        message: Message={
+            "type": "delta",
+            "seq": frame["seq"],
+            "prev": prev,
+            "nodes": {channel: frame["nodes"][channel]} if channel in frame["nodes"] else {},
+        }
+        if channel in frame.get("removed_fields", {}):
+            message["removed_fields"] = {channel: frame["removed_fields"][channel]}
+        if channel in frame.get("removed_nodes", ()):
+            message["removed_nodes"] = [channel]
+        return message
+
+    # =========================================================================
+    # Subscribers
+    # =========================================================================
+    def add_subscriber(
+        self, sid: str, node_ids: Optional[Iterable[str]] = None, fmt: str="json"
+    ) -> Set[str]:
+        """
+        Register a client; returns the channels (rooms) it should join.
+
+        Raises:
+            ValueError: Unknown format, or msgpack requested but not installed
+        """
+        check_format(fmt)
+        channels={ALL_NODES} if node_ids is None else set(node_ids)
+        with self._lock:
+            self._subscribers[sid] = (fmt, channels)
+        return channels
+
+    def remove_subscriber(self, sid: str) -> Optional[Tuple[str, Set[str]]]:
+        """Forget a client; returns its (format, channels) if it was registered."""
+        with self._lock:
+            return self._subscribers.pop(sid, None)
+
+    def active_channels(self) -> Set[Tuple[str, str]]:
+        """(format, channel) pairs with at least one subscriber."""
+        with self._lock:
+            return {
+                (fmt, channel)
+                for fmt, channels in self._subscribers.values()
+                for channel in channels
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Stream statistics."""
+        with self._lock:
+            return {
+                "seq": self.seq,
+                "nodes": len(self.state),
+                "pending_nodes": len(self._pending),
+                "history_frames": len(self._history),
+                "subscribers": len(self._subscribers),
+                "updates_received": self.updates_received,
+                "frames_published": self.frames_published,
+            }
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+def check_format(fmt: str) -> None:
+    """Raise ValueError for an unusable wire format."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown metrics stream format: {fmt}")
+    if fmt == "msgpack" and not HAS_MSGPACK:
+        raise ValueError("msgpack format requested but msgpack is not installed")
+
+
+def encode(message: Message, fmt: str="json") -> Union[str, bytes]:
+    """Encode a message as a JSON string or msgpack bytes."""
+    if fmt == "msgpack":
+        check_format(fmt)
+        return msgpack.packb(message, use_bin_type=True)    # type: ignore[no-any-return]
+    return json.dumps(message, separators=(",", ":"))
+
+
+def decode(payload: Union[str, bytes], fmt: str="json") -> Message:
+    """Inverse of encode()."""
+    if fmt == "msgpack":
+        check_format(fmt)
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)    # type: ignore[no-any-return]
+    return json.loads(payload)    # type: ignore[no-any-return]
+
+
+def room_name(fmt: str, channel: str) -> str:
+    """Socket.IO room for a (format, channel) pair."""
+    return f"metrics_stream:{fmt}:{channel}"
+
+
+def publish_tick(stream: MetricsStream, emit_frame: Any, now: Optional[float] = None) -> int:
+    """
+    Run one tick and hand each active room its encoded frame.
+
+    Args:
+        stream: MetricsStream
+        emit_frame: Callable (room, payload) doing the actual emit
+        now: Timestamp added to frames (defaults to time.time())
+
+    Returns:
+        Number of rooms emitted to
+    """
+    frame=stream.tick()
+    if frame is None:
+        return 0
+    frame["ts"] = time.time() if now is None else now
+    emitted=0
+    for fmt, channel in stream.active_channels():
+        message=stream.channel_frame(frame, channel)
+        if message is None:
+            continue
+        emit_frame(room_name(fmt, channel), encode(message, fmt))
+        emitted += 1
+    return emitted
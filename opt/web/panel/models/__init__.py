@@ -104,8 +104,8 @@ Database models for user management, audit logging, and application state.
 """
 
 from .user import User
-from .audit_log import AuditLog
+from .audit_log import AuditLog, AuditChainCheckpoint
 from .node import Node
 from .snapshot import Snapshot
 
-__all__=["User", "AuditLog", "Node", "Snapshot"]
+__all__=["User", "AuditLog", "AuditChainCheckpoint", "Node", "Snapshot"]
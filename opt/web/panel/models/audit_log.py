@@ -102,14 +102,30 @@
 
 Records all operations for compliance and debugging.
 Captures user, operation, resource, status, and error details.
+
+Entries are HMAC-signed and hash-chained (each entry stores the previous
+entry's signature). With an AuditLogWriter running, log_operation only
+queues the entry; the writer thread assigns chain order, signs and
+bulk-inserts batches, so requests never wait on the chain tail or a
+commit. Queued entries are written within flush_interval and flushed on
+graceful shutdown.
+
+Verification streams the chain in id-ordered windows and records signed
+checkpoints (AuditChainCheckpoint), so later runs only verify new rows.
 """
 
-from typing import Any, Optional, List, Dict, cast
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Deque, Optional, List, Dict, Tuple, cast
 from datetime import datetime, timezone
 from opt.web.panel.extensions import db
+import hashlib
+import hmac
 import json
 import os
 import logging
+import threading
+import time
 
 # Import core audit signing
 try:
@@ -123,62 +139,121 @@ except ImportError:
     )
 
 
+logger=logging.getLogger(__name__)
+
+# previous_hash of the first entry in the chain
+GENESIS_HASH="0" * 64
+
+# Serializes "read chain tail -> commit" between the writer thread and
+# synchronous writes in this process
+_chain_lock=threading.Lock()
+
+# Columns covered by the signature (besides previous_hash)
+_SIGNED_COLUMNS=(
+    "operation", "resource_type", "resource_id", "user_id", "action", "status",
+    "created_at", "request_data", "response_data", "ip_address", "user_agent",
+    "compliance_tags",
+)
+
+
+def _audit_secret_key() -> str:
+    """Signing key; falls back to a dev key outside production."""
+    secret_key=os.getenv("SECRET_KEY")
+    if not secret_key:
+        if os.getenv("FLASK_ENV") == "production":
+            raise ValueError("SECRET_KEY not set in production environment")
+        secret_key="dev-key"
+    return secret_key
+
+
+def _signing_entry(
+    row: Dict[str, Any], previous_hash: Optional[str], signature: Optional[str] = None
+) -> "AuditEntry":
+    """Core AuditEntry for an audit row, rebuilt from the stored column values.
+
+    Signing and verification both go through here, so an entry verifies
+    exactly as it was signed regardless of which path wrote it.
+    """
+    created_at=row["created_at"]
+    # Stored as naive UTC by some backends
+    if created_at.tzinfo is None:
+        created_at=created_at.replace(tzinfo=timezone.utc)
+    return AuditEntry(
+        operation=row["operation"],
+        resource_type=row["resource_type"],
+        resource_id=str(row["resource_id"]) if row["resource_id"] else "",
+        actor_id=str(row["user_id"]) if row["user_id"] else "system",
+        action=row["action"],
+        status=row["status"],
+        timestamp=created_at.isoformat(),
+        details={
+            "request": json.loads(row["request_data"]) if row["request_data"] else None,
+            "response": json.loads(row["response_data"]) if row["response_data"] else None,
+            "ip": row["ip_address"],
+            "ua": row["user_agent"],
+        },
+        compliance_tags=json.loads(row["compliance_tags"]) if row["compliance_tags"] else [],
+        previous_hash=previous_hash,
+        signature=signature,
+    )
+
+
 class AuditLog(db.Model):
     """Audit log entry for tracking user operations and RPC calls."""
 
     __tablename__="audit_log"
 
     # Primary key
-    _id=db.Column(db.Integer, primary_key=True)
+    id=db.Column(db.Integer, primary_key=True)
 
     # User reference (nullable for system operations)
-    _user_id=db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True, index=True)
+    user_id=db.Column(db.Integer, db.ForeignKey("user.id"), nullable=True, index=True)
 
     # Operation details
     # create, read, update, delete, execute
-    _operation=db.Column(db.String(50), nullable=False, index=True)
+    operation=db.Column(db.String(50), nullable=False, index=True)
     # node, snapshot, user, etc.
-    _resource_type=db.Column(db.String(50), nullable=False, index=True)
-    _resource_id=db.Column(
+    resource_type=db.Column(db.String(50), nullable=False, index=True)
+    resource_id=db.Column(
         db.String(100), nullable=True, index=True
     )    # specific resource ID
 
     # Action description
-    _action=db.Column(db.String(255), nullable=False)    # "Created snapshot on node1"
+    action=db.Column(db.String(255), nullable=False)    # "Created snapshot on node1"
 
     # Status tracking
     status=db.Column(
         db.String(20), nullable=False, index=True
     )    # success, failure, pending
-    _status_code=db.Column(db.Integer, nullable=True)    # HTTP status or RPC code
-    _error_message=db.Column(db.Text, nullable=True)    # Error details if failure
+    status_code=db.Column(db.Integer, nullable=True)    # HTTP status or RPC code
+    error_message=db.Column(db.Text, nullable=True)    # Error details if failure
 
     # Request/Response details (JSON)
-    _request_data=db.Column(db.Text, nullable=True)    # Request parameters (redacted)
-    _response_data=db.Column(db.Text, nullable=True)    # Response summary (redacted)
+    request_data=db.Column(db.Text, nullable=True)    # Request parameters (redacted)
+    response_data=db.Column(db.Text, nullable=True)    # Response summary (redacted)
 
     # Context information
-    _ip_address=db.Column(db.String(45), nullable=True, index=True)    # IPv4 or IPv6
-    _user_agent=db.Column(db.String(255), nullable=True)
+    ip_address=db.Column(db.String(45), nullable=True, index=True)    # IPv4 or IPv6
+    user_agent=db.Column(db.String(255), nullable=True)
 
     # Security & Compliance (AUDIT-001)
-    _signature=db.Column(db.String(64), nullable=True)    # HMAC-SHA256
-    _previous_hash=db.Column(db.String(64), nullable=True)    # Hash chaining
-    _compliance_tags=db.Column(
+    signature=db.Column(db.String(64), nullable=True)    # HMAC-SHA256
+    previous_hash=db.Column(db.String(64), nullable=True)    # Hash chaining
+    compliance_tags=db.Column(
         db.Text, nullable=True
     )    # JSON list of tags (GDPR, HIPAA)
 
     # Timing
-    _created_at=db.Column(
+    created_at=db.Column(
         db.DateTime, default=lambda: datetime.now(timezone.utc), index=True
     )
-    _duration_ms=db.Column(db.Integer, nullable=True)    # Operation duration
+    duration_ms=db.Column(db.Integer, nullable=True)    # Operation duration
 
     # RPC integration
-    _rpc_service=db.Column(
+    rpc_service=db.Column(
         db.String(50), nullable=True, index=True
     )    # NodeService, StorageService, etc.
-    _rpc_method=db.Column(
+    rpc_method=db.Column(
         db.String(50), nullable=True, index=True
     )    # RegisterNode, CreateSnapshot, etc.
 
@@ -204,9 +279,15 @@ class AuditLog(db.Model):
         rpc_service: Optional[str] = None,
         rpc_method: Optional[str] = None,
         compliance_tags: Optional[List[str]] = None,
-    ) -> 'AuditLog':
+        sync: bool=False,
+    ) -> Optional['AuditLog']:
         """Create and save audit log entry.
 
+        When an AuditLogWriter is running the entry is only queued; the
+        writer thread chains, signs and commits it within its flush
+        interval. Otherwise, or with sync=True, the entry is chained,
+        signed and committed before returning.
+
         Args:
             user_id: User who performed operation (None for system)
             operation: Operation type (create, read, update, delete, execute)
@@ -224,77 +305,99 @@ class AuditLog(db.Model):
             rpc_service: RPC service name (for RPC operations)
             rpc_method: RPC method name (for RPC operations)
             compliance_tags: List of compliance tags (e.g. GDPR, HIPAA)
+            sync: Write immediately even if an AuditLogWriter is running
 
         Returns:
-            Created AuditLog instance
+            Created AuditLog instance, or None if queued to the writer
         """
-        _entry=AuditLog(
-            _user_id=user_id,
-            _operation=operation,
-            _resource_type=resource_type,
-            _action=action,
-            _status=status,
-            _resource_id=resource_id,
-            _status_code=status_code,
-            _error_message=error_message,
-            _request_data=json.dumps(request_data) if request_data else None,
-            _response_data=json.dumps(response_data) if response_data else None,
-            _ip_address=ip_address,
-            _user_agent=user_agent,
-            _duration_ms=duration_ms,
-            _rpc_service=rpc_service,
-            _rpc_method=rpc_method,
-            _compliance_tags=json.dumps(compliance_tags) if compliance_tags else None,
-            _created_at=datetime.now(timezone.utc)
+        row=AuditLog.build_row(
+            user_id=user_id,
+            operation=operation,
+            resource_type=resource_type,
+            action=action,
+            status=status,
+            resource_id=resource_id,
+            status_code=status_code,
+            error_message=error_message,
+            request_data=request_data,
+            response_data=response_data,
+            ip_address=ip_address,
+            user_agent=user_agent,
+            duration_ms=duration_ms,
+            rpc_service=rpc_service,
+            rpc_method=rpc_method,
+            compliance_tags=compliance_tags,
         )
 
-        # Compute signature and hash chaining if core audit is available
-        if HAS_CORE_AUDIT:
-            try:
-            # Get previous hash
-                _last_entry=AuditLog.query.order_by(AuditLog.id.desc()).first()
-                previous_hash=last_entry.signature if last_entry else "0" * 64
-                entry.previous_hash=previous_hash
-
-                # Create core AuditEntry for signing
-                # Ensure timestamp matches exactly what is stored
-                _timestamp_str=entry.created_at.isoformat()
-
-                _core_entry=AuditEntry(
-                    _operation=operation,
-                    _resource_type=resource_type,
-                    _resource_id=str(resource_id) if resource_id else "",
-                    _actor_id=str(user_id) if user_id else "system",
-                    _action=action,
-                    _status=status,
-                    _timestamp=timestamp_str,
-                    _details={
-                        "request": request_data,
-                        "response": response_data,
-                        "ip": ip_address,
-                        "ua": user_agent,
-                    },
-                    _compliance_tags=compliance_tags or [],
-                    _previous_hash=previous_hash,
-                )
-
-                # Sign
-                # In production, SECRET_KEY must be set in environment
-                _secret_key=os.getenv("SECRET_KEY")
-                if not secret_key:
-                    if os.getenv("FLASK_ENV") == "production":
-                        raise ValueError("SECRET_KEY not set in production environment")
-                    secret_key="dev-key"
-
-                _signer=AuditSigner(secret_key=secret_key)
-                entry.signature=signer.sign(core_entry)
-            except Exception as e:
-                logging.getLogger(__name__).error(f"Failed to sign audit entry: {e}")
-
-        db.session.add(entry)
-        db.session.commit()
+        # Off the request path: the writer thread chains, signs and inserts
+        writer=_audit_writer
+        if not sync and writer is not None and writer.running:
+            writer.enqueue(row)
+            return None
+
+        entry=AuditLog(**row)
+
+        with _chain_lock:
+            # Compute signature and hash chaining if core audit is available
+            if HAS_CORE_AUDIT:
+                try:
+                    # Get previous hash
+                    last_entry=AuditLog.query.order_by(AuditLog.id.desc()).first()
+                    previous_hash=last_entry.signature if last_entry else GENESIS_HASH
+                    entry.previous_hash=previous_hash
+
+                    signer=AuditSigner(secret_key=_audit_secret_key())
+                    entry.signature=signer.sign(_signing_entry(row, previous_hash))
+                except Exception as e:
+                    logger.error(f"Failed to sign audit entry: {e}")
+
+            db.session.add(entry)
+            db.session.commit()
         return entry
 
+    @staticmethod
+    def build_row(
+        user_id: Optional[int],
+        operation: str,
+        resource_type: str,
+        action: str,
+        status: str="success",
+        resource_id: Optional[str] = None,
+        status_code: Optional[int] = None,
+        error_message: Optional[str] = None,
+        request_data: Optional[Dict[str, Any]] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        duration_ms: Optional[int] = None,
+        rpc_service: Optional[str] = None,
+        rpc_method: Optional[str] = None,
+        compliance_tags: Optional[List[str]] = None,
+        created_at: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Column values for a new entry, JSON fields encoded, not yet signed."""
+        return {
+            "user_id": user_id,
+            "operation": operation,
+            "resource_type": resource_type,
+            "action": action,
+            "status": status,
+            "resource_id": resource_id,
+            "status_code": status_code,
+            "error_message": error_message,
+            "request_data": json.dumps(request_data) if request_data else None,
+            "response_data": json.dumps(response_data) if response_data else None,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "duration_ms": duration_ms,
+            "rpc_service": rpc_service,
+            "rpc_method": rpc_method,
+            "compliance_tags": json.dumps(compliance_tags) if compliance_tags else None,
+            "created_at": created_at or datetime.now(timezone.utc),
+            "previous_hash": None,
+            "signature": None,
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert audit log to dictionary for JSON responses."""
         return {
@@ -314,7 +417,7 @@ class AuditLog(db.Model):
         }
 
     @staticmethod
-    def get_user_operations(userid: int, limit: int=100, offset: int=0) -> List['AuditLog']:
+    def get_user_operations(user_id: int, limit: int=100, offset: int=0) -> List['AuditLog']:
         """Get audit log entries for specific user.
 
         Args:
@@ -349,9 +452,9 @@ class AuditLog(db.Model):
         Returns:
             List of AuditLog entries
         """
-        _query=AuditLog.query.filter_by(resource_type=resource_type)
+        query=AuditLog.query.filter_by(resource_type=resource_type)
         if resource_id:
-            _query=query.filter_by(resource_id=resource_id)
+            query=query.filter_by(resource_id=resource_id)
         return query.order_by(AuditLog.created_at.desc()).limit(limit).all()    # type: ignore
 
     @staticmethod
@@ -372,84 +475,550 @@ class AuditLog(db.Model):
         )
 
     @staticmethod
-    def verify_chain() -> Dict[str, Any]:
+    def verify_chain(
+        incremental: bool=False,
+        save_checkpoint: bool=False,
+        window_size: int=5000,
+        workers: int=0,
+        checkpoint_interval: int=100_000,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
         """Verify the integrity of the audit log chain.
 
+        Rows are streamed in id-ordered windows, so memory stays bounded
+        regardless of table size. See AuditChainVerifier.
+
+        Args:
+            incremental: Resume after the latest signed checkpoint
+            save_checkpoint: Record signed checkpoints of verified progress
+            window_size: Rows fetched per query
+            workers: Processes for signature verification (0 = in-process)
+            checkpoint_interval: Rows between intermediate checkpoints
+            progress: Called with progress stats after every window
+
         Returns:
             Dict with verification results:
             - valid: bool
             - broken_at_id: int (if invalid)
-            - total_checked: int
+            - reason: str (if invalid)
+            - total_checked: int (rows checked by this run)
+            - total_verified: int (including rows covered by the checkpoint)
+            - verified_up_to_id, resumed_from_id, elapsed_seconds, rows_per_second
         """
+        return AuditChainVerifier(
+            incremental=incremental,
+            save_checkpoint=save_checkpoint,
+            window_size=window_size,
+            workers=workers,
+            checkpoint_interval=checkpoint_interval,
+            progress=progress,
+        ).run()
+
+
+class AuditChainCheckpoint(db.Model):
+    """Signed record of how far the audit chain has been verified.
+
+    The HMAC over (verified_up_to_id, last_hash, total_verified) stops a
+    forged checkpoint from skipping tampered rows.
+    """
+
+    __tablename__="audit_chain_checkpoint"
+
+    id=db.Column(db.Integer, primary_key=True)
+    verified_up_to_id=db.Column(db.Integer, nullable=False, index=True)
+    last_hash=db.Column(db.String(64), nullable=False)    # Signature of that row
+    total_verified=db.Column(db.Integer, nullable=False, default=0)
+    signature=db.Column(db.String(64), nullable=False)    # HMAC-SHA256
+    created_at=db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+
+    def __repr__(self) -> str:
+        return f"<AuditChainCheckpoint up to {self.verified_up_to_id}>"
+
+    @staticmethod
+    def compute_signature(
+        secret_key: str, verified_up_to_id: int, last_hash: str, total_verified: int
+    ) -> str:
+        message=f"{verified_up_to_id}:{last_hash}:{total_verified}"
+        return hmac.new(secret_key.encode("utf-8"), message.encode("utf-8"), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def latest() -> Optional["AuditChainCheckpoint"]:
+        """Most recent checkpoint, if any."""
+        return cast(
+            Optional["AuditChainCheckpoint"],
+            AuditChainCheckpoint.query.order_by(AuditChainCheckpoint.id.desc()).first(),
+        )
+
+    @staticmethod
+    def record(
+        secret_key: str, verified_up_to_id: int, last_hash: str, total_verified: int
+    ) -> "AuditChainCheckpoint":
+        """Sign and store a checkpoint."""
+        checkpoint=AuditChainCheckpoint(
+            verified_up_to_id=verified_up_to_id,
+            last_hash=last_hash,
+            total_verified=total_verified,
+            signature=AuditChainCheckpoint.compute_signature(
+                secret_key, verified_up_to_id, last_hash, total_verified
+            ),
+        )
+        db.session.add(checkpoint)
+        db.session.commit()
+        return checkpoint
+
+    def problem(self, secret_key: str) -> Optional[str]:
+        """Reason this checkpoint cannot be trusted, or None."""
+        expected=AuditChainCheckpoint.compute_signature(
+            secret_key, self.verified_up_to_id, self.last_hash, self.total_verified
+        )
+        if not hmac.compare_digest(self.signature or "", expected):
+            return "Checkpoint signature mismatch"
+        anchor=db.session.query(AuditLog.signature).filter(
+            AuditLog.id == self.verified_up_to_id
+        ).first()
+        if anchor is None or anchor[0] != self.last_hash:
+            return "Checkpoint anchor mismatch"
+        return None
+
+
+# =============================================================================
+# Chain Verification
+# =============================================================================
+def _verify_signatures(
+    secret_key: str, items: List[Tuple[Dict[str, Any], Optional[str], Optional[str]]]
+) -> List[bool]:
+    """Check (row, expected previous hash, signature) triples; runs in workers too."""
+    signer=AuditSigner(secret_key=secret_key)
+    return [
+        signer.verify(_signing_entry(row, previous_hash, signature))
+        for row, previous_hash, signature in items
+    ]
+
+
+class AuditChainVerifier:
+    """
+    Streaming, checkpointed verification of the audit chain.
+
+    - Rows are read in id-ordered windows (keyset pagination), never all
+      at once
+    - Each row's signature is checked against the expected previous hash,
+      then its stored previous_hash against the chain, matching the
+      original full-scan semantics and failure reasons
+    - Incremental runs start after the latest signed checkpoint, whose HMAC
+      and anchor row are checked first; only newer rows are verified
+    - Signature checks, the CPU-heavy part, can be spread across worker
+      processes for the initial full pass
+    - progress is updated (and the callback invoked) after every window
+    """
+
+    def __init__(
+        self,
+        incremental: bool=False,
+        save_checkpoint: bool=False,
+        window_size: int=5000,
+        workers: int=0,
+        checkpoint_interval: int=100_000,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.incremental=incremental
+        self.save_checkpoint=save_checkpoint
+        self.window_size=window_size
+        self.workers=workers
+        self.checkpoint_interval=checkpoint_interval
+        self.callback=progress
+        self.progress: Dict[str, Any] = {}
+
+    def run(self) -> Dict[str, Any]:
+        """Verify the chain; see AuditLog.verify_chain for the result format."""
         if not HAS_CORE_AUDIT:
             return {"valid": False, "error": "Core audit module not available"}
 
-        _logs=AuditLog.query.order_by(AuditLog.id.asc()).all()
-        if not logs:
-            return {"valid": True, "total_checked": 0}
-
-        _secret_key=os.getenv("SECRET_KEY")
-        if not secret_key:
-        # Fallback for dev/test if not set, matching log_operation logic
-            if os.getenv("FLASK_ENV") != "production":
-                secret_key="dev-key"
-            else:
-                return {"valid": False, "error": "SECRET_KEY not set"}
-
-        _signer=AuditSigner(secret_key=secret_key)
-
-        _previous_hash="0" * 64
-
-        for log in logs:
-        # Reconstruct core entry
-            _compliance_tags=json.loads(log.compliance_tags) if log.compliance_tags else []
-            _request_data=json.loads(log.request_data) if log.request_data else None
-            _response_data=json.loads(log.response_data) if log.response_data else None
-
-            # Handle timestamp reconstruction carefully
-            # Assuming created_at is stored as naive UTC or timezone-aware
-            if log.created_at.tzinfo is None:
-                _timestamp_str=log.created_at.replace(tzinfo=timezone.utc).isoformat()
-            else:
-                _timestamp_str=log.created_at.isoformat()
-
-            _core_entry=AuditEntry(
-                _operation=log.operation,
-                _resource_type=log.resource_type,
-                _resource_id=str(log.resource_id) if log.resource_id else "",
-                _actor_id=str(log.user_id) if log.user_id else "system",
-                _action=log.action,
-                _status=log.status,
-                _timestamp=timestamp_str,
-                _details={
-                    "request": request_data,
-                    "response": response_data,
-                    "ip": log.ip_address,
-                    "ua": log.user_agent,
-                },
-                _compliance_tags=compliance_tags,
-                _previous_hash=previous_hash,
-                _signature=log.signature
+        try:
+            secret_key=_audit_secret_key()
+        except ValueError:
+            return {"valid": False, "error": "SECRET_KEY not set"}
+
+        previous_hash: Optional[str] = GENESIS_HASH
+        last_id=0
+        total_verified=0
+        resumed_from: Optional[int] = None
+        if self.incremental:
+            checkpoint=AuditChainCheckpoint.latest()
+            if checkpoint is not None:
+                problem=checkpoint.problem(secret_key)
+                if problem:
+                    return {
+                        "valid": False,
+                        "broken_at_id": checkpoint.verified_up_to_id,
+                        "reason": problem,
+                        "total_checked": 0,
+                    }
+                previous_hash=checkpoint.last_hash
+                last_id=resumed_from=checkpoint.verified_up_to_id
+                total_verified=checkpoint.total_verified
+
+        max_id=db.session.query(db.func.max(AuditLog.id)).scalar() or 0
+        columns=[AuditLog.id, AuditLog.previous_hash, AuditLog.signature] + [
+            getattr(AuditLog, column) for column in _SIGNED_COLUMNS
+        ]
+        checked=0
+        since_checkpoint=0
+        start=time.perf_counter()
+        executor=ProcessPoolExecutor(self.workers) if self.workers > 0 else None
+
+        try:
+            while True:
+                rows=(
+                    db.session.query(*columns)
+                    .filter(AuditLog.id > last_id)
+                    .order_by(AuditLog.id.asc())
+                    .limit(self.window_size)
+                    .all()
+                )
+                if not rows:
+                    break
+
+                items=[]
+                expected=previous_hash
+                for row in rows:
+                    items.append((dict(row._mapping), expected, row.signature))
+                    expected=row.signature
+                valid=self._verify(executor, secret_key, items)
+
+                for row, (_, expected_hash, _), signature_ok in zip(rows, items, valid):
+                    reason=None
+                    if not signature_ok:
+                        reason="Signature mismatch"
+                    elif row.previous_hash != expected_hash:
+                        reason="Chain broken (previous_hash mismatch)"
+                    if reason:
+                        return {
+                            "valid": False,
+                            "broken_at_id": row.id,
+                            "reason": reason,
+                            "total_checked": checked + 1,
+                        }
+                    checked += 1
+
+                previous_hash=rows[-1].signature
+                last_id=rows[-1].id
+                total_verified += len(rows)
+                since_checkpoint += len(rows)
+                if self.save_checkpoint and since_checkpoint >= self.checkpoint_interval:
+                    AuditChainCheckpoint.record(secret_key, last_id, previous_hash, total_verified)
+                    since_checkpoint=0
+                self._report(checked, last_id, max_id, start)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if self.save_checkpoint and since_checkpoint:
+            AuditChainCheckpoint.record(secret_key, last_id, previous_hash, total_verified)
+            logger.info(f"Audit chain verified up to id {last_id} ({total_verified} entries)")
+
+        elapsed=time.perf_counter() - start
+        return {
+            "valid": True,
+            "total_checked": checked,
+            "total_verified": total_verified,
+            "verified_up_to_id": last_id,
+            "resumed_from_id": resumed_from,
+            "elapsed_seconds": elapsed,
+            "rows_per_second": checked / elapsed if elapsed > 0 else 0.0,
+        }
+
+    def _verify(
+        self,
+        executor: Optional[ProcessPoolExecutor],
+        secret_key: str,
+        items: List[Tuple[Dict[str, Any], Optional[str], Optional[str]]],
+    ) -> List[bool]:
+        if executor is None:
+            return _verify_signatures(secret_key, items)
+        chunk=-(-len(items) // self.workers)
+        chunks=[items[n:n + chunk] for n in range(0, len(items), chunk)]
+        results: List[bool] = []
+        for part in executor.map(_verify_signatures, [secret_key] * len(chunks), chunks):
+            results.extend(part)
+        return results
+
+    def _report(self, checked: int, last_id: int, max_id: int, start: float) -> None:
+        elapsed=time.perf_counter() - start
+        self.progress={
+            "checked": checked,
+            "last_id": last_id,
+            "max_id": max_id,
+            "elapsed_seconds": elapsed,
+            "rows_per_second": checked / elapsed if elapsed > 0 else 0.0,
+        }
+        if self.callback is not None:
+            self.callback(dict(self.progress))
+
+
+# =============================================================================
+# Asynchronous Writer
+# =============================================================================
+class AuditLogWriter:
+    """
+    Batched, off-request-path writer for the audit chain.
+
+    Requests append column rows to an in-process buffer. A single writer
+    thread drains it, reads the chain tail once per batch, assigns chain
+    order, signs each entry and bulk-inserts the batch in one commit.
+
+    Durability: an entry waits at most flush_interval (plus the write
+    itself) before it is committed; close() and the graceful-shutdown hook
+    flush everything still buffered. A hard kill can lose at most one
+    flush interval of entries.
+
+    Failed batches are put back at the head of the buffer and retried, so
+    a transient database error delays entries instead of dropping them.
+    When the buffer holds max_pending entries, enqueue() blocks for up to
+    enqueue_timeout and then raises, like a failed synchronous commit.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        batch_size: int=500,
+        flush_interval: float=0.25,
+        max_pending: int=100_000,
+        enqueue_timeout: float=5.0,
+        retry_interval: float=1.0,
+    ) -> None:
+        """
+        Initialize audit log writer.
+
+        Args:
+            app: Flask application whose database receives the entries
+            batch_size: Maximum entries per insert/commit
+            flush_interval: Maximum seconds an entry stays buffered
+            max_pending: Buffer capacity
+            enqueue_timeout: Seconds enqueue() waits for buffer space
+            retry_interval: Delay before retrying a failed batch
+        """
+        self.app=app
+        self.batch_size=batch_size
+        self.flush_interval=flush_interval
+        self.max_pending=max_pending
+        self.enqueue_timeout=enqueue_timeout
+        self.retry_interval=retry_interval
+
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._cond=threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping=False
+        self._flush_target=0
+
+        # Counters
+        self.enqueued=0
+        self.written=0
+        self.batches=0
+        self.failed_batches=0
+        self.dropped=0
+        self.last_batch_ms=0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the writer thread is accepting entries."""
+        return self._thread is not None and self._thread.is_alive() and not self._stopping
+
+    @property
+    def pending(self) -> int:
+        """Entries buffered but not yet committed."""
+        return self.enqueued - self.written - self.dropped
+
+    def start(self) -> "AuditLogWriter":
+        """Start the writer thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping=False
+            self._thread=threading.Thread(
+                target=self._run, name="audit-log-writer", daemon=True
             )
+            self._thread.start()
+            logger.info(
+                f"Audit log writer started: batch_size={self.batch_size}, "
+                f"flush_interval={self.flush_interval}s"
+            )
+        return self
+
+    def enqueue(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a row built by AuditLog.build_row().
+
+        Raises:
+            RuntimeError: If the buffer stays full for enqueue_timeout
+        """
+        with self._cond:
+            if len(self._buffer) >= self.max_pending:
+                if not self._cond.wait_for(
+                    lambda: len(self._buffer) < self.max_pending, timeout=self.enqueue_timeout
+                ):
+                    raise RuntimeError("Audit log buffer full; entry not recorded")
+            self._buffer.append(row)
+            self.enqueued += 1
+            # Wake the writer to start the flush clock, or for a full batch
+            if len(self._buffer) == 1 or len(self._buffer) >= self.batch_size:
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every entry queued before this call is committed.
 
-            # Verify signature
-            if not signer.verify(core_entry):
-                return {
-                    "valid": False,
-                    "broken_at_id": log.id,
-                    "reason": "Signature mismatch",
-                    "total_checked": len(logs)
-                }
-
-            # Verify chain
-            if log.previous_hash != previous_hash:
-                return {
-                    "valid": False,
-                    "broken_at_id": log.id,
-                    "reason": "Chain broken (previous_hash mismatch)",
-                    "total_checked": len(logs)
-                }
-
-            _previous_hash=log.signature
-
-        return {"valid": True, "total_checked": len(logs)}
+        Returns:
+            True if flushed, False on timeout or if the writer is stopped
+        """
+        with self._cond:
+            target=self.enqueued
+            self._flush_target=max(self._flush_target, target)
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: self.written + self.dropped >= target
+                or self._thread is None
+                or not self._thread.is_alive(),
+                timeout=timeout,
+            ) and self.written + self.dropped >= target
+
+    def close(self, timeout: float=30.0) -> None:
+        """Flush buffered entries and stop the writer thread."""
+        with self._cond:
+            self._stopping=True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.error(f"Audit log writer did not stop; {self.pending} entries unwritten")
+        logger.info(f"Audit log writer stopped: {self.written} entries written")
+
+    def stats(self) -> Dict[str, Any]:
+        """Writer counters."""
+        return {
+            "running": self.running,
+            "pending": self.pending,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "batches": self.batches,
+            "failed_batches": self.failed_batches,
+            "dropped": self.dropped,
+            "last_batch_ms": self.last_batch_ms,
+        }
+
+    def _next_batch(self) -> List[Dict[str, Any]]:
+        """Wait for a full batch, the flush deadline, a flush() or close()."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._buffer or self._stopping)
+            self._cond.wait_for(
+                lambda: len(self._buffer) >= self.batch_size
+                or self._stopping
+                or self._flush_target > self.written + self.dropped,
+                timeout=self.flush_interval,
+            )
+            count=min(self.batch_size, len(self._buffer))
+            batch=[self._buffer.popleft() for _ in range(count)]
+            self._cond.notify_all()    # Wake producers waiting for space
+            return batch
+
+    def _run(self) -> None:
+        """Writer thread main loop."""
+        with self.app.app_context():
+            failures=0
+            while True:
+                batch=self._next_batch()
+                if not batch:
+                    if self._stopping:
+                        break
+                    continue
+                try:
+                    self._write_batch(batch)
+                    failures=0
+                    with self._cond:
+                        self.written += len(batch)
+                        self._cond.notify_all()
+                except Exception as e:
+                    failures += 1
+                    self.failed_batches += 1
+                    logger.error(f"Audit log batch of {len(batch)} failed (attempt {failures}): {e}")
+                    if self._stopping and failures >= 3:
+                        with self._cond:
+                            self.dropped += len(batch) + len(self._buffer)
+                            logger.critical(
+                                f"Dropping {len(batch) + len(self._buffer)} audit entries at shutdown"
+                            )
+                            self._buffer.clear()
+                            self._cond.notify_all()
+                        break
+                    with self._cond:
+                        self._buffer.extendleft(reversed(batch))
+                    time.sleep(self.retry_interval)
+            db.session.remove()
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Chain, sign and insert one batch in a single transaction."""
+        start=time.perf_counter()
+        with _chain_lock:
+            self._insert_chained(batch)
+        self.batches += 1
+        self.last_batch_ms=(time.perf_counter() - start) * 1000
+
+    def _insert_chained(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            if HAS_CORE_AUDIT:
+                last_entry=(
+                    db.session.query(AuditLog.signature).order_by(AuditLog.id.desc()).first()
+                )
+                previous_hash=last_entry[0] if last_entry else GENESIS_HASH
+                signer=AuditSigner(secret_key=_audit_secret_key())
+                for row in batch:
+                    row["previous_hash"] = previous_hash
+                    row["signature"] = signer.sign(_signing_entry(row, previous_hash))
+                    previous_hash=row["signature"]
+            # Executed in list order, so ids follow chain order
+            db.session.execute(AuditLog.__table__.insert(), batch)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+
+_audit_writer: Optional[AuditLogWriter] = None
+
+
+def get_audit_writer() -> Optional[AuditLogWriter]:
+    """The running audit log writer, if any."""
+    return _audit_writer
+
+
+def start_audit_writer(
+    app: Any, shutdown_manager: Any=None, **kwargs: Any
+) -> AuditLogWriter:
+    """
+    Start the process-wide audit log writer and flush it on shutdown.
+
+    Args:
+        app: Flask application
+        shutdown_manager: GracefulShutdownManager (default: global instance)
+        **kwargs: AuditLogWriter options
+
+    Returns:
+        Running writer; AuditLog.log_operation queues to it from now on
+    """
+    global _audit_writer
+    if _audit_writer is not None:
+        _audit_writer.close()
+    _audit_writer=AuditLogWriter(app, **kwargs).start()
+
+    if shutdown_manager is None:
+        from opt.web.panel.graceful_shutdown import get_shutdown_manager
+
+        shutdown_manager=get_shutdown_manager()
+    # Before database connections are closed (default priority 50)
+    shutdown_manager.register_cleanup_hook("audit_log_writer", stop_audit_writer, priority=10)
+    return _audit_writer
+
+
+def stop_audit_writer(timeout: float=30.0) -> None:
+    """Flush and stop the audit log writer; later entries are written synchronously."""
+    global _audit_writer
+    writer, _audit_writer=_audit_writer, None
+    if writer is not None:
+        writer.close(timeout)
@@ -102,11 +102,46 @@
 
 Stores cluster node information synchronized from RPC service.
 Tracks node status, capabilities, and metadata.
+
+NodeStatusCache keeps a materialized, versioned snapshot of every node's
+to_dict() for the status API, refreshed incrementally when nodes change.
 """
 
-from typing import Any, Optional, List, Dict
+from bisect import bisect_right
+from typing import Any, Optional, List, Dict, Sequence, Tuple
 from datetime import datetime, timezone
+from flask import current_app, has_app_context
+from sqlalchemy import event, func
 from opt.web.panel.extensions import db
+import hashlib
+import json
+import threading
+import time
+
+HEALTHY_HEARTBEAT_SECONDS=300    # Nodes are healthy within 5 minutes of a heartbeat
+
+# Keys of Node.to_dict(), selectable through field projection
+STATUS_FIELDS=(
+    "id",
+    "node_id",
+    "hostname",
+    "ip_address",
+    "mac_address",
+    "cpu_cores",
+    "memory_gb",
+    "storage_gb",
+    "status",
+    "is_healthy",
+    "last_heartbeat",
+    "region",
+    "rack",
+    "created_at",
+)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (as returned by SQLite) as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
 
 
 class Node(db.Model):
@@ -115,44 +150,44 @@ class Node(db.Model):
     __tablename__="node"
 
     # Primary key
-    _id=db.Column(db.Integer, primary_key=True)
+    id=db.Column(db.Integer, primary_key=True)
 
     # Node identification
-    _node_id=db.Column(
+    node_id=db.Column(
         db.String(36), unique=True, nullable=False, index=True
     )    # UUID from RPC
-    _hostname=db.Column(db.String(253), nullable=False, index=True)    # FQDN
-    _ip_address=db.Column(db.String(45), nullable=False, index=True)    # IPv4 or IPv6
-    _mac_address=db.Column(db.String(17), nullable=True, index=True)
+    hostname=db.Column(db.String(253), nullable=False, index=True)    # FQDN
+    ip_address=db.Column(db.String(45), nullable=False, index=True)    # IPv4 or IPv6
+    mac_address=db.Column(db.String(17), nullable=True, index=True)
 
     # Node capabilities
-    _cpu_cores=db.Column(db.Integer)
-    _memory_gb=db.Column(db.Integer)
-    _storage_gb=db.Column(db.Integer)
+    cpu_cores=db.Column(db.Integer)
+    memory_gb=db.Column(db.Integer)
+    storage_gb=db.Column(db.Integer)
 
     # Status tracking
-    _status=db.Column(
+    status=db.Column(
         db.String(20), default="unknown", index=True
     )    # online, offline, error
-    _last_heartbeat=db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
+    last_heartbeat=db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
 
     # Metadata
-    _region=db.Column(db.String(100), nullable=True, index=True)
-    _rack=db.Column(db.String(100), nullable=True)
-    _labels=db.Column(db.Text, nullable=True)    # JSON-encoded labels
+    region=db.Column(db.String(100), nullable=True, index=True)
+    rack=db.Column(db.String(100), nullable=True)
+    labels=db.Column(db.Text, nullable=True)    # JSON-encoded labels
 
     # Tracking
-    _created_at=db.Column(
+    created_at=db.Column(
         db.DateTime, default=lambda: datetime.now(timezone.utc), index=True
     )
-    _updated_at=db.Column(
+    updated_at=db.Column(
         db.DateTime,
-        _default=lambda: datetime.now(timezone.utc),
-        _onupdate=lambda: datetime.now(timezone.utc),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
     )
 
     # Relationships
-    _snapshots=db.relationship(
+    snapshots=db.relationship(
         "Snapshot", backref="node", lazy=True, cascade="all, delete-orphan"
     )
 
@@ -168,8 +203,8 @@ class Node(db.Model):
         """
         if not self.last_heartbeat:
             return False
-        _elapsed=datetime.now(timezone.utc) - self.last_heartbeat
-        return bool(elapsed.total_seconds() < 300)    # 5 minutes
+        elapsed=datetime.now(timezone.utc) - _as_utc(self.last_heartbeat)
+        return bool(elapsed.total_seconds() < HEALTHY_HEARTBEAT_SECONDS)
 
     def update_heartbeat(self) -> None:
         """Update last heartbeat timestamp to current time."""
@@ -177,7 +212,7 @@ class Node(db.Model):
         self.status="online"
         db.session.commit()
 
-    def to_dict(self, includesnapshots: bool=False) -> Dict[str, Any]:
+    def to_dict(self, include_snapshots: bool=False) -> Dict[str, Any]:
         """Convert node to dictionary for JSON responses.
 
         Args:
@@ -186,7 +221,7 @@ class Node(db.Model):
         Returns:
             Dictionary representation of node
         """
-        _data={
+        data={
             "id": self.id,
             "node_id": self.node_id,
             "hostname": self.hostname,
@@ -221,7 +256,7 @@ class Node(db.Model):
         return Node.query.filter_by(hostname=hostname).first()    # type: ignore
 
     @staticmethod
-    def get_by_node_id(nodeid: str) -> Optional['Node']:
+    def get_by_node_id(node_id: str) -> Optional['Node']:
         """Get node by node_id (UUID from RPC).
 
         Args:
@@ -239,7 +274,7 @@ class Node(db.Model):
         Returns:
             List of healthy Node instances
         """
-        _nodes=Node.query.filter_by(status="online").all()
+        nodes=Node.query.filter_by(status="online").all()
         return [n for n in nodes if n.is_healthy()]
 
     @staticmethod
@@ -250,3 +285,242 @@ class Node(db.Model):
             List of offline Node instances
         """
         return Node.query.filter_by(status="offline").all()    # type: ignore
+
+
+# =============================================================================
+# Node Status Snapshot
+# =============================================================================
+class NodeStatusSnapshot:
+    """
+    Immutable, versioned view of every node's to_dict(), ordered by id.
+
+    Encoded response bodies and their ETags are cached per query shape, so
+    each distinct page is serialized once per version.
+    """
+
+    MAX_CACHED_RESPONSES=256
+
+    def __init__(
+        self,
+        version: int,
+        rows: List[Dict[str, Any]],
+        heartbeats: List[Optional[float]],
+        fingerprint: Tuple[Any, ...],
+        max_updated_at: Optional[datetime],
+    ) -> None:
+        self.version=version
+        self.rows=rows
+        self.ids=[row["id"] for row in rows]
+        self.heartbeats=heartbeats    # Epoch seconds, parallel to rows
+        self.fingerprint=fingerprint
+        self.max_updated_at=max_updated_at
+        self.built_at=time.time()
+        # Wall-clock time at which the next healthy node turns unhealthy
+        self.valid_until=min(
+            (
+                hb + HEALTHY_HEARTBEAT_SECONDS
+                for hb, row in zip(heartbeats, rows)
+                if hb is not None and row["is_healthy"]
+            ),
+            default=float("inf"),
+        )
+        self._responses: Dict[Tuple[Any, ...], Tuple[bytes, str]] = {}
+        self._lock=threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def select(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        status: Optional[str] = None,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Keyset page of rows.
+
+        Args:
+            fields: Keys to include (None=all)
+            status: Only nodes with this status
+            after: Return nodes with id greater than this
+            limit: Page size (None=all remaining)
+
+        Returns:
+            (rows, next_after) where next_after is None on the last page
+        """
+        start=bisect_right(self.ids, after) if after is not None else 0
+        page: List[Dict[str, Any]] = []
+        next_after=None
+        for index in range(start, len(self.rows)):
+            row=self.rows[index]
+            if status is not None and row["status"] != status:
+                continue
+            if limit is not None and len(page) == limit:
+                next_after=page[-1]["id"]
+                break
+            page.append(row)
+        if fields is not None:
+            page=[{name: row[name] for name in fields} for row in page]
+        return page, next_after
+
+    def response(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        status: Optional[str] = None,
+        after: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[bytes, str]:
+        """
+        Encoded JSON body and its ETag.
+
+        Without a limit the body is a plain list (the original API shape);
+        with one it is {"nodes": [...], "next_after": id-or-null}.
+        """
+        key=(tuple(fields) if fields is not None else None, status, after, limit)
+        cached=self._responses.get(key)
+        if cached is not None:
+            return cached
+
+        rows, next_after=self.select(fields, status, after, limit)
+        payload: Any=rows if limit is None else {"nodes": rows, "next_after": next_after}
+        body=json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        etag=hashlib.blake2b(body, digest_size=16).hexdigest()
+        with self._lock:
+            if len(self._responses) >= self.MAX_CACHED_RESPONSES:
+                self._responses.clear()
+            self._responses[key] = (body, etag)
+        return body, etag
+
+
+class NodeStatusCache:
+    """
+    Materialized node-status snapshot, refreshed incrementally.
+
+    A refresh compares a cheap fingerprint (row count, max id, max
+    updated_at) with the snapshot's; if it moved, only rows updated since
+    the snapshot are reloaded, falling back to a full rebuild when rows
+    were deleted. Writes through the ORM in this process mark the cache
+    dirty immediately (see the Node event listeners); writes from other
+    processes are picked up within revalidate_interval seconds. The
+    snapshot also expires when a node's heartbeat ages past the health
+    threshold, since is_healthy changes without a write.
+    """
+
+    def __init__(self, revalidate_interval: float=1.0) -> None:
+        self.revalidate_interval=revalidate_interval
+        self._snapshot: Optional[NodeStatusSnapshot] = None
+        self._dirty=True
+        self._checked_at=0.0
+        self._version=0
+        self._lock=threading.Lock()
+        self.stats={"hits": 0, "revalidations": 0, "incremental": 0, "rebuilds": 0}
+
+    def invalidate(self) -> None:
+        """Force a fingerprint check on the next get()."""
+        self._dirty=True
+
+    def get(self) -> NodeStatusSnapshot:
+        """Current snapshot, refreshed if the node table changed."""
+        snapshot=self._snapshot
+        now=time.monotonic()
+        if (
+            snapshot is not None
+            and not self._dirty
+            and now - self._checked_at < self.revalidate_interval
+            and time.time() < snapshot.valid_until
+        ):
+            self.stats["hits"] += 1
+            return snapshot
+
+        with self._lock:
+            self.stats["revalidations"] += 1
+            self._dirty=False
+            self._checked_at=now
+            snapshot=self._snapshot
+            fingerprint=self._fingerprint()
+            if (
+                snapshot is not None
+                and fingerprint == snapshot.fingerprint
+                and time.time() < snapshot.valid_until
+            ):
+                return snapshot
+            self._snapshot=self._refresh(snapshot, fingerprint)
+            return self._snapshot
+
+    @staticmethod
+    def _fingerprint() -> Tuple[Any, ...]:
+        count, max_id, max_updated=db.session.query(
+            func.count(Node.id), func.max(Node.id), func.max(Node.updated_at)
+        ).one()
+        return (count, max_id, max_updated)
+
+    def _refresh(
+        self, snapshot: Optional[NodeStatusSnapshot], fingerprint: Tuple[Any, ...]
+    ) -> NodeStatusSnapshot:
+        self._version += 1
+        if snapshot is not None and snapshot.max_updated_at is not None:
+            changed=Node.query.filter(Node.updated_at >= snapshot.max_updated_at).all()
+            by_id={row["id"]: (row, hb) for row, hb in zip(snapshot.rows, snapshot.heartbeats)}
+            for node in changed:
+                by_id[node.id] = self._row(node)
+            if len(by_id) == fingerprint[0]:
+                self.stats["incremental"] += 1
+                ordered=sorted(by_id.items())
+                return self._snapshot_from(
+                    [self._recheck_health(row, hb) for _, (row, hb) in ordered],
+                    fingerprint,
+                )
+
+        self.stats["rebuilds"] += 1
+        nodes=Node.query.order_by(Node.id.asc()).all()
+        return self._snapshot_from([self._row(node) for node in nodes], fingerprint)
+
+    def _snapshot_from(
+        self,
+        entries: List[Tuple[Dict[str, Any], Optional[float]]],
+        fingerprint: Tuple[Any, ...],
+    ) -> NodeStatusSnapshot:
+        return NodeStatusSnapshot(
+            self._version,
+            [row for row, _ in entries],
+            [hb for _, hb in entries],
+            fingerprint,
+            fingerprint[2],
+        )
+
+    @staticmethod
+    def _row(node: Node) -> Tuple[Dict[str, Any], Optional[float]]:
+        heartbeat=_as_utc(node.last_heartbeat).timestamp() if node.last_heartbeat else None
+        return node.to_dict(), heartbeat
+
+    @staticmethod
+    def _recheck_health(
+        row: Dict[str, Any], heartbeat: Optional[float]
+    ) -> Tuple[Dict[str, Any], Optional[float]]:
+        healthy=heartbeat is not None and time.time() - heartbeat < HEALTHY_HEARTBEAT_SECONDS
+        if healthy != row["is_healthy"]:
+            row=dict(row, is_healthy=healthy)
+        return row, heartbeat
+
+
+def get_node_status_cache() -> NodeStatusCache:
+    """The current app's NodeStatusCache (created on first use)."""
+    cache=current_app.extensions.get("node_status_cache")
+    if cache is None:
+        cache=NodeStatusCache(
+            revalidate_interval=current_app.config.get("NODE_STATUS_REVALIDATE_SECONDS", 1.0)
+        )
+        current_app.extensions["node_status_cache"] = cache
+    return cache    # type: ignore[no-any-return]
+
+
+def _node_changed(mapper: Any, connection: Any, target: Node) -> None:
+    if has_app_context():
+        cache=current_app.extensions.get("node_status_cache")
+        if cache is not None:
+            cache.invalidate()
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Node, _event_name, _node_changed)
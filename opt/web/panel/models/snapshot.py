@@ -115,47 +115,47 @@ class Snapshot(db.Model):
     __tablename__="snapshot"
 
     # Primary key
-    _id=db.Column(db.Integer, primary_key=True)
+    id=db.Column(db.Integer, primary_key=True)
 
     # Snapshot identification
-    _snapshot_id=db.Column(
+    snapshot_id=db.Column(
         db.String(36), unique=True, nullable=False, index=True
     )    # UUID from RPC
-    _name=db.Column(db.String(255), nullable=False, index=True)
+    name=db.Column(db.String(255), nullable=False, index=True)
 
     # Relationships
-    _node_id=db.Column(
+    node_id=db.Column(
         db.Integer, db.ForeignKey("node.id"), nullable=False, index=True
     )
 
     # Source information
-    _source_vm=db.Column(db.String(255), nullable=True, index=True)    # Source VM identifier
-    _source_volume=db.Column(db.String(255), nullable=True)    # Source volume/disk
+    source_vm=db.Column(db.String(255), nullable=True, index=True)    # Source VM identifier
+    source_volume=db.Column(db.String(255), nullable=True)    # Source volume/disk
 
     # Snapshot details
-    _description=db.Column(db.Text, nullable=True)
-    _size_gb=db.Column(db.Float)
+    description=db.Column(db.Text, nullable=True)
+    size_gb=db.Column(db.Float)
 
     # Status tracking
     # pending, success, failed, deleting
-    _status=db.Column(db.String(20), default="pending", index=True)
-    _progress_percent=db.Column(db.Integer, default=0)
+    status=db.Column(db.String(20), default="pending", index=True)
+    progress_percent=db.Column(db.Integer, default=0)
 
     # Metadata
-    _retention_days=db.Column(db.Integer)    # Days to retain
-    _is_encrypted=db.Column(db.Boolean, default=True)
-    _checksum=db.Column(db.String(64), nullable=True)    # SHA256 of snapshot
+    retention_days=db.Column(db.Integer)    # Days to retain
+    is_encrypted=db.Column(db.Boolean, default=True)
+    checksum=db.Column(db.String(64), nullable=True)    # SHA256 of snapshot
 
     # Timing
-    _created_at=db.Column(
+    created_at=db.Column(
         db.DateTime, default=lambda: datetime.now(timezone.utc), index=True
     )
-    _updated_at=db.Column(
+    updated_at=db.Column(
         db.DateTime,
-        _default=lambda: datetime.now(timezone.utc),
-        _onupdate=lambda: datetime.now(timezone.utc),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
     )
-    _expires_at=db.Column(db.DateTime, nullable=True, index=True)
+    expires_at=db.Column(db.DateTime, nullable=True, index=True)
 
     def __repr__(self) -> str:
         """String representation of Snapshot."""
@@ -204,7 +204,7 @@ class Snapshot(db.Model):
         self.updated_at=datetime.now(timezone.utc)
         db.session.commit()
 
-    def mark_failed(self, errormessage: Optional[str] = None) -> None:
+    def mark_failed(self, error_message: Optional[str] = None) -> None:
         """Mark snapshot as failed.
 
         Args:
@@ -216,7 +216,7 @@ class Snapshot(db.Model):
         self.updated_at=datetime.now(timezone.utc)
         db.session.commit()
 
-    def to_dict(self, includenode: bool=False) -> Dict[str, Any]:
+    def to_dict(self, include_node: bool=False) -> Dict[str, Any]:
         """Convert snapshot to dictionary for JSON responses.
 
         Args:
@@ -225,7 +225,7 @@ class Snapshot(db.Model):
         Returns:
             Dictionary representation of snapshot
         """
-        _data={
+        data={
             "id": self.id,
             "snapshot_id": self.snapshot_id,
             "name": self.name,
@@ -247,7 +247,7 @@ class Snapshot(db.Model):
         return data
 
     @staticmethod
-    def get_by_snapshot_id(snapshotid: str) -> Optional['Snapshot']:
+    def get_by_snapshot_id(snapshot_id: str) -> Optional['Snapshot']:
         """Get snapshot by snapshot_id (UUID from RPC).
 
         Args:
@@ -259,7 +259,7 @@ class Snapshot(db.Model):
         return Snapshot.query.filter_by(snapshot_id=snapshot_id).first()    # type: ignore
 
     @staticmethod
-    def get_node_snapshots(nodeid: int, status: Optional[str] = None) -> List['Snapshot']:
+    def get_node_snapshots(node_id: int, status: Optional[str] = None) -> List['Snapshot']:
         """Get all snapshots for a node.
 
         Args:
@@ -269,9 +269,9 @@ class Snapshot(db.Model):
         Returns:
             List of Snapshot instances
         """
-        _query=Snapshot.query.filter_by(node_id=node_id)
+        query=Snapshot.query.filter_by(node_id=node_id)
         if status:
-            _query=query.filter_by(status=status)
+            query=query.filter_by(status=status)
         return query.order_by(Snapshot.created_at.desc()).all()    # type: ignore
 
     @staticmethod
@@ -281,7 +281,7 @@ class Snapshot(db.Model):
         Returns:
             List of expired Snapshot instances
         """
-        _now=datetime.now(timezone.utc)
+        now=datetime.now(timezone.utc)
         return Snapshot.query.filter(Snapshot.expires_at < now).all()    # type: ignore
 
     @staticmethod
@@ -19,7 +19,7 @@ login, logout, registration, password reset, and session management.
 
 from opt.web.panel.extensions import db, limiter
 from typing import Any
-# import time
+import time
 
 from opt.web.panel.rbac import require_permission, Resource, Action
 from opt.helpers.mail import send_password_reset
@@ -70,8 +70,8 @@ auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 @limiter.limit("10 per minute", methods=["POST"], key_func=lambda: request.remote_addr)    # type: ignore
 @sliding_window_limiter(
     lambda: f"user:{request.form.get('username', 'anonymous')}",
-    _limit=20,
-    _window_seconds=60,
+    limit=20,
+    window_seconds=60,
 )
 
 
@@ -85,9 +85,9 @@ def login() -> Any:
         return redirect(url_for("main.dashboard"))
 
     if request.method == "POST":
-        _username=request.form.get("username", "").strip()
-        _password=request.form.get("password", "")
-        _remember_me=request.form.get("remember_me") is not None
+        username=request.form.get("username", "").strip()
+        password=request.form.get("password", "")
+        remember_me=request.form.get("remember_me") is not None
 
         # Validate input
         if not username or not password:
@@ -105,22 +105,22 @@ def login() -> Any:
 
             # Log failed login attempt
             AuditLog.log_operation(
-                _user_id=None,
-                _operation="read",
-                _resource_type="user",
-                _action=f"Failed login attempt for {username}",
-                _status="failure",
-                _status_code=401,
-                _ip_address=request.remote_addr,
-                _user_agent=request.headers.get("User-Agent"),
+                user_id=None,
+                operation="read",
+                resource_type="user",
+                action=f"Failed login attempt for {username}",
+                status="failure",
+                status_code=401,
+                ip_address=request.remote_addr,
+                user_agent=request.headers.get("User-Agent"),
             )
             # Exponential backoff: impose a delay based on recent failures for this IP
             # Sliding window approximation via limiter; add small sleep to deter brute force
             try:
-                _failure_count=int(session.get("login_failures", 0)) + 1
+                failure_count=int(session.get("login_failures", 0)) + 1
                 session["login_failures"] = failure_count
-                _delay_seconds=min(8, 2 ** min(3, failure_count - 1))
-                time.sleep(delay_seconds / 10.0)  # type: ignore[name-defined]
+                delay_seconds=min(8, 2 ** min(3, failure_count - 1))
+                time.sleep(delay_seconds / 10.0)
             except Exception as e:
                 current_app.logger.debug(f"Delay calculation error: {e}")
             return redirect(url_for("auth.login"))
@@ -136,22 +136,22 @@ def login() -> Any:
 
         # Log successful login
         AuditLog.log_operation(
-            _user_id=user.id,
-            _operation="read",
-            _resource_type="user",
-            _action=f"User {user.username} logged in",
-            _status="success",
-            _status_code=200,
-            _ip_address=request.remote_addr,
-            _user_agent=request.headers.get("User-Agent"),
+            user_id=user.id,
+            operation="read",
+            resource_type="user",
+            action=f"User {user.username} logged in",
+            status="success",
+            status_code=200,
+            ip_address=request.remote_addr,
+            user_agent=request.headers.get("User-Agent"),
         )
 
         flash(f"Welcome back, {user.full_name or user.username}!", "success")
-        _next_page=request.args.get("next")
+        next_page=request.args.get("next")
 
         # Validate next_page to prevent open redirects
         if not next_page or not is_safe_url(next_page):
-            _next_page=url_for("main.dashboard")
+            next_page=url_for("main.dashboard")
 
         return redirect(next_page)
 
@@ -175,12 +175,12 @@ def logout() -> Any:
 
     # Log logout
     AuditLog.log_operation(
-        _user_id=user.id,
-        _operation="read",
-        _resource_type="user",
-        _action=f"User {user.username} logged out",
-        _status="success",
-        _ip_address=request.remote_addr,
+        user_id=user.id,
+        operation="read",
+        resource_type="user",
+        action=f"User {user.username} logged out",
+        status="success",
+        ip_address=request.remote_addr,
     )
 
     flash("You have been logged out", "info")
@@ -191,8 +191,8 @@ def logout() -> Any:
 @limiter.limit("5 per minute", methods=["POST"], key_func=lambda: request.remote_addr)    # type: ignore
 @sliding_window_limiter(
     lambda: f"email:{request.form.get('email', 'unknown')}",
-    _limit=10,
-    _window_seconds=3600,
+    limit=10,
+    window_seconds=3600,
 )
 
 
@@ -206,11 +206,11 @@ def register() -> Any:
         return redirect(url_for("main.dashboard"))
 
     if request.method == "POST":
-        _username=request.form.get("username", "").strip().lower()
-        _email=request.form.get("email", "").strip().lower()
-        _password=request.form.get("password", "")
-        _password_confirm=request.form.get("password_confirm", "")
-        _full_name=request.form.get("full_name", "").strip()
+        username=request.form.get("username", "").strip().lower()
+        email=request.form.get("email", "").strip().lower()
+        password=request.form.get("password", "")
+        password_confirm=request.form.get("password_confirm", "")
+        full_name=request.form.get("full_name", "").strip()
 
         # Validate input
         errors=[]
@@ -240,7 +240,7 @@ def register() -> Any:
             return redirect(url_for("auth.register"))
 
         # Create new user
-        _user=User(username=username, email=email, full_name=full_name)
+        user=User(username=username, email=email, full_name=full_name)
         user.set_password(password)
 
         db.session.add(user)
@@ -248,12 +248,12 @@ def register() -> Any:
 
         # Log registration
         AuditLog.log_operation(
-            _user_id=user.id,
-            _operation="create",
-            _resource_type="user",
-            _action=f"New user account created: {username}",
-            _status="success",
-            _ip_address=request.remote_addr,
+            user_id=user.id,
+            operation="create",
+            resource_type="user",
+            action=f"New user account created: {username}",
+            status="success",
+            ip_address=request.remote_addr,
         )
 
         flash("Account created successfully. Please log in.", "success")
@@ -276,11 +276,11 @@ def profile() -> Any:
     POST: Update user information
     """
     if request.method == "POST":
-        _full_name=request.form.get("full_name", "").strip()
-        _email=request.form.get("email", "").strip().lower()
-        _current_password=request.form.get("current_password", "")
-        _new_password=request.form.get("new_password", "")
-        _new_password_confirm=request.form.get("new_password_confirm", "")
+        full_name=request.form.get("full_name", "").strip()
+        email=request.form.get("email", "").strip().lower()
+        current_password=request.form.get("current_password", "")
+        new_password=request.form.get("new_password", "")
+        new_password_confirm=request.form.get("new_password_confirm", "")
 
         # Update profile fields
         if full_name:
@@ -313,12 +313,12 @@ def profile() -> Any:
 
         # Log profile update
         AuditLog.log_operation(
-            _user_id=current_user.id,
-            _operation="update",
-            _resource_type="user",
-            _action="User updated their profile",
-            _status="success",
-            _ip_address=request.remote_addr,
+            user_id=current_user.id,
+            operation="update",
+            resource_type="user",
+            action="User updated their profile",
+            status="success",
+            ip_address=request.remote_addr,
         )
 
         flash("Profile updated successfully", "success")
@@ -335,10 +335,10 @@ def list_users() -> Any:
 
     GET: Display paginated user list
     """
-    _page=request.args.get("page", 1, type=int)
+    page=request.args.get("page", 1, type=int)
     per_page=20
 
-    _pagination=User.query.paginate(page=page, per_page=per_page)
+    pagination=User.query.paginate(page=page, per_page=per_page)
     users=pagination.items
 
     return render_template("auth/users.html", users=users, pagination=pagination)
@@ -350,8 +350,8 @@ def list_users() -> Any:
 )
 @sliding_window_limiter(
     lambda: f"email:{request.form.get('email', 'unknown')}",
-    _limit=5,
-    _window_seconds=1800,
+    limit=5,
+    window_seconds=1800,
 )
 
 
@@ -362,38 +362,38 @@ def password_reset() -> Any:
     POST: Accept email and enqueue reset instructions (placeholder implementation)
     """
     if request.method == "POST":
-        _email=request.form.get("email", "").strip().lower()
+        email=request.form.get("email", "").strip().lower()
         if not email or "@" not in email:
             flash("Valid email address required", "error")
             return redirect(url_for("auth.password_reset"))
 
-        _user=User.query.filter_by(email=email).first()
+        user=User.query.filter_by(email=email).first()
         if not user:
         # Avoid user enumeration: respond success regardless
             AuditLog.log_operation(
-                _user_id=None,
-                _operation="read",
-                _resource_type="user",
-                _action=f"Password reset requested for {email} (no account)",
-                _status="success",
-                _ip_address=request.remote_addr,
+                user_id=None,
+                operation="read",
+                resource_type="user",
+                action=f"Password reset requested for {email} (no account)",
+                status="success",
+                ip_address=request.remote_addr,
             )
             flash("If an account exists, reset instructions have been sent.", "info")
             return redirect(url_for("auth.login"))
 
         # Generate time-limited reset token and enqueue email (placeholder)
-        _s=URLSafeTimedSerializer(current_app.config["SECRET_KEY"])
-        _token=s.dumps({"uid": user.id, "email": user.email}, salt="reset")
+        s=URLSafeTimedSerializer(current_app.config["SECRET_KEY"])
+        token=s.dumps({"uid": user.id, "email": user.email}, salt="reset")
 
         send_password_reset(email=user.email, token=token)
 
         AuditLog.log_operation(
-            _user_id=user.id,
-            _operation="update",
-            _resource_type="user",
-            _action="Password reset requested",
-            _status="success",
-            _ip_address=request.remote_addr,
+            user_id=user.id,
+            operation="update",
+            resource_type="user",
+            action="Password reset requested",
+            status="success",
+            ip_address=request.remote_addr,
         )
         flash("If an account exists, reset instructions have been sent.", "info")
         return redirect(url_for("auth.login"))
@@ -409,7 +409,7 @@ def password_reset() -> Any:
 
 def reset_verify() -> Any:
     """Verify reset token and set new password."""
-    _s=URLSafeTimedSerializer(current_app.config["SECRET_KEY"])
+    s=URLSafeTimedSerializer(current_app.config["SECRET_KEY"])
     token=(
         request.args.get("token")
         if request.method == "GET"
@@ -421,8 +421,8 @@ def reset_verify() -> Any:
         return render_template("auth/reset_verify.html", token=token)
 
     # POST: apply new password
-    _new_password=request.form.get("password", "")
-    _confirm=request.form.get("password_confirm", "")
+    new_password=request.form.get("password", "")
+    confirm=request.form.get("password_confirm", "")
     if not new_password or new_password != confirm or len(new_password) < 8:
         flash("Invalid password or mismatch", "error")
         return redirect(url_for("auth.reset_verify", token=token))
@@ -432,7 +432,7 @@ def reset_verify() -> Any:
         return redirect(url_for("auth.password_reset"))
 
     try:
-        _data=s.loads(token, salt="reset", max_age=3600)
+        data=s.loads(token, salt="reset", max_age=3600)
     except SignatureExpired:
         flash("Reset link expired", "error")
         return redirect(url_for("auth.password_reset"))
@@ -440,7 +440,7 @@ def reset_verify() -> Any:
         flash("Invalid reset link", "error")
         return redirect(url_for("auth.password_reset"))
 
-    _user=User.query.get(int(data.get("uid")))
+    user=User.query.get(int(data.get("uid")))
     if not user or user.email != data.get("email"):
         flash("Invalid reset link", "error")
         return redirect(url_for("auth.password_reset"))
@@ -449,12 +449,12 @@ def reset_verify() -> Any:
     db.session.commit()
 
     AuditLog.log_operation(
-        _user_id=user.id,
-        _operation="update",
-        _resource_type="user",
-        _action="User password reset via token",
-        _status="success",
-        _ip_address=request.remote_addr,
+        user_id=user.id,
+        operation="update",
+        resource_type="user",
+        action="User password reset via token",
+        status="success",
+        ip_address=request.remote_addr,
     )
 
     flash("Password updated. Please log in.", "success")
@@ -469,7 +469,7 @@ def reset_verify() -> Any:
 )
 
 
-def disable_user(userid: int) -> Any:
+def disable_user(user_id: int) -> Any:
     """Disable user account (admin only).
 
     POST: Set is_active to False
@@ -478,7 +478,7 @@ def disable_user(userid: int) -> Any:
         flash("Cannot disable your own account", "error")
         return redirect(url_for("auth.list_users"))
 
-    _user=User.query.get(user_id)
+    user=User.query.get(user_id)
     if not user:
         flash("User not found", "error")
         return redirect(url_for("auth.list_users"))
@@ -488,13 +488,13 @@ def disable_user(userid: int) -> Any:
 
     # Log user disable
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="update",
-        _resource_type="user",
-        _action=f"Disabled user account: {user.username}",
-        _status="success",
-        _resource_id=str(user_id),
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="update",
+        resource_type="user",
+        action=f"Disabled user account: {user.username}",
+        status="success",
+        resource_id=str(user_id),
+        ip_address=request.remote_addr,
     )
 
     flash(f"User {user.username} has been disabled", "success")
@@ -509,12 +509,12 @@ def disable_user(userid: int) -> Any:
 )
 
 
-def enable_user(userid: int) -> Any:
+def enable_user(user_id: int) -> Any:
     """Enable user account (admin only).
 
     POST: Set is_active to True
     """
-    _user=User.query.get(user_id)
+    user=User.query.get(user_id)
     if not user:
         flash("User not found", "error")
         return redirect(url_for("auth.list_users"))
@@ -524,13 +524,13 @@ def enable_user(userid: int) -> Any:
 
     # Log user enable
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="update",
-        _resource_type="user",
-        _action=f"Enabled user account: {user.username}",
-        _status="success",
-        _resource_id=str(user_id),
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="update",
+        resource_type="user",
+        action=f"Enabled user account: {user.username}",
+        status="success",
+        resource_id=str(user_id),
+        ip_address=request.remote_addr,
     )
 
     flash(f"User {user.username} has been enabled", "success")
@@ -545,7 +545,7 @@ def enable_user(userid: int) -> Any:
 )
 
 
-def delete_user(userid: int) -> Any:
+def delete_user(user_id: int) -> Any:
     """Delete user account (admin only).
 
     POST: Permanently remove user
@@ -554,7 +554,7 @@ def delete_user(userid: int) -> Any:
         flash("Cannot delete your own account", "error")
         return redirect(url_for("auth.list_users"))
 
-    _user=User.query.get(user_id)
+    user=User.query.get(user_id)
     if not user:
         flash("User not found", "error")
         return redirect(url_for("auth.list_users"))
@@ -565,13 +565,13 @@ def delete_user(userid: int) -> Any:
 
     # Log user deletion
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="delete",
-        _resource_type="user",
-        _action=f"Deleted user account: {username}",
-        _status="success",
-        _resource_id=str(user_id),
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="delete",
+        resource_type="user",
+        action=f"Deleted user account: {username}",
+        status="success",
+        resource_id=str(user_id),
+        ip_address=request.remote_addr,
     )
 
     flash(f"User {username} has been deleted", "success")
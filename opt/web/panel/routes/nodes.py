@@ -18,16 +18,19 @@ Integrates with RPC service for backend operations.
 """
 
 from typing import Any
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
-from opt.web.panel.core.rpc_client import get_rpc_client, RPCClientError
-from opt.web.panel.models.node import Node
+from opt.web.panel.core.rpc_client import NODE_FIELDS, get_rpc_client, RPCClientError
+from opt.web.panel.core.streaming import stream_json_array
+from opt.web.panel.models.node import STATUS_FIELDS, Node, get_node_status_cache
 from opt.web.panel.models.audit_log import AuditLog
 from opt.web.panel.extensions import db, limiter
 from opt.web.panel.rbac import require_permission, Resource, Action
 
 # Create blueprint
-_nodes_bp=Blueprint("nodes", __name__, url_prefix="/nodes")
+nodes_bp=Blueprint("nodes", __name__, url_prefix="/nodes")
+
+MAX_STATUS_PAGE_SIZE=1000
 
 
 @nodes_bp.route("/", methods=["GET"])
@@ -39,34 +42,34 @@ def list_nodes() -> Any:
 
     GET: Display paginated node list
     """
-    _page=request.args.get("page", 1, type=int)
+    page=request.args.get("page", 1, type=int)
     per_page=20
-    _status_filter=request.args.get("status", None)
+    status_filter=request.args.get("status", None)
 
     query=Node.query
     if status_filter:
-        _query=query.filter_by(status=status_filter)
+        query=query.filter_by(status=status_filter)
 
-    _pagination=query.order_by(Node.updated_at.desc()).paginate(
-        _page=page, per_page=per_page
+    pagination=query.order_by(Node.updated_at.desc()).paginate(
+        page=page, per_page=per_page
     )
-    _nodes=pagination.items
+    nodes=pagination.items
 
     # Log view
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="read",
-        _resource_type="node",
-        _action="Viewed node list",
-        _status="success",
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="read",
+        resource_type="node",
+        action="Viewed node list",
+        status="success",
+        ip_address=request.remote_addr,
     )
 
     return render_template(
         "nodes/list.html",
-        _nodes=nodes,
-        _pagination=pagination,
-        _status_filter=status_filter,
+        nodes=nodes,
+        pagination=pagination,
+        status_filter=status_filter,
     )
 
 
@@ -74,28 +77,28 @@ def list_nodes() -> Any:
 @login_required    # type: ignore
 @require_permission(Resource.NODE, Action.READ)
 @limiter.limit("100 per minute")    # type: ignore
-def view_node(nodeid: int) -> Any:
+def view_node(node_id: int) -> Any:
     """View node details.
 
     GET: Display node information and status
     """
-    _node=Node.query.get(node_id)
+    node=Node.query.get(node_id)
     if not node:
         flash("Node not found", "error")
         return redirect(url_for("nodes.list_nodes"))
 
     # Get snapshots for this node
-    _snapshots=node.snapshots
+    snapshots=node.snapshots
 
     # Log view
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="read",
-        _resource_type="node",
-        _action=f"Viewed node details: {node.hostname}",
-        _status="success",
-        _resource_id=str(node_id),
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="read",
+        resource_type="node",
+        action=f"Viewed node details: {node.hostname}",
+        status="success",
+        resource_id=str(node_id),
+        ip_address=request.remote_addr,
     )
 
     return render_template("nodes/view.html", node=node, snapshots=snapshots)
@@ -112,13 +115,13 @@ def register_node() -> Any:
     POST: Register node with RPC service
     """
     if request.method == "POST":
-        _hostname=request.form.get("hostname", "").strip().lower()
-        _ip_address=request.form.get("ip_address", "").strip()
-        _cpu_cores=request.form.get("cpu_cores", type=int, default=0)
-        _memory_gb=request.form.get("memory_gb", type=int, default=0)
-        _storage_gb=request.form.get("storage_gb", type=int, default=0)
-        _region=request.form.get("region", "").strip()
-        _rack=request.form.get("rack", "").strip()
+        hostname=request.form.get("hostname", "").strip().lower()
+        ip_address=request.form.get("ip_address", "").strip()
+        cpu_cores=request.form.get("cpu_cores", type=int, default=0)
+        memory_gb=request.form.get("memory_gb", type=int, default=0)
+        storage_gb=request.form.get("storage_gb", type=int, default=0)
+        region=request.form.get("region", "").strip()
+        rack=request.form.get("rack", "").strip()
 
         # Validate input
         errors=[]
@@ -145,60 +148,59 @@ def register_node() -> Any:
 
         try:
         # Register with RPC service
-            _rpc_client=get_rpc_client()
-            _rpc_response=rpc_client.register_node(
-                _hostname=hostname,
-                _ip_address=ip_address,
-                _cpu_cores=cpu_cores,
-                _memory_gb=memory_gb,
-                _storage_gb=storage_gb,
-                _region=region,
-                _rack=rack,
+            rpc_client=get_rpc_client()
+            rpc_response=rpc_client.register_node(
+                hostname=hostname,
+                ip_address=ip_address,
+                cpu_cores=cpu_cores,
+                memory_gb=memory_gb,
+                storage_gb=storage_gb,
+                region=region,
+                rack=rack,
             )
 
             # Save node to database
             node=Node(
-                _node_id=rpc_response.get("node_id"),
-                _hostname=hostname,
-                _ip_address=ip_address,
-                _cpu_cores=cpu_cores,
-                _memory_gb=memory_gb,
-                _storage_gb=storage_gb,
-                _region=region,
-                _rack=rack,
-                _status="online",
+                node_id=rpc_response.get("node_id"),
+                hostname=hostname,
+                ip_address=ip_address,
+                cpu_cores=cpu_cores,
+                memory_gb=memory_gb,
+                storage_gb=storage_gb,
+                region=region,
+                rack=rack,
+                status="online",
             )
             db.session.add(node)
             db.session.commit()
 
             # Log registration
             AuditLog.log_operation(
-                _user_id=current_user.id,
-                _operation="create",
-                _resource_type="node",
-                _action=f"Registered node: {hostname}",
-                _status="success",
-                _resource_id=str(node.id),
-                _rpc_method="RegisterNode",
-                _ip_address=request.remote_addr,
+                user_id=current_user.id,
+                operation="create",
+                resource_type="node",
+                action=f"Registered node: {hostname}",
+                status="success",
+                resource_id=str(node.id),
+                rpc_method="RegisterNode",
+                ip_address=request.remote_addr,
             )
 
             flash(f"Node {hostname} registered successfully", "success")
             return redirect(url_for("nodes.view_node", node_id=node.id))
 
         except RPCClientError as e:
-                current_app.logger.error(f"Failed to send heartbeat to node {node.hostname}: {e}", exc_info=True)
             current_app.logger.error(f"Failed to register node with RPC service: {e}", exc_info=True)
             flash("Failed to register node with RPC service", "error")
             AuditLog.log_operation(
-                _user_id=current_user.id,
-                _operation="create",
-                _resource_type="node",
-                _action=f"Failed to register node: {hostname}",
-                _status="failure",
-                _error_message="RPC registration failed",
-                _rpc_method="RegisterNode",
-                _ip_address=request.remote_addr,
+                user_id=current_user.id,
+                operation="create",
+                resource_type="node",
+                action=f"Failed to register node: {hostname}",
+                status="failure",
+                error_message="RPC registration failed",
+                rpc_method="RegisterNode",
+                ip_address=request.remote_addr,
             )
 
     return render_template("nodes/register.html")
@@ -208,18 +210,18 @@ def register_node() -> Any:
 @login_required    # type: ignore
 @require_permission(Resource.NODE, Action.UPDATE)
 @limiter.limit("60 per minute")    # type: ignore
-def send_heartbeat(nodeid: int) -> Any:
+def send_heartbeat(node_id: int) -> Any:
     """Send node heartbeat to keep it online.
 
     POST: Update node status
     """
-    _node=Node.query.get(node_id)
+    node=Node.query.get(node_id)
     if not node:
         return jsonify({"error": "Node not found"}), 404
 
     try:
     # Send heartbeat to RPC service
-        _rpc_client=get_rpc_client()
+        rpc_client=get_rpc_client()
         rpc_client.heartbeat(node.node_id, {})
 
         # Update node status
@@ -227,29 +229,30 @@ def send_heartbeat(nodeid: int) -> Any:
 
         # Log heartbeat
         AuditLog.log_operation(
-            _user_id=current_user.id,
-            _operation="execute",
-            _resource_type="node",
-            _action=f"Sent heartbeat to node: {node.hostname}",
-            _status="success",
-            _resource_id=str(node_id),
-            _rpc_method="Heartbeat",
-            _ip_address=request.remote_addr,
+            user_id=current_user.id,
+            operation="execute",
+            resource_type="node",
+            action=f"Sent heartbeat to node: {node.hostname}",
+            status="success",
+            resource_id=str(node_id),
+            rpc_method="Heartbeat",
+            ip_address=request.remote_addr,
         )
 
         return jsonify({"success": True, "status": node.status})
 
     except RPCClientError as e:
+        current_app.logger.error(f"Failed to send heartbeat to node {node.hostname}: {e}", exc_info=True)
         flash("Failed to send heartbeat", "error")
         AuditLog.log_operation(
-            _user_id=current_user.id,
-            _operation="execute",
-            _resource_type="node",
-            _action=f"Failed to send heartbeat to node: {node.hostname}",
-            _status="failure",
-            _error_message="Heartbeat RPC failed",
-            _rpc_method="Heartbeat",
-            _ip_address=request.remote_addr,
+            user_id=current_user.id,
+            operation="execute",
+            resource_type="node",
+            action=f"Failed to send heartbeat to node: {node.hostname}",
+            status="failure",
+            error_message="Heartbeat RPC failed",
+            rpc_method="Heartbeat",
+            ip_address=request.remote_addr,
         )
         # Return generic error message to prevent information exposure
         return jsonify({"error": "Failed to send heartbeat. Please check logs for details."}), 500
@@ -259,12 +262,12 @@ def send_heartbeat(nodeid: int) -> Any:
 @login_required    # type: ignore
 @require_permission(Resource.NODE, Action.UPDATE)
 @limiter.limit("20 per minute")    # type: ignore
-def disable_node(nodeid: int) -> Any:
+def disable_node(node_id: int) -> Any:
     """Disable node in cluster.
 
     POST: Mark node as offline
     """
-    _node=Node.query.get(node_id)
+    node=Node.query.get(node_id)
     if not node:
         flash("Node not found", "error")
         return redirect(url_for("nodes.list_nodes"))
@@ -274,13 +277,13 @@ def disable_node(nodeid: int) -> Any:
 
     # Log disable
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="update",
-        _resource_type="node",
-        _action=f"Disabled node: {node.hostname}",
-        _status="success",
-        _resource_id=str(node_id),
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="update",
+        resource_type="node",
+        action=f"Disabled node: {node.hostname}",
+        status="success",
+        resource_id=str(node_id),
+        ip_address=request.remote_addr,
     )
 
     flash(f"Node {node.hostname} has been disabled", "success")
@@ -291,12 +294,12 @@ def disable_node(nodeid: int) -> Any:
 @login_required    # type: ignore
 @require_permission(Resource.NODE, Action.DELETE)
 @limiter.limit("10 per minute")    # type: ignore
-def delete_node(nodeid: int) -> Any:
+def delete_node(node_id: int) -> Any:
     """Delete node from cluster.
 
     POST: Remove node and associated data
     """
-    _node=Node.query.get(node_id)
+    node=Node.query.get(node_id)
     if not node:
         flash("Node not found", "error")
         return redirect(url_for("nodes.list_nodes"))
@@ -307,13 +310,13 @@ def delete_node(nodeid: int) -> Any:
 
     # Log deletion
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="delete",
-        _resource_type="node",
-        _action=f"Deleted node: {hostname}",
-        _status="success",
-        _resource_id=str(node_id),
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="delete",
+        resource_type="node",
+        action=f"Deleted node: {hostname}",
+        status="success",
+        resource_id=str(node_id),
+        ip_address=request.remote_addr,
     )
 
     flash(f"Node {hostname} has been deleted", "success")
@@ -328,6 +331,62 @@ def api_nodes_status() -> Any:
     """API endpoint to get all nodes status.
 
     GET: Return JSON array of node statuses
+
+    Served from the materialized node-status snapshot. Query parameters:
+        fields: Comma-separated keys to include (default all)
+        status: Only nodes with this status
+        limit: Page size (1-1000); switches the body to
+            {"nodes": [...], "next_after": id-or-null}
+        after: Keyset cursor, the next_after of the previous page
+
+    Responses carry an ETag; a matching If-None-Match returns 304.
     """
-    _nodes=Node.query.all()
-    return jsonify([node.to_dict() for node in nodes])
+    fields=None
+    if request.args.get("fields"):
+        fields=[name.strip() for name in request.args["fields"].split(",") if name.strip()]
+        unknown=sorted(set(fields) - set(STATUS_FIELDS))
+        if unknown:
+            return jsonify({"error": f"Unknown fields: {', '.join(unknown)}"}), 400
+    limit=request.args.get("limit", type=int)
+    if limit is not None and not 1 <= limit <= MAX_STATUS_PAGE_SIZE:
+        return jsonify({"error": f"limit must be between 1 and {MAX_STATUS_PAGE_SIZE}"}), 400
+    after=request.args.get("after", type=int)
+
+    snapshot=get_node_status_cache().get()
+    body, etag=snapshot.response(fields, request.args.get("status"), after, limit)
+
+    response=current_app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    response.headers["X-Node-Status-Version"] = str(snapshot.version)
+    return response.make_conditional(request)
+
+
+@nodes_bp.route("/api/cluster", methods=["GET"])
+@login_required    # type: ignore
+@require_permission(Resource.NODE, Action.READ)
+@limiter.limit("30 per minute")    # type: ignore
+def api_cluster_nodes() -> Any:
+    """API endpoint streaming the RPC service's node registry.
+
+    GET: Return JSON array of node summaries, ordered by node ID, written
+    as rows arrive from StreamNodes. Query parameters:
+        status: Only nodes with this status
+        hostname_prefix: Only hostnames starting with this prefix
+        fields: Comma-separated summary fields (default all)
+    """
+    fields=None
+    if request.args.get("fields"):
+        fields=[name.strip() for name in request.args["fields"].split(",") if name.strip()]
+        unknown=sorted(set(fields) - set(NODE_FIELDS))
+        if unknown:
+            return jsonify({"error": f"Unknown fields: {', '.join(unknown)}"}), 400
+
+    return stream_json_array(
+        lambda: get_rpc_client().iter_nodes(
+            status=request.args.get("status"),
+            hostname_prefix=request.args.get("hostname_prefix"),
+            fields=fields,
+        ),
+        (RPCClientError,),
+    )
@@ -18,10 +18,11 @@ Integrates with RPC service for backend storage operations.
 """
 
 from typing import Any
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
 from datetime import datetime, timedelta, timezone
-from opt.web.panel.core.rpc_client import get_rpc_client, RPCClientError
+from opt.web.panel.core.rpc_client import SNAPSHOT_FIELDS, get_rpc_client, RPCClientError
+from opt.web.panel.core.streaming import stream_json_array
 from opt.web.panel.models.snapshot import Snapshot
 from opt.web.panel.models.node import Node
 from opt.web.panel.models.audit_log import AuditLog
@@ -29,7 +30,7 @@ from opt.web.panel.extensions import db, limiter
 from opt.web.panel.rbac import require_permission, Resource, Action
 
 # Create blueprint
-_storage_bp=Blueprint("storage", __name__, url_prefix="/storage")
+storage_bp=Blueprint("storage", __name__, url_prefix="/storage")
 
 
 @storage_bp.route("/snapshots", methods=["GET"])
@@ -41,30 +42,30 @@ def list_snapshots() -> Any:
 
     GET: Display paginated snapshot list
     """
-    _page=request.args.get("page", 1, type=int)
-    _per_page=20
-    _node_id=request.args.get("node_id", None, type=int)
-    _status_filter=request.args.get("status", None)
+    page=request.args.get("page", 1, type=int)
+    per_page=20
+    node_id=request.args.get("node_id", None, type=int)
+    status_filter=request.args.get("status", None)
 
     query=Snapshot.query
     if node_id:
-        _query=query.filter_by(node_id=node_id)
+        query=query.filter_by(node_id=node_id)
     if status_filter:
-        _query=query.filter_by(status=status_filter)
+        query=query.filter_by(status=status_filter)
 
-    _pagination=query.order_by(Snapshot.created_at.desc()).paginate(
-        _page=page, per_page=per_page
+    pagination=query.order_by(Snapshot.created_at.desc()).paginate(
+        page=page, per_page=per_page
     )
-    _snapshots=pagination.items
+    snapshots=pagination.items
 
     # Log view
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="read",
-        _resource_type="snapshot",
-        _action="Viewed snapshot list",
-        _status="success",
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="read",
+        resource_type="snapshot",
+        action="Viewed snapshot list",
+        status="success",
+        ip_address=request.remote_addr,
     )
 
     return render_template(
@@ -76,25 +77,25 @@ def list_snapshots() -> Any:
 @login_required    # type: ignore
 @require_permission(Resource.SNAPSHOT, Action.READ)
 @limiter.limit("100 per minute")    # type: ignore
-def view_snapshot(snapshotid: int) -> Any:
+def view_snapshot(snapshot_id: int) -> Any:
     """View snapshot details.
 
     GET: Display snapshot information and status
     """
-    _snapshot=Snapshot.query.get(snapshot_id)
+    snapshot=Snapshot.query.get(snapshot_id)
     if not snapshot:
         flash("Snapshot not found", "error")
         return redirect(url_for("storage.list_snapshots"))
 
     # Log view
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="read",
-        _resource_type="snapshot",
-        _action=f"Viewed snapshot: {snapshot.name}",
-        _status="success",
-        _resource_id=str(snapshot_id),
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="read",
+        resource_type="snapshot",
+        action=f"Viewed snapshot: {snapshot.name}",
+        status="success",
+        resource_id=str(snapshot_id),
+        ip_address=request.remote_addr,
     )
 
     return render_template("storage/view.html", snapshot=snapshot)
@@ -111,14 +112,14 @@ def create_snapshot() -> Any:
     POST: Create snapshot via RPC service
     """
     # Get list of nodes for selection
-    _nodes=Node.get_healthy_nodes()
+    nodes=Node.get_healthy_nodes()
 
     if request.method == "POST":
-        _node_id=request.form.get("node_id", type=int)
-        _source_volume=request.form.get("source_volume", "").strip()
-        _name=request.form.get("name", "").strip()
-        _retention_days=request.form.get("retention_days", 30, type=int)
-        _description=request.form.get("description", "").strip()
+        node_id=request.form.get("node_id", type=int)
+        source_volume=request.form.get("source_volume", "").strip()
+        name=request.form.get("name", "").strip()
+        retention_days=request.form.get("retention_days", 30, type=int)
+        description=request.form.get("description", "").strip()
 
         # Validate input
         errors=[]
@@ -137,48 +138,48 @@ def create_snapshot() -> Any:
             return redirect(url_for("storage.create_snapshot"))
 
         # Verify node exists
-        _node=Node.query.get(node_id)
+        node=Node.query.get(node_id)
         if not node:
             flash("Selected node not found", "error")
             return redirect(url_for("storage.create_snapshot"))
 
         try:
         # Create snapshot via RPC service
-            _rpc_client=get_rpc_client()
-            _rpc_response=rpc_client.create_snapshot(
-                _node_id=node.node_id,
-                _source_volume=source_volume,
-                _name=name,
-                _retention_days=retention_days,
+            rpc_client=get_rpc_client()
+            rpc_response=rpc_client.create_snapshot(
+                node_id=node.node_id,
+                source_volume=source_volume,
+                name=name,
+                retention_days=retention_days,
             )
 
             # Save snapshot to database
-            _expires_at=datetime.now(timezone.utc) + timedelta(days=retention_days)
+            expires_at=datetime.now(timezone.utc) + timedelta(days=retention_days)
             snapshot=Snapshot(
-                _snapshot_id=rpc_response.get("snapshot_id"),
-                _name=name,
-                _node_id=node_id,
-                _source_volume=source_volume,
-                _description=description,
-                _size_gb=rpc_response.get("size_gb", 0),
-                _status=rpc_response.get("status", "pending"),
-                _retention_days=retention_days,
-                _expires_at=expires_at,
+                snapshot_id=rpc_response.get("snapshot_id"),
+                name=name,
+                node_id=node_id,
+                source_volume=source_volume,
+                description=description,
+                size_gb=rpc_response.get("size_gb", 0),
+                status=rpc_response.get("status", "pending"),
+                retention_days=retention_days,
+                expires_at=expires_at,
             )
             db.session.add(snapshot)
             db.session.commit()
 
             # Log creation
             AuditLog.log_operation(
-                _user_id=current_user.id,
-                _operation="create",
-                _resource_type="snapshot",
-                _action=f"Created snapshot: {name} on {node.hostname}",
-                _status="success",
-                _resource_id=str(snapshot.id),
-                _request_data={"node": node.hostname, "volume": source_volume},
-                _rpc_method="CreateSnapshot",
-                _ip_address=request.remote_addr,
+                user_id=current_user.id,
+                operation="create",
+                resource_type="snapshot",
+                action=f"Created snapshot: {name} on {node.hostname}",
+                status="success",
+                resource_id=str(snapshot.id),
+                request_data={"node": node.hostname, "volume": source_volume},
+                rpc_method="CreateSnapshot",
+                ip_address=request.remote_addr,
             )
 
             flash(f"Snapshot {name} created successfully", "success")
@@ -188,14 +189,14 @@ def create_snapshot() -> Any:
             current_app.logger.error(f"Failed to create snapshot {name}: {e}", exc_info=True)
             flash("Failed to create snapshot", "error")
             AuditLog.log_operation(
-                _user_id=current_user.id,
-                _operation="create",
-                _resource_type="snapshot",
-                _action=f"Failed to create snapshot: {name}",
-                _status="failure",
-                _error_message="Snapshot creation RPC failed",
-                _rpc_method="CreateSnapshot",
-                _ip_address=request.remote_addr,
+                user_id=current_user.id,
+                operation="create",
+                resource_type="snapshot",
+                action=f"Failed to create snapshot: {name}",
+                status="failure",
+                error_message="Snapshot creation RPC failed",
+                rpc_method="CreateSnapshot",
+                ip_address=request.remote_addr,
             )
 
     return render_template("storage/create.html", nodes=nodes)
@@ -205,19 +206,19 @@ def create_snapshot() -> Any:
 @login_required    # type: ignore
 @require_permission(Resource.SNAPSHOT, Action.DELETE)
 @limiter.limit("10 per minute")    # type: ignore
-def delete_snapshot(snapshotid: int) -> Any:
+def delete_snapshot(snapshot_id: int) -> Any:
     """Delete storage snapshot.
 
     POST: Delete snapshot via RPC service
     """
-    _snapshot=Snapshot.query.get(snapshot_id)
+    snapshot=Snapshot.query.get(snapshot_id)
     if not snapshot:
         flash("Snapshot not found", "error")
         return redirect(url_for("storage.list_snapshots"))
 
     try:
     # Delete snapshot via RPC service
-        _rpc_client=get_rpc_client()
+        rpc_client=get_rpc_client()
         rpc_client.delete_snapshot(snapshot.snapshot_id)
 
         # Update status to deleting
@@ -226,14 +227,14 @@ def delete_snapshot(snapshotid: int) -> Any:
 
         # Log deletion
         AuditLog.log_operation(
-            _user_id=current_user.id,
-            _operation="delete",
-            _resource_type="snapshot",
-            _action=f"Deleted snapshot: {snapshot.name}",
-            _status="success",
-            _resource_id=str(snapshot_id),
-            _rpc_method="DeleteSnapshot",
-            _ip_address=request.remote_addr,
+            user_id=current_user.id,
+            operation="delete",
+            resource_type="snapshot",
+            action=f"Deleted snapshot: {snapshot.name}",
+            status="success",
+            resource_id=str(snapshot_id),
+            rpc_method="DeleteSnapshot",
+            ip_address=request.remote_addr,
         )
 
         flash(f"Snapshot {snapshot.name} has been deleted", "success")
@@ -243,14 +244,14 @@ def delete_snapshot(snapshotid: int) -> Any:
         current_app.logger.error(f"Failed to delete snapshot {snapshot.name}: {e}", exc_info=True)
         flash("Failed to delete snapshot", "error")
         AuditLog.log_operation(
-            _user_id=current_user.id,
-            _operation="delete",
-            _resource_type="snapshot",
-            _action=f"Failed to delete snapshot: {snapshot.name}",
-            _status="failure",
-            _error_message="Snapshot deletion RPC failed",
-            _rpc_method="DeleteSnapshot",
-            _ip_address=request.remote_addr,
+            user_id=current_user.id,
+            operation="delete",
+            resource_type="snapshot",
+            action=f"Failed to delete snapshot: {snapshot.name}",
+            status="failure",
+            error_message="Snapshot deletion RPC failed",
+            rpc_method="DeleteSnapshot",
+            ip_address=request.remote_addr,
         )
         return redirect(url_for("storage.list_snapshots"))
 
@@ -264,25 +265,50 @@ def api_snapshots() -> Any:
 
     GET: Return JSON array of snapshots
     """
-    _node_id=request.args.get("node_id", None, type=int)
+    node_id=request.args.get("node_id", None, type=int)
 
     query=Snapshot.query
     if node_id:
-        _query=query.filter_by(node_id=node_id)
+        query=query.filter_by(node_id=node_id)
 
-    _snapshots=query.order_by(Snapshot.created_at.desc()).limit(100).all()
+    snapshots=query.order_by(Snapshot.created_at.desc()).limit(100).all()
     return jsonify([s.to_dict(include_node=True) for s in snapshots])
 
 
+@storage_bp.route("/api/cluster/snapshots", methods=["GET"])
+@login_required    # type: ignore
+@require_permission(Resource.SNAPSHOT, Action.READ)
+@limiter.limit("30 per minute")    # type: ignore
+def api_cluster_snapshots() -> Any:
+    """API endpoint streaming snapshots known to the RPC storage service.
+
+    GET: Return JSON array of snapshot summaries, ordered by snapshot ID,
+    written as rows arrive from StreamSnapshots. Query parameters:
+        pool: Only snapshots in this pool
+        fields: Comma-separated summary fields (default all)
+    """
+    fields=None
+    if request.args.get("fields"):
+        fields=[name.strip() for name in request.args["fields"].split(",") if name.strip()]
+        unknown=sorted(set(fields) - set(SNAPSHOT_FIELDS))
+        if unknown:
+            return jsonify({"error": f"Unknown fields: {', '.join(unknown)}"}), 400
+
+    return stream_json_array(
+        lambda: get_rpc_client().iter_snapshots(pool=request.args.get("pool"), fields=fields),
+        (RPCClientError,),
+    )
+
+
 @storage_bp.route("/api/snapshots/<int:snapshot_id>/progress", methods=["GET"])
 @login_required    # type: ignore
 @require_permission(Resource.SNAPSHOT, Action.READ)
-def api_snapshot_progress(snapshotid: int) -> Any:
+def api_snapshot_progress(snapshot_id: int) -> Any:
     """API endpoint to get snapshot creation progress.
 
     GET: Return snapshot progress and status
     """
-    _snapshot=Snapshot.query.get(snapshot_id)
+    snapshot=Snapshot.query.get(snapshot_id)
     if not snapshot:
         return jsonify({"error": "Snapshot not found"}), 404
 
@@ -304,7 +330,7 @@ def cleanup_expired() -> Any:
 
     POST: Delete all snapshots past retention date
     """
-    _expired=Snapshot.get_expired_snapshots()
+    expired=Snapshot.get_expired_snapshots()
 
     if not expired:
         flash("No expired snapshots to clean up", "info")
@@ -313,7 +339,7 @@ def cleanup_expired() -> Any:
     deleted_count=0
     for snapshot in expired:
         try:
-            _rpc_client=get_rpc_client()
+            rpc_client=get_rpc_client()
             rpc_client.delete_snapshot(snapshot.snapshot_id)
             snapshot.status="deleting"
             deleted_count += 1
@@ -327,12 +353,12 @@ def cleanup_expired() -> Any:
 
     # Log cleanup
     AuditLog.log_operation(
-        _user_id=current_user.id,
-        _operation="execute",
-        _resource_type="snapshot",
-        _action=f"Cleaned up {deleted_count} expired snapshots",
-        _status="success",
-        _ip_address=request.remote_addr,
+        user_id=current_user.id,
+        operation="execute",
+        resource_type="snapshot",
+        action=f"Cleaned up {deleted_count} expired snapshots",
+        status="success",
+        ip_address=request.remote_addr,
     )
 
     flash(f"Cleanup initiated for {deleted_count} expired snapshots", "success")
@@ -115,6 +115,9 @@ Features:
 - Message acknowledgment
 - Namespace-level authentication checks on connect
 - Per-namespace permission verification
+- Node metrics streaming: initial snapshot, then per-field deltas batched
+  on a fixed tick, JSON or msgpack, with sequence-based resync
+  (see metrics_stream)
 """
 
 import asyncio
@@ -138,20 +141,55 @@ try:
 except ImportError:
     # Placeholder for when flask-socketio is not installed
     SocketIO=None
-    _emit=None
-    _join_room=None
-    _leave_room=None
-    _rooms=None
-    _disconnect=None
-    _request=None
-
+    emit=None
+    join_room=None
+    leave_room=None
+    rooms=None
+    disconnect=None
+    request=None
+
+from opt.web.panel.metrics_stream import (
+    MetricsStream,
+    check_format,
+    encode,
+    publish_tick,
+    room_name,
+)
 from opt.web.panel.websocket_events import (
     EventFactory,
     WebSocketConnectionManager,
     WebSocketEventBus,
 )
 
-_logger=logging.getLogger(__name__)
+logger=logging.getLogger(__name__)
+
+
+def _parse_stream_request(data: Any) -> Tuple[str, Optional[List[str]], Optional[int]]:
+    """Validate a metrics stream payload.
+
+    Args:
+        data: Client payload (None means all defaults)
+
+    Returns:
+        (format, node_ids or None for all, last_seq)
+
+    Raises:
+        ValueError: Malformed payload or unusable format
+    """
+    data=data or {}
+    if not isinstance(data, dict):
+        raise ValueError("payload must be an object")
+    fmt=data.get("format", "json")
+    check_format(fmt)
+    node_ids=data.get("node_ids")
+    if node_ids is not None and not (
+        isinstance(node_ids, list) and all(isinstance(node_id, str) for node_id in node_ids)
+    ):
+        raise ValueError("node_ids must be a list of node IDs")
+    last_seq=data.get("last_seq")
+    if last_seq is not None and (not isinstance(last_seq, int) or isinstance(last_seq, bool)):
+        raise ValueError("last_seq must be an integer")
+    return fmt, node_ids, last_seq
 
 
 class NamespaceAuthenticationRequired(Exception):
@@ -219,13 +257,13 @@ class WebSocketAuthenticationManager:
             return False, "Authentication required"
 
         # Verify token
-        _token=auth.get("token")
+        token=auth.get("token")
         if not token:
             return False, "No authentication token provided"
 
         try:
         # Decode and validate JWT
-            _payload=jwt.decode(token, self.secret, algorithms=[self.JWT_ALGORITHM])
+            payload=jwt.decode(token, self.secret, algorithms=[self.JWT_ALGORITHM])
         except jwt.ExpiredSignatureError:
             return False, "Authentication token expired"
         except jwt.InvalidTokenError as e:
@@ -233,8 +271,8 @@ class WebSocketAuthenticationManager:
             return False, "Invalid authentication token"
 
         # Extract user info
-        _user_id=payload.get("user_id")
-        _user_permissions=payload.get("permissions", [])
+        user_id=payload.get("user_id")
+        user_permissions=payload.get("permissions", [])
 
         if not user_id:
             return False, "Token missing user_id"
@@ -284,7 +322,7 @@ class WebSocketAuthenticationManager:
             JWT token string
         """
         expiry=expiry_seconds or self.JWT_EXPIRY_SECONDS
-        _now=time.time()
+        now=time.time()
 
         payload={
             "user_id": user_id,
@@ -293,12 +331,12 @@ class WebSocketAuthenticationManager:
             "exp": now + expiry,
         }
 
-        _token=jwt.encode(payload, self.secret, algorithm=self.JWT_ALGORITHM)
+        token=jwt.encode(payload, self.secret, algorithm=self.JWT_ALGORITHM)
 
         logger.debug(f"Created session token for user {user_id}")
         return token
 
-    def revoke_session(self, userid: str) -> None:
+    def revoke_session(self, user_id: str) -> None:
         """
         Revoke an active session.
 
@@ -320,7 +358,7 @@ class SocketIOConfig:
 
     async_mode: str="threading"    # threading, eventlet, gevent
     cors_allowed_origins: List[str] = field(
-        _default_factory=lambda: ["http://localhost:3000", "http://localhost:5000"]
+        default_factory=lambda: ["http://localhost:3000", "http://localhost:5000"]
     )
     ping_timeout: int=10
     ping_interval: int=5
@@ -328,8 +366,12 @@ class SocketIOConfig:
     socketio_logger: bool=False
     max_http_buffer_size: int=1000000
     heartbeat_interval: int=30
+    metrics_stream_interval: float=0.25    # Delta tick, seconds
+    metrics_stream_history: int=240    # Delta frames kept for resync
+    metrics_stream_min_change: float=0.0
+    metrics_legacy_events: bool=True    # Also emit node_metrics_update per update
     auth_manager: Optional[WebSocketAuthenticationManager] = field(
-        _default_factory=WebSocketAuthenticationManager
+        default_factory=WebSocketAuthenticationManager
     )
 
 
@@ -377,8 +419,13 @@ class NodeNamespace(SocketIONamespace):
         self,
         connection_manager: WebSocketConnectionManager,
         event_bus: WebSocketEventBus,
+        metrics_stream: Optional[MetricsStream] = None,
+        legacy_metrics_events: bool=True,
     ):
         super().__init__("/nodes", connection_manager, event_bus)
+        self.metrics_stream=metrics_stream or MetricsStream()
+        self.legacy_metrics_events=legacy_metrics_events
+        self._stream_running=False
 
     def register_handlers(self, socketio: Any) -> None:
         """Register node namespace handlers."""
@@ -390,8 +437,8 @@ class NodeNamespace(SocketIONamespace):
                 disconnect()
                 return False
 
-            _client_id=f"node_client_{id(auth)}"
-            _user_id=auth.get("user_id", "anonymous") if auth else "anonymous"
+            client_id=f"node_client_{id(auth)}"
+            user_id=auth.get("user_id", "anonymous") if auth else "anonymous"
             # permissions = auth.get("permissions", [])
 
             self.clients[client_id] = {
@@ -406,7 +453,7 @@ class NodeNamespace(SocketIONamespace):
         @socketio.on("subscribe_node", namespace=self.namespace)    # type: ignore
         def handle_subscribe_node(data: Dict[str, Any]) -> Dict[str, Any]:
             """Subscribe to node updates."""
-            _node_id=data.get("node_id")
+            node_id=data.get("node_id")
             room=f"node:{node_id}"
 
             join_room(room)
@@ -417,7 +464,7 @@ class NodeNamespace(SocketIONamespace):
         @socketio.on("unsubscribe_node", namespace=self.namespace)    # type: ignore
         def handle_unsubscribe_node(data: Dict[str, Any]) -> Dict[str, Any]:
             """Unsubscribe from node updates."""
-            _node_id=data.get("node_id")
+            node_id=data.get("node_id")
             room=f"node:{node_id}"
 
             leave_room(room)
@@ -428,7 +475,7 @@ class NodeNamespace(SocketIONamespace):
         @socketio.on("subscribe_metrics", namespace=self.namespace)    # type: ignore
         def handle_subscribe_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
             """Subscribe to node metrics."""
-            _node_id=data.get("node_id")
+            node_id=data.get("node_id")
             room=f"node_metrics:{node_id}"
 
             join_room(room)
@@ -439,7 +486,7 @@ class NodeNamespace(SocketIONamespace):
         @socketio.on("unsubscribe_metrics", namespace=self.namespace)    # type: ignore
         def handle_unsubscribe_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
             """Unsubscribe from node metrics."""
-            _node_id=data.get("node_id")
+            node_id=data.get("node_id")
             room=f"node_metrics:{node_id}"
 
             leave_room(room)
@@ -447,10 +494,49 @@ class NodeNamespace(SocketIONamespace):
 
             return {"status": "unsubscribed_metrics", "node_id": node_id}
 
+        @socketio.on("subscribe_metrics_stream", namespace=self.namespace)    # type: ignore
+        def handle_subscribe_metrics_stream(data: Optional[Dict[str, Any]]) -> Any:
+            """Join the delta stream; the ack carries the initial snapshot.
+
+            data: {"node_ids": [...] (default all), "format": "json"|"msgpack",
+                   "last_seq": int (reconnecting clients get deltas instead)}
+            """
+            try:
+                fmt, node_ids, last_seq=_parse_stream_request(data)
+            except ValueError as e:
+                return {"status": "error", "error": str(e)}
+            # Resubscribing replaces the previous subscription and its rooms
+            self._leave_metrics_stream(request.sid)
+            channels=self.metrics_stream.add_subscriber(request.sid, node_ids, fmt)
+            for channel in channels:
+                join_room(room_name(fmt, channel))
+
+            if last_seq is None:
+                message=self.metrics_stream.snapshot(node_ids)
+            else:
+                message=self.metrics_stream.since(last_seq, node_ids)
+            return encode(message, fmt)
+
+        @socketio.on("resync_metrics", namespace=self.namespace)    # type: ignore
+        def handle_resync_metrics(data: Optional[Dict[str, Any]] = None) -> Any:
+            """Catch up from last_seq after a gap (delta, or snapshot if too old)."""
+            try:
+                fmt, node_ids, last_seq=_parse_stream_request(data)
+            except ValueError as e:
+                return {"status": "error", "error": str(e)}
+            message=self.metrics_stream.since(-1 if last_seq is None else last_seq, node_ids)
+            return encode(message, fmt)
+
+        @socketio.on("unsubscribe_metrics_stream", namespace=self.namespace)    # type: ignore
+        def handle_unsubscribe_metrics_stream(data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            """Leave the delta stream."""
+            self._leave_metrics_stream(request.sid)
+            return {"status": "unsubscribed_metrics_stream"}
+
         @socketio.on("get_node_status", namespace=self.namespace)    # type: ignore
         def handle_get_node_status(data: Dict[str, Any]) -> Dict[str, Any]:
             """Get current node status."""
-            _node_id=data.get("node_id")
+            node_id=data.get("node_id")
 
             # In production, fetch from database/cache
             status={
@@ -465,9 +551,10 @@ class NodeNamespace(SocketIONamespace):
         @socketio.on("disconnect", namespace=self.namespace)    # type: ignore
         def handle_disconnect() -> None:
             """Handle client disconnection."""
+            self.metrics_stream.remove_subscriber(request.sid)
             logger.info("Client disconnected from /nodes")
 
-    def broadcast_node_status(self, nodeid: str, status: str) -> None:
+    def broadcast_node_status(self, node_id: str, status: str) -> None:
         """
         Broadcast node status update.
 
@@ -476,17 +563,17 @@ class NodeNamespace(SocketIONamespace):
             status: Node status
         """
         room=f"node:{node_id}"
-        _event=EventFactory.node_status_event(node_id, status)
+        event=EventFactory.node_status_event(node_id, status)
 
         if emit:
             emit(
                 "node_status_update",
                 event.to_json(),
-                _namespace=self.namespace,
-                _room=room,
+                namespace=self.namespace,
+                room=room,
             )
 
-    def broadcast_node_metrics(self, nodeid: str, metrics: Dict[str, Any]) -> None:
+    def broadcast_node_metrics(self, node_id: str, metrics: Dict[str, Any]) -> None:
         """
         Broadcast node metrics update.
 
@@ -494,17 +581,55 @@ class NodeNamespace(SocketIONamespace):
             node_id: Node ID
             metrics: Node metrics
         """
+        self.metrics_stream.update(node_id, metrics)
+        if not self.legacy_metrics_events:
+            return
+
         room=f"node_metrics:{node_id}"
-        _event=EventFactory.node_metrics_event(node_id, metrics)
+        event=EventFactory.node_metrics_event(node_id, metrics)
 
         if emit:
             emit(
                 "node_metrics_update",
                 event.to_json(),
-                _namespace=self.namespace,
-                _room=room,
+                namespace=self.namespace,
+                room=room,
             )
 
+    def _leave_metrics_stream(self, sid: str) -> None:
+        subscription=self.metrics_stream.remove_subscriber(sid)
+        if subscription is not None:
+            fmt, channels=subscription
+            for channel in channels:
+                leave_room(room_name(fmt, channel))
+
+    def start_metrics_stream(self, socketio: Any) -> None:
+        """Emit a metrics_delta frame to every stream room each tick."""
+        if self._stream_running:
+            return
+        self._stream_running=True
+
+        def emit_frame(room: str, payload: Any) -> None:
+            socketio.emit("metrics_delta", payload, namespace=self.namespace, room=room)
+
+        def run() -> None:
+            interval=self.metrics_stream.interval
+            next_tick=time.monotonic() + interval
+            while self._stream_running:
+                try:
+                    publish_tick(self.metrics_stream, emit_frame)
+                except Exception as e:
+                    logger.error(f"Metrics stream tick failed: {e}")
+                next_tick += interval
+                socketio.sleep(max(0.0, next_tick - time.monotonic()))
+
+        socketio.start_background_task(run)
+        logger.info(f"Metrics stream started ({self.metrics_stream.interval * 1000:.0f} ms tick)")
+
+    def stop_metrics_stream(self) -> None:
+        """Stop the tick task after its current iteration."""
+        self._stream_running=False
+
     @staticmethod
     def _verify_auth(auth: Optional[Dict[str, Any]]) -> bool:
         """
@@ -520,7 +645,7 @@ class NodeNamespace(SocketIONamespace):
             logger.warning("WebSocket connection attempt without authentication")
             return False
 
-        _token=auth.get("token")
+        token=auth.get("token")
         if not token:
             logger.warning("WebSocket connection attempt without token")
             return False
@@ -530,7 +655,7 @@ class NodeNamespace(SocketIONamespace):
             jwt.decode(
                 token,
                 WebSocketAuthenticationManager.JWT_SECRET,
-                _algorithms=[WebSocketAuthenticationManager.JWT_ALGORITHM],
+                algorithms=[WebSocketAuthenticationManager.JWT_ALGORITHM],
             )
             return True
         except jwt.ExpiredSignatureError:
@@ -568,7 +693,7 @@ class JobNamespace(SocketIONamespace):
         @socketio.on("subscribe_job", namespace=self.namespace)    # type: ignore
         def handle_subscribe_job(data: Dict[str, Any]) -> Dict[str, Any]:
             """Subscribe to job progress."""
-            _job_id=data.get("job_id")
+            job_id=data.get("job_id")
             room=f"job:{job_id}"
 
             join_room(room)
@@ -579,7 +704,7 @@ class JobNamespace(SocketIONamespace):
         @socketio.on("unsubscribe_job", namespace=self.namespace)    # type: ignore
         def handle_unsubscribe_job(data: Dict[str, Any]) -> Dict[str, Any]:
             """Unsubscribe from job progress."""
-            _job_id=data.get("job_id")
+            job_id=data.get("job_id")
             room=f"job:{job_id}"
 
             leave_room(room)
@@ -590,7 +715,7 @@ class JobNamespace(SocketIONamespace):
         @socketio.on("get_job_status", namespace=self.namespace)    # type: ignore
         def handle_get_job_status(data: Dict[str, Any]) -> Dict[str, Any]:
             """Get current job status."""
-            _job_id=data.get("job_id")
+            job_id=data.get("job_id")
 
             # In production, fetch from database/cache
             status={
@@ -607,7 +732,7 @@ class JobNamespace(SocketIONamespace):
             """Handle client disconnection."""
             logger.info("Client disconnected from /jobs")
 
-    def broadcast_job_progress(self, jobid: str, progress: int, status: str) -> None:
+    def broadcast_job_progress(self, job_id: str, progress: int, status: str) -> None:
         """
         Broadcast job progress update.
 
@@ -617,14 +742,14 @@ class JobNamespace(SocketIONamespace):
             status: Job status
         """
         room=f"job:{job_id}"
-        _event=EventFactory.job_progress_event(job_id, progress, status)
+        event=EventFactory.job_progress_event(job_id, progress, status)
 
         if emit:
             emit(
                 "job_progress_update",
                 event.to_json(),
-                _namespace=self.namespace,
-                _room=room,
+                namespace=self.namespace,
+                room=room,
             )
 
     @staticmethod
@@ -633,7 +758,7 @@ class JobNamespace(SocketIONamespace):
         if auth is None:
             return False
 
-        _token=auth.get("token")
+        token=auth.get("token")
         return token is not None
 
 
@@ -663,7 +788,7 @@ class AlertNamespace(SocketIONamespace):
         @socketio.on("subscribe_alerts", namespace=self.namespace)    # type: ignore
         def handle_subscribe_alerts(data: Dict[str, Any]) -> Dict[str, Any]:
             """Subscribe to cluster alerts."""
-            _severity=data.get("severity", "warning")
+            severity=data.get("severity", "warning")
             room=f"alerts:{severity}"
 
             join_room(room)
@@ -674,7 +799,7 @@ class AlertNamespace(SocketIONamespace):
         @socketio.on("acknowledge_alert", namespace=self.namespace)    # type: ignore
         def handle_acknowledge_alert(data: Dict[str, Any]) -> Dict[str, Any]:
             """Acknowledge alert."""
-            _alert_id=data.get("alert_id")
+            alert_id=data.get("alert_id")
             logger.debug(f"Alert {alert_id} acknowledged")
 
             return {"status": "acknowledged", "alert_id": alert_id}
@@ -696,14 +821,14 @@ class AlertNamespace(SocketIONamespace):
             severity: Severity level (info, warning, error, critical)
         """
         room=f"alerts:{severity}"
-        _event=EventFactory.alert_event(alert_type, message, severity)
+        event=EventFactory.alert_event(alert_type, message, severity)
 
         if emit:
             emit(
                 "alert",
                 event.to_json(),
-                _namespace=self.namespace,
-                _room=room,
+                namespace=self.namespace,
+                room=room,
             )
 
     @staticmethod
@@ -712,7 +837,7 @@ class AlertNamespace(SocketIONamespace):
         if auth is None:
             return False
 
-        _token=auth.get("token")
+        token=auth.get("token")
         return token is not None
 
 
@@ -736,7 +861,7 @@ class NotificationNamespace(SocketIONamespace):
                 disconnect()
                 return False
 
-            _user_id=auth.get("user_id") if auth else None
+            user_id=auth.get("user_id") if auth else None
             if user_id:
                 join_room(f"user:{user_id}")
                 logger.info(f"User {user_id} connected to /notifications")
@@ -745,8 +870,8 @@ class NotificationNamespace(SocketIONamespace):
         @socketio.on("send_message", namespace=self.namespace)    # type: ignore
         def handle_send_message(data: Dict[str, Any]) -> Dict[str, Any]:
             """Handle chat message."""
-            _user_id=data.get("user_id")    # Target user
-            _message=data.get("message")
+            user_id=data.get("user_id")    # Target user
+            message=data.get("message")
 
             if user_id and message:
             # In a real app, we would validate permissions and persist the message
@@ -778,8 +903,8 @@ class NotificationNamespace(SocketIONamespace):
                     "level": level,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 },
-                _namespace=self.namespace,
-                _room=f"user:{user_id}",
+                namespace=self.namespace,
+                room=f"user:{user_id}",
             )
 
     @staticmethod
@@ -788,7 +913,7 @@ class NotificationNamespace(SocketIONamespace):
         if auth is None:
             return False
 
-        _token=auth.get("token")
+        token=auth.get("token")
         return token is not None
 
 
@@ -827,12 +952,12 @@ class SocketIOServer:
 
         self.socketio=SocketIO(
             app,
-            _async_mode=self.config.async_mode,
-            _cors_allowed_origins=self.config.cors_allowed_origins,
-            _ping_timeout=self.config.ping_timeout,
-            _ping_interval=self.config.ping_interval,
-            _engineio_logger=self.config.engineio_logger,
-            _socketio_logger=self.config.socketio_logger,
+            async_mode=self.config.async_mode,
+            cors_allowed_origins=self.config.cors_allowed_origins,
+            ping_timeout=self.config.ping_timeout,
+            ping_interval=self.config.ping_interval,
+            engineio_logger=self.config.engineio_logger,
+            socketio_logger=self.config.socketio_logger,
         )
 
         # Register namespaces
@@ -840,10 +965,19 @@ class SocketIOServer:
 
     def _register_namespaces(self) -> None:
         """Register all namespaces."""
-        _node_ns=NodeNamespace(self.connection_manager, self.event_bus)
-        _job_ns=JobNamespace(self.connection_manager, self.event_bus)
-        _alert_ns=AlertNamespace(self.connection_manager, self.event_bus)
-        _notification_ns=NotificationNamespace(self.connection_manager, self.event_bus)
+        node_ns=NodeNamespace(
+            self.connection_manager,
+            self.event_bus,
+            metrics_stream=MetricsStream(
+                interval=self.config.metrics_stream_interval,
+                history_size=self.config.metrics_stream_history,
+                min_change=self.config.metrics_stream_min_change,
+            ),
+            legacy_metrics_events=self.config.metrics_legacy_events,
+        )
+        job_ns=JobNamespace(self.connection_manager, self.event_bus)
+        alert_ns=AlertNamespace(self.connection_manager, self.event_bus)
+        notification_ns=NotificationNamespace(self.connection_manager, self.event_bus)
 
         self.namespaces["/nodes"] = node_ns
         self.namespaces["/jobs"] = job_ns
@@ -855,24 +989,25 @@ class SocketIOServer:
             job_ns.register_handlers(self.socketio)
             alert_ns.register_handlers(self.socketio)
             notification_ns.register_handlers(self.socketio)
+            node_ns.start_metrics_stream(self.socketio)
 
             logger.info("Registered namespaces: /nodes, /jobs, /alerts, /notifications")
 
-    def emit_node_status(self, nodeid: str, status: str) -> None:
+    def emit_node_status(self, node_id: str, status: str) -> None:
         """Emit node status update."""
-        _node_ns=self.namespaces.get("/nodes")
+        node_ns=self.namespaces.get("/nodes")
         if node_ns:
             node_ns.broadcast_node_status(node_id, status)
 
-    def emit_node_metrics(self, nodeid: str, metrics: Dict[str, Any]) -> None:
+    def emit_node_metrics(self, node_id: str, metrics: Dict[str, Any]) -> None:
         """Emit node metrics update."""
-        _node_ns=self.namespaces.get("/nodes")
+        node_ns=self.namespaces.get("/nodes")
         if node_ns:
             node_ns.broadcast_node_metrics(node_id, metrics)
 
-    def emit_job_progress(self, jobid: str, progress: int, status: str) -> None:
+    def emit_job_progress(self, job_id: str, progress: int, status: str) -> None:
         """Emit job progress update."""
-        _job_ns=self.namespaces.get("/jobs")
+        job_ns=self.namespaces.get("/jobs")
         if job_ns:
             job_ns.broadcast_job_progress(job_id, progress, status)
 
@@ -880,7 +1015,7 @@ class SocketIOServer:
         self, alert_type: str, message: str, severity: str="warning"
     ) -> None:
         """Emit alert."""
-        _alert_ns=self.namespaces.get("/alerts")
+        alert_ns=self.namespaces.get("/alerts")
         if alert_ns:
             alert_ns.broadcast_alert(alert_type, message, severity)
 
@@ -888,7 +1023,7 @@ class SocketIOServer:
         """Send periodic heartbeat to all connected clients."""
         while True:
             try:
-                _event=EventFactory.heartbeat_event()
+                event=EventFactory.heartbeat_event()
                 await self.event_bus.publish(event)
                 await asyncio.sleep(self.config.heartbeat_interval)
             except Exception as e:
@@ -901,5 +1036,11 @@ class SocketIOServer:
             "connected_clients": len(self.connection_manager.connections),
             "subscriptions": len(self.event_bus.subscriptions),
             "event_history_size": len(self.event_bus.event_history),
+            "event_bus": self.event_bus.get_stats(),
+            "metrics_stream": (
+                self.namespaces["/nodes"].metrics_stream.get_stats()
+                if "/nodes" in self.namespaces
+                else None
+            ),
             "namespaces": list(self.namespaces.keys()),
         }
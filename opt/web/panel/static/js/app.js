@@ -603,7 +603,7 @@ function getCsrfToken() {
  */
 async function refreshNodeStatus() {
     try {
-        const response = await apiCall('/nodes/api/status');
+        const response = await apiCall('/nodes/api/status?fields=node_id,status');
         updateNodeStatusUI(response);
     } catch (error) {
         console.error('Failed to refresh node status:', error);
@@ -114,17 +114,22 @@ Features:
 - Client subscription management
 - Automatic reconnection support
 - Message queuing
+- Indexed fan-out: publish only visits clients subscribed to the event's
+  type and resource, with permissions resolved at subscribe time
+- Events are serialized to JSON once, however many clients receive them
+- Superseded metric events are coalesced in backed-up client queues
 """
 
 import asyncio
+from collections import deque
 from datetime import datetime, timezone
 import json
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
 
-_logger=logging.getLogger(__name__)
+logger=logging.getLogger(__name__)
 
 
 class EventType(Enum):
@@ -142,6 +147,13 @@ class EventType(Enum):
     HEARTBEAT="heartbeat"
 
 
+# Data keys identifying the resource an event is about, in lookup order
+RESOURCE_KEYS=("node_id", "job_id", "pool_id")
+
+# Event types where a newer event for the same resource replaces a queued one
+COALESCED_EVENT_TYPES=frozenset({EventType.NODE_METRICS.value, EventType.STORAGE_METRIC.value})
+
+
 @dataclass
 class WebSocketEvent:
     """WebSocket event message."""
@@ -153,18 +165,42 @@ class WebSocketEvent:
     severity: str="info"    # info, warning, error, critical
 
     def to_json(self) -> str:
-        """Convert event to JSON."""
-        return json.dumps(asdict(self))
+        """Convert event to JSON.
+
+        The encoding is cached: events must not be modified once published.
+        """
+        encoded: Optional[str] = self.__dict__.get("_json")
+        if encoded is None:
+            encoded=json.dumps(
+                {
+                    "event_type": self.event_type,
+                    "timestamp": self.timestamp,
+                    "data": self.data,
+                    "source": self.source,
+                    "severity": self.severity,
+                }
+            )
+            self.__dict__["_json"] = encoded
+        return encoded
+
+    @property
+    def resource_id(self) -> Optional[str]:
+        """Node, job or pool the event refers to, if any."""
+        for key in RESOURCE_KEYS:
+            value=self.data.get(key)
+            if value is not None:
+                return str(value)
+        return None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "WebSocketEvent":
         """Create event from dictionary."""
         return cls(
-            _event_type=data.get("event_type", "unknown"),
-            _timestamp=data.get("timestamp", datetime.now(timezone.utc).isoformat()),
-            _data=data.get("data", {}),
-            _source=data.get("source", "system"),
-            _severity=data.get("severity", "info"),
+            event_type=data.get("event_type", "unknown"),
+            timestamp=data.get("timestamp", datetime.now(timezone.utc).isoformat()),
+            data=data.get("data", {}),
+            source=data.get("source", "system"),
+            severity=data.get("severity", "info"),
         )
 
 
@@ -177,6 +213,7 @@ class ClientSubscription:
     user_id: str
     permissions: Set[str]    # RBAC permissions
     subscribed_at: Optional[datetime] = None
+    resource_ids: Optional[Set[str]] = None    # None=all resources
 
     def __post_init__(self) -> None:
         if self.subscribed_at is None:
@@ -197,24 +234,119 @@ class ClientSubscription:
         ):
             return False
 
+        resource_id=event.resource_id
+        if (
+            self.resource_ids is not None
+            and resource_id is not None
+            and resource_id not in self.resource_ids
+        ):
+            return False
+
         return True
 
+    def allowed_event_types(self) -> Set[str]:
+        """Subscribed event types the client has permission to view."""
+        if "view:*" in self.permissions:
+            return set(self.event_types)
+        return {t for t in self.event_types if f"view:{t}" in self.permissions}
+
+
+class ClientMessageQueue:
+    """
+    Bounded per-client event queue with coalescing.
+
+    While a metric event (COALESCED_EVENT_TYPES) is still queued, a newer
+    event for the same type and resource replaces it in place instead of
+    being appended, so a slow client gets the latest values rather than a
+    growing backlog. Other events are delivered in order; when the queue
+    is full new events are dropped and counted.
+    """
+
+    def __init__(self, maxsize: int=1000) -> None:
+        self.maxsize=maxsize
+        self._slots: Deque[List[Any]] = deque()    # [event, coalesce key]
+        self._pending: Dict[Tuple[str, Optional[str]], List[Any]] = {}
+        self._ready=asyncio.Event()
+        self.delivered=0
+        self.coalesced=0
+        self.dropped=0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def put_nowait(self, event: WebSocketEvent) -> bool:
+        """Queue or coalesce an event; False if it was dropped."""
+        key=None
+        if event.event_type in COALESCED_EVENT_TYPES:
+            key=(event.event_type, event.resource_id)
+            slot=self._pending.get(key)
+            if slot is not None:
+                slot[0] = event
+                self.coalesced += 1
+                return True
+        if self.maxsize and len(self._slots) >= self.maxsize:
+            self.dropped += 1
+            return False
+        slot=[event, key]
+        self._slots.append(slot)
+        if key is not None:
+            self._pending[key] = slot
+        self._ready.set()
+        return True
+
+    def get_nowait(self) -> Optional[WebSocketEvent]:
+        """Next event, or None if the queue is empty."""
+        if not self._slots:
+            return None
+        event, key=self._slots.popleft()
+        if key is not None:
+            del self._pending[key]
+        if not self._slots:
+            self._ready.clear()
+        self.delivered += 1
+        return event    # type: ignore[no-any-return]
+
+    async def get(self) -> WebSocketEvent:
+        """Wait for the next event."""
+        while True:
+            event=self.get_nowait()
+            if event is not None:
+                return event
+            await self._ready.wait()
+
 
 class WebSocketEventBus:
     """
     Manages WebSocket event distribution.
 
     Handles client subscriptions, event filtering, and message delivery.
+
+    Subscriptions are indexed by event type and resource id (None for
+    clients watching every resource), so publishing an event only touches
+    the clients that will receive it. Index updates and fan-out contain no
+    awaits, so they run atomically on the event loop.
     """
 
-    def __init__(self) -> None:
-        """Initialize event bus."""
+    def __init__(self, max_history_size: int=1000, max_queue_size: int=1000) -> None:
+        """
+        Initialize event bus.
+
+        Args:
+            max_history_size: Events kept in event_history
+            max_queue_size: Per-client queue bound (0=unbounded)
+        """
         self.subscriptions: Dict[str, ClientSubscription] = {}
         self.event_handlers: Dict[str, List[Callable[..., Any]]] = {}
-        self.message_queues: Dict[str, asyncio.Queue[WebSocketEvent]] = {}
+        self.message_queues: Dict[str, ClientMessageQueue] = {}
         self.lock=asyncio.Lock()
-        self.event_history: List[WebSocketEvent] = []
-        self.max_history_size=1000
+        self.max_history_size=max_history_size
+        self.max_queue_size=max_queue_size
+        self.event_history: Deque[WebSocketEvent] = deque(maxlen=max_history_size)
+        # event type -> resource id (None=all resources) -> client ids
+        self._index: Dict[str, Dict[Optional[str], Set[str]]] = {}
+        # event type -> every subscribed client, for events without a resource
+        self._type_members: Dict[str, Set[str]] = {}
+        self.events_published=0
 
     async def subscribe(
         self,
@@ -222,32 +354,42 @@ class WebSocketEventBus:
         event_types: List[str],
         user_id: str,
         permissions: List[str],
+        resource_ids: Optional[Iterable[str]] = None,
     ) -> ClientSubscription:
         """
         Subscribe client to events.
 
+        Subscribing again replaces the client's previous subscription.
+
         Args:
             client_id: Unique client identifier
             event_types: List of event types to subscribe to
             user_id: User ID (for RBAC)
             permissions: User permissions
+            resource_ids: Only receive events for these nodes/jobs/pools
+                (None=all; events without a resource always match)
 
         Returns:
             ClientSubscription instance
         """
         async with self.lock:
             subscription=ClientSubscription(
-                _client_id=client_id,
-                _event_types=set(event_types),
-                _user_id=user_id,
-                _permissions=set(permissions),
+                client_id=client_id,
+                event_types=set(event_types),
+                user_id=user_id,
+                permissions=set(permissions),
+                resource_ids=set(resource_ids) if resource_ids is not None else None,
             )
 
+            previous=self.subscriptions.get(client_id)
+            if previous is not None:
+                self._unindex(previous)
             self.subscriptions[client_id] = subscription
+            self._index_subscription(subscription)
 
             # Create message queue for client
             if client_id not in self.message_queues:
-                self.message_queues[client_id] = asyncio.Queue()
+                self.message_queues[client_id] = ClientMessageQueue(self.max_queue_size)
 
             logger.info(
                 f"Client {client_id} subscribed to {event_types} "
@@ -255,7 +397,7 @@ class WebSocketEventBus:
             )
             return subscription
 
-    async def unsubscribe(self, clientid: str) -> None:
+    async def unsubscribe(self, client_id: str) -> None:
         """
         Unsubscribe client from events.
 
@@ -263,8 +405,9 @@ class WebSocketEventBus:
             client_id: Client identifier
         """
         async with self.lock:
-            if client_id in self.subscriptions:
-                del self.subscriptions[client_id]
+            subscription=self.subscriptions.pop(client_id, None)
+            if subscription is not None:
+                self._unindex(subscription)
 
             if client_id in self.message_queues:
                 del self.message_queues[client_id]
@@ -278,28 +421,58 @@ class WebSocketEventBus:
         Args:
             event: WebSocketEvent to publish
         """
-        # Add to history
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history_size:
-            self.event_history.pop(0)
-
-        # Distribute to subscribed clients
-        async with self.lock:
-            for client_id, subscription in self.subscriptions.items():
-                if subscription.is_allowed(event):
-                    _queue=self.message_queues.get(client_id)
-                    if queue:
-                        try:
-                            queue.put_nowait(event)
-                        except asyncio.QueueFull:
-                            logger.warning(
-                                f"Message queue full for client {client_id}, "
-                                "dropping message"
-                            )
-
-        logger.debug(
-            f"Published event {event.event_type} to {len(self.subscriptions)} clients"
+        self.events_published += 1
+
+        by_resource=self._index.get(event.event_type)
+        if not by_resource:
+            return
+        event.to_json()    # Serialize once for every recipient
+
+        resource_id=event.resource_id
+        if resource_id is None:
+            recipients: Iterable[str] = self._type_members[event.event_type]
+        else:
+            recipients=by_resource.get(None, ())
+            watching=by_resource.get(resource_id)
+            if watching:
+                recipients=watching.union(recipients) if recipients else watching
+
+        queues=self.message_queues
+        for client_id in recipients:
+            queue=queues.get(client_id)
+            if queue is not None and not queue.put_nowait(event) and queue.dropped == 1:
+                logger.warning(f"Message queue full for client {client_id}, dropping messages")
+
+    def _index_subscription(self, subscription: ClientSubscription) -> None:
+        resources: Iterable[Optional[str]] = (
+            [None] if subscription.resource_ids is None else subscription.resource_ids
+        )
+        for event_type in subscription.allowed_event_types():
+            by_resource=self._index.setdefault(event_type, {})
+            for resource_id in resources:
+                by_resource.setdefault(resource_id, set()).add(subscription.client_id)
+            self._type_members.setdefault(event_type, set()).add(subscription.client_id)
+
+    def _unindex(self, subscription: ClientSubscription) -> None:
+        resources: Iterable[Optional[str]] = (
+            [None] if subscription.resource_ids is None else subscription.resource_ids
         )
+        for event_type in subscription.allowed_event_types():
+            by_resource=self._index.get(event_type)
+            if by_resource is None:
+                continue
+            for resource_id in resources:
+                clients=by_resource.get(resource_id)
+                if clients is not None:
+                    clients.discard(subscription.client_id)
+                    if not clients:
+                        del by_resource[resource_id]
+            members=self._type_members[event_type]
+            members.discard(subscription.client_id)
+            if not members:
+                del self._index[event_type]
+                del self._type_members[event_type]
 
     async def get_message(
         self, client_id: str, timeout: Optional[float] = 30.0
@@ -317,20 +490,23 @@ class WebSocketEventBus:
         Raises:
             KeyError: If client not subscribed
         """
-        _queue=self.message_queues.get(client_id)
+        queue=self.message_queues.get(client_id)
         if queue is None:
             raise KeyError(f"Client {client_id} not subscribed")
 
+        event=queue.get_nowait()
+        if event is not None:
+            return event
         try:
             if timeout:
-                _event=await asyncio.wait_for(queue.get(), timeout=timeout)
+                event=await asyncio.wait_for(queue.get(), timeout=timeout)
             else:
-                _event=await queue.get()
+                event=await queue.get()
             return event
         except asyncio.TimeoutError:
             return None
 
-    async def register_handler(self, eventtype: str, handler: Callable[..., Any]) -> None:
+    async def register_handler(self, event_type: str, handler: Callable[..., Any]) -> None:
         """
         Register handler for event type.
 
@@ -349,7 +525,21 @@ class WebSocketEventBus:
         async with self.lock:
             return len(self.subscriptions)
 
-    async def get_subscribed_clients(self, eventtype: str) -> List[ClientSubscription]:
+    def get_stats(self) -> Dict[str, Any]:
+        """Delivery statistics across client queues."""
+        queues=list(self.message_queues.values())
+        return {
+            "clients": len(self.subscriptions),
+            "events_published": self.events_published,
+            "queued": sum(len(q) for q in queues),
+            "max_queue_depth": max((len(q) for q in queues), default=0),
+            "delivered": sum(q.delivered for q in queues),
+            "coalesced": sum(q.coalesced for q in queues),
+            "dropped": sum(q.dropped for q in queues),
+            "indexed_event_types": len(self._index),
+        }
+
+    async def get_subscribed_clients(self, event_type: str) -> List[ClientSubscription]:
         """
         Get clients subscribed to event type.
 
@@ -376,27 +566,27 @@ class EventFactory:
     ) -> WebSocketEvent:
         """Create node status event."""
         return WebSocketEvent(
-            _event_type=EventType.NODE_STATUS.value,
-            _timestamp=datetime.now(timezone.utc).isoformat(),
-            _data={
+            event_type=EventType.NODE_STATUS.value,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            data={
                 "node_id": node_id,
                 "status": status,
                 "details": details or {},
             },
-            _severity="info",
+            severity="info",
         )
 
     @staticmethod
-    def node_metrics_event(nodeid: str, metrics: Dict[str, Any]) -> WebSocketEvent:
+    def node_metrics_event(node_id: str, metrics: Dict[str, Any]) -> WebSocketEvent:
         """Create node metrics event."""
         return WebSocketEvent(
-            _event_type=EventType.NODE_METRICS.value,
-            _timestamp=datetime.now(timezone.utc).isoformat(),
-            _data={
+            event_type=EventType.NODE_METRICS.value,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            data={
                 "node_id": node_id,
                 "metrics": metrics,
             },
-            _severity="info",
+            severity="info",
         )
 
     @staticmethod
@@ -405,22 +595,22 @@ class EventFactory:
     ) -> WebSocketEvent:
         """Create alert event."""
         return WebSocketEvent(
-            _event_type=EventType.CLUSTER_ALERT.value,
-            _timestamp=datetime.now(timezone.utc).isoformat(),
-            _data={
+            event_type=EventType.CLUSTER_ALERT.value,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            data={
                 "alert_type": alert_type,
                 "message": message,
             },
-            _severity=severity,
+            severity=severity,
         )
 
     @staticmethod
-    def job_progress_event(jobid: str, progress: int, status: str) -> WebSocketEvent:
+    def job_progress_event(job_id: str, progress: int, status: str) -> WebSocketEvent:
         """Create job progress event."""
         return WebSocketEvent(
-            _event_type=EventType.JOB_PROGRESS.value,
-            _timestamp=datetime.now(timezone.utc).isoformat(),
-            _data={
+            event_type=EventType.JOB_PROGRESS.value,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            data={
                 "job_id": job_id,
                 "progress": progress,    # 0-100
                 "status": status,
@@ -433,9 +623,9 @@ class EventFactory:
     ) -> WebSocketEvent:
         """Create storage metric event."""
         return WebSocketEvent(
-            _event_type=EventType.STORAGE_METRIC.value,
-            _timestamp=datetime.now(timezone.utc).isoformat(),
-            _data={
+            event_type=EventType.STORAGE_METRIC.value,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            data={
                 "pool_id": pool_id,
                 "used_bytes": used,
                 "total_bytes": total,
@@ -444,32 +634,32 @@ class EventFactory:
         )
 
     @staticmethod
-    def error_event(message: str, errorcode: Optional[str] = None) -> WebSocketEvent:
+    def error_event(message: str, error_code: Optional[str] = None) -> WebSocketEvent:
         """Create error event."""
         return WebSocketEvent(
-            _event_type=EventType.ERROR.value,
-            _timestamp=datetime.now(timezone.utc).isoformat(),
-            _data={
+            event_type=EventType.ERROR.value,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            data={
                 "message": message,
                 "error_code": error_code,
             },
-            _severity="error",
+            severity="error",
         )
 
     @staticmethod
     def heartbeat_event() -> WebSocketEvent:
         """Create heartbeat event (keep-alive)."""
         return WebSocketEvent(
-            _event_type=EventType.HEARTBEAT.value,
-            _timestamp=datetime.now(timezone.utc).isoformat(),
-            _data={"status": "ok"},
+            event_type=EventType.HEARTBEAT.value,
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            data={"status": "ok"},
         )
 
 
 class WebSocketConnectionManager:
     """Manages WebSocket connections and lifecycle."""
 
-    def __init__(self, eventbus: Optional[WebSocketEventBus] = None) -> None:
+    def __init__(self, event_bus: Optional[WebSocketEventBus] = None) -> None:
         """
         Initialize connection manager.
 
@@ -505,7 +695,7 @@ class WebSocketConnectionManager:
 
         logger.info(f"Client {client_id} connected")
 
-    async def disconnect(self, clientid: str) -> None:
+    async def disconnect(self, client_id: str) -> None:
         """
         Close a WebSocket connection.
 
@@ -519,7 +709,7 @@ class WebSocketConnectionManager:
         await self.event_bus.unsubscribe(client_id)
         logger.info(f"Client {client_id} disconnected")
 
-    async def send_to_client(self, clientid: str, event: WebSocketEvent) -> bool:
+    async def send_to_client(self, client_id: str, event: WebSocketEvent) -> bool:
         """
         Send event to specific client.
 
@@ -531,7 +721,7 @@ class WebSocketConnectionManager:
             True if sent successfully, False if client not connected
         """
         async with self.lock:
-            _websocket=self.connections.get(client_id)
+            websocket=self.connections.get(client_id)
 
         if websocket is None:
             return False
@@ -0,0 +1,30 @@
+"""
+Benchmark opt-in.
+
+Benchmark modules are marked slow (pytestmark) and skipped unless
+RUN_BENCHMARKS is set, so plain ``pytest`` stays fast and timing results
+do not depend on how loaded the machine running the suite is:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks -v -s
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_DIR = Path(__file__).parent
+
+
+def benchmarks_enabled() -> bool:
+    return os.environ.get("RUN_BENCHMARKS", "") not in ("", "0")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests under tests/benchmarks unless RUN_BENCHMARKS is set."""
+    if benchmarks_enabled():
+        return
+    skip = pytest.mark.skip(reason="benchmark; set RUN_BENCHMARKS=1 to run")
+    for item in items:
+        if item.get_closest_marker("slow") and BENCHMARK_DIR in item.path.parents:
+            item.add_marker(skip)
@@ -0,0 +1,197 @@
+"""
+LSTM Anomaly Detection Benchmark
+================================
+
+Compares the batched LSTM path with the previous per-scalar implementation:
+
+- ``_detect_lstm_anomaly`` per call: previous code (``np.row_stack`` and
+  four gate matmuls per step, copying the whole metric deque to slice the
+  last ten points) against the current one, using identical weights
+- Forecasting many series: one stacked pass (``predict_lstm``) against a
+  ``predict`` call per series
+- Training many models: stacked BPTT (``train_models``) against training
+  each model on its own
+
+Timings are printed, not asserted: ratios swing with machine load. The
+tests only check that both paths agree.
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_anomaly_lstm_benchmark.py -v -s
+"""
+
+import os
+import time
+import unittest
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from opt.services.anomaly.core import (
+    AnomalyAlert,
+    AnomalyConfig,
+    AnomalyDetectionEngine,
+    AnomalyType,
+    DetectionMethod,
+    LSTMModel,
+    MetricType,
+    SeverityLevel,
+)
+
+pytestmark = pytest.mark.slow
+
+SERIES = int(os.environ.get("DEBVISOR_BENCH_LSTM_SERIES", "200"))
+HISTORY = 10_000
+
+
+class LegacyLSTM:
+    """The previous LSTMModel forward/predict, fed with current weights."""
+
+    def __init__(self, model: LSTMModel) -> None:
+        H = model.hidden_size
+        W, b = model.params["W"], model.params["b"]
+        self.hidden_size = H
+        self.Wf, self.Wi, self.Wc, self.Wo = (W[n * H : (n + 1) * H] for n in range(4))
+        self.bf, self.bi, self.bc, self.bo = (b[n * H : (n + 1) * H, None] for n in range(4))
+        self.Wy = model.params["Wy"]
+        self.by = model.params["by"][:, None]
+        self.stats = model.stats
+
+    def sigmoid(self, x):
+        return 1 / (1 + np.exp(-x))
+
+    def forward(self, inputs: List[float]) -> List[float]:
+        h = np.zeros((self.hidden_size, 1))
+        c = np.zeros((self.hidden_size, 1))
+        outputs = []
+        for x_val in inputs:
+            z = np.vstack((h, np.array([[x_val]])))
+            f = self.sigmoid(np.dot(self.Wf, z) + self.bf)
+            i = self.sigmoid(np.dot(self.Wi, z) + self.bi)
+            c_bar = np.tanh(np.dot(self.Wc, z) + self.bc)
+            c = f * c + i * c_bar
+            o = self.sigmoid(np.dot(self.Wo, z) + self.bo)
+            h = o * np.tanh(c)
+            y = np.dot(self.Wy, h) + self.by
+            outputs.append(y[0, 0])
+        return outputs
+
+    def predict(self, sequence: List[float]) -> float:
+        mean, std = self.stats["mean"], self.stats["std"]
+        outputs = self.forward([(x - mean) / std for x in sequence])
+        return float(outputs[-1] * std + mean)
+
+
+def legacy_detect(engine, legacy, resource_id, metric_type, current_value, baseline) -> Optional[AnomalyAlert]:
+    """The previous _detect_lstm_anomaly body after the model checks."""
+    key = (resource_id, metric_type)
+    if key not in engine.metrics or len(engine.metrics[key]) < 10:
+        return None
+    sequence = [p.value for p in list(engine.metrics[key])[-11:-1]]
+    predicted_value = legacy.predict(sequence)
+    deviation = abs(current_value - predicted_value)
+    threshold = baseline.stddev * 2.5
+    if deviation > threshold:
+        return AnomalyAlert(
+            alert_id=str(uuid4())[:8],
+            timestamp=datetime.now(timezone.utc),
+            resource_id=resource_id,
+            metric_type=metric_type,
+            anomaly_type=AnomalyType.SPIKE,
+            severity=SeverityLevel.INFO,
+            confidence=0.0,
+            detected_value=current_value,
+            expected_range=(predicted_value - threshold, predicted_value + threshold),
+            detection_method=DetectionMethod.LSTM,
+            message="",
+        )
+    return None
+
+
+def sine(count: int, phase: float = 0.0) -> np.ndarray:
+    return 50 + 10 * np.sin(np.arange(count) * 0.2 + phase)
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+class TestLSTMDetectionSpeed(unittest.TestCase):
+    """Per-call detection latency."""
+
+    def test_detect_lstm_anomaly(self) -> None:
+        engine = AnomalyDetectionEngine(config=AnomalyConfig(config_dir="/nonexistent", lstm_workers=0))
+        for value in sine(HISTORY):
+            engine.add_metric("vm-1", MetricType.CPU_USAGE, float(value))
+        engine.train_model("vm-1", MetricType.CPU_USAGE)
+        baseline = engine.establish_baseline("vm-1", MetricType.CPU_USAGE)
+        legacy = LegacyLSTM(engine.lstm_models[("vm-1", MetricType.CPU_USAGE)])
+        value = float(sine(HISTORY + 1)[-1])
+
+        old = legacy_detect(engine, legacy, "vm-1", MetricType.CPU_USAGE, value, baseline)
+        new = engine._detect_lstm_anomaly("vm-1", MetricType.CPU_USAGE, value, baseline)
+        self.assertEqual(old is None, new is None)
+
+        legacy_us = timed(
+            lambda: legacy_detect(engine, legacy, "vm-1", MetricType.CPU_USAGE, value, baseline), 500
+        ) * 1e6
+        current_us = timed(
+            lambda: engine._detect_lstm_anomaly("vm-1", MetricType.CPU_USAGE, value, baseline), 500
+        ) * 1e6
+        print(
+            f"\n_detect_lstm_anomaly ({HISTORY:,}-point history): previous {legacy_us:.1f} us, "
+            f"current {current_us:.1f} us ({legacy_us / current_us:.1f}x)"
+        )
+
+
+class TestLSTMFleet(unittest.TestCase):
+    """Many series: stacked inference and training."""
+
+    def setUp(self) -> None:
+        self.engine = AnomalyDetectionEngine(
+            config=AnomalyConfig(config_dir="/nonexistent", lstm_workers=0)
+        )
+        for n in range(SERIES):
+            for value in sine(256, phase=n * 0.1):
+                self.engine.add_metric(f"vm-{n}", MetricType.CPU_USAGE, float(value))
+        self.keys = list(self.engine.metrics)
+
+    def test_fleet_training_and_inference(self) -> None:
+        start = time.perf_counter()
+        trained = self.engine.train_models(self.keys)
+        stacked_s = time.perf_counter() - start
+        self.assertEqual(trained, SERIES)
+
+        sample = self.keys[:20]
+        data = [[p.value for p in self.engine.metrics[key]] for key in sample]
+        start = time.perf_counter()
+        for values in data:
+            LSTMModel().train(values, epochs=self.engine.config.lstm_epochs)
+        single_s = (time.perf_counter() - start) / len(sample) * SERIES
+
+        windows = {
+            key: [p.value for p in self.engine.metrics[key]][-10:] for key in self.keys
+        }
+        loop_s = timed(
+            lambda: [self.engine.lstm_models[key].predict(windows[key]) for key in self.keys], 3
+        )
+        legacy = {key: LegacyLSTM(self.engine.lstm_models[key]) for key in self.keys}
+        legacy_s = timed(lambda: [legacy[key].predict(windows[key]) for key in self.keys], 1)
+        batch_s = timed(lambda: self.engine.predict_lstm(self.keys), 3)
+
+        print(
+            f"\n{SERIES} series: stacked training {stacked_s:.2f} s "
+            f"(one model at a time ~{single_s:.2f} s, {single_s / stacked_s:.1f}x)"
+            f"\nForecast all series: previous forward {legacy_s * 1000:.1f} ms, "
+            f"predict loop {loop_s * 1000:.1f} ms, stacked {batch_s * 1000:.1f} ms "
+            f"({legacy_s / batch_s:.0f}x vs previous)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Streaming Anomaly Detection Benchmark
+=====================================
+
+Measures batched, vectorised detection against the per-value engine path:
+
+- Samples/minute for a fleet of VMs x metrics scored in scrape-sized
+  batches (``StreamingAnomalyDetector.process_series``)
+- The same workload resolving resource/metric columns on every batch
+- ``AnomalyDetectionEngine.detect_anomalies`` (add_metric + detect per
+  value) on a subset, for comparison
+
+Rates are printed, not asserted: they depend on the machine and its load.
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_anomaly_stream_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_ANOMALY_VMS=5000 pytest tests/benchmarks/test_anomaly_stream_benchmark.py -s
+"""
+
+import os
+import time
+import unittest
+
+import numpy as np
+import pytest
+
+from opt.services.anomaly.core import AnomalyDetectionEngine, DetectionMethod, MetricType
+from opt.services.anomaly.streaming import StreamingAnomalyDetector
+
+pytestmark = pytest.mark.slow
+
+VMS = int(os.environ.get("DEBVISOR_BENCH_ANOMALY_VMS", "5000"))
+SCRAPES = int(os.environ.get("DEBVISOR_BENCH_ANOMALY_SCRAPES", "25"))
+METRICS = list(MetricType)
+LEGACY_SAMPLES = 2_000
+
+
+def fleet_columns(vms: int):
+    resource_ids = [f"vm-{n:05d}" for n in range(vms) for _ in METRICS]
+    metric_types = METRICS * vms
+    return resource_ids, metric_types
+
+
+class TestStreamingThroughput(unittest.TestCase):
+    """Batched detection must sustain well over a million samples per minute."""
+
+    def test_samples_per_minute(self) -> None:
+        rng = np.random.default_rng(1)
+        resource_ids, metric_types = fleet_columns(VMS)
+        series = len(resource_ids)
+        levels = rng.uniform(10, 90, size=series)
+
+        detector = StreamingAnomalyDetector(initial_capacity=series)
+        start = time.perf_counter()
+        ids = detector.resolve(resource_ids, metric_types)
+        resolve_ms = (time.perf_counter() - start) * 1000
+
+        scrapes = [levels + rng.normal(0, 2, size=series) for _ in range(SCRAPES)]
+        for values in scrapes[:3]:
+            spike = rng.integers(series)
+            values[spike] += 50
+        timestamps = time.time()
+
+        anomalies = 0
+        start = time.perf_counter()
+        for n, values in enumerate(scrapes):
+            result = detector.process_series(
+                ids, values, timestamps=np.full(series, timestamps + 15 * n)
+            )
+            anomalies += result.anomaly_count
+        elapsed = time.perf_counter() - start
+        per_minute = series * SCRAPES / elapsed * 60
+
+        start = time.perf_counter()
+        detector.process_batch(resource_ids, metric_types, scrapes[-1])
+        column_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"\n{series:,} series ({VMS:,} VMs x {len(METRICS)} metrics), {SCRAPES} scrapes"
+            f"\n  resolve columns once: {resolve_ms:.1f} ms"
+            f"\n  process_series: {elapsed / SCRAPES * 1000:.1f} ms/scrape, "
+            f"{per_minute / 1e6:.1f}M samples/min, {anomalies:,} flagged"
+            f"\n  process_batch with column resolution: {column_ms:.1f} ms/scrape"
+            f"\n  state: {len(detector):,} series"
+        )
+        self.assertEqual(len(detector), series)
+
+    def test_against_per_value_engine(self) -> None:
+        rng = np.random.default_rng(2)
+        history = rng.normal(50, 2, size=100)
+        values = rng.normal(50, 2, size=LEGACY_SAMPLES)
+        methods = [DetectionMethod.Z_SCORE, DetectionMethod.IQR, DetectionMethod.EWMA]
+
+        engine = AnomalyDetectionEngine()
+        for value in history:
+            engine.add_metric("vm-1", MetricType.CPU_USAGE, float(value))
+        start = time.perf_counter()
+        for value in values:
+            engine.add_metric("vm-1", MetricType.CPU_USAGE, float(value))
+            engine.detect_anomalies("vm-1", MetricType.CPU_USAGE, float(value), methods=methods)
+        legacy_us = (time.perf_counter() - start) / LEGACY_SAMPLES * 1e6
+
+        resource_ids, metric_types = fleet_columns(LEGACY_SAMPLES // len(METRICS))
+        detector = StreamingAnomalyDetector()
+        ids = detector.resolve(resource_ids, metric_types)
+        for _ in range(20):
+            detector.process_series(ids, rng.normal(50, 2, size=ids.size))
+        start = time.perf_counter()
+        for _ in range(10):
+            detector.process_series(ids, rng.normal(50, 2, size=ids.size))
+        batched_us = (time.perf_counter() - start) / (10 * ids.size) * 1e6
+
+        print(
+            f"\nPer-value engine: {legacy_us:.1f} us/sample; "
+            f"batched: {batched_us:.2f} us/sample ({legacy_us / batched_us:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
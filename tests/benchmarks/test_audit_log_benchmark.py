@@ -0,0 +1,98 @@
+"""
+Audit Log Write Benchmark
+=========================
+
+Request-path cost of AuditLog.log_operation with and without the
+asynchronous writer, on a file-backed SQLite database:
+
+- Synchronous: chain-tail query, HMAC signature and a commit per entry
+- Asynchronous: enqueue only; the writer thread chains, signs and
+  bulk-inserts batches (end-to-end throughput reported as well)
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_audit_log_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_AUDIT_ENTRIES=50000 pytest tests/benchmarks/test_audit_log_benchmark.py -s
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import pytest
+from flask import Flask
+
+from opt.web.panel.extensions import db
+from opt.web.panel.graceful_shutdown import GracefulShutdownManager
+from opt.web.panel.models.audit_log import AuditLog, start_audit_writer, stop_audit_writer
+
+pytestmark = pytest.mark.slow
+
+ENTRIES = int(os.environ.get("DEBVISOR_BENCH_AUDIT_ENTRIES", "10000"))
+SYNC_ENTRIES = min(ENTRIES, 1000)
+
+
+def log(n: int) -> None:
+    AuditLog.log_operation(
+        user_id=1,
+        operation="read",
+        resource_type="node",
+        action="Listed nodes",
+        request_data={"page": n, "per_page": 50},
+        ip_address="10.0.0.1",
+        user_agent="bench",
+    )
+
+
+class TestAuditWriteOverhead(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = (
+            f"sqlite:///{os.path.join(self.temp_dir, 'audit.db')}"
+        )
+        self.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        db.init_app(self.app)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+    def tearDown(self) -> None:
+        stop_audit_writer()
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_sync_vs_async(self) -> None:
+        start = time.perf_counter()
+        for n in range(SYNC_ENTRIES):
+            log(n)
+        sync_us = (time.perf_counter() - start) / SYNC_ENTRIES * 1e6
+
+        writer = start_audit_writer(self.app, shutdown_manager=GracefulShutdownManager())
+        start = time.perf_counter()
+        for n in range(ENTRIES):
+            log(n)
+        enqueue_s = time.perf_counter() - start
+        self.assertTrue(writer.flush(timeout=300))
+        total_s = time.perf_counter() - start
+        async_us = enqueue_s / ENTRIES * 1e6
+        stats = writer.stats()
+
+        result = AuditLog.verify_chain()
+        print(
+            f"\nlog_operation request-path cost: sync {sync_us:.0f} us/entry, "
+            f"async {async_us:.1f} us/entry ({sync_us / async_us:.0f}x)"
+            f"\nasync end-to-end: {ENTRIES:,} entries in {total_s:.2f} s "
+            f"({ENTRIES / total_s:,.0f}/s vs sync {1e6 / sync_us:,.0f}/s), "
+            f"{stats['batches']} batches"
+        )
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["total_checked"], SYNC_ENTRIES + ENTRIES)
+        self.assertLess(async_us * 5, sync_us)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""
+Audit Chain Verification Benchmark
+==================================
+
+Verification cost of AuditLog.verify_chain on a file-backed SQLite
+database:
+
+- Previous implementation: load every row as an ORM object, then verify
+- Streaming windows, in-process and with worker processes
+- Incremental run after a signed checkpoint, with 1% new rows
+- Peak Python memory (tracemalloc) of the previous and streaming passes
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_audit_verify_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_AUDIT_VERIFY_ROWS=200000 pytest tests/benchmarks/test_audit_verify_benchmark.py -s
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+import unittest
+from typing import Any, Dict
+
+import pytest
+from flask import Flask
+
+from opt.core.audit import AuditSigner
+from opt.web.panel.extensions import db
+from opt.web.panel.graceful_shutdown import GracefulShutdownManager
+from opt.web.panel.models import audit_log
+from opt.web.panel.models.audit_log import (
+    GENESIS_HASH,
+    AuditLog,
+    _SIGNED_COLUMNS,
+    _audit_secret_key,
+    _signing_entry,
+    start_audit_writer,
+    stop_audit_writer,
+)
+
+pytestmark = pytest.mark.slow
+
+ROWS = int(os.environ.get("DEBVISOR_BENCH_AUDIT_VERIFY_ROWS", "20000"))
+WORKERS = min(4, os.cpu_count() or 1)
+_saved_level = audit_log.logger.level
+
+
+def setUpModule() -> None:
+    audit_log.logger.setLevel(logging.INFO)
+
+
+def tearDownModule() -> None:
+    audit_log.logger.setLevel(_saved_level)
+
+
+def legacy_verify() -> Dict[str, Any]:
+    """The previous verify_chain: every row loaded up front."""
+    signer = AuditSigner(secret_key=_audit_secret_key())
+    logs = AuditLog.query.order_by(AuditLog.id.asc()).all()
+    previous_hash = GENESIS_HASH
+    for log in logs:
+        entry = _signing_entry(
+            {c: getattr(log, c) for c in _SIGNED_COLUMNS}, previous_hash, signature=log.signature
+        )
+        if not signer.verify(entry) or log.previous_hash != previous_hash:
+            return {"valid": False, "broken_at_id": log.id}
+        previous_hash = log.signature
+    return {"valid": True, "total_checked": len(logs)}
+
+
+def log(n: int) -> None:
+    AuditLog.log_operation(
+        user_id=1,
+        operation="read",
+        resource_type="node",
+        action="Listed nodes",
+        request_data={"page": n, "per_page": 50},
+        ip_address="10.0.0.1",
+        user_agent="bench",
+    )
+
+
+def timed(func):
+    db.session.expire_all()
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def peak_memory(func) -> float:
+    db.session.expunge_all()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+class TestAuditVerifyThroughput(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = (
+            f"sqlite:///{os.path.join(self.temp_dir, 'audit.db')}"
+        )
+        self.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        db.init_app(self.app)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+        writer = start_audit_writer(self.app, shutdown_manager=GracefulShutdownManager())
+        for n in range(ROWS):
+            log(n)
+        self.assertTrue(writer.flush(timeout=600))
+        stop_audit_writer()
+
+    def tearDown(self) -> None:
+        stop_audit_writer()
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_full_parallel_and_incremental(self) -> None:
+        legacy, legacy_s = timed(legacy_verify)
+        streamed, stream_s = timed(lambda: AuditLog.verify_chain(save_checkpoint=True))
+        parallel, parallel_s = timed(lambda: AuditLog.verify_chain(workers=WORKERS))
+        for result in (legacy, streamed, parallel):
+            self.assertTrue(result["valid"])
+            self.assertEqual(result["total_checked"], ROWS)
+
+        new_rows = max(1, ROWS // 100)
+        for n in range(new_rows):
+            log(n)
+        incremental, incremental_s = timed(lambda: AuditLog.verify_chain(incremental=True))
+        self.assertTrue(incremental["valid"])
+        self.assertEqual(incremental["total_checked"], new_rows)
+
+        legacy_mb = peak_memory(legacy_verify)
+        stream_mb = peak_memory(AuditLog.verify_chain)
+
+        print(
+            f"\nVerify {ROWS:,} rows:"
+            f"\n  previous (load all): {legacy_s:.2f} s ({ROWS / legacy_s:,.0f} rows/s), "
+            f"peak {legacy_mb:.1f} MiB"
+            f"\n  streaming: {stream_s:.2f} s ({ROWS / stream_s:,.0f} rows/s), "
+            f"peak {stream_mb:.1f} MiB"
+            f"\n  {WORKERS} workers: {parallel_s:.2f} s ({ROWS / parallel_s:,.0f} rows/s)"
+            f"\n  incremental (+{new_rows:,} rows): {incremental_s * 1000:.1f} ms "
+            f"({stream_s / incremental_s:.0f}x faster than a full pass)"
+        )
+        self.assertLess(incremental_s * 10, stream_s)
+        self.assertLess(stream_mb, legacy_mb)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Block Index Benchmark
+=====================
+
+Measures per-chunk index cost during ingest and store startup time for
+the ``json`` (legacy), ``log`` and ``sqlite`` block index backends.
+
+The startup benchmark size defaults to 100k blocks; set
+``DEBVISOR_BENCH_INDEX_BLOCKS=10000000`` to measure a 10M-block store.
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_backup_block_index_benchmark.py -v -s
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from opt.services.backup.block_index import BlockRecord, open_block_index
+from opt.services.backup.dedup_backup_service import (
+    BackupConfig,
+    BlockStore,
+    CompressionAlgo,
+)
+
+pytestmark = pytest.mark.slow
+
+STARTUP_BLOCKS = int(os.environ.get("DEBVISOR_BENCH_INDEX_BLOCKS", "100000"))
+STORED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_record(n: int) -> BlockRecord:
+    return BlockRecord(
+        digest=f"{n:064x}", size=65536, compressed_size=32768, stored_at=STORED_AT, ref_count=1
+    )
+
+
+def ingest_us_per_op(backend: str, blocks: int, dup_every: int = 4) -> float:
+    """Simulate one backup of ``blocks`` chunks; return microseconds per chunk."""
+    with tempfile.TemporaryDirectory() as root:
+        index = open_block_index(Path(root), backend)
+        start = time.perf_counter()
+        with index.batch():
+            for n in range(blocks):
+                digest = f"{n // dup_every:064x}"
+                if index.adjust_ref(digest, 1) is None:
+                    index.add(make_record(n // dup_every))
+        elapsed = time.perf_counter() - start
+        index.close()
+    return elapsed / blocks * 1e6
+
+
+class TestBlockIndexIngest(unittest.TestCase):
+    """Per-chunk index cost must not grow with store size."""
+
+    def test_ingest_is_linear(self) -> None:
+        for backend in ("log", "sqlite"):
+            small = ingest_us_per_op(backend, 20_000)
+            large = ingest_us_per_op(backend, 100_000)
+            print(f"\n{backend}: {small:.1f} us/chunk @20k, {large:.1f} us/chunk @100k")
+            # O(n) total I/O: per-chunk cost stays roughly flat
+            self.assertLess(large, small * 3)
+
+    def test_legacy_json_unbatched(self) -> None:
+        """Legacy behaviour: full rewrite on every put (quadratic)."""
+        with tempfile.TemporaryDirectory() as root:
+            config = BackupConfig(
+                store_root=root, index_backend="json", compression=CompressionAlgo.NONE
+            )
+            store = BlockStore(config)
+            start = time.perf_counter()
+            for n in range(500):
+                store.put(n.to_bytes(8, "little"))
+            elapsed = time.perf_counter() - start
+        print(f"\njson (per-put rewrite): {elapsed / 500 * 1e6:.1f} us/chunk @500")
+
+    def test_block_store_batched_put(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            config = BackupConfig(store_root=root, compression=CompressionAlgo.NONE)
+            store = BlockStore(config)
+            start = time.perf_counter()
+            with store.batch():
+                for n in range(10_000):
+                    store.put((n % 2_500).to_bytes(8, "little"))
+            elapsed = time.perf_counter() - start
+            store.close()
+        print(f"\nBlockStore.put (sqlite, batched): {elapsed / 10_000 * 1e6:.1f} us/chunk")
+
+
+class TestBlockIndexStartup(unittest.TestCase):
+    """Time from opening a populated store to the first lookup."""
+
+    def test_startup_time(self) -> None:
+        for backend in ("sqlite", "log"):
+            with tempfile.TemporaryDirectory() as root:
+                index = open_block_index(Path(root), backend)
+                with index.batch():
+                    for n in range(STARTUP_BLOCKS):
+                        index.add(make_record(n))
+                if backend == "log":
+                    index.compact()
+                index.close()
+
+                start = time.perf_counter()
+                store = BlockStore(BackupConfig(store_root=root, index_backend=backend))
+                opened = time.perf_counter() - start
+                self.assertIn(f"{STARTUP_BLOCKS // 2:064x}", store.index)
+                first_lookup = time.perf_counter() - start
+                store.close()
+            print(
+                f"\n{backend} startup @{STARTUP_BLOCKS:,} blocks: "
+                f"open {opened * 1000:.1f} ms, first lookup {first_lookup * 1000:.1f} ms"
+            )
+            if backend == "sqlite":
+                self.assertLess(first_lookup, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
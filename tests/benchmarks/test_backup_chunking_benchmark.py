@@ -0,0 +1,106 @@
+"""
+Chunking Throughput Benchmark
+=============================
+
+Compares the buffered gear chunker against the legacy byte-at-a-time
+``ContentDefinedChunker`` on a synthetic VM disk image (random extents,
+zeroed extents and duplicated extents).
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_backup_chunking_benchmark.py -v -s
+"""
+
+import io
+import random
+import time
+import unittest
+from typing import Callable, Iterable
+
+import pytest
+
+from opt.services.backup.chunking import HAS_NUMPY, GearChunker
+from opt.services.backup.dedup_backup_service import (
+    ChunkingConfig,
+    ContentDefinedChunker,
+)
+
+pytestmark = pytest.mark.slow
+
+
+def make_synthetic_image(size: int, seed: int = 7) -> bytes:
+    """Build an image of ``size`` bytes: 50% random, 25% zeros, 25% duplicates."""
+    rng = random.Random(seed)
+    extent = 256 * 1024
+    parts = []
+    total = 0
+    random_extents = []
+    while total < size:
+        kind = rng.random()
+        if kind < 0.5 or not random_extents:
+            block = rng.randbytes(extent)
+            random_extents.append(block)
+        elif kind < 0.75:
+            block = b"\0" * extent
+        else:
+            block = rng.choice(random_extents)
+        parts.append(block)
+        total += extent
+    return b"".join(parts)[:size]
+
+
+def measure_mb_per_sec(chunk: Callable[[bytes], Iterable[bytes]], data: bytes) -> float:
+    """Chunk ``data`` once and return throughput in MB/s."""
+    start = time.perf_counter()
+    consumed = sum(len(c) for c in chunk(data))
+    elapsed = time.perf_counter() - start
+    assert consumed == len(data)
+    return (len(data) / (1024 * 1024)) / elapsed
+
+
+class TestChunkingThroughput(unittest.TestCase):
+    """Benchmark gear vs legacy chunking."""
+
+    def setUp(self) -> None:
+        self.config = ChunkingConfig()
+        self.image = make_synthetic_image(32 * 1024 * 1024)
+        # Legacy chunker is too slow to run on the full image
+        self.legacy_sample = self.image[: 512 * 1024]
+
+    def test_gear_vs_legacy(self) -> None:
+        legacy = ContentDefinedChunker(self.config)
+        legacy_mbps = measure_mb_per_sec(
+            lambda d: legacy.chunk_stream(io.BytesIO(d)), self.legacy_sample
+        )
+        gear = GearChunker(self.config)
+        gear_mbps = measure_mb_per_sec(
+            lambda d: gear.chunk_stream(io.BytesIO(d)), self.image
+        )
+        gear_py = GearChunker(self.config, use_numpy=False)
+        gear_py_mbps = measure_mb_per_sec(gear_py.chunk_bytes, self.image[: 4 * 1024 * 1024])
+
+        print(
+            f"\nlegacy rabin: {legacy_mbps:8.2f} MB/s"
+            f"\ngear (numpy={HAS_NUMPY}): {gear_mbps:8.2f} MB/s"
+            f"\ngear (pure python): {gear_py_mbps:8.2f} MB/s"
+        )
+        self.assertGreater(gear_mbps, legacy_mbps)
+        self.assertGreater(gear_py_mbps, legacy_mbps)
+
+    def test_gear_mmap_file(self) -> None:
+        import tempfile
+
+        gear = GearChunker(self.config)
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(self.image)
+            f.flush()
+            f.seek(0)
+            start = time.perf_counter()
+            chunks = list(gear.chunk_stream(f))
+            elapsed = time.perf_counter() - start
+        mbps = (len(self.image) / (1024 * 1024)) / elapsed
+        print(f"\ngear mmap: {mbps:8.2f} MB/s, {len(chunks)} chunks")
+        self.assertEqual(sum(len(c) for c in chunks), len(self.image))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Backup Restore Benchmark
+========================
+
+Reports ``DedupBackupService.restore_to_file`` throughput (MB/s) for the
+legacy one-block-at-a-time path (1 worker, no read-ahead) against the
+parallel read-ahead engine, with gzip compression and AES-256-GCM
+encryption enabled. Scaling depends on the cores available to the run.
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_backup_restore_benchmark.py -v -s
+"""
+
+import io
+import os
+import tempfile
+import time
+import unittest
+from typing import Dict, Tuple
+
+import pytest
+
+from opt.services.backup.dedup_backup_service import (
+    BackupConfig,
+    CompressionAlgo,
+    DedupBackupService,
+    EncryptionMode,
+)
+from tests.benchmarks.test_backup_pipeline_benchmark import make_compressible_image
+
+pytestmark = pytest.mark.slow
+
+IMAGE_SIZE = 32 * 1024 * 1024
+ZERO_SIZE = 16 * 1024 * 1024
+CONFIGS: Tuple[Tuple[int, int], ...] = ((1, 1), (2, 8), (4, 16), (8, 32))
+
+
+class TestBackupRestoreThroughput(unittest.TestCase):
+    """MB/s versus restore workers and read-ahead depth."""
+
+    def test_throughput_vs_workers(self) -> None:
+        image = make_compressible_image(IMAGE_SIZE) + bytes(ZERO_SIZE)
+        results: Dict[Tuple[int, int], float] = {}
+        with tempfile.TemporaryDirectory() as root:
+            config = BackupConfig(
+                store_root=os.path.join(root, "store"),
+                compression=CompressionAlgo.GZIP,
+                encryption=EncryptionMode.AES_256_GCM,
+                encryption_key=b"\x01" * 32,
+                parallelism=4,
+            )
+            svc = DedupBackupService(config)
+            manifest = svc.backup_stream("bench", io.BytesIO(image))
+            output = os.path.join(root, "restored.img")
+
+            for workers, prefetch in CONFIGS:
+                svc.config.restore_workers = workers
+                svc.config.restore_prefetch = prefetch
+                start = time.perf_counter()
+                result = svc.restore_to_file(manifest.id, output)
+                elapsed = time.perf_counter() - start
+                self.assertEqual(result.bytes_written, len(image))
+                results[(workers, prefetch)] = (len(image) / (1024 * 1024)) / elapsed
+            sparse = result.sparse_bytes
+            svc.close()
+
+        print(f"\nrestore_to_file throughput ({os.cpu_count()} CPUs, {sparse >> 20} MiB sparse):")
+        baseline = results[CONFIGS[0]]
+        for (workers, prefetch), mbps in results.items():
+            print(
+                f"  workers={workers} prefetch={prefetch}: "
+                f"{mbps:8.2f} MB/s ({mbps / baseline:.2f}x)"
+            )
+
+        if (os.cpu_count() or 1) >= 4:
+            self.assertGreater(results[(4, 16)], baseline * 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
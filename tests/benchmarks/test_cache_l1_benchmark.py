@@ -0,0 +1,124 @@
+"""
+L1 Cache Benchmark
+==================
+
+Compares the previous ``L1Cache`` algorithm (one ``asyncio.Lock`` for every
+operation, eviction by scanning all keys with ``min(accessed_at)``) with
+the sharded LRU and W-TinyLFU engines at a 100k-entry capacity.
+
+The legacy implementation is reproduced below so the comparison keeps
+working after the old code path was replaced.
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_cache_l1_benchmark.py -v -s
+"""
+
+import asyncio
+import os
+import random
+import time
+import unittest
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import pytest
+
+from opt.services.cache import EvictionPolicy, L1Cache
+
+pytestmark = pytest.mark.slow
+
+CAPACITY = int(os.environ.get("DEBVISOR_BENCH_CACHE_ENTRIES", "100000"))
+LEGACY_INSERTS = 200
+INSERTS = 50_000
+GETS = 200_000
+
+
+class LegacyL1Cache:
+    """The previous L1Cache algorithm: global lock, O(n) LRU scan."""
+
+    def __init__(self, max_size: int) -> None:
+        self.data: Dict[str, Dict[str, Any]] = {}
+        self.max_size = max_size
+        self._lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[Any]:
+        async with self._lock:
+            entry = self.data.get(key)
+            if entry is None:
+                return None
+            entry["accessed_at"] = datetime.now(timezone.utc)
+            return entry["value"]
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> bool:
+        async with self._lock:
+            if len(self.data) >= self.max_size:
+                lru_key = min(self.data.keys(), key=lambda k: self.data[k]["accessed_at"])
+                del self.data[lru_key]
+            self.data[key] = {"value": value, "accessed_at": datetime.now(timezone.utc)}
+            return True
+
+
+async def fill(cache: Any, count: int) -> None:
+    for n in range(count):
+        await cache.set(f"key:{n}", n, 3600)
+
+
+async def time_inserts_at_capacity(cache: Any, count: int) -> float:
+    """Microseconds per insert once the cache is full (every insert evicts)."""
+    start = time.perf_counter()
+    for n in range(count):
+        await cache.set(f"new:{n}", n, 3600)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+async def time_gets(cache: Any, count: int) -> float:
+    rng = random.Random(5)
+    keys = [f"key:{rng.randrange(CAPACITY)}" for _ in range(count)]
+    start = time.perf_counter()
+    for key in keys:
+        await cache.get(key)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+class TestL1CacheThroughput(unittest.TestCase):
+    """Per-operation cost at capacity."""
+
+    def test_set_at_capacity(self) -> None:
+        async def run() -> Dict[str, float]:
+            legacy = LegacyL1Cache(CAPACITY)
+            await fill(legacy, CAPACITY)
+            results = {"legacy": await time_inserts_at_capacity(legacy, LEGACY_INSERTS)}
+            for policy in EvictionPolicy:
+                cache = L1Cache(max_size=CAPACITY, policy=policy)
+                await fill(cache, CAPACITY)
+                results[policy.value] = await time_inserts_at_capacity(cache, INSERTS)
+            return results
+
+        results = asyncio.run(run())
+        print(f"\nL1 set at capacity ({CAPACITY:,} entries):")
+        for name, us in results.items():
+            print(f"  {name:10s}: {us:10.2f} us/op ({results['legacy'] / us:8.1f}x)")
+        self.assertLess(results["lru"] * 20, results["legacy"])
+
+    def test_get_latency(self) -> None:
+        async def run() -> Dict[str, Any]:
+            legacy = LegacyL1Cache(CAPACITY)
+            await fill(legacy, CAPACITY)
+            results: Dict[str, Any] = {"legacy": await time_gets(legacy, GETS)}
+            cache = L1Cache(max_size=CAPACITY)
+            await fill(cache, CAPACITY)
+            results["lru"] = await time_gets(cache, GETS)
+            results["metrics"] = await cache.get_metrics()
+            return results
+
+        results = asyncio.run(run())
+        metrics = results["metrics"]
+        print(
+            f"\nL1 get: legacy {results['legacy']:.2f} us/op, lru {results['lru']:.2f} us/op; "
+            f"p50 {metrics.latency_p50_ms * 1000:.2f} us, "
+            f"p99 {metrics.latency_p99_ms * 1000:.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+"""
+Cardinality Controller Throughput Benchmark
+===========================================
+
+Samples/sec through CardinalityController for exporter-like workloads
+(many metrics, a few labels each), in steady state (repeated scrapes of
+a bounded set of series) and under series churn:
+
+- Previous implementation: SHA-256 per label value into HyperLogLog
+  registers, and a recount of every metric's series for each new series
+- process_sample() per sample (maintained series counter)
+- process_samples() per scrape batch (vectorized HyperLogLog updates)
+
+Also times HyperLogLog.estimate() and merge() against the previous
+generator/loop versions. Throughput varies with the host, so it is only
+reported; the assertions compare against the previous implementation.
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_cardinality_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_CARDINALITY_SAMPLES=1000000 \\
+        pytest tests/benchmarks/test_cardinality_benchmark.py -s
+"""
+
+import hashlib
+import logging
+import math
+import os
+import random
+import struct
+import time
+import unittest
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from opt.services.observability import cardinality_controller
+from opt.services.observability.cardinality_controller import (
+    CardinalityController,
+    HyperLogLog,
+    SeriesStats,
+)
+
+pytestmark = pytest.mark.slow
+
+SAMPLES = int(os.environ.get("DEBVISOR_BENCH_CARDINALITY_SAMPLES", "200000"))
+BATCH = 20000   # Samples per scrape
+
+Sample = Tuple[str, Dict[str, str], float]
+_saved_level = cardinality_controller.logger.level
+
+
+def setUpModule() -> None:
+    cardinality_controller.logger.setLevel(logging.ERROR)
+
+
+def tearDownModule() -> None:
+    cardinality_controller.logger.setLevel(_saved_level)
+
+
+class LegacyHyperLogLog(HyperLogLog):
+    """Previous registers and hash: bytearray, SHA-256 per value."""
+
+    def __init__(self, precision: int = 14) -> None:
+        super().__init__(precision)
+        self.buckets = self._registers
+
+    def _hash(self, value: str) -> int:
+        return struct.unpack("<Q", hashlib.sha256(value.encode()).digest()[:8])[0]
+
+    def estimate(self) -> int:
+        indicator = sum(2.0**-b for b in self.buckets)
+        raw_estimate = self._alpha * (self.num_buckets**2) / indicator
+        if raw_estimate <= 2.5 * self.num_buckets:
+            zeros = self.buckets.count(0)
+            if zeros > 0:
+                return int(self.num_buckets * math.log(self.num_buckets / zeros))
+        return int(raw_estimate)
+
+    def merge(self, other: HyperLogLog) -> None:
+        for i in range(self.num_buckets):
+            self.buckets[i] = max(self.buckets[i], other.buckets[i])
+
+
+class LegacyController(CardinalityController):
+    """Previous process_sample: recounts all series for each new one."""
+
+    def register_metric(self, name, label_names):
+        descriptor = super().register_metric(name, label_names)
+        for tracker in self.label_trackers[name].values():
+            if not isinstance(tracker.hll, LegacyHyperLogLog):
+                tracker.hll = LegacyHyperLogLog(precision=12)
+        return descriptor
+
+    def process_sample(
+        self, metric_name: str, labels: Dict[str, str], value: float, timestamp: Optional[float] = None
+    ) -> Tuple[Dict[str, str], bool]:
+        self.total_samples_processed += 1
+        timestamp = timestamp or time.time()
+        if metric_name not in self.metrics:
+            self.register_metric(metric_name, set(labels.keys()))
+        metric = self.metrics[metric_name]
+        for label_name, label_value in labels.items():
+            if label_name in self.label_trackers[metric_name]:
+                self.label_trackers[metric_name][label_name].add(label_value)
+        transformed = self._transform_labels(metric_name, labels)
+        series_hash = self._hash_labels(transformed)
+        if series_hash in self.series_by_metric[metric_name]:
+            stats = self.series_by_metric[metric_name][series_hash]
+            stats.sample_count += 1
+            stats.last_sample_time = timestamp
+            return transformed, True
+        if len(self.series_by_metric[metric_name]) >= self.max_series_per_metric:
+            self.samples_pruned += 1
+            return transformed, False
+        total_series = sum(len(s) for s in self.series_by_metric.values())
+        if total_series >= self.max_total_series:
+            self.samples_pruned += 1
+            return transformed, False
+        self.series_by_metric[metric_name][series_hash] = SeriesStats(
+            metric_name=metric_name, label_hash=series_hash, labels=transformed,
+            sample_count=1, last_sample_time=timestamp,
+        )
+        metric.series_count = len(self.series_by_metric[metric_name])
+        return transformed, True
+
+
+def make_samples(count: int, metrics: int, instances: int, devices: int) -> List[Sample]:
+    rng = random.Random(11)
+    return [
+        (
+            f"exporter_metric_{rng.randrange(metrics)}",
+            {
+                "instance": f"node-{rng.randrange(instances)}",
+                "job": "node",
+                "device": f"dev{rng.randrange(devices)}",
+            },
+            rng.random(),
+        )
+        for _ in range(count)
+    ]
+
+
+def best_rate(samples: List[Sample], make, batched: bool, rounds: int = 3) -> Tuple[float, CardinalityController]:
+    """Best samples/sec over fresh controllers (the machine may be noisy)."""
+    best = 0.0
+    for _ in range(rounds):
+        controller = make()
+        start = time.perf_counter()
+        if batched:
+            for offset in range(0, len(samples), BATCH):
+                controller.process_samples(samples[offset:offset + BATCH], 1.0)
+        else:
+            for metric, labels, value in samples:
+                controller.process_sample(metric, labels, value, 1.0)
+        best = max(best, len(samples) / (time.perf_counter() - start))
+    return best, controller
+
+
+def series_count(controller: CardinalityController) -> int:
+    return sum(len(s) for s in controller.series_by_metric.values())
+
+
+class TestCardinalityThroughput(unittest.TestCase):
+    def test_steady_state_scrapes(self) -> None:
+        """500 metrics x 20 instances x 2 devices: 20,000 series, scraped repeatedly."""
+        samples = make_samples(SAMPLES, 500, 20, 2)
+        legacy_rate, legacy = best_rate(samples, LegacyController, batched=False)
+        single_rate, _ = best_rate(samples, CardinalityController, batched=False)
+        batch_rate, batch = best_rate(samples, CardinalityController, batched=True)
+
+        print(
+            f"\nSteady state, samples/sec ({SAMPLES:,} samples, {batch.total_series:,} series):"
+            f"\n  previous process_sample: {legacy_rate:,.0f}"
+            f"\n  process_sample: {single_rate:,.0f} ({single_rate / legacy_rate:.2f}x)"
+            f"\n  process_samples, {BATCH:,}/batch: {batch_rate:,.0f} "
+            f"({batch_rate / legacy_rate:.2f}x)"
+        )
+        self.assertEqual(batch.total_series, series_count(legacy))
+        self.assertGreater(batch_rate, legacy_rate)
+
+    def test_series_churn(self) -> None:
+        """2,000 metrics with mostly new series: no more recount per new series."""
+        samples = make_samples(SAMPLES // 2, 2000, 200, 8)
+        legacy_rate, legacy = best_rate(samples, LegacyController, batched=False, rounds=1)
+        batch_rate, batch = best_rate(samples, CardinalityController, batched=True, rounds=1)
+
+        print(
+            f"\nSeries churn, samples/sec ({len(samples):,} samples, {batch.total_series:,} series):"
+            f"\n  previous process_sample: {legacy_rate:,.0f}"
+            f"\n  process_samples, {BATCH:,}/batch: {batch_rate:,.0f} ({batch_rate / legacy_rate:.1f}x)"
+        )
+        self.assertEqual(batch.total_series, series_count(legacy))
+        self.assertGreater(batch_rate, 2 * legacy_rate)
+
+    def test_estimate_and_merge(self) -> None:
+        values = [f"series-{n}" for n in range(200000)]
+        legacy, other_legacy = LegacyHyperLogLog(), LegacyHyperLogLog()
+        hll, other = HyperLogLog(), HyperLogLog()
+        for value in values:
+            legacy.add(value)
+        hll.add_many(values)
+        other.add_many(values[::3])
+        other_legacy.buckets = bytearray(other.buckets.tobytes())
+
+        def per_call_us(func, rounds: int = 50) -> float:
+            start = time.perf_counter()
+            for _ in range(rounds):
+                func()
+            return (time.perf_counter() - start) / rounds * 1e6
+
+        print(
+            f"\nHyperLogLog (2^14 registers), previous -> NumPy:"
+            f"\n  estimate(): {per_call_us(legacy.estimate):,.0f} us -> {per_call_us(hll.estimate):,.0f} us"
+            f"\n  merge(): {per_call_us(lambda: legacy.merge(other_legacy)):,.0f} us -> "
+            f"{per_call_us(lambda: hll.merge(other)):,.0f} us"
+            f"\n  estimate of {len(values):,} distinct: {hll.estimate():,}"
+        )
+        self.assertLess(abs(hll.estimate() - len(values)) / len(values), 0.03)
+
+
+if __name__ == "__main__":
+    unittest.main()
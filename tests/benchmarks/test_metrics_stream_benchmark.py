@@ -0,0 +1,98 @@
+"""
+Node Metrics Streaming Benchmark
+================================
+
+One simulated minute of dashboard traffic for many nodes, each reporting
+a full metrics dict four times a second with only a few fields changing:
+
+- Previous path: every update becomes a node_metrics event encoded and
+  emitted in full (``broadcast_node_metrics``)
+- Stream: updates folded into MetricsStream, one delta frame per 250 ms
+  tick, encoded once as JSON and as msgpack
+
+Reports server encode time and bytes per subscribed client.
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_metrics_stream_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_STREAM_NODES=1000 pytest tests/benchmarks/test_metrics_stream_benchmark.py -s
+"""
+
+import os
+import random
+import time
+import unittest
+
+import pytest
+
+from opt.web.panel.metrics_stream import HAS_MSGPACK, MetricsStream, publish_tick
+from opt.web.panel.websocket_events import EventFactory
+
+pytestmark = pytest.mark.slow
+
+NODES = int(os.environ.get("DEBVISOR_BENCH_STREAM_NODES", "300"))
+SECONDS = int(os.environ.get("DEBVISOR_BENCH_STREAM_SECONDS", "60"))
+UPDATES_PER_SECOND = 4
+FIELDS = 20
+CHANGING = 3    # Fields that move between two updates
+
+
+def updates(seed: int = 1):
+    rng = random.Random(seed)
+    state = {
+        f"node{n}": {f"metric_{f}": round(rng.uniform(0, 100), 1) for f in range(FIELDS)}
+        for n in range(NODES)
+    }
+    for _ in range(SECONDS * UPDATES_PER_SECOND):
+        batch = []
+        for node_id, metrics in state.items():
+            for f in rng.sample(range(FIELDS), CHANGING):
+                metrics[f"metric_{f}"] = round(rng.uniform(0, 100), 1)
+            batch.append((node_id, dict(metrics)))
+        yield batch
+
+
+class TestMetricsStreamBandwidth(unittest.TestCase):
+    def test_stream_vs_full_events(self) -> None:
+        batches = list(updates())
+        total_updates = sum(len(b) for b in batches)
+
+        start = time.perf_counter()
+        legacy_bytes = 0
+        for batch in batches:
+            for node_id, metrics in batch:
+                legacy_bytes += len(EventFactory.node_metrics_event(node_id, metrics).to_json())
+        legacy_s = time.perf_counter() - start
+
+        sizes = {}
+        timings = {}
+        for fmt in ["json"] + (["msgpack"] if HAS_MSGPACK else []):
+            stream = MetricsStream()
+            stream.add_subscriber("dashboard", None, fmt)
+            sent = []
+            start = time.perf_counter()
+            for batch in batches:    # One tick per batch (250 ms)
+                for node_id, metrics in batch:
+                    stream.update(node_id, metrics)
+                publish_tick(stream, lambda room, payload: sent.append(len(payload)))
+            timings[fmt] = time.perf_counter() - start
+            sizes[fmt] = sum(sent)
+
+        lines = [
+            f"\n{NODES} nodes x {UPDATES_PER_SECOND}/s for {SECONDS} s "
+            f"({total_updates:,} updates, {CHANGING}/{FIELDS} fields changing):",
+            f"  full events: {legacy_s * 1000:.0f} ms encode, "
+            f"{legacy_bytes / SECONDS / 1024:,.0f} KiB/s per client",
+        ]
+        for fmt, size in sizes.items():
+            lines.append(
+                f"  {fmt} deltas: {timings[fmt] * 1000:.0f} ms (update + diff + encode), "
+                f"{size / SECONDS / 1024:,.0f} KiB/s per client ({legacy_bytes / size:.1f}x less)"
+            )
+        print("\n".join(lines))
+        # msgpack mostly saves encode time: floats are 9 bytes, so float-heavy
+        # deltas come out about the size of compact JSON
+        self.assertLess(sizes["json"] * 3, legacy_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
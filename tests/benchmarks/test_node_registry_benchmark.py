@@ -0,0 +1,161 @@
+"""
+Node Registry Heartbeat Benchmark
+=================================
+
+Heartbeats/sec handled by the NodeService heartbeat path for a cluster
+of many registered nodes:
+
+- Previous implementation: plain dict, ISO timestamp rewrite and an INFO
+  log line per heartbeat
+- Write-through SQLite: one UPDATE and commit per heartbeat
+- ShardedNodeRegistry over the in-memory backend
+- ShardedNodeRegistry over SQLite, flushed in batches (one per second of
+  simulated traffic), single-threaded and from several threads
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_node_registry_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_REGISTRY_NODES=50000 pytest tests/benchmarks/test_node_registry_benchmark.py -s
+"""
+
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timezone
+from typing import Callable, List
+
+import pytest
+
+from opt.services.rpc import node_registry
+from opt.services.rpc.node_registry import ShardedNodeRegistry, SQLiteRegistryBackend
+
+pytestmark = pytest.mark.slow
+
+NODES = int(os.environ.get("DEBVISOR_BENCH_REGISTRY_NODES", "10000"))
+ROUNDS = int(os.environ.get("DEBVISOR_BENCH_REGISTRY_ROUNDS", "5"))
+THREADS = 4
+# One write-through pass over a prefix of the nodes
+WRITE_THROUGH_NODES = min(NODES, 2000)
+
+legacy_logger = logging.getLogger("debvisor.bench.legacy_rpc")
+_saved_level = node_registry.logger.level
+
+
+def setUpModule() -> None:
+    node_registry.logger.setLevel(logging.WARNING)
+    legacy_logger.addHandler(logging.NullHandler())
+    legacy_logger.propagate = False
+    legacy_logger.setLevel(logging.INFO)
+
+
+def tearDownModule() -> None:
+    node_registry.logger.setLevel(_saved_level)
+
+
+def throughput(beats: int, func: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    func()
+    return beats / (time.perf_counter() - start)
+
+
+class TestHeartbeatThroughput(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_registry(self, backend=None) -> ShardedNodeRegistry:
+        registry = ShardedNodeRegistry(backend)
+        self.node_ids = [
+            registry.register(f"node{n}.example", f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}").node_id
+            for n in range(NODES)
+        ]
+        return registry
+
+    def registry_rounds(self, registry: ShardedNodeRegistry, node_ids: List[str]) -> None:
+        for _ in range(ROUNDS):
+            for node_id in node_ids:
+                registry.heartbeat(node_id)
+            registry.flush()
+
+    def test_heartbeats_per_second(self) -> None:
+        beats = NODES * ROUNDS
+
+        # Previous NodeServiceImpl.Heartbeat body
+        nodes = {f"node-{n}": {"status": "registered", "last_heartbeat": None} for n in range(NODES)}
+
+        def legacy() -> None:
+            for _ in range(ROUNDS):
+                for node_id in nodes:
+                    nodes[node_id]["last_heartbeat"] = datetime.now(timezone.utc).isoformat()
+                    nodes[node_id]["status"] = "online"
+                    legacy_logger.info(f"Heartbeat received from node {node_id}")
+                    int(datetime.now(timezone.utc).timestamp())
+
+        legacy_rate = throughput(beats, legacy)
+
+        memory = self.make_registry()
+        memory_rate = throughput(beats, lambda: self.registry_rounds(memory, self.node_ids))
+
+        path = os.path.join(self.temp_dir, "nodes.db")
+        sqlite_registry = self.make_registry(SQLiteRegistryBackend(path))
+        sqlite_rate = throughput(beats, lambda: self.registry_rounds(sqlite_registry, self.node_ids))
+
+        def threaded() -> None:
+            chunks = [self.node_ids[t::THREADS] for t in range(THREADS)]
+            for _ in range(ROUNDS):
+                workers = [
+                    threading.Thread(target=lambda c=chunk: [sqlite_registry.heartbeat(i) for i in c])
+                    for chunk in chunks
+                ]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+                sqlite_registry.flush()
+
+        threaded_rate = throughput(beats, threaded)
+        stats = sqlite_registry.stats()
+        sqlite_registry.close()
+
+        conn = sqlite3.connect(path, isolation_level=None)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        stored_ids = self.node_ids[:WRITE_THROUGH_NODES]
+
+        def write_through() -> None:
+            for node_id in stored_ids:
+                conn.execute("BEGIN")
+                conn.execute(
+                    "UPDATE rpc_nodes SET last_heartbeat=?, status=? WHERE node_id=?",
+                    (time.time(), "online", node_id),
+                )
+                conn.execute("COMMIT")
+
+        write_through_rate = throughput(WRITE_THROUGH_NODES, write_through)
+        persisted = conn.execute("SELECT COUNT(*) FROM rpc_nodes WHERE status='online'").fetchone()[0]
+        conn.close()
+
+        print(
+            f"\nHeartbeats/sec, {NODES:,} nodes x {ROUNDS} rounds:"
+            f"\n  previous (dict + isoformat + INFO log): {legacy_rate:,.0f}"
+            f"\n  write-through SQLite (commit per heartbeat): {write_through_rate:,.0f}"
+            f"\n  sharded registry, in-memory backend: {memory_rate:,.0f} "
+            f"({memory_rate / legacy_rate:.1f}x previous)"
+            f"\n  sharded registry, SQLite batched: {sqlite_rate:,.0f} "
+            f"({sqlite_rate / write_through_rate:.0f}x write-through)"
+            f"\n  sharded registry, SQLite batched, {THREADS} threads: {threaded_rate:,.0f}"
+            f"\n  {stats['flushes']} flushes, {stats['rows_written']:,} rows written"
+        )
+        self.assertEqual(persisted, NODES)
+        self.assertEqual(stats["heartbeats"], 2 * beats)
+        self.assertGreater(memory_rate, legacy_rate)
+        self.assertGreater(sqlite_rate, write_through_rate)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Node Status API Benchmark
+=========================
+
+Request latency of GET /nodes/api/status on a file-backed SQLite
+database of many nodes:
+
+- Previous implementation: Node.query.all(), to_dict() and jsonify per request
+- Snapshot cache: full body served from the materialized snapshot
+- Conditional request: If-None-Match with the current ETag (304)
+- Projected page: fields=node_id,status with a keyset page of 100
+- After a heartbeat: incremental snapshot refresh for one changed node
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_node_status_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_NODE_STATUS_NODES=50000 pytest tests/benchmarks/test_node_status_benchmark.py -s
+"""
+
+import inspect
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask, jsonify
+
+from opt.web.panel.extensions import db
+from opt.web.panel.models.node import Node, get_node_status_cache
+from opt.web.panel.routes import nodes as nodes_routes
+
+pytestmark = pytest.mark.slow
+
+NODES = int(os.environ.get("DEBVISOR_BENCH_NODE_STATUS_NODES", "10000"))
+REQUESTS = int(os.environ.get("DEBVISOR_BENCH_NODE_STATUS_REQUESTS", "20"))
+
+
+def legacy_status():
+    """The previous api_nodes_status."""
+    return jsonify([node.to_dict() for node in Node.query.all()])
+
+
+class TestNodeStatusLatency(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = (
+            f"sqlite:///{os.path.join(self.temp_dir, 'nodes.db')}"
+        )
+        self.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        db.init_app(self.app)
+        self.app.add_url_rule("/legacy", view_func=legacy_status)
+        self.app.add_url_rule(
+            "/nodes/api/status", view_func=inspect.unwrap(nodes_routes.api_nodes_status)
+        )
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+        now = datetime.now(timezone.utc)
+        db.session.execute(Node.__table__.insert(), [
+            {
+                "node_id": f"uuid-{n}", "hostname": f"node{n}.example",
+                "ip_address": f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}",
+                "status": "online" if n % 10 else "offline", "cpu_cores": 16,
+                "memory_gb": 64, "storage_gb": 2000, "region": f"r{n % 4}",
+                "last_heartbeat": now, "created_at": now, "updated_at": now,
+            }
+            for n in range(NODES)
+        ])
+        db.session.commit()
+        self.client = self.app.test_client()
+
+    def tearDown(self) -> None:
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def median_ms(self, url: str, status: int = 200, **headers) -> float:
+        samples = []
+        for _ in range(REQUESTS):
+            db.session.expire_all()
+            start = time.perf_counter()
+            response = self.client.get(url, headers=headers)
+            samples.append(time.perf_counter() - start)
+            self.assertEqual(response.status_code, status)
+        return statistics.median(samples) * 1000
+
+    def test_status_latency(self) -> None:
+        legacy_ms = self.median_ms("/legacy")
+        legacy_bytes = len(self.client.get("/legacy").data)
+
+        start = time.perf_counter()
+        first = self.client.get("/nodes/api/status")
+        build_ms = (time.perf_counter() - start) * 1000
+        self.assertEqual(len(first.get_json()), NODES)
+        cached_ms = self.median_ms("/nodes/api/status")
+        not_modified_ms = self.median_ms("/nodes/api/status", 304, **{"If-None-Match": first.headers["ETag"]})
+
+        page_url = "/nodes/api/status?fields=node_id,status&limit=100"
+        page_ms = self.median_ms(page_url)
+        page_bytes = len(self.client.get(page_url).data)
+
+        heartbeat_samples = []
+        for n in range(1, REQUESTS + 1):
+            Node.query.get(n).update_heartbeat()
+            start = time.perf_counter()
+            self.assertEqual(self.client.get("/nodes/api/status").status_code, 200)
+            heartbeat_samples.append(time.perf_counter() - start)
+        heartbeat_ms = statistics.median(heartbeat_samples) * 1000
+        stats = get_node_status_cache().stats
+
+        print(
+            f"\nGET /nodes/api/status, {NODES:,} nodes (median of {REQUESTS}):"
+            f"\n  previous (query + to_dict): {legacy_ms:.1f} ms, {legacy_bytes / 1024:.0f} KiB"
+            f"\n  first request (snapshot build): {build_ms:.1f} ms"
+            f"\n  cached snapshot: {cached_ms:.2f} ms ({legacy_ms / cached_ms:.0f}x)"
+            f"\n  304 Not Modified: {not_modified_ms:.2f} ms ({legacy_ms / not_modified_ms:.0f}x)"
+            f"\n  fields=node_id,status limit=100: {page_ms:.2f} ms, {page_bytes / 1024:.1f} KiB"
+            f"\n  after one heartbeat: {heartbeat_ms:.1f} ms "
+            f"({stats['incremental']} incremental refreshes, {stats['rebuilds']} rebuilds)"
+        )
+        self.assertLess(cached_ms * 5, legacy_ms)
+        self.assertLess(not_modified_ms * 5, legacy_ms)
+        self.assertLess(heartbeat_ms, legacy_ms)
+        self.assertEqual(stats["rebuilds"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Cluster Placement Benchmark
+===========================
+
+Key -> node placement on a large cluster:
+
+- Previous ConsistentHashRing: SHA-256 per key, bisect.insort per virtual
+  node (built for a prefix of the nodes only, as insort is quadratic)
+- PlacementRing in "ring", "maglev" and "rendezvous" modes
+
+Reports rebuild time, scalar and batch lookups/sec, batch replica
+lookups/sec, and the share of keys that move when 1% of the nodes leave
+or join (the ideal is the share of keys those nodes own; Maglev trades
+some extra movement for its balance and O(1) lookups).
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_placement_ring_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_PLACEMENT_NODES=20000 pytest tests/benchmarks/test_placement_ring_benchmark.py -s
+"""
+
+import os
+import time
+import unittest
+from typing import Callable, List, Tuple
+
+import pytest
+
+from opt.services.cluster.large_cluster_optimizer import ConsistentHashRing, PlacementRing
+
+pytestmark = pytest.mark.slow
+
+NODES = int(os.environ.get("DEBVISOR_BENCH_PLACEMENT_NODES", "5000"))
+KEYS = int(os.environ.get("DEBVISOR_BENCH_PLACEMENT_KEYS", "200000"))
+LEGACY_NODES = min(NODES, 1000)
+SCALAR_KEYS = 20000
+# Rendezvous scores every node per key
+RENDEZVOUS_KEYS = 20000
+# Allowed key movement on churn, as a multiple of the ideal
+MOVEMENT_SLACK = {"ring": 1.5, "rendezvous": 1.5, "maglev": 6.0}
+
+
+def timed(func: Callable[[], object]) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def moved(before: List[str], after: List[str]) -> float:
+    return sum(a != b for a, b in zip(before, after)) / len(before)
+
+
+class TestPlacementThroughput(unittest.TestCase):
+    def setUp(self) -> None:
+        self.nodes = [f"node-{n:05d}" for n in range(NODES)]
+        self.keys = [f"workload-{n}:vm-{n * 7}" for n in range(KEYS)]
+        self.churn = self.nodes[:: 100]    # 1% of the nodes
+
+    def test_legacy_ring(self) -> None:
+        ring = ConsistentHashRing()
+        nodes = self.nodes[:LEGACY_NODES]
+
+        def build() -> None:
+            for node in nodes:
+                ring.add_node(node)
+
+        build_s, _ = timed(build)
+        keys = self.keys[:SCALAR_KEYS]
+        lookup_s, _ = timed(lambda: [ring.get_node(k) for k in keys])
+        replicas_s, _ = timed(lambda: [ring.get_nodes(k, 3) for k in keys])
+        print(
+            f"\nConsistentHashRing, {LEGACY_NODES:,} nodes x {ring.replicas} vnodes:"
+            f"\n  build: {build_s * 1000:,.0f} ms"
+            f"\n  lookups/sec: {len(keys) / lookup_s:,.0f}"
+            f"\n  3-replica lookups/sec: {len(keys) / replicas_s:,.0f}"
+        )
+
+    def run_mode(self, mode: str, key_count: int) -> None:
+        keys = self.keys[:key_count]
+        ring = PlacementRing(self.nodes, mode=mode)
+        build_s, _ = timed(ring.rebuild)
+
+        scalar = keys[:SCALAR_KEYS]
+        scalar_s, single = timed(lambda: [ring.get_node(k) for k in scalar])
+        batch_s, before = timed(lambda: ring.get_node_many(keys))
+        replicas_s, _ = timed(lambda: ring.get_nodes_many(keys, 3))
+        self.assertEqual(single, before[: len(scalar)])
+
+        churn = set(self.churn)
+        owned = sum(1 for node in before if node in churn) / len(keys)
+        for node in self.churn:
+            ring.remove_node(node)
+        rebuild_s, _ = timed(ring.rebuild)
+        after_leave = ring.get_node_many(keys)
+        for node in self.churn:
+            ring.add_node(node)
+        after_join = ring.get_node_many(keys)
+
+        leave = moved(before, after_leave)
+        print(
+            f"\nPlacementRing mode={mode}, {NODES:,} nodes, {len(keys):,} keys:"
+            f"\n  build: {build_s * 1000:,.0f} ms, rebuild after churn: {rebuild_s * 1000:,.0f} ms"
+            f"\n  lookups/sec: scalar {len(scalar) / scalar_s:,.0f}, batch {len(keys) / batch_s:,.0f}"
+            f"\n  3-replica batch lookups/sec: {len(keys) / replicas_s:,.0f}"
+            f"\n  keys moved when {len(self.churn)} nodes leave: {leave:.2%} "
+            f"(ideal {owned:.2%}), rejoin restores placement: {after_join == before}"
+        )
+        self.assertEqual(after_join, before)
+        self.assertLessEqual(leave, owned * MOVEMENT_SLACK[mode] + 0.005)
+
+    def test_ring(self) -> None:
+        self.run_mode("ring", KEYS)
+
+    def test_maglev(self) -> None:
+        self.run_mode("maglev", KEYS)
+
+    def test_rendezvous(self) -> None:
+        self.run_mode("rendezvous", min(KEYS, RENDEZVOUS_KEYS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Quantile Sketch Benchmark
+=========================
+
+Documents the accuracy / memory / throughput tradeoff of ``DDSketch``
+against the exact, sort-based percentile that ``LatencySLI`` used before:
+
+- Worst relative error of p50..p99.9 for several relative accuracies and
+  latency-like distributions, with the number of bins each needs
+- Insertion throughput (per value and bulk) and percentile query cost
+  versus sorting all data points on every evaluation
+- Cost of merging per-node sketches into a fleet-wide percentile
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_quantile_sketch_benchmark.py -v -s
+"""
+
+import os
+import random
+import time
+import unittest
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import pytest
+
+from opt.services.quantile_sketch import DDSketch, merge_sketches
+
+pytestmark = pytest.mark.slow
+
+SAMPLES = int(os.environ.get("DEBVISOR_BENCH_SKETCH_SAMPLES", "200000"))
+QUANTILES = [0.5, 0.9, 0.95, 0.99, 0.999]
+ACCURACIES = [0.005, 0.01, 0.02, 0.05]
+
+
+def latency_samples(count: int) -> Dict[str, List[float]]:
+    rng = random.Random(17)
+    return {
+        "lognormal": [rng.lognormvariate(3, 1.2) for _ in range(count)],
+        # Bimodal: cache hits around 2 ms, misses around 150 ms
+        "bimodal": [
+            rng.gauss(2, 0.3) if rng.random() < 0.8 else rng.gauss(150, 30)
+            for _ in range(count)
+        ],
+        "pareto": [rng.paretovariate(1.1) for _ in range(count)],
+    }
+
+
+def legacy_percentile(points: List[Dict[str, float]], percentile: float) -> float:
+    """The previous LatencySLI.get_percentile: sort all latencies per call."""
+    latencies = sorted(p["latency_ms"] for p in points)
+    index = int(len(latencies) * (percentile / 100))
+    return latencies[min(index, len(latencies) - 1)]
+
+
+class TestSketchAccuracy(unittest.TestCase):
+    """Relative error and memory for each accuracy setting."""
+
+    def test_accuracy_table(self) -> None:
+        data = latency_samples(SAMPLES)
+        print(f"\nDDSketch accuracy ({SAMPLES:,} samples, worst error over p50..p99.9):")
+        print(f"  {'distribution':12s} {'alpha':>6s} {'max err':>9s} {'bins':>6s}")
+        for name, values in data.items():
+            values = [max(v, 0.0) for v in values]
+            ordered = sorted(values)
+            for alpha in ACCURACIES:
+                sketch = DDSketch(relative_accuracy=alpha)
+                sketch.add_many(values)
+                worst = 0.0
+                for q, estimate in zip(QUANTILES, sketch.quantiles(QUANTILES)):
+                    expected = ordered[int(q * (len(ordered) - 1))]
+                    worst = max(worst, abs(estimate - expected) / expected)
+                print(f"  {name:12s} {alpha:6.3f} {worst * 100:8.3f}% {len(sketch.bins):6d}")
+                self.assertLessEqual(worst, alpha * 1.0001)
+
+
+class TestSketchThroughput(unittest.TestCase):
+    """Insertion, query and merge cost."""
+
+    def test_insert_and_query(self) -> None:
+        values = [max(v, 0.0) for v in latency_samples(SAMPLES)["lognormal"]]
+        points = [
+            {"timestamp": datetime.now(timezone.utc), "latency_ms": v} for v in values
+        ]
+
+        sketch = DDSketch()
+        start = time.perf_counter()
+        for value in values:
+            sketch.add(value)
+        add_us = (time.perf_counter() - start) / len(values) * 1e6
+
+        bulk = DDSketch()
+        start = time.perf_counter()
+        bulk.add_many(values)
+        bulk_us = (time.perf_counter() - start) / len(values) * 1e6
+
+        start = time.perf_counter()
+        for _ in range(10):
+            legacy_percentile(points, 99)
+        legacy_ms = (time.perf_counter() - start) / 10 * 1000
+
+        start = time.perf_counter()
+        for _ in range(1000):
+            sketch.percentile(99)
+        query_ms = (time.perf_counter() - start) / 1000 * 1000
+
+        print(
+            f"\nInsert: add {add_us:.2f} us/value, add_many {bulk_us:.3f} us/value"
+            f"\np99 query over {len(values):,} values: sort {legacy_ms:.2f} ms, "
+            f"sketch {query_ms * 1000:.1f} us ({legacy_ms / query_ms:,.0f}x)"
+        )
+        self.assertLess(query_ms * 20, legacy_ms)
+
+    def test_fleet_merge(self) -> None:
+        rng = random.Random(3)
+        nodes = []
+        for _ in range(100):
+            sketch = DDSketch()
+            sketch.add_many([rng.lognormvariate(3, 1.2) for _ in range(2_000)])
+            nodes.append(sketch)
+
+        start = time.perf_counter()
+        fleet = merge_sketches(nodes)
+        merge_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"\nMerged 100 node sketches ({fleet.count:,} values, {len(fleet.bins)} bins) "
+            f"in {merge_ms:.2f} ms; fleet p99 {fleet.percentile(99):.1f} ms"
+        )
+        self.assertEqual(fleet.count, 200_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+RPC Authentication Overhead Benchmark
+=====================================
+
+Per-call cost of AuthenticationInterceptor._authenticate for a client that
+presents the same credential on every call:
+
+- API key: PBKDF2 (600k iterations) + storage lookup on every call, against
+  the verified-credential cache
+- JWT (HS256): signature and claim verification on every call, against the
+  cache
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_rpc_auth_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_AUTH_CALLS=100000 pytest tests/benchmarks/test_rpc_auth_benchmark.py -s
+"""
+
+import hashlib
+import logging
+import os
+import time
+import unittest
+from collections import namedtuple
+from typing import Any, Dict, Optional
+
+import jwt
+import pytest
+
+from opt.services.rpc.auth import AuthenticationInterceptor
+
+pytestmark = pytest.mark.slow
+
+CALLS = int(os.environ.get("DEBVISOR_BENCH_AUTH_CALLS", "20000"))
+UNCACHED_API_KEY_CALLS = 3
+
+CallDetails = namedtuple("CallDetails", ["method", "invocation_metadata"])
+
+
+def setUpModule() -> None:
+    # Measure at the production log level, not pytest's capture level
+    logging.getLogger("opt.services.rpc.auth").setLevel(logging.INFO)
+
+
+def tearDownModule() -> None:
+    logging.getLogger("opt.services.rpc.auth").setLevel(logging.NOTSET)
+
+
+class StoreInterceptor(AuthenticationInterceptor):
+    """Interceptor backed by a one-entry in-memory key store."""
+
+    key_hash = ""
+
+    def _lookup_key_hash(self, key_hash: str) -> Optional[Dict[str, Any]]:
+        if key_hash == self.key_hash:
+            return {"key_id": "key_bench", "principal_id": "ci-system", "permissions": ["node:list"]}
+        return None
+
+
+def make_interceptor(cache: bool, jwt_secret: Optional[str] = None) -> StoreInterceptor:
+    os.environ.setdefault("API_KEY_SALT", "benchmark-salt")
+    interceptor = StoreInterceptor({"credential_cache_enabled": cache})
+    interceptor.jwt_public_key = jwt_secret
+    return interceptor
+
+
+def per_call_us(interceptor: AuthenticationInterceptor, details: CallDetails, calls: int) -> float:
+    assert interceptor._authenticate(details) is not None
+    start = time.perf_counter()
+    for _ in range(calls):
+        interceptor._authenticate(details)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+class TestApiKeyOverhead(unittest.TestCase):
+    def test_api_key(self) -> None:
+        uncached = make_interceptor(cache=False)
+        cached = make_interceptor(cache=True)
+        api_key = "dv_" + "ab" * 32
+        key_hash = hashlib.pbkdf2_hmac(
+            "sha256", api_key.encode(), cached.api_key_salt, cached.API_KEY_HASH_ITERATIONS
+        ).hex()
+        uncached.key_hash = cached.key_hash = key_hash
+        details = CallDetails("/debvisor.NodeService/ListNodes", (("authorization", f"Bearer {api_key}"),))
+
+        slow_us = per_call_us(uncached, details, UNCACHED_API_KEY_CALLS)
+        fast_us = per_call_us(cached, details, CALLS)
+        print(
+            f"\nAPI key auth per call: uncached {slow_us / 1000:.1f} ms, "
+            f"cached {fast_us:.1f} us ({slow_us / fast_us:,.0f}x); {cached.credential_cache.stats()}"
+        )
+        self.assertLess(fast_us * 100, slow_us)
+
+
+class TestJwtOverhead(unittest.TestCase):
+    def test_jwt(self) -> None:
+        secret = "benchmark-secret-at-least-32-bytes-long"
+        token = jwt.encode(
+            {"sub": "alice", "exp": int(time.time()) + 3600, "permissions": ["node:list"]}, secret
+        )
+        details = CallDetails("/debvisor.NodeService/ListNodes", (("authorization", f"Bearer {token}"),))
+
+        slow_us = per_call_us(make_interceptor(cache=False, jwt_secret=secret), details, CALLS // 10)
+        fast_us = per_call_us(make_interceptor(cache=True, jwt_secret=secret), details, CALLS)
+        print(
+            f"\nJWT auth per call: uncached {slow_us:.1f} us, cached {fast_us:.1f} us "
+            f"({slow_us / fast_us:.1f}x)"
+        )
+        self.assertLess(fast_us, slow_us)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+"""
+Adaptive Sampler Decision Benchmark
+===================================
+
+Tail-sampling decisions/sec of AdaptiveSampler.finish_trace() for a mixed
+workload (several services, a few spans per trace, some errors, eight
+rules):
+
+- Previous implementation: every rule condition re-parsed with str.split
+  on every decision, and a list latency reservoir trimmed with pop(0)
+  and sorted for the p99 on every trace
+- Rule conditions compiled once, latency p99 from streaming DDSketch
+  windows
+
+Head-based should_sample() checks/sec are reported too. Absolute rates
+are printed, not asserted, since they depend on the machine; the tests
+check that the compiled path beats the previous one.
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_sampler_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_SAMPLER_TRACES=200000 \\
+        pytest tests/benchmarks/test_sampler_benchmark.py -s
+"""
+
+import os
+import random
+import time
+import unittest
+from functools import partial
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from opt.services.observability.cardinality_controller import AdaptiveSampler
+
+pytestmark = pytest.mark.slow
+
+TRACES = int(os.environ.get("DEBVISOR_BENCH_SAMPLER_TRACES", "50000"))
+CHUNK = 5000    # Pending traces per round (below max_pending_traces)
+SERVICES = ["api", "payment", "cart", "search", "auth"]
+EXTRA_RULES = [
+    ("checkout", "operation_name == 'POST /checkout'", 0.5),
+    ("fanout", "span_count > 6", 0.2),
+    ("server_errors", "http.status_code == '503'", 1.0),
+    ("long", "total_duration_ms >= 2000", 0.3),
+]
+
+Trace = Tuple[str, str, str, List[Tuple[float, bool]], Dict[str, str]]
+
+
+def legacy_condition(condition: str, context: Dict[str, Any]) -> bool:
+    """The previous string matcher, parsing the condition on every call."""
+    if condition == "True":
+        return True
+    if condition == "False":
+        return False
+    for op in ["==", "!=", ">=", "<=", ">", "<"]:
+        if op in condition:
+            parts = condition.split(op, 1)
+            if len(parts) == 2:
+                left = parts[0].strip()
+                right = parts[1].strip()
+                left_val = context.get(left, left)
+                if right.startswith("'") and right.endswith("'"):
+                    right_val: Any = right[1:-1]
+                elif right == "True":
+                    right_val = True
+                elif right == "False":
+                    right_val = False
+                elif right.replace(".", "").isdigit():
+                    right_val = float(right)
+                else:
+                    right_val = context.get(right, right)
+                if op == "==":
+                    return left_val == right_val
+                elif op == "!=":
+                    return left_val != right_val
+                elif op == ">":
+                    return float(left_val) > float(right_val)
+                elif op == "<":
+                    return float(left_val) < float(right_val)
+                elif op == ">=":
+                    return float(left_val) >= float(right_val)
+                elif op == "<=":
+                    return float(left_val) <= float(right_val)
+    return False
+
+
+class LegacySampler(AdaptiveSampler):
+    """Previous condition parsing and sorted list reservoir."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.latency_reservoir: Dict[str, List[float]] = {}
+
+    def add_rule(self, name, condition, sample_rate, priority=50):
+        rule = super().add_rule(name, condition, sample_rate, priority)
+        for existing in self.rules:
+            existing.predicate = partial(legacy_condition, existing.condition)
+        return rule
+
+    def _update_latency_threshold(self, service: str, latency: float) -> None:
+        reservoir = self.latency_reservoir.setdefault(service, [])
+        reservoir.append(latency)
+        if len(reservoir) > self.reservoir_size:
+            reservoir.pop(0)
+        if len(reservoir) >= 100:
+            sorted_latencies = sorted(reservoir)
+            idx = int(len(sorted_latencies) * self.latency_percentile_target / 100)
+            self.latency_thresholds[service] = sorted_latencies[min(idx, len(sorted_latencies) - 1)]
+
+
+def make_traces(count: int) -> List[Trace]:
+    rng = random.Random(23)
+    traces = []
+    for n in range(count):
+        service = rng.choice(SERVICES)
+        operation = rng.choice(["GET /items", "POST /checkout", "GET /cart", "POST /login"])
+        spans = [(rng.expovariate(1 / 40), rng.random() < 0.005) for _ in range(rng.randint(1, 8))]
+        tags = {"http.status_code": rng.choice(["200"] * 30 + ["404", "503"])}
+        traces.append((f"trace-{n}", service, operation, spans, tags))
+    return traces
+
+
+def decisions_per_second(sampler: AdaptiveSampler, traces: List[Trace]) -> float:
+    """finish_trace() rate; traces are started and given spans untimed."""
+    elapsed = 0.0
+    for offset in range(0, len(traces), CHUNK):
+        chunk = traces[offset:offset + CHUNK]
+        for trace_id, service, operation, spans, tags in chunk:
+            sampler.start_trace(trace_id, service, operation)
+            for number, (duration_ms, has_error) in enumerate(spans):
+                sampler.add_span(trace_id, f"span-{number}", duration_ms, has_error, tags)
+        start = time.perf_counter()
+        for trace in chunk:
+            sampler.finish_trace(trace[0])
+        elapsed += time.perf_counter() - start
+    return len(traces) / elapsed
+
+
+def make_sampler(cls: type) -> AdaptiveSampler:
+    sampler = cls(base_sample_rate=0.05, max_traces_per_second=10 ** 9)
+    for name, condition, rate in EXTRA_RULES:
+        sampler.add_rule(name, condition, rate)
+    return sampler
+
+
+class TestSamplerDecisions(unittest.TestCase):
+    def test_decisions_per_second(self) -> None:
+        traces = make_traces(TRACES)
+        random.seed(1)
+        legacy = make_sampler(LegacySampler)
+        legacy_rate = decisions_per_second(legacy, traces)
+        random.seed(1)
+        compiled = make_sampler(AdaptiveSampler)
+        compiled_rate = decisions_per_second(compiled, traces)
+
+        print(
+            f"\nTail-sampling decisions/sec ({TRACES:,} traces, {len(compiled.rules)} rules):"
+            f"\n  previous: {legacy_rate:,.0f}"
+            f"\n  compiled: {compiled_rate:,.0f} ({compiled_rate / legacy_rate:.1f}x)"
+            f"\n  sampled: {legacy.sampled_traces:,} -> {compiled.sampled_traces:,}"
+            f"\n  p99 thresholds (ms): "
+            + ", ".join(
+                f"{service} {legacy.latency_thresholds[service]:.0f} -> "
+                f"{compiled.latency_thresholds[service]:.0f}"
+                for service in SERVICES
+            )
+        )
+        for service in SERVICES:
+            self.assertAlmostEqual(
+                compiled.latency_thresholds[service], legacy.latency_thresholds[service],
+                delta=0.2 * legacy.latency_thresholds[service],
+            )
+        self.assertGreater(compiled_rate, legacy_rate)
+
+    def test_head_checks_per_second(self) -> None:
+        rng = random.Random(29)
+        contexts = []
+        for _ in range(TRACES):
+            latency_ms = rng.expovariate(1 / 40)
+            contexts.append({
+                "service": rng.choice(SERVICES), "latency_ms": latency_ms,
+                "total_duration_ms": latency_ms, "operation_name": "GET /items",
+                "span_count": rng.randint(1, 8), "http.status_code": "200",
+            })
+        rates = []
+        for cls in (LegacySampler, AdaptiveSampler):
+            sampler = make_sampler(cls)
+            start = time.perf_counter()
+            for context in contexts:
+                sampler.should_sample(context)
+            rates.append(len(contexts) / (time.perf_counter() - start))
+
+        print(
+            f"\nHead should_sample() checks/sec: {rates[0]:,.0f} -> {rates[1]:,.0f} "
+            f"({rates[1] / rates[0]:.1f}x)"
+        )
+        self.assertGreater(rates[1], rates[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
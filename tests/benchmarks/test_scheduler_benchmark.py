@@ -0,0 +1,134 @@
+"""
+Bin-Packing Scheduler Latency Benchmark
+=======================================
+
+Scheduling latency on fleets of 1k, 5k and 10k nodes:
+
+- BinPackingScheduler: scores every node in Python and sorts all
+  candidates for each replica (timed for a prefix of the replicas and
+  reported per replica, as full runs take minutes at 10k nodes)
+- IndexedBinPackingScheduler: vectorized scoring, top-k selection,
+  incremental re-scoring, for one 500-replica workload and for a
+  schedule_batch() of many small workloads
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_scheduler_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_SCHEDULER_NODES=1000,5000,10000,50000 pytest tests/benchmarks/test_scheduler_benchmark.py -s
+"""
+
+import logging
+import os
+import random
+import time
+import unittest
+from typing import Dict, List
+
+import pytest
+
+from opt.services.cluster import large_cluster_optimizer
+from opt.services.cluster.large_cluster_optimizer import (
+    BinPackingScheduler,
+    IndexedBinPackingScheduler,
+    NodeInfo,
+    NodeState,
+    SchedulingStrategy,
+    WorkloadRequest,
+)
+
+pytestmark = pytest.mark.slow
+
+FLEETS = [int(n) for n in os.environ.get("DEBVISOR_BENCH_SCHEDULER_NODES", "1000,5000,10000").split(",")]
+REPLICAS = int(os.environ.get("DEBVISOR_BENCH_SCHEDULER_REPLICAS", "500"))
+LEGACY_REPLICAS = 20
+BATCH_WORKLOADS = 1000
+GIB = 1024 ** 3
+
+_saved_level = large_cluster_optimizer.logger.level
+
+
+def setUpModule() -> None:
+    large_cluster_optimizer.logger.setLevel(logging.ERROR)
+
+
+def tearDownModule() -> None:
+    large_cluster_optimizer.logger.setLevel(_saved_level)
+
+
+def make_fleet(count: int) -> Dict[str, NodeInfo]:
+    rng = random.Random(count)
+    return {
+        f"node-{n:05d}": NodeInfo(
+            node_id=f"node-{n:05d}",
+            hostname=f"node-{n:05d}",
+            ip_address="10.0.0.1",
+            state=NodeState.HEALTHY if rng.random() > 0.05 else NodeState.DEGRADED,
+            zone=f"zone-{n % 3}",
+            cpu_capacity=64000,
+            memory_capacity=256 * GIB,
+            cpu_allocatable=62000,
+            memory_allocatable=250 * GIB,
+            cpu_used=rng.randrange(0, 40000),
+            memory_used=rng.randrange(0, 160) * GIB,
+            pod_count=rng.randrange(0, 60),
+            labels={"disk": "ssd"} if n % 4 == 0 else {},
+            conditions={"Ready": True, "MemoryPressure": False, "DiskPressure": False},
+        )
+        for n in range(count)
+    }
+
+
+def batch_requests() -> List[WorkloadRequest]:
+    return [
+        WorkloadRequest(
+            f"svc-{n}", 250 * (n % 8 + 1), (n % 4 + 1) * GIB, replicas=n % 5 + 1,
+            labels_required={"disk": "ssd"} if n % 10 == 0 else None,
+        )
+        for n in range(BATCH_WORKLOADS)
+    ]
+
+
+class TestSchedulingLatency(unittest.TestCase):
+    def test_latency(self) -> None:
+        strategy = SchedulingStrategy.BALANCED
+        for count in FLEETS:
+            legacy = BinPackingScheduler(strategy)
+            legacy.update_nodes(make_fleet(count))
+            start = time.perf_counter()
+            expected = legacy.schedule("web", 1000, 2 * GIB, LEGACY_REPLICAS)
+            legacy_per_replica = (time.perf_counter() - start) / LEGACY_REPLICAS
+
+            indexed = IndexedBinPackingScheduler(strategy)
+            indexed.update_nodes(make_fleet(count))
+            start = time.perf_counter()
+            indexed._build()
+            build_s = time.perf_counter() - start
+            start = time.perf_counter()
+            decisions = indexed.schedule("web", 1000, 2 * GIB, REPLICAS)
+            workload_s = time.perf_counter() - start
+
+            requests = batch_requests()
+            start = time.perf_counter()
+            placed = indexed.schedule_batch(requests)
+            batch_s = time.perf_counter() - start
+            replicas = sum(len(d) for d in placed)
+
+            print(
+                f"\n{count:,} nodes:"
+                f"\n  BinPackingScheduler: {legacy_per_replica * 1000:,.1f} ms/replica "
+                f"(~{legacy_per_replica * REPLICAS:,.1f} s for {REPLICAS} replicas)"
+                f"\n  indexed: build {build_s * 1000:,.1f} ms, {REPLICAS} replicas in "
+                f"{workload_s * 1000:,.1f} ms ({workload_s / REPLICAS * 1e6:,.0f} us/replica, "
+                f"{legacy_per_replica * REPLICAS / workload_s:,.0f}x)"
+                f"\n  indexed schedule_batch: {BATCH_WORKLOADS} workloads / {replicas:,} replicas "
+                f"in {batch_s * 1000:,.0f} ms"
+            )
+            self.assertEqual(
+                [d.selected_node for d in decisions[:LEGACY_REPLICAS]],
+                [d.selected_node for d in expected],
+            )
+            self.assertEqual(len(decisions), REPLICAS)
+            self.assertLess(workload_s, legacy_per_replica * REPLICAS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+WebSocket Event Fan-out Benchmark
+=================================
+
+Dashboard-style load on WebSocketEventBus: thousands of clients, each
+watching node status for the whole cluster and metrics for a handful of
+nodes, with a stream of mostly node-metric events.
+
+- Previous bus: every publish checks every client under the lock and each
+  delivery re-encodes the event (``json.dumps(asdict(event))``)
+- Indexed bus: publish visits only interested clients, encodes once and
+  coalesces metrics a client has not consumed yet
+
+Usage:
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_websocket_fanout_benchmark.py -v -s
+    RUN_BENCHMARKS=1 DEBVISOR_BENCH_WS_CLIENTS=5000 pytest tests/benchmarks/test_websocket_fanout_benchmark.py -s
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+import unittest
+from dataclasses import asdict
+from typing import Dict, List
+
+import pytest
+
+from opt.web.panel.websocket_events import (
+    ClientSubscription,
+    EventFactory,
+    WebSocketEvent,
+    WebSocketEventBus,
+)
+
+pytestmark = pytest.mark.slow
+
+CLIENTS = int(os.environ.get("DEBVISOR_BENCH_WS_CLIENTS", "2000"))
+EVENTS = int(os.environ.get("DEBVISOR_BENCH_WS_EVENTS", "5000"))
+NODES = 500
+WATCHED = 5
+LEGACY_EVENTS = 200    # The previous bus is timed on a prefix of the stream
+
+
+class LegacyEventBus:
+    """The previous publish path: scan every client, queue every match."""
+
+    def __init__(self) -> None:
+        self.subscriptions: Dict[str, ClientSubscription] = {}
+        self.message_queues: Dict[str, asyncio.Queue] = {}
+        self.lock = asyncio.Lock()
+        self.event_history: List[WebSocketEvent] = []
+
+    async def subscribe(self, client_id, event_types, user_id, permissions) -> None:
+        self.subscriptions[client_id] = ClientSubscription(
+            client_id=client_id, event_types=set(event_types),
+            user_id=user_id, permissions=set(permissions),
+        )
+        self.message_queues[client_id] = asyncio.Queue()
+
+    async def publish(self, event: WebSocketEvent) -> None:
+        self.event_history.append(event)
+        if len(self.event_history) > 1000:
+            self.event_history.pop(0)
+        async with self.lock:
+            for client_id, subscription in self.subscriptions.items():
+                if subscription.is_allowed(event):
+                    self.message_queues[client_id].put_nowait(event)
+
+
+def workload(seed: int = 1):
+    rng = random.Random(seed)
+    events = []
+    for n in range(EVENTS):
+        node = f"node{rng.randrange(NODES)}"
+        if n % 10 == 0:
+            events.append(EventFactory.node_status_event(node, rng.choice(["online", "degraded"])))
+        else:
+            events.append(EventFactory.node_metrics_event(node, {"cpu": rng.random(), "mem": rng.random()}))
+    watched = [[f"node{rng.randrange(NODES)}" for _ in range(WATCHED)] for _ in range(CLIENTS)]
+    return events, watched
+
+
+def drain_legacy(bus: LegacyEventBus) -> int:
+    sent = 0
+    for queue in bus.message_queues.values():
+        while not queue.empty():
+            json.dumps(asdict(queue.get_nowait()))    # Encoded per client
+            sent += 1
+    return sent
+
+
+def drain_indexed(bus: WebSocketEventBus) -> int:
+    sent = 0
+    for queue in bus.message_queues.values():
+        event = queue.get_nowait()
+        while event is not None:
+            event.to_json()
+            sent += 1
+            event = queue.get_nowait()
+    return sent
+
+
+class TestFanOutThroughput(unittest.TestCase):
+    """Publish + deliver cost per event, previous vs indexed bus."""
+
+    def test_dashboard_load(self) -> None:
+        asyncio.run(self._run())
+
+    async def _run(self) -> None:
+        events, watched = workload()
+        legacy = LegacyEventBus()
+        # The previous bus has no resource filter: clients take every metric
+        for n in range(CLIENTS):
+            await legacy.subscribe(f"c{n}", ["node_status", "node_metrics"], "u", ["view:*"])
+        start = time.perf_counter()
+        for event in events[:LEGACY_EVENTS]:
+            await legacy.publish(event)
+        legacy_publish = (time.perf_counter() - start) / LEGACY_EVENTS
+        legacy_sent = drain_legacy(legacy)
+        legacy_total = (time.perf_counter() - start) / LEGACY_EVENTS
+
+        events, _ = workload()    # Fresh events: no cached encodings
+        indexed = WebSocketEventBus()
+        for n in range(CLIENTS):
+            await indexed.subscribe(f"c{n}", ["node_status"], "u", ["view:*"])
+            await indexed.subscribe(
+                f"c{n}", ["node_status", "node_metrics"], "u", ["view:*"], resource_ids=watched[n]
+            )
+        start = time.perf_counter()
+        for event in events:
+            await indexed.publish(event)
+        indexed_publish = (time.perf_counter() - start) / EVENTS
+        indexed_sent = drain_indexed(indexed)
+        indexed_total = (time.perf_counter() - start) / EVENTS
+        stats = indexed.get_stats()
+
+        print(
+            f"\n{CLIENTS:,} clients, {EVENTS:,} events (90% node metrics):"
+            f"\n  previous ({LEGACY_EVENTS} events): publish {legacy_publish * 1e6:,.0f} us/event, "
+            f"with delivery {1 / legacy_total:,.0f} events/s, {legacy_sent:,} messages"
+            f"\n  indexed: publish {indexed_publish * 1e6:,.0f} us/event, "
+            f"with delivery {1 / indexed_total:,.0f} events/s, {indexed_sent:,} messages "
+            f"({stats['coalesced']:,} metric updates coalesced)"
+            f"\n  speed-up: {legacy_total / indexed_total:.0f}x"
+        )
+        self.assertLess(indexed_total * 5, legacy_total)
+
+
+class TestStatusBroadcast(unittest.TestCase):
+    """Events every client receives: encoding once still matters."""
+
+    def test_broadcast(self) -> None:
+        asyncio.run(self._run())
+
+    async def _run(self) -> None:
+        legacy = LegacyEventBus()
+        indexed = WebSocketEventBus()
+        for n in range(CLIENTS):
+            await legacy.subscribe(f"c{n}", ["node_status"], "u", ["view:*"])
+            await indexed.subscribe(f"c{n}", ["node_status"], "u", ["view:*"])
+        count = 50
+
+        start = time.perf_counter()
+        for n in range(count):
+            await legacy.publish(EventFactory.node_status_event(f"node{n}", "online", {"n": n}))
+        drain_legacy(legacy)
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for n in range(count):
+            await indexed.publish(EventFactory.node_status_event(f"node{n}", "online", {"n": n}))
+        drain_indexed(indexed)
+        indexed_s = time.perf_counter() - start
+
+        print(
+            f"\nBroadcast to {CLIENTS:,} clients: previous {legacy_s / count * 1000:.2f} ms/event, "
+            f"indexed {indexed_s / count * 1000:.2f} ms/event ({legacy_s / indexed_s:.1f}x)"
+        )
+        self.assertLess(indexed_s, legacy_s)
+
+
+if __name__ == "__main__":
+    unittest.main()
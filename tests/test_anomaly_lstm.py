@@ -0,0 +1,261 @@
+"""
+LSTM Anomaly Detection - Test Suite
+
+Covers the batched LSTM kernels (BPTT gradients, closed-form readout),
+stacked training and inference across models, background training and
+weight persistence in AnomalyDetectionEngine.
+
+Author: DebVisor Development Team
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from opt.services.anomaly import lstm
+from opt.services.anomaly.core import (
+    AnomalyConfig,
+    AnomalyDetectionEngine,
+    AnomalyType,
+    DetectionMethod,
+    LSTMModel,
+    MetricType,
+    predict_lstm_models,
+    train_lstm_models,
+)
+
+
+def sine(count: int, phase: float = 0.0) -> np.ndarray:
+    return 50 + 10 * np.sin(np.arange(count) * 0.2 + phase)
+
+
+class TestKernels(unittest.TestCase):
+    """Batched forward/backward passes."""
+
+    def test_gradients_match_finite_differences(self) -> None:
+        """BPTT gradients agree with numerical ones for stacked models."""
+        rng = np.random.default_rng(0)
+        params = lstm.init_params(2, hidden_size=3, rng=rng)
+        X = rng.normal(size=(2, 3, 4, 1))
+        Y = rng.normal(size=(2, 3, 4, 1))
+
+        def loss() -> float:
+            outputs, _ = lstm.forward(params, X)
+            return float(((outputs - Y) ** 2).sum())
+
+        outputs, cache = lstm.forward(params, X, keep_cache=True)
+        grads = lstm.backward(params, cache, 2 * (outputs - Y))
+        for name in lstm.PARAM_NAMES:
+            flat = params[name].reshape(-1)
+            for index in range(0, flat.size, max(1, flat.size // 12)):
+                original = flat[index]
+                flat[index] = original + 1e-6
+                upper = loss()
+                flat[index] = original - 1e-6
+                lower = loss()
+                flat[index] = original
+                numeric = (upper - lower) / 2e-6
+                self.assertAlmostEqual(grads[name].reshape(-1)[index], numeric, places=5)
+
+    def test_stacked_forward_matches_single(self) -> None:
+        """A stack of models computes the same outputs as each model alone."""
+        rng = np.random.default_rng(1)
+        params = lstm.init_params(3, rng=rng)
+        X = rng.normal(size=(3, 2, 6, 1))
+        stacked, _ = lstm.forward(params, X)
+        for m, single in enumerate(lstm.unstack_params(params)):
+            alone, _ = lstm.forward({k: v[None] for k, v in single.items()}, X[m : m + 1])
+            np.testing.assert_allclose(stacked[m], alone[0])
+
+    def test_fit_reduces_loss(self) -> None:
+        """Training improves on the closed-form readout alone."""
+        series = (sine(150) - 50) / 10
+        X, Y = lstm.sliding_windows(series, 10)
+        params = lstm.init_params(1, rng=np.random.default_rng(2))
+        readout_only = lstm.fit(
+            {k: v.copy() for k, v in params.items()}, X[None, ..., None], Y[None, ..., None], epochs=0
+        )
+        trained = lstm.fit(params, X[None, ..., None], Y[None, ..., None], epochs=50)
+        self.assertLess(trained[0], readout_only[0])
+
+
+class TestLSTMModel(unittest.TestCase):
+    """Model-level training and prediction."""
+
+    def test_predict_matches_forward(self) -> None:
+        """The sequential fast path equals the batched forward pass."""
+        model = LSTMModel(seed=3)
+        model.train(sine(120).tolist(), epochs=5)
+        sequence = sine(10, phase=1.0).tolist()
+        norm = [(x - model.stats["mean"]) / model.stats["std"] for x in sequence]
+        expected = model.forward(norm)[-1] * model.stats["std"] + model.stats["mean"]
+        self.assertAlmostEqual(model.predict(sequence), expected, places=9)
+
+    def test_untrained_model_returns_last_value(self) -> None:
+        """Untrained models fall back to persistence forecasting."""
+        self.assertEqual(LSTMModel().predict([1.0, 2.0, 3.0]), 3.0)
+
+    def test_stacked_training_and_inference(self) -> None:
+        """Models trained and evaluated together match individual predictions."""
+        models = [LSTMModel(seed=n) for n in range(4)]
+        train_lstm_models(models, [sine(100, phase=n).tolist() for n in range(4)], epochs=20)
+
+        sequences = [sine(10, phase=n + 2.0).tolist() for n in range(4)]
+        batched = predict_lstm_models(models, sequences)
+        for model, sequence, value in zip(models, sequences, batched):
+            self.assertTrue(model.is_trained)
+            self.assertAlmostEqual(model.predict(sequence), value, places=9)
+
+    def test_forecast_accuracy(self) -> None:
+        """A trained model forecasts a sine wave far better than its amplitude."""
+        model = LSTMModel(seed=4)
+        model.train(sine(200).tolist())
+        prediction = model.predict(sine(200)[-10:].tolist())
+        self.assertAlmostEqual(prediction, sine(201)[-1], delta=3.0)
+
+
+class TestEngineLSTM(unittest.TestCase):
+    """Engine training, detection, background pool and persistence."""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = AnomalyConfig(config_dir=self.temp_dir, lstm_workers=0)
+        self.engine = AnomalyDetectionEngine(config=self.config)
+        self.key = ("vm-1", MetricType.CPU_USAGE)
+        for value in sine(100):
+            self.engine.add_metric("vm-1", MetricType.CPU_USAGE, float(value))
+
+    def tearDown(self) -> None:
+        self.engine.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_train_and_detect(self) -> None:
+        """A trained model flags a spike and accepts the expected value."""
+        self.assertTrue(self.engine.train_model("vm-1", MetricType.CPU_USAGE))
+        self.assertTrue(self.engine.lstm_models[self.key].is_trained)
+
+        expected = float(sine(101)[-1])
+        self.engine.add_metric("vm-1", MetricType.CPU_USAGE, expected)
+        alerts = self.engine.detect_anomalies(
+            "vm-1", MetricType.CPU_USAGE, expected, methods=[DetectionMethod.LSTM]
+        )
+        self.assertEqual(alerts, [])
+
+        self.engine.add_metric("vm-1", MetricType.CPU_USAGE, 90.0)
+        alerts = self.engine.detect_anomalies(
+            "vm-1", MetricType.CPU_USAGE, 90.0, methods=[DetectionMethod.LSTM]
+        )
+        self.assertEqual(len(alerts), 1)
+        self.assertEqual(alerts[0].detection_method, DetectionMethod.LSTM)
+        self.assertEqual(alerts[0].anomaly_type, AnomalyType.SPIKE)
+
+    def test_detection_schedules_background_training(self) -> None:
+        """Detection without a model queues training on the worker pool."""
+        self.config.lstm_workers = 1
+        self.assertIsNone(
+            self.engine._detect_lstm_anomaly(
+                "vm-1", MetricType.CPU_USAGE, 50.0,
+                self.engine.establish_baseline("vm-1", MetricType.CPU_USAGE),
+            )
+        )
+        self.engine.close()    # Waits for the queued job
+        self.assertTrue(self.engine.lstm_models[self.key].is_trained)
+        self.assertEqual(self.engine._lstm_pending, set())
+
+    def test_pending_series_not_queued_twice(self) -> None:
+        """A series already being trained is skipped."""
+        self.engine._lstm_pending.add(self.key)
+        self.assertIsNone(self.engine.schedule_lstm_training([self.key]))
+
+    def test_train_models_and_batch_predict(self) -> None:
+        """Many series train together and forecast in one pass."""
+        for value in sine(100, phase=1.0):
+            self.engine.add_metric("vm-2", MetricType.CPU_USAGE, float(value))
+        self.engine.add_metric("vm-3", MetricType.CPU_USAGE, 1.0)    # Too short
+
+        self.assertEqual(self.engine.train_models(), 2)
+        predictions = self.engine.predict_lstm()
+
+        self.assertEqual(set(predictions), {self.key, ("vm-2", MetricType.CPU_USAGE)})
+        history = [p.value for p in self.engine.metrics[self.key]][-10:]
+        self.assertAlmostEqual(
+            predictions[self.key], self.engine.lstm_models[self.key].predict(history), places=9
+        )
+
+    def test_weights_persist_across_restarts(self) -> None:
+        """A new engine on the same config_dir reloads trained models."""
+        self.engine.train_model("vm-1", MetricType.CPU_USAGE)
+        restarted = AnomalyDetectionEngine(config=self.config)
+
+        model = restarted.lstm_models[self.key]
+        original = self.engine.lstm_models[self.key]
+        self.assertTrue(model.is_trained)
+        self.assertEqual(model.stats, original.stats)
+        sequence = sine(10, phase=0.5).tolist()
+        self.assertEqual(model.predict(sequence), original.predict(sequence))
+
+    def test_concurrent_saves_leave_valid_file(self) -> None:
+        """Saves racing from several threads never corrupt the model file."""
+        self.engine.train_model("vm-1", MetricType.CPU_USAGE)
+        barrier = threading.Barrier(8)
+
+        def save() -> None:
+            barrier.wait()
+            self.engine.save_lstm_models()
+
+        threads = [threading.Thread(target=save) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(os.listdir(self.temp_dir), [self.config.lstm_model_file])
+        self.assertEqual(AnomalyDetectionEngine(config=self.config).load_lstm_models(), 1)
+
+    def test_background_saves_debounced(self) -> None:
+        """One save per drained queue, not one per trained batch."""
+        self.config.lstm_workers = 2
+        keys = [(f"vm-{n}", MetricType.CPU_USAGE) for n in range(2, 10)]
+        for resource_id, metric in keys:
+            for value in sine(100, phase=0.1):
+                self.engine.add_metric(resource_id, metric, float(value))
+
+        with mock.patch.object(
+            self.engine, "save_lstm_models", wraps=self.engine.save_lstm_models
+        ) as save:
+            futures = [self.engine.schedule_lstm_training([key]) for key in keys]
+            self.assertEqual(sum(future.result() for future in futures), len(keys))
+            self.engine.close()
+
+        self.assertLessEqual(save.call_count, 3)
+        restarted = AnomalyDetectionEngine(config=self.config)
+        self.assertEqual(set(restarted.lstm_models), set(keys))
+
+    def test_mixed_hidden_sizes_logged(self) -> None:
+        """Models of a minority hidden size are skipped with a warning."""
+        self.engine.train_model("vm-1", MetricType.CPU_USAGE)
+        small = LSTMModel(hidden_size=4)
+        train_lstm_models([small], [sine(100)], epochs=2)
+        self.engine.lstm_models[("vm-9", MetricType.CPU_USAGE)] = small
+        self.engine.lstm_models[("vm-8", MetricType.CPU_USAGE)] = self.engine.lstm_models[self.key]
+
+        with self.assertLogs(self.engine.logger, "WARNING") as logs:
+            self.engine.save_lstm_models()
+        self.assertIn("Not saving 1 LSTM models", logs.output[0])
+        restarted = AnomalyDetectionEngine(config=self.config)
+        self.assertNotIn(("vm-9", MetricType.CPU_USAGE), restarted.lstm_models)
+
+    def test_corrupt_model_file_ignored(self) -> None:
+        """An unreadable model file does not break engine start-up."""
+        with open(f"{self.temp_dir}/{self.config.lstm_model_file}", "wb") as fh:
+            fh.write(b"not a model file")
+        self.assertEqual(AnomalyDetectionEngine(config=self.config).lstm_models, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
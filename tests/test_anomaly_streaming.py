@@ -0,0 +1,204 @@
+"""
+Streaming Anomaly Detection - Test Suite
+
+Covers the incremental baselines (Welford, EWMA, streaming quantiles),
+vectorised batch scoring and the engine's detect_batch entry point.
+
+Author: DebVisor Development Team
+"""
+
+import unittest
+
+import numpy as np
+
+from opt.services.anomaly.core import (
+    AnomalyDetectionEngine,
+    AnomalyType,
+    DetectionMethod,
+    MetricType,
+    SeverityLevel,
+)
+from opt.services.anomaly.streaming import StreamingAnomalyDetector
+
+
+class TestIncrementalBaselines(unittest.TestCase):
+    """Incremental state must match the batch statistics."""
+
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(7)
+
+    def test_welford_matches_numpy(self) -> None:
+        """Mean, stddev, min and max equal the exact values."""
+        detector = StreamingAnomalyDetector()
+        data = self.rng.normal(50, 5, size=(500, 3))
+        for row in data:
+            detector.process_batch(["vm-1", "vm-2", "vm-3"], MetricType.CPU_USAGE, row)
+
+        for n, resource_id in enumerate(["vm-1", "vm-2", "vm-3"]):
+            baseline = detector.baseline(resource_id, MetricType.CPU_USAGE)
+            self.assertAlmostEqual(baseline.mean, data[:, n].mean(), places=9)
+            self.assertAlmostEqual(baseline.stddev, data[:, n].std(ddof=1), places=9)
+            self.assertEqual(baseline.min_value, data[:, n].min())
+            self.assertEqual(baseline.max_value, data[:, n].max())
+            self.assertEqual(baseline.sample_count, 500)
+
+    def test_ewma_matches_recurrence(self) -> None:
+        """EWMA state equals the sequential recurrence."""
+        detector = StreamingAnomalyDetector(ewma_alpha=0.3)
+        values = self.rng.normal(10, 2, size=200)
+        detector.process_batch(["vm-1"] * len(values), MetricType.DISK_IO, values)
+
+        ewma = values[0]
+        for value in values[1:]:
+            ewma = 0.3 * value + 0.7 * ewma
+        series = detector.series_id("vm-1", MetricType.DISK_IO)
+        self.assertAlmostEqual(detector.ewma[series], ewma, places=9)
+
+    def test_quantiles_converge(self) -> None:
+        """Streaming quartiles approach the exact ones."""
+        detector = StreamingAnomalyDetector()
+        values = self.rng.normal(100, 10, size=20_000)
+        for chunk in np.array_split(values, 100):
+            detector.process_batch(["vm-1"] * len(chunk), MetricType.CPU_USAGE, chunk)
+
+        baseline = detector.baseline("vm-1", MetricType.CPU_USAGE)
+        exact = np.percentile(values, [25, 50, 75, 95])
+        estimates = [baseline.p25, baseline.p50, baseline.p75, baseline.p95]
+        for estimate, expected in zip(estimates, exact):
+            self.assertAlmostEqual(estimate, expected, delta=2.5)    # 0.25 sigma
+
+    def test_aging_bounds_weight(self) -> None:
+        """Long histories are aged so the baseline follows a level shift."""
+        detector = StreamingAnomalyDetector(max_samples=100)
+        detector.process_batch(["vm-1"] * 1000, MetricType.CPU_USAGE, self.rng.normal(10, 1, 1000))
+        detector.process_batch(["vm-1"] * 1000, MetricType.CPU_USAGE, self.rng.normal(50, 1, 1000))
+
+        series = detector.series_id("vm-1", MetricType.CPU_USAGE)
+        self.assertLessEqual(detector.count[series], 100)
+        self.assertGreater(detector.baseline("vm-1", MetricType.CPU_USAGE).mean, 45)
+
+
+class TestBatchDetection(unittest.TestCase):
+    """Vectorised scoring over many series."""
+
+    def setUp(self) -> None:
+        self.rng = np.random.default_rng(11)
+        self.detector = StreamingAnomalyDetector()
+        self.resources = [f"vm-{n:03d}" for n in range(50)]
+        for _ in range(100):
+            self.detector.process_batch(
+                self.resources, MetricType.CPU_USAGE, self.rng.normal(50, 2, 50)
+            )
+
+    def test_spike_detected(self) -> None:
+        """Only the spiking series is flagged, with legacy alert semantics."""
+        values = np.full(50, 50.0)
+        values[7] = 95.0
+        result = self.detector.process_batch(self.resources, MetricType.CPU_USAGE, values)
+
+        self.assertEqual(np.flatnonzero(result.anomalous).tolist(), [7])
+        self.assertGreater(result.z_scores[7], 3.0)
+        methods = {alert.detection_method for alert in result.alerts}
+        self.assertEqual(methods, {DetectionMethod.Z_SCORE, DetectionMethod.IQR, DetectionMethod.EWMA})
+        for alert in result.alerts:
+            self.assertEqual(alert.resource_id, "vm-007")
+            self.assertEqual(alert.anomaly_type, AnomalyType.SPIKE)
+            self.assertEqual(alert.metric_type, MetricType.CPU_USAGE)
+        z_alert = next(a for a in result.alerts if a.detection_method == DetectionMethod.Z_SCORE)
+        self.assertEqual(z_alert.severity, SeverityLevel.CRITICAL)
+
+    def test_dip_and_method_subset(self) -> None:
+        """Dips are detected and disabled methods stay silent."""
+        values = np.full(50, 50.0)
+        values[3] = 5.0
+        result = self.detector.process_batch(
+            self.resources, MetricType.CPU_USAGE, values, methods=[DetectionMethod.Z_SCORE]
+        )
+
+        self.assertEqual(len(result.alerts), 1)
+        self.assertEqual(result.alerts[0].anomaly_type, AnomalyType.DIP)
+        self.assertFalse(result.ewma_scores.any())
+
+    def test_warmup_not_scored(self) -> None:
+        """New series are not scored before min_samples values."""
+        result = self.detector.process_batch(["new-vm"] * 5, MetricType.CPU_USAGE, [1, 1, 1, 1, 1000])
+        self.assertFalse(result.anomalous.any())
+
+    def test_repeated_series_in_batch_is_sequential(self) -> None:
+        """One batch with several samples per series equals sample-by-sample processing."""
+        rng = np.random.default_rng(5)
+        ids = rng.choice(["a", "b", "c"], size=300).tolist()
+        values = rng.normal(20, 3, size=300)
+        values[250] = 80.0
+
+        batched = StreamingAnomalyDetector()
+        one_by_one = StreamingAnomalyDetector()
+        result = batched.process_batch(ids, "memory_usage", values)
+        scores = [
+            one_by_one.process_batch([rid], "memory_usage", [value]).z_scores[0]
+            for rid, value in zip(ids, values)
+        ]
+
+        np.testing.assert_allclose(result.z_scores, scores)
+        self.assertTrue(result.anomalous[250])
+        for resource_id in "abc":
+            expected = one_by_one.baseline(resource_id, MetricType.MEMORY_USAGE)
+            actual = batched.baseline(resource_id, MetricType.MEMORY_USAGE)
+            for name in ("mean", "stddev", "p25", "p50", "p75", "p95", "sample_count"):
+                self.assertAlmostEqual(getattr(actual, name), getattr(expected, name), places=9)
+
+    def test_alert_timestamps_from_samples(self) -> None:
+        """Alerts carry the sample timestamp."""
+        values = np.full(50, 50.0)
+        values[0] = 120.0
+        result = self.detector.process_batch(
+            self.resources, MetricType.CPU_USAGE, values, timestamps=np.full(50, 1_700_000_000.0)
+        )
+        self.assertEqual(result.alerts[0].timestamp.timestamp(), 1_700_000_000.0)
+
+    def test_mismatched_columns_rejected(self) -> None:
+        """Column lengths must agree."""
+        with self.assertRaises(ValueError):
+            self.detector.process_batch(["vm-000"], [MetricType.CPU_USAGE] * 2, [1.0])
+
+
+class TestEngineBatch(unittest.TestCase):
+    """AnomalyDetectionEngine.detect_batch integration."""
+
+    def test_detect_batch_records_alerts(self) -> None:
+        """Batch alerts join the engine's alert list and baselines are exposed."""
+        engine = AnomalyDetectionEngine()
+        rng = np.random.default_rng(3)
+        methods = [DetectionMethod.Z_SCORE, DetectionMethod.IQR]
+        for _ in range(50):
+            engine.detect_batch(
+                ["vm-1", "vm-2"], MetricType.CPU_USAGE, rng.normal(40, 1, 2), methods=methods
+            )
+        before = len(engine.alerts)
+
+        result = engine.detect_batch(
+            ["vm-1", "vm-2"], MetricType.CPU_USAGE, [40.0, 90.0], methods=methods
+        )
+
+        self.assertEqual(result.anomaly_count, 1)
+        self.assertEqual(len(engine.alerts), before + 2)
+        self.assertTrue(all(a.resource_id == "vm-2" for a in engine.alerts[before:]))
+        baseline = engine.get_streaming_baseline("vm-1", MetricType.CPU_USAGE)
+        self.assertEqual(baseline.sample_count, 51)
+        self.assertIsNone(engine.get_streaming_baseline("vm-9", MetricType.CPU_USAGE))
+
+    def test_record_history(self) -> None:
+        """Samples can also be kept in the per-series history."""
+        engine = AnomalyDetectionEngine()
+        engine.detect_batch(
+            ["vm-1", "vm-1"], MetricType.DISK_IO, [1.0, 2.0],
+            timestamps=[1_700_000_000.0, 1_700_000_060.0], record_history=True,
+        )
+
+        points = engine.metrics[("vm-1", MetricType.DISK_IO)]
+        self.assertEqual([p.value for p in points], [1.0, 2.0])
+        self.assertEqual(points[1].timestamp.timestamp(), 1_700_000_060.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,10 +44,10 @@ class TestAPIKey(unittest.TestCase):
 
     def setUp(self) -> None:
         self.key = APIKey(
-            _key_id = "key-123",
+            key_id="key-123",
             key_hash="hashed_secret",
-            _service_name = "payment-service",
-            _description = "Payment API Key",
+            service_name="payment-service",
+            description="Payment API Key",
         )
 
     def test_initial_status(self) -> None:
@@ -0,0 +1,168 @@
+"""
+Audit Chain Verification - Test Suite
+
+Covers streaming (windowed) verification, signed checkpoints with
+incremental re-verification, checkpoint tamper detection, progress
+reporting and parallel signature checks.
+"""
+
+import unittest
+from typing import Any, Dict, List
+
+from flask import Flask
+
+from opt.web.panel.extensions import db
+from opt.web.panel.models.audit_log import AuditChainCheckpoint, AuditLog
+
+
+class AuditChainVerifyTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+        self.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        self.app.config["SECRET_KEY"] = "test-key"
+        db.init_app(self.app)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+    def tearDown(self) -> None:
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def log(self, count: int) -> None:
+        for n in range(count):
+            AuditLog.log_operation(
+                user_id=1,
+                operation="update",
+                resource_type="node",
+                action=f"Updated node {n}",
+                request_data={"n": n},
+                compliance_tags=["SOC2"],
+            )
+
+    def tamper(self, row_id: int, **values: Any) -> None:
+        db.session.execute(
+            AuditLog.__table__.update().where(AuditLog.__table__.c.id == row_id).values(**values)
+        )
+        db.session.commit()
+
+
+class TestStreamingVerification(AuditChainVerifyTestCase):
+    def test_windows_cover_whole_chain(self) -> None:
+        """Small windows verify every row and report throughput."""
+        self.log(25)
+        result = AuditLog.verify_chain(window_size=4)
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["total_checked"], 25)
+        self.assertEqual(result["verified_up_to_id"], 25)
+        self.assertGreater(result["rows_per_second"], 0)
+
+    def test_tamper_across_window_boundary(self) -> None:
+        """A modified row in a later window is reported by id."""
+        self.log(12)
+        self.tamper(9, action="Deleted node 8")
+        result = AuditLog.verify_chain(window_size=4)
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["broken_at_id"], 9)
+        self.assertEqual(result["reason"], "Signature mismatch")
+
+    def test_relinked_row_breaks_chain(self) -> None:
+        """A row whose previous_hash no longer links is a chain break."""
+        self.log(6)
+        self.tamper(5, previous_hash="f" * 64)
+        result = AuditLog.verify_chain(window_size=2)
+        self.assertEqual(result["broken_at_id"], 5)
+        self.assertIn("Chain broken", result["reason"])
+
+    def test_progress_reported_per_window(self) -> None:
+        """The progress callback sees every window."""
+        self.log(10)
+        updates: List[Dict[str, Any]] = []
+        AuditLog.verify_chain(window_size=3, progress=updates.append)
+        self.assertEqual([u["checked"] for u in updates], [3, 6, 9, 10])
+        self.assertEqual(updates[-1]["max_id"], 10)
+        self.assertIn("rows_per_second", updates[-1])
+
+    def test_parallel_workers_match_sequential(self) -> None:
+        """Worker processes give the same results, including failures."""
+        self.log(20)
+        self.assertEqual(AuditLog.verify_chain(window_size=8, workers=2)["total_checked"], 20)
+        self.tamper(14, status="failure")
+        result = AuditLog.verify_chain(window_size=8, workers=2)
+        self.assertEqual(result["broken_at_id"], 14)
+        self.assertEqual(result["reason"], "Signature mismatch")
+
+
+class TestCheckpoints(AuditChainVerifyTestCase):
+    def test_incremental_checks_only_new_rows(self) -> None:
+        """After a checkpoint, only newer rows are verified."""
+        self.log(10)
+        self.assertTrue(AuditLog.verify_chain(save_checkpoint=True)["valid"])
+        checkpoint = AuditChainCheckpoint.latest()
+        self.assertEqual(checkpoint.verified_up_to_id, 10)
+        self.assertEqual(checkpoint.total_verified, 10)
+
+        self.log(5)
+        result = AuditLog.verify_chain(incremental=True, save_checkpoint=True)
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["total_checked"], 5)
+        self.assertEqual(result["total_verified"], 15)
+        self.assertEqual(result["resumed_from_id"], 10)
+        self.assertEqual(AuditChainCheckpoint.latest().verified_up_to_id, 15)
+
+        result = AuditLog.verify_chain(incremental=True, save_checkpoint=True)
+        self.assertEqual(result["total_checked"], 0)
+        self.assertEqual(AuditChainCheckpoint.query.count(), 2)
+
+    def test_new_rows_must_link_to_checkpoint(self) -> None:
+        """The first row after a checkpoint is checked against its hash."""
+        self.log(4)
+        AuditLog.verify_chain(save_checkpoint=True)
+        self.log(2)
+        self.tamper(5, previous_hash="0" * 64)
+        result = AuditLog.verify_chain(incremental=True)
+        self.assertEqual(result["broken_at_id"], 5)
+
+    def test_intermediate_checkpoints(self) -> None:
+        """Long runs record checkpoints as they go."""
+        self.log(25)
+        AuditLog.verify_chain(save_checkpoint=True, window_size=5, checkpoint_interval=10)
+        ids = [c.verified_up_to_id for c in AuditChainCheckpoint.query.order_by(AuditChainCheckpoint.id)]
+        self.assertEqual(ids, [10, 20, 25])
+
+    def test_forged_checkpoint_rejected(self) -> None:
+        """A checkpoint altered without the key is not trusted."""
+        self.log(6)
+        AuditLog.verify_chain(save_checkpoint=True)
+        checkpoint = AuditChainCheckpoint.latest()
+        checkpoint.verified_up_to_id = 3
+        checkpoint.last_hash = AuditLog.query.get(3).signature
+        db.session.commit()
+
+        result = AuditLog.verify_chain(incremental=True)
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["reason"], "Checkpoint signature mismatch")
+
+    def test_rewritten_anchor_row_detected(self) -> None:
+        """Changing the checkpointed row's hash invalidates the checkpoint."""
+        self.log(6)
+        AuditLog.verify_chain(save_checkpoint=True)
+        self.tamper(6, signature="a" * 64)
+        result = AuditLog.verify_chain(incremental=True)
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["reason"], "Checkpoint anchor mismatch")
+
+    def test_full_run_still_sees_old_tampering(self) -> None:
+        """Incremental runs skip verified rows; a full run does not."""
+        self.log(6)
+        AuditLog.verify_chain(save_checkpoint=True)
+        self.tamper(2, action="Rewritten")
+        self.assertTrue(AuditLog.verify_chain(incremental=True)["valid"])
+        self.assertEqual(AuditLog.verify_chain()["broken_at_id"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
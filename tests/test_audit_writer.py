@@ -0,0 +1,234 @@
+"""
+Audit Log Writer - Test Suite
+
+Covers the asynchronous, batched audit writer: chain order and signatures
+equivalent to synchronous writes, flush/close semantics, the graceful
+shutdown hook, retries after database errors and buffer back-pressure.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from typing import Optional
+from unittest.mock import patch
+
+from flask import Flask
+
+from opt.web.panel.extensions import db
+from opt.web.panel.graceful_shutdown import GracefulShutdownManager
+from opt.web.panel.models import audit_log
+from opt.web.panel.models.audit_log import (
+    GENESIS_HASH,
+    AuditLog,
+    AuditLogWriter,
+    get_audit_writer,
+    start_audit_writer,
+    stop_audit_writer,
+)
+
+
+class AuditWriterTestCase(unittest.TestCase):
+    """File-backed SQLite so the writer thread shares the database."""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = (
+            f"sqlite:///{os.path.join(self.temp_dir, 'audit.db')}"
+        )
+        self.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        db.init_app(self.app)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+    def tearDown(self) -> None:
+        stop_audit_writer()
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def log(self, n: int, **kwargs) -> Optional[AuditLog]:
+        return AuditLog.log_operation(
+            user_id=1,
+            operation="read",
+            resource_type="node",
+            action=f"Viewed node {n}",
+            resource_id=f"node-{n}",
+            request_data={"page": n},
+            compliance_tags=["GDPR"],
+            **kwargs,
+        )
+
+    def rows(self):
+        db.session.expire_all()
+        return AuditLog.query.order_by(AuditLog.id.asc()).all()
+
+
+class TestAsyncWrites(AuditWriterTestCase):
+    def test_queued_entries_form_valid_chain(self) -> None:
+        """Batched entries are chained in enqueue order and verify."""
+        writer = start_audit_writer(
+            self.app, shutdown_manager=GracefulShutdownManager(), batch_size=7
+        )
+        returned = [self.log(n) for n in range(30)]
+        self.assertTrue(writer.flush(timeout=10))
+
+        self.assertEqual(returned, [None] * 30)
+        rows = self.rows()
+        self.assertEqual([r.action for r in rows], [f"Viewed node {n}" for n in range(30)])
+        self.assertEqual(rows[0].previous_hash, GENESIS_HASH)
+        for prev, row in zip(rows, rows[1:]):
+            self.assertEqual(row.previous_hash, prev.signature)
+        result = AuditLog.verify_chain()
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["total_checked"], 30)
+        self.assertGreaterEqual(writer.stats()["batches"], 5)
+
+    def test_sync_and_async_entries_share_one_chain(self) -> None:
+        """Entries written before, during and after the writer chain together."""
+        self.log(0)
+        start_audit_writer(self.app, shutdown_manager=GracefulShutdownManager())
+        self.log(1)
+        self.log(2, sync=True)
+        get_audit_writer().flush(timeout=10)
+        stop_audit_writer()
+        self.log(3)
+
+        self.assertEqual(len(self.rows()), 4)
+        self.assertTrue(AuditLog.verify_chain()["valid"])
+
+    def test_signatures_match_synchronous_path(self) -> None:
+        """The writer signs exactly what the synchronous path would."""
+        created_at = audit_log.datetime(2025, 1, 1, tzinfo=audit_log.timezone.utc)
+        row = AuditLog.build_row(
+            user_id=None, operation="delete", resource_type="vm", action="x",
+            request_data={"force": True}, created_at=created_at,
+        )
+        entry = audit_log._signing_entry(row, GENESIS_HASH)
+        self.assertEqual(entry.actor_id, "system")
+        self.assertEqual(entry.details["request"], {"force": True})
+        self.assertEqual(entry.timestamp, "2025-01-01T00:00:00+00:00")
+
+    def test_tampering_detected(self) -> None:
+        writer = start_audit_writer(self.app, shutdown_manager=GracefulShutdownManager())
+        for n in range(5):
+            self.log(n)
+        writer.flush(timeout=10)
+
+        row = self.rows()[2]
+        row.action = "Viewed nothing"
+        db.session.commit()
+        result = AuditLog.verify_chain()
+        self.assertFalse(result["valid"])
+        self.assertEqual(result["broken_at_id"], row.id)
+
+    def test_flush_interval_bounds_latency(self) -> None:
+        """Entries are committed within the flush interval without flush()."""
+        writer = start_audit_writer(
+            self.app, shutdown_manager=GracefulShutdownManager(), flush_interval=0.05
+        )
+        self.log(0)
+        deadline = time.monotonic() + 5
+        while writer.written < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.rows()), 1)
+
+
+class TestShutdown(AuditWriterTestCase):
+    def test_close_flushes_buffer(self) -> None:
+        writer = start_audit_writer(
+            self.app, shutdown_manager=GracefulShutdownManager(), flush_interval=60
+        )
+        for n in range(10):
+            self.log(n)
+        stop_audit_writer()
+
+        self.assertFalse(writer.running)
+        self.assertEqual(len(self.rows()), 10)
+        self.assertIsNone(get_audit_writer())
+
+    def test_graceful_shutdown_hook_flushes_before_db_cleanup(self) -> None:
+        manager = GracefulShutdownManager()
+        order = []
+        manager.register_cleanup_hook(
+            "database", lambda: order.append(("database", len(self.rows())))
+        )
+        start_audit_writer(self.app, shutdown_manager=manager, flush_interval=60)
+        for n in range(3):
+            self.log(n)
+
+        manager._run_cleanup_hooks()
+
+        self.assertEqual(order, [("database", 3)])
+        self.assertEqual(manager.metrics.hooks_failed, 0)
+
+
+class TestFailures(AuditWriterTestCase):
+    def test_failed_batch_retried(self) -> None:
+        writer = AuditLogWriter(self.app, retry_interval=0.01)
+        original = writer._insert_chained
+        calls = []
+
+        def flaky(batch):
+            calls.append(len(batch))
+            if len(calls) == 1:
+                raise RuntimeError("database is locked")
+            original(batch)
+
+        with patch.object(writer, "_insert_chained", side_effect=flaky):
+            writer.start()
+            writer.enqueue(AuditLog.build_row(None, "op", "res", "act"))
+            self.assertTrue(writer.flush(timeout=10))
+        writer.close()
+
+        self.assertEqual(writer.failed_batches, 1)
+        self.assertEqual(len(self.rows()), 1)
+        self.assertTrue(AuditLog.verify_chain()["valid"])
+
+    def test_full_buffer_raises(self) -> None:
+        writer = AuditLogWriter(self.app, max_pending=2, enqueue_timeout=0.01)
+        writer.enqueue(AuditLog.build_row(None, "op", "res", "act"))
+        writer.enqueue(AuditLog.build_row(None, "op", "res", "act"))
+        with self.assertRaises(RuntimeError):
+            writer.enqueue(AuditLog.build_row(None, "op", "res", "act"))
+
+    def test_concurrent_producers(self) -> None:
+        """Many request threads enqueue without breaking the chain."""
+        writer = start_audit_writer(
+            self.app, shutdown_manager=GracefulShutdownManager(), batch_size=50
+        )
+
+        def produce(offset: int) -> None:
+            for n in range(50):
+                self.log(offset + n)
+
+        threads = [threading.Thread(target=produce, args=(t * 100,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.flush(timeout=10)
+
+        result = AuditLog.verify_chain()
+        self.assertTrue(result["valid"])
+        self.assertEqual(result["total_checked"], 200)
+
+
+class TestShutdownHookPriority(unittest.TestCase):
+    def test_hooks_run_by_priority(self) -> None:
+        manager = GracefulShutdownManager()
+        order = []
+        manager.register_cleanup_hook("late", lambda: order.append("late"), priority=90)
+        manager.register_cleanup_hook("default", lambda: order.append("default"))
+        manager.register_cleanup_hook("early", lambda: order.append("early"), priority=10)
+        manager._run_cleanup_hooks()
+        self.assertEqual(order, ["early", "default", "late"])
+
+
+if __name__ == "__main__":
+    unittest.main()
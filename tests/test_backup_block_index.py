@@ -0,0 +1,214 @@
+"""
+Tests for the pluggable block index backends.
+
+Covers persistence round-trips, batched ref-count updates, append-only
+log compaction and crash recovery, lazy loading and legacy migration.
+"""
+
+import json
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from opt.services.backup.block_index import (
+    BlockRecord,
+    JsonBlockIndex,
+    LogBlockIndex,
+    SqliteBlockIndex,
+    open_block_index,
+    record_to_dict,
+)
+
+BACKENDS = ["json", "log", "sqlite"]
+
+
+def make_record(n: int, ref_count: int = 1) -> BlockRecord:
+    """Build a deterministic record for block ``n``."""
+    return BlockRecord(
+        digest=f"{n:064x}",
+        size=1000 + n,
+        compressed_size=500 + n,
+        stored_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        ref_count=ref_count,
+        compression="gzip",
+    )
+
+
+# =============================================================================
+# Backend Contract Tests
+# =============================================================================
+class TestBlockIndexBackends:
+    """Behaviour shared by every backend."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_roundtrip(self, tmp_path, backend):
+        index = open_block_index(tmp_path, backend)
+        index.add(make_record(1))
+        index.add(make_record(2))
+        index.adjust_ref(make_record(1).digest, 2)
+        index.set_verified(make_record(2).digest, datetime(2025, 2, 1, tzinfo=timezone.utc))
+        index.close()
+
+        reopened = open_block_index(tmp_path, backend)
+        assert len(reopened) == 2
+        assert reopened[make_record(1).digest].ref_count == 3
+        assert reopened[make_record(2).digest].verified_at.month == 2
+        assert reopened.totals() == (2, 2003, 1003)
+        reopened.close()
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_remove(self, tmp_path, backend):
+        index = open_block_index(tmp_path, backend)
+        index.add(make_record(1))
+        index.remove(make_record(1).digest)
+        index.close()
+        assert make_record(1).digest not in open_block_index(tmp_path, backend)
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_adjust_ref_unknown_digest(self, tmp_path, backend):
+        index = open_block_index(tmp_path, backend)
+        assert index.adjust_ref("missing", 1) is None
+        index.close()
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_returned_records_are_copies(self, tmp_path, backend):
+        index = open_block_index(tmp_path, backend)
+        index.add(make_record(1))
+        index[make_record(1).digest].ref_count = 99
+        assert index[make_record(1).digest].ref_count == 1
+        index.close()
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_batch_coalesces_and_reads_pending(self, tmp_path, backend):
+        index = open_block_index(tmp_path, backend)
+        index.add(make_record(1))
+        digest = make_record(1).digest
+        with index.batch():
+            for _ in range(10):
+                index.adjust_ref(digest, 1)
+            assert index[digest].ref_count == 11
+        index.close()
+        assert open_block_index(tmp_path, backend)[digest].ref_count == 11
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_scan_follows_adds_and_removes(self, tmp_path, backend):
+        index = open_block_index(tmp_path, backend)
+        for n in (5, 1, 3):
+            index.add(make_record(n))
+        assert [r.size for r in index.scan("", 2)] == [1001, 1003]
+        index.add(make_record(2))
+        index.add(make_record(3, ref_count=4))
+        index.remove(make_record(1).digest)
+        records = index.scan(make_record(1).digest)
+        assert [r.size for r in records] == [1002, 1003, 1005]
+        assert records[1].ref_count == 4
+        assert index.scan(make_record(5).digest) == []
+        index.close()
+
+    def test_unknown_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            open_block_index(tmp_path, "lmdb")
+
+
+# =============================================================================
+# SQLite Backend
+# =============================================================================
+class TestSqliteBlockIndex:
+    """SQLite-specific behaviour."""
+
+    def test_batch_commits_once_at_exit(self, tmp_path):
+        index = SqliteBlockIndex(tmp_path)
+        with index.batch():
+            index.add(make_record(1))
+            other = sqlite3.connect(str(index.path))
+            assert other.execute("SELECT COUNT(*) FROM blocks").fetchone()[0] == 0
+        assert other.execute("SELECT COUNT(*) FROM blocks").fetchone()[0] == 1
+        other.close()
+        index.close()
+
+    def test_values_pages_through_index(self, tmp_path):
+        index = SqliteBlockIndex(tmp_path)
+        with index.batch():
+            for n in range(25_000):
+                index.add(make_record(n))
+        assert sum(1 for _ in index.values()) == 25_000
+        index.close()
+
+
+# =============================================================================
+# Append-Only Log Backend
+# =============================================================================
+class TestLogBlockIndex:
+    """Log/snapshot behaviour and crash recovery."""
+
+    def test_lazy_load(self, tmp_path):
+        index = LogBlockIndex(tmp_path)
+        index.add(make_record(1))
+        index.close()
+        reopened = LogBlockIndex(tmp_path)
+        assert reopened._records is None
+        assert len(reopened) == 1
+
+    def test_compaction_rotates_generation(self, tmp_path):
+        index = LogBlockIndex(tmp_path, compact_min_ops=10, fsync=False)
+        for n in range(5):
+            index.add(make_record(n))
+        for _ in range(30):
+            index.adjust_ref(make_record(0).digest, 1)
+        assert index.generation > 0
+        assert (tmp_path / LogBlockIndex.SNAPSHOT_FILE).exists()
+        assert not (tmp_path / "block_index.0.log").exists()
+        index.close()
+        assert LogBlockIndex(tmp_path)[make_record(0).digest].ref_count == 31
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        index = LogBlockIndex(tmp_path, fsync=False)
+        index.add(make_record(1))
+        index.close()
+        log_path = tmp_path / "block_index.0.log"
+        with open(log_path, "a") as f:
+            f.write('{"op":"put","r":{"dig')
+
+        recovered = LogBlockIndex(tmp_path, fsync=False)
+        assert len(recovered) == 1
+        recovered.add(make_record(2))
+        recovered.close()
+        assert len(LogBlockIndex(tmp_path)) == 2
+
+    def test_stale_log_from_interrupted_compaction_ignored(self, tmp_path):
+        index = LogBlockIndex(tmp_path, compact_min_ops=1, fsync=False)
+        index.add(make_record(1))
+        index.adjust_ref(make_record(1).digest, 1)
+        index.adjust_ref(make_record(1).digest, -1)
+        gen = index.generation
+        assert gen > 0
+        index.close()
+        # Simulate a crash after the snapshot rename but before log removal
+        stale = tmp_path / f"block_index.{gen - 1}.log"
+        stale.write_text(json.dumps({"op": "ref", "d": make_record(1).digest, "n": 5}) + "\n")
+        assert LogBlockIndex(tmp_path)[make_record(1).digest].ref_count == 1
+        assert not stale.exists()
+
+
+# =============================================================================
+# Legacy Migration
+# =============================================================================
+class TestLegacyMigration:
+    """Import of an existing block_index.json."""
+
+    @pytest.mark.parametrize("backend", ["log", "sqlite"])
+    def test_migrates_json_index(self, tmp_path, backend):
+        legacy = {make_record(n).digest: record_to_dict(make_record(n)) for n in range(5)}
+        (tmp_path / "block_index.json").write_text(json.dumps(legacy))
+
+        index = open_block_index(tmp_path, backend)
+        assert len(index) == 5
+        assert (tmp_path / "block_index.json.migrated").exists()
+        assert not (tmp_path / "block_index.json").exists()
+        index.close()
+
+    def test_json_backend_reads_legacy_file(self, tmp_path):
+        legacy = {make_record(1).digest: record_to_dict(make_record(1))}
+        (tmp_path / "block_index.json").write_text(json.dumps(legacy))
+        assert len(JsonBlockIndex(tmp_path)) == 1
@@ -0,0 +1,115 @@
+"""
+Tests for the buffered gear content-defined chunker.
+
+Covers min/avg/max semantics, determinism across read strategies
+(in-memory, buffered stream, mmap), the pure-Python fallback and
+shift resistance.
+"""
+
+import io
+import os
+import random
+
+import pytest
+
+from opt.services.backup.chunking import HAS_NUMPY, GearChunker
+from opt.services.backup.dedup_backup_service import (
+    ChunkingConfig,
+    ContentDefinedChunker,
+    create_chunker,
+)
+
+
+@pytest.fixture
+def config() -> ChunkingConfig:
+    """Small chunk sizes so tests run on little data."""
+    return ChunkingConfig(min_size=1024, avg_size=4096, max_size=16384, mask_bits=12)
+
+
+@pytest.fixture
+def image() -> bytes:
+    """Synthetic disk image: random data, a zeroed region, repeated blocks."""
+    rng = random.Random(42)
+    random_part = bytes(rng.getrandbits(8) for _ in range(200_000))
+    return random_part + b"\0" * 50_000 + random_part[:30_000] * 2
+
+
+# =============================================================================
+# Gear Chunker Tests
+# =============================================================================
+class TestGearChunker:
+    """Test suite for GearChunker."""
+
+    def test_reassembles_input(self, config, image):
+        chunks = GearChunker(config).chunk_bytes(image)
+        assert b"".join(chunks) == image
+
+    def test_respects_min_and_max(self, config, image):
+        chunks = GearChunker(config).chunk_bytes(image)
+        assert all(len(c) >= config.min_size for c in chunks[:-1])
+        assert all(len(c) <= config.max_size for c in chunks)
+
+    def test_zero_region_cut_at_max_size(self, config):
+        chunks = GearChunker(config).chunk_bytes(b"\0" * (config.max_size * 3))
+        assert [len(c) for c in chunks] == [config.max_size] * 3
+
+    def test_average_near_target(self, config):
+        data = os.urandom(2_000_000)
+        chunks = GearChunker(config).chunk_bytes(data)
+        mean = len(data) / len(chunks)
+        assert config.min_size < mean < config.min_size + 3 * (1 << config.mask_bits)
+
+    def test_stream_matches_bytes(self, config, image):
+        chunker = GearChunker(config, buffer_size=40_000)
+        assert list(chunker.chunk_stream(io.BytesIO(image))) == chunker.chunk_bytes(image)
+
+    def test_mmap_matches_bytes(self, config, image, tmp_path):
+        path = tmp_path / "disk.img"
+        path.write_bytes(image)
+        chunker = GearChunker(config, buffer_size=40_000)
+        assert list(chunker.chunk_file(str(path))) == chunker.chunk_bytes(image)
+
+    def test_buffer_size_does_not_change_boundaries(self, config, image):
+        small = GearChunker(config, buffer_size=1).chunk_stream(io.BytesIO(image))
+        large = GearChunker(config, buffer_size=1 << 20).chunk_bytes(image)
+        assert list(small) == large
+
+    @pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+    def test_python_fallback_matches_numpy(self, config, image):
+        fast = GearChunker(config, use_numpy=True).chunk_bytes(image)
+        slow = GearChunker(config, use_numpy=False).chunk_bytes(image)
+        assert fast == slow
+
+    def test_insert_only_changes_local_chunks(self, config):
+        data = os.urandom(500_000)
+        chunker = GearChunker(config)
+        before = chunker.chunk_bytes(data)
+        after = chunker.chunk_bytes(data[:1000] + b"inserted" + data[1000:])
+        assert len(set(before) & set(after)) >= len(before) - 3
+
+    def test_empty_input(self, config):
+        assert GearChunker(config).chunk_bytes(b"") == []
+        assert list(GearChunker(config).chunk_stream(io.BytesIO(b""))) == []
+
+    def test_rejects_min_size_below_window(self):
+        with pytest.raises(ValueError):
+            GearChunker(ChunkingConfig(min_size=16))
+
+
+class TestCreateChunker:
+    """Engine selection from ChunkingConfig."""
+
+    def test_default_engine_is_gear(self):
+        assert isinstance(create_chunker(ChunkingConfig()), GearChunker)
+
+    def test_rabin_engine(self, config):
+        config.engine = "rabin"
+        chunker = create_chunker(config)
+        assert isinstance(chunker, ContentDefinedChunker)
+        data = os.urandom(20_000)
+        assert b"".join(chunker.chunk_bytes(data)) == data
+
+    def test_unknown_engine(self, config):
+        config.engine = "bogus"
+        with pytest.raises(ValueError):
+            create_chunker(config)
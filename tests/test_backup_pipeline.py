@@ -0,0 +1,137 @@
+"""
+Tests for the parallel dedup ingest pipeline.
+
+Verifies the pipeline produces the same manifests and ref counts as the
+sequential path, bounds the number of chunks in flight, and surfaces
+worker errors to the caller.
+"""
+
+import io
+import os
+import threading
+
+import pytest
+
+from opt.services.backup.dedup_backup_service import (
+    BackupConfig,
+    BlockStore,
+    ChunkingConfig,
+    CompressionAlgo,
+    DedupBackupService,
+    EncryptionMode,
+)
+from opt.services.backup.pipeline import ParallelIngestPipeline
+
+
+def make_config(root, parallelism: int = 1, **kwargs) -> BackupConfig:
+    config = BackupConfig(
+        store_root=str(root),
+        compression=CompressionAlgo.GZIP,
+        parallelism=parallelism,
+        **kwargs,
+    )
+    config.chunking = ChunkingConfig(min_size=1024, max_size=16384, mask_bits=12)
+    return config
+
+
+@pytest.fixture
+def image() -> bytes:
+    """Data with plenty of repeated chunks."""
+    unique = os.urandom(200_000)
+    return unique + b"\0" * 100_000 + unique
+
+
+# =============================================================================
+# Pipeline Tests
+# =============================================================================
+class TestParallelIngest:
+    """Parallel ingest must match sequential ingest exactly."""
+
+    @pytest.mark.parametrize("backend", ["sqlite", "log"])
+    def test_matches_sequential(self, tmp_path, image, backend):
+        seq = DedupBackupService(make_config(tmp_path / "seq", index_backend=backend))
+        par = DedupBackupService(
+            make_config(tmp_path / "par", parallelism=4, pipeline_depth=3, index_backend=backend)
+        )
+        m_seq = seq.backup_stream("vm", io.BytesIO(image))
+        m_par = par.backup_stream("vm", io.BytesIO(image))
+
+        assert m_par.blocks == m_seq.blocks
+        assert m_par.block_sizes == m_seq.block_sizes
+        assert m_par.source_size == len(image)
+        for digest in set(m_seq.blocks):
+            assert par.store.index[digest].ref_count == seq.store.index[digest].ref_count
+        assert b"".join(par.store.get(d) for d in m_par.blocks) == image
+        seq.close()
+        par.close()
+
+    def test_second_backup_is_all_duplicates(self, tmp_path, image):
+        svc = DedupBackupService(make_config(tmp_path, parallelism=3))
+        first = svc.backup_stream("vm", io.BytesIO(image))
+        result = ParallelIngestPipeline(svc.store, 3).run(svc.chunker.chunk_bytes(image))
+        assert result.new_blocks == 0
+        assert result.duplicate_blocks == len(first.blocks)
+        svc.close()
+
+    def test_encrypted_ingest_roundtrip(self, tmp_path, image):
+        config = make_config(
+            tmp_path,
+            parallelism=2,
+            encryption=EncryptionMode.AES_256_GCM,
+            encryption_key=b"k" * 32,
+        )
+        svc = DedupBackupService(config)
+        manifest = svc.backup_stream("vm", io.BytesIO(image))
+        assert b"".join(svc.store.get(d) for d in manifest.blocks) == image
+        svc.close()
+
+    def test_backpressure_bounds_inflight_chunks(self, tmp_path):
+        store = BlockStore(make_config(tmp_path))
+        release = threading.Event()
+        produced = []
+        original_encode = store.encode
+
+        def slow_encode(data):
+            release.wait(5)
+            return original_encode(data)
+
+        store.encode = slow_encode
+
+        def chunks():
+            for n in range(50):
+                produced.append(n)
+                yield os.urandom(64) + bytes([n])
+
+        pipeline = ParallelIngestPipeline(store, workers=2, max_inflight=4)
+        timer = threading.Timer(0.5, release.set)
+        timer.start()
+        observed = []
+        original_write = store.write_block
+
+        def record_write(digest, payload):
+            observed.append(len(produced))
+            original_write(digest, payload)
+
+        store.write_block = record_write
+        result = pipeline.run(chunks())
+        timer.cancel()
+
+        assert len(result.blocks) == 50
+        # Producer can be at most queue size + one submission ahead of the writer
+        assert observed[0] <= 4 + 2
+        store.close()
+
+    def test_worker_error_propagates(self, tmp_path):
+        store = BlockStore(make_config(tmp_path))
+
+        def broken_encode(data):
+            raise RuntimeError("compressor exploded")
+
+        store.encode = broken_encode
+        with pytest.raises(RuntimeError, match="compressor exploded"):
+            ParallelIngestPipeline(store, workers=2).run(os.urandom(100) for _ in range(20))
+        store.close()
+
+    def test_rejects_zero_workers(self, tmp_path):
+        with pytest.raises(ValueError):
+            ParallelIngestPipeline(BlockStore(make_config(tmp_path)), workers=0)
@@ -0,0 +1,215 @@
+"""
+Tests for the parallel read-ahead restore engine.
+
+Verifies restores are byte-identical and ordered, zero chunks become
+sparse holes on regular files, results carry throughput for RTO
+tracking, and RestoreTestManager reports restore trends.
+"""
+
+import io
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from opt.services.backup.backup_intelligence import RestoreTestManager
+from opt.services.backup.dedup_backup_service import (
+    BackupConfig,
+    ChunkingConfig,
+    CompressionAlgo,
+    DedupBackupService,
+    EncryptionMode,
+)
+from opt.services.backup.restore_engine import ParallelRestoreEngine, RestoreResult
+
+
+def make_service(root, **kwargs) -> DedupBackupService:
+    config = BackupConfig(store_root=str(root), compression=CompressionAlgo.GZIP, **kwargs)
+    config.chunking = ChunkingConfig(min_size=4096, max_size=65536, mask_bits=14)
+    return DedupBackupService(config)
+
+
+@pytest.fixture
+def image() -> bytes:
+    """Random data with a large zero region in the middle."""
+    return os.urandom(300_000) + bytes(2_000_000) + os.urandom(300_000)
+
+
+# =============================================================================
+# Restore Engine Tests
+# =============================================================================
+class TestParallelRestore:
+    """Parallel restore must reproduce the source exactly."""
+
+    @pytest.mark.parametrize("workers,prefetch", [(1, 1), (4, 3), (8, 64)])
+    def test_restore_roundtrip(self, tmp_path, image, workers, prefetch):
+        svc = make_service(tmp_path / "store", restore_workers=workers, restore_prefetch=prefetch)
+        manifest = svc.backup_stream("vm", io.BytesIO(image))
+        out = tmp_path / "restored.img"
+
+        result = svc.restore_to_file(manifest.id, str(out))
+
+        assert out.read_bytes() == image
+        assert result.bytes_written == len(image)
+        assert result.blocks == len(manifest.blocks)
+        svc.close()
+
+    def test_zero_chunks_become_holes(self, tmp_path, image):
+        svc = make_service(tmp_path / "store")
+        manifest = svc.backup_stream("vm", io.BytesIO(image))
+        out = tmp_path / "restored.img"
+
+        result = svc.restore_to_file(manifest.id, str(out))
+
+        assert result.sparse_bytes >= 1_000_000
+        assert os.path.getsize(out) == len(image)
+        allocated = os.stat(out).st_blocks * 512
+        assert allocated < len(image) - result.sparse_bytes // 2
+        svc.close()
+
+    def test_trailing_zeros_keep_file_size(self, tmp_path):
+        data = os.urandom(100_000) + bytes(500_000)
+        svc = make_service(tmp_path / "store")
+        manifest = svc.backup_stream("vm", io.BytesIO(data))
+        out = tmp_path / "restored.img"
+
+        svc.restore_to_file(manifest.id, str(out))
+
+        assert out.read_bytes() == data
+        svc.close()
+
+    def test_non_sparse_restore_writes_zeros(self, tmp_path, image):
+        svc = make_service(tmp_path / "store", restore_sparse=False)
+        manifest = svc.backup_stream("vm", io.BytesIO(image))
+        out = tmp_path / "restored.img"
+
+        result = svc.restore_to_file(manifest.id, str(out))
+
+        assert result.sparse_bytes == 0
+        assert out.read_bytes() == image
+        svc.close()
+
+    def test_restore_overwrites_existing_file(self, tmp_path):
+        svc = make_service(tmp_path / "store")
+        manifest = svc.backup_stream("vm", io.BytesIO(b"short" * 100))
+        out = tmp_path / "restored.img"
+        out.write_bytes(os.urandom(1_000_000))
+
+        svc.restore_to_file(manifest.id, str(out))
+
+        assert out.read_bytes() == b"short" * 100
+        svc.close()
+
+    def test_encrypted_restore(self, tmp_path, image):
+        svc = make_service(
+            tmp_path / "store",
+            encryption=EncryptionMode.AES_256_GCM,
+            encryption_key=b"k" * 32,
+            parallelism=2,
+        )
+        manifest = svc.backup_stream("vm", io.BytesIO(image))
+        out = tmp_path / "restored.img"
+
+        svc.restore_to_file(manifest.id, str(out))
+
+        assert out.read_bytes() == image
+        svc.close()
+
+    def test_restore_stream_is_ordered(self, tmp_path, image):
+        svc = make_service(tmp_path / "store", restore_prefetch=4)
+        manifest = svc.backup_stream("vm", io.BytesIO(image))
+
+        blocks = list(svc.restore_stream(manifest.id))
+
+        assert len(blocks) == len(manifest.blocks)
+        assert b"".join(blocks) == image
+        svc.close()
+
+    def test_unknown_manifest_raises(self, tmp_path):
+        svc = make_service(tmp_path / "store")
+        with pytest.raises(ValueError):
+            svc.restore_to_file("missing", str(tmp_path / "out"))
+        with pytest.raises(ValueError):
+            list(svc.restore_stream("missing"))
+        svc.close()
+
+    def test_zero_digest_is_read_once(self, tmp_path):
+        svc = make_service(tmp_path / "store")
+        data = bytes(4096 * 64)
+        manifest = svc.backup_stream("vm", io.BytesIO(data))
+        engine = ParallelRestoreEngine(svc.store, workers=1, prefetch=1)
+        reads = []
+        original_get = svc.store.get
+
+        def counting_get(digest):
+            reads.append(digest)
+            return original_get(digest)
+
+        svc.store.get = counting_get
+        engine.restore_to_file(
+            manifest.id, manifest.blocks, manifest.block_sizes, str(tmp_path / "out")
+        )
+
+        assert len(manifest.blocks) > 1
+        assert len(reads) == len(set(manifest.blocks))
+        svc.close()
+
+    def test_result_reports_throughput(self, tmp_path, image):
+        svc = make_service(tmp_path / "store")
+        manifest = svc.backup_stream("vm", io.BytesIO(image))
+
+        result = svc.restore_to_file(manifest.id, str(tmp_path / "out"))
+
+        assert result.duration_seconds > 0
+        assert result.throughput_mbps > 0
+        assert result.to_dict()["bytes_written"] == len(image)
+        svc.close()
+
+
+# =============================================================================
+# RTO Tracking Tests
+# =============================================================================
+class TestRestoreTestRTO:
+    """RestoreTestManager records measured restore timings."""
+
+    def make_result(self, seconds: float) -> RestoreResult:
+        return RestoreResult(
+            manifest_id="m",
+            output_path="/dev/null",
+            bytes_written=100 * 1024 * 1024,
+            blocks=10,
+            sparse_bytes=0,
+            duration_seconds=seconds,
+        )
+
+    def test_record_restore_result(self):
+        manager = RestoreTestManager()
+        test = manager.schedule_test("bkp-1", "vm-1", "gold")
+
+        manager.record_restore_result(test.id, self.make_result(2.0))
+
+        assert test.restore_duration_seconds == 2.0
+        assert test.restore_throughput_mbps == pytest.approx(50.0)
+
+    def test_record_unknown_test_raises(self):
+        with pytest.raises(ValueError):
+            RestoreTestManager().record_restore_result("rt-missing", self.make_result(1.0))
+
+    def test_rto_trend_degrading(self):
+        manager = RestoreTestManager()
+        base = datetime.now(timezone.utc) - timedelta(days=10)
+        for day, seconds in enumerate([10, 10, 11, 20, 22, 25]):
+            test = manager.schedule_test(f"bkp-{day}", "vm-1", "gold")
+            test.created_at = base + timedelta(days=day)
+            manager.record_restore_result(test.id, self.make_result(seconds))
+        manager.schedule_test("bkp-x", "vm-1", "gold")    # Not measured
+
+        trend = manager.get_rto_trend("vm-1")
+
+        assert trend["trend"] == "degrading"
+        assert [s["duration_seconds"] for s in trend["samples"]] == [10, 10, 11, 20, 22, 25]
+        assert trend["max_duration_seconds"] == 25
+
+    def test_rto_trend_insufficient_data(self):
+        manager = RestoreTestManager()
+        assert manager.get_rto_trend("vm-1")["trend"] == "insufficient_data"
@@ -0,0 +1,138 @@
+"""
+Bin-Packing Scheduler Tests
+
+Covers IndexedBinPackingScheduler against the reference
+BinPackingScheduler: identical decisions for every strategy (labels,
+anti-affinity, zones, ties, exhausted capacity), index rebuilds after
+update_nodes() and schedule_batch().
+"""
+
+import random
+from copy import deepcopy
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+from opt.services.cluster.large_cluster_optimizer import (
+    BinPackingScheduler,
+    IndexedBinPackingScheduler,
+    LargeClusterOptimizer,
+    NodeInfo,
+    NodeState,
+    SchedulingDecision,
+    SchedulingStrategy,
+    WorkloadRequest,
+)
+
+GIB=1024 ** 3
+
+
+def make_fleet(count: int, seed: int=1) -> Dict[str, NodeInfo]:
+    rng=random.Random(seed)
+    nodes={}
+    for n in range(count):
+        node_id=f"node-{n:04d}"
+        nodes[node_id] = NodeInfo(
+            node_id=node_id,
+            hostname=node_id,
+            ip_address=f"10.0.{n // 256}.{n % 256}",
+            state=NodeState.HEALTHY if rng.random() > 0.1 else NodeState.DEGRADED,
+            zone=f"zone-{n % 3}",
+            cpu_capacity=16000,
+            memory_capacity=64 * GIB,
+            cpu_allocatable=15000,
+            memory_allocatable=60 * GIB,
+            # Coarse usage so that equal scores (ties) are common
+            cpu_used=rng.choice([0, 3000, 6000]),
+            memory_used=rng.choice([0, 12, 24]) * GIB,
+            pod_count=rng.randrange(0, 20),
+            pod_capacity=rng.choice([20, 110]),
+            labels={"disk": "ssd"} if n % 4 == 0 else {},
+            conditions={"Ready": rng.random() > 0.2, "MemoryPressure": rng.random() < 0.3,
+                        "DiskPressure": False},
+        )
+    return nodes
+
+
+def as_tuples(decisions: List[SchedulingDecision]):
+    return [(d.workload_id, d.selected_node, d.score, d.reason, d.alternatives) for d in decisions]
+
+
+def both(strategy: SchedulingStrategy, count: int=120):
+    reference=BinPackingScheduler(strategy)
+    reference.update_nodes(make_fleet(count))
+    indexed=IndexedBinPackingScheduler(strategy)
+    indexed.update_nodes(make_fleet(count))
+    return reference, indexed
+
+
+@pytest.mark.parametrize("strategy", list(SchedulingStrategy))
+class TestMatchesReference:
+    def test_plain_replicas(self, strategy):
+        reference, indexed=both(strategy)
+        args=("web", 2000, 4 * GIB, 40)
+        assert as_tuples(indexed.schedule(*args)) == as_tuples(reference.schedule(*args))
+        assert {n: (v.cpu_used, v.pod_count) for n, v in indexed._nodes.items()} == {
+            n: (v.cpu_used, v.pod_count) for n, v in reference._nodes.items()
+        }
+
+    def test_constraints(self, strategy):
+        reference, indexed=both(strategy)
+        kwargs=dict(labels_required={"disk": "ssd"}, anti_affinity_workloads=["db"],
+                    preferred_zones=["zone-1"])
+        expected=reference.schedule("db", 4000, 8 * GIB, 40, **kwargs)
+        assert as_tuples(indexed.schedule("db", 4000, 8 * GIB, 40, **kwargs)) == as_tuples(expected)
+        # Fewer ssd nodes than replicas: the rest is left unscheduled
+        assert len(expected) < 40
+
+    def test_batch(self, strategy):
+        reference, indexed=both(strategy)
+        requests=[
+            WorkloadRequest(f"w{n}", 500 * (n % 5 + 1), (n % 3 + 1) * GIB, replicas=n % 7 + 1,
+                            labels_required={"disk": "ssd"} if n % 6 == 0 else None,
+                            preferred_zones=["zone-2"] if n % 2 else None)
+            for n in range(30)
+        ]
+        expected=reference.schedule_batch(requests)
+        actual=indexed.schedule_batch(requests)
+        assert [as_tuples(d) for d in actual] == [as_tuples(d) for d in expected]
+
+
+class TestIndex:
+    def test_index_rebuilt_after_update_nodes(self):
+        scheduler=IndexedBinPackingScheduler(SchedulingStrategy.SPREAD)
+        nodes=make_fleet(10)
+        scheduler.update_nodes(nodes)
+        first=scheduler.schedule("a", 1000, GIB)[0].selected_node
+
+        drained=deepcopy(nodes)
+        drained[first].state=NodeState.DRAINING
+        scheduler.update_nodes(drained)
+        assert scheduler.schedule("b", 1000, GIB)[0].selected_node != first
+
+    def test_no_nodes_and_no_capacity(self):
+        scheduler=IndexedBinPackingScheduler()
+        assert scheduler.schedule("a", 1000, GIB, replicas=2) == []
+        scheduler.update_nodes(make_fleet(5))
+        assert scheduler.schedule("huge", 10 ** 9, GIB) == []
+
+    def test_top_k_tie_order(self):
+        scheduler=IndexedBinPackingScheduler()
+        values=scheduler._top_k(np.array([0.5, 0.9, 0.5, 0.9, 0.1, 0.5]), 4)
+        assert values.tolist() == [1, 3, 0, 2]
+
+
+class TestOptimizerScheduling:
+    async def test_schedule_workloads(self):
+        optimizer=LargeClusterOptimizer(max_workers=2)
+        try:
+            await optimizer.initialize([])
+            optimizer._node_cache.update(make_fleet(20))
+            optimizer._scheduler.update_nodes(optimizer._node_cache)
+            results=optimizer.schedule_workloads([WorkloadRequest("a", 1000, GIB, replicas=3),
+                                                  WorkloadRequest("b", 1000, GIB)])
+            assert [len(r) for r in results] == [3, 1]
+            assert results[1][0].workload_id == "b-0"
+        finally:
+            optimizer.shutdown()
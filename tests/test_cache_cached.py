@@ -0,0 +1,194 @@
+"""
+Tests for stampede protection in the @cached decorator.
+
+Covers single-flight coalescing of concurrent misses, error propagation to
+every waiter, stale-while-revalidate with one background refresh per key,
+XFetch probabilistic early expiration and the per-function metrics.
+"""
+
+import asyncio
+import time
+
+from opt.services.cache import L1Cache, cached
+
+
+class Counter:
+    """Async function stand-in that counts and optionally delays calls."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self, x: int) -> int:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return x * 10 + self.calls
+
+
+def decorate(fn, **kwargs):
+    async def compute(x: int) -> int:
+        return await fn(x)
+
+    return cached(**kwargs)(compute)
+
+
+# =============================================================================
+# Single-Flight Tests
+# =============================================================================
+class TestSingleFlight:
+    """Concurrent misses for one key run the function once."""
+
+    async def test_concurrent_misses_coalesce(self):
+        fn = Counter(delay=0.05)
+        wrapped = decorate(fn, cache=L1Cache(max_size=100))
+
+        results = await asyncio.gather(*(wrapped(1) for _ in range(50)))
+
+        assert fn.calls == 1
+        assert set(results) == {11}
+        metrics = wrapped.cache_metrics
+        assert metrics.misses == 50
+        assert metrics.coalesced == 49
+        assert await wrapped(1) == 11
+        assert metrics.hits == 1
+
+    async def test_distinct_keys_do_not_coalesce(self):
+        fn = Counter(delay=0.01)
+        wrapped = decorate(fn, cache=L1Cache(max_size=100))
+        await asyncio.gather(wrapped(1), wrapped(2), wrapped(1))
+        assert fn.calls == 2
+
+    async def test_disabled_runs_every_caller(self):
+        fn = Counter(delay=0.01)
+        wrapped = decorate(fn, cache=L1Cache(max_size=100), single_flight=False)
+        await asyncio.gather(*(wrapped(1) for _ in range(5)))
+        assert fn.calls == 5
+
+    async def test_without_cache_still_coalesces(self):
+        fn = Counter(delay=0.02)
+        wrapped = decorate(fn)
+        await asyncio.gather(*(wrapped(1) for _ in range(10)))
+        await wrapped(1)
+        assert fn.calls == 2
+
+    async def test_error_reaches_all_waiters_and_is_not_cached(self):
+        calls = 0
+
+        async def failing(x: int) -> int:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            if calls == 1:
+                raise RuntimeError("backend down")
+            return x
+
+        wrapped = cached(cache=L1Cache(max_size=10))(failing)
+        results = await asyncio.gather(*(wrapped(3) for _ in range(5)), return_exceptions=True)
+
+        assert calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert await wrapped(3) == 3
+
+    async def test_cancelled_waiter_does_not_cancel_flight(self):
+        fn = Counter(delay=0.05)
+        wrapped = decorate(fn, cache=L1Cache(max_size=10))
+        first = asyncio.ensure_future(wrapped(1))
+        second = asyncio.ensure_future(wrapped(1))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == 11
+        assert fn.calls == 1
+
+
+# =============================================================================
+# Stale-While-Revalidate Tests
+# =============================================================================
+class TestStaleWhileRevalidate:
+    """Expired values are served while one background refresh runs."""
+
+    async def test_serves_stale_and_refreshes_once(self):
+        fn = Counter(delay=0.05)
+        wrapped = decorate(fn, cache=L1Cache(max_size=10), ttl_seconds=1, stale_ttl_seconds=60)
+        assert await wrapped(1) == 11
+
+        await asyncio.sleep(1.05)
+        start = time.monotonic()
+        stale = await asyncio.gather(*(wrapped(1) for _ in range(20)))
+        assert time.monotonic() - start < 0.04    # Nobody waited on the refresh
+        assert set(stale) == {11}
+
+        await asyncio.sleep(0.1)
+        assert await wrapped(1) == 12
+        metrics = wrapped.cache_metrics
+        assert fn.calls == 2
+        assert metrics.stale_hits == 20
+        assert metrics.background_refreshes == 1
+
+    async def test_refresh_error_keeps_stale_value(self, caplog):
+        calls = 0
+
+        async def flaky(x: int) -> int:
+            nonlocal calls
+            calls += 1
+            if calls > 1:
+                raise RuntimeError("refresh failed")
+            return x
+
+        wrapped = cached(cache=L1Cache(max_size=10), ttl_seconds=1, stale_ttl_seconds=60)(flaky)
+        assert await wrapped(7) == 7
+        await asyncio.sleep(1.05)
+
+        assert await wrapped(7) == 7
+        await asyncio.sleep(0.01)
+        assert wrapped.cache_metrics.refresh_errors == 1
+        assert await wrapped(7) == 7
+
+    async def test_legacy_values_are_hits(self):
+        cache = L1Cache(max_size=10)
+        fn = Counter()
+        wrapped = decorate(fn, cache=cache)
+        await wrapped(1)
+        key = cache.engine.keys()[0]
+        await cache.set(key, "raw", 60)    # Written before envelopes existed
+
+        assert await wrapped(1) == "raw"
+        assert fn.calls == 1
+
+
+# =============================================================================
+# XFetch Tests
+# =============================================================================
+class TestXFetch:
+    """Probabilistic early expiration recomputes before the deadline."""
+
+    async def test_refreshes_early_near_expiry(self, monkeypatch):
+        fn = Counter(delay=0.05)
+        wrapped = decorate(fn, cache=L1Cache(max_size=10), ttl_seconds=1, xfetch_beta=1.0)
+        await wrapped(1)
+
+        # 50 ms * -log(2**-52) is past the 1 s TTL: always refresh early
+        monkeypatch.setattr("opt.services.cache.tiered.random.random", lambda: 1 - 2**-52)
+        assert await wrapped(1) == 12
+        assert wrapped.cache_metrics.early_refreshes == 1
+
+    async def test_rarely_refreshes_far_from_expiry(self):
+        fn = Counter(delay=0.001)
+        wrapped = decorate(fn, cache=L1Cache(max_size=10), ttl_seconds=3600, xfetch_beta=1.0)
+        await wrapped(1)
+        for _ in range(200):
+            await wrapped(1)
+        assert fn.calls == 1
+
+    async def test_background_early_refresh_with_stale_window(self, monkeypatch):
+        fn = Counter(delay=0.05)
+        wrapped = decorate(
+            fn, cache=L1Cache(max_size=10), ttl_seconds=1, xfetch_beta=1.0, stale_ttl_seconds=10
+        )
+        await wrapped(1)
+        monkeypatch.setattr("opt.services.cache.tiered.random.random", lambda: 1 - 2**-52)
+
+        assert await wrapped(1) == 11    # Current value served immediately
+        await asyncio.sleep(0.1)
+        assert fn.calls == 2
+        assert wrapped.cache_metrics.background_refreshes == 1
@@ -0,0 +1,356 @@
+"""
+Tests for indexed cache invalidation.
+
+Covers the L1 prefix trie and tag index, the Redis tag/namespace sets
+(against a small in-memory stand-in for the async Redis client) and
+HybridCache keeping both tiers consistent.
+"""
+
+import fnmatch
+import random
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+
+from opt.services.cache import HybridCache, L1Cache, L1Engine
+from opt.services.cache.l1_engine import PrefixTrie
+from opt.services.cache.tiered import RedisCache
+
+
+class FakeRedis:
+    """Just enough of ``redis.asyncio.Redis`` for RedisCache."""
+
+    def __init__(self) -> None:
+        self.strings: Dict[str, str] = {}
+        self.sets: Dict[str, Set[str]] = {}
+        self.ttls: Dict[str, int] = {}
+        self.scans = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        return self.strings.get(key)
+
+    async def set(self, key: str, value: str) -> bool:
+        self.strings[key] = value
+        self.ttls.pop(key, None)
+        return True
+
+    async def setex(self, key: str, ttl: int, value: str) -> bool:
+        await self.set(key, value)
+        return await self.expire(key, ttl)
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        if key not in self.strings and key not in self.sets:
+            return False
+        self.ttls[key] = ttl
+        return True
+
+    async def ttl(self, key: str) -> int:
+        if key not in self.strings and key not in self.sets:
+            return -2
+        return self.ttls.get(key, -1)
+
+    async def persist(self, key: str) -> bool:
+        return self.ttls.pop(key, None) is not None
+
+    async def sadd(self, key: str, *members: str) -> int:
+        target = self.sets.setdefault(key, set())
+        before = len(target)
+        target.update(members)
+        return len(target) - before
+
+    async def srem(self, key: str, *members: str) -> int:
+        target = self.sets.get(key, set())
+        removed = len(target & set(members))
+        target.difference_update(members)
+        if not target:
+            self.sets.pop(key, None)
+            self.ttls.pop(key, None)
+        return removed
+
+    async def smembers(self, key: str) -> Set[str]:
+        return set(self.sets.get(key, set()))
+
+    async def sunion(self, *keys: str) -> Set[str]:
+        result: Set[str] = set()
+        for key in keys:
+            result |= self.sets.get(key, set())
+        return result
+
+    async def delete(self, *keys: str) -> int:
+        count = 0
+        for key in keys:
+            self.ttls.pop(key, None)
+            count += (self.strings.pop(key, None) is not None) + (
+                self.sets.pop(key, None) is not None
+            )
+        return count
+
+    async def scan(self, cursor: int, match: str, count: int):
+        self.scans += 1
+        keys = [k for k in list(self.strings) + list(self.sets) if fnmatch.fnmatchcase(k, match)]
+        return 0, keys
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.calls: List[Any] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args: Any) -> "FakePipeline":
+            self.calls.append((name, args))
+            return self
+
+        return queue
+
+    async def execute(self) -> List[Any]:
+        return [await getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+@pytest.fixture
+def redis_cache() -> RedisCache:
+    cache = RedisCache()
+    cache.redis_client = FakeRedis()
+    return cache
+
+
+# =============================================================================
+# Prefix Trie Tests
+# =============================================================================
+class TestPrefixTrie:
+    """Trie lookups must agree with fnmatch over all keys."""
+
+    KEYS = [
+        "node:1",
+        "node:1:status",
+        "node:12",
+        "node:2:status",
+        "nodes:list",
+        "vm:1",
+        "vm:node:1",
+        "node",
+        "node:",
+    ]
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["node:*", "node:1*", "node:?:status", "no*", "*:status", "node:1", "node", "vm:*:1",
+         "node:[12]", "missing:*", "*"],
+    )
+    def test_matches_fnmatch(self, pattern):
+        trie = PrefixTrie()
+        for key in self.KEYS:
+            trie.add(key)
+        expected = sorted(k for k in self.KEYS if fnmatch.fnmatchcase(k, pattern))
+        assert sorted(trie.match(pattern)) == expected
+
+    def test_remove_prunes(self):
+        trie = PrefixTrie()
+        trie.add("a:b:c")
+        trie.add("a:b")
+        assert trie.remove("a:b:c")
+        assert not trie.remove("a:b:c")
+        assert trie.match("a:*") == ["a:b"]
+        assert trie.remove("a:b")
+        assert trie.root.children == {}
+        assert len(trie) == 0
+
+    def test_random_keys_against_fnmatch(self):
+        rng = random.Random(3)
+        keys = {
+            ":".join(rng.choice(["node", "vm", "n1", "x"]) for _ in range(rng.randint(1, 4)))
+            for _ in range(300)
+        }
+        trie = PrefixTrie()
+        for key in keys:
+            trie.add(key)
+        for pattern in ["node:*", "vm:n*", "n*", "x:x:*", "node:vm:?1"]:
+            expected = sorted(k for k in keys if fnmatch.fnmatchcase(k, pattern))
+            assert sorted(trie.match(pattern)) == expected
+
+
+# =============================================================================
+# L1 Index Tests
+# =============================================================================
+class TestL1Indexes:
+    """Tag and pattern invalidation through the engine's indexes."""
+
+    def test_invalidate_tags(self):
+        engine = L1Engine(max_entries=1000)
+        engine.set("node:1", 1, tags={"node", "cluster:a"})
+        engine.set("node:2", 2, tags={"node"})
+        engine.set("vm:1", 3, tags={"cluster:a"})
+        engine.set("vm:2", 4)
+
+        assert engine.invalidate_tags({"cluster:a"}) == 2
+        assert sorted(engine.keys()) == ["node:2", "vm:2"]
+        assert engine.keys_for_tags({"cluster:a"}) == set()
+
+    def test_eviction_and_overwrite_update_indexes(self):
+        engine = L1Engine(max_entries=2)
+        engine.set("a:1", 1, tags={"t"})
+        engine.set("a:2", 2, tags={"t"})
+        engine.set("a:3", 3)    # Evicts a:1
+        engine.set("a:2", 2, tags={"u"})    # Retagged
+
+        assert engine.keys_for_tags({"t"}) == set()
+        assert engine.keys_for_tags({"u"}) == {"a:2"}
+        assert sorted(engine.match("a:*")) == ["a:2", "a:3"]
+
+    def test_expired_entries_leave_indexes(self):
+        engine = L1Engine(max_entries=10)
+        engine.set("k:1", 1, ttl_seconds=0.01, tags={"t"})
+        time.sleep(0.02)
+        assert engine.get("k:1") is None
+        assert engine.keys_for_tags({"t"}) == set()
+        assert engine.match("k:*") == []
+
+    def test_sharded_pattern_invalidation(self):
+        engine = L1Engine(max_entries=20_000, shards=8)
+        for n in range(5_000):
+            engine.set(f"node:{n}", n)
+            engine.set(f"vm:{n}", n)
+
+        assert engine.invalidate_pattern("node:*") == 5_000
+        assert len(engine) == 5_000
+        assert engine.match("node:*") == []
+
+    def test_clear_resets_indexes(self):
+        engine = L1Engine(max_entries=10)
+        engine.set("a:1", 1, tags={"t"})
+        engine.clear()
+        assert engine.keys_for_tags({"t"}) == set()
+        assert engine.match("a:*") == []
+
+    async def test_l1cache_invalidation(self):
+        cache = L1Cache(max_size=100)
+        await cache.set("node:1", 1, 60, tags={"node"})
+        await cache.set("node:2", 2, 60)
+        await cache.set("vm:1", 3, 60, tags={"node"})
+
+        assert await cache.invalidate_pattern("node:*") == 2
+        assert await cache.invalidate_tags({"node"}) == 1
+        assert len(cache) == 0
+
+
+# =============================================================================
+# Redis and Hybrid Tests
+# =============================================================================
+class TestRedisIndexes:
+    """Redis invalidation reads index sets instead of scanning."""
+
+    async def test_tag_sets(self, redis_cache):
+        await redis_cache.set("node:1", {"a": 1}, 60, tags={"node", "rack:1"})
+        await redis_cache.set("node:2", {"a": 2}, 60, tags={"node"})
+        await redis_cache.set("vm:1", {"a": 3}, 60, tags={"rack:1"})
+
+        assert await redis_cache.invalidate_tags({"rack:1"}) == 2
+        client = redis_cache.redis_client
+        assert set(client.strings) == {"node:2"}
+        assert client.sets["_tag:node"] == {"node:2"}
+        assert "_keytags:node:1" not in client.sets
+
+    async def test_namespace_pattern_without_scan(self, redis_cache):
+        for n in range(20):
+            await redis_cache.set(f"node:{n}", n, 60)
+        await redis_cache.set("vm:1", 1, 60)
+
+        assert await redis_cache.invalidate_pattern("node:1*") == 11
+        assert redis_cache.redis_client.scans == 0
+        assert await redis_cache.get("node:2") == 2
+        assert await redis_cache.get("node:10") is None
+
+    async def test_pattern_without_namespace_scans(self, redis_cache):
+        await redis_cache.set("plain", 1, 60)
+        assert await redis_cache.invalidate_pattern("pla*") == 1
+        assert redis_cache.redis_client.scans == 1
+
+    async def test_delete_cleans_index_sets(self, redis_cache):
+        await redis_cache.set("node:1", 1, 60, tags={"t"})
+        assert await redis_cache.delete("node:1")
+        assert redis_cache.redis_client.sets == {}
+
+    async def test_index_sets_expire_with_longest_key(self, redis_cache):
+        client = redis_cache.redis_client
+        await redis_cache.set("node:1", 1, 300, tags={"t"})
+        await redis_cache.set("node:2", 2, 60, tags={"t"})
+        assert client.ttls["_ns:node"] == client.ttls["_tag:t"] == 300
+        await redis_cache.set("node:3", 3, 900)
+        assert client.ttls["_ns:node"] == 900
+
+        await redis_cache.set("node:4", 4, 0, tags={"t"})    # No TTL: sets persist
+        await redis_cache.set("node:5", 5, 60, tags={"t"})
+        assert "_ns:node" not in client.ttls and "_tag:t" not in client.ttls
+
+    async def test_reset_moves_key_out_of_old_tags(self, redis_cache):
+        client = redis_cache.redis_client
+        await redis_cache.set("node:1", 1, 60, tags={"a", "b"})
+        await redis_cache.set("node:1", 1, 60, tags={"b", "c"})
+        assert "_tag:a" not in client.sets
+        assert client.sets["_keytags:node:1"] == {"b", "c"}
+
+        await redis_cache.set("node:1", 1, 60)
+        assert "_keytags:node:1" not in client.sets
+        assert not any(name.startswith("_tag:") for name in client.sets)
+        assert await redis_cache.invalidate_tags({"b"}) == 0
+        assert await redis_cache.get("node:1") == 1
+
+    async def test_pattern_scans_when_namespace_set_missing(self, redis_cache):
+        client = redis_cache.redis_client
+        client.strings["node:old"] = "1"    # Written before the index existed
+        assert await redis_cache.invalidate_pattern("node:*") == 1
+        assert client.scans == 1 and client.strings == {}
+
+    async def test_pattern_always_scans_without_index(self):
+        cache = RedisCache(index_patterns=False)
+        cache.redis_client = FakeRedis()
+        await cache.set("node:1", 1, 60, tags={"t"})
+        cache.redis_client.strings["node:other"] = "2"    # Another writer
+        assert await cache.invalidate_pattern("node:*") == 2
+        assert cache.redis_client.scans == 1
+        assert cache.redis_client.sets == {}
+
+
+class TestHybridInvalidation:
+    """Both tiers drop tagged entries, including L1 copies filled from L2."""
+
+    async def test_l2_fill_keeps_tags(self, redis_cache):
+        l1 = L1Cache(max_size=100)
+        hybrid = HybridCache(l1, redis_cache)
+        await redis_cache.set("node:1", "v", 60, tags={"node"})
+
+        assert await hybrid.get("node:1") == "v"    # Populates L1 from L2
+        assert l1.engine.keys_for_tags({"node"}) == {"node:1"}
+
+        assert await hybrid.invalidate_tags({"node"}) == 2
+        assert await hybrid.get("node:1") is None
+
+    async def test_pattern_across_tiers(self, redis_cache):
+        hybrid = HybridCache(L1Cache(max_size=100), redis_cache)
+        for n in range(3):
+            await hybrid.set(f"node:{n}", n, 60)
+        await hybrid.set("vm:1", 1, 60)
+
+        assert await hybrid.invalidate_pattern("node:*") == 6
+        assert await hybrid.get("vm:1") == 1
+
+
+class TestHybridMetrics:
+    """Combined latency comes from both tiers' samples."""
+
+    async def test_latency_percentiles_across_tiers(self, redis_cache):
+        l1 = L1Cache(max_size=100)
+        hybrid = HybridCache(l1, redis_cache)
+        for _ in range(10):
+            l1.engine.latency.record(1.0)
+        redis_cache.latency.record(50.0)
+
+        metrics = await hybrid.get_metrics()
+
+        assert metrics.avg_latency_ms == pytest.approx(60 / 11)
+        assert metrics.latency_p50_ms == 1.0
+        assert metrics.latency_p99_ms == 50.0
@@ -0,0 +1,215 @@
+"""
+Tests for the L1 cache engine and L1Cache.
+
+Covers O(1) LRU ordering, W-TinyLFU admission, the byte budget, TTL
+expiry, shard limits and latency percentiles.
+"""
+
+import threading
+import time
+
+import pytest
+
+from opt.services.cache import EvictionPolicy, L1Cache, L1Engine
+from opt.services.cache.l1_engine import LatencyTracker
+
+
+# =============================================================================
+# LRU Tests
+# =============================================================================
+class TestLRU:
+    """Least recently used entries are evicted first."""
+
+    def test_evicts_least_recently_used(self):
+        engine = L1Engine(max_entries=3)
+        for key in "abc":
+            engine.set(key, key)
+        engine.get("a")
+
+        evicted = engine.set("d", "d")
+
+        assert [e.key for e in evicted] == ["b"]
+        assert sorted(engine.keys()) == ["a", "c", "d"]
+
+    def test_overwrite_does_not_evict(self):
+        engine = L1Engine(max_entries=2)
+        engine.set("a", 1)
+        engine.set("b", 2)
+        assert engine.set("a", 3) == []
+        assert engine.get("a") == 3
+        assert len(engine) == 2
+
+    def test_ttl_expiry(self):
+        engine = L1Engine(max_entries=10)
+        engine.set("short", 1, ttl_seconds=0.05)
+        engine.set("forever", 2)
+        time.sleep(0.06)
+
+        assert engine.get("short") is None
+        assert engine.get("forever") == 2
+        assert engine.stats()["expirations"] == 1
+
+    def test_byte_budget(self):
+        engine = L1Engine(max_entries=100, max_bytes=1000)
+        for n in range(10):
+            engine.set(f"k{n}", b"x" * 300)
+
+        assert engine.bytes_used <= 1000
+        assert len(engine) == 3
+        assert engine.get("k9") == b"x" * 300
+        assert engine.get("k0") is None
+
+    def test_delete_releases_bytes(self):
+        engine = L1Engine(max_entries=10, max_bytes=1000)
+        engine.set("a", "y" * 100)
+        engine.delete("a")
+        assert engine.bytes_used == 0
+
+    def test_shards_respect_total_limit(self):
+        engine = L1Engine(max_entries=10_000, shards=16)
+        for n in range(30_000):
+            engine.set(str(n), n)
+
+        assert engine.shard_count == 16
+        assert len(engine) <= 10_000
+        assert len(engine) > 9_000
+
+    def test_concurrent_access(self):
+        engine = L1Engine(max_entries=5_000, shards=8)
+        errors = []
+
+        def worker(offset):
+            try:
+                for n in range(5_000):
+                    engine.set(f"{offset}:{n}", n)
+                    engine.get(f"{offset}:{n // 2}")
+            except Exception as e:    # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert not errors
+        assert len(engine) <= 5_000
+
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            L1Engine(max_entries=0)
+
+
+# =============================================================================
+# W-TinyLFU Tests
+# =============================================================================
+class TestTinyLFU:
+    """Frequently used entries survive a scan of one-hit wonders."""
+
+    def test_scan_resistance(self):
+        engine = L1Engine(max_entries=200, policy=EvictionPolicy.W_TINYLFU)
+        hot = [f"hot{n}" for n in range(100)]
+        for _ in range(5):
+            for key in hot:
+                if engine.get(key) is None:
+                    engine.set(key, key)
+
+        for n in range(2_000):
+            engine.set(f"scan{n}", n)
+
+        survivors = sum(engine.get(key) is not None for key in hot)
+        assert survivors >= 90
+        assert engine.stats()["rejections"] > 0
+
+    def test_lru_loses_hot_set_on_scan(self):
+        engine = L1Engine(max_entries=200, policy=EvictionPolicy.LRU)
+        hot = [f"hot{n}" for n in range(100)]
+        for key in hot:
+            engine.set(key, key)
+        for n in range(2_000):
+            engine.set(f"scan{n}", n)
+        assert all(engine.get(key) is None for key in hot)
+
+    def test_capacity_and_byte_budget(self):
+        engine = L1Engine(max_entries=50, max_bytes=2_000, policy=EvictionPolicy.W_TINYLFU)
+        for n in range(500):
+            engine.set(str(n), "v" * 100)
+            engine.get(str(n // 3))
+
+        assert len(engine) <= 50
+        assert engine.bytes_used <= 2_000
+
+
+# =============================================================================
+# Latency and L1Cache Tests
+# =============================================================================
+class TestLatency:
+    """Percentiles come from real samples, not a running pseudo-average."""
+
+    def test_percentiles(self):
+        tracker = LatencyTracker(window=1000)
+        for n in range(1, 101):
+            tracker.record(float(n))
+
+        p50, p95, p99 = tracker.percentiles(50, 95, 99)
+
+        assert p50 == pytest.approx(50, abs=1)
+        assert p95 == pytest.approx(95, abs=1)
+        assert p99 == pytest.approx(99, abs=1)
+        assert tracker.mean == pytest.approx(50.5)
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window=10)
+        for _ in range(100):
+            tracker.record(1000.0)
+        for _ in range(10):
+            tracker.record(1.0)
+        assert tracker.percentiles(99) == [1.0]
+
+    def test_merged_trackers(self):
+        fast, slow = LatencyTracker(window=100), LatencyTracker(window=100)
+        for _ in range(90):
+            fast.record(1.0)
+        for _ in range(10):
+            slow.record(100.0)
+
+        merged = LatencyTracker.merged(fast, slow)
+
+        assert merged.count == 100
+        assert merged.mean == pytest.approx(10.9)
+        assert merged.percentiles(50, 99) == [1.0, 100.0]
+        assert fast.count == 90    # Inputs are untouched
+
+
+class TestL1Cache:
+    """Async L1Cache API on top of the engine."""
+
+    async def test_get_set_and_metrics(self):
+        cache = L1Cache(max_size=2)
+        await cache.set("a", {"v": 1}, 60)
+        await cache.set("b", 2, 60)
+        await cache.set("c", 3, 60)
+
+        assert await cache.get("a") is None
+        assert await cache.get("c") == 3
+        metrics = await cache.get_metrics()
+        assert metrics.hits == 1
+        assert metrics.misses == 1
+        assert metrics.evictions == 1
+        assert metrics.latency_p99_ms >= metrics.latency_p50_ms > 0
+
+    async def test_invalidate_pattern(self):
+        cache = L1Cache(max_size=100)
+        for n in range(5):
+            await cache.set(f"node:{n}", n, 60)
+        await cache.set("vm:1", 1, 60)
+
+        assert await cache.invalidate_pattern("node:*") == 5
+        assert len(cache) == 1
+
+    async def test_tinylfu_policy(self):
+        cache = L1Cache(max_size=100, policy=EvictionPolicy.W_TINYLFU, max_bytes=10_000)
+        for n in range(1_000):
+            await cache.set(str(n), "x" * 50, 60)
+        assert len(cache) <= 100
+        assert cache.engine.bytes_used <= 10_000
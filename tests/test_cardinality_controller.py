@@ -0,0 +1,267 @@
+"""
+Cardinality Controller Tests
+
+Covers the NumPy-backed HyperLogLog (bulk adds, estimate and merge),
+batch ingestion with CardinalityController.process_samples() against
+per-sample processing, the maintained global series counter, and the
+AdaptiveSampler's compiled rule conditions and streaming latency windows.
+"""
+
+import logging
+import pickle
+import random
+from copy import deepcopy
+from typing import Dict, List, Tuple
+
+import pytest
+
+from opt.services.fast_hash import hash64, hash64_many
+from opt.services.observability import cardinality_controller
+from opt.services.observability.cardinality_controller import (
+    AdaptiveSampler,
+    CardinalityController,
+    HyperLogLog,
+    LabelValueTracker,
+    LatencyWindow,
+    ObservabilityController,
+    SamplingDecision,
+    compile_condition,
+)
+
+Sample=Tuple[str, Dict[str, str], float]
+
+
+def make_samples(count: int, seed: int=3) -> List[Sample]:
+    rng=random.Random(seed)
+    samples: List[Sample] = []
+    for _ in range(count):
+        samples.append(("http_requests_total", {
+            "service": rng.choice(["api", "web"]),
+            "status": rng.choice(["200", "500"]),
+        }, 1.0))
+        samples.append(("pod_cpu_usage", {
+            "pod_id": f"pod-{rng.randrange(300)}",
+            "node": f"node-{rng.randrange(5)}",
+            "transaction_id": str(rng.random()),
+        }, 0.5))
+        samples.append(("request_latency", {
+            "client_ip": f"10.0.{rng.randrange(4)}.{rng.randrange(256)}",
+            "endpoint": rng.choice(["/a", "/b", "/c"]),
+        }, 12.0))
+    return samples
+
+
+class TestFastHash:
+    def test_bulk_matches_scalar(self):
+        values=[f"value-{n}" for n in range(2000)] + ["", "ünïcode"]
+        assert hash64_many(values).tolist() == [hash64(v) for v in values]
+
+
+class TestHyperLogLog:
+    def test_add_many_matches_add(self):
+        values=[f"user-{n}" for n in range(20000)]
+        bulk, single=HyperLogLog(), HyperLogLog()
+        bulk.add_many(values)
+        for value in values:
+            single.add(value)
+        assert bulk.buckets.tolist() == single.buckets.tolist()
+
+    @pytest.mark.parametrize("count", [500, 20000, 300000])
+    def test_estimate_accuracy(self, count):
+        hll=HyperLogLog()
+        hll.add_many([f"series-{n}" for n in range(count)])
+        hll.add_many([f"series-{n}" for n in range(count // 2)])    # duplicates
+        assert abs(hll.estimate() - count) / count < 0.03
+
+    def test_merge(self):
+        a, b, union=HyperLogLog(12), HyperLogLog(12), HyperLogLog(12)
+        a.add_many([f"a{n}" for n in range(5000)])
+        b.add_many([f"b{n}" for n in range(5000)])
+        union.add_many([f"a{n}" for n in range(5000)] + [f"b{n}" for n in range(5000)])
+        a.merge(b)
+        assert a.buckets.tolist() == union.buckets.tolist()
+        with pytest.raises(ValueError):
+            a.merge(HyperLogLog(14))
+
+    def test_copy_keeps_registers_and_view_together(self):
+        original=HyperLogLog(10)
+        original.add_many([f"v{n}" for n in range(100)])
+        clone=pickle.loads(pickle.dumps(deepcopy(original)))
+        clone.add("extra")
+        clone.add_many([f"w{n}" for n in range(100)])
+        assert clone.buckets.tolist() == list(clone._registers)
+        assert original.buckets.tolist() != clone.buckets.tolist()
+
+    def test_empty(self):
+        hll=HyperLogLog()
+        hll.add_many([])
+        assert hll.estimate() == 0
+
+
+class TestBatchIngest:
+    def test_matches_per_sample_processing(self):
+        samples=make_samples(1500)
+        single=CardinalityController(max_series_per_metric=400)
+        batch=CardinalityController(max_series_per_metric=400)
+
+        expected=[single.process_sample(m, labels, v, timestamp=100.0) for m, labels, v in samples]
+        assert batch.process_samples(samples, timestamp=100.0) == expected
+
+        assert batch.total_series == single.total_series
+        assert batch.samples_pruned == single.samples_pruned > 0
+        assert batch.labels_dropped == single.labels_dropped
+        assert {m: set(s) for m, s in batch.series_by_metric.items()} == {
+            m: set(s) for m, s in single.series_by_metric.items()
+        }
+        for metric, trackers in single.label_trackers.items():
+            for label, tracker in trackers.items():
+                other=batch.label_trackers[metric][label]
+                assert other.get_cardinality() == tracker.get_cardinality()
+                assert other.value_counts == tracker.value_counts
+
+    def test_one_warning_per_metric(self, caplog):
+        controller=CardinalityController(max_series_per_metric=10)
+        samples=[("m", {"id": str(n)}, 1.0) for n in range(50)]
+        with caplog.at_level(logging.WARNING):
+            results=controller.process_samples(samples)
+        assert [accepted for _, accepted in results].count(True) == 10
+        warnings=[r for r in caplog.records if "series limit" in r.getMessage()]
+        assert len(warnings) == 1 and "Dropped 40 samples" in warnings[0].getMessage()
+
+    def test_tracker_add_many(self):
+        tracker=LabelValueTracker(max_tracked=2)
+        tracker.add_many(["a", "b", "a", "c"])
+        assert tracker.value_counts == {"a": 2, "b": 1}
+        assert (tracker.total_samples, tracker.overflow_count) == (4, 1)
+        assert tracker.get_cardinality() == 3
+
+
+class TestSeriesCounter:
+    def test_global_limit_uses_counter(self):
+        controller=CardinalityController(max_total_series=5)
+        for n in range(8):
+            controller.process_sample(f"metric_{n % 2}", {"k": str(n)}, 1.0)
+        assert controller.total_series == 5
+        assert controller.get_cardinality_report().total_series == 5
+        assert controller.samples_pruned == 3
+
+    def test_prune_updates_counter(self):
+        controller=CardinalityController()
+        controller.process_samples([("m", {"k": str(n)}, 1.0) for n in range(4)], timestamp=1.0)
+        controller.process_sample("m", {"k": "fresh"}, 1.0)
+        assert controller.prune_stale_series(max_age_seconds=60) == 4
+        assert controller.total_series == 1
+
+    def test_observability_controller_batch(self):
+        controller=ObservabilityController(max_series=100)
+        results=controller.process_metrics([("m", {"k": "1"}, 1.0), ("m", {"k": "1"}, 2.0)])
+        assert [accepted for _, accepted in results] == [True, True]
+        assert controller.cardinality.total_series == 1
+
+
+CONTEXT={
+    "service_name": "payment",
+    "total_duration_ms": 700.0,
+    "span_count": 3,
+    "has_error": False,
+    "http.status_code": "500",
+}
+
+
+class TestSamplingConditions:
+    @pytest.mark.parametrize("condition, expected", [
+        ("True", True),
+        ("False", False),
+        ("has_error == True", False),
+        ("service_name == 'payment'", True),
+        ("span_count >= 3", True),
+        ("total_duration_ms > 1000", False),
+        ("span_count == 3", True),
+        ("http.status_code == '500'", True),
+        # Unknown keys compare as their own name, as before
+        ("env == env", True),
+        ("env == 'prod'", False),
+        # Beyond the original single-comparison matcher
+        ("service_name == 'payment' and total_duration_ms > 500", True),
+        ("has_error or span_count > 10", False),
+        ("not has_error", True),
+        ("0 < span_count <= 3", True),
+        ("http.status_code in ('500', '503')", True),
+        ("service_name not in ['payment']", False),
+        ("total_duration_ms > -1", True),
+    ])
+    def test_semantics(self, condition, expected):
+        assert compile_condition(condition)(CONTEXT) is expected
+
+    @pytest.mark.parametrize("condition", [
+        "__import__('os').system('true')",
+        "span_count + 1 > 2",
+        "tags['a'] == 1",
+        "service_name ==",
+        "service_name is None",
+        "(lambda: True)()",
+    ])
+    def test_unsafe_or_invalid_rejected_when_added(self, condition):
+        sampler=AdaptiveSampler()
+        with pytest.raises(ValueError):
+            sampler.add_rule("bad", condition, 1.0)
+        assert "bad" not in [rule.name for rule in sampler.rules]
+
+    def test_conditions_not_parsed_per_decision(self, monkeypatch):
+        sampler=AdaptiveSampler(base_sample_rate=0.0)
+        rule=sampler.add_rule("checkout", "operation_name == 'POST /checkout'", 1.0, priority=10)
+
+        def no_parsing(*args, **kwargs):
+            raise AssertionError("condition parsed during a decision")
+
+        monkeypatch.setattr(cardinality_controller.ast, "parse", no_parsing)
+        for n, operation in enumerate(["POST /checkout", "GET /cart"]):
+            sampler.start_trace(f"t{n}", "shop", operation)
+            sampler.add_span(f"t{n}", "s1", 5.0)
+        assert sampler.finish_trace("t0") == SamplingDecision.SAMPLED
+        assert sampler.finish_trace("t1") == SamplingDecision.DROPPED
+        assert rule.hit_count == 1
+
+    def test_comparison_errors_skip_rule(self, caplog):
+        sampler=AdaptiveSampler()
+        sampler.add_rule("broken", "service_name > 5", 1.0, priority=0)
+        sampler.start_trace("t", "api", "GET")
+        with caplog.at_level(logging.WARNING):
+            sampler.finish_trace("t")
+        assert "Error evaluating rule broken" in caplog.text
+        assert sampler.rules[0].hit_count == 0
+
+
+class TestLatencyWindow:
+    def test_tracks_percentile_of_recent_values(self):
+        rng=random.Random(5)
+        window=LatencyWindow(99.0, window_size=1000)
+        values=[rng.expovariate(1 / 50) for _ in range(99)]
+        for value in values:
+            assert window.add(value) is None
+        values.append(rng.expovariate(1 / 50))
+        assert window.add(values[-1]) is not None
+
+        for _ in range(5000):
+            window.add(rng.expovariate(1 / 50))
+        # p99 of an exponential distribution: mean * ln(100)
+        assert window.threshold == pytest.approx(50 * 4.605, rel=0.15)
+        assert 1000 <= len(window) < 2000
+
+        # A 10x slowdown is picked up within two windows
+        for _ in range(2000):
+            window.add(rng.expovariate(1 / 500))
+        assert window.threshold == pytest.approx(500 * 4.605, rel=0.15)
+
+    def test_sampler_learns_slow_threshold(self):
+        sampler=AdaptiveSampler(base_sample_rate=0.0)
+        for n in range(300):
+            sampler.start_trace(f"t{n}", "api", "GET")
+            sampler.add_span(f"t{n}", "s", float(n % 100))
+            sampler.finish_trace(f"t{n}")
+        assert 95 <= sampler.latency_thresholds["api"] <= 100
+
+        sampler.start_trace("slow", "api", "GET")
+        sampler.add_span("slow", "s", 250.0)
+        assert sampler.pending_traces["slow"].has_slow_span
+        assert sampler.finish_trace("slow") == SamplingDecision.SAMPLED
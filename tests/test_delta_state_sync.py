@@ -0,0 +1,201 @@
+"""
+Delta State Synchronizer Tests
+
+Covers the ring-buffered delta log of DeltaStateSynchronizer: field-level
+diffs, version arithmetic across ring wrap-around, full-sync fallback,
+the compact msgpack/JSON wire form and follower convergence via
+apply_delta().
+"""
+
+import random
+from copy import deepcopy
+from typing import Dict
+
+import pytest
+
+from opt.services.cluster.large_cluster_optimizer import (
+    DELTA_FORMATS,
+    DeltaStateSynchronizer,
+    LargeClusterOptimizer,
+    NodeInfo,
+    NodeState,
+    apply_delta,
+    decode_delta,
+    encode_delta,
+)
+
+
+def make_node(node_id: str, **overrides) -> NodeInfo:
+    return NodeInfo(node_id=node_id, hostname=node_id, ip_address="10.0.0.1",
+                    state=NodeState.HEALTHY, **overrides)
+
+
+def comparable(state: Dict[str, NodeInfo]) -> Dict[str, NodeInfo]:
+    nodes=deepcopy(state)
+    for node in nodes.values():
+        node.version=0
+    return nodes
+
+
+class TestFieldDeltas:
+    def test_only_changed_fields_recorded(self):
+        sync=DeltaStateSynchronizer()
+        node=make_node("n1", cpu_capacity=8000)
+        assert sync.update_node(node) == 1
+
+        # In-place mutation of the same object is still diffed
+        node.cpu_used=2000
+        node.labels["gpu"] = "true"
+        assert sync.update_node(node) == 2
+        assert node.version == 2
+
+        delta=sync.get_delta_since(1)
+        assert delta.node_updates == {"n1": {"cpu_used": 2000, "labels": {"gpu": "true"}}}
+        assert not delta.full_sync
+
+    def test_unchanged_update_records_nothing(self):
+        sync=DeltaStateSynchronizer()
+        node=make_node("n1")
+        sync.update_node(node)
+        assert sync.update_node(node) == 1
+        assert sync.update_node(make_node("n1")) == 1
+        assert sync.get_delta_since(1) is None
+
+    def test_changes_merged_across_versions(self):
+        sync=DeltaStateSynchronizer()
+        a, b=make_node("a"), make_node("b")
+        sync.update_node(a)
+        sync.update_node(b)
+        a.cpu_used=1
+        sync.update_node(a)
+        a.state=NodeState.DRAINING
+        sync.update_node(a)
+        sync.remove_node("b")
+
+        delta=sync.get_delta_since(2)
+        assert delta.version == 5
+        assert delta.node_updates == {"a": {"cpu_used": 1, "state": "draining"}}
+        assert delta.node_deletions == {"b"}
+        # Merging must not alter the recorded deltas
+        assert sync.get_delta_since(3).node_updates == {"a": {"state": "draining"}}
+
+    def test_readded_node_carries_all_fields(self):
+        sync=DeltaStateSynchronizer()
+        sync.update_node(make_node("a", zone="z1"))
+        sync.remove_node("a")
+        sync.update_node(make_node("a", zone="z1"))
+
+        delta=sync.get_delta_since(1)
+        assert delta.node_deletions == {"a"}
+        assert delta.node_updates["a"]["zone"] == "z1"
+        assert delta.node_updates["a"]["hostname"] == "a"
+
+
+class TestRingBuffer:
+    def test_wraparound_and_full_sync_fallback(self):
+        sync=DeltaStateSynchronizer(max_versions=4)
+        node=make_node("n1")
+        for n in range(10):
+            node.pod_count=n + 1
+            sync.update_node(node)
+
+        assert sync.current_version == 10
+        assert sync.oldest_version == 6
+        delta=sync.get_delta_since(6)
+        assert not delta.full_sync and delta.node_updates == {"n1": {"pod_count": 10}}
+
+        behind=sync.get_delta_since(5)
+        assert behind.full_sync and behind.node_updates["n1"]["pod_count"] == 10
+        assert sync.get_delta_since(0).full_sync
+        assert sync.get_delta_since(10) is None
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            DeltaStateSynchronizer(max_versions=0)
+
+
+class TestWireFormat:
+    @pytest.mark.parametrize("fmt", DELTA_FORMATS)
+    def test_round_trip(self, fmt):
+        sync=DeltaStateSynchronizer()
+        node=make_node("n1", taints=[{"key": "dedicated", "effect": "NoSchedule"}])
+        sync.update_node(node)
+        sync.update_node(make_node("n2"))
+        node.conditions["Ready"] = True
+        sync.update_node(node)
+        sync.remove_node("n2")
+
+        delta=sync.get_delta_since(1)
+        payload=encode_delta(delta, fmt)
+        assert isinstance(payload, bytes)
+        assert delta.compressed_size == len(payload)
+
+        decoded=decode_delta(payload, fmt)
+        assert decoded.version == delta.version
+        assert decoded.node_updates == delta.node_updates
+        assert decoded.node_deletions == delta.node_deletions
+        assert decoded.full_sync is False
+
+    def test_field_numbers_keep_payload_small(self):
+        sync=DeltaStateSynchronizer()
+        node=make_node("node-0001")
+        sync.update_node(node)
+        node.cpu_used=1500
+        sync.update_node(node)
+        assert len(encode_delta(sync.get_delta_since(1))) < 48
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            encode_delta(DeltaStateSynchronizer().get_delta_since(-1), "xml")
+
+
+class TestFollowerConvergence:
+    @pytest.mark.parametrize("fmt", DELTA_FORMATS)
+    def test_random_updates_converge(self, fmt):
+        rng=random.Random(7)
+        leader=DeltaStateSynchronizer(max_versions=16)
+        follower: Dict[str, NodeInfo] = {}
+        live: Dict[str, NodeInfo] = {}
+        synced=0
+
+        for step in range(400):
+            node_id=f"n{rng.randrange(12)}"
+            if node_id in live and rng.random() < 0.1:
+                leader.remove_node(node_id)
+                del live[node_id]
+            else:
+                node=live.setdefault(node_id, make_node(node_id))
+                node.cpu_used=rng.randrange(4) * 1000
+                node.state=rng.choice(list(NodeState)[:3])
+                if rng.random() < 0.2:
+                    node.labels[f"l{rng.randrange(3)}"] = str(step)
+                leader.update_node(node)
+
+            if rng.random() < 0.15:
+                delta=leader.get_delta_since(synced)
+                if delta:
+                    apply_delta(follower, decode_delta(encode_delta(delta, fmt), fmt))
+                    synced=delta.version
+                assert comparable(follower) == comparable(leader.get_full_state())
+
+
+class TestOptimizerSync:
+    async def test_incremental_sync_payload(self):
+        optimizer=LargeClusterOptimizer(max_workers=2)
+        try:
+            await optimizer.initialize(["a", "b"])
+            version=optimizer.incremental_sync(0)["version"]
+            optimizer.update_node_state("a", NodeState.DRAINING)
+
+            result=optimizer.incremental_sync(version)
+            assert result["changes"] == [
+                {"type": "update", "node": "a", "fields": {"state": "draining"}}
+            ]
+            assert optimizer.incremental_sync(0)["full_sync"]
+
+            follower: Dict[str, NodeInfo] = {}
+            apply_delta(follower, decode_delta(optimizer.incremental_sync_payload(0)))
+            assert follower["a"].state is NodeState.DRAINING
+            assert decode_delta(optimizer.incremental_sync_payload(version + 1)).node_updates == {}
+        finally:
+            optimizer.shutdown()
@@ -0,0 +1,318 @@
+"""
+Tests for node metrics snapshot/delta streaming.
+
+Covers per-tick batching and field diffs, removals, jitter suppression,
+resync from a sequence number, per-node channels, JSON/msgpack encoding
+and the /nodes namespace handlers and tick loop.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from opt.web.panel import metrics_stream as ms
+from opt.web.panel import socketio_server
+from opt.web.panel.metrics_stream import ALL_NODES, MetricsStream, decode, encode, publish_tick
+from opt.web.panel.socketio_server import NodeNamespace
+from opt.web.panel.websocket_events import WebSocketConnectionManager, WebSocketEventBus
+
+
+def apply(state, message):
+    """Client-side application of snapshot/delta messages."""
+    if message["type"] == "snapshot":
+        state.clear()
+    for node_id in message.get("removed_nodes", ()):
+        state.pop(node_id, None)
+    for node_id, fields in message.get("removed_fields", {}).items():
+        for name in fields:
+            state.get(node_id, {}).pop(name, None)
+    for node_id, fields in message["nodes"].items():
+        state.setdefault(node_id, {}).update(fields)
+    return state
+
+
+# =============================================================================
+# Delta Tests
+# =============================================================================
+class TestDeltas:
+    """Ticks emit only what changed."""
+
+    def test_updates_batched_per_tick(self):
+        stream = MetricsStream()
+        stream.update("node1", {"cpu": 10, "mem": 50})
+        stream.update("node1", {"cpu": 20, "mem": 50})
+        stream.update("node2", {"cpu": 5})
+
+        frame = stream.tick()
+
+        assert frame["seq"] == 1 and frame["prev"] == 0
+        assert frame["nodes"] == {"node1": {"cpu": 20, "mem": 50}, "node2": {"cpu": 5}}
+        assert stream.tick() is None    # Nothing new: no frame, seq unchanged
+        assert stream.seq == 1
+
+    def test_only_changed_fields_sent(self):
+        stream = MetricsStream()
+        stream.update("node1", {"cpu": 10, "mem": 50, "disk": 7})
+        stream.tick()
+        stream.update("node1", {"cpu": 11, "mem": 50, "disk": 7})
+        stream.update("node2", {"cpu": 1})
+        stream.tick()
+        stream.update("node2", {"cpu": 1})
+
+        assert stream.tick() is None
+        assert stream.state["node1"] == {"cpu": 11, "mem": 50, "disk": 7}
+        assert stream._history[-1]["nodes"] == {"node1": {"cpu": 11}, "node2": {"cpu": 1}}
+
+    def test_removed_fields_and_nodes(self):
+        stream = MetricsStream()
+        stream.update("node1", {"cpu": 10, "gpu": 3})
+        stream.update("node2", {"cpu": 1})
+        stream.tick()
+        stream.update("node1", {"cpu": 10})
+        stream.remove_node("node2")
+
+        frame = stream.tick()
+
+        assert frame["nodes"] == {}
+        assert frame["removed_fields"] == {"node1": ["gpu"]}
+        assert frame["removed_nodes"] == ["node2"]
+        assert stream.snapshot()["nodes"] == {"node1": {"cpu": 10}}
+
+    def test_partial_updates_merge(self):
+        stream = MetricsStream()
+        stream.update("node1", {"cpu": 10, "mem": 50})
+        stream.tick()
+        stream.update("node1", {"cpu": 12}, replace=False)
+        stream.update("node1", {"net": 3}, replace=False)
+
+        assert stream.tick()["nodes"] == {"node1": {"cpu": 12, "net": 3}}
+        assert stream.state["node1"] == {"cpu": 12, "mem": 50, "net": 3}
+
+    def test_min_change_suppresses_jitter(self):
+        stream = MetricsStream(min_change=0.5)
+        stream.update("node1", {"cpu": 10.0, "status": "ok"})
+        stream.tick()
+        stream.update("node1", {"cpu": 10.2, "status": "ok"})
+        assert stream.tick() is None
+        stream.update("node1", {"cpu": 10.6, "status": "ok"})
+        assert stream.tick()["nodes"] == {"node1": {"cpu": 10.6}}
+
+
+# =============================================================================
+# Resync Tests
+# =============================================================================
+class TestResync:
+    """Clients catch up from any sequence number."""
+
+    def make_stream(self, ticks: int, history_size: int = 240) -> MetricsStream:
+        stream = MetricsStream(history_size=history_size)
+        for n in range(ticks):
+            stream.update("node1", {"cpu": n, "mem": 50})
+            stream.update(f"node{n % 3 + 2}", {"cpu": n})
+            stream.tick()
+        return stream
+
+    def test_since_merges_deltas(self):
+        stream = self.make_stream(10)
+        client = apply({}, stream.snapshot())
+        at_seq4 = self.make_stream(4).snapshot()
+        assert at_seq4["seq"] == 4
+
+        message = stream.since(4)
+
+        assert message["type"] == "delta" and message["seq"] == 10 and message["prev"] == 4
+        assert apply(apply({}, at_seq4), message) == client
+
+    def test_since_handles_removals(self):
+        stream = self.make_stream(3)
+        base = apply({}, stream.snapshot())
+        stream.remove_node("node2")
+        stream.update("node1", {"cpu": 99})
+        stream.tick()
+
+        assert apply(base, stream.since(3)) == stream.snapshot()["nodes"]
+
+    def test_old_or_unknown_seq_gets_snapshot(self):
+        stream = self.make_stream(20, history_size=5)
+        assert stream.since(2)["type"] == "snapshot"
+        assert stream.since(99)["type"] == "snapshot"
+        assert stream.since(15)["type"] == "delta"
+        assert stream.since(20) == {"type": "delta", "seq": 20, "prev": 20, "nodes": {}}
+
+    def test_since_filters_nodes(self):
+        stream = self.make_stream(6)
+        message = stream.since(2, node_ids=["node1"])
+        assert set(message["nodes"]) == {"node1"}
+
+
+# =============================================================================
+# Channel and Encoding Tests
+# =============================================================================
+class TestChannels:
+    """Per-node channels and wire encodings."""
+
+    def test_node_channel_prev_links_frames_touching_node(self):
+        stream = MetricsStream()
+        stream.update("node1", {"cpu": 1})
+        first = stream.tick()
+        stream.update("node2", {"cpu": 1})
+        stream.tick()
+        stream.update("node1", {"cpu": 2})
+        third = stream.tick()
+
+        assert MetricsStream.channel_frame(first, "node1")["prev"] == 0
+        assert MetricsStream.channel_frame(third, "node2") is None
+        message = MetricsStream.channel_frame(third, "node1")
+        assert (message["seq"], message["prev"]) == (3, 1)
+        assert message["nodes"] == {"node1": {"cpu": 2}}
+        assert "node_prev" not in MetricsStream.channel_frame(third, ALL_NODES)
+
+    def test_publish_tick_encodes_once_per_room(self):
+        stream = MetricsStream()
+        stream.add_subscriber("a", None, "json")
+        stream.add_subscriber("b", None, "json")
+        stream.add_subscriber("c", ["node1"], "msgpack" if ms.HAS_MSGPACK else "json")
+        stream.update("node1", {"cpu": 1})
+        stream.update("node2", {"cpu": 2})
+
+        sent = {}
+        assert publish_tick(stream, sent.__setitem__, now=1.0) == 2
+        fmt = "msgpack" if ms.HAS_MSGPACK else "json"
+        assert set(sent) == {"metrics_stream:json:*", f"metrics_stream:{fmt}:node1"}
+        assert decode(sent["metrics_stream:json:*"])["nodes"] == {"node1": {"cpu": 1}, "node2": {"cpu": 2}}
+        assert decode(sent[f"metrics_stream:{fmt}:node1"], fmt)["nodes"] == {"node1": {"cpu": 1}}
+
+        stream.remove_subscriber("c")
+        assert stream.active_channels() == {("json", ALL_NODES)}
+
+    def test_msgpack_smaller_than_json(self):
+        pytest.importorskip("msgpack")
+        message = {"type": "delta", "seq": 7, "prev": 6,
+                   "nodes": {f"node{n}": {"cpu": 12.5, "mem": 1 << 30} for n in range(50)}}
+        packed = encode(message, "msgpack")
+        assert isinstance(packed, bytes)
+        assert decode(packed, "msgpack") == message
+        assert len(packed) < len(encode(message))
+
+    def test_unknown_or_missing_format_rejected(self):
+        stream = MetricsStream()
+        with pytest.raises(ValueError):
+            stream.add_subscriber("a", None, "xml")
+        with patch.object(ms, "HAS_MSGPACK", False):
+            with pytest.raises(ValueError):
+                stream.add_subscriber("a", None, "msgpack")
+
+
+# =============================================================================
+# Namespace Tests
+# =============================================================================
+class FakeSocketIO:
+    def __init__(self):
+        self.handlers = {}
+        self.emitted = []
+        self.tasks = []
+
+    def on(self, event, namespace=None):
+        def register(func):
+            self.handlers[event] = func
+            return func
+        return register
+
+    def emit(self, event, data, namespace=None, room=None):
+        self.emitted.append((event, room, data))
+
+    def start_background_task(self, target):
+        self.tasks.append(target)
+
+    def sleep(self, seconds):
+        pass
+
+
+class TestNodeNamespace:
+    """Socket.IO wiring of the stream."""
+
+    @pytest.fixture
+    def namespace(self):
+        bus = WebSocketEventBus()
+        ns = NodeNamespace(WebSocketConnectionManager(bus), bus, legacy_metrics_events=False)
+        socketio = FakeSocketIO()
+        joined = []
+        with patch.object(socketio_server, "request", SimpleNamespace(sid="sid-1")), \
+                patch.object(socketio_server, "join_room", joined.append), \
+                patch.object(socketio_server, "leave_room", lambda room: joined.remove(room)):
+            ns.register_handlers(socketio)
+            yield ns, socketio, joined
+
+    def test_subscribe_returns_snapshot_and_stream_delivers_deltas(self, namespace):
+        ns, socketio, joined = namespace
+        ns.broadcast_node_metrics("node1", {"cpu": 10, "mem": 50})
+        ns.metrics_stream.tick()
+
+        snapshot = decode(socketio.handlers["subscribe_metrics_stream"]({}))
+        assert snapshot == {"type": "snapshot", "seq": 1, "nodes": {"node1": {"cpu": 10, "mem": 50}}}
+        assert joined == ["metrics_stream:json:*"]
+
+        ns.broadcast_node_metrics("node1", {"cpu": 11, "mem": 50})
+        ns.start_metrics_stream(socketio)
+        loop = socketio.tasks[0]
+        with patch.object(socketio, "sleep", lambda s: ns.stop_metrics_stream()):
+            loop()
+
+        event, room, payload = socketio.emitted[0]
+        assert (event, room) == ("metrics_delta", "metrics_stream:json:*")
+        assert decode(payload)["nodes"] == {"node1": {"cpu": 11}}
+
+    def test_resubscribe_with_last_seq_gets_delta(self, namespace):
+        ns, socketio, _ = namespace
+        for cpu in range(3):
+            ns.broadcast_node_metrics("node1", {"cpu": cpu})
+            ns.metrics_stream.tick()
+        message = decode(socketio.handlers["resync_metrics"]({"last_seq": 1}))
+        assert message["type"] == "delta" and message["nodes"] == {"node1": {"cpu": 2}}
+
+    def test_resubscribe_leaves_previous_rooms(self, namespace):
+        ns, socketio, joined = namespace
+        socketio.handlers["subscribe_metrics_stream"]({})
+        socketio.handlers["subscribe_metrics_stream"]({"node_ids": ["node1", "node2"]})
+        assert sorted(joined) == ["metrics_stream:json:node1", "metrics_stream:json:node2"]
+        socketio.handlers["subscribe_metrics_stream"]({"node_ids": ["node2"]})
+        assert joined == ["metrics_stream:json:node2"]
+        assert ns.metrics_stream.active_channels() == {("json", "node2")}
+
+    def test_resync_payload_validation(self, namespace):
+        ns, socketio, _ = namespace
+        ns.broadcast_node_metrics("node1", {"cpu": 1})
+        ns.metrics_stream.tick()
+        for payload in (None, {}):
+            assert decode(socketio.handlers["resync_metrics"](payload))["type"] == "snapshot"
+        for last_seq in ("1", 1.5, True):
+            result = socketio.handlers["resync_metrics"]({"last_seq": last_seq})
+            assert result == {"status": "error", "error": "last_seq must be an integer"}
+            result = socketio.handlers["subscribe_metrics_stream"]({"last_seq": last_seq})
+            assert result["status"] == "error"
+        for node_ids in ("node1", ["node1", 2], {"node1": 1}):
+            for event in ("resync_metrics", "subscribe_metrics_stream"):
+                result = socketio.handlers[event]({"node_ids": node_ids})
+                assert result == {"status": "error", "error": "node_ids must be a list of node IDs"}
+        assert socketio.handlers["resync_metrics"]("node1")["status"] == "error"
+
+    def test_resync_msgpack_unavailable(self, namespace):
+        ns, socketio, joined = namespace
+        socketio.handlers["subscribe_metrics_stream"]({"node_ids": ["node1"]})
+        with patch.object(ms, "HAS_MSGPACK", False):
+            for event in ("resync_metrics", "subscribe_metrics_stream"):
+                result = socketio.handlers[event]({"format": "msgpack"})
+                assert result["status"] == "error" and "msgpack" in result["error"]
+        # A rejected resubscribe keeps the existing subscription
+        assert joined == ["metrics_stream:json:node1"]
+
+    def test_unsubscribe_and_errors(self, namespace):
+        ns, socketio, joined = namespace
+        socketio.handlers["subscribe_metrics_stream"]({"node_ids": ["node1"]})
+        assert joined == ["metrics_stream:json:node1"]
+        socketio.handlers["unsubscribe_metrics_stream"]({})
+        assert joined == [] and ns.metrics_stream.active_channels() == set()
+
+        result = socketio.handlers["subscribe_metrics_stream"]({"format": "xml"})
+        assert result["status"] == "error"
@@ -0,0 +1,212 @@
+"""
+RPC Node Registry Tests
+
+Covers ShardedNodeRegistry registration, heartbeat batching, status and
+hostname filtering, stale detection, the background flusher, and
+persistence through the in-memory and SQLite backends.
+"""
+
+import threading
+import time
+import uuid
+from typing import List
+
+import pytest
+
+from opt.services.rpc.node_registry import (
+    HeartbeatRow,
+    InMemoryRegistryBackend,
+    NodeRecord,
+    ShardedNodeRegistry,
+    SQLiteRegistryBackend,
+    create_node_registry,
+)
+
+
+class RecordingBackend(InMemoryRegistryBackend):
+    """In-memory backend that keeps every heartbeat batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: List[List[HeartbeatRow]] = []
+        self.fail=False
+
+    def write_heartbeats(self, rows: List[HeartbeatRow]) -> None:
+        if self.fail:
+            raise OSError("disk full")
+        self.batches.append(sorted(rows))
+        super().write_heartbeats(rows)
+
+
+def register_many(registry: ShardedNodeRegistry, count: int) -> List[NodeRecord]:
+    return [registry.register(f"node{n}.example", f"10.0.0.{n}", "1.0") for n in range(count)]
+
+
+class TestRegistration:
+    def test_register_assigns_uuid_and_writes_through(self):
+        backend=RecordingBackend()
+        registry=ShardedNodeRegistry(backend)
+        record=registry.register("node1.example", "10.0.0.1", "1.0")
+
+        assert str(uuid.UUID(record.node_id)) == record.node_id
+        assert record.status == "registered"
+        assert backend.records[record.node_id].hostname == "node1.example"
+
+    def test_reregistering_hostname_keeps_node_id(self):
+        registry=ShardedNodeRegistry()
+        first=registry.register("node1.example", "10.0.0.1", "1.0")
+        registry.heartbeat(first.node_id)
+        second=registry.register("node1.example", "10.0.0.9", "1.1")
+
+        assert second.node_id == first.node_id
+        assert (second.ip, second.version, second.status) == ("10.0.0.9", "1.1", "registered")
+        assert registry.count() == 1
+
+    def test_remove(self):
+        backend=RecordingBackend()
+        registry=ShardedNodeRegistry(backend)
+        record=registry.register("node1.example", "10.0.0.1")
+
+        assert registry.remove(record.node_id)
+        assert not registry.remove(record.node_id)
+        assert registry.get(record.node_id) is None
+        assert backend.records == {}
+        assert registry.register("node1.example", "10.0.0.1").node_id != record.node_id
+
+
+class TestHeartbeats:
+    def test_heartbeats_batched_until_flush(self):
+        backend=RecordingBackend()
+        registry=ShardedNodeRegistry(backend, shards=4)
+        nodes=register_many(registry, 5)
+
+        for now in (100.0, 101.0, 102.0):
+            for node in nodes[:3]:
+                assert registry.heartbeat(node.node_id, now)
+        assert backend.batches == []
+        assert registry.get(nodes[0].node_id).last_heartbeat == 102.0
+
+        assert registry.flush() == 3
+        assert backend.batches == [sorted((n.node_id, 102.0, "online") for n in nodes[:3])]
+        assert registry.flush() == 0
+        assert registry.stats()["heartbeats"] == 9
+
+    def test_unknown_node_rejected(self):
+        registry=ShardedNodeRegistry()
+        assert not registry.heartbeat(str(uuid.uuid4()))
+
+    def test_failed_flush_retried(self):
+        backend=RecordingBackend()
+        registry=ShardedNodeRegistry(backend)
+        node=registry.register("node1.example", "10.0.0.1")
+        registry.heartbeat(node.node_id, 50.0)
+
+        backend.fail=True
+        with pytest.raises(OSError):
+            registry.flush()
+        assert registry.stats()["dirty"] == 1
+
+        backend.fail=False
+        assert registry.flush() == 1
+        assert backend.records[node.node_id].last_heartbeat == 50.0
+
+    def test_concurrent_heartbeats(self):
+        registry=ShardedNodeRegistry(shards=8)
+        nodes=register_many(registry, 64)
+
+        def beat(offset: int) -> None:
+            for n in range(500):
+                registry.heartbeat(nodes[(n + offset) % len(nodes)].node_id)
+
+        threads=[threading.Thread(target=beat, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert registry.stats()["heartbeats"] == 2000
+        assert registry.count("online") == 64
+        assert registry.flush() == 64
+
+    def test_mark_stale(self):
+        registry=ShardedNodeRegistry()
+        fresh, stale=register_many(registry, 2)
+        registry.heartbeat(fresh.node_id, 1000.0)
+        registry.heartbeat(stale.node_id, 900.0)
+
+        assert registry.mark_stale(60, now=1010.0) == 1
+        assert registry.get(stale.node_id).status == "offline"
+        assert registry.count("online") == 1
+        registry.heartbeat(stale.node_id, 1011.0)
+        assert registry.get(stale.node_id).status == "online"
+
+
+class TestListing:
+    def test_filters(self):
+        registry=ShardedNodeRegistry(shards=4)
+        nodes=register_many(registry, 12)
+        for node in nodes[:5]:
+            registry.heartbeat(node.node_id)
+
+        online={r.node_id for r in registry.iter_nodes(status="online")}
+        assert online == {n.node_id for n in nodes[:5]}
+        assert {r.hostname for r in registry.iter_nodes(hostname_prefix="node1")} == {
+            "node1.example", "node10.example", "node11.example"
+        }
+        assert [r.hostname for r in registry.iter_nodes("online", "node1")] == ["node1.example"]
+        assert len(list(registry.iter_nodes())) == 12
+        assert list(registry.iter_nodes(status="error")) == []
+
+    def test_iteration_returns_copies_and_does_not_block(self):
+        registry=ShardedNodeRegistry(shards=2)
+        nodes=register_many(registry, 4)
+        stream=registry.iter_nodes()
+        first=next(stream)
+        first.status="tampered"
+
+        # A heartbeat mid-iteration must not deadlock on a held shard lock
+        assert registry.heartbeat(nodes[0].node_id)
+        assert len(list(stream)) == 3
+        assert registry.get(first.node_id).status != "tampered"
+
+
+class TestPersistence:
+    def test_sqlite_round_trip(self, tmp_path):
+        path=str(tmp_path / "nodes.db")
+        registry=ShardedNodeRegistry(SQLiteRegistryBackend(path))
+        nodes=register_many(registry, 3)
+        registry.heartbeat(nodes[1].node_id, 1234.5)
+        registry.close()
+
+        reloaded=ShardedNodeRegistry(SQLiteRegistryBackend(path))
+        record=reloaded.get(nodes[1].node_id)
+        assert (record.status, record.last_heartbeat) == ("online", 1234.5)
+        assert reloaded.count() == 3
+        assert reloaded.register("node0.example", "10.0.0.0").node_id == nodes[0].node_id
+        reloaded.close()
+
+    def test_background_flusher(self):
+        backend=RecordingBackend()
+        registry=ShardedNodeRegistry(backend, flush_interval=0.01, stale_after=3600)
+        node=registry.register("node1.example", "10.0.0.1")
+        registry.start()
+        try:
+            registry.heartbeat(node.node_id)
+            for _ in range(200):
+                if backend.batches:
+                    break
+                time.sleep(0.01)
+            assert backend.batches and backend.batches[0][0][0] == node.node_id
+        finally:
+            registry.stop()
+
+    def test_create_from_config(self, tmp_path):
+        registry=create_node_registry({
+            "node_registry": {"backend": "sqlite", "path": str(tmp_path / "n.db"), "shards": 4}
+        })
+        assert isinstance(registry.backend, SQLiteRegistryBackend)
+        assert registry.stats()["shards"] == 4
+        registry.close()
+        assert isinstance(create_node_registry({}).backend, InMemoryRegistryBackend)
+        with pytest.raises(ValueError):
+            create_node_registry({"node_registry": {"backend": "etcd"}})
@@ -0,0 +1,162 @@
+"""
+Node Status API - Test Suite
+
+Covers the materialized node-status snapshot (incremental refresh,
+invalidation on heartbeats and deletes, health expiry) and the
+api_nodes_status endpoint: ETag/304, keyset pagination, field projection
+and parameter validation.
+"""
+
+import inspect
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from flask import Flask
+
+from opt.web.panel.extensions import db
+from opt.web.panel.models import node as node_module
+from opt.web.panel.models.node import Node, NodeStatusCache, get_node_status_cache
+from opt.web.panel.routes import nodes as nodes_routes
+
+
+class NodeStatusTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+        self.app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        db.init_app(self.app)
+        # The view without its login/RBAC/rate-limit decorators
+        self.app.add_url_rule(
+            "/nodes/api/status", view_func=inspect.unwrap(nodes_routes.api_nodes_status)
+        )
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.client = self.app.test_client()
+
+    def tearDown(self) -> None:
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def add_nodes(self, count: int, status: str = "online") -> None:
+        start = db.session.query(db.func.max(Node.id)).scalar() or 0
+        for n in range(start + 1, start + count + 1):
+            db.session.add(Node(
+                node_id=f"uuid-{n}", hostname=f"node{n}.example", ip_address=f"10.0.0.{n % 250}",
+                status=status, cpu_cores=8, memory_gb=32, storage_gb=500,
+            ))
+        db.session.commit()
+
+
+class TestNodeStatusCache(NodeStatusTestCase):
+    def test_snapshot_matches_to_dict(self) -> None:
+        self.add_nodes(5)
+        snapshot = get_node_status_cache().get()
+        expected = [n.to_dict() for n in Node.query.order_by(Node.id).all()]
+        self.assertEqual(snapshot.rows, expected)
+        self.assertTrue(all(row["is_healthy"] for row in snapshot.rows))
+
+    def test_unchanged_table_reuses_snapshot(self) -> None:
+        self.add_nodes(3)
+        cache = NodeStatusCache(revalidate_interval=0)
+        first = cache.get()
+        self.assertIs(cache.get(), first)
+        self.assertEqual(cache.stats["rebuilds"], 1)
+
+    def test_heartbeat_refreshes_incrementally(self) -> None:
+        self.add_nodes(4, status="offline")
+        cache = get_node_status_cache()
+        first = cache.get()
+
+        Node.query.get(2).update_heartbeat()
+        second = cache.get()
+
+        self.assertGreater(second.version, first.version)
+        self.assertEqual(second.rows[1]["status"], "online")
+        self.assertEqual(cache.stats["incremental"], 1)
+        self.assertEqual(cache.stats["rebuilds"], 1)
+
+    def test_delete_and_insert_rebuild(self) -> None:
+        self.add_nodes(3)
+        cache = get_node_status_cache()
+        cache.get()
+        db.session.delete(Node.query.get(1))
+        db.session.commit()
+        self.add_nodes(1)
+        self.assertEqual([row["id"] for row in cache.get().rows], [2, 3, 4])
+
+    def test_other_process_writes_seen_after_revalidate_interval(self) -> None:
+        self.add_nodes(2)
+        cache = get_node_status_cache()
+        cache.revalidate_interval = 60
+        cache.get()
+        # A raw UPDATE bypasses the ORM events, as a write from another worker would
+        db.session.execute(
+            Node.__table__.update().where(Node.__table__.c.id == 1).values(
+                status="error", updated_at=datetime.now(timezone.utc) + timedelta(seconds=1)
+            )
+        )
+        db.session.commit()
+        self.assertEqual(cache.get().rows[0]["status"], "online")
+        cache.revalidate_interval = 0
+        self.assertEqual(cache.get().rows[0]["status"], "error")
+
+    def test_health_expiry(self) -> None:
+        self.add_nodes(1)
+        cache = get_node_status_cache()
+        snapshot = cache.get()
+        self.assertTrue(snapshot.rows[0]["is_healthy"])
+
+        later = snapshot.valid_until + 1
+        with patch.object(node_module.time, "time", return_value=later):
+            self.assertFalse(cache.get().rows[0]["is_healthy"])
+
+
+class TestNodeStatusEndpoint(NodeStatusTestCase):
+    def test_full_list_and_etag(self) -> None:
+        self.add_nodes(3)
+        response = self.client.get("/nodes/api/status")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([n["hostname"] for n in response.get_json()], ["node1.example", "node2.example", "node3.example"])
+        etag = response.headers["ETag"]
+        self.assertEqual(response.headers["Cache-Control"], "private, no-cache")
+
+        cached = self.client.get("/nodes/api/status", headers={"If-None-Match": etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.data, b"")
+
+        Node.query.get(1).status = "error"
+        db.session.commit()
+        changed = self.client.get("/nodes/api/status", headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["ETag"], etag)
+
+    def test_keyset_pagination(self) -> None:
+        self.add_nodes(7)
+        seen, after = [], None
+        while True:
+            url = "/nodes/api/status?limit=3" + (f"&after={after}" if after else "")
+            body = self.client.get(url).get_json()
+            seen.extend(n["id"] for n in body["nodes"])
+            after = body["next_after"]
+            if after is None:
+                break
+        self.assertEqual(seen, list(range(1, 8)))
+
+    def test_field_projection_and_status_filter(self) -> None:
+        self.add_nodes(2)
+        self.add_nodes(2, status="offline")
+        body = self.client.get("/nodes/api/status?fields=node_id,status&status=offline").get_json()
+        self.assertEqual(body, [{"node_id": "uuid-3", "status": "offline"}, {"node_id": "uuid-4", "status": "offline"}])
+
+    def test_invalid_parameters(self) -> None:
+        self.assertEqual(self.client.get("/nodes/api/status?fields=password").status_code, 400)
+        self.assertEqual(self.client.get("/nodes/api/status?limit=0").status_code, 400)
+        self.assertEqual(self.client.get("/nodes/api/status?limit=5000").status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
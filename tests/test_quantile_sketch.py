@@ -0,0 +1,161 @@
+"""
+Tests for the DDSketch quantile sketch.
+
+Covers the relative-error guarantee against exact percentiles, bulk
+insertion, merging across sketches, serialization and the bin limit.
+"""
+
+import json
+import math
+import random
+
+import pytest
+
+from opt.services.quantile_sketch import DDSketch, merge_sketches
+
+QUANTILES = [0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99, 0.999, 1.0]
+
+
+def exact(sorted_values, q):
+    return sorted_values[int(q * (len(sorted_values) - 1))]
+
+
+def distributions():
+    rng = random.Random(11)
+    return {
+        "lognormal": [rng.lognormvariate(3, 1.5) for _ in range(20_000)],
+        "uniform": [rng.uniform(1, 1000) for _ in range(20_000)],
+        "pareto": [rng.paretovariate(1.2) for _ in range(20_000)],
+    }
+
+
+# =============================================================================
+# Accuracy Tests
+# =============================================================================
+class TestAccuracy:
+    """Every quantile is within the configured relative error."""
+
+    @pytest.mark.parametrize("alpha", [0.005, 0.01, 0.05])
+    @pytest.mark.parametrize("name", ["lognormal", "uniform", "pareto"])
+    def test_relative_error_bound(self, name, alpha):
+        values = distributions()[name]
+        sketch = DDSketch(relative_accuracy=alpha)
+        for value in values:
+            sketch.add(value)
+        ordered = sorted(values)
+
+        for q in QUANTILES:
+            expected = exact(ordered, q)
+            assert sketch.quantile(q) == pytest.approx(expected, rel=alpha * 1.0001)
+
+    def test_add_many_matches_add(self):
+        values = distributions()["lognormal"]
+        one = DDSketch()
+        for value in values:
+            one.add(value)
+        bulk = DDSketch()
+        bulk.add_many(iter(values))
+
+        assert bulk.bins == one.bins
+        assert bulk.count == one.count
+        assert bulk.sum == pytest.approx(one.sum)
+        assert (bulk.min, bulk.max) == (one.min, one.max)
+
+    def test_zero_and_extremes(self):
+        sketch = DDSketch()
+        sketch.add_many([0.0] * 10 + [5.0] * 10)
+
+        assert sketch.quantile(0.2) == 0.0
+        assert sketch.quantile(1.0) == 5.0
+        assert sketch.zero_count == 10
+
+    def test_mean_and_summary(self):
+        sketch = DDSketch()
+        sketch.add_many(range(1, 101))
+        summary = sketch.summary()
+
+        assert summary.count == 100
+        assert summary.mean == pytest.approx(50.5)
+        assert summary.p99 == pytest.approx(99, rel=0.01)
+        assert summary.to_dict()["max"] == 100
+
+    def test_empty_sketch(self):
+        sketch = DDSketch()
+        assert sketch.quantile(0.5) is None
+        assert sketch.summary().count == 0
+
+    @pytest.mark.parametrize("bad", [-1.0, math.nan])
+    def test_rejects_invalid_values(self, bad):
+        with pytest.raises(ValueError):
+            DDSketch().add(bad)
+        with pytest.raises(ValueError):
+            DDSketch().add_many([1.0, bad])
+
+    def test_rejects_invalid_quantile(self):
+        sketch = DDSketch()
+        sketch.add(1.0)
+        with pytest.raises(ValueError):
+            sketch.quantile(1.5)
+
+
+# =============================================================================
+# Merge and Serialization Tests
+# =============================================================================
+class TestMerge:
+    """Merging per-node sketches equals sketching all values at once."""
+
+    def test_merge_equals_union(self):
+        values = distributions()["lognormal"]
+        nodes = [DDSketch() for _ in range(4)]
+        for n, value in enumerate(values):
+            nodes[n % 4].add(value)
+        whole = DDSketch()
+        whole.add_many(values)
+
+        fleet = merge_sketches(reversed(nodes))
+
+        assert fleet.bins == whole.bins
+        assert fleet.count == whole.count
+        assert fleet.quantiles(QUANTILES) == whole.quantiles(QUANTILES)
+        assert nodes[0].count == len(values) // 4    # Inputs are not modified
+
+    def test_merge_requires_same_accuracy(self):
+        with pytest.raises(ValueError):
+            DDSketch(0.01).merge(DDSketch(0.02))
+
+    def test_json_round_trip(self):
+        sketch = DDSketch()
+        sketch.add_many(distributions()["pareto"])
+
+        restored = DDSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.bins == sketch.bins
+        assert restored.quantiles(QUANTILES) == sketch.quantiles(QUANTILES)
+        assert DDSketch.from_dict(DDSketch().to_dict()).count == 0
+
+
+# =============================================================================
+# Memory Bound Tests
+# =============================================================================
+class TestBinLimit:
+    """Collapsing the lowest bins bounds memory and keeps the tail accurate."""
+
+    def test_bins_bounded_and_tail_accurate(self):
+        rng = random.Random(2)
+        values = [10 ** rng.uniform(-6, 6) for _ in range(50_000)]
+        sketch = DDSketch(relative_accuracy=0.01, max_bins=256)
+        for value in values:
+            sketch.add(value)
+        ordered = sorted(values)
+
+        assert len(sketch.bins) <= 256
+        assert sketch.collapsed
+        assert sketch.count == len(values)
+        for q in (0.9, 0.95, 0.99):
+            assert sketch.quantile(q) == pytest.approx(exact(ordered, q), rel=0.0101)
+
+    def test_merge_respects_limit(self):
+        low, high = DDSketch(max_bins=64), DDSketch(max_bins=64)
+        low.add_many([1.1 ** n for n in range(60)])
+        high.add_many([1.1 ** n for n in range(60, 120)])
+        assert len(low.merge(high).bins) <= 64
@@ -0,0 +1,277 @@
+"""
+RPC Authentication - Verified Credential Cache Tests
+
+Covers VerifiedCredentialCache (TTL, credential expiry, LRU bound, keyed
+digests) and its use by AuthenticationInterceptor for API keys and JWTs,
+including eviction on revocation and rotation events from APIKeyManager
+and APIKeyRotationManager.
+"""
+
+import hashlib
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import jwt
+import pytest
+
+from opt.services.api_key_manager import APIKeyManager, KeyRotationConfig
+from opt.services.api_key_rotation import APIKeyRotationManager
+from opt.services.rpc.auth import (
+    AuthenticationInterceptor,
+    Identity,
+    VerifiedCredentialCache,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now=1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingInterceptor(AuthenticationInterceptor):
+    """Interceptor with an in-memory key store that counts lookups."""
+
+    API_KEY_HASH_ITERATIONS=1000
+
+    def __init__(self, config: Dict[str, Any], keys: Dict[str, Dict[str, Any]]) -> None:
+        super().__init__(config)
+        self.keys=keys
+        self.lookups: List[str] = []
+
+    def _lookup_key_hash(self, key_hash: str) -> Optional[Dict[str, Any]]:
+        self.lookups.append(key_hash)
+        for api_key, data in self.keys.items():
+            if self.hash(api_key) == key_hash:
+                return data
+        return None
+
+    def hash(self, api_key: str) -> str:
+        return hashlib.pbkdf2_hmac(
+            "sha256", api_key.encode(), self.api_key_salt, self.API_KEY_HASH_ITERATIONS
+        ).hex()
+
+
+@pytest.fixture(autouse=True)
+def api_key_salt(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("API_KEY_SALT", "test-salt")
+
+
+@pytest.fixture
+def interceptor() -> CountingInterceptor:
+    return CountingInterceptor(
+        {},
+        {
+            "dv_alpha": {"key_id": "key_a", "principal_id": "ci-system", "permissions": ["node:list"]},
+            "dv_beta": {"key_id": "key_b", "principal_id": "monitor-agent"},
+        },
+    )
+
+
+# ============================================================================
+# VerifiedCredentialCache
+# ============================================================================
+class TestVerifiedCredentialCache:
+    def test_hit_returns_copy(self) -> None:
+        cache=VerifiedCredentialCache()
+        cache.put("api-key", "secret", Identity("svc", "api-key", ["a"]))
+
+        first=cache.get("api-key", "secret")
+        first.permissions.append("b")
+        second=cache.get("api-key", "secret")
+
+        assert second.principal_id == "svc"
+        assert second.permissions == ["a"]
+        assert cache.stats()["hits"] == 2
+
+    def test_kinds_do_not_collide(self) -> None:
+        cache=VerifiedCredentialCache()
+        cache.put("jwt", "token", Identity("svc", "jwt"))
+        assert cache.get("api-key", "token") is None
+        assert cache.get("jwt", "token") is not None
+
+    def test_raw_credential_not_stored(self) -> None:
+        cache=VerifiedCredentialCache()
+        cache.put("api-key", "dv_secret", Identity("svc", "api-key"))
+        assert all(isinstance(k, bytes) and b"dv_secret" not in k for k in cache._entries)
+        assert VerifiedCredentialCache().digest("api-key", "x") != cache.digest("api-key", "x")
+
+    def test_ttl_expiry(self) -> None:
+        clock=FakeClock()
+        cache=VerifiedCredentialCache(ttl_seconds=60, clock=clock)
+        cache.put("api-key", "secret", Identity("svc", "api-key"))
+
+        clock.now += 59
+        assert cache.get("api-key", "secret") is not None
+        clock.now += 1
+        assert cache.get("api-key", "secret") is None
+        assert len(cache) == 0
+
+    def test_credential_expiry_caps_ttl(self) -> None:
+        clock=FakeClock()
+        cache=VerifiedCredentialCache(ttl_seconds=600, clock=clock)
+        cache.put("jwt", "token", Identity("svc", "jwt"), expires_at=clock.now + 10)
+
+        clock.now += 10
+        assert cache.get("jwt", "token") is None
+
+    def test_lru_bound(self) -> None:
+        cache=VerifiedCredentialCache(max_entries=2)
+        cache.put("api-key", "a", Identity("a", "api-key"))
+        cache.put("api-key", "b", Identity("b", "api-key"))
+        cache.get("api-key", "a")
+        cache.put("api-key", "c", Identity("c", "api-key"))
+
+        assert cache.get("api-key", "b") is None
+        assert cache.get("api-key", "a") is not None
+        assert cache.stats()["evictions"] == 1
+        assert "b" not in cache._by_principal
+
+    def test_invalidate_by_principal_and_key_id(self) -> None:
+        cache=VerifiedCredentialCache()
+        cache.put("api-key", "k1", Identity("svc", "api-key"), key_id="key_1")
+        cache.put("api-key", "k2", Identity("svc", "api-key"), key_id="key_2")
+        cache.put("jwt", "t", Identity("other", "jwt"))
+
+        assert cache.invalidate_key_id("key_1") == 1
+        assert cache.get("api-key", "k1") is None
+        assert cache.invalidate_principal("svc") == 1
+        assert len(cache) == 1
+        assert cache.invalidate("jwt", "t")
+        assert cache.stats()["invalidations"] == 3
+
+    def test_disabled_with_zero_size(self) -> None:
+        cache=VerifiedCredentialCache(max_entries=0)
+        cache.put("api-key", "k", Identity("svc", "api-key"))
+        assert cache.get("api-key", "k") is None
+
+
+# ============================================================================
+# Interceptor Integration
+# ============================================================================
+class TestInterceptorApiKeys:
+    def test_repeat_calls_skip_hash_and_lookup(self, interceptor: CountingInterceptor) -> None:
+        first=interceptor._verify_api_key("dv_alpha")
+        second=interceptor._verify_api_key("dv_alpha")
+
+        assert first.principal_id == second.principal_id == "ci-system"
+        assert second.permissions == ["node:list"]
+        assert len(interceptor.lookups) == 1
+
+    def test_failures_not_cached(self, interceptor: CountingInterceptor) -> None:
+        assert interceptor._verify_api_key("dv_unknown") is None
+        assert interceptor._verify_api_key("dv_unknown") is None
+        assert len(interceptor.lookups) == 2
+        assert len(interceptor.credential_cache) == 0
+
+    def test_key_expiry_respected(self, interceptor: CountingInterceptor) -> None:
+        soon=datetime.now(timezone.utc) + timedelta(seconds=30)
+        interceptor.keys["dv_alpha"]["expires_at"] = soon.isoformat()
+        interceptor._verify_api_key("dv_alpha")
+
+        _, deadline, _ = next(iter(interceptor.credential_cache._entries.values()))
+        assert deadline == pytest.approx(soon.timestamp())
+
+    def test_expired_key_rejected(self, interceptor: CountingInterceptor) -> None:
+        interceptor.keys["dv_alpha"]["expires_at"] = "2020-01-01T00:00:00"
+        assert interceptor._verify_api_key("dv_alpha") is None
+
+    def test_cache_can_be_disabled(self) -> None:
+        interceptor=CountingInterceptor(
+            {"credential_cache_enabled": False}, {"dv_alpha": {"principal_id": "svc"}}
+        )
+        interceptor._verify_api_key("dv_alpha")
+        interceptor._verify_api_key("dv_alpha")
+        assert interceptor.credential_cache is None
+        assert len(interceptor.lookups) == 2
+
+    def test_key_manager_revocation_evicts(
+        self, interceptor: CountingInterceptor, tmp_path: Any
+    ) -> None:
+        manager=APIKeyManager(KeyRotationConfig(), str(tmp_path))
+        manager._hash_key=lambda key: f"hash:{key}"    # Skip PBKDF2 in tests
+        interceptor.attach_key_manager(manager)
+        api_key, key_obj=manager.create_key("ci-system")
+        interceptor.keys[api_key] = {"key_id": key_obj.key_id, "principal_id": "ci-system"}
+
+        interceptor._verify_api_key(api_key)
+        interceptor._verify_api_key("dv_beta")
+        manager.revoke_key(key_obj.key_id, reason="leaked")
+
+        assert interceptor.credential_cache.get("api-key", api_key) is None
+        assert interceptor.credential_cache.get("api-key", "dv_beta") is not None
+
+    def test_key_manager_rotation_evicts(
+        self, interceptor: CountingInterceptor, tmp_path: Any
+    ) -> None:
+        manager=APIKeyManager(KeyRotationConfig(), str(tmp_path))
+        manager._hash_key=lambda key: f"hash:{key}"
+        interceptor.attach_key_manager(manager)
+        interceptor._verify_api_key("dv_alpha")
+
+        _, key_obj=manager.create_key("ci-system")
+        manager.rotate_key(key_obj.key_id)
+
+        assert len(interceptor.credential_cache) == 0
+
+    async def test_rotation_manager_events_evict(self, interceptor: CountingInterceptor) -> None:
+        manager=APIKeyRotationManager()
+        interceptor.attach_key_manager(manager)
+        _, api_key=await manager.create_key("ci-system")
+
+        interceptor.keys["dv_gamma"] = {"key_id": api_key.key_id, "principal_id": "svc-gamma"}
+        interceptor._verify_api_key("dv_gamma")
+        interceptor._verify_api_key("dv_beta")
+        await manager.revoke_key(api_key.key_id)
+
+        assert interceptor.credential_cache.get("api-key", "dv_gamma") is None
+        assert interceptor.credential_cache.get("api-key", "dv_beta") is not None
+
+    async def test_grace_period_end_evicts(self, interceptor: CountingInterceptor) -> None:
+        manager=APIKeyRotationManager()
+        interceptor.attach_key_manager(manager)
+        _, api_key=await manager.create_key("ci-system")
+        await manager.rotate_key(api_key.key_id)
+
+        interceptor.keys["dv_old"] = {"key_id": api_key.key_id, "principal_id": "svc-old"}
+        interceptor._verify_api_key("dv_old")
+        api_key.grace_period_ends_at=datetime.now(timezone.utc) - timedelta(seconds=1)
+        await manager._cleanup_grace_periods()
+
+        assert interceptor.credential_cache.get("api-key", "dv_old") is None
+
+
+class TestInterceptorJWT:
+    SECRET="jwt-test-secret-at-least-32-bytes-long"
+
+    def make(self) -> CountingInterceptor:
+        interceptor=CountingInterceptor({}, {})
+        interceptor.jwt_public_key=self.SECRET
+        return interceptor
+
+    def test_jwt_cached_until_exp(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        interceptor=self.make()
+        exp=int(time.time()) + 120
+        token=jwt.encode({"sub": "alice", "exp": exp, "permissions": ["node:list"]}, self.SECRET)
+
+        calls: List[str] = []
+        decode=jwt.decode
+        monkeypatch.setattr(jwt, "decode", lambda *a, **kw: calls.append(a[0]) or decode(*a, **kw))
+
+        first=interceptor._verify_jwt(token)
+        second=interceptor._verify_jwt(token)
+
+        assert first.principal_id == second.principal_id == "alice"
+        assert second.auth_method == "jwt"
+        assert len(calls) == 1
+        _, deadline, _ = next(iter(interceptor.credential_cache._entries.values()))
+        assert deadline == exp
+
+    def test_invalid_jwt_not_cached(self) -> None:
+        interceptor=self.make()
+        token=jwt.encode({"sub": "alice"}, "another-secret-that-is-long-enough-xx")
+        assert interceptor._verify_jwt(token) is None
+        assert len(interceptor.credential_cache) == 0
@@ -0,0 +1,277 @@
+"""
+RPC Listing - Pagination and Streaming Tests
+
+Covers page tokens and field masks (opt.services.rpc.pagination), keyset
+pages from the node registry, RPCClient listing generators over a fake
+stub (channel release, cancellation, errors) and the panel's streamed
+JSON endpoints.
+"""
+
+import inspect
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import grpc
+import pytest
+from flask import Flask
+
+from opt.services.rpc.node_registry import ShardedNodeRegistry
+from opt.services.rpc.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    apply_field_mask,
+    check_field_mask,
+    decode_page_token,
+    encode_page_token,
+    page_size,
+)
+from opt.web.panel.core import rpc_client
+from opt.web.panel.core.rpc_client import NODE_FIELDS, RPCClient, RPCClientError
+from opt.web.panel.core.streaming import iter_json_array
+from opt.web.panel.routes import nodes as nodes_routes
+
+
+# =============================================================================
+# Page Tokens and Field Masks
+# =============================================================================
+class TestPagination:
+    def test_page_token_round_trip(self):
+        filters={"status": "online", "hostname_prefix": None}
+        token=encode_page_token("node-42", filters)
+        assert decode_page_token(token, filters) == "node-42"
+        assert decode_page_token("", filters) is None
+
+    def test_page_token_bound_to_filters(self):
+        token=encode_page_token("node-42", {"status": "online"})
+        with pytest.raises(ValueError):
+            decode_page_token(token, {"status": "offline"})
+        with pytest.raises(ValueError):
+            decode_page_token("not-a-token", {"status": "online"})
+
+    def test_page_size(self):
+        assert page_size(0) == DEFAULT_PAGE_SIZE
+        assert page_size(25) == 25
+        assert page_size(10**6) == MAX_PAGE_SIZE
+        with pytest.raises(ValueError):
+            page_size(-1)
+
+    def test_field_mask(self):
+        allowed=("node_id", "hostname", "status")
+        assert check_field_mask([], allowed) is None
+        assert check_field_mask(["status"], allowed) == ["status"]
+        with pytest.raises(ValueError):
+            check_field_mask(["password"], allowed)
+
+        values={"node_id": "n1", "hostname": "h", "status": "online"}
+        assert apply_field_mask(values, None) is values
+        assert apply_field_mask(values, ["status", "node_id"]) == {"status": "online", "node_id": "n1"}
+
+
+class TestRegistryPages:
+    def test_pages_ordered_and_complete(self):
+        registry=ShardedNodeRegistry(shards=4)
+        for n in range(23):
+            registry.register(f"node{n}.example", "10.0.0.1")
+
+        seen: List[str] = []
+        after=None
+        while True:
+            page=registry.list_page(after=after, limit=5)
+            seen.extend(r.node_id for r in page)
+            if len(page) < 5:
+                break
+            after=page[-1].node_id
+        assert seen == sorted(r.node_id for r in registry.iter_nodes())
+
+    def test_pages_stable_under_concurrent_changes(self):
+        registry=ShardedNodeRegistry(shards=4)
+        for n in range(10):
+            registry.register(f"node{n}.example", "10.0.0.1")
+        first=registry.list_page(limit=4)
+        registry.remove(first[0].node_id)
+        registry.remove(registry.list_page(after=first[-1].node_id, limit=1)[0].node_id)
+
+        rest=registry.list_page(after=first[-1].node_id, limit=100)
+        assert len(rest) == 5
+        assert all(r.node_id > first[-1].node_id for r in rest)
+
+    def test_filtered_pages(self):
+        registry=ShardedNodeRegistry(shards=2)
+        ids=[registry.register(f"node{n}.example", "10.0.0.1").node_id for n in range(8)]
+        for node_id in ids[::2]:
+            registry.heartbeat(node_id)
+
+        page=registry.list_page(status="online", limit=10)
+        assert [r.node_id for r in page] == sorted(ids[::2])
+        assert registry.list_page(status="online", hostname_prefix="node2", limit=10)[0].hostname == "node2.example"
+
+
+# =============================================================================
+# RPC Client Generators
+# =============================================================================
+class FakeRpcError(grpc.RpcError):
+    def details(self) -> str:
+        return "unavailable"
+
+
+class FakeStream:
+    """Server-streaming call: iterable with cancel()."""
+
+    def __init__(self, messages: List[Any], fail_after: int=-1) -> None:
+        self.messages=messages
+        self.fail_after=fail_after
+        self.cancelled=False
+        self.sent=0
+
+    def __iter__(self):
+        for n, message in enumerate(self.messages):
+            if n == self.fail_after:
+                raise FakeRpcError()
+            self.sent += 1
+            yield message
+
+    def cancel(self) -> None:
+        self.cancelled=True
+
+
+class FakePool:
+    def __init__(self) -> None:
+        self.in_use=0
+
+    def acquire(self, timeout: float=10.0) -> str:
+        self.in_use += 1
+        return "channel"
+
+    def release(self, channel: str) -> None:
+        self.in_use -= 1
+
+
+def summary(n: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        node_id=f"node-{n:03d}", hostname=f"node{n}.example", ip="10.0.0.1",
+        status="online", registered_at=SimpleNamespace(seconds=1_700_000_000),
+    )
+
+
+@pytest.fixture
+def client():
+    fake_pb2=SimpleNamespace(
+        ListNodesRequest=lambda **kw: kw,
+        ListSnapshotsRequest=lambda **kw: kw,
+    )
+    with patch.object(RPCClient, "_init_pool"), \
+            patch.object(rpc_client, "HAS_PROTOS", True), \
+            patch.object(rpc_client, "debvisor_pb2", fake_pb2), \
+            patch.object(rpc_client, "FieldMask", lambda paths: SimpleNamespace(paths=paths)):
+        rpc=RPCClient()
+        rpc.channel_pool=FakePool()
+        rpc.requests: List[Dict[str, Any]] = []
+        rpc.stream=FakeStream([summary(n) for n in range(5)])
+
+        def stream_nodes(request, timeout=None):
+            rpc.requests.append(request)
+            return rpc.stream
+
+        def list_nodes(request, timeout=None):
+            rpc.requests.append(request)
+            return SimpleNamespace(nodes=[summary(1), summary(2)], next_page_token="tok")
+
+        stub=SimpleNamespace(StreamNodes=stream_nodes, ListNodes=list_nodes)
+        with patch.object(rpc, "_get_stub", return_value=stub):
+            yield rpc
+
+
+class TestClientGenerators:
+    def test_iter_nodes_streams_rows(self, client):
+        rows=client.iter_nodes(status="online", fields=["node_id", "registered_at"])
+        assert client.channel_pool.in_use == 0    # Nothing happens until iteration
+
+        first=next(rows)
+        assert first == {"node_id": "node-000", "registered_at": "2023-11-14T22:13:20+00:00"}
+        assert client.stream.sent == 1
+        assert client.channel_pool.in_use == 1
+
+        assert [r["node_id"] for r in rows] == [f"node-{n:03d}" for n in range(1, 5)]
+        assert client.channel_pool.in_use == 0
+        request=client.requests[0]
+        assert request["status"] == "online"
+        assert request["field_mask"].paths == ["node_id", "registered_at"]
+
+    def test_early_close_cancels_and_releases(self, client):
+        rows=client.iter_nodes()
+        next(rows)
+        rows.close()
+        assert client.stream.cancelled
+        assert client.channel_pool.in_use == 0
+
+    def test_stream_error_raised_and_released(self, client):
+        client.stream=FakeStream([summary(n) for n in range(5)], fail_after=2)
+        with pytest.raises(RPCClientError):
+            list(client.iter_nodes())
+        assert client.channel_pool.in_use == 0
+
+    def test_list_nodes_page(self, client):
+        nodes, token=client.list_nodes_page(page_size=2, page_token="abc", fields=["node_id"])
+        assert [n["node_id"] for n in nodes] == ["node-001", "node-002"]
+        assert token == "tok"
+        assert client.requests[0]["page_size"] == 2 and client.requests[0]["page_token"] == "abc"
+
+    def test_unknown_fields_rejected(self, client):
+        with pytest.raises(RPCClientError):
+            list(client.iter_nodes(fields=["password"]))
+
+    def test_list_nodes_collects_stream(self, client):
+        assert [n["node_id"] for n in client.list_nodes()] == [f"node-{n:03d}" for n in range(5)]
+        assert set(client.list_nodes()[0]) == set(NODE_FIELDS)
+
+
+# =============================================================================
+# Panel Streaming Endpoints
+# =============================================================================
+class FakePanelClient:
+    def __init__(self, rows: int=0, error: bool=False) -> None:
+        self.rows=rows
+        self.error=error
+        self.calls: List[Dict[str, Any]] = []
+
+    def iter_nodes(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.error:
+            raise RPCClientError("RPC stream failed: NodeService.StreamNodes - unavailable")
+        for n in range(self.rows):
+            yield {"node_id": f"node-{n:03d}", "status": "online"}
+
+
+class TestPanelStreaming:
+    @pytest.fixture
+    def app(self):
+        app=Flask(__name__)
+        app.add_url_rule("/nodes/api/cluster", view_func=inspect.unwrap(nodes_routes.api_cluster_nodes))
+        return app
+
+    def test_streamed_json(self, app):
+        fake=FakePanelClient(rows=3000)
+        with patch.object(nodes_routes, "get_rpc_client", return_value=fake):
+            response=app.test_client().get("/nodes/api/cluster?status=online&fields=node_id,status")
+            assert response.is_streamed
+            body=json.loads(response.get_data())
+        assert len(body) == 3000 and body[0] == {"node_id": "node-000", "status": "online"}
+        assert fake.calls == [{"status": "online", "hostname_prefix": None, "fields": ["node_id", "status"]}]
+
+    def test_empty_and_errors(self, app):
+        with patch.object(nodes_routes, "get_rpc_client", return_value=FakePanelClient()):
+            assert app.test_client().get("/nodes/api/cluster").get_json() == []
+        with patch.object(nodes_routes, "get_rpc_client", return_value=FakePanelClient(error=True)):
+            response=app.test_client().get("/nodes/api/cluster")
+            assert response.status_code == 502
+            assert "StreamNodes" not in response.get_json()["error"]
+        assert app.test_client().get("/nodes/api/cluster?fields=password").status_code == 400
+
+    def test_json_array_chunks(self):
+        rows=[{"n": n, "pad": "x" * 100} for n in range(2000)]
+        chunks=list(iter_json_array(rows, chunk_bytes=4096))
+        assert len(chunks) > 10
+        assert json.loads("".join(chunks)) == rows
+        assert list(iter_json_array([])) == ["[]"]
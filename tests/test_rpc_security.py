@@ -93,12 +93,12 @@ class SecurityPolicy:
 def rpc_credential() -> None:
     """Create RPC credential"""
     return RPCCredential(  # type: ignore[return-value]
-        _credential_id = "cred-001",
-        _auth_method = AuthMethod.BEARER,
-        _username = "testuser",
-        _token = "token-abc123",
-        _created_at = time.time(),
-        _expires_at = time.time() + 3600,
+        credential_id="cred-001",
+        auth_method=AuthMethod.BEARER,
+        username="testuser",
+        token="token-abc123",
+        created_at=time.time(),
+        expires_at=time.time() + 3600,
     )
 
 
@@ -108,13 +108,13 @@ def rpc_credential() -> None:
 def rpc_request() -> None:
     """Create RPC request"""
     return RPCRequest(  # type: ignore[return-value]
-        _request_id = "req-001",
-        _method = "vm.create",
-        _params = {"name": "test-vm"},
-        _source_ip = "192.168.1.100",
-        _user = "testuser",
-        _timestamp = time.time(),
-        _signature = None,
+        request_id="req-001",
+        method="vm.create",
+        params={"name": "test-vm"},
+        source_ip="192.168.1.100",
+        user="testuser",
+        timestamp=time.time(),
+        signature=None,
     )
 
 
@@ -124,12 +124,12 @@ def rpc_request() -> None:
 def security_policy() -> None:
     """Create security policy"""
     return SecurityPolicy(  # type: ignore[return-value]
-        _policy_id = "policy-001",
-        _name = "standard",
-        _max_requests_per_minute = 100,
-        _encryption_required = True,
-        _auth_required = True,
-        _allowed_methods = ["vm.*", "network.*"],
+        policy_id="policy-001",
+        name="standard",
+        max_requests_per_minute=100,
+        encryption_required=True,
+        auth_required=True,
+        allowed_methods=["vm.*", "network.*"],
     )
 
 
@@ -192,7 +192,7 @@ class TestRPCAuthentication:
         mock_rpc_security.authenticate_mtls = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.authenticate_mtls(
-            _client_cert = "mock_cert", server_cert="server_cert"
+            client_cert="mock_cert", server_cert="server_cert"
         )
 
         assert result is True
@@ -203,7 +203,7 @@ class TestRPCAuthentication:
         mock_rpc_security.authenticate_api_key = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.authenticate_api_key(
-            _api_key = "key-12345", api_secret="secret-abc"
+            api_key="key-12345", api_secret="secret-abc"
         )
 
         assert result is True
@@ -223,7 +223,7 @@ class TestRPCAuthentication:
         mock_rpc_security.create_credential = AsyncMock(return_value="cred-001")
 
         cred_id = await mock_rpc_security.create_credential(
-            _auth_method = AuthMethod.BEARER, username="testuser"
+            auth_method=AuthMethod.BEARER, username="testuser"
         )
 
         assert cred_id == "cred-001"
@@ -306,7 +306,7 @@ class TestRPCAuthorization:
         mock_rpc_security.delegate_authority = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.delegate_authority(
-            _delegator = "admin-user", delegatee="regular-user", permission="vm.create"
+            delegator="admin-user", delegatee="regular-user", permission="vm.create"
         )
 
         assert result is True
@@ -360,7 +360,7 @@ class TestRPCEncryption:
         mock_rpc_security.set_cipher_suites = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.set_cipher_suites(
-            _suites = ["TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384"]
+            suites=["TLS_ECDHE_RSA_WITH_AES_256_GCM_SHA384"]
         )
 
         assert result is True
@@ -504,7 +504,7 @@ class TestRPCRateLimiting:
         mock_rpc_security.check_endpoint_rate_limit = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.check_endpoint_rate_limit(
-            _endpoint = "vm.create", user="testuser", limit=10
+            endpoint="vm.create", user="testuser", limit=10
         )
 
         assert result is True
@@ -515,7 +515,7 @@ class TestRPCRateLimiting:
         mock_rpc_security.check_ip_rate_limit = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.check_ip_rate_limit(
-            _ip = "192.168.1.100", limit=1000
+            ip="192.168.1.100", limit=1000
         )
 
         assert result is True
@@ -535,7 +535,7 @@ class TestRPCRateLimiting:
     async def test_get_rate_limit_status(self, mock_rpc_security):
         """Test getting rate limit status"""
         mock_rpc_security.get_rate_limit_status = AsyncMock(
-            _return_value = {"remaining": 45, "reset_at": 1234567890}
+            return_value={"remaining": 45, "reset_at": 1234567890}
         )
 
         status = await mock_rpc_security.get_rate_limit_status("testuser")
@@ -548,7 +548,7 @@ class TestRPCRateLimiting:
         mock_rpc_security.queue_request = AsyncMock(return_value="queued")
 
         result = await mock_rpc_security.queue_request(
-            _request_id = "req-001", priority="high"
+            request_id="req-001", priority="high"
         )
 
         assert result == "queued"
@@ -566,7 +566,7 @@ class TestRPCAuditLogging:
         mock_rpc_security.log_auth_event = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.log_auth_event(
-            _user = "testuser", event_type="login", result="success"
+            user="testuser", event_type="login", result="success"
         )
 
         assert result is True
@@ -577,7 +577,7 @@ class TestRPCAuditLogging:
         mock_rpc_security.log_authz_event = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.log_authz_event(
-            _user = "testuser", resource="vm-001", action="create", result="allowed"
+            user="testuser", resource="vm-001", action="create", result="allowed"
         )
 
         assert result is True
@@ -588,7 +588,7 @@ class TestRPCAuditLogging:
         mock_rpc_security.log_api_call = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.log_api_call(
-            _method = "vm.create", user="testuser", params={"name": "test-vm"}
+            method="vm.create", user="testuser", params={"name": "test-vm"}
         )
 
         assert result is True
@@ -599,9 +599,9 @@ class TestRPCAuditLogging:
         mock_rpc_security.log_security_event = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.log_security_event(
-            _event_type = "suspicious_activity",
-            _severity = "warning",
-            _details = "Multiple failed auth attempts",
+            event_type="suspicious_activity",
+            severity="warning",
+            details="Multiple failed auth attempts",
         )
 
         assert result is True
@@ -610,7 +610,7 @@ class TestRPCAuditLogging:
     async def test_retrieve_audit_log(self, mock_rpc_security):
         """Test retrieving audit logs"""
         mock_rpc_security.get_audit_logs = AsyncMock(
-            _return_value = [{"event": "login", "user": "testuser"}]
+            return_value=[{"event": "login", "user": "testuser"}]
         )
 
         logs = await mock_rpc_security.get_audit_logs(user="testuser", days=7)
@@ -639,7 +639,7 @@ class TestRPCSecurityPolicy:
         mock_rpc_security.create_policy = AsyncMock(return_value="policy-001")
 
         policy_id = await mock_rpc_security.create_policy(
-            _name = "strict", max_requests_per_minute=50, encryption_required=True
+            name="strict", max_requests_per_minute=50, encryption_required=True
         )
 
         assert policy_id == "policy-001"
@@ -659,7 +659,7 @@ class TestRPCSecurityPolicy:
         mock_rpc_security.enforce_policy = AsyncMock(return_value=True)
 
         result = await mock_rpc_security.enforce_policy(
-            _user = "testuser", request={"method": "vm.create"}
+            user="testuser", request={"method": "vm.create"}
         )
 
         assert result is True
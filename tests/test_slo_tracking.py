@@ -10,11 +10,19 @@ Date: November 28, 2025
 """
 
 import asyncio
+import random
 import pytest
 from datetime import datetime, timedelta, timezone
+from typing import List
 
 from services.slo_tracking import (
+    AvailabilitySLI,
+    LatencySLI,
+    SLICalculator,
+    SLIDataPoint,
     SLIType,
+    SLIWindow,
+    SLODefinition,
     SLOTarget,
     SLIRecord,
     SLOViolation,
@@ -23,6 +31,7 @@ from services.slo_tracking import (
     track_latency_sli,
     track_availability_sli,
 )
+from opt.services.quantile_sketch import DDSketch
 
 # =============================================================================
 # SLI Type Tests
@@ -91,12 +100,12 @@ class TestSLIRecord:
     def test_record_creation(self) -> None:
         """Should create SLI record correctly."""
         now = datetime.now(timezone.utc)
-        _record = SLIRecord(
+        record = SLIRecord(
             sli_type=SLIType.LATENCY,
             service="api-gateway",
-            _operation = "get_user",
+            operation="get_user",
             value=150.0,
-            _timestamp = now,
+            timestamp=now,
             success=True,
             metadata={"endpoint": "/users/{id}"},
         )
@@ -130,15 +139,15 @@ class TestSLOViolation:
     def test_violation_creation(self) -> None:
         """Should create violation record correctly."""
         target = SLOTarget(
-            _name = "test-target", sli_type=SLIType.LATENCY, target_value=200.0
+            name="test-target", sli_type=SLIType.LATENCY, target_value=200.0
         )
 
         violation = SLOViolation(
             target=target,
             actual_value=350.0,
-            _expected_value = 200.0,
+            expected_value=200.0,
             severity="critical",
-            _message = "Latency exceeded target",
+            message="Latency exceeded target",
         )
 
         assert violation.target.name == "test-target"
@@ -221,7 +230,7 @@ class TestSLOTracker:
     def test_register_target(self, tracker):
         """Should register SLO target."""
         target = SLOTarget(
-            _name = "test-latency", sli_type=SLIType.LATENCY, target_value=200.0
+            name="test-latency", sli_type=SLIType.LATENCY, target_value=200.0
         )
 
         tracker.register_target(target)
@@ -232,7 +241,7 @@ class TestSLOTracker:
         """Should record SLI measurement."""
         # Register target first
         target = SLOTarget(
-            _name = "test-latency", sli_type=SLIType.LATENCY, target_value=200.0
+            name="test-latency", sli_type=SLIType.LATENCY, target_value=200.0
         )
         tracker.register_target(target)
 
@@ -247,10 +256,10 @@ class TestSLOTracker:
     def test_check_compliance(self, tracker):
         """Should check SLO compliance."""
         target = SLOTarget(
-            _name = "test-latency",
+            name="test-latency",
             sli_type=SLIType.LATENCY,
-            _target_value = 200.0,
-            _threshold_type = "max",
+            target_value=200.0,
+            threshold_type="max",
         )
         tracker.register_target(target)
 
@@ -324,7 +333,7 @@ class TestSLIDecorators:
         """track_latency_sli should measure function execution time."""
         tracker = SLOTracker(service="test")
         target = SLOTarget(
-            _name = "op-latency", sli_type=SLIType.LATENCY, target_value=1000.0
+            name="op-latency", sli_type=SLIType.LATENCY, target_value=1000.0
         )
         tracker.register_target(target)
 
@@ -346,7 +355,7 @@ class TestSLIDecorators:
         """track_availability_sli should track success/failure."""
         tracker = SLOTracker(service="test")
         target = SLOTarget(
-            _name = "op-availability", sli_type=SLIType.AVAILABILITY, target_value=99.0
+            name="op-availability", sli_type=SLIType.AVAILABILITY, target_value=99.0
         )
         tracker.register_target(target)
 
@@ -439,9 +448,9 @@ class TestSLOIntegration:
         availability_compliance = tracker.check_compliance("availability")
         
         # Latency p99 is 500ms > 200ms target, so should fail
-        assert latency_compliance is False
+        assert latency_compliance.compliant is False
         # Availability is 98% < 99.9% target, so should fail
-        assert availability_compliance is False
+        assert availability_compliance.compliant is False
 
         # Get overall summary
         summary = tracker.get_summary()
@@ -451,6 +460,204 @@ class TestSLOIntegration:
         assert len(tracker.records) == 200    # 100 latency + 100 availability
 
 
+# =============================================================================
+# Windowed Aggregation Tests
+# =============================================================================
+def make_point(age: timedelta, success: bool = True, latency_ms: float = 10.0) -> SLIDataPoint:
+    return SLIDataPoint(
+        timestamp=datetime.now(timezone.utc) - age,
+        value=1.0 if success else 0.0,
+        success=success,
+        latency_ms=latency_ms,
+    )
+
+
+class TestSLIWindow:
+    """Bucketed aggregates agree with recomputing from raw data points."""
+
+    def test_matches_raw_calculation(self) -> None:
+        """Window SLIs should equal the raw-point calculation at bucket resolution."""
+        rng = random.Random(9)
+        tracker = SLOTracker()
+        tracker.register_slo(
+            SLODefinition(name="avail", sli_type=SLIType.AVAILABILITY, target=99.0, window_days=1)
+        )
+        tracker.register_slo(
+            SLODefinition(name="lat", sli_type=SLIType.LATENCY, target=90.0, window_days=1),
+            LatencySLI(threshold_ms=100),
+        )
+        points = []
+        for _ in range(5_000):
+            age = timedelta(minutes=rng.randrange(1, 23 * 60))
+            point = make_point(age, rng.random() > 0.02, rng.expovariate(1 / 60))
+            points.append(point)
+            tracker.record_sync("avail", point)
+            tracker.record_sync("lat", point)
+
+        avail = tracker.get_slo_status("avail")
+        assert avail.data_points == 5_000
+        assert avail.current_value == pytest.approx(AvailabilitySLI().calculate(points))
+        lat = tracker.get_slo_status("lat")
+        assert lat.current_value == pytest.approx(LatencySLI(threshold_ms=100).calculate(points))
+
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=6)
+        recent = [p for p in points if p.timestamp >= cutoff]
+        expected = (100 - AvailabilitySLI().calculate(recent)) / (100 - 99.0)
+        assert avail.burn_rate_6h == pytest.approx(expected, rel=0.05)
+
+    def test_short_and_long_burn_rates(self) -> None:
+        """Old errors count toward the 6h burn rate but not the 1h one."""
+        tracker = SLOTracker()
+        tracker.register_slo(
+            SLODefinition(name="api", sli_type=SLIType.AVAILABILITY, target=99.0)
+        )
+        for n in range(100):
+            tracker.record_sync("api", make_point(timedelta(hours=3), success=n >= 10))
+            tracker.record_sync("api", make_point(timedelta(minutes=5)))
+
+        status = tracker.get_slo_status("api")
+
+        assert status.burn_rate_1h == 0.0
+        assert status.burn_rate_6h == pytest.approx(5.0)
+        assert status.data_points == 200
+
+    def test_expired_buckets_are_pruned(self) -> None:
+        """Buckets past retention leave the window and the running totals."""
+        window = SLIWindow(retention_seconds=3600, bucket_seconds=60)
+        now = datetime.now(timezone.utc)
+        for minutes in (90, 80, 30, 1):
+            window.add(make_point(timedelta(minutes=minutes), success=False))
+
+        stats = window.stats(3600, now.timestamp())
+
+        assert stats.count == 2
+        assert stats.errors == 2
+        assert len(window) == 2
+
+    def test_out_of_order_points(self) -> None:
+        """Late points land in their own bucket, not the newest one."""
+        window = SLIWindow(retention_seconds=86400, bucket_seconds=60)
+        now = datetime.now(timezone.utc)
+        window.add(make_point(timedelta(minutes=1)))
+        window.add(make_point(timedelta(minutes=30), success=False))
+
+        assert window.stats(600, now.timestamp()).errors == 0
+        assert window.stats(3600, now.timestamp()).errors == 1
+
+    def test_bucket_count_is_bounded(self) -> None:
+        """Many points in a few minutes collapse into a few buckets."""
+        window = SLIWindow(retention_seconds=86400, bucket_seconds=60)
+        for n in range(50_000):
+            window.add(make_point(timedelta(seconds=n % 180)))
+        assert len(window) <= 4
+        assert window.stats(86400, datetime.now(timezone.utc).timestamp()).count == 50_000
+
+    def test_custom_calculator_uses_raw_points(self) -> None:
+        """Calculators without a window implementation still see data points."""
+
+        class HalfSLI(SLICalculator):
+            def __init__(self) -> None:
+                self.seen: List[int] = []
+
+            def calculate(self, data_points: List[SLIDataPoint]) -> float:
+                self.seen.append(len(data_points))
+                return 50.0
+
+        calculator = HalfSLI()
+        tracker = SLOTracker()
+        tracker.register_slo(
+            SLODefinition(name="custom", sli_type=SLIType.CORRECTNESS, target=40.0),
+            calculator,
+        )
+        for _ in range(3):
+            tracker.record_sync("custom", make_point(timedelta(minutes=1)))
+
+        status = tracker.get_slo_status("custom")
+
+        assert status.current_value == 50.0
+        assert status.is_meeting_target
+        assert calculator.seen[0] == 3
+
+
+class TestLatencySketches:
+    """Latency percentiles come from per-bucket sketches."""
+
+    def make_tracker(self) -> SLOTracker:
+        tracker = SLOTracker()
+        tracker.register_slo(
+            SLODefinition(name="lat", sli_type=SLIType.LATENCY, target=95.0, window_days=2),
+            LatencySLI(threshold_ms=200, percentile=99),
+        )
+        return tracker
+
+    def test_percentile_matches_exact(self) -> None:
+        """Window percentiles stay within the sketch's relative error."""
+        rng = random.Random(4)
+        tracker = self.make_tracker()
+        latencies = []
+        for _ in range(5_000):
+            latency = rng.lognormvariate(4, 0.8)
+            latencies.append(latency)
+            age = timedelta(minutes=rng.randrange(1, 40 * 60))
+            tracker.record_sync("lat", make_point(age, latency_ms=latency))
+
+        ordered = sorted(latencies)
+        for p in (50, 95, 99):
+            expected = ordered[int(p / 100 * (len(ordered) - 1))]
+            assert tracker.get_latency_percentile("lat", p) == pytest.approx(expected, rel=0.0101)
+        assert tracker.get_latency_sketch("lat").count == 5_000
+        assert tracker.get_latency_percentile("missing") is None
+
+    def test_short_window_uses_recent_points(self) -> None:
+        """A 1h window only sees the last hour's latencies."""
+        tracker = self.make_tracker()
+        for _ in range(100):
+            tracker.record_sync("lat", make_point(timedelta(hours=20), latency_ms=1000.0))
+            tracker.record_sync("lat", make_point(timedelta(minutes=10), latency_ms=10.0))
+
+        assert tracker.get_latency_percentile("lat", 99, window_days=1 / 24) == pytest.approx(
+            10.0, rel=0.01
+        )
+        assert tracker.get_latency_sketch("lat", window_days=1 / 24).count == 100
+        assert tracker.get_latency_percentile("lat", 99) == pytest.approx(1000.0, rel=0.01)
+
+    def test_old_bucket_sketches_are_released(self) -> None:
+        """Buckets past the fine retention drop their sketches, rollups keep the data."""
+        window = SLIWindow(retention_seconds=86400, bucket_seconds=60)
+        now = datetime.now(timezone.utc)
+        for hours in (20, 12, 1):
+            for minutes in range(0, 60, 7):
+                window.add(make_point(timedelta(hours=hours, minutes=minutes), latency_ms=hours))
+
+        sketch = window.latency_sketch(86400, now.timestamp())
+
+        assert sketch.count == 27
+        old = [b for b in window._buckets.values() if b.start < now.timestamp() - 8 * 3600]
+        assert old and all(b.latency_sketch is None for b in old)
+
+    def test_fleet_merge(self) -> None:
+        """Per-node sketches merge into a fleet-wide percentile."""
+        nodes = [self.make_tracker() for _ in range(3)]
+        for n, tracker in enumerate(nodes):
+            for _ in range(50):
+                tracker.record_sync("lat", make_point(timedelta(minutes=5), latency_ms=10.0 * (n + 1)))
+
+        fleet = DDSketch()
+        for tracker in nodes:
+            fleet.merge(DDSketch.from_dict(tracker.get_latency_sketch("lat").to_dict()))
+
+        assert fleet.count == 150
+        assert fleet.percentile(99) == pytest.approx(30.0, rel=0.01)
+        assert fleet.percentile(10) == pytest.approx(10.0, rel=0.01)
+
+    def test_get_percentile_without_sorting(self) -> None:
+        """LatencySLI.get_percentile is answered from a sketch."""
+        points = [make_point(timedelta(seconds=1), latency_ms=float(n)) for n in range(1, 1001)]
+        assert LatencySLI(threshold_ms=100, percentile=95).get_percentile(points) == pytest.approx(
+            950, rel=0.01
+        )
+
+
 # =============================================================================
 # Main
 # =============================================================================
@@ -0,0 +1,164 @@
+"""
+Tests for the WebSocket event bus.
+
+Covers indexed fan-out (event type, resource and permission filtering),
+re-subscription and unsubscribe index maintenance, serialize-once
+encoding, metric coalescing in client queues, queue bounds and history.
+"""
+
+import asyncio
+import json
+
+from opt.web.panel.websocket_events import (
+    ClientMessageQueue,
+    EventFactory,
+    WebSocketEvent,
+    WebSocketEventBus,
+)
+
+
+async def drain(bus: WebSocketEventBus, client_id: str):
+    events = []
+    while True:
+        event = bus.message_queues[client_id].get_nowait()
+        if event is None:
+            return events
+        events.append(event)
+
+
+# =============================================================================
+# Fan-out Tests
+# =============================================================================
+class TestFanOut:
+    """publish reaches exactly the clients allowed to see an event."""
+
+    async def test_type_and_permission_filtering(self):
+        bus = WebSocketEventBus()
+        await bus.subscribe("viewer", ["node_status"], "u1", ["view:node_status"])
+        await bus.subscribe("admin", ["node_status", "cluster_alert"], "u2", ["view:*"])
+        await bus.subscribe("no-perm", ["node_status"], "u3", ["view:job_progress"])
+
+        await bus.publish(EventFactory.node_status_event("node1", "online"))
+        await bus.publish(EventFactory.alert_event("HIGH_MEMORY", "Memory usage high"))
+
+        assert [e.event_type for e in await drain(bus, "viewer")] == ["node_status"]
+        assert [e.event_type for e in await drain(bus, "admin")] == ["node_status", "cluster_alert"]
+        assert await drain(bus, "no-perm") == []
+        assert await bus.get_message("no-perm", timeout=0.01) is None
+
+    async def test_resource_filtering(self):
+        bus = WebSocketEventBus()
+        await bus.subscribe("all", ["node_status"], "u1", ["view:*"])
+        await bus.subscribe("n1", ["node_status", "cluster_alert"], "u2", ["view:*"], resource_ids=["node1"])
+
+        await bus.publish(EventFactory.node_status_event("node1", "online"))
+        await bus.publish(EventFactory.node_status_event("node2", "offline"))
+        await bus.publish(EventFactory.alert_event("DISK", "Disk failing"))    # No resource
+
+        assert [e.data["node_id"] for e in await drain(bus, "all")] == ["node1", "node2"]
+        received = await drain(bus, "n1")
+        assert [e.event_type for e in received] == ["node_status", "cluster_alert"]
+        assert received[0].data["node_id"] == "node1"
+
+    async def test_index_matches_is_allowed(self):
+        """Indexed delivery agrees with the per-client predicate."""
+        bus = WebSocketEventBus()
+        clients = {
+            "a": (["node_status", "node_metrics"], ["view:node_status"], None),
+            "b": (["node_metrics"], ["view:*"], ["node1", "node2"]),
+            "c": (["job_progress"], ["view:job_progress"], ["job1"]),
+            "d": (["heartbeat", "node_status"], ["view:*"], None),
+        }
+        for client_id, (types, perms, resources) in clients.items():
+            await bus.subscribe(client_id, types, client_id, perms, resource_ids=resources)
+        events = [
+            EventFactory.node_status_event("node1", "online"),
+            EventFactory.node_metrics_event("node2", {"cpu": 1}),
+            EventFactory.node_metrics_event("node3", {"cpu": 2}),
+            EventFactory.job_progress_event("job1", 50, "running"),
+            EventFactory.job_progress_event("job2", 50, "running"),
+            EventFactory.heartbeat_event(),
+        ]
+        for event in events:
+            await bus.publish(event)
+
+        for client_id, subscription in bus.subscriptions.items():
+            expected = [e for e in events if subscription.is_allowed(e)]
+            assert await drain(bus, client_id) == expected
+
+    async def test_resubscribe_and_unsubscribe_update_index(self):
+        bus = WebSocketEventBus()
+        await bus.subscribe("c1", ["node_status"], "u1", ["view:*"])
+        await bus.subscribe("c1", ["cluster_alert"], "u1", ["view:*"])
+        await bus.publish(EventFactory.node_status_event("node1", "online"))
+        assert await drain(bus, "c1") == []
+
+        await bus.unsubscribe("c1")
+        await bus.publish(EventFactory.alert_event("X", "y"))
+        assert bus.get_stats()["indexed_event_types"] == 0
+        assert "c1" not in bus.message_queues
+
+
+# =============================================================================
+# Encoding and Queue Tests
+# =============================================================================
+class TestDelivery:
+    """Serialize-once, coalescing, bounds and history."""
+
+    async def test_event_serialized_once(self):
+        event = EventFactory.node_status_event("node1", "online")
+        encoded = event.to_json()
+        assert event.to_json() is encoded
+        assert json.loads(encoded)["data"]["node_id"] == "node1"
+        assert WebSocketEvent.from_dict(json.loads(encoded)) == event
+
+    async def test_metrics_coalesced_while_queued(self):
+        bus = WebSocketEventBus()
+        await bus.subscribe("slow", ["node_metrics", "node_status"], "u1", ["view:*"])
+        for cpu in range(5):
+            await bus.publish(EventFactory.node_metrics_event("node1", {"cpu": cpu}))
+        await bus.publish(EventFactory.node_status_event("node1", "degraded"))
+        await bus.publish(EventFactory.node_metrics_event("node2", {"cpu": 9}))
+        await bus.publish(EventFactory.node_metrics_event("node1", {"cpu": 5}))
+
+        received = await drain(bus, "slow")
+        assert [(e.event_type, e.data.get("metrics")) for e in received] == [
+            ("node_metrics", {"cpu": 5}),
+            ("node_status", None),
+            ("node_metrics", {"cpu": 9}),
+        ]
+        assert bus.get_stats()["coalesced"] == 5
+
+        # Once delivered, the next sample is queued normally
+        await bus.publish(EventFactory.node_metrics_event("node1", {"cpu": 6}))
+        assert (await bus.get_message("slow", timeout=0.1)).data["metrics"] == {"cpu": 6}
+
+    async def test_status_events_never_coalesced(self):
+        queue = ClientMessageQueue()
+        for status in ("online", "offline", "online"):
+            queue.put_nowait(EventFactory.node_status_event("node1", status))
+        assert len(queue) == 3
+
+    async def test_full_queue_drops_and_counts(self):
+        bus = WebSocketEventBus(max_queue_size=2)
+        await bus.subscribe("c1", ["cluster_alert"], "u1", ["view:*"])
+        for n in range(4):
+            await bus.publish(EventFactory.alert_event("A", str(n)))
+        stats = bus.get_stats()
+        assert stats["queued"] == 2
+        assert stats["dropped"] == 2
+
+    async def test_waiting_client_woken_by_publish(self):
+        bus = WebSocketEventBus()
+        await bus.subscribe("c1", ["heartbeat"], "u1", ["view:heartbeat"])
+        waiter = asyncio.ensure_future(bus.get_message("c1", timeout=1))
+        await asyncio.sleep(0)
+        await bus.publish(EventFactory.heartbeat_event())
+        assert (await waiter).event_type == "heartbeat"
+
+    async def test_history_bounded(self):
+        bus = WebSocketEventBus(max_history_size=3)
+        for n in range(5):
+            await bus.publish(EventFactory.job_progress_event(f"job{n}", n, "running"))
+        assert [e.data["job_id"] for e in bus.event_history] == ["job2", "job3", "job4"]
+        assert bus.events_published == 5